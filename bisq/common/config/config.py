@@ -293,6 +293,24 @@ class Config:
         self.gui_mode: bool = (
             options["gui"] or False
         )
+        self.user_hibernation_idle_timeout_sec: int = (
+            options["userHibernationIdleTimeout"] or 0
+        )
+        self.max_awake_users: int = options["maxAwakeUsers"] or 0
+        self.user_memory_cap_mb: int = options["userMemoryCapMb"] or 0
+        self.always_online_users: list[str] = options["alwaysOnlineUsers"] or []
+        self.hibernated_user_mailbox_check_interval_sec: int = (
+            options["hibernatedUserMailboxCheckInterval"] or 0
+        )
+        self.user_worker_id: str = options["userWorkerId"] or ""
+        # workers never spawn workers themselves
+        self.process_per_user: bool = (
+            options["processPerUser"] or False
+        ) and not self.user_worker_id
+        # workers can only share a tor instance which is reachable by its control port
+        self.shared_tor: bool = (options["sharedTor"] or False) and (
+            not self.user_worker_id or self.tor_control_port != Config.UNSPECIFIED_PORT
+        )
 
         # Assign values to special-case static fields
         Config.BASE_CURRENCY_NETWORK_VALUE = self.base_currency_network
@@ -987,4 +1005,79 @@ class Config:
             nargs="?",
             const=True,
         )
+        parser.add_argument(
+            "--userHibernationIdleTimeout",
+            help=(
+                "Hibernate users which had no activity for the given number of seconds. "
+                "0 disables hibernation of idle users"
+            ),
+            type=int,
+            metavar="<Integer>",
+        )
+        parser.add_argument(
+            "--maxAwakeUsers",
+            help=(
+                "Max. number of users which are kept awake at the same time. "
+                "The least recently active users get hibernated first. 0 means no limit"
+            ),
+            type=int,
+            metavar="<Integer>",
+        )
+        parser.add_argument(
+            "--userMemoryCapMb",
+            help=(
+                "Hibernate the least recently active user if the memory used by the process "
+                "exceeds the given number of MB. 0 means no limit"
+            ),
+            type=int,
+            metavar="<Integer>",
+        )
+        parser.add_argument(
+            "--alwaysOnlineUsers",
+            help="Ids of users which get started at startup and never get hibernated",
+            type=_comma_separated_str_list,
+            metavar="<user_id[,...]>",
+        )
+        parser.add_argument(
+            "--hibernatedUserMailboxCheckInterval",
+            help=(
+                "Wake hibernated users every given number of seconds to receive their mailbox "
+                "messages. 0 disables the periodic wake up"
+            ),
+            type=int,
+            metavar="<Integer>",
+        )
+        parser.add_argument(
+            "--processPerUser",
+            help=(
+                "Run each user in its own worker process. The api of the daemon forwards the "
+                "requests to the worker process of the active user"
+            ),
+            type=parse_bool,
+            metavar="<Boolean>",
+            nargs="?",
+            const=True,
+        )
+        parser.add_argument(
+            "--userWorkerId",
+            help=(
+                "Internal: run as worker process of the given user, serving the api on a "
+                "unix domain socket in the data directory of the user"
+            ),
+            type=str,
+            metavar="<String>",
+        )
+        parser.add_conditional_argument(
+            "--sharedTor",
+            help=(
+                "Run one Tor instance for all users instead of one per user. Each user gets its "
+                "own onion service and SOCKS credentials on it. If torControlPort is set, the "
+                "Tor instance behind it is shared"
+            ),
+            type=parse_bool,
+            metavar="<Boolean>",
+            nargs="?",
+            const=True,
+            unavailable_if=["torProxyHost", "torProxyPort"],
+        )
         return parser
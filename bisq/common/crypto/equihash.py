@@ -19,6 +19,12 @@ from utils.java_compat import (
     unsigned_compare,
 )
 
+try:
+    from bisq.common.crypto import equihash_numpy
+except ImportError:
+    # numpy is optional, the pure python implementation is used without it
+    equihash_numpy = None
+
 
 class Equihash:
     HASH_BIT_LENGTH = 256
@@ -203,6 +209,17 @@ def find_equihash_solution(equihash: "Equihash", seed: bytes):
         nonce += 1
 
 
+def find_equihash_solution_in_range(
+    equihash: "Equihash", seed: bytes, start: int, end: int
+) -> Optional["EquihashPuzzleSolution"]:
+    """Returns the solution for the lowest nonce in [start, end) which has one, or None."""
+    for nonce in range(start, end):
+        result = equihash.with_hash_prefix(seed, nonce).find_inputs()
+        if result is not None:
+            return EquihashPuzzleSolution(equihash, seed, nonce, list(result))
+    return None
+
+
 def count_all_solutions_for_nonce(equihash: "Equihash", seed: bytes, nonce: int) -> int:
     return len(set(equihash.with_hash_prefix(seed, nonce).stream_inputs_hits()))
 
@@ -283,21 +300,34 @@ class EquihashWithHashPrefix:
         digest.update(input_bytes)
         return bytes_to_ints_be(digest.digest())
 
-    def stream_inputs_hits(self):
-        table = self.compute_all_hashes()
-        for i in range(self.equihash.k):
-            table = self.equihash.find_collisions(table, i + 1 < self.equihash.k)
+    def stream_inputs_hits(self, use_numpy: Optional[bool] = None):
+        if use_numpy is None:
+            use_numpy = equihash_numpy is not None
+        if use_numpy:
+            rows = equihash_numpy.find_distinct_input_tuples(
+                self.prefix_bytes, self.equihash.k, self.equihash.N
+            )
+        else:
+            rows = self.find_distinct_input_tuples()
 
         def row_generator():
-            for i in range(table.num_rows):
-                row = table.get_row(i)
-                if len(set(row)) == self.equihash.input_num:
-                    sorted_inputs = Equihash.sort_inputs(list(row))
-                    if self.test_difficulty_condition(sorted_inputs):
-                        yield tuple(sorted_inputs)
+            for row in rows:
+                sorted_inputs = Equihash.sort_inputs(list(row))
+                if self.test_difficulty_condition(sorted_inputs):
+                    yield tuple(sorted_inputs)
 
         return row_generator()
 
+    def find_distinct_input_tuples(self):
+        table = self.compute_all_hashes()
+        for i in range(self.equihash.k):
+            table = self.equihash.find_collisions(table, i + 1 < self.equihash.k)
+
+        for i in range(table.num_rows):
+            row = table.get_row(i)
+            if len(set(row)) == self.equihash.input_num:
+                yield row
+
     def find_inputs(self) -> Optional[tuple[int, ...]]:
         return next(self.stream_inputs_hits(), None)
 
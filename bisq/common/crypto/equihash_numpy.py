@@ -0,0 +1,82 @@
+# NumPy backed table construction and collision search for Equihash.
+# Requires numpy, which is an optional dependency; equihash.py falls back to the
+# pure python implementation if it cannot be imported.
+
+import hashlib
+import struct
+
+import numpy as np
+
+_INPUT_STRUCT = struct.Struct(">I")
+
+
+def compute_all_hashes(prefix_bytes: bytes, k: int, n: int) -> np.ndarray:
+    """
+    Returns the (n, k + 1) uint32 array of the first k + 1 hash words of every
+    input, masked to n / 2 - 1 like `EquihashWithHashPrefix.compute_all_hashes`.
+    """
+    prefix = hashlib.blake2b(prefix_bytes, digest_size=32)
+    copy_prefix = prefix.copy
+    pack_input = _INPUT_STRUCT.pack
+    digests = []
+    for i in range(n):
+        digest = copy_prefix()
+        digest.update(pack_input(i))
+        digests.append(digest.digest())
+    words = np.frombuffer(b"".join(digests), dtype=">u4").reshape(n, 8)
+    return (words[:, : k + 1] & (n // 2 - 1)).astype(np.uint32)
+
+
+def find_collisions(
+    hashes: np.ndarray, indices: np.ndarray, is_partial: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pairs up all rows whose first hash word collides (or all hash words, for the
+    final round) and returns the xor-ed remaining hash words and the concatenated
+    index tuples of the pairs, with the lower row first as in `Equihash.find_collisions`.
+    """
+    compared = hashes[:, :1] if is_partial else hashes
+    if compared.shape[1] == 1:
+        order = np.argsort(compared[:, 0], kind="stable")
+    else:
+        order = np.lexsort(compared.T[::-1])
+    sorted_compared = compared[order]
+
+    # rows with equal keys are adjacent after sorting, so all pairs within a bucket
+    # are found by comparing each row with the one d positions further for d = 1, 2, ...
+    lefts = []
+    rights = []
+    d = 1
+    while d < len(order):
+        same = np.all(sorted_compared[:-d] == sorted_compared[d:], axis=1)
+        positions = np.flatnonzero(same)
+        if len(positions) == 0:
+            break
+        lefts.append(order[positions])
+        rights.append(order[positions + d])
+        d += 1
+
+    if lefts:
+        left = np.concatenate(lefts)
+        right = np.concatenate(rights)
+    else:
+        left = right = np.empty(0, dtype=np.intp)
+
+    if is_partial:
+        new_hashes = hashes[left, 1:] ^ hashes[right, 1:]
+    else:
+        new_hashes = np.empty((len(left), 0), dtype=np.uint32)
+    new_indices = np.concatenate((indices[left], indices[right]), axis=1)
+    return new_hashes, new_indices
+
+
+def find_distinct_input_tuples(prefix_bytes: bytes, k: int, n: int) -> list[list[int]]:
+    """Returns all index tuples of the final table which consist of 2 ** k distinct inputs."""
+    hashes = compute_all_hashes(prefix_bytes, k, n)
+    indices = np.arange(n, dtype=np.uint32).reshape(n, 1)
+    for i in range(k):
+        hashes, indices = find_collisions(hashes, indices, i + 1 < k)
+
+    sorted_indices = np.sort(indices, axis=1)
+    distinct = np.all(sorted_indices[:, 1:] != sorted_indices[:, :-1], axis=1)
+    return indices[distinct].tolist()
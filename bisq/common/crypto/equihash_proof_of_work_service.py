@@ -1,12 +1,15 @@
+from functools import partial
 from utils.aio import FutureCallback
 from typing import Optional
+from bisq.common.crypto import equihash as equihash_module
 from bisq.common.crypto.equihash import (
     Equihash,
     EquihashPuzzleSolution,
     deserialize_equihash_puzzle_solution,
-    find_equihash_solution,
+    find_equihash_solution_in_range,
 )
 from bisq.common.crypto.hash import get_sha256_hash
+from bisq.common.crypto.proof_of_work_batch_search import ProofOfWorkBatchSearch
 from bisq.common.crypto.proof_of_work_service import ProofOfWorkService
 from bisq.common.crypto.proof_of_work import ProofOfWork
 
@@ -18,6 +21,8 @@ from concurrent.futures import ProcessPoolExecutor, Future
 class EquihashProofOfWorkService(ProofOfWorkService):
     DIFFICULTY_SCALE_FACTOR = 3.0e-5
     """Rough cost of two Hashcash iterations compared to solving an Equihash-90-5 puzzle of unit difficulty."""
+    NONCE_BATCH_SIZE = 4
+    """Number of nonces a minting task tries before it reports back, if numpy is available."""
 
     def __init__(self, version: int):
         super().__init__(version)
@@ -31,17 +36,12 @@ class EquihashProofOfWorkService(ProofOfWorkService):
             self._process_pool_executor is None
             or self._process_pool_executor._shutdown_thread
         ):
-            self._process_pool_executor = ProcessPoolExecutor(1)
+            self._process_pool_executor = ProcessPoolExecutor(self.get_num_workers())
         scaled_difficulty = EquihashProofOfWorkService._scaled_difficulty(difficulty)
         self.logger.info(f"Got scaled & adjusted difficulty: {scaled_difficulty}")
 
         future = Future[ProofOfWork]()
         ts = get_time_ms()
-        executor_result = self._process_pool_executor.submit(
-            find_equihash_solution,
-            Equihash(90, 5, scaled_difficulty),
-            self._get_seed(payload, challenge),
-        )
 
         def on_success(result: "EquihashPuzzleSolution"):
             solution = result.serialize()
@@ -57,14 +57,33 @@ class EquihashProofOfWorkService(ProofOfWorkService):
             )
             self.logger.info(f"Completed minting proofOfWork: {proof_of_work}")
             future.set_result(proof_of_work)
-                
 
         def on_failure(e):
             future.set_exception(e)
 
-        executor_result.add_done_callback(FutureCallback(on_success, on_failure))
+        # nonces are tried in parallel if we expect to need more than one batch of them
+        expected_nonces = scaled_difficulty / Equihash.MEAN_SOLUTION_COUNT_PER_NONCE
+        nonce_batch_size = EquihashProofOfWorkService.get_nonce_batch_size()
+        ProofOfWorkBatchSearch(
+            self._process_pool_executor,
+            partial(
+                find_equihash_solution_in_range,
+                Equihash(90, 5, scaled_difficulty),
+                self._get_seed(payload, challenge),
+            ),
+            nonce_batch_size,
+            FutureCallback(on_success, on_failure),
+        ).start(self.get_num_workers() if expected_nonces > nonce_batch_size else 1)
         return future
 
+    @staticmethod
+    def get_nonce_batch_size() -> int:
+        # Keeps a task at well under a second. Without numpy a single nonce takes
+        # about two seconds, so each task tries only one.
+        if equihash_module.equihash_numpy is None:
+            return 1
+        return EquihashProofOfWorkService.NONCE_BATCH_SIZE
+
     def _get_seed(self, payload: bytes, challenge: bytes):
         return get_sha256_hash(payload + challenge)
 
@@ -77,7 +96,7 @@ class EquihashProofOfWorkService(ProofOfWorkService):
             (escaped_item_id + ", " + escaped_owner_id).encode("utf-8")
         )
 
-    def verify(self, proof_of_work: ProofOfWork):
+    def do_verify(self, proof_of_work: ProofOfWork):
         scaled_difficulty = EquihashProofOfWorkService._scaled_difficulty(proof_of_work.difficulty)
         seed = self._get_seed(proof_of_work.payload, proof_of_work.challenge)
         equihash = Equihash(90, 5, scaled_difficulty)
@@ -1,10 +1,13 @@
+from functools import partial
 from typing import Optional
 from bisq.common.crypto.hash_cash_service_work import (
-    do_mint,
+    MINT_BATCH_SIZE,
+    mint_range,
     number_of_leading_zeros,
     to_num_leading_zeros,
     to_sha256_hash,
 )
+from bisq.common.crypto.proof_of_work_batch_search import ProofOfWorkBatchSearch
 from bisq.common.crypto.proof_of_work_service import ProofOfWorkService
 from bisq.common.crypto.proof_of_work import ProofOfWork
 
@@ -27,26 +30,19 @@ class HashCashService(ProofOfWorkService):
             self._process_pool_executor is None
             or self._process_pool_executor._shutdown_thread
         ):
-            self._process_pool_executor = ProcessPoolExecutor(1)
+            self._process_pool_executor = ProcessPoolExecutor(self.get_num_workers())
 
         future = Future[ProofOfWork]()
         ts = get_time_ms()
-        executor_result = self._process_pool_executor.submit(
-            do_mint,
-            payload,
-            challenge,
-            difficulty,
-        )
 
-        def on_success(result: tuple[int, bytes]):
-            counter, solution = result
+        def on_success(counter: int):
             proof_of_work = ProofOfWork(
                 payload,
                 counter,
                 challenge,
                 difficulty,
                 get_time_ms() - ts,
-                solution,
+                counter.to_bytes(8, "big", signed=True),
                 0,
             )
             self.logger.info(f"Completed minting proofOfWork: {proof_of_work}")
@@ -55,10 +51,22 @@ class HashCashService(ProofOfWorkService):
         def on_failure(e):
             future.set_exception(e)
 
-        executor_result.add_done_callback(FutureCallback(on_success, on_failure))
+        log2_difficulty = to_num_leading_zeros(difficulty)
+        # easy proofs are found within the first batch, so we only fan out if the
+        # expected number of iterations exceeds a single batch
+        expected_iterations = 1 << min(log2_difficulty + 1, 64)
+        ProofOfWorkBatchSearch(
+            self._process_pool_executor,
+            partial(mint_range, payload, challenge, log2_difficulty),
+            MINT_BATCH_SIZE,
+            FutureCallback(on_success, on_failure),
+            first=1,
+        ).start(
+            self.get_num_workers() if expected_iterations > MINT_BATCH_SIZE else 1
+        )
         return future
 
-    def verify(self, proof_of_work: ProofOfWork) -> bool:
+    def do_verify(self, proof_of_work: ProofOfWork) -> bool:
         hash_result = to_sha256_hash(
             proof_of_work.payload,
             proof_of_work.challenge,
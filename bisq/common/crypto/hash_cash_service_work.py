@@ -1,35 +1,20 @@
-from ctypes import c_byte
+import hashlib
 import struct
+from typing import Optional
 from bisq.common.crypto.hash import get_sha256_hash
 
-from utils.java_compat import (
-    get_exponent_double,
-    int_unsigned_right_shift,
-    next_down_double,
-)
+from utils.java_compat import get_exponent_double, next_down_double
 
 
-def number_of_leading_zeros_byte(byte: int) -> int:
-    byte = c_byte(byte).value
-    if byte <= 0:
-        return 8 if byte == 0 else 0
-    n = 7
-    if byte >= 1 << 4:
-        n -= 4
-        byte = int_unsigned_right_shift(byte, 4)
-    if byte >= 1 << 2:
-        n -= 2
-        byte = int_unsigned_right_shift(byte, 2)
-    return n - int_unsigned_right_shift(byte, 1)
+# Number of counters a single minting task checks before it reports back, which
+# bounds how much work is wasted after another task already found a solution.
+MINT_BATCH_SIZE = 1 << 14
+
+_COUNTER_STRUCT = struct.Struct(">q")
 
 
 def number_of_leading_zeros(bytes_data: bytes) -> int:
-    number_of_leading_zeros = 0
-    for i, byte in enumerate(bytes_data):
-        number_of_leading_zeros += number_of_leading_zeros_byte(byte)
-        if number_of_leading_zeros < 8 * (i + 1):
-            break
-    return number_of_leading_zeros
+    return len(bytes_data) * 8 - int.from_bytes(bytes_data, "big").bit_length()
 
 
 def to_sha256_hash(payload: bytes, challenge: bytes, counter: int) -> bytes:
@@ -41,14 +26,28 @@ def to_num_leading_zeros(difficulty: float) -> int:
     return get_exponent_double(max(next_down_double(difficulty), 0.5)) + 1
 
 
-def do_mint(payload: bytes, challenge: bytes, difficulty: float) -> tuple[int, bytes]:
-    log2_difficulty = to_num_leading_zeros(difficulty)
-    counter = 0
-    while True:
-        counter += 1
-        hash_result = to_sha256_hash(payload, challenge, counter)
-        if number_of_leading_zeros(hash_result) > log2_difficulty:
-            break
+def mint_range(
+    payload: bytes, challenge: bytes, log2_difficulty: int, start: int, end: int
+) -> Optional[int]:
+    """
+    Returns the lowest counter in [start, end) whose hash has more than
+    `log2_difficulty` leading zeros or None if there is none.
+
+    The sha256 state of payload + challenge is computed once and copied for each
+    counter, and instead of counting the zeros the hash is compared as an integer
+    against the largest value with enough leading zeros.
+    """
+    if log2_difficulty >= 256:
+        return None
+    bound = 1 << (255 - log2_difficulty)
+    prefix = hashlib.sha256(payload + challenge)
+    copy_prefix = prefix.copy
+    pack_counter = _COUNTER_STRUCT.pack
+    from_bytes = int.from_bytes
+    for counter in range(start, end):
+        digest = copy_prefix()
+        digest.update(pack_counter(counter))
+        if from_bytes(digest.digest(), "big") < bound:
+            return counter
+    return None
 
-    solution = struct.pack(">q", counter)
-    return counter, solution
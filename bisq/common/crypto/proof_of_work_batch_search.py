@@ -0,0 +1,92 @@
+from concurrent.futures import CancelledError, Executor, Future
+from threading import RLock
+from typing import Callable, Generic, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+
+class ProofOfWorkBatchSearch(Generic[_T]):
+    """
+    Searches a counter or nonce space in consecutive batches spread over an executor.
+
+    `search` is called with the half open range [start, end) of a batch and returns
+    a solution or None. As soon as one batch yields a solution no further batches
+    get submitted and the queued ones are cancelled, so at most the batches already
+    running are wasted. The callback receives a completed future with the solution.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        search: Callable[[int, int], Optional[_T]],
+        batch_size: int,
+        callback: Callable[[Future[_T]], None],
+        first: int = 0,
+    ):
+        self._executor = executor
+        self._search = search
+        self._batch_size = batch_size
+        self._callback = callback
+        # reentrant as done callbacks of already completed batches run immediately
+        self._lock = RLock()
+        self._next_start = first
+        self._pending: set[Future[Optional[_T]]] = set()
+        self._done = False
+        self._outcome: Optional[Future[_T]] = None
+
+    def start(self, num_batches: int):
+        """Submits the given number of batches, each finished batch gets replaced by the next one."""
+        with self._lock:
+            for _ in range(max(num_batches, 1)):
+                self._submit_next_batch()
+            outcome = self._take_outcome()
+        self._notify(outcome)
+
+    def _submit_next_batch(self):
+        if self._done:
+            return
+        start = self._next_start
+        self._next_start += self._batch_size
+        try:
+            batch = self._executor.submit(self._search, start, start + self._batch_size)
+        except BaseException as e:
+            self._set_outcome(exception=e)
+            return
+        self._pending.add(batch)
+        batch.add_done_callback(self._on_batch_done)
+
+    def _on_batch_done(self, batch: Future[Optional[_T]]):
+        with self._lock:
+            self._pending.discard(batch)
+            if self._done:
+                return
+            if batch.cancelled():
+                self._set_outcome(exception=CancelledError())
+            elif batch.exception() is not None:
+                self._set_outcome(exception=batch.exception())
+            elif batch.result() is not None:
+                self._set_outcome(result=batch.result())
+            else:
+                self._submit_next_batch()
+            outcome = self._take_outcome()
+        self._notify(outcome)
+
+    def _set_outcome(self, result: Optional[_T] = None, exception=None):
+        self._done = True
+        for pending in self._pending:
+            pending.cancel()
+        self._pending.clear()
+        self._outcome = Future[_T]()
+        if exception is not None:
+            self._outcome.set_exception(exception)
+        else:
+            self._outcome.set_result(result)
+
+    def _take_outcome(self) -> Optional[Future[_T]]:
+        outcome, self._outcome = self._outcome, None
+        return outcome
+
+    def _notify(self, outcome: Optional[Future[_T]]):
+        # invoked outside of the lock as the callback completes the caller's future
+        if outcome is not None:
+            self._callback(outcome)
@@ -1,13 +1,20 @@
 from abc import ABC, abstractmethod
 from concurrent.futures import Future
-from typing import TYPE_CHECKING
+import os
+from typing import TYPE_CHECKING, Iterable, Sequence
 
+from bisq.common.crypto.proof_of_work_verification_cache import (
+    ProofOfWorkVerificationCache,
+)
 from utils.preconditions import check_argument
 
 if TYPE_CHECKING:
     from bisq.common.crypto.proof_of_work import ProofOfWork
 
 class ProofOfWorkService(ABC):
+    verification_cache = ProofOfWorkVerificationCache()
+    """Verdicts of all proof of work services, shared to avoid verifying the same proofs again."""
+
     def __init__(self, version: int):
         self._version = version
 
@@ -21,8 +28,33 @@ class ProofOfWorkService(ABC):
     ) -> Future["ProofOfWork"]:
         pass
 
-    @abstractmethod
     def verify(self, proof_of_work: "ProofOfWork") -> bool:
+        return self.verification_cache.get_or_verify(
+            self.version, proof_of_work, self.do_verify
+        )
+
+    def verify_batch(self, proofs_of_work: Iterable["ProofOfWork"]) -> list[bool]:
+        """
+        Verifies many proofs at once, e.g. the offers of initial data, where each
+        distinct proof is verified at most once and known verdicts come from the cache.
+        """
+        verdicts: dict[tuple, bool] = {}
+        result = []
+        for proof_of_work in proofs_of_work:
+            key = ProofOfWorkVerificationCache.get_key(self.version, proof_of_work)
+            verdict = verdicts.get(key)
+            if verdict is None:
+                verdict = self.verification_cache.get(key)
+                if verdict is None:
+                    verdict = self.do_verify(proof_of_work)
+                    self.verification_cache.put(key, verdict)
+                verdicts[key] = verdict
+            result.append(verdict)
+        return result
+
+    @abstractmethod
+    def do_verify(self, proof_of_work: "ProofOfWork") -> bool:
+        """Verifies the proof without consulting the verification cache."""
         pass
 
     def get_payload(self, item_id: str) -> bytes:
@@ -49,6 +81,37 @@ class ProofOfWorkService(ABC):
         item_id: str,
         owner_id: str,
         control_difficulty: float,
+    ) -> bool:
+        return self._matches_ids(
+            proof_of_work, item_id, owner_id, control_difficulty
+        ) and self.verify(proof_of_work)
+
+    def verify_all_with_ids(
+        self,
+        proofs_with_ids: Sequence[tuple["ProofOfWork", str, str]],
+        control_difficulty: float,
+    ) -> list[bool]:
+        """
+        Same result as verify_with_ids for each (proof of work, item id, owner id),
+        but the proofs are verified as one batch.
+        """
+        result = [False] * len(proofs_with_ids)
+        to_verify = [
+            (i, proof_of_work)
+            for i, (proof_of_work, item_id, owner_id) in enumerate(proofs_with_ids)
+            if self._matches_ids(proof_of_work, item_id, owner_id, control_difficulty)
+        ]
+        verdicts = self.verify_batch(proof_of_work for _, proof_of_work in to_verify)
+        for (i, _), verdict in zip(to_verify, verdicts):
+            result[i] = verdict
+        return result
+
+    def _matches_ids(
+        self,
+        proof_of_work: "ProofOfWork",
+        item_id: str,
+        owner_id: str,
+        control_difficulty: float,
     ) -> bool:
         check_argument(proof_of_work.version == self.version, "Version mismatch")
 
@@ -56,5 +119,9 @@ class ProofOfWorkService(ABC):
         return (
             proof_of_work.challenge == control_challenge
             and proof_of_work.difficulty >= control_difficulty
-            and self.verify(proof_of_work)
         )
+
+    @staticmethod
+    def get_num_workers() -> int:
+        """Number of worker processes used for minting."""
+        return os.cpu_count() or 1
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Optional
+
+from bisq.common.crypto.hash import get_sha256_hash
+
+if TYPE_CHECKING:
+    from bisq.common.crypto.proof_of_work import ProofOfWork
+
+
+class ProofOfWorkVerificationCache:
+    """
+    Bounded LRU cache of proof of work verdicts.
+
+    The same offers arrive again on republishing, TTL refreshes and with the
+    GetDataResponse of every peer we connect to, so we remember whether a proof of
+    work has been valid instead of verifying it again. The verdict only depends on
+    the proof itself and the version of the service verifying it, which is why the
+    key covers all fields verify looks at.
+    """
+
+    DEFAULT_MAX_SIZE = 10_000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self._verdicts = OrderedDict[tuple, bool]()
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(version: int, proof_of_work: "ProofOfWork") -> tuple:
+        return (
+            version,
+            get_sha256_hash(proof_of_work.payload),
+            proof_of_work.challenge,
+            proof_of_work.difficulty,
+            proof_of_work.counter,
+            proof_of_work.solution,
+        )
+
+    def get(self, key: tuple) -> Optional[bool]:
+        with self._lock:
+            verdict = self._verdicts.get(key)
+            if verdict is not None:
+                self._verdicts.move_to_end(key)
+            return verdict
+
+    def put(self, key: tuple, verdict: bool):
+        with self._lock:
+            self._verdicts[key] = verdict
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self.max_size:
+                self._verdicts.popitem(last=False)
+
+    def get_or_verify(
+        self,
+        version: int,
+        proof_of_work: "ProofOfWork",
+        verifier: Callable[["ProofOfWork"], bool],
+    ) -> bool:
+        key = self.get_key(version, proof_of_work)
+        verdict = self.get(key)
+        if verdict is None:
+            verdict = verifier(proof_of_work)
+            self.put(key, verdict)
+        return verdict
+
+    def clear(self):
+        with self._lock:
+            self._verdicts.clear()
+
+    def __len__(self):
+        return len(self._verdicts)
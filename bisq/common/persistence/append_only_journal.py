@@ -0,0 +1,221 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from datetime import timedelta
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.common.timer import Timer
+from bisq.common.user_thread import UserThread
+from proto.delimited_protobuf import read_delimited, write_delimited
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from google.protobuf.message import Message
+    from bisq.common.persistence.persistence_manager import PersistenceManager
+
+_R = TypeVar("_R", bound="Message")
+
+
+def _get_file_state(file: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = file.stat()
+        return stat.st_ino, stat.st_mtime_ns
+    except OSError:
+        return None
+
+
+class AppendOnlyJournal(Generic[_R], ABC):
+    """
+    Append-only journal of the changes to the data persisted by a PersistenceManager.
+
+    Instead of writing all data on each change, the changes get appended as delimited protobuf
+    records to journal files next to the snapshot written by the PersistenceManager. At startup the
+    journal files are replayed on top of the snapshot. When the journal got large enough, it gets
+    compacted: a new snapshot is written and the journal files it covers are deleted.
+
+    A file which got replayed is never appended to, as it might end with an incomplete record. So
+    the records go to files of increasing generations. Subclasses define how their changes get
+    encoded to records and applied at replay.
+    """
+
+    FILE_NAME_INFIX = ".journal."
+
+    def __init__(
+        self,
+        persistence_manager: "PersistenceManager",
+        record_class: type[_R],
+        generation: int = 0,
+    ):
+        self.logger = get_ctx_logger(__name__)
+        self.persistence_manager = persistence_manager
+        self.record_class = record_class
+        self.dir: Path = persistence_manager.dir
+        self.file_name_prefix = persistence_manager.file_name + self.FILE_NAME_INFIX
+        self.flush_delay = timedelta(milliseconds=persistence_manager.source.delay)
+        # generation of the file new records get appended to
+        self.generation = generation
+        # records in the journal files written since the last compaction
+        self.num_records = 0
+        self._flush_timer: Optional[Timer] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @abstractmethod
+    def _apply_record(self, record: _R):
+        pass
+
+    @abstractmethod
+    def _drain_records(self) -> list[_R]:
+        """Returns the records of the changes since the last call."""
+        pass
+
+    @abstractmethod
+    def _is_compaction_due(self) -> bool:
+        pass
+
+    def _on_compaction(self, generation: int):
+        """Called before the snapshot gets written, with the first generation it does not contain."""
+        pass
+
+    def get_file(self, generation: int) -> Path:
+        return self.dir.joinpath(f"{self.file_name_prefix}{generation}")
+
+    def get_generations(self) -> list[int]:
+        generations = []
+        if not self.dir.exists():
+            return generations
+        for file in self.dir.iterdir():
+            name = file.name
+            if name.startswith(self.file_name_prefix):
+                suffix = name[len(self.file_name_prefix) :]
+                if suffix.isdigit():
+                    generations.append(int(suffix))
+        generations.sort()
+        return generations
+
+    def replay(self, first_generation: int = 0) -> int:
+        """
+        Applies the records of the journal files. Needs to be called after the snapshot got loaded.
+        Files before first_generation are covered by the snapshot and get deleted instead.
+        """
+        generations = self.get_generations()
+        covered = [g for g in generations if g < first_generation]
+        if covered:
+            # Left over from a compaction which got interrupted before deleting them
+            self._submit(self._delete_up_to, covered[-1])
+        generations = generations[len(covered) :]
+        num_records = 0
+        for generation in generations:
+            num_records += self._replay_file(self.get_file(generation))
+        # We never append to a replayed file, as it might end with an incomplete record
+        self.generation = max(
+            first_generation, generations[-1] + 1 if generations else 0
+        )
+        self.num_records = num_records
+        if num_records:
+            self.logger.info(
+                f"Replayed {num_records} records of {len(generations)} "
+                f"{self.file_name_prefix}* files"
+            )
+        return num_records
+
+    def _replay_file(self, file: Path) -> int:
+        num_records = 0
+        try:
+            with file.open("rb") as file_in:
+                while True:
+                    record = read_delimited(file_in, self.record_class)
+                    if record is None:
+                        break
+                    self._apply_record(record)
+                    num_records += 1
+        except Exception as e:
+            # Most likely the last record was not completely written before the app terminated
+            self.logger.warning(
+                f"Reading {file.name} stopped after {num_records} records. {e}"
+            )
+        return num_records
+
+    def request_flush(self):
+        # We write with a delay to batch the changes of many operations
+        if self._flush_timer is None:
+            self._flush_timer = UserThread.run_after(
+                self._on_flush_timer, self.flush_delay
+            )
+
+    def _on_flush_timer(self):
+        self._flush_timer = None
+        self.flush()
+        if self._is_compaction_due():
+            self.compact()
+
+    def flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+
+        records = self._drain_records()
+        if records:
+            self.num_records += len(records)
+            self._submit(self._append, self.get_file(self.generation), records)
+
+    def compact(self, complete_handler: Optional["Callable[[], None]"] = None):
+        """Writes a snapshot, which replaces all journal files written so far."""
+        self.flush()
+        covered_generation = self.generation
+        self.generation += 1
+        self.num_records = 0
+        self._on_compaction(self.generation)
+        storage_file = self.persistence_manager.storage_file
+        file_state = _get_file_state(storage_file)
+
+        def on_written():
+            # The PersistenceManager calls us also if writing failed or was not permitted yet.
+            # A successful write replaced the file.
+            new_file_state = _get_file_state(storage_file)
+            if new_file_state is not None and new_file_state != file_state:
+                self._submit(self._delete_up_to, covered_generation)
+            if complete_handler:
+                complete_handler()
+
+        # The snapshot gets serialized synchronously by persist_now, so it contains all changes
+        # written to the current and previous generations.
+        self.persistence_manager.persist_now(on_written)
+
+    def _append(self, file: Path, records: list[_R]):
+        try:
+            with file.open("ab") as file_out:
+                for record in records:
+                    write_delimited(file_out, record)
+                file_out.flush()
+                os.fsync(file_out.fileno())
+        except Exception as e:
+            self.logger.error(f"Appending to {file.name} failed", exc_info=e)
+
+    def _delete_up_to(self, generation: int):
+        for covered_generation in self.get_generations():
+            if covered_generation > generation:
+                break
+            try:
+                self.get_file(covered_generation).unlink(missing_ok=True)
+            except Exception as e:
+                self.logger.error(
+                    f"Deleting {self.get_file(covered_generation).name} failed",
+                    exc_info=e,
+                )
+
+    def _submit(self, fn, *args):
+        # A single thread, so the files are written in the order of the calls
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"Write-{type(self).__name__}"
+            )
+        self._executor.submit(contextvars.copy_context().run, fn, *args)
+
+    def shut_down(self):
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
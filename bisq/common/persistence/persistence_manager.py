@@ -1,4 +1,4 @@
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 import contextvars
 from datetime import timedelta
 import threading
@@ -68,6 +68,8 @@ class PersistenceManager(Generic[T]):
         self.write_to_disk_executor: Optional[ThreadPoolExecutor] = None
         self.init_called = False
         self.read_called = False
+        # file name -> data read ahead of the read_persisted call
+        self._prefetched: dict[str, Future[Optional[T]]] = {}
 
     ###############################################################################
 
@@ -117,6 +119,7 @@ class PersistenceManager(Generic[T]):
             self.write_to_disk_executor.shutdown()
             self.write_to_disk_executor = None
 
+        self.release_prefetched()
         self.persistable = None # unref
 
     ###########################################################################
@@ -137,8 +140,9 @@ class PersistenceManager(Generic[T]):
             )
             return
 
-        def read():
-            persisted = self.get_persisted(file_name)
+        def read(persisted: Optional[T] = None):
+            if persisted is None:
+                persisted = self.get_persisted(file_name)
             if persisted:
 
                 def run():
@@ -151,9 +155,53 @@ class PersistenceManager(Generic[T]):
                 UserThread.execute(or_else)
 
         ctx = contextvars.copy_context()
-        threading.Thread(
-            target=ctx.run, args=(read,), name="PersistenceManager-read-" + file_name
-        ).start()
+
+        def start_read_thread():
+            threading.Thread(
+                target=ctx.run,
+                args=(read,),
+                name="PersistenceManager-read-" + file_name,
+            ).start()
+
+        def on_prefetched(future: Future[Optional[T]]):
+            if future.cancelled() or future.exception() or future.result() is None:
+                # We try again, the file might have been replaced since
+                start_read_thread()
+            else:
+                self.read_called = True
+                ctx.run(read, future.result())
+
+        prefetched = self._prefetched.pop(file_name, None)
+        if prefetched is not None:
+            prefetched.add_done_callback(on_prefetched)
+        else:
+            start_read_thread()
+
+    def prefetch_persisted(
+        self, executor: Executor, file_name: Optional[str] = None
+    ) -> Optional[Future[Optional[T]]]:
+        """
+        Reads and parses the file on the executor, so the next read_persisted call for it does not
+        need to wait for the file to be read. Returns None if there is no file to read.
+        """
+        file_name = file_name or self.file_name
+        assert file_name, "file_name cannot be null"
+        if file_name in self._prefetched:
+            return self._prefetched[file_name]
+        if not self.dir.joinpath(file_name).exists():
+            return None
+
+        ctx = contextvars.copy_context()
+        # read_called is only set once the data is requested, so we never write before it got applied
+        future = executor.submit(ctx.run, self._read_file, file_name)
+        self._prefetched[file_name] = future
+        return future
+
+    def release_prefetched(self):
+        """Releases data which got read ahead but was not requested by a read_persisted call."""
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
 
     def get_persisted(self, file_name: Optional[str] = None) -> Optional[T]:
         if self._persistence_orchestrator.flush_at_shutdown_called:
@@ -163,8 +211,9 @@ class PersistenceManager(Generic[T]):
             return None
 
         self.read_called = True
+        return self._read_file(file_name or self.file_name)
 
-        file_name = file_name or self.file_name
+    def _read_file(self, file_name: str) -> Optional[T]:
         assert file_name, "file_name cannot be null"
 
         storage_file = self.dir.joinpath(file_name)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from bisq.common.handlers.result_handler import ResultHandler
 from bisq.common.setup.log_setup import get_ctx_logger
@@ -7,7 +7,11 @@ from utils.concurrency import AtomicBoolean, AtomicInt
 
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
     from bisq.common.persistence.persistence_manager import PersistenceManager
+    from bisq.common.protocol.persistable.persistable_envelope import (
+        PersistableEnvelope,
+    )
 
 
 class PersistenceOrchestrator:
@@ -19,9 +23,26 @@ class PersistenceOrchestrator:
         self.flush_at_shutdown_called = AtomicBoolean(False)
         self.logger = get_ctx_logger(__name__)
 
+    def prefetch_persisted(
+        self, executor: "Executor"
+    ) -> dict[str, "Future[Optional[PersistableEnvelope]]"]:
+        """
+        Reads the files of the PersistenceManagers which have not been read yet on the executor.
+        Returns the futures by file name.
+        """
+        futures = {}
+        for file_name, manager in list(self.all_persistence_managers.items()):
+            if not manager.read_called:
+                future = manager.prefetch_persisted(executor)
+                if future is not None:
+                    futures[file_name] = future
+        return futures
+
     def on_all_services_initialized(self):
         self.all_services_initialized.set(True)
         for manager in self.all_persistence_managers.values():
+            # Data of stores which did not get read at startup is not needed anymore
+            manager.release_prefetched()
             # In case we got a requestPersistence call before we got initialized we trigger the timer for the
             # persist call
             if manager.persistence_requested.get():
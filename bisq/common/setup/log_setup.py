@@ -152,11 +152,13 @@ class CustomRotatingFileHandler(RotatingFileHandler):
         return default_name
 
 
-def setup_aggregated_logger(app_data_dir: Path, log_level="INFO"):
+def setup_aggregated_logger(
+    app_data_dir: Path, log_level="INFO", log_file_name="bisq.log"
+):
     global base_logger_file_handler
     log_dir = app_data_dir.joinpath("all_logs")
     log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = str(log_dir.joinpath("bisq.log"))
+    log_file = str(log_dir.joinpath(log_file_name))
     file_handler = CustomRotatingFileHandler(
         filename=log_file,
         maxBytes=10 * 1024 * 1024,  # 10MB
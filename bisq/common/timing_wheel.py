@@ -0,0 +1,229 @@
+import contextvars
+import itertools
+import math
+import random
+import threading
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Optional
+
+from bisq.common.setup.log_setup import get_base_logger
+from bisq.common.timer import Timer
+from bisq.common.user_thread import UserThread
+from utils.clock import Clock
+
+logger = get_base_logger(__name__)
+
+
+class WheelTimer(Timer):
+    """A timer of a TimingWheel. Same as other timers it can be used once."""
+
+    def __init__(self, wheel: "TimingWheel"):
+        self._wheel = wheel
+        self._seq = next(wheel._counter)
+        self._callable: Optional[Callable[[], None]] = None
+        self._ctx: Optional[contextvars.Context] = None
+        self._interval_ms: Optional[int] = None
+        self._due_tick = 0
+        self._stopped = False
+
+    @property
+    def is_periodically(self) -> bool:
+        return self._interval_ms is not None
+
+    def run_later(self, delay: timedelta, callable: Callable[[], None]) -> "WheelTimer":
+        self._callable = callable
+        self._ctx = contextvars.copy_context()
+        self._wheel._schedule(self, int(delay.total_seconds() * 1000))
+        return self
+
+    def run_periodically(
+        self, interval: timedelta, callable: Callable[[], None]
+    ) -> "WheelTimer":
+        self._interval_ms = int(interval.total_seconds() * 1000)
+        return self.run_later(interval, callable)
+
+    def stop(self) -> None:
+        if not self._stopped:
+            self._stopped = True
+            self._wheel._unschedule(self)
+
+    def _run(self):
+        try:
+            self._ctx.run(self._callable)
+        except Exception as e:
+            logger.error("Exception in timer of timing wheel", exc_info=e)
+
+
+class TimingWheel:
+    """
+    Shared timer for the many short and imprecise delays of per connection maintenance
+    (pings, peer exchange, timeouts).
+
+    Timers are put into the slot of the tick they are due at. Instead of one reactor
+    timer per timer, the wheel wakes up once for each tick that has due timers and runs
+    all of them, so timers of many connections and users which are due within the same
+    tick share one wakeup. Delays are rounded up to the next tick, random delays are
+    drawn the same way as UserThread does before they get rounded.
+
+    Timers run on the user thread with the context they got scheduled in.
+    """
+
+    # Same resolution as the MasterTimer frame interval. Fine enough for the random
+    # delays of the handlers (up to 500 ms for the peer exchange).
+    DEFAULT_TICK_MS = 100
+    DEFAULT_NUM_SLOTS = 1024
+
+    _default_wheel: Optional["TimingWheel"] = None
+
+    def __init__(
+        self,
+        tick_ms: int = DEFAULT_TICK_MS,
+        num_slots: int = DEFAULT_NUM_SLOTS,
+        clock: Optional[Clock] = None,
+        timer_factory: Callable[
+            [Callable[[], None], timedelta], Timer
+        ] = UserThread.run_after,
+    ):
+        self.tick_ms = tick_ms
+        self.num_slots = num_slots
+        self.clock = clock or Clock()
+        self._timer_factory = timer_factory
+        self._lock = threading.RLock()
+        self._slots: list[list[WheelTimer]] = [[] for _ in range(num_slots)]
+        self._num_timers = 0
+        self._counter = itertools.count()
+        # all ticks up to this one are processed
+        self._current_tick = self.clock.millis() // tick_ms
+        self._wakeup_timer: Optional[Timer] = None
+        self._wakeup_tick: Optional[int] = None
+        self._wakeup_timer_id = 0
+        self.num_wakeups = 0
+
+    @staticmethod
+    def get_default() -> "TimingWheel":
+        if TimingWheel._default_wheel is None:
+            TimingWheel._default_wheel = TimingWheel()
+        return TimingWheel._default_wheel
+
+    # API, same as the one of UserThread
+
+    def run_after(self, runnable: Callable[[], None], delay: timedelta) -> Timer:
+        return WheelTimer(self).run_later(delay, runnable)
+
+    def run_after_random_delay(
+        self,
+        runnable: Callable[[], None],
+        min_delay: timedelta,
+        max_delay: timedelta,
+    ) -> Timer:
+        delay = random.uniform(min_delay.total_seconds(), max_delay.total_seconds())
+        return self.run_after(runnable, timedelta(seconds=delay))
+
+    def run_periodically(
+        self, runnable: Callable[[], None], interval: timedelta
+    ) -> Timer:
+        return WheelTimer(self).run_periodically(interval, runnable)
+
+    def __len__(self) -> int:
+        return self._num_timers
+
+    # Private
+
+    def _schedule(self, timer: WheelTimer, delay_ms: int):
+        with self._lock:
+            if timer._stopped:
+                return
+            due_tick = math.ceil((self.clock.millis() + delay_ms) / self.tick_ms)
+            timer._due_tick = max(due_tick, self._current_tick + 1)
+            self._slots[timer._due_tick % self.num_slots].append(timer)
+            self._num_timers += 1
+            if self._wakeup_tick is None or timer._due_tick < self._wakeup_tick:
+                self._start_wakeup_timer(timer._due_tick)
+
+    def _unschedule(self, timer: WheelTimer):
+        with self._lock:
+            slot = self._slots[timer._due_tick % self.num_slots]
+            try:
+                slot.remove(timer)
+            except ValueError:
+                # not scheduled or currently running
+                return
+            self._num_timers -= 1
+            if self._num_timers == 0:
+                self._stop_wakeup_timer()
+
+    def _on_wakeup(self, wakeup_timer_id: int):
+        with self._lock:
+            # A stopped wakeup timer might still fire if it was due already
+            if wakeup_timer_id == self._wakeup_timer_id:
+                self._wakeup_timer = None
+                self._wakeup_tick = None
+        self.advance()
+
+    def advance(self):
+        """Runs all timers which are due by now."""
+        with self._lock:
+            self.num_wakeups += 1
+            now_tick = self.clock.millis() // self.tick_ms
+            due: list[WheelTimer] = []
+            # After a long pause each slot needs to be visited only once
+            num_ticks = min(now_tick - self._current_tick, self.num_slots)
+            for tick in range(now_tick - num_ticks + 1, now_tick + 1):
+                slot = self._slots[tick % self.num_slots]
+                if not slot:
+                    continue
+                remaining = []
+                for timer in slot:
+                    (due if timer._due_tick <= now_tick else remaining).append(timer)
+                slot[:] = remaining
+            self._current_tick = max(self._current_tick, now_tick)
+            self._num_timers -= len(due)
+            due.sort(key=lambda timer: (timer._due_tick, timer._seq))
+
+        for timer in due:
+            if timer._stopped:
+                continue
+            timer._run()
+            if timer.is_periodically and not timer._stopped:
+                self._schedule(timer, timer._interval_ms)
+
+        with self._lock:
+            self._update_wakeup()
+
+    def _get_next_due_tick(self) -> Optional[int]:
+        if self._num_timers == 0:
+            return None
+        first_tick = self._current_tick + 1
+        for tick in range(first_tick, first_tick + self.num_slots):
+            for timer in self._slots[tick % self.num_slots]:
+                if timer._due_tick == tick:
+                    return tick
+        # Only timers due in later rounds, we wake up to advance the wheel
+        return self._current_tick + self.num_slots
+
+    def _update_wakeup(self):
+        next_tick = self._get_next_due_tick()
+        if next_tick is None:
+            self._stop_wakeup_timer()
+            return
+        if self._wakeup_tick is not None and self._wakeup_tick <= next_tick:
+            return
+        self._start_wakeup_timer(next_tick)
+
+    def _start_wakeup_timer(self, tick: int):
+        self._stop_wakeup_timer()
+        delay_ms = max(0, tick * self.tick_ms - self.clock.millis())
+        self._wakeup_tick = tick
+        self._wakeup_timer_id += 1
+        wakeup_timer_id = self._wakeup_timer_id
+        self._wakeup_timer = self._timer_factory(
+            lambda: self._on_wakeup(wakeup_timer_id),
+            timedelta(milliseconds=delay_ms),
+        )
+
+    def _stop_wakeup_timer(self):
+        if self._wakeup_timer is not None:
+            self._wakeup_timer.stop()
+            self._wakeup_timer = None
+        self._wakeup_tick = None
@@ -2,6 +2,9 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Optional
 
 from bisq.common.version import Version
+from bisq.core.api.exception.failed_precondition_exception import (
+    FailedPreconditionException,
+)
 from bisq.core.exceptions.illegal_state_exception import IllegalStateException
 from bisq.core.user.user_context import UserContext
 from grpc_extra_pb2 import BriefUserInfo
@@ -489,12 +492,22 @@ class CoreApi:
             user_context, address, amount
         )
 
+    def _check_shared_preferences_writable(self):
+        # A worker never writes the shared preferences, the change would get lost
+        if self._config.user_worker_id:
+            raise FailedPreconditionException(
+                "changing the preferences shared by all users is not supported in "
+                "process per user mode"
+            )
+
     def set_tx_fee_rate_preference(
         self, user_context: "UserContext", tx_fee_rate: int
     ) -> None:
+        self._check_shared_preferences_writable()
         self._wallets_service.set_tx_fee_rate_preference(user_context, tx_fee_rate)
 
     def unset_tx_fee_rate_preference(self, user_context: "UserContext") -> None:
+        self._check_shared_preferences_writable()
         self._wallets_service.unset_tx_fee_rate_preference(user_context)
 
     def get_most_recent_tx_fee_rate_info(
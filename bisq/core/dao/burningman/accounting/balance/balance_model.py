@@ -44,6 +44,18 @@ class BalanceModel:
             self._received_btc_balance_entries_by_month[month] = set()
         self._received_btc_balance_entries_by_month[month].add(balance_entry)
 
+    def remove_received_btc_balance_entry(
+        self, balance_entry: "ReceivedBtcBalanceEntry"
+    ):
+        self._received_btc_balance_entries.discard(balance_entry)
+
+        month = balance_entry.month
+        entries_of_month = self._received_btc_balance_entries_by_month.get(month)
+        if entries_of_month is not None:
+            entries_of_month.discard(balance_entry)
+            if not entries_of_month:
+                del self._received_btc_balance_entries_by_month[month]
+
     @property
     def received_btc_balance_entries(self):
         return self._received_btc_balance_entries
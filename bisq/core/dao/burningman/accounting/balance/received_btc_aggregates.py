@@ -0,0 +1,209 @@
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from bisq.common.util.date_util import DateUtil
+from bisq.core.dao.burningman.accounting.balance.balance_entry_type import (
+    BalanceEntryType,
+)
+from bisq.core.dao.burningman.accounting.blockchain.accounting_tx_type import (
+    AccountingTxType,
+)
+from bisq.core.dao.burningman.burning_man_presentation_service import (
+    BurningManPresentationService,
+)
+import pb_pb2 as protobuf
+
+if TYPE_CHECKING:
+    from bisq.core.dao.burningman.accounting.blockchain.accounting_block import (
+        AccountingBlock,
+    )
+    from bisq.core.monetary.price import Price
+
+# month and type of the balance entries
+_Bucket = tuple[datetime, BalanceEntryType]
+
+
+class ReceivedBtcAggregates:
+    """
+    Running aggregates of the BTC received by the burningmen, by burningman name, month and type.
+
+    They are updated when accounting blocks get added or removed, so the totals do not need to walk
+    all balance entries. For each bucket the amounts are counted, as the conversion to BSQ is rounded
+    for each balance entry. The legacy burningmen are not included in the totals.
+    """
+
+    LEGACY_BURNING_MAN_NAMES = frozenset(
+        {
+            BurningManPresentationService.LEGACY_BURNING_MAN_DPT_NAME,
+            BurningManPresentationService.LEGACY_BURNING_MAN_BTC_FEES_NAME,
+        }
+    )
+
+    def __init__(self):
+        # name -> (month, type) -> amount -> number of balance entries
+        self._amounts_by_name: dict[str, dict[_Bucket, Counter[int]]] = {}
+        # Same as above summed up over all burningmen except the legacy burningmen
+        self._amounts_by_bucket: dict[_Bucket, Counter[int]] = {}
+        self._total_by_type: Counter[BalanceEntryType] = Counter()
+        # The BSQ value of a bucket with the price it got calculated with
+        self._as_bsq_by_bucket: dict[_Bucket, tuple["Price", int]] = {}
+
+    @staticmethod
+    def from_blocks(blocks: list["AccountingBlock"]) -> "ReceivedBtcAggregates":
+        aggregates = ReceivedBtcAggregates()
+        for block in blocks:
+            aggregates.add_block(block)
+        return aggregates
+
+    @staticmethod
+    def to_balance_entry_type(tx_type: AccountingTxType) -> BalanceEntryType:
+        if tx_type == AccountingTxType.BTC_TRADE_FEE_TX:
+            return BalanceEntryType.BTC_TRADE_FEE_TX
+        else:
+            return BalanceEntryType.DPT_TX
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // Updates
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    def add_block(self, block: "AccountingBlock"):
+        month = self._get_month(block)
+        for name, _, amount, entry_type in self._get_entries(block):
+            self._update(name, (month, entry_type), amount, 1)
+
+    def remove_block(self, block: "AccountingBlock"):
+        month = self._get_month(block)
+        for name, _, amount, entry_type in self._get_entries(block):
+            self._update(name, (month, entry_type), amount, -1)
+
+    @staticmethod
+    def _get_month(block: "AccountingBlock") -> datetime:
+        return DateUtil.get_start_of_month(datetime.fromtimestamp(block.date / 1000))
+
+    @staticmethod
+    def _get_entries(block: "AccountingBlock"):
+        # Like the ReceivedBtcBalanceEntries of a BalanceModel, identical entries count once
+        return {
+            (
+                output.get_name(),
+                tx.truncated_tx_id,
+                output.value,
+                ReceivedBtcAggregates.to_balance_entry_type(tx.type),
+            )
+            for tx in block.txs
+            for output in tx.outputs
+        }
+
+    def _update(self, name: str, bucket: _Bucket, amount: int, delta: int):
+        amounts_by_bucket = self._amounts_by_name.setdefault(name, {})
+        self._update_amounts(amounts_by_bucket, bucket, amount, delta)
+        if not amounts_by_bucket:
+            del self._amounts_by_name[name]
+        if name not in self.LEGACY_BURNING_MAN_NAMES:
+            self._update_amounts(self._amounts_by_bucket, bucket, amount, delta)
+            self._total_by_type[bucket[1]] += amount * delta
+            self._as_bsq_by_bucket.pop(bucket, None)
+
+    @staticmethod
+    def _update_amounts(
+        amounts_by_bucket: dict[_Bucket, Counter[int]],
+        bucket: _Bucket,
+        amount: int,
+        delta: int,
+    ):
+        amounts = amounts_by_bucket.setdefault(bucket, Counter())
+        amounts[amount] += delta
+        if amounts[amount] <= 0:
+            del amounts[amount]
+            if not amounts:
+                del amounts_by_bucket[bucket]
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // API
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    def get_total_amount(self, entry_type: Optional[BalanceEntryType] = None) -> int:
+        if entry_type is None:
+            return sum(self._total_by_type.values())
+        return self._total_by_type[entry_type]
+
+    def get_total_amount_as_bsq(
+        self,
+        average_bsq_price_by_month: dict[datetime, "Price"],
+        to_bsq: Callable[[int, Optional["Price"]], int],
+        entry_type: Optional[BalanceEntryType] = None,
+    ) -> int:
+        total = 0
+        for bucket, amounts in self._amounts_by_bucket.items():
+            month, bucket_type = bucket
+            if entry_type is not None and bucket_type != entry_type:
+                continue
+            price = average_bsq_price_by_month.get(month, None)
+            cached = self._as_bsq_by_bucket.get(bucket)
+            if cached is None or cached[0] is not price:
+                as_bsq = sum(
+                    to_bsq(amount, price) * count for amount, count in amounts.items()
+                )
+                cached = (price, as_bsq)
+                self._as_bsq_by_bucket[bucket] = cached
+            total += cached[1]
+        return total
+
+    def get_amount_by_month(
+        self, month: datetime, entry_type: Optional[BalanceEntryType] = None
+    ) -> int:
+        return sum(
+            amount * count
+            for (bucket_month, bucket_type), amounts in self._amounts_by_bucket.items()
+            if bucket_month == month and (entry_type is None or bucket_type == entry_type)
+            for amount, count in amounts.items()
+        )
+
+    def get_amounts_by_month_of_burning_man(self, name: str) -> dict[_Bucket, int]:
+        return {
+            bucket: sum(amount * count for amount, count in amounts.items())
+            for bucket, amounts in self._amounts_by_name.get(name, {}).items()
+        }
+
+    @property
+    def burning_man_names(self):
+        return self._amounts_by_name.keys()
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // PROTO BUFFER
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    def to_proto_message(self) -> protobuf.ReceivedBtcAggregates:
+        return protobuf.ReceivedBtcAggregates(
+            aggregates=[
+                protobuf.ReceivedBtcAggregate(
+                    name=name,
+                    month=month.year * 12 + month.month - 1,
+                    type=entry_type.value,
+                    amounts=list(amounts.keys()),
+                    counts=list(amounts.values()),
+                )
+                for name, amounts_by_bucket in self._amounts_by_name.items()
+                for (month, entry_type), amounts in amounts_by_bucket.items()
+            ]
+        )
+
+    @staticmethod
+    def from_proto(proto: protobuf.ReceivedBtcAggregates) -> "ReceivedBtcAggregates":
+        aggregates = ReceivedBtcAggregates()
+        for aggregate in proto.aggregates:
+            bucket = (
+                datetime(aggregate.month // 12, aggregate.month % 12 + 1, 1),
+                BalanceEntryType(aggregate.type),
+            )
+            for amount, count in zip(aggregate.amounts, aggregate.counts):
+                aggregates._update(aggregate.name, bucket, amount, count)
+        return aggregates
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ReceivedBtcAggregates)
+            and self._amounts_by_name == other._amounts_by_name
+        )
@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING
+
+from bisq.common.persistence.append_only_journal import AppendOnlyJournal
+from bisq.core.dao.burningman.accounting.blockchain.accounting_block import (
+    AccountingBlock,
+)
+import pb_pb2 as protobuf
+
+if TYPE_CHECKING:
+    from bisq.common.persistence.persistence_manager import PersistenceManager
+    from bisq.core.dao.burningman.accounting.storage.burning_man_accounting_store import (
+        BurningManAccountingStore,
+    )
+
+
+class BurningManAccountingJournal(AppendOnlyJournal[protobuf.AccountingBlock]):
+    """
+    Append-only journal of the accounting blocks added to the BurningManAccountingStore.
+
+    New blocks get appended to the journal, so adding a block does not serialize all blocks again.
+    Once the journal holds more blocks than the snapshot, or blocks got removed, the journal gets
+    compacted.
+
+    The snapshot stores the first journal generation it does not contain. Older journal files are
+    ignored at replay, so blocks removed by a reorg do not come back if deleting their files failed.
+    """
+
+    MIN_BLOCKS_BEFORE_COMPACTION = 1000
+
+    def __init__(
+        self,
+        persistence_manager: "PersistenceManager[BurningManAccountingStore]",
+        store: "BurningManAccountingStore",
+    ):
+        super().__init__(
+            persistence_manager, protobuf.AccountingBlock, store.journal_generation
+        )
+        self.store = store
+        self._pending_blocks: list[AccountingBlock] = []
+
+    def replay(self) -> int:
+        """Adds the blocks of the journal files to the store. Needs to be called after the snapshot got loaded."""
+        return super().replay(self.store.journal_generation)
+
+    def append(self, block: AccountingBlock):
+        self._pending_blocks.append(block)
+        # We write with a delay to batch the blocks added at a sync
+        self.request_flush()
+
+    def _apply_record(self, record: protobuf.AccountingBlock):
+        self.store.add_if_new_block(AccountingBlock.from_proto(record))
+
+    def _drain_records(self) -> list[protobuf.AccountingBlock]:
+        records = [block.to_proto_message() for block in self._pending_blocks]
+        self._pending_blocks = []
+        return records
+
+    def _is_compaction_due(self) -> bool:
+        return self.num_records > max(self.MIN_BLOCKS_BEFORE_COMPACTION, len(self.store))
+
+    def _on_compaction(self, generation: int):
+        self.store.journal_generation = generation
@@ -1,14 +1,16 @@
+from bisect import bisect_left
 from collections.abc import Callable
 from datetime import datetime
 from bisq.common.setup.log_setup import get_ctx_logger
 from threading import RLock
 from typing import Optional
 from bisq.common.protocol.persistable.persistable_envelope import PersistableEnvelope
+from bisq.core.dao.burningman.accounting.balance.received_btc_aggregates import (
+    ReceivedBtcAggregates,
+)
 from bisq.core.dao.burningman.accounting.blockchain.accounting_block import (
     AccountingBlock,
 )
-from collections import deque
-
 from bisq.core.dao.burningman.accounting.exceptions.block_hash_not_connecting_exception import (
     BlockHashNotConnectingException,
 )
@@ -22,51 +24,75 @@ import pb_pb2 as protobuf
 
 
 class BurningManAccountingStore(PersistableEnvelope):
+    """
+    The blocks are kept ordered by height, with an index by height and the last block cached, so adding a
+    block and the lookups by height do not need to scan all blocks.
+
+    The aggregates of the received BTC are updated with the blocks and persisted with them.
+    """
 
-    def __init__(self, blocks: list[AccountingBlock]):
+    def __init__(
+        self,
+        blocks: list[AccountingBlock],
+        journal_generation: int = 0,
+        received_btc_aggregates: Optional[ReceivedBtcAggregates] = None,
+    ):
         self._lock = RLock()
         self.logger = get_ctx_logger(__name__)
-        self.blocks = blocks.copy()
+        self.blocks = sorted(blocks, key=lambda block: block.height)
+        self._blocks_by_height = {block.height: block for block in self.blocks}
+        # First generation of the journal files which is not contained in this store,
+        # see BurningManAccountingJournal
+        self.journal_generation = journal_generation
+        if received_btc_aggregates is None:
+            received_btc_aggregates = ReceivedBtcAggregates.from_blocks(self.blocks)
+        self.received_btc_aggregates = received_btc_aggregates
 
-    def add_if_new_block(self, new_block: AccountingBlock):
+    def add_if_new_block(self, new_block: AccountingBlock) -> bool:
         with self._lock:
-            self._try_to_add_new_block(new_block)
+            return self._try_to_add_new_block(new_block)
 
     def for_each_block(self, consumer: Callable[[AccountingBlock], None]):
         with self._lock:
             for block in self.blocks:
                 consumer(block)
 
-    def purge_last_ten_blocks(self):
+    def purge_last_ten_blocks(self) -> list[AccountingBlock]:
         with self._lock:
-            for _ in range(10):
-                if not self.blocks:
-                    break
-                self.blocks.pop()
+            purged_blocks = self.blocks[-10:]
+            del self.blocks[-10:]
+            for block in purged_blocks:
+                del self._blocks_by_height[block.height]
+                self.received_btc_aggregates.remove_block(block)
+            return purged_blocks
 
     def remove_all_blocks(self):
         with self._lock:
             self.blocks.clear()
+            self._blocks_by_height.clear()
+            self.received_btc_aggregates = ReceivedBtcAggregates()
 
     def get_last_block(self) -> Optional[AccountingBlock]:
         with self._lock:
-            if not self.blocks:
-                return None
-            return max(self.blocks, key=lambda block: block.height)
+            return self.blocks[-1] if self.blocks else None
 
     def get_block_at_height(self, height: int) -> Optional[AccountingBlock]:
         with self._lock:
-            return next(
-                (block for block in self.blocks if block.height == height), None
-            )
+            return self._blocks_by_height.get(height)
 
     def get_blocks_at_least_with_height(self, min_height: int) -> list[AccountingBlock]:
         with self._lock:
-            return [block for block in self.blocks if block.height >= min_height]
+            from_index = bisect_left(
+                self.blocks, min_height, key=lambda block: block.height
+            )
+            return self.blocks[from_index:]
+
+    def __len__(self):
+        return len(self.blocks)
 
-    def _try_to_add_new_block(self, new_block: AccountingBlock):
+    def _try_to_add_new_block(self, new_block: AccountingBlock) -> bool:
         with self._lock:
-            if new_block not in self.blocks:
+            if self._blocks_by_height.get(new_block.height) != new_block:
                 last_block = self.get_last_block()
                 if last_block:
                     if new_block.height != last_block.height + 1:
@@ -84,17 +110,25 @@ class BurningManAccountingStore(PersistableEnvelope):
                     f"Add new accountingBlock at height {new_block.height} at {datetime.fromtimestamp(new_block.time_in_sec)} with {len(new_block.txs)} txs"
                 )
                 self.blocks.append(new_block)
+                self._blocks_by_height[new_block.height] = new_block
+                self.received_btc_aggregates.add_block(new_block)
+                return True
             else:
                 self.logger.info(
                     f"We have that block already. Height: {new_block.height}"
                 )
+                return False
 
     def to_proto_message(self):
         with self._lock:
             blocks_copy = self.blocks.copy()
+            journal_generation = self.journal_generation
+            received_btc_aggregates = self.received_btc_aggregates.to_proto_message()
         return protobuf.PersistableEnvelope(
             burning_man_accounting_store=protobuf.BurningManAccountingStore(
-                blocks=[block.to_proto_message() for block in blocks_copy]
+                blocks=[block.to_proto_message() for block in blocks_copy],
+                journal_generation=journal_generation,
+                received_btc_aggregates=received_btc_aggregates,
             )
         )
 
@@ -103,5 +137,11 @@ class BurningManAccountingStore(PersistableEnvelope):
         proto: protobuf.BurningManAccountingStore,
     ) -> "BurningManAccountingStore":
         return BurningManAccountingStore(
-            blocks=[AccountingBlock.from_proto(block) for block in proto.blocks]
+            blocks=[AccountingBlock.from_proto(block) for block in proto.blocks],
+            journal_generation=proto.journal_generation,
+            received_btc_aggregates=(
+                ReceivedBtcAggregates.from_proto(proto.received_btc_aggregates)
+                if proto.HasField("received_btc_aggregates")
+                else None
+            ),
         )
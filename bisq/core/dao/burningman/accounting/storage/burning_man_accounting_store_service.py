@@ -9,11 +9,17 @@ from bisq.common.timer import Timer
 from bisq.common.user_thread import UserThread
 from bisq.core.network.p2p.persistence.store_service import StoreService
 from utils.concurrency import AtomicBoolean
+from bisq.core.dao.burningman.accounting.storage.burning_man_accounting_journal import (
+    BurningManAccountingJournal,
+)
 from bisq.core.dao.burningman.accounting.storage.burning_man_accounting_store import (
     BurningManAccountingStore,
 )
 
 if TYPE_CHECKING:
+    from bisq.core.dao.burningman.accounting.balance.received_btc_aggregates import (
+        ReceivedBtcAggregates,
+    )
     from bisq.core.dao.burningman.accounting.blockchain.accounting_block import (
         AccountingBlock,
     )
@@ -37,6 +43,9 @@ class BurningManAccountingStoreService(StoreService["BurningManAccountingStore"]
         self.logger = get_ctx_logger(__name__)
         self._remove_all_blocks_callled = AtomicBoolean(False)
         self._timer: Optional[Timer] = None
+        # New blocks are appended to the journal, the PersistenceManager only writes all
+        # blocks when the journal gets compacted.
+        self.journal: Optional[BurningManAccountingJournal] = None
         self.resource_data_store_service.add_service(self)
 
     def read_from_resources(self, post_fix: str, complete_handler: Callable[[], None]):
@@ -61,6 +70,8 @@ class BurningManAccountingStoreService(StoreService["BurningManAccountingStore"]
         if self._timer:
             self._timer.stop()
             self._timer = None
+        if self.journal:
+            self.journal.shut_down()
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // API
@@ -72,28 +83,36 @@ class BurningManAccountingStoreService(StoreService["BurningManAccountingStore"]
     def add_if_new_block(self, block: "AccountingBlock"):
         if self._remove_all_blocks_callled.get():
             return
-        self.store.add_if_new_block(block)
-        self.request_persistence()
+        if self.store.add_if_new_block(block):
+            self.journal.append(block)
 
     def for_each_block(self, consumer: Callable[["AccountingBlock"], None]):
         self.store.for_each_block(consumer)
 
-    def purge_last_ten_blocks(self):
+    def purge_last_ten_blocks(self) -> list["AccountingBlock"]:
         if self._remove_all_blocks_callled.get():
-            return
-        self.store.purge_last_ten_blocks()
-        self.request_persistence()
+            return []
+        purged_blocks = self.store.purge_last_ten_blocks()
+        # Removed blocks are not journaled, we write a snapshot which replaces the journal
+        self.journal.compact()
+        return purged_blocks
 
     def remove_all_blocks(self, result_handler: Callable[[], None]):
         self._remove_all_blocks_callled.set(True)
         self.store.remove_all_blocks()
-        self.persistence_manager.persist_now(result_handler)
+        self.journal.compact(result_handler)
 
     def delete_storage_file(self):
         try:
             delete_file_if_exists(
                 self.storage_dir.joinpath(BurningManAccountingStoreService.FILE_NAME)
             )
+            for file in self.storage_dir.glob(
+                BurningManAccountingStoreService.FILE_NAME
+                + BurningManAccountingJournal.FILE_NAME_INFIX
+                + "*"
+            ):
+                delete_file_if_exists(file)
         except Exception as e:
             self.logger.error(e, exc_info=e)
 
@@ -106,6 +125,9 @@ class BurningManAccountingStoreService(StoreService["BurningManAccountingStore"]
     def get_blocks_at_least_with_height(self, min_height: int):
         return self.store.get_blocks_at_least_with_height(min_height)
 
+    def get_received_btc_aggregates(self) -> "ReceivedBtcAggregates":
+        return self.store.received_btc_aggregates
+
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // Protected
     # ///////////////////////////////////////////////////////////////////////////////////////////
@@ -117,6 +139,8 @@ class BurningManAccountingStoreService(StoreService["BurningManAccountingStore"]
         self.persistence_manager.initialize(
             self.store, PersistenceManagerSource.NETWORK, self.get_file_name()
         )
+        self.journal = BurningManAccountingJournal(self.persistence_manager, self.store)
+        self.journal.replay()
 
     def get_file_name(self) -> str:
         return BurningManAccountingStoreService.FILE_NAME
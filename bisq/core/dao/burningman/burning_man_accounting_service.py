@@ -1,6 +1,6 @@
 from collections.abc import Callable
 import contextvars
-from datetime import datetime
+from datetime import datetime, timezone
 import threading
 from typing import TYPE_CHECKING, Optional
 from bisq.common.user_thread import UserThread
@@ -8,6 +8,9 @@ from bisq.common.util.math_utils import MathUtils
 from bisq.core.dao.burningman.accounting.balance.balance_entry_type import (
     BalanceEntryType,
 )
+from bisq.core.dao.burningman.accounting.balance.received_btc_aggregates import (
+    ReceivedBtcAggregates,
+)
 from bisq.core.dao.burningman.accounting.balance.received_btc_balance_entry import (
     ReceivedBtcBalanceEntry,
 )
@@ -18,7 +21,6 @@ from bisq.core.dao.burningman.burning_man_accounting_const import (
     BurningManAccountingConst,
 )
 from bisq.core.dao.dao_setup_service import DaoSetupService
-from bisq.core.dao.state.dao_state_listener import DaoStateListener
 from bisq.core.monetary.price import Price
 from bisq.core.util.average_price_util import get_average_price_tuple
 from bitcoinj.base.coin import Coin
@@ -37,16 +39,19 @@ if TYPE_CHECKING:
     )
     from bisq.core.dao.state.dao_state_service import DaoStateService
     from bisq.core.user.preferences import Preferences
-    from bisq.core.dao.state.model.blockchain.block import Block
     from bisq.core.dao.burningman.accounting.blockchain.accounting_block import (
         AccountingBlock,
     )
 
 
-class BurningManAccountingService(DaoSetupService, DaoStateListener):
+class BurningManAccountingService(DaoSetupService):
     """
     Provides APIs for the accounting related aspects of burningmen.
     Combines the received funds from BTC trade fees and DPT payouts and the burned BSQ.
+
+    The totals are taken from the ReceivedBtcAggregates of the store, which are updated with the
+    accounting blocks and persisted with them. The balance models get only the blocks added since
+    they were last updated.
     """
 
     # Constants moved to BurningManAccountingConst
@@ -72,19 +77,11 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
         )
         self._average_prices_valid = False
         self.balance_model_by_burning_man_name: dict[str, "BalanceModel"] = {}
+        # Height of the last accounting block added to the balance models
+        self._balance_model_height = BurningManAccountingConst.EARLIEST_BLOCK_HEIGHT - 1
         self.is_processing = SimpleProperty(False)
-
-        # cache
-        self.received_btc_balance_entry_list_excluding_legacy_bm: list[
-            "ReceivedBtcBalanceEntry"
-        ] = []
         self._subscriptions: list[Callable[[], None]] = []
 
-        dao_state_service.add_dao_state_listener(self)
-        last_block = dao_state_service.last_block
-        if last_block:
-            self._apply_block(last_block)
-
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // DaoSetupService
     # ///////////////////////////////////////////////////////////////////////////////////////////
@@ -103,13 +100,19 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
 
         def run_async():
             map: dict[str, "BalanceModel"] = {}
+            blocks = self.get_blocks_at_least_with_height(0)
             # add_accounting_block_to_balance_model takes about 500ms for 100k items, so we run it in a non UI thread.
-            self._burning_man_accounting_store_service.for_each_block(
-                lambda block: self._add_accounting_block_to_balance_model(map, block)
-            )
-            UserThread.execute(
-                lambda: self.balance_model_by_burning_man_name.update(map)
-            )
+            for block in blocks:
+                self._add_accounting_block_to_balance_model(map, block)
+
+            def apply_balance_models():
+                self.balance_model_by_burning_man_name.update(map)
+                if blocks:
+                    self._balance_model_height = blocks[-1].height
+                # Blocks added in the meantime
+                self._add_new_blocks_to_balance_models()
+
+            UserThread.execute(apply_balance_models)
 
         ctx = contextvars.copy_context()
         threading.Thread(
@@ -121,35 +124,22 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
     def shut_down(self):
         self._burning_man_presentation_service.shut_down()
         self._burning_man_accounting_store_service.shut_down()
-        self.dao_state_service.remove_dao_state_listener(self)
         for unsub in self._subscriptions:
             unsub()
         self._subscriptions.clear()
 
-    # ///////////////////////////////////////////////////////////////////////////////////////////
-    # // DaoStateListener
-    # ///////////////////////////////////////////////////////////////////////////////////////////
-
-    def on_parse_block_complete_after_batch_processing(self, block: "Block"):
-        self._apply_block(block)
-
-    def _apply_block(self, block: "Block"):
-        self.received_btc_balance_entry_list_excluding_legacy_bm.clear()
-
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // API
     # ///////////////////////////////////////////////////////////////////////////////////////////
 
     def on_initial_block_requests_complete(self):
         self._update_balance_model_by_address()
-        self._burning_man_accounting_store_service.for_each_block(
-            self.add_accounting_block_to_balance_model
-        )
+        self._add_new_blocks_to_balance_models()
         UserThread.execute(lambda: self.is_processing.set(False))
 
     def on_new_block_received(self, accounting_block: "AccountingBlock"):
         self._update_balance_model_by_address()
-        self.add_accounting_block_to_balance_model(accounting_block)
+        self._add_new_blocks_to_balance_models()
 
     def add_block(self, block: "AccountingBlock"):
         self._burning_man_accounting_store_service.add_if_new_block(block)
@@ -182,56 +172,42 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
         return self._average_bsq_price_by_month
 
     def get_total_amount_of_distributed_btc(self) -> int:
-        return sum(
-            entry.amount
-            for entry in self._get_received_btc_balance_entry_list_excluding_legacy_bm()
-        )
+        return self._get_received_btc_aggregates().get_total_amount()
 
     def get_total_amount_of_distributed_btc_fees(self) -> int:
-        return sum(
-            entry.amount
-            for entry in self._get_received_btc_balance_entry_list_excluding_legacy_bm()
-            if entry.type == BalanceEntryType.BTC_TRADE_FEE_TX
+        return self._get_received_btc_aggregates().get_total_amount(
+            BalanceEntryType.BTC_TRADE_FEE_TX
         )
 
     def get_total_amount_of_distributed_btc_fees_as_bsq(self) -> int:
-        average_bsq_price_by_month = self.get_average_bsq_price_by_month()
-        return sum(
-            self._received_btc_as_bsq(entry, average_bsq_price_by_month)
-            for entry in self._get_received_btc_balance_entry_list_excluding_legacy_bm()
-            if entry.type == BalanceEntryType.BTC_TRADE_FEE_TX
+        return self._get_received_btc_aggregates().get_total_amount_as_bsq(
+            self.get_average_bsq_price_by_month(),
+            self._received_btc_as_bsq,
+            BalanceEntryType.BTC_TRADE_FEE_TX,
         )
 
     def get_total_amount_of_distributed_dpt(self) -> int:
-        return sum(
-            entry.amount
-            for entry in self._get_received_btc_balance_entry_list_excluding_legacy_bm()
-            if entry.type == BalanceEntryType.DPT_TX
+        return self._get_received_btc_aggregates().get_total_amount(
+            BalanceEntryType.DPT_TX
         )
 
     def get_total_amount_of_distributed_dpt_as_bsq(self) -> int:
-        average_bsq_price_by_month = self.get_average_bsq_price_by_month()
-        return sum(
-            self._received_btc_as_bsq(entry, average_bsq_price_by_month)
-            for entry in self._get_received_btc_balance_entry_list_excluding_legacy_bm()
-            if entry.type == BalanceEntryType.DPT_TX
+        return self._get_received_btc_aggregates().get_total_amount_as_bsq(
+            self.get_average_bsq_price_by_month(),
+            self._received_btc_as_bsq,
+            BalanceEntryType.DPT_TX,
         )
 
     def get_total_amount_of_distributed_bsq(self) -> int:
-        average_bsq_price_by_month = self.get_average_bsq_price_by_month()
-        return sum(
-            self._received_btc_as_bsq(entry, average_bsq_price_by_month)
-            for entry in self._get_received_btc_balance_entry_list_excluding_legacy_bm()
+        return self._get_received_btc_aggregates().get_total_amount_as_bsq(
+            self.get_average_bsq_price_by_month(), self._received_btc_as_bsq
         )
 
+    def get_total_amount_of_distributed_btc_by_month(self, month: datetime) -> int:
+        return self._get_received_btc_aggregates().get_amount_by_month(month)
+
     @staticmethod
-    def _received_btc_as_bsq(
-        balance_entry: "ReceivedBtcBalanceEntry",
-        average_bsq_price_by_month: dict[datetime, Price],
-    ) -> int:
-        month = balance_entry.month
-        received_btc = balance_entry.amount
-        price = average_bsq_price_by_month.get(month, None)
+    def _received_btc_as_bsq(received_btc: int, price: Optional[Price]) -> int:
         if price is None or price.value == 0:
             return 0
         volume = price.get_volume_by_amount(Coin.value_of(received_btc)).value
@@ -239,33 +215,14 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
             MathUtils.scale_down_by_power_of_10(volume, 6)
         )
 
-    def _get_received_btc_balance_entry_list_excluding_legacy_bm(
-        self,
-    ) -> list["ReceivedBtcBalanceEntry"]:
-        if self.received_btc_balance_entry_list_excluding_legacy_bm:
-            return self.received_btc_balance_entry_list_excluding_legacy_bm
-
-        self.received_btc_balance_entry_list_excluding_legacy_bm.extend(
-            entry
-            for key, balance_model in self.balance_model_by_burning_man_name.items()
-            if key
-            not in {
-                self._burning_man_presentation_service.LEGACY_BURNING_MAN_DPT_NAME,
-                self._burning_man_presentation_service.LEGACY_BURNING_MAN_BTC_FEES_NAME,
-            }
-            for entry in balance_model.received_btc_balance_entries
-        )
-        return self.received_btc_balance_entry_list_excluding_legacy_bm
+    def _get_received_btc_aggregates(self) -> ReceivedBtcAggregates:
+        return self._burning_man_accounting_store_service.get_received_btc_aggregates()
 
     def get_distributed_btc_balance_by_month(self, month: datetime):
         return (
             e
             for key, entry in self.balance_model_by_burning_man_name.items()
-            if key
-            not in {
-                self._burning_man_presentation_service.LEGACY_BURNING_MAN_DPT_NAME,
-                self._burning_man_presentation_service.LEGACY_BURNING_MAN_BTC_FEES_NAME,
-            }
+            if key not in ReceivedBtcAggregates.LEGACY_BURNING_MAN_NAMES
             for e in entry.get_received_btc_balance_entries_by_month(month)
         )
 
@@ -298,7 +255,16 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
         return self._burning_man_presentation_service.genesis_tx_id
 
     def purge_last_ten_blocks(self) -> None:
-        self._burning_man_accounting_store_service.purge_last_ten_blocks()
+        purged_blocks = (
+            self._burning_man_accounting_store_service.purge_last_ten_blocks()
+        )
+        for block in purged_blocks:
+            if block.height <= self._balance_model_height:
+                self._remove_accounting_block_from_balance_model(block)
+        if purged_blocks:
+            self._balance_model_height = min(
+                self._balance_model_height, purged_blocks[0].height - 1
+            )
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // Private
@@ -313,6 +279,13 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
             if key not in self.balance_model_by_burning_man_name:
                 self.balance_model_by_burning_man_name[key] = BalanceModel()
 
+    def _add_new_blocks_to_balance_models(self) -> None:
+        blocks = self.get_blocks_at_least_with_height(self._balance_model_height + 1)
+        for block in blocks:
+            self.add_accounting_block_to_balance_model(block)
+        if blocks:
+            self._balance_model_height = blocks[-1].height
+
     def add_accounting_block_to_balance_model(
         self, accounting_block: "AccountingBlock"
     ) -> None:
@@ -325,18 +298,34 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
         balance_model_by_burning_man_name: dict[str, "BalanceModel"],
         accounting_block: "AccountingBlock",
     ) -> None:
+        for name, balance_entry in self._get_received_btc_balance_entries(
+            accounting_block
+        ):
+            if name not in balance_model_by_burning_man_name:
+                balance_model_by_burning_man_name[name] = BalanceModel()
+            balance_model_by_burning_man_name[name].add_received_btc_balance_entry(
+                balance_entry
+            )
+
+    def _remove_accounting_block_from_balance_model(
+        self, accounting_block: "AccountingBlock"
+    ) -> None:
+        for name, balance_entry in self._get_received_btc_balance_entries(
+            accounting_block
+        ):
+            balance_model = self.balance_model_by_burning_man_name.get(name, None)
+            if balance_model:
+                balance_model.remove_received_btc_balance_entry(balance_entry)
+
+    def _get_received_btc_balance_entries(self, accounting_block: "AccountingBlock"):
+        date = datetime.fromtimestamp(accounting_block.date / 1000)
         for tx in accounting_block.txs:
             for tx_output in tx.outputs:
-                name = tx_output.name
-                if name not in balance_model_by_burning_man_name:
-                    balance_model_by_burning_man_name[name] = BalanceModel()
-                balance_model_by_burning_man_name[name].add_received_btc_balance_entry(
-                    ReceivedBtcBalanceEntry(
-                        tx.truncated_tx_id,
-                        tx_output.value,
-                        datetime.fromtimestamp(accounting_block.date / 1000),
-                        self._to_balance_entry_type(tx.type),
-                    )
+                yield tx_output.get_name(), ReceivedBtcBalanceEntry(
+                    tx.truncated_tx_id,
+                    tx_output.value,
+                    date,
+                    self._to_balance_entry_type(tx.type),
                 )
 
     def _get_average_bsq_price_by_month(
@@ -362,10 +351,7 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
 
     @staticmethod
     def _to_balance_entry_type(tx_type: AccountingTxType) -> BalanceEntryType:
-        if tx_type == AccountingTxType.BTC_TRADE_FEE_TX:
-            return BalanceEntryType.BTC_TRADE_FEE_TX
-        else:
-            return BalanceEntryType.DPT_TX
+        return ReceivedBtcAggregates.to_balance_entry_type(tx_type)
 
     @staticmethod
     def _get_historical_average_bsq_price_by_month() -> dict[datetime, Price]:
@@ -386,10 +372,14 @@ class BurningManAccountingService(DaoSetupService, DaoStateListener):
             "1601528400000=5648, 1651381200000=2908, 1598936400000=6032"
         )
 
+        def to_month(timestamp: str) -> datetime:
+            # The timestamps are the start of the months in EST, we map them to the start of
+            # the month in our timezone as used for the balance entries.
+            date = datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc)
+            return datetime(date.year, date.month, 1)
+
         return {
-            datetime.fromtimestamp(int(timestamp) / 1000): Price.value_of(
-                "BSQ", int(price)
-            )
+            to_month(timestamp): Price.value_of("BSQ", int(price))
             for timestamp, price in (
                 entry.split("=") for entry in historical.split(", ")
             )
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
 from bisq.common.setup.log_setup import get_ctx_logger
+from bisect import insort
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Optional
 from bisq.common.handlers.error_message_handler import ErrorMessageHandler
 from bisq.common.handlers.result_handler import ResultHandler
@@ -9,10 +10,16 @@ from bisq.core.btc.exceptions.transaction_verification_exception import (
 from bisq.core.btc.exceptions.wallet_exception import WalletException
 from bisq.core.btc.wallet.tx_broadcaster_callback import TxBroadcasterCallback
 from bisq.core.dao.governance.asset.asset_consensus import AssetConsensus
+from bisq.core.dao.governance.asset.fee_payment import FeePayment
+from bisq.core.dao.governance.asset.stateful_asset import StatefulAsset
+from bisq.core.dao.governance.asset.trade_volume_aggregates import (
+    TradeVolumeAggregates,
+)
 from bisq.core.dao.governance.param.param import Param
 from bisq.core.dao.governance.proposal.tx_exception import TxException
 from bisq.core.dao.state.dao_state_listener import DaoStateListener
 from bisq.core.dao.dao_setup_service import DaoSetupService
+from bisq.core.dao.state.model.blockchain.tx_output_type import TxOutputType
 from bisq.core.dao.state.model.blockchain.tx_type import TxType
 from bisq.core.dao.state.model.governance.remove_asset_proposal import (
     RemoveAssetProposal,
@@ -23,7 +30,6 @@ from bisq.core.locale.currency_util import (
 )
 from bitcoinj.base.coin import Coin
 from utils.preconditions import check_argument
-from bisq.core.locale.currency_util import is_crypto_currency
 from bisq.core.dao.governance.asset.asset_state import AssetState
 from datetime import timedelta
 
@@ -33,9 +39,7 @@ from utils.time import get_time_ms
 if TYPE_CHECKING:
     from bitcoinj.core.transaction import Transaction
     from bisq.core.dao.state.model.blockchain.tx import Tx
-    from bisq.core.dao.governance.asset.fee_payment import FeePayment
     from bisq.core.dao.state.model.blockchain.block import Block
-    from bisq.core.dao.governance.asset.stateful_asset import StatefulAsset
     from bisq.core.btc.wallet.bsq_wallet_service import BsqWalletService
     from bisq.core.btc.wallet.btc_wallet_service import BtcWalletService
     from bisq.core.btc.wallet.wallets_manager import WalletsManager
@@ -44,12 +48,8 @@ if TYPE_CHECKING:
         TradeStatisticsManager,
     )
     from bisq.core.util.coin.bsq_formatter import BsqFormatter
-
-
-@dataclass(frozen=True)
-class TradeAmountDateTuple:
-    trade_amount: int
-    trade_date: int
+    from utils.data import ObservableChangeEvent
+    from bisq.core.trade.statistics.trade_statistics_3 import TradeStatistics3
 
 
 class AssetService(DaoSetupService, DaoStateListener):
@@ -77,23 +77,62 @@ class AssetService(DaoSetupService, DaoStateListener):
         self._bsq_fee_per_day = 0
         self._min_volume_in_btc = 0
 
+        # The trade volumes are updated from the trade statistics, the fee txs and removed assets
+        # at the DAO blocks, so updating the asset states does not need to scan them.
+        self._trade_volume_aggregates = TradeVolumeAggregates()
+        self._remove_trade_statistics_listener: Optional[Callable[[], None]] = None
+        # op return data -> asset listing fee txs, sorted by time
+        self._fee_txs_by_op_return_data: dict[bytes, list["Tx"]] = {}
+        self._removed_ticker_symbols: set[str] = set()
+        self._indexed_block_height = -1
+        self._num_indexed_evaluated_proposals = 0
+
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // DaoSetupService
     # ///////////////////////////////////////////////////////////////////////////////////////////
 
     def add_listeners(self):
         self._dao_state_service.add_dao_state_listener(self)
+        trade_statistics_set = (
+            self._trade_statistics_manager.observable_trade_statistics_set
+        )
+        self._remove_trade_statistics_listener = trade_statistics_set.add_listener(
+            self._on_trade_statistics_changed
+        )
+        self._trade_volume_aggregates.add_all(trade_statistics_set)
 
     def start(self):
         pass
 
     def shut_down(self):
         self._dao_state_service.remove_dao_state_listener(self)
+        if self._remove_trade_statistics_listener:
+            self._remove_trade_statistics_listener()
+            self._remove_trade_statistics_listener = None
+
+    def _on_trade_statistics_changed(
+        self, e: "ObservableChangeEvent[TradeStatistics3]"
+    ):
+        if e.added_elements:
+            self._trade_volume_aggregates.add_all(e.added_elements)
+        if e.removed_elements:
+            self._trade_volume_aggregates.remove_all(e.removed_elements)
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // DaoStateListener
     # ///////////////////////////////////////////////////////////////////////////////////////////
 
+    def on_parse_block_complete(self, block: "Block"):
+        if block.height == self._indexed_block_height + 1:
+            for tx in block.get_txs():
+                if tx.tx_type == TxType.ASSET_LISTING_FEE:
+                    self._index_fee_tx(tx)
+            self._indexed_block_height = block.height
+        else:
+            # At startup, after a snapshot got applied or at a reorg
+            self._rebuild_dao_indexes()
+        self._update_removed_ticker_symbols()
+
     def on_parse_block_complete_after_batch_processing(self, block: "Block"):
         chain_height = self._dao_state_service.chain_height
         self._bsq_fee_per_day = self._dao_state_service.get_param_value_as_coin(
@@ -116,24 +155,25 @@ class AssetService(DaoSetupService, DaoStateListener):
             )
         return self._lazy_loaded_stateful_assets
 
-    # Java Call takes about 22 ms. Should be only called on demand (e.g. view is showing the data)
+    # Should be only called on demand (e.g. view is showing the data). The trade volumes, fee txs and
+    # removed assets are indexed in advance, so the costs only depend on the number of assets.
     def update_asset_states(self):
-        # For performance optimisation we map the trade stats to a temporary lookup map and convert it to a custom
-        # TradeAmountDateTuple object holding only the data we need.
-        lookup_map: dict[str, list[TradeAmountDateTuple]] = {}
-        for e in self._trade_statistics_manager.observable_trade_statistics_set:
-            if is_crypto_currency(e.currency):
-                if e.currency not in lookup_map:
-                    lookup_map[e.currency] = []
-                lookup_map[e.currency].append(TradeAmountDateTuple(e.amount, e.date))
+        if self._indexed_block_height != self._dao_state_service.chain_height:
+            self._rebuild_dao_indexes()
+        # The vote result might have been applied after we got notified about the block
+        self._update_removed_ticker_symbols()
 
+        now = get_time_ms()
         for stateful_asset in self.get_stateful_assets():
             if stateful_asset.asset_state == AssetState.REMOVED_BY_VOTING:
                 # if once set to REMOVED_BY_VOTING we ignore it for further processing
                 continue
 
             ticker_symbol = stateful_asset.ticker_symbol
-            if self._was_asset_removed_by_voting(ticker_symbol):
+            if ticker_symbol in self._removed_ticker_symbols:
+                self.logger.info(
+                    f"Asset '{get_currency_name_and_code(ticker_symbol)}' was removed"
+                )
                 stateful_asset.asset_state = AssetState.REMOVED_BY_VOTING
             else:
                 stateful_asset.fee_payments = self._get_fee_payments(stateful_asset)
@@ -141,11 +181,11 @@ class AssetService(DaoSetupService, DaoStateListener):
                     stateful_asset
                 )
                 stateful_asset.look_back_period_in_days = look_back_period_in_days
-                lookup_date = get_time_ms() - int(
+                lookup_date = now - int(
                     timedelta(days=look_back_period_in_days).total_seconds() * 1000
                 )
-                trade_volume = self._get_trade_volume(
-                    lookup_date, lookup_map.get(ticker_symbol, None)
+                trade_volume = self._trade_volume_aggregates.get_trade_volume(
+                    ticker_symbol, lookup_date
                 )
                 stateful_asset.trade_volume = trade_volume
 
@@ -156,8 +196,6 @@ class AssetService(DaoSetupService, DaoStateListener):
                 else:
                     stateful_asset.asset_state = AssetState.DE_LISTED
 
-        lookup_map.clear()
-
     def is_active(self, ticker_symbol: str) -> bool:
         asset = self._find_asset(ticker_symbol)
         return asset.is_active if asset else False
@@ -228,22 +266,6 @@ class AssetService(DaoSetupService, DaoStateListener):
     # // Private
     # ///////////////////////////////////////////////////////////////////////////////////////////
 
-    # Get the trade volume from lookupDate until current date
-    def _get_trade_volume(
-        self,
-        lookup_date: int,
-        trade_amount_date_tuple_list: Optional[list[TradeAmountDateTuple]],
-    ) -> int:
-        if trade_amount_date_tuple_list is None:
-            # Was never traded
-            return 0
-
-        return sum(
-            e.trade_amount
-            for e in trade_amount_date_tuple_list
-            if e.trade_date > lookup_date
-        )
-
     def _is_in_trial_period(self, stateful_asset: "StatefulAsset") -> bool:
         for fee_payment in stateful_asset.fee_payments:
             passed_days = fee_payment.get_passed_days(self._dao_state_service)
@@ -281,18 +303,32 @@ class AssetService(DaoSetupService, DaoStateListener):
     def _get_fee_txs(self, stateful_asset: "StatefulAsset") -> list["Tx"]:
         asset_hash = AssetConsensus.get_hash(stateful_asset)
         op_return_data = AssetConsensus.get_op_return_data(asset_hash)
-
-        return sorted(
-            filter(
-                lambda x: x is not None,
-                (
-                    self._dao_state_service.get_tx(tx_output.tx_id)
-                    for tx_output in self._dao_state_service.get_asset_listing_fee_op_return_tx_outputs()
-                    if tx_output.op_return_data == op_return_data
-                ),
-            ),
-            key=lambda tx: tx.time,
-        )
+        return self._fee_txs_by_op_return_data.get(op_return_data, [])
+
+    def _index_fee_tx(self, tx: "Tx"):
+        for tx_output in tx.tx_outputs:
+            if (
+                tx_output.tx_output_type
+                == TxOutputType.ASSET_LISTING_FEE_OP_RETURN_OUTPUT
+            ):
+                fee_txs = self._fee_txs_by_op_return_data.setdefault(
+                    tx_output.op_return_data, []
+                )
+                if tx not in fee_txs:
+                    insort(fee_txs, tx, key=lambda e: e.time)
+
+    def _rebuild_dao_indexes(self):
+        self._fee_txs_by_op_return_data.clear()
+        dao_state_service = self._dao_state_service
+        for tx_output in dao_state_service.get_asset_listing_fee_op_return_tx_outputs():
+            tx = dao_state_service.get_tx(tx_output.tx_id)
+            if tx is not None:
+                self._index_fee_tx(tx)
+        self._indexed_block_height = self._dao_state_service.chain_height
+
+        self._removed_ticker_symbols.clear()
+        self._num_indexed_evaluated_proposals = 0
+        self._update_removed_ticker_symbols()
 
     def _find_asset(self, ticker_symbol: str) -> Optional["StatefulAsset"]:
         return next(
@@ -304,16 +340,18 @@ class AssetService(DaoSetupService, DaoStateListener):
             None,
         )
 
-    def _was_asset_removed_by_voting(self, ticker_symbol: str) -> bool:
-        is_removed = any(
-            proposal.ticker_symbol == ticker_symbol
-            for proposal in self._get_accepted_remove_asset_proposal_stream()
+    def _update_removed_ticker_symbols(self):
+        # The evaluated proposals are only added by the vote results, so we only need to check them
+        # again if their number changed.
+        num_evaluated_proposals = len(
+            self._dao_state_service.get_evaluated_proposal_list()
         )
-        if is_removed:
-            self.logger.info(
-                f"Asset '{get_currency_name_and_code(ticker_symbol)}' was removed"
-            )
-        return is_removed
+        if num_evaluated_proposals != self._num_indexed_evaluated_proposals:
+            self._removed_ticker_symbols = {
+                proposal.ticker_symbol
+                for proposal in self._get_accepted_remove_asset_proposal_stream()
+            }
+            self._num_indexed_evaluated_proposals = num_evaluated_proposals
 
     def _get_accepted_remove_asset_proposal_stream(self):
         return (
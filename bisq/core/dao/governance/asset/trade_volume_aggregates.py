@@ -0,0 +1,102 @@
+from collections import Counter
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from bisq.core.locale.currency_util import is_crypto_currency
+
+if TYPE_CHECKING:
+    from bisq.core.trade.statistics.trade_statistics_3 import TradeStatistics3
+
+
+class TradeVolumeAggregates:
+    """
+    Trade volumes of the crypto currencies, by currency and day of the trade date.
+
+    They are updated when trade statistics get added or removed, so the volume of a look back
+    period sums up the days of the period instead of filtering all trade statistics. Only the
+    trades of the first day of the period need to be checked against the exact lookup date.
+    """
+
+    DAY_IN_MS = int(timedelta(days=1).total_seconds() * 1000)
+
+    def __init__(self):
+        # currency -> day -> sum of the trade amounts
+        self._volume_by_day: dict[str, dict[int, int]] = {}
+        # currency -> day -> (trade date, trade amount) -> number of trades
+        self._trades_by_day: dict[str, dict[int, Counter[tuple[int, int]]]] = {}
+        # currency -> latest day with trades, it is not lowered when trades get removed
+        self._last_day_by_currency: dict[str, int] = {}
+        self._is_crypto_currency_cache: dict[str, bool] = {}
+
+    def add_all(self, trade_statistics: Iterable["TradeStatistics3"]):
+        for e in trade_statistics:
+            self._update(e, 1)
+
+    def remove_all(self, trade_statistics: Iterable["TradeStatistics3"]):
+        for e in trade_statistics:
+            self._update(e, -1)
+
+    def clear(self):
+        self._volume_by_day.clear()
+        self._trades_by_day.clear()
+        self._last_day_by_currency.clear()
+
+    def _update(self, trade_statistics: "TradeStatistics3", delta: int):
+        currency = trade_statistics.currency
+        if not self._is_crypto_currency(currency):
+            return
+        day = trade_statistics.date // TradeVolumeAggregates.DAY_IN_MS
+        key = (trade_statistics.date, trade_statistics.amount)
+        trades_by_day = self._trades_by_day.setdefault(currency, {})
+        trades = trades_by_day.setdefault(day, Counter())
+        if trades[key] + delta < 0:
+            # We never counted that trade
+            delta = 0
+        trades[key] += delta
+        volumes = self._volume_by_day.setdefault(currency, {})
+        volumes[day] = volumes.get(day, 0) + trade_statistics.amount * delta
+        if day > self._last_day_by_currency.get(currency, day - 1):
+            self._last_day_by_currency[currency] = day
+
+        if trades[key] <= 0:
+            del trades[key]
+            if not trades:
+                del trades_by_day[day]
+                del volumes[day]
+                if not trades_by_day:
+                    del self._trades_by_day[currency]
+                    del self._volume_by_day[currency]
+                    del self._last_day_by_currency[currency]
+
+    def _is_crypto_currency(self, currency: str) -> bool:
+        result = self._is_crypto_currency_cache.get(currency, None)
+        if result is None:
+            result = is_crypto_currency(currency)
+            self._is_crypto_currency_cache[currency] = result
+        return result
+
+    def get_trade_volume(self, currency: str, lookup_date: int) -> int:
+        """Returns the volume of the trades of the currency with a trade date after lookup_date."""
+        volumes = self._volume_by_day.get(currency, None)
+        if not volumes:
+            # Was never traded
+            return 0
+
+        first_day = lookup_date // TradeVolumeAggregates.DAY_IN_MS
+        # The trades of the first day might be before the lookup date
+        volume = sum(
+            amount * count
+            for (date, amount), count in self._trades_by_day[currency]
+            .get(first_day, {})
+            .items()
+            if date > lookup_date
+        )
+        last_day = self._last_day_by_currency[currency]
+        if last_day - first_day < len(volumes):
+            return volume + sum(
+                volumes.get(day, 0) for day in range(first_day + 1, last_day + 1)
+            )
+        return volume + sum(
+            amount for day, amount in volumes.items() if day > first_day
+        )
@@ -0,0 +1,125 @@
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Executor, Future
+from functools import partial
+from math import comb
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from bisq.core.dao.governance.voteresult.blind_vote_list_permutation_work import (
+    SEARCH_BATCH_SIZE,
+    search_range,
+)
+
+if TYPE_CHECKING:
+    from bisq.core.dao.governance.blindvote.blind_vote import BlindVote
+
+
+class BlindVoteListPermutationSearch:
+    """
+    Searches the variant of our blind vote list which matches the majority hash, by removing blind
+    votes the majority did not have.
+
+    The candidates and their order are the same as with PermutationUtil.find_matching_permutation:
+    first all lists with one blind vote removed, then all with two removed, and so on, each level in
+    lexicographic order of the removed indices. At most `max_iterations` candidates are checked.
+
+    The blind votes are serialized once and candidates sharing a prefix share its hash state. With
+    an executor the candidates are searched in batches by several workers. A match is only taken
+    once all batches before it are done, so the result is the same as with a sequential search.
+    """
+
+    def __init__(
+        self,
+        blind_votes: list["BlindVote"],
+        max_iterations: int,
+        executor: Optional[Executor] = None,
+        num_workers: int = 1,
+        batch_size: int = SEARCH_BATCH_SIZE,
+    ):
+        self.blind_votes = blind_votes
+        self.max_iterations = max_iterations
+        self.executor = executor
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        self.fragments = tuple(
+            blind_vote.serialize_for_hash() for blind_vote in blind_votes
+        )
+        self._cancelled = threading.Event()
+
+    @property
+    def num_candidates(self) -> int:
+        n = len(self.blind_votes)
+        return min(
+            sum(comb(n, num_removed) for num_removed in range(1, n)),
+            self.max_iterations,
+        )
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def find(self, majority_hash: bytes) -> Optional[list["BlindVote"]]:
+        search = partial(search_range, self.fragments, majority_hash)
+        if self.executor is None or self.num_candidates <= self.batch_size:
+            removed = self._find_sequential(search)
+        else:
+            removed = self._find_parallel(search)
+        if removed is None:
+            return None
+        removed = set(removed)
+        return [
+            blind_vote
+            for i, blind_vote in enumerate(self.blind_votes)
+            if i not in removed
+        ]
+
+    def _get_batches(self) -> Iterator[tuple[int, int, int]]:
+        """Yields the number of removed blind votes and the range of ranks of each batch."""
+        n = len(self.blind_votes)
+        remaining = self.max_iterations
+        for num_removed in range(1, n):
+            num_combinations = min(comb(n, num_removed), remaining)
+            for start in range(0, num_combinations, self.batch_size):
+                yield num_removed, start, min(
+                    start + self.batch_size, num_combinations
+                )
+            remaining -= num_combinations
+            if remaining <= 0:
+                return
+
+    def _find_sequential(self, search) -> Optional[tuple[int, ...]]:
+        for batch in self._get_batches():
+            if self.is_cancelled:
+                return None
+            removed = search(*batch)
+            if removed is not None:
+                return removed
+        return None
+
+    def _find_parallel(self, search) -> Optional[tuple[int, ...]]:
+        batches = self._get_batches()
+        pending: deque[Future[Optional[tuple[int, ...]]]] = deque()
+
+        def submit_next_batch():
+            batch = next(batches, None)
+            if batch is not None:
+                pending.append(self.executor.submit(search, *batch))
+
+        try:
+            # Some more batches than workers so the workers do not idle while we wait
+            for _ in range(self.num_workers * 2):
+                submit_next_batch()
+            while pending and not self.is_cancelled:
+                # We wait for the batches in the order of the candidates
+                removed = pending.popleft().result()
+                if removed is not None:
+                    return removed
+                submit_next_batch()
+            return None
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,88 @@
+import hashlib
+from itertools import accumulate
+from math import comb
+from typing import Optional
+
+from bisq.common.crypto.hash import get_ripemd160_hash
+
+# Number of candidate lists a single search task checks before it reports back, which
+# bounds how much work is wasted after a match got found or the search got cancelled.
+SEARCH_BATCH_SIZE = 1 << 12
+
+
+def unrank_combination(n: int, k: int, rank: int) -> list[int]:
+    """Returns the combination of k out of n indices at the given rank in lexicographic order."""
+    combination = []
+    x = 0
+    for i in range(k):
+        while True:
+            num_with_x = comb(n - x - 1, k - i - 1)
+            if rank < num_with_x:
+                break
+            rank -= num_with_x
+            x += 1
+        combination.append(x)
+        x += 1
+    return combination
+
+
+def search_range(
+    fragments: tuple[bytes, ...],
+    target_hash: bytes,
+    num_removed: int,
+    start: int,
+    end: int,
+) -> Optional[tuple[int, ...]]:
+    """
+    Returns the indices of the first combination of `num_removed` fragments within the ranks
+    [start, end) whose removal gives a list with the target hash, or None if there is none.
+
+    The combinations are visited in lexicographic order. The hash is the RIPEMD160 of the SHA256 of
+    the concatenated fragments. For each removed index the SHA256 state of the kept fragments before
+    it is kept, so consecutive combinations only hash the fragments after their first difference.
+    """
+    n = len(fragments)
+    k = num_removed
+    end = min(end, comb(n, k))
+    if not 0 < k < n or start >= end:
+        return None
+    data = memoryview(b"".join(fragments))
+    offsets = list(accumulate(map(len, fragments), initial=0))
+    combination = unrank_combination(n, k, start)
+    # states[j] is the state of the kept fragments before the removed index combination[j]
+    states: list = [None] * k
+    first_changed = 0
+    last = k - 1
+    for _ in range(start, end):
+        for j in range(first_changed, k):
+            if j == 0:
+                state = hashlib.sha256(data[: offsets[combination[0]]])
+            else:
+                state = states[j - 1].copy()
+                state.update(
+                    data[offsets[combination[j - 1] + 1] : offsets[combination[j]]]
+                )
+            states[j] = state
+        digest = states[last].copy()
+        digest.update(data[offsets[combination[last] + 1] :])
+        if get_ripemd160_hash(digest.digest()) == target_hash:
+            return tuple(combination)
+
+        # Advance to the next combination
+        i = last
+        while i >= 0 and combination[i] == n - k + i:
+            i -= 1
+        if i < 0:
+            break
+        if i == last:
+            # Only the last index moved on, the fragment at its old index is kept now
+            index = combination[last]
+            states[last].update(data[offsets[index] : offsets[index + 1]])
+            combination[last] = index + 1
+            first_changed = k
+        else:
+            combination[i] += 1
+            for j in range(i + 1, k):
+                combination[j] = combination[j - 1] + 1
+            first_changed = i
+    return None
@@ -1,15 +1,19 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+import os
 from bisq.common.setup.log_setup import get_ctx_logger
 import traceback
 from typing import TYPE_CHECKING, Optional
 from bisq.common.util.math_utils import MathUtils
-from bisq.common.util.permutation_util import PermutationUtil
 from bisq.common.util.utilities import bytes_as_hex_string
 from bisq.core.dao.dao_setup_service import DaoSetupService
 from bisq.core.dao.governance.blindvote.blind_vote_consensus import BlindVoteConsensus
 from bisq.core.dao.governance.merit.merit_consensus import MeritConsensus
 from bisq.core.dao.governance.param.param import Param
 from bisq.core.dao.governance.proposal.issuance_proposal import IssuanceProposal
+from bisq.core.dao.governance.voteresult.blind_vote_list_permutation_search import (
+    BlindVoteListPermutationSearch,
+)
 from bisq.core.dao.governance.voteresult.missing_data_request_service import (
     MissingDataRequestService,
 )
@@ -48,6 +52,7 @@ from bisq.core.dao.state.model.governance.decrypted_ballots_with_merits import (
 from bisq.core.dao.state.model.governance.evaluated_proposal import (
     EvaluatedProposal,
 )
+from utils.aio import FutureCallback, run_in_thread
 from utils.java_compat import java_cmp_str
 from utils.preconditions import check_argument
 from utils.time import get_time_ms
@@ -106,6 +111,10 @@ class VoteResultService(DaoStateListener, DaoSetupService):
         self.invalid_decrypted_ballots_with_merit_items = set[
             "DecryptedBallotsWithMerits"
         ]()
+        self._process_pool_executor: Optional[ProcessPoolExecutor] = None
+        self._permutation_search: Optional[BlindVoteListPermutationSearch] = None
+        # Variants of our blind vote list matching a majority hash, searched before the vote result block
+        self._permutation_search_results: dict[bytes, Optional[list["BlindVote"]]] = {}
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // DaoSetupService
@@ -119,6 +128,11 @@ class VoteResultService(DaoStateListener, DaoSetupService):
 
     def shut_down(self):
         self._dao_state_service.remove_dao_state_listener(self)
+        if self._permutation_search is not None:
+            self._permutation_search.cancel()
+        if self._process_pool_executor is not None:
+            self._process_pool_executor.shutdown(wait=False, cancel_futures=True)
+            self._process_pool_executor = None
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // DaoStateListener
@@ -126,6 +140,7 @@ class VoteResultService(DaoStateListener, DaoSetupService):
 
     def on_parse_block_complete(self, block: "Block"):
         self._maybe_calculate_vote_result(block.height)
+        self._maybe_start_permutation_search(block.height)
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // Private
@@ -568,20 +583,24 @@ class VoteResultService(DaoStateListener, DaoSetupService):
     def _find_permutated_list_matching_majority(
         self, majority_vote_list_hash: bytes
     ) -> Optional[list["BlindVote"]]:
-        blind_vote_list = BlindVoteConsensus.get_sorted_blind_vote_list_of_cycle(
-            self._blind_vote_list_service
-        )
-        ts = get_time_ms()
-
-        def predicate(hash: bytes, variation: list["BlindVote"]):
-            return self._is_list_matching_majority(hash, variation, False)
-
-        result = PermutationUtil.find_matching_permutation(
-            majority_vote_list_hash, blind_vote_list, predicate, 1000000
-        )
-        self.logger.info(
-            f"findPermutatedListMatchingMajority for {len(blind_vote_list)} items took {get_time_ms() - ts} ms."
-        )
+        if majority_vote_list_hash in self._permutation_search_results:
+            result = self._permutation_search_results.pop(majority_vote_list_hash)
+        else:
+            # We could not search before this block, e.g. if we started from the snapshot of the
+            # previous block, so we need to search now.
+            blind_vote_list = BlindVoteConsensus.get_sorted_blind_vote_list_of_cycle(
+                self._blind_vote_list_service
+            )
+            ts = get_time_ms()
+            search = self._create_permutation_search(blind_vote_list)
+            self._permutation_search = search
+            try:
+                result = search.find(majority_vote_list_hash)
+            finally:
+                self._permutation_search = None
+            self.logger.info(
+                f"findPermutatedListMatchingMajority for {len(blind_vote_list)} items took {get_time_ms() - ts} ms."
+            )
         if not result:
             self.logger.info(
                 "We did not find a variation of the blind vote list which matches the majority hash."
@@ -593,6 +612,130 @@ class VoteResultService(DaoStateListener, DaoSetupService):
             )
             return result
 
+    def _create_permutation_search(
+        self, blind_vote_list: list["BlindVote"]
+    ) -> BlindVoteListPermutationSearch:
+        num_workers = os.cpu_count() or 1
+        search = BlindVoteListPermutationSearch(
+            blind_vote_list, 1000000, num_workers=num_workers
+        )
+        if num_workers > 1 and search.num_candidates > search.batch_size:
+            # We only start worker processes if there are more candidates than a single batch
+            if self._process_pool_executor is None:
+                self._process_pool_executor = ProcessPoolExecutor(num_workers)
+            search.executor = self._process_pool_executor
+        return search
+
+    def _maybe_start_permutation_search(self, chain_height: int):
+        """
+        If the vote result gets calculated at the next block and our blind vote list does not match
+        the majority hash, we search the matching variant off the user thread. Parsing of the next
+        block is held until the search is done, so the vote result still gets applied at that block.
+        """
+        if (
+            self._permutation_search is not None
+            or self._period_service.get_first_block_of_phase(
+                chain_height, DaoPhase.Phase.RESULT
+            )
+            != chain_height + 1
+        ):
+            return
+
+        try:
+            stakes = self._get_expected_stake_by_hash_of_blind_vote_list_map(chain_height)
+            if not stakes:
+                return
+            majority_vote_list_hash = self._calculate_majority_blind_vote_list_hash(
+                stakes
+            )
+        except Exception as e:
+            # The vote result calculation will report it
+            self.logger.info(f"Could not calculate the expected majority hash. {e}")
+            return
+
+        blind_vote_list = BlindVoteConsensus.get_sorted_blind_vote_list_of_cycle(
+            self._blind_vote_list_service
+        )
+        if self._is_list_matching_majority(
+            majority_vote_list_hash, blind_vote_list, False
+        ):
+            return
+
+        self.logger.info(
+            "Our local list of blind vote payloads does not match the expected majority hash. "
+            "We search a matching variant before the vote result block gets parsed."
+        )
+        ts = get_time_ms()
+        search = self._create_permutation_search(blind_vote_list)
+        self._permutation_search = search
+        release_block_parsing = self._dao_state_service.hold_block_parsing()
+
+        def on_success(result: Optional[list["BlindVote"]]):
+            self._permutation_search = None
+            if not search.is_cancelled:
+                self.logger.info(
+                    f"findPermutatedListMatchingMajority for {len(blind_vote_list)} items took {get_time_ms() - ts} ms."
+                )
+                self._permutation_search_results[majority_vote_list_hash] = result
+            release_block_parsing()
+
+        def on_failure(e: BaseException):
+            self._permutation_search = None
+            self.logger.error(f"Searching the blind vote list variants failed. {e}")
+            release_block_parsing()
+
+        run_in_thread(search.find, majority_vote_list_hash).add_done_callback(
+            FutureCallback(on_success, on_failure, on_failure)
+        )
+
+    def _get_expected_stake_by_hash_of_blind_vote_list_map(
+        self, chain_height: int
+    ) -> dict[StorageByteArray, int]:
+        """
+        The stakes of the revealed votes like _get_stake_by_hash_of_blind_vote_list_map, without
+        decrypting them. If a vote fails to decrypt, the majority hash might differ at the vote
+        result block, in which case the search is done there.
+        """
+        stakes: dict[StorageByteArray, int] = {}
+        for tx_output in self._dao_state_service.get_vote_reveal_op_return_tx_outputs():
+            vote_reveal_tx_id = tx_output.tx_id
+            if not self._period_service.is_tx_in_correct_cycle_by_id(
+                vote_reveal_tx_id, chain_height
+            ) or not self._period_service.is_tx_in_phase(
+                vote_reveal_tx_id, DaoPhase.Phase.VOTE_REVEAL
+            ):
+                continue
+            try:
+                vote_reveal_tx = self._dao_state_service.get_tx(vote_reveal_tx_id)
+                if vote_reveal_tx is None:
+                    continue
+                blind_vote_stake_output = (
+                    VoteResultConsensus.get_connected_blind_vote_stake_output(
+                        vote_reveal_tx, self._dao_state_service
+                    )
+                )
+                blind_vote_tx_id = blind_vote_stake_output.tx_id
+                if not self._period_service.is_tx_in_phase_and_cycle(
+                    blind_vote_tx_id, DaoPhase.Phase.BLIND_VOTE, chain_height
+                ):
+                    continue
+                VoteResultConsensus.validate_blind_vote_tx(
+                    blind_vote_tx_id,
+                    self._dao_state_service,
+                    self._period_service,
+                    chain_height,
+                )
+                hash_bytes = StorageByteArray(
+                    VoteResultConsensus.get_hash_of_blind_vote_list(
+                        tx_output.op_return_data
+                    )
+                )
+            except Exception:
+                # Such votes are not counted at the vote result calculation either
+                continue
+            stakes[hash_bytes] = stakes.get(hash_bytes, 0) + blind_vote_stake_output.value
+        return stakes
+
     def _is_list_matching_majority(
         self,
         majority_vote_list_hash: bytes,
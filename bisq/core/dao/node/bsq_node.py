@@ -144,6 +144,15 @@ class BsqNode(DaoSetupService, ABC):
         if self._shutdown_in_progress.get():
             return None
 
+        if self._dao_state_service.is_block_parsing_held:
+            # A listener still works on data needed for the next block. We parse it when done.
+            if raw_block not in self.pending_blocks:
+                self.pending_blocks.append(raw_block)
+                self._dao_state_service.run_when_block_parsing_released(
+                    self._on_block_parsing_released
+                )
+            return None
+
         # We check if we have a block with that height. If so we return. We do not use the chainHeight as with genesis
         # height we have no block but chainHeight is initially set to genesis height (bad design ;-( but a bit tricky
         # to change now as it used in many areas.)
@@ -162,14 +171,8 @@ class BsqNode(DaoSetupService, ABC):
                 pass
 
             # After parsing we check if we have pending blocks we might have received earlier but which have been
-            # not connecting from the latest height we had. The list is sorted by height
-            if self.pending_blocks:
-                # We take only first element after sorting (so it is the block with the next height) to avoid that
-                # we would repeat calls in recursions in case we would iterate the list.
-                self.pending_blocks.sort(key=lambda b: b.height)
-                next_pending = self.pending_blocks[0]
-                if next_pending.height == self._dao_state_service.chain_height + 1:
-                    self.do_parse_block(next_pending)
+            # not connecting from the latest height we had.
+            self._maybe_parse_next_pending_block()
 
             return block
         except BlockHeightNotConnectingException:
@@ -228,5 +231,22 @@ class BsqNode(DaoSetupService, ABC):
 
         return None
 
+    def _maybe_parse_next_pending_block(self):
+        if self.pending_blocks:
+            # We take only first element after sorting (so it is the block with the next height) to avoid that
+            # we would repeat calls in recursions in case we would iterate the list.
+            self.pending_blocks.sort(key=lambda b: b.height)
+            next_pending = self.pending_blocks[0]
+            if next_pending.height == self._dao_state_service.chain_height + 1:
+                self.do_parse_block(next_pending)
+
+    def _on_block_parsing_released(self):
+        try:
+            self._maybe_parse_next_pending_block()
+        except RequiredReorgFromSnapshotException as e:
+            self.logger.warning(
+                f"doParseBlock failed after block parsing was held because of a blockchain reorg. {e}"
+            )
+
     def maybe_export_to_json(self):
         self._export_json_files_service.maybe_export_to_json()
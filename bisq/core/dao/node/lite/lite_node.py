@@ -291,6 +291,12 @@ class LiteNode(BsqNode):
                 result_handler()
                 return
 
+            if self._dao_state_service.is_block_parsing_held:
+                self._dao_state_service.run_when_block_parsing_released(
+                    process_next_block
+                )
+                return
+
             block = blocks.pop(0)
             try:
                 self.do_parse_block(block)
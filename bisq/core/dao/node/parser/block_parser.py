@@ -1,6 +1,7 @@
 from bisq.common.setup.log_setup import get_ctx_logger
 from typing import TYPE_CHECKING
 from bisq.common.app.dev_env import DevEnv
+from bisq.core.dao.node.parser.block_utxo_overlay import BlockUtxoOverlay
 from bisq.core.dao.node.parser.exceptions.block_hash_not_connecting_exception import (
     BlockHashNotConnectingException,
 )
@@ -66,15 +67,20 @@ class BlockParser:
         # one get resolved.
         # Lately there is a patter with 24 iterations observed
 
+        # The inputs are resolved from the utxos of the earlier txs of the block on top of the daoState.
+        # The utxo changes of the block get applied together before the listeners get notified.
+        utxo_overlay = BlockUtxoOverlay(self._dao_state_service)
         for raw_tx in raw_block.raw_txs:
             tx = self._tx_parser.find_tx(
                 raw_tx,
                 self._genesis_tx_id,
                 self._genesis_block_height,
                 self._genesis_total_supply,
+                utxo_overlay,
             )
             if tx:
                 self._dao_state_service.on_new_tx_for_last_block(block, tx)
+        utxo_overlay.commit()
 
         self._dao_state_service.on_parse_block_complete(block)
         duration = get_time_ms() - start_ts
@@ -86,18 +92,15 @@ class BlockParser:
         return block
 
     def _validate_if_block_is_connecting(self, raw_block: "RawBlock") -> None:
-        blocks = self._dao_state_service.blocks
+        last_block = self._dao_state_service.last_block
 
-        if not blocks:
+        if last_block is None:
             return
 
-        if self._dao_state_service.block_height_of_last_block + 1 != raw_block.height:
+        if last_block.height + 1 != raw_block.height:
             raise BlockHeightNotConnectingException(raw_block)
 
-        if (
-            self._dao_state_service.block_hash_of_last_block
-            != raw_block.previous_block_hash
-        ):
+        if last_block.hash != raw_block.previous_block_hash:
             raise BlockHashNotConnectingException(raw_block)
 
     def _is_block_already_added(self, raw_block: "RawBlock") -> bool:
@@ -0,0 +1,49 @@
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from bisq.core.dao.state.dao_state_service import DaoStateService
+    from bisq.core.dao.state.model.blockchain.spent_info import SpentInfo
+    from bisq.core.dao.state.model.blockchain.tx_output import TxOutput
+    from bisq.core.dao.state.model.blockchain.tx_output_key import TxOutputKey
+
+
+class BlockUtxoOverlay:
+    """
+    Collects the changes of the unspent tx outputs while the txs of a block get parsed.
+
+    Lookups see the outputs created and spent by the earlier txs of the block on top of the
+    daoState. The changes are applied to the daoState at once when the block is parsed, so outputs
+    which are created and spent within the same block never enter the sorted unspent tx output map,
+    and a block which fails to parse leaves the map untouched.
+    """
+
+    def __init__(self, dao_state_service: "DaoStateService"):
+        self._dao_state_service = dao_state_service
+        self._created_tx_outputs: dict["TxOutputKey", "TxOutput"] = {}
+        # Outputs of earlier blocks which got spent in this block
+        self._spent_keys: set["TxOutputKey"] = set()
+        self._spent_infos: dict["TxOutputKey", "SpentInfo"] = {}
+
+    def get_unspent_tx_output(self, key: "TxOutputKey") -> Optional["TxOutput"]:
+        tx_output = self._created_tx_outputs.get(key, None)
+        if tx_output is not None:
+            return tx_output
+        if key in self._spent_keys:
+            return None
+        return self._dao_state_service.get_unspent_tx_output(key)
+
+    def add_unspent_tx_output(self, tx_output: "TxOutput"):
+        self._created_tx_outputs[tx_output.get_key()] = tx_output
+
+    def spend_tx_output(self, key: "TxOutputKey", spent_info: "SpentInfo"):
+        self._spent_infos[key] = spent_info
+        if self._created_tx_outputs.pop(key, None) is None:
+            self._spent_keys.add(key)
+
+    def commit(self):
+        self._dao_state_service.apply_unspent_tx_output_changes(
+            self._spent_keys, self._created_tx_outputs, self._spent_infos
+        )
+        self._created_tx_outputs = {}
+        self._spent_keys = set()
+        self._spent_infos = {}
@@ -6,6 +6,7 @@ from bisq.core.dao.state.model.blockchain.tx_output_type import TxOutputType
 
 
 if TYPE_CHECKING:
+    from bisq.core.dao.node.parser.block_utxo_overlay import BlockUtxoOverlay
     from bisq.core.dao.state.model.blockchain.tx_output_key import TxOutputKey
     from bisq.core.dao.state.model.blockchain.tx_output import TxOutput
     from bisq.core.dao.state.dao_state_service import DaoStateService
@@ -14,8 +15,11 @@ if TYPE_CHECKING:
 class TxInputParser:
     """Processes TxInput and add input value to available balance if the input is a valid BSQ input."""
 
-    def __init__(self, dao_state_service: "DaoStateService"):
+    def __init__(
+        self, dao_state_service: "DaoStateService", utxo_overlay: "BlockUtxoOverlay"
+    ):
         self._dao_state_service = dao_state_service
+        self._utxo_overlay = utxo_overlay
         self.accumulated_input_value = 0
         self.burnt_bond_value = 0
         self.unlock_block_height = 0
@@ -36,7 +40,7 @@ class TxInputParser:
         input_index: int,
     ):
         if not self._dao_state_service.is_confiscated_output(tx_output_key):
-            connected_tx_output = self._dao_state_service.get_unspent_tx_output(
+            connected_tx_output = self._utxo_overlay.get_unspent_tx_output(
                 tx_output_key
             )
             if connected_tx_output:
@@ -84,11 +88,9 @@ class TxInputParser:
                             f"blockHeight={block_height}, unLockHeight={unlock_block_height}"
                         )
 
-                self._dao_state_service.set_spent_info(
-                    connected_tx_output.get_key(),
-                    SpentInfo(block_height, tx_id, input_index),
+                self._utxo_overlay.spend_tx_output(
+                    tx_output_key, SpentInfo(block_height, tx_id, input_index)
                 )
-                self._dao_state_service.remove_unspent_tx_output(connected_tx_output)
         else:
             self.logger.warning(
                 f"Connected txOutput {tx_output_key} at input {input_index} of txId {tx_id} is confiscated"
@@ -12,6 +12,7 @@ from bisq.core.dao.state.model.blockchain.tx_output import TxOutput
 
 
 if TYPE_CHECKING:
+    from bisq.core.dao.node.parser.block_utxo_overlay import BlockUtxoOverlay
     from bisq.core.dao.node.parser.temp_tx_output import TempTxOutput
     from bisq.core.dao.state.dao_state_service import DaoStateService
 
@@ -68,9 +69,12 @@ class TxOutputParser:
     ACTIVATE_HARD_FORK_1_HEIGHT_TESTNET = 1583054
     ACTIVATE_HARD_FORK_1_HEIGHT_REGTEST = 1
 
-    def __init__(self, dao_state_service: "DaoStateService"):
+    def __init__(
+        self, dao_state_service: "DaoStateService", utxo_overlay: "BlockUtxoOverlay"
+    ):
         self.logger = get_ctx_logger(__name__)
         self._dao_state_service = dao_state_service
+        self._utxo_overlay = utxo_overlay
 
         self.available_input_value: int = 0
         self.unlock_block_height: int = 0
@@ -153,9 +157,7 @@ class TxOutputParser:
 
     def commit_utxo_candidates(self):
         for output in self._utxo_candidates:
-            self._dao_state_service.add_unspent_tx_output(
-                TxOutput.from_temp_output(output)
-            )
+            self._utxo_overlay.add_unspent_tx_output(TxOutput.from_temp_output(output))
 
     def invalidate_utxo_candidates(self):
         # We do not need to apply prohibit_more_bsq_outputs as all spendable outputs are set to BTC_OUTPUT anyway.
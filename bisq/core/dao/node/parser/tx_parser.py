@@ -2,6 +2,7 @@ from bisq.common.setup.log_setup import get_ctx_logger
 from typing import TYPE_CHECKING, Optional
 from bisq.core.dao.governance.param.param import Param
 from bisq.core.dao.node.genesis_tx_parser import GenesisTxParser
+from bisq.core.dao.node.parser.block_utxo_overlay import BlockUtxoOverlay
 from bisq.core.dao.node.parser.tx_input_parser import TxInputParser
 from bisq.core.dao.node.parser.tx_output_parser import TxOutputParser
 from bisq.core.dao.state.model.blockchain.op_return_type import OpReturnType
@@ -41,20 +42,32 @@ class TxParser:
         genesis_tx_id: str,
         genesis_block_height: int,
         genesis_total_supply: Coin,
+        utxo_overlay: Optional[BlockUtxoOverlay] = None,
     ) -> Optional[Tx]:
+        """
+        The utxo changes are collected in the utxo_overlay of the block, which gets committed after
+        all txs of the block are parsed. Without an overlay the changes are applied right away.
+        """
         if GenesisTxParser.is_genesis(raw_tx, genesis_tx_id, genesis_block_height):
             return GenesisTxParser.get_genesis_tx(
                 raw_tx, genesis_total_supply.value, self._dao_state_service
             )
+        elif utxo_overlay is None:
+            utxo_overlay = BlockUtxoOverlay(self._dao_state_service)
+            tx = self._find_tx(raw_tx, utxo_overlay)
+            utxo_overlay.commit()
+            return tx
         else:
-            return self._find_tx(raw_tx)
+            return self._find_tx(raw_tx, utxo_overlay)
 
     # Apply state changes to tx, inputs and outputs
     # return Tx if any input contained BSQ
     # Any tx with BSQ input is a BSQ tx.
     # There might be txs without any valid BSQ txOutput but we still keep track of it,
     # for instance to calculate the total burned BSQ.
-    def _find_tx(self, raw_tx: "RawTx") -> Optional[Tx]:
+    def _find_tx(
+        self, raw_tx: "RawTx", utxo_overlay: BlockUtxoOverlay
+    ) -> Optional[Tx]:
         block_height = raw_tx.block_height
         temp_tx = TempTx.from_raw_tx(raw_tx)
 
@@ -62,7 +75,7 @@ class TxParser:
         # Parse Inputs
         # ****************************************************************************************
 
-        tx_input_parser = TxInputParser(self._dao_state_service)
+        tx_input_parser = TxInputParser(self._dao_state_service, utxo_overlay)
         for input_index, tx_input in enumerate(temp_tx.tx_inputs):
             output_key = tx_input.get_connected_tx_output_key()
             tx_input_parser.process(output_key, block_height, raw_tx.id, input_index)
@@ -87,7 +100,9 @@ class TxParser:
         # Parse Outputs
         # ****************************************************************************************
 
-        self._tx_output_parser = TxOutputParser(self._dao_state_service)
+        self._tx_output_parser = TxOutputParser(
+            self._dao_state_service, utxo_overlay
+        )
         self._tx_output_parser.available_input_value = accumulated_input_value
         self._tx_output_parser.unlock_block_height = unlock_block_height
         self._tx_output_parser.optional_spent_lockup_tx_output = (
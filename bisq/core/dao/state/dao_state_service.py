@@ -1,3 +1,4 @@
+from collections.abc import Callable
 import itertools
 from bisq.common.setup.log_setup import get_ctx_logger
 from typing import TYPE_CHECKING, Optional, Union
@@ -52,6 +53,8 @@ class DaoStateService(DaoSetupService):
         self.parse_block_chain_complete = False
         self.allow_dao_state_change = False
         self._cached_tx_id_set_by_address: dict[str, set[str]] = {}
+        self._num_block_parsing_holds = 0
+        self._block_parsing_released_handlers: list[Callable[[], None]] = []
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // DaoSetupService
@@ -79,7 +82,9 @@ class DaoStateService(DaoSetupService):
         self.logger.info(f"Apply snapshot with chain height {snapshot.chain_height}")
 
         self.dao_state.chain_height = snapshot.chain_height
-        self.dao_state.set_tx_cache(snapshot.tx_cache)
+        self.dao_state.set_tx_cache(
+            snapshot.tx_cache, snapshot.tx_outputs_by_tx_output_type
+        )
 
         self.dao_state.clear_and_set_blocks(snapshot.blocks)
 
@@ -462,6 +467,20 @@ class DaoStateService(DaoSetupService):
         self._assert_dao_state_change()
         self.get_unspent_tx_output_map().pop(tx_output.get_key(), None)
 
+    def apply_unspent_tx_output_changes(
+        self,
+        spent_keys: set["TxOutputKey"],
+        new_unspent_tx_outputs: dict["TxOutputKey", "TxOutput"],
+        spent_infos: dict["TxOutputKey", "SpentInfo"],
+    ) -> None:
+        # Applies the changes collected while parsing a block
+        self._assert_dao_state_change()
+        unspent_tx_output_map = self.get_unspent_tx_output_map()
+        for key in spent_keys:
+            unspent_tx_output_map.pop(key, None)
+        unspent_tx_output_map.update(new_unspent_tx_outputs)
+        self.dao_state.spent_info_map.update(spent_infos)
+
     def is_unspent(self, key: "TxOutputKey") -> bool:
         return key in self.get_unspent_tx_output_map()
 
@@ -1071,6 +1090,42 @@ class DaoStateService(DaoSetupService):
             TxOutputType.PROOF_OF_BURN_OP_RETURN_OUTPUT
         )
 
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // Block parsing hold
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    def hold_block_parsing(self) -> Callable[[], None]:
+        """
+        Defers parsing of the next blocks until the returned release function got called.
+        Lets listeners finish work needed for the next block off the user thread.
+        """
+        self._num_block_parsing_holds += 1
+        released = False
+
+        def release():
+            nonlocal released
+            if released:
+                return
+            released = True
+            self._num_block_parsing_holds -= 1
+            if self._num_block_parsing_holds == 0:
+                handlers = self._block_parsing_released_handlers
+                self._block_parsing_released_handlers = []
+                for handler in handlers:
+                    handler()
+
+        return release
+
+    @property
+    def is_block_parsing_held(self) -> bool:
+        return self._num_block_parsing_holds > 0
+
+    def run_when_block_parsing_released(self, handler: Callable[[], None]):
+        if self.is_block_parsing_held:
+            self._block_parsing_released_handlers.append(handler)
+        else:
+            handler()
+
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // Listeners
     # ///////////////////////////////////////////////////////////////////////////////////////////
@@ -7,6 +7,7 @@ from bisq.common.user_thread import UserThread
 from bisq.core.dao.dao_setup_service import DaoSetupService
 from bisq.core.dao.governance.param.param import Param
 from bisq.core.dao.state.dao_state_listener import DaoStateListener
+from bisq.core.dao.state.storage.dao_state_snapshot_index import DaoStateSnapshotIndex
 from typing import TYPE_CHECKING, Optional
 from bisq.core.trade.delayed_payout_address_provider import DelayedPayoutAddressProvider
 import pb_pb2 as protobuf
@@ -68,6 +69,7 @@ class DaoStateSnapshotService(DaoSetupService, DaoStateListener):
         self._dao_state_candidate: Optional[protobuf.DaoState] = None
         self._hash_chain_candidate: list["DaoStateHash"] = []
         self._blocks_candidate: list["Block"] = []
+        self._snapshot_index_candidate: Optional["DaoStateSnapshotIndex"] = None
         self._snapshot_height: int = 0
         self._chain_height_of_last_applied_snapshot = 0
         self.resync_dao_state_from_resources_handler: Optional[Callable[[], None]] = (
@@ -164,6 +166,7 @@ class DaoStateSnapshotService(DaoSetupService, DaoStateListener):
         dao_state_for_snapshot = self._get_dao_state_for_snapshot()
         blocks_for_snapshot = self._get_blocks_for_snapshot()
         hash_chain_for_snapshot = self._get_hash_chain_for_snapshot()
+        snapshot_index = self._get_snapshot_index_for_snapshot(hash_chain_for_snapshot)
         self._dao_state_storage_service.request_persistence(
             dao_state_for_snapshot,
             blocks_for_snapshot,
@@ -171,6 +174,7 @@ class DaoStateSnapshotService(DaoSetupService, DaoStateListener):
             lambda: self.logger.info(
                 f"Persisted daoState after parsing completed at height {chain_height}. Took {get_time_ms() - ts} ms"
             ),
+            snapshot_index,
         )
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
@@ -236,6 +240,7 @@ class DaoStateSnapshotService(DaoSetupService, DaoStateListener):
                 self._create_snapshot(),
                 self._persisting_block_in_progress.set(False),
             ),
+            self._snapshot_index_candidate,
         )
 
     def _create_snapshot(self):
@@ -248,6 +253,9 @@ class DaoStateSnapshotService(DaoSetupService, DaoStateListener):
         self._dao_state_candidate = self._get_dao_state_for_snapshot()
         self._blocks_candidate = self._get_blocks_for_snapshot()
         self._hash_chain_candidate = self._get_hash_chain_for_snapshot()
+        self._snapshot_index_candidate = self._get_snapshot_index_for_snapshot(
+            self._hash_chain_candidate
+        )
         self._snapshot_height = self._dao_state_service.chain_height
 
         self.logger.info(
@@ -300,6 +308,10 @@ class DaoStateSnapshotService(DaoSetupService, DaoStateListener):
                 self._resync_dao_state_from_resources()
                 return
 
+            if not self._dao_state_storage_service.verify_persisted_snapshot():
+                self._resync_dao_state_from_resources()
+                return
+
             if self._is_height_below_genesis_height(chain_height_of_persisted_dao_state):
                 return
             
@@ -389,3 +401,10 @@ class DaoStateSnapshotService(DaoSetupService, DaoStateListener):
 
     def _get_hash_chain_for_snapshot(self) -> list["DaoStateHash"]:
         return list(self._dao_state_monitoring_service.dao_state_hash_chain)
+
+    def _get_snapshot_index_for_snapshot(
+        self, hash_chain: list["DaoStateHash"]
+    ) -> Optional["DaoStateSnapshotIndex"]:
+        return DaoStateSnapshotIndex.from_dao_state(
+            self._dao_state_service.dao_state, hash_chain
+        )
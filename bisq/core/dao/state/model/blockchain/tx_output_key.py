@@ -16,6 +16,16 @@ class TxOutputKey:
     tx_id: str
     index: int
 
+    def __post_init__(self):
+        # The keys are looked up in the large utxo and spent info maps at each parsed input, so we
+        # compute the java hash code only once.
+        result = (59 + self.index) * 59
+        if self.tx_id is None:
+            result += 43
+        else:
+            result += java_string_hashcode(self.tx_id)
+        object.__setattr__(self, "_hash", result)
+
     def __str__(self) -> str:
         return f"{self.tx_id}:{self.index}"
 
@@ -29,18 +39,19 @@ class TxOutputKey:
         """Implements comparison for sorting."""
         if not isinstance(other, TxOutputKey):
             return NotImplemented
-        return java_string_compare(str(self), str(other)) < 0
+        s1 = str(self)
+        s2 = str(other)
+        if s1.isascii() and s2.isascii():
+            # Same order as the java compare for ascii strings, which tx ids always are
+            return s1 < s2
+        return java_string_compare(s1, s2) < 0
 
     def __eq__(self, other: Any) -> bool:
         """Implements equality comparison."""
         if not isinstance(other, TxOutputKey):
             return NotImplemented
-        return java_string_compare(str(self), str(other)) == 0
+        # Same as comparing the string representations, without building them
+        return self.index == other.index and self.tx_id == other.tx_id
 
     def __hash__(self):
-        result = (59 + self.index) * 59
-        if self.tx_id is None:
-            result += 43
-        else:
-            result += java_string_hashcode(self.tx_id)
-        return result
+        return self._hash
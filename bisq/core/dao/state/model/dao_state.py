@@ -1,3 +1,4 @@
+from typing import TYPE_CHECKING
 from sortedcontainers import SortedDict
 from bisq.common.protocol.persistable.persistable_payload import PersistablePayload
 from bisq.core.dao.state.model.blockchain.tx_output_type import TxOutputType
@@ -18,6 +19,11 @@ from bisq.core.dao.state.model.governance.issuance import Issuance
 from bisq.core.dao.state.model.governance.param_change import ParamChange
 from utils.java_compat import HashMap
 
+if TYPE_CHECKING:
+    from bisq.core.dao.state.storage.dao_state_snapshot_index import (
+        DaoStateSnapshotIndex,
+    )
+
 
 class DaoState(PersistablePayload):
     """
@@ -42,6 +48,8 @@ class DaoState(PersistablePayload):
         param_change_list: list["ParamChange"] = None,
         evaluated_proposal_list: list["EvaluatedProposal"] = None,
         decrypted_ballots_with_merits_list: list["DecryptedBallotsWithMerits"] = None,
+        tx_cache: dict[str, "Tx"] = None,
+        tx_outputs_by_tx_output_type: dict["TxOutputType", set["TxOutput"]] = None,
     ):
         # Is set initially to genesis height
         self.chain_height = chain_height or 0
@@ -96,10 +104,15 @@ class DaoState(PersistablePayload):
             {}  # transient JsonExclude
         )
 
-        for block in self._blocks:
-            for tx in block._txs:
-                self._add_to_tx_outputs_by_tx_output_type_map(tx)
-                self.tx_cache[tx.id] = tx
+        if tx_cache is not None and tx_outputs_by_tx_output_type is not None:
+            # Prebuilt from the blocks, e.g. from the index of a persisted snapshot
+            self.tx_cache = tx_cache
+            self.tx_outputs_by_tx_output_type = tx_outputs_by_tx_output_type
+        else:
+            for block in self._blocks:
+                for tx in block._txs:
+                    self._add_to_tx_outputs_by_tx_output_type_map(tx)
+                    self.tx_cache[tx.id] = tx
 
     def get_json_dict(self):
         return {
@@ -176,21 +189,41 @@ class DaoState(PersistablePayload):
 
     @staticmethod
     def from_proto(
-        proto: protobuf.DaoState, blocks: list["Block"] = None
+        proto: protobuf.DaoState,
+        blocks: list["Block"] = None,
+        snapshot_index: "DaoStateSnapshotIndex" = None,
     ) -> "DaoState":
+        """
+        If a snapshot_index is given, the unspent tx output map and the transient indices are
+        built from it. A ValueError is raised if it does not match the daoState.
+        """
         if blocks is None:
             blocks = [Block.from_proto(block_proto) for block_proto in proto.blocks]
-        return DaoState(
-            chain_height=proto.chain_height,
-            blocks=blocks,
-            cycles=[Cycle.from_proto(cycle_proto) for cycle_proto in proto.cycles],
-            unspent_tx_output_map=SortedDict(
+        tx_cache = None
+        tx_outputs_by_tx_output_type = None
+        if snapshot_index is None:
+            unspent_tx_output_map = SortedDict(
                 (
                     TxOutputKey.get_key_from_string(item.key),
                     TxOutput.from_proto(item.value),
                 )
                 for item in proto.unspent_tx_output_map_entries
-            ),
+            )
+        else:
+            unspent_tx_output_map = DaoState._get_unspent_tx_output_map_from_index(
+                proto, snapshot_index
+            )
+            tx_cache = {tx.id: tx for block in blocks for tx in block._txs}
+            tx_outputs_by_tx_output_type = (
+                DaoState._get_tx_outputs_by_tx_output_type_from_index(
+                    tx_cache, snapshot_index
+                )
+            )
+        return DaoState(
+            chain_height=proto.chain_height,
+            blocks=blocks,
+            cycles=[Cycle.from_proto(cycle_proto) for cycle_proto in proto.cycles],
+            unspent_tx_output_map=unspent_tx_output_map,
             spent_info_map=SortedDict(
                 (
                     TxOutputKey.get_key_from_string(item.key),
@@ -215,8 +248,52 @@ class DaoState(PersistablePayload):
                 DecryptedBallotsWithMerits.from_proto(ballot_proto)
                 for ballot_proto in proto.decrypted_ballots_with_merits_list
             ],
+            tx_cache=tx_cache,
+            tx_outputs_by_tx_output_type=tx_outputs_by_tx_output_type,
         )
 
+    @staticmethod
+    def _get_unspent_tx_output_map_from_index(
+        proto: protobuf.DaoState, snapshot_index: "DaoStateSnapshotIndex"
+    ) -> SortedDict:
+        entries = {item.key: item.value for item in proto.unspent_tx_output_map_entries}
+        keys = snapshot_index.sorted_unspent_tx_output_keys
+        if len(keys) != len(entries) or entries.keys() != set(keys):
+            raise ValueError("Unspent tx outputs of snapshot index do not match")
+        # As the keys are already sorted, the SortedDict does not need to compare them again
+        # and again as with the entries in hash map order.
+        return SortedDict(
+            (TxOutputKey.get_key_from_string(key), TxOutput.from_proto(entries[key]))
+            for key in keys
+        )
+
+    @staticmethod
+    def _get_tx_outputs_by_tx_output_type_from_index(
+        tx_cache: dict[str, "Tx"], snapshot_index: "DaoStateSnapshotIndex"
+    ) -> dict["TxOutputType", set["TxOutput"]]:
+        num_tx_outputs = sum(len(tx.tx_outputs) for tx in tx_cache.values())
+        num_indexed_tx_outputs = 0
+        tx_outputs_by_tx_output_type = {}
+        for (
+            tx_output_type,
+            tx_output_keys,
+        ) in snapshot_index.tx_output_keys_by_type.items():
+            tx_outputs = set()
+            for key_as_string in tx_output_keys:
+                key = TxOutputKey.get_key_from_string(key_as_string)
+                tx = tx_cache.get(key.tx_id, None)
+                if tx is None or key.index >= len(tx.tx_outputs):
+                    raise ValueError(f"Indexed tx output {key} not found")
+                tx_output = tx.tx_outputs[key.index]
+                if tx_output.tx_output_type != tx_output_type:
+                    raise ValueError(f"Indexed tx output {key} has a different type")
+                tx_outputs.add(tx_output)
+            num_indexed_tx_outputs += len(tx_outputs)
+            tx_outputs_by_tx_output_type[tx_output_type] = tx_outputs
+        if num_indexed_tx_outputs != num_tx_outputs:
+            raise ValueError("Not all tx outputs are in the snapshot index")
+        return tx_outputs_by_tx_output_type
+
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // Static
     # ///////////////////////////////////////////////////////////////////////////////////////////
@@ -245,6 +322,17 @@ class DaoState(PersistablePayload):
         builder.blocks.append(self.last_block.to_proto_message())
         return builder.SerializeToString()
 
+    @staticmethod
+    def get_serialized_snapshot_for_hash_chain(
+        dao_state_as_proto: protobuf.DaoState, last_block: "Block"
+    ) -> bytes:
+        """Same as get_serialized_state_for_hash_chain for a daoState clone excluding blocks."""
+        dao_state_as_proto.blocks.append(last_block.to_proto_message())
+        try:
+            return dao_state_as_proto.SerializeToString()
+        finally:
+            del dao_state_as_proto.blocks[-1]
+
     def add_to_tx_cache(self, tx: "Tx"):
         # We shouldn't get duplicate txIds, but use setdefault instead of put for consistency with the map merge
         # function used in the constructor to initialize tx_cache (and to exactly match the pre-caching behavior).
@@ -252,13 +340,22 @@ class DaoState(PersistablePayload):
 
         self._add_to_tx_outputs_by_tx_output_type_map(tx)
 
-    def set_tx_cache(self, tx_cache: dict[str, "Tx"]):
+    def set_tx_cache(
+        self,
+        tx_cache: dict[str, "Tx"],
+        tx_outputs_by_tx_output_type: dict["TxOutputType", set["TxOutput"]] = None,
+    ):
         self.tx_cache.clear()
         self.tx_cache.update(tx_cache)
 
         self.tx_outputs_by_tx_output_type.clear()
-        for tx in self.tx_cache.values():
-            self._add_to_tx_outputs_by_tx_output_type_map(tx)
+        if tx_outputs_by_tx_output_type is not None:
+            # Must be the index of the given tx_cache
+            for tx_output_type, tx_outputs in tx_outputs_by_tx_output_type.items():
+                self.tx_outputs_by_tx_output_type[tx_output_type] = set(tx_outputs)
+        else:
+            for tx in self.tx_cache.values():
+                self._add_to_tx_outputs_by_tx_output_type_map(tx)
 
     def get_tx_output_by_tx_output_type(
         self, tx_output_type: TxOutputType
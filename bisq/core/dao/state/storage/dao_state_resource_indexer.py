@@ -0,0 +1,124 @@
+"""
+Adds a snapshot index to the DaoStateStore resource file.
+
+At the first start the resource files get copied to the data directory. With the index, the daoState
+of the resource file gets loaded without parsing all its unspent tx outputs and rebuilding the
+indices from all blocks, like a snapshot written by the app. The index is only added if the daoState
+matches the tail of the hash chain in the resource file, which is verified again at startup.
+
+Run it after updating the resource files:
+
+    python -m bisq.core.dao.state.storage.dao_state_resource_indexer [--postfix _BTC_MAINNET] [resource_dir]
+"""
+
+import argparse
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from bisq.common.setup.log_setup import get_ctx_logger, logger_context
+from bisq.core.dao.state.model.blockchain.block import Block
+from bisq.core.dao.state.model.dao_state import DaoState
+from bisq.core.dao.state.storage.bsq_block_storage_service import (
+    BsqBlocksStorageService,
+)
+from bisq.core.dao.state.storage.dao_state_snapshot_index import DaoStateSnapshotIndex
+from bisq.core.dao.state.storage.dao_state_storage_service import (
+    DaoStateStorageService,
+)
+from bisq.core.dao.state.storage.dao_state_store import DaoStateStore
+from bisq.resources import p2p_resource_dir
+from proto.delimited_protobuf import read_delimited, write_delimited
+import pb_pb2 as protobuf
+
+
+def _read_envelope(file: Path) -> Optional[protobuf.PersistableEnvelope]:
+    with file.open("rb") as file_in:
+        return read_delimited(file_in, protobuf.PersistableEnvelope)
+
+
+def _read_blocks(blocks_dir: Path, chain_height: int) -> list[Block]:
+    """Reads the blocks of the bucket files written by BlocksPersistence."""
+    buckets: list[tuple[int, Path]] = []
+    prefix = BsqBlocksStorageService.NAME + "_"
+    for file in blocks_dir.iterdir() if blocks_dir.is_dir() else []:
+        first, _, last = file.name.removeprefix(prefix).partition("-")
+        if file.name.startswith(prefix) and first.isdigit() and last.isdigit():
+            buckets.append((int(first), file))
+    blocks = []
+    for _, file in sorted(buckets):
+        envelope = _read_envelope(file)
+        if envelope is not None:
+            blocks.extend(
+                Block.from_proto(block)
+                for block in envelope.bsq_block_store.blocks
+                if block.height <= chain_height
+            )
+    return blocks
+
+
+def index_dao_state_resources(resource_dir: Path, post_fix: str) -> bool:
+    """Returns True if the DaoStateStore resource file got written with a snapshot index."""
+    logger = get_ctx_logger(__name__)
+    store_file = resource_dir.joinpath(DaoStateStorageService.FILE_NAME + post_fix)
+    envelope = _read_envelope(store_file) if store_file.is_file() else None
+    if envelope is None or not envelope.HasField("dao_state_store"):
+        logger.warning(f"{store_file} contains no DaoStateStore")
+        return False
+
+    store = DaoStateStore.from_proto(envelope.dao_state_store)
+    dao_state_as_proto = store.dao_state_as_proto
+    if dao_state_as_proto.blocks:
+        # Old format, the app moves the blocks to the BsqBlocks directory when reading it
+        blocks = [Block.from_proto(block) for block in dao_state_as_proto.blocks]
+    else:
+        blocks = _read_blocks(
+            resource_dir.joinpath(BsqBlocksStorageService.NAME + post_fix),
+            dao_state_as_proto.chain_height,
+        )
+
+    dao_state = DaoState.from_proto(dao_state_as_proto, blocks)
+    snapshot_index = DaoStateSnapshotIndex.from_dao_state(
+        dao_state, store.dao_state_hash_chain
+    )
+    if snapshot_index is None:
+        logger.warning(
+            f"The hash chain of {store_file.name} does not end at chain height "
+            f"{dao_state_as_proto.chain_height}. No index is added."
+        )
+        return False
+    store.snapshot_index = snapshot_index
+    if not DaoStateStorageService.verify_snapshot(store, blocks, logger):
+        return False
+
+    temp_file = store_file.with_name(store_file.name + ".tmp")
+    with temp_file.open("wb") as file_out:
+        write_delimited(file_out, store.to_proto_message())
+        file_out.flush()
+        os.fsync(file_out.fileno())
+    os.replace(temp_file, store_file)
+    logger.info(
+        f"Added snapshot index at chain height {snapshot_index.chain_height} to {store_file}"
+    )
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Adds a snapshot index to the DaoStateStore resource file."
+    )
+    parser.add_argument(
+        "resource_dir", nargs="?", type=Path, default=p2p_resource_dir
+    )
+    parser.add_argument("--postfix", default="_BTC_MAINNET")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with logger_context(logging.getLogger(__name__)):
+        if not index_dao_state_resources(args.resource_dir, args.postfix):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+from typing import TYPE_CHECKING, Optional
+
+from bisq.common.protocol.persistable.persistable_payload import PersistablePayload
+from bisq.core.dao.monitoring.model.dao_state_hash import DaoStateHash
+from bisq.core.dao.state.model.blockchain.tx_output_type import TxOutputType
+import pb_pb2 as protobuf
+
+if TYPE_CHECKING:
+    from bisq.core.dao.state.model.dao_state import DaoState
+
+
+class DaoStateSnapshotIndex(PersistablePayload):
+    """
+    Derived indices of a persisted daoState snapshot, so loading the snapshot does not need to
+    rebuild them from all blocks.
+
+    It contains the hash of the hash chain at the chain height of the snapshot. The snapshot is
+    only used with its indices if hashing the persisted daoState with the last locally stored block
+    results in that hash, see DaoStateStorageService.verify_persisted_snapshot.
+    """
+
+    def __init__(
+        self,
+        chain_height: int,
+        tail_dao_state_hash: DaoStateHash,
+        sorted_unspent_tx_output_keys: list[str],
+        tx_output_keys_by_type: dict[TxOutputType, list[str]],
+    ):
+        self.chain_height = chain_height
+        self.tail_dao_state_hash = tail_dao_state_hash
+        # In the order of the unspent tx output map of the daoState
+        self.sorted_unspent_tx_output_keys = sorted_unspent_tx_output_keys
+        self.tx_output_keys_by_type = tx_output_keys_by_type
+
+    @staticmethod
+    def from_dao_state(
+        dao_state: "DaoState", dao_state_hash_chain: list[DaoStateHash]
+    ) -> Optional["DaoStateSnapshotIndex"]:
+        """Returns None if the hash chain does not contain the hash of the daoState."""
+        if (
+            not dao_state_hash_chain
+            or dao_state_hash_chain[-1].height != dao_state.chain_height
+        ):
+            return None
+        return DaoStateSnapshotIndex(
+            chain_height=dao_state.chain_height,
+            tail_dao_state_hash=dao_state_hash_chain[-1],
+            sorted_unspent_tx_output_keys=[
+                str(key) for key in dao_state.unspent_tx_output_map
+            ],
+            tx_output_keys_by_type={
+                tx_output_type: [str(tx_output.get_key()) for tx_output in tx_outputs]
+                for (
+                    tx_output_type,
+                    tx_outputs,
+                ) in dao_state.tx_outputs_by_tx_output_type.items()
+            },
+        )
+
+    def to_proto_message(self) -> protobuf.DaoStateSnapshotIndex:
+        return protobuf.DaoStateSnapshotIndex(
+            chain_height=self.chain_height,
+            tail_dao_state_hash=self.tail_dao_state_hash.to_proto_message(),
+            sorted_unspent_tx_output_keys=self.sorted_unspent_tx_output_keys,
+            tx_output_type_index_entries=[
+                protobuf.TxOutputTypeIndexEntry(
+                    tx_output_type=tx_output_type.to_proto_message(),
+                    tx_output_keys=tx_output_keys,
+                )
+                for (
+                    tx_output_type,
+                    tx_output_keys,
+                ) in self.tx_output_keys_by_type.items()
+            ],
+        )
+
+    @staticmethod
+    def from_proto(proto: protobuf.DaoStateSnapshotIndex) -> "DaoStateSnapshotIndex":
+        return DaoStateSnapshotIndex(
+            chain_height=proto.chain_height,
+            tail_dao_state_hash=DaoStateHash.from_proto(proto.tail_dao_state_hash),
+            sorted_unspent_tx_output_keys=list(proto.sorted_unspent_tx_output_keys),
+            tx_output_keys_by_type={
+                TxOutputType.from_proto(entry.tx_output_type): list(
+                    entry.tx_output_keys
+                )
+                for entry in proto.tx_output_type_index_entries
+            },
+        )
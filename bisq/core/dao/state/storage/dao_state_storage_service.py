@@ -6,11 +6,13 @@ from bisq.common.setup.log_setup import get_ctx_logger
 from pathlib import Path
 from threading import current_thread
 from typing import TYPE_CHECKING, Optional
+from bisq.common.crypto.hash import get_sha256_ripemd160_hash
 from bisq.common.file.file_util import remove_and_backup_file
 from bisq.common.persistence.persistence_manager_source import PersistenceManagerSource
 from bisq.common.user_thread import UserThread
 from bisq.core.dao.monitoring.model.dao_state_hash import DaoStateHash
 from bisq.core.dao.state.model.dao_state import DaoState
+from bisq.core.dao.state.storage.dao_state_snapshot_index import DaoStateSnapshotIndex
 from bisq.core.dao.state.storage.dao_state_store import DaoStateStore
 from bisq.core.network.p2p.persistence.store_service import StoreService
 import pb_pb2 as protobuf
@@ -19,6 +21,7 @@ from utils.time import get_time_ms
 
 
 if TYPE_CHECKING:
+    import logging
     from bisq.core.network.p2p.storage.persistence.resource_data_store_service import (
         ResourceDataStoreService,
     )
@@ -70,6 +73,7 @@ class DaoStateStorageService(StoreService["DaoStateStore"]):
         blocks: list["Block"],
         dao_state_hash_chain: list[DaoStateHash],
         complete_handler: Callable[[], None],
+        snapshot_index: Optional[DaoStateSnapshotIndex] = None,
     ):
         if dao_state_as_proto is None:
             complete_handler()
@@ -78,7 +82,11 @@ class DaoStateStorageService(StoreService["DaoStateStore"]):
         if self._future and not self._future.done():
             UserThread.run_after(
                 lambda: self.request_persistence(
-                    dao_state_as_proto, blocks, dao_state_hash_chain, complete_handler
+                    dao_state_as_proto,
+                    blocks,
+                    dao_state_hash_chain,
+                    complete_handler,
+                    snapshot_index,
                 ),
                 timedelta(seconds=2),
             )
@@ -90,6 +98,7 @@ class DaoStateStorageService(StoreService["DaoStateStore"]):
                 self._bsq_blocks_storage_service.persist_blocks(blocks)
                 self.store.dao_state_as_proto = dao_state_as_proto
                 self.store.dao_state_hash_chain = dao_state_hash_chain
+                self.store.snapshot_index = snapshot_index
                 ts = get_time_ms()
                 self.persistence_manager.persist_now(
                     lambda: self._on_persistence_complete(ts, complete_handler)
@@ -169,7 +178,19 @@ class DaoStateStorageService(StoreService["DaoStateStore"]):
         dao_state_as_proto = self.store.dao_state_as_proto
         if dao_state_as_proto is not None:
             ts = get_time_ms()
-            dao_state = DaoState.from_proto(dao_state_as_proto, self._blocks)
+            dao_state = None
+            snapshot_index = self.store.snapshot_index
+            if snapshot_index is not None:
+                try:
+                    dao_state = DaoState.from_proto(
+                        dao_state_as_proto, self._blocks, snapshot_index
+                    )
+                except ValueError as e:
+                    self.logger.warning(
+                        f"Snapshot index cannot be used, we rebuild the indices. {e}"
+                    )
+            if dao_state is None:
+                dao_state = DaoState.from_proto(dao_state_as_proto, self._blocks)
             self.logger.info(
                 f"Deserializing DaoState with {len(dao_state.blocks)} blocks took {get_time_ms() - ts} ms"
             )
@@ -177,9 +198,12 @@ class DaoStateStorageService(StoreService["DaoStateStore"]):
         return DaoState()
 
     def is_chain_height_matching_last_block_height(self) -> bool:
-        persisted_dao_state = self.get_persisted_bsq_state()
-        height_of_persisted_last_block = persisted_dao_state.last_block.height
-        chain_height_of_persisted_dao_state = persisted_dao_state.chain_height
+        # We check the persisted data directly, as deserializing the daoState takes quite a while
+        dao_state_as_proto = self.store.dao_state_as_proto
+        height_of_persisted_last_block = self._blocks[-1].height
+        chain_height_of_persisted_dao_state = (
+            dao_state_as_proto.chain_height if dao_state_as_proto is not None else 0
+        )
         is_matching = (
             height_of_persisted_last_block == chain_height_of_persisted_dao_state
         )
@@ -194,6 +218,78 @@ class DaoStateStorageService(StoreService["DaoStateStore"]):
     def get_persisted_dao_state_hash_chain(self) -> list[DaoStateHash]:
         return self.store.dao_state_hash_chain
 
+    def verify_persisted_snapshot(self) -> bool:
+        """
+        Verifies the persisted daoState against the persisted hash chain if it has been persisted
+        with a snapshot index. Snapshots without index are not verified and are accepted as before.
+        """
+        return DaoStateStorageService.verify_snapshot(
+            self.store, self._blocks, self.logger
+        )
+
+    @staticmethod
+    def verify_snapshot(
+        store: "DaoStateStore", blocks: list["Block"], logger: "logging.Logger"
+    ) -> bool:
+        """
+        We hash the daoState of the store together with the last block the same way as
+        DaoStateMonitoringService does when creating the hash chain, so no network is required.
+        """
+        snapshot_index = store.snapshot_index
+        if snapshot_index is None:
+            return True
+
+        dao_state_as_proto = store.dao_state_as_proto
+        hash_chain = store.dao_state_hash_chain or []
+        tail = snapshot_index.tail_dao_state_hash
+        if (
+            dao_state_as_proto is None
+            or not hash_chain
+            or hash_chain[-1].height != tail.height
+            or hash_chain[-1].hash != tail.hash
+        ):
+            logger.warning(
+                "Snapshot index does not match the tail of the persisted hash chain"
+            )
+            return False
+        if (
+            snapshot_index.chain_height != dao_state_as_proto.chain_height
+            or tail.height != dao_state_as_proto.chain_height
+        ):
+            logger.warning(
+                f"Hash chain tail at height {tail.height} is not at chain height "
+                f"{dao_state_as_proto.chain_height} of the persisted daoState"
+            )
+            return False
+        if not blocks or blocks[-1].height != tail.height:
+            logger.warning(f"Last persisted block is not at chain height {tail.height}")
+            return False
+        prev_hash = bytes()
+        if len(hash_chain) > 1:
+            if hash_chain[-2].height != tail.height - 1:
+                logger.warning(
+                    f"Persisted hash chain is not connecting at height {tail.height}"
+                )
+                return False
+            prev_hash = hash_chain[-2].hash
+
+        ts = get_time_ms()
+        state_as_bytes = DaoState.get_serialized_snapshot_for_hash_chain(
+            dao_state_as_proto, blocks[-1]
+        )
+        is_matching = get_sha256_ripemd160_hash(prev_hash + state_as_bytes) == tail.hash
+        if is_matching:
+            logger.info(
+                f"Verified persisted daoState at chain height {tail.height} "
+                f"in {get_time_ms() - ts} ms"
+            )
+        else:
+            logger.warning(
+                f"Hash of persisted daoState at chain height {tail.height} does not match "
+                "the persisted hash chain"
+            )
+        return is_matching
+
     def release_memory(self):
         self._blocks.clear()
         self.store.clear()
@@ -213,6 +309,7 @@ class DaoStateStorageService(StoreService["DaoStateStore"]):
             DaoState()
         )
         self.store.dao_state_hash_chain = []
+        self.store.snapshot_index = None
         self.persistence_manager.persist_now(result_handler)
 
     def remove_and_backup_all_dao_data(self):
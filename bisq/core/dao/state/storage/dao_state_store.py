@@ -2,6 +2,7 @@ from typing import Optional
 from bisq.common.protocol.persistable.persistable_envelope import PersistableEnvelope
 
 from bisq.core.dao.monitoring.model.dao_state_hash import DaoStateHash
+from bisq.core.dao.state.storage.dao_state_snapshot_index import DaoStateSnapshotIndex
 import pb_pb2 as protobuf
 
 
@@ -11,9 +12,11 @@ class DaoStateStore(PersistableEnvelope):
         self,
         dao_state_as_proto: Optional[protobuf.DaoState],
         dao_state_hash_chain: list[DaoStateHash],
+        snapshot_index: Optional[DaoStateSnapshotIndex] = None,
     ):
         self.dao_state_as_proto = dao_state_as_proto
         self.dao_state_hash_chain: Optional[list[DaoStateHash]] = dao_state_hash_chain
+        self.snapshot_index = snapshot_index
 
     def to_proto_message(self):
         assert (
@@ -22,21 +25,28 @@ class DaoStateStore(PersistableEnvelope):
         assert (
             self.dao_state_hash_chain is not None
         ), "dao_state_hash_chain must not be None when to_proto_message is invoked"
-        return protobuf.PersistableEnvelope(
-            dao_state_store=protobuf.DaoStateStore(
-                dao_state=self.dao_state_as_proto,
-                dao_state_hash=[
-                    dao_state_hash.to_proto_message()
-                    for dao_state_hash in self.dao_state_hash_chain
-                ],
-            )
+        builder = protobuf.DaoStateStore(
+            dao_state=self.dao_state_as_proto,
+            dao_state_hash=[
+                dao_state_hash.to_proto_message()
+                for dao_state_hash in self.dao_state_hash_chain
+            ],
         )
+        if self.snapshot_index is not None:
+            builder.snapshot_index.CopyFrom(self.snapshot_index.to_proto_message())
+        return protobuf.PersistableEnvelope(dao_state_store=builder)
 
     @staticmethod
     def from_proto(proto: protobuf.DaoStateStore):
         dao_state_hash_list = [DaoStateHash.from_proto(p) for p in proto.dao_state_hash]
-        return DaoStateStore(proto.dao_state, dao_state_hash_list)
+        snapshot_index = (
+            DaoStateSnapshotIndex.from_proto(proto.snapshot_index)
+            if proto.HasField("snapshot_index")
+            else None
+        )
+        return DaoStateStore(proto.dao_state, dao_state_hash_list, snapshot_index)
 
     def clear(self):
         self.dao_state_as_proto = None
         self.dao_state_hash_chain = None
+        self.snapshot_index = None
@@ -26,6 +26,7 @@ from bisq.common.version import Version
 from bisq.core.network.p2p.p2p_service_listener import P2PServiceListener
 
 if TYPE_CHECKING:
+    from bisq.common.crypto.proof_of_work import ProofOfWork
     from bisq.core.offer.offer import Offer
     from bisq.core.payment.payload.payment_account_payload import PaymentAccountPayload
     from bisq.core.network.p2p.node_address import NodeAddress
@@ -513,6 +514,43 @@ class FilterManager:
             )
         )
 
+    def are_proofs_of_work_valid(self, offers: Collection["Offer"]) -> list[bool]:
+        """
+        Same result as calling is_proof_of_work_valid for each offer, but the proofs
+        are verified in one batch per service so duplicates get verified only once.
+        """
+        filter = self.get_filter()
+        if filter is None:
+            return [True] * len(offers)
+
+        enabled_versions = self.get_enabled_pow_versions()
+        result = [False] * len(offers)
+        # service version -> (offer index, (proof of work, offer id, owner id))
+        to_verify: dict[int, list[tuple[int, tuple["ProofOfWork", str, str]]]] = {}
+        for i, offer in enumerate(offers):
+            check_argument(
+                offer.bsq_swap_offer_payload is not None,
+                "Offer payload must be BsqSwapOfferPayload",
+            )
+            pow = offer.bsq_swap_offer_payload.get_proof_of_work()
+            if (
+                pow_service_for_version(pow.version) is None
+                or pow.version not in enabled_versions
+            ):
+                continue
+            to_verify.setdefault(pow.version, []).append(
+                (i, (pow, offer.id, str(offer.owner_node_address)))
+            )
+
+        for version, entries in to_verify.items():
+            verdicts = pow_service_for_version(version).verify_all_with_ids(
+                [proof_with_ids for _, proof_with_ids in entries],
+                filter.pow_difficulty,
+            )
+            for (i, _), verdict in zip(entries, verdicts):
+                result[i] = verdict
+        return result
+
     def get_enabled_pow_versions(self) -> list[int]:
         filter = self.get_filter()
         return (
@@ -1,16 +1,16 @@
 from bisq.common.setup.log_setup import get_ctx_logger
 from utils.aio import as_future
 import asyncio
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 import uuid
 import aiohttp
-from aiohttp_socks import ProxyType, ProxyConnector
 
 from bisq.common.version import Version
 from bisq.core.exceptions.illegal_argument_exception import IllegalArgumentException
 from bisq.core.network.http.async_http_client import AsyncHttpClient
 from bisq.core.network.http.http_client_utils import parse_and_validate_url
 from bisq.core.network.http.http_response_error import HttpResponseError
+from bisq.core.network.http.http_session_pool import HttpSessionPool
 from bisq.core.network.p2p.network.socks5_proxy import Socks5Proxy
 from bisq.core.network.socks5_proxy_provider import Socks5ProxyProvider
 from utils.preconditions import check_argument
@@ -25,6 +25,7 @@ class AsyncHttpClientImpl(AsyncHttpClient):
         base_url: str = None,
         socks5_proxy_provider: Socks5ProxyProvider = None,
         timeout: asyncio.TimeoutError = None,
+        session_pool: Optional[HttpSessionPool] = None,
     ):
         super().__init__()
         self.logger = get_ctx_logger(__name__)
@@ -36,6 +37,7 @@ class AsyncHttpClientImpl(AsyncHttpClient):
         self.ignore_socks5_proxy = False
         self.current_task: "asyncio.Future[str]" = None
         self.default_timeout = timeout
+        self.session_pool = session_pool or HttpSessionPool.get_default()
         self.base_url = base_url
 
     @property
@@ -110,25 +112,11 @@ class AsyncHttpClientImpl(AsyncHttpClient):
             url = "/" + url
 
         socks5_proxy: Socks5Proxy = None
-        proxy_connector = None
 
         if not self.ignore_socks5_proxy:
             socks5_proxy = self._get_socks5_proxy()
 
         if socks5_proxy:
-            if self._base_url_host_is_onion:
-                verify_ssl = False
-            else:
-                verify_ssl = True
-            proxy_connector = ProxyConnector(
-                proxy_type=ProxyType.SOCKS5,
-                host=socks5_proxy.host,
-                port=socks5_proxy.port,
-                username=socks5_proxy.username,
-                password=socks5_proxy.password,
-                rdns=True,
-                ssl=verify_ssl,
-            )
             client_timeout = (
                 timeout
                 or self.default_timeout
@@ -154,36 +142,34 @@ class AsyncHttpClientImpl(AsyncHttpClient):
         ts = get_time_ms()
 
         try:
-            async with aiohttp.ClientSession(
-                connector=proxy_connector,
+            status, response = await self.session_pool.request(
+                http_method,
+                self.base_url + url,
+                socks5_proxy=socks5_proxy,
+                verify_ssl=not (socks5_proxy and self._base_url_host_is_onion),
                 timeout=client_timeout,
-            ) as session:
-                async with session.request(
-                    http_method,
-                    self.base_url + url,
-                    params=params,
-                    data=data,
-                    headers=headers,
-                    allow_redirects=True,
-                ) as response:
-                    if response.status != 200:
-                        response_text = response.text()
-                        raise HttpResponseError(
-                            f"Server responded with non-200 status code: {response.status}",
-                            response.status,
-                            response_text,
-                            f"{self.base_url} {url}",
-                            (get_time_ms() - ts),
-                            params
-                        )
-
-                    response = await response.text()
-
-                    self.logger.debug(
-                        f"Response from {self.base_url} {url} took {(get_time_ms() - ts)} ms. Data size:{len(response)}, response: {response}, param: {params}"
-                    )
-
-                    return response
+                # only requests without side effects are sent again
+                retry_on_connection_error=http_method == "GET",
+                params=params,
+                data=data,
+                headers=headers,
+                allow_redirects=True,
+            )
+            if status != 200:
+                raise HttpResponseError(
+                    f"Server responded with non-200 status code: {status}",
+                    status,
+                    response,
+                    f"{self.base_url} {url}",
+                    (get_time_ms() - ts),
+                    params
+                )
+
+            self.logger.debug(
+                f"Response from {self.base_url} {url} took {(get_time_ms() - ts)} ms. Data size:{len(response)}, response: {response}, param: {params}"
+            )
+
+            return response
         finally:
             self.has_pending_request = False
 
@@ -0,0 +1,192 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp_socks import ProxyConnector, ProxyType
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from utils.time import get_time_ms
+
+if TYPE_CHECKING:
+    from bisq.core.network.p2p.network.socks5_proxy import Socks5Proxy
+
+
+@dataclass
+class _PooledSession:
+    session: aiohttp.ClientSession
+    last_used: int = field(default_factory=get_time_ms)
+    active_requests: int = 0
+
+
+class HttpSessionPool:
+    """
+    Keeps one aiohttp session per (origin, socks5 proxy, ssl verification) so that
+    the http clients of the price, fee, mempool and tx proof providers reuse their
+    connections, and with that the established Tor circuits, instead of paying a new
+    SOCKS5 handshake and circuit setup for every request.
+
+    Sessions which have not been used for `idle_timeout_sec` get closed the next time
+    the pool is used. The number of concurrent connections per session is bounded by
+    `max_concurrent_requests`, further requests wait for a free connection.
+    """
+
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+    DEFAULT_KEEPALIVE_TIMEOUT_SEC = 60
+    DEFAULT_IDLE_TIMEOUT_SEC = 5 * 60
+
+    _default_pool: Optional["HttpSessionPool"] = None
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        keepalive_timeout_sec: float = DEFAULT_KEEPALIVE_TIMEOUT_SEC,
+        idle_timeout_sec: float = DEFAULT_IDLE_TIMEOUT_SEC,
+    ):
+        self.logger = get_ctx_logger(__name__)
+        self.max_concurrent_requests = max_concurrent_requests
+        self.keepalive_timeout_sec = keepalive_timeout_sec
+        self.idle_timeout_sec = idle_timeout_sec
+        self._sessions: dict[tuple, _PooledSession] = {}
+
+    @staticmethod
+    def get_default() -> "HttpSessionPool":
+        """The process wide pool used by the http clients if they got none assigned."""
+        if HttpSessionPool._default_pool is None:
+            HttpSessionPool._default_pool = HttpSessionPool()
+        return HttpSessionPool._default_pool
+
+    @staticmethod
+    async def shut_down_default():
+        if HttpSessionPool._default_pool is not None:
+            await HttpSessionPool._default_pool.shut_down()
+
+    @staticmethod
+    def get_key(
+        url: str, socks5_proxy: Optional["Socks5Proxy"], verify_ssl: bool
+    ) -> tuple:
+        parsed = urlsplit(url)
+        return (parsed.scheme, parsed.hostname, parsed.port, socks5_proxy, verify_ssl)
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    async def request(
+        self,
+        http_method: str,
+        url: str,
+        socks5_proxy: Optional["Socks5Proxy"] = None,
+        verify_ssl: bool = True,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        retry_on_connection_error: bool = True,
+        **kwargs,
+    ) -> tuple[int, str]:
+        """
+        Sends the request through the pooled session and returns status and body.
+
+        A connection error can mean the reused connection or the Tor circuit it runs
+        over went stale. If `retry_on_connection_error` is set, the request is sent
+        once more over a fresh connection.
+        """
+        key = HttpSessionPool.get_key(url, socks5_proxy, verify_ssl)
+        try:
+            return await self._request_with_session(
+                key, http_method, url, socks5_proxy, verify_ssl, timeout, **kwargs
+            )
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            if not retry_on_connection_error:
+                raise
+            self.logger.info(
+                f"Request to {url} failed with {e!r}. Retrying with a new connection."
+            )
+            await self._discard_session(key)
+            return await self._request_with_session(
+                key, http_method, url, socks5_proxy, verify_ssl, timeout, **kwargs
+            )
+
+    async def _request_with_session(
+        self,
+        key: tuple,
+        http_method: str,
+        url: str,
+        socks5_proxy: Optional["Socks5Proxy"],
+        verify_ssl: bool,
+        timeout: Optional[aiohttp.ClientTimeout],
+        **kwargs,
+    ) -> tuple[int, str]:
+        await self.evict_idle_sessions()
+        pooled = self._get_or_create_session(key, socks5_proxy, verify_ssl)
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        pooled.active_requests += 1
+        try:
+            async with pooled.session.request(http_method, url, **kwargs) as response:
+                return response.status, await response.text()
+        finally:
+            pooled.active_requests -= 1
+            pooled.last_used = get_time_ms()
+
+    def _get_or_create_session(
+        self, key: tuple, socks5_proxy: Optional["Socks5Proxy"], verify_ssl: bool
+    ) -> _PooledSession:
+        pooled = self._sessions.get(key)
+        if pooled is not None and not pooled.session.closed:
+            return pooled
+
+        if socks5_proxy:
+            connector = ProxyConnector(
+                proxy_type=ProxyType.SOCKS5,
+                host=socks5_proxy.host,
+                port=socks5_proxy.port,
+                username=socks5_proxy.username,
+                password=socks5_proxy.password,
+                rdns=True,
+                ssl=verify_ssl,
+                limit=self.max_concurrent_requests,
+                keepalive_timeout=self.keepalive_timeout_sec,
+            )
+        else:
+            connector = aiohttp.TCPConnector(
+                ssl=verify_ssl,
+                limit=self.max_concurrent_requests,
+                keepalive_timeout=self.keepalive_timeout_sec,
+            )
+        # A pooled session is shared by all users, so cookies set for one of them must
+        # not be sent along with the requests of the others.
+        pooled = _PooledSession(
+            session=aiohttp.ClientSession(
+                connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+            )
+        )
+        self._sessions[key] = pooled
+        return pooled
+
+    async def evict_idle_sessions(self):
+        now = get_time_ms()
+        idle_keys = [
+            key
+            for key, pooled in self._sessions.items()
+            if pooled.active_requests == 0
+            and now - pooled.last_used >= self.idle_timeout_sec * 1000
+        ]
+        for key in idle_keys:
+            await self._close_session(key)
+
+    async def _discard_session(self, key: tuple):
+        """
+        Closes the session so the retry does not get a connection of it again, unless
+        other requests still use it. Broken connections get dropped by aiohttp anyway.
+        """
+        pooled = self._sessions.get(key)
+        if pooled is not None and pooled.active_requests == 0:
+            await self._close_session(key)
+
+    async def _close_session(self, key: tuple):
+        pooled = self._sessions.pop(key, None)
+        if pooled is not None and not pooled.session.closed:
+            await pooled.session.close()
+
+    async def shut_down(self):
+        for key in list(self._sessions.keys()):
+            await self._close_session(key)
@@ -10,14 +10,29 @@ from bisq.core.network.p2p.storage.payload.capability_requiring_payload import C
 import pb_pb2 as protobuf
 
 from dataclasses import dataclass, field
+from typing import Optional
 
 @dataclass
 class BundleOfEnvelopes(BroadcastMessage, ExtendedDataSizePermission, CapabilityRequiringPayload):
     envelopes: list[NetworkEnvelope] = field(default_factory=list)
+    # protos of envelopes which were serialized before, keyed by id of the envelope
+    envelope_protos: dict[int, "protobuf.NetworkEnvelope"] = field(
+        default_factory=dict, compare=False, repr=False
+    )
 
-    def add(self, network_envelope: NetworkEnvelope) -> None:
+    def add(
+        self,
+        network_envelope: NetworkEnvelope,
+        proto: Optional["protobuf.NetworkEnvelope"] = None,
+    ) -> None:
         self.envelopes.append(network_envelope)
-        
+        if proto is not None:
+            self.envelope_protos[id(network_envelope)] = proto
+
+    def _get_envelope_proto(self, envelope: NetworkEnvelope) -> "protobuf.NetworkEnvelope":
+        proto = self.envelope_protos.get(id(envelope))
+        return proto if proto is not None else envelope.to_proto_network_envelope()
+
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // PROTO BUFFER
     # ///////////////////////////////////////////////////////////////////////////////////////////
@@ -25,7 +40,7 @@ class BundleOfEnvelopes(BroadcastMessage, ExtendedDataSizePermission, Capability
     def to_proto_network_envelope(self) -> 'protobuf.NetworkEnvelope':
         builder = self.get_network_envelope_builder()
         builder.bundle_of_envelopes.CopyFrom(
-            protobuf.BundleOfEnvelopes(envelopes=[env.to_proto_network_envelope() for env in self.envelopes])
+            protobuf.BundleOfEnvelopes(envelopes=[self._get_envelope_proto(env) for env in self.envelopes])
         )
         return builder
 
@@ -40,12 +40,12 @@ class FileTransferPart(NetworkEnvelope, ExtendedDataSizePermission, SendersNodeA
     def to_proto_network_envelope(self):
         envelope = self.get_network_envelope_builder()
         envelope.file_transfer_part.CopyFrom(protobuf.FileTransferPart(
-            senderNodeAddress=self.sender_node_address.to_proto_message(),
-            tradeId=self.trade_id,
-            traderId=self.trader_id,
+            sender_node_address=self.sender_node_address.to_proto_message(),
+            trade_id=self.trade_id,
+            trader_id=self.trader_id,
             uid=self.uid,
-            seqNumOrFileLength=self.seq_num_or_file_length,
-            messageData=self.message_data
+            seq_num_or_file_length=self.seq_num_or_file_length,
+            message_data=self.message_data
         ))
         return envelope
 
@@ -1,17 +1,19 @@
 
+from collections.abc import Callable
 from datetime import timedelta
 from typing import TYPE_CHECKING, Optional
 
 from bisq.common.protocol.network.network_envelope import NetworkEnvelope
 from bisq.common.setup.log_setup import get_ctx_logger
 from bisq.common.timer import Timer
-from bisq.common.user_thread import UserThread
+from bisq.common.timing_wheel import TimingWheel
 from bisq.core.network.p2p.bundle_of_envelopes import BundleOfEnvelopes
 from bisq.core.network.p2p.initial_data_request import InitialDataRequest
 from bisq.core.network.p2p.initial_data_response import InitialDataResponse
 from bisq.core.network.p2p.network.message_listener import MessageListener
 from bisq.core.network.p2p.network.peer_type import PeerType
 from bisq.core.network.p2p.prefixed_sealed_and_signed_message import PrefixedSealedAndSignedMessage
+from utils.concurrency import ThreadSafeSet
 from utils.time import get_time_ms
 
 if TYPE_CHECKING:
@@ -44,6 +46,8 @@ class ConnectionState(MessageListener):
         self.num_initial_data_responses = 0
         self.last_initial_data_msg_timestamp = 0
         self.is_seed_node = False
+        # notified when peer_type or last_initial_data_msg_timestamp changed
+        self._change_listeners: ThreadSafeSet[Callable[[], None]] = ThreadSafeSet()
 
         self.peer_type_reset_due_timeout_timer: Optional[Timer] = None
         self.initial_data_exchange_completed_timer: Optional[Timer] = None
@@ -54,6 +58,14 @@ class ConnectionState(MessageListener):
         self.connection.remove_message_listener(self)
         self.stop_timer()
 
+    def add_change_listener(self, listener: Callable[[], None]):
+        self._change_listeners.add(listener)
+        return lambda: self._change_listeners.discard(listener)
+
+    def _notify_changed(self):
+        for listener in self._change_listeners:
+            listener()
+
     def on_message(self, network_envelope, connection):
         if isinstance(network_envelope, BundleOfEnvelopes):
             for envelope in network_envelope.envelopes:
@@ -77,6 +89,7 @@ class ConnectionState(MessageListener):
             self.on_initial_data_exchange()
         elif isinstance(network_envelope, PrefixedSealedAndSignedMessage) and self.connection.peers_node_address:
             self.peer_type = PeerType.DIRECT_MSG_PEER
+            self._notify_changed()
 
     def on_initial_data_exchange(self):
         # If we have a higher prio type we do not handle it
@@ -86,10 +99,11 @@ class ConnectionState(MessageListener):
 
         self.peer_type = PeerType.INITIAL_DATA_EXCHANGE
         self.last_initial_data_msg_timestamp = get_time_ms()
+        self._notify_changed()
         self.maybe_reset_initial_data_exchange_type()
 
         if self.peer_type_reset_due_timeout_timer is None:
-            self.peer_type_reset_due_timeout_timer = UserThread.run_after(self.reset_initial_data_exchange_type, timedelta(seconds=self.PEER_RESET_TIMER_DELAY_SEC))
+            self.peer_type_reset_due_timeout_timer = TimingWheel.get_default().run_after(self.reset_initial_data_exchange_type, timedelta(seconds=self.PEER_RESET_TIMER_DELAY_SEC))
 
     def maybe_reset_initial_data_exchange_type(self):
         if self.num_initial_data_responses >= self.expected_initial_data_responses:
@@ -98,7 +112,7 @@ class ConnectionState(MessageListener):
             # Reset to PEER does not mean disconnection as well, but just that this connection has lower priority and
             # runs higher risk for getting disconnected.
             if self.initial_data_exchange_completed_timer is None:
-                self.initial_data_exchange_completed_timer = UserThread.run_after(self.reset_initial_data_exchange_type, timedelta(seconds=self.COMPLETED_TIMER_DELAY_SEC))
+                self.initial_data_exchange_completed_timer = TimingWheel.get_default().run_after(self.reset_initial_data_exchange_type, timedelta(seconds=self.COMPLETED_TIMER_DELAY_SEC))
 
     def reset_initial_data_exchange_type(self):
         # If we have a higher prio type we do not handle it
@@ -108,6 +122,7 @@ class ConnectionState(MessageListener):
 
         self.stop_timer()
         self.peer_type = PeerType.PEER
+        self._notify_changed()
         self.logger.info(f"We have changed the peerType from INITIAL_DATA_EXCHANGE to PEER as we have received all "
                     f"expected initial data responses at connection with peer {self.connection.peers_node_address}/{self.connection.uid}.")
 
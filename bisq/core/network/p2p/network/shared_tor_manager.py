@@ -0,0 +1,267 @@
+import asyncio
+import base64
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from bisq.common.config.config import Config
+from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.core.network.p2p.network.new_tor import NewTor
+from bisq.core.network.p2p.network.socks5_proxy import Socks5Proxy
+from bisq.core.network.p2p.network.tor_controller import (
+    BootstrapPhase,
+    TorController,
+    parse_bootstrap_phase,
+)
+from bisq.core.network.p2p.network.tor_mode import TorMode
+from utils.aio import as_future, run_in_thread
+from utils.data import SimpleProperty
+from utils.time import get_time_ms
+
+if TYPE_CHECKING:
+    from txtorcon import Tor
+
+
+class SharedTorManager:
+    """
+    Runs a single Tor instance which is shared by the network nodes of all users.
+
+    Each user gets its own ephemeral onion service on that instance. Its key is kept in the hidden
+    service directory of the user, so the onion address of the user does not change. The key of a
+    hidden service which tor created in that directory before is reused.
+
+    Each user also gets its own SOCKS credentials. Tor does not share circuits between streams with
+    different SOCKS credentials (IsolateSOCKSAuth is on by default), so the traffic of the users can
+    not be linked by their circuits. The credentials only serve this isolation and are not secret.
+
+    If a tor control port is configured, the running Tor instance behind it is used instead of
+    launching a new one.
+    """
+
+    PRIVATE_KEY_FILE_NAME = "private_key"
+    # written by tor for hidden services configured by HiddenServiceDir
+    TOR_SECRET_KEY_FILE_NAME = "hs_ed25519_secret_key"
+    TOR_SECRET_KEY_HEADER = b"== ed25519v1-secret: type0 =="
+
+    def __init__(self, config: "Config", tor_dir: Path):
+        self.logger = get_ctx_logger(__name__)
+        self._config = config
+        self._tor_dir = tor_dir
+        self.bootstrap_phase_property = SimpleProperty[Optional[BootstrapPhase]]()
+        self.socks_host: Optional[str] = None
+        self.socks_port: Optional[int] = None
+        self._controller: Optional[TorController] = None
+        # only set if we launched tor ourselves
+        self._tor: Optional["Tor"] = None
+        self._start_future: Optional[asyncio.Future] = None
+        self._bootstrapped: Optional[asyncio.Future] = None
+        self._onion_service_ids: dict[str, str] = {}  # user_id -> service id
+
+    @property
+    def bootstrap_progress(self) -> int:
+        phase = self.bootstrap_phase_property.value
+        return phase.progress if phase else 0
+
+    @property
+    def is_bootstrapped(self):
+        return self.bootstrap_progress >= 100
+
+    def start(self) -> asyncio.Future[None]:
+        """Starts or connects to tor once and completes when tor has bootstrapped."""
+        if self._start_future is None or (
+            self._start_future.done()
+            and (
+                self._start_future.cancelled()
+                or self._start_future.exception() is not None
+            )
+        ):
+            self._start_future = as_future(self._start())
+        return self._start_future
+
+    def get_socks_proxy(self, user_id: str) -> Socks5Proxy:
+        if self.socks_port is None:
+            raise RuntimeError("Shared tor is not started yet")
+        return Socks5Proxy(
+            self.socks_host, self.socks_port, f"bisq-{user_id}", user_id
+        )
+
+    async def add_onion_service(
+        self,
+        user_id: str,
+        hidden_service_dir: Path,
+        service_port: int,
+        local_port: int,
+    ) -> str:
+        """Publishes the onion service of the user and returns its onion hostname."""
+        await self.start()
+        if user_id in self._onion_service_ids:
+            await self.remove_onion_service(user_id)
+
+        key = await run_in_thread(self._read_key, hidden_service_dir)
+        ts = get_time_ms()
+        service_id, new_key = await self._controller.add_onion(
+            [(service_port, f"127.0.0.1:{local_port}")], key
+        )
+        if new_key:
+            await run_in_thread(self._write_key, hidden_service_dir, new_key)
+        self._onion_service_ids[user_id] = service_id
+        self.logger.info(
+            f"Onion service of user `{user_id}` added to shared tor after "
+            f"{get_time_ms() - ts} ms"
+        )
+        return f"{service_id}.onion"
+
+    async def remove_onion_service(self, user_id: str):
+        service_id = self._onion_service_ids.pop(user_id, None)
+        if service_id is None or self._controller is None:
+            return
+        try:
+            await self._controller.del_onion(service_id)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to remove onion service of user `{user_id}`: {e}"
+            )
+
+    async def shut_down(self):
+        for user_id in list(self._onion_service_ids.keys()):
+            await self.remove_onion_service(user_id)
+        if self._controller is not None:
+            await self._controller.close()
+            self._controller = None
+        if self._tor is not None:
+            tor, self._tor = self._tor, None
+            await as_future(tor.quit())
+        self._start_future = None
+        self.logger.info("Shared tor shut down")
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // Private
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    async def _start(self):
+        ts = get_time_ms()
+        password = None
+        if self._config.tor_control_port != Config.UNSPECIFIED_PORT:
+            endpoint = (
+                f"{self._config.tor_control_host}:{self._config.tor_control_port}"
+            )
+            password = self._config.tor_control_password or None
+        else:
+            # Bridges of the users are not used, as they are per user. Bridges can be set up
+            # with the bridges file or the torrc options.
+            self._tor = await NewTor(
+                self._config.app_data_dir,
+                self._tor_dir,
+                self._config.torrc_file,
+                self._config.torrc_options,
+                None,
+                self._config.tor_use_bridges_file,
+            ).get_tor()
+            control_port = str(self._tor._config.ControlPort)
+            endpoint = (
+                control_port
+                if control_port.startswith("unix:")
+                else f"127.0.0.1:{control_port}"
+            )
+
+        controller = TorController()
+        await controller.connect(endpoint)
+        try:
+            await controller.authenticate(password)
+            self._bootstrapped = asyncio.get_running_loop().create_future()
+            controller.add_event_listener("STATUS_CLIENT", self._on_status_client)
+            await controller.set_events(["STATUS_CLIENT"])
+            phase = await controller.get_bootstrap_phase()
+            if phase:
+                self._on_bootstrap_phase(phase)
+            listeners = await controller.get_socks_listeners()
+            if not listeners:
+                raise RuntimeError("Shared tor has no SOCKS listener")
+            host, port = listeners[0].rsplit(":", 1)
+            self.socks_host, self.socks_port = host, int(port)
+        except BaseException:
+            await controller.close()
+            raise
+        self._controller = controller
+
+        await self._bootstrapped
+        self.logger.info(
+            f"Shared tor bootstrapped after {get_time_ms() - ts} ms. "
+            f"SOCKS proxy at {self.socks_host}:{self.socks_port}"
+        )
+
+    def _on_status_client(self, line: str):
+        phase = parse_bootstrap_phase(line)
+        if phase:
+            self._on_bootstrap_phase(phase)
+
+    def _on_bootstrap_phase(self, phase: BootstrapPhase):
+        if phase == self.bootstrap_phase_property.value:
+            return
+        self.logger.info(f"Shared tor bootstrap {phase.progress}%: {phase.summary}")
+        self.bootstrap_phase_property.set(phase)
+        if (
+            phase.progress >= 100
+            and self._bootstrapped is not None
+            and not self._bootstrapped.done()
+        ):
+            self._bootstrapped.set_result(None)
+
+    def _read_key(self, hidden_service_dir: Path) -> Optional[str]:
+        key_file = hidden_service_dir.joinpath(SharedTorManager.PRIVATE_KEY_FILE_NAME)
+        if key_file.is_file():
+            key = key_file.read_text().strip()
+            if key.startswith("ED25519-V3:"):
+                return key
+
+        # The user ran its own tor before, keep the onion address of that hidden service
+        tor_key_file = hidden_service_dir.joinpath(
+            SharedTorManager.TOR_SECRET_KEY_FILE_NAME
+        )
+        if tor_key_file.is_file():
+            data = tor_key_file.read_bytes()
+            # 32 bytes header followed by the 64 bytes expanded secret key
+            if len(data) == 96 and data.startswith(
+                SharedTorManager.TOR_SECRET_KEY_HEADER
+            ):
+                return "ED25519-V3:" + base64.b64encode(data[32:]).decode()
+            self.logger.warning(
+                f"Ignoring {tor_key_file} as it is no ed25519 v3 secret key file"
+            )
+        return None
+
+    def _write_key(self, hidden_service_dir: Path, key: str):
+        key_file = hidden_service_dir.joinpath(SharedTorManager.PRIVATE_KEY_FILE_NAME)
+        hidden_service_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(key)
+
+
+class SharedTor(TorMode):
+    """Uses the tor instance of the SharedTorManager, on which the user gets its own onion service."""
+
+    def __init__(
+        self, shared_tor_manager: "SharedTorManager", tor_dir: Path, user_id: str
+    ):
+        super().__init__(tor_dir)
+        self.shared_tor_manager = shared_tor_manager
+        self.user_id = user_id
+
+    async def get_tor(self) -> None:
+        await self.shared_tor_manager.start()
+        return None
+
+    def get_hidden_service_directory(self) -> Path:
+        return self.tor_dir.joinpath(TorMode.HIDDEN_SERVICE_DIRECTORY)
+
+    def get_socks_proxy(self) -> Socks5Proxy:
+        return self.shared_tor_manager.get_socks_proxy(self.user_id)
+
+    async def publish_hidden_service(self, service_port: int, local_port: int) -> str:
+        return await self.shared_tor_manager.add_onion_service(
+            self.user_id, self.get_hidden_service_directory(), service_port, local_port
+        )
+
+    async def remove_hidden_service(self):
+        await self.shared_tor_manager.remove_onion_service(self.user_id)
@@ -1,9 +1,10 @@
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from bisq.common.setup.log_setup import get_base_logger
 from bisq.common.user_thread import UserThread
-from utils.concurrency import ThreadSafeDict
+from utils.concurrency import ThreadSafeDict, ThreadSafeSet
 from utils.data import SimpleProperty
 from utils.formatting import readable_file_size
 from utils.time import get_time_ms
@@ -39,12 +40,19 @@ class Statistic:
         self.sent_messages: ThreadSafeDict[str, int] = ThreadSafeDict()
         self.received_messages: ThreadSafeDict[str, int] = ThreadSafeDict()
         self.round_trip_time_property = SimpleProperty(0)
+        self._last_activity_listeners: ThreadSafeSet[Callable[[], None]] = ThreadSafeSet()
 
     def update_last_activity_timestamp(self):
         def update():
             self.last_activity_timestamp = get_time_ms()
+            for listener in self._last_activity_listeners:
+                listener()
         UserThread.execute(update)
 
+    def add_last_activity_listener(self, listener: Callable[[], None]):
+        self._last_activity_listeners.add(listener)
+        return lambda: self._last_activity_listeners.discard(listener)
+
     def add_sent_bytes(self, value: int):
         def update():
             self.sent_bytes_property.value += value
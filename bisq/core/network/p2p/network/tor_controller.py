@@ -0,0 +1,241 @@
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+import re
+from typing import Optional, Union
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from utils.aio import run_in_thread
+
+_KEY_VALUE_RE = re.compile(r'([\w/\-]+)=("(?:[^"\\]|\\.)*"|\S*)')
+
+
+class TorControlError(Exception):
+    def __init__(self, code: str, message: str):
+        super().__init__(f"{code} {message}")
+        self.code = code
+        self.message = message
+
+
+@dataclass(frozen=True)
+class BootstrapPhase:
+    progress: int
+    tag: str
+    summary: str
+
+
+def parse_key_values(line: str) -> dict[str, str]:
+    """Parses the KEY=VALUE and KEY="quoted value" pairs of a reply or event line."""
+    result = {}
+    for key, value in _KEY_VALUE_RE.findall(line):
+        if value.startswith('"'):
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        result[key] = value
+    return result
+
+
+def parse_bootstrap_phase(line: str) -> Optional[BootstrapPhase]:
+    """Parses a bootstrap status like `NOTICE BOOTSTRAP PROGRESS=50 TAG=loading_descriptors SUMMARY="..."`."""
+    if "BOOTSTRAP" not in line.split():
+        return None
+    values = parse_key_values(line)
+    if "PROGRESS" not in values:
+        return None
+    return BootstrapPhase(
+        int(values["PROGRESS"]), values.get("TAG", ""), values.get("SUMMARY", "")
+    )
+
+
+class TorController:
+    """
+    Minimal client of the Tor control protocol.
+
+    Supports what is needed to share one Tor instance between users: authentication, ephemeral
+    onion services (ADD_ONION/DEL_ONION), GETINFO and asynchronous events.
+    Replies are matched to commands in order, so commands are sent one at a time.
+
+    see https://spec.torproject.org/control-spec/
+    """
+
+    def __init__(self):
+        self.logger = get_ctx_logger(__name__)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._read_task: Optional[asyncio.Task] = None
+        self._command_lock = asyncio.Lock()
+        self._pending_replies: asyncio.Queue[Union[list[str], BaseException]] = (
+            asyncio.Queue()
+        )
+        self._event_listeners: dict[str, list[Callable[[str], None]]] = {}
+
+    @property
+    def is_connected(self):
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self, endpoint: str):
+        """Connects to an endpoint of the form host:port or unix:/path/to/socket."""
+        if endpoint.startswith("unix:"):
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                endpoint[len("unix:") :]
+            )
+        else:
+            host, port = endpoint.rsplit(":", 1)
+            self._reader, self._writer = await asyncio.open_connection(host, int(port))
+        self._read_task = asyncio.ensure_future(self._read_loop())
+
+    async def authenticate(self, password: Optional[str] = None):
+        reply = await self.send_command("PROTOCOLINFO 1")
+        methods: set[str] = set()
+        cookie_file = None
+        for line in reply:
+            if line.startswith("AUTH "):
+                values = parse_key_values(line)
+                methods = set(values.get("METHODS", "").split(","))
+                cookie_file = values.get("COOKIEFILE", None)
+
+        if "NULL" in methods:
+            await self.send_command("AUTHENTICATE")
+        elif password and "HASHEDPASSWORD" in methods:
+            escaped = password.replace("\\", "\\\\").replace('"', '\\"')
+            await self.send_command(f'AUTHENTICATE "{escaped}"')
+        elif cookie_file and "COOKIE" in methods:
+            cookie = await run_in_thread(Path(cookie_file).read_bytes)
+            await self.send_command(f"AUTHENTICATE {cookie.hex()}")
+        else:
+            raise TorControlError(
+                "515", f"No supported authentication method in {sorted(methods)}"
+            )
+
+    async def send_command(self, command: str) -> list[str]:
+        """Returns the lines of the reply without status codes. Raises TorControlError on errors."""
+        if not self.is_connected:
+            raise ConnectionError("Not connected to the tor control port")
+        async with self._command_lock:
+            self._writer.write(command.encode() + b"\r\n")
+            await self._writer.drain()
+            reply = await self._pending_replies.get()
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+
+    async def get_info(self, *keys: str) -> dict[str, str]:
+        reply = await self.send_command(f"GETINFO {' '.join(keys)}")
+        result = {}
+        for line in reply:
+            key, sep, value = line.partition("=")
+            if sep and key in keys:
+                # multi line values start with a line break
+                result[key] = value.strip("\n")
+        return result
+
+    async def get_bootstrap_phase(self) -> Optional[BootstrapPhase]:
+        info = await self.get_info("status/bootstrap-phase")
+        return parse_bootstrap_phase(info.get("status/bootstrap-phase", ""))
+
+    async def get_socks_listeners(self) -> list[str]:
+        info = await self.get_info("net/listeners/socks")
+        return [
+            listener.strip('"')
+            for listener in info.get("net/listeners/socks", "").split()
+        ]
+
+    async def add_onion(
+        self, ports: list[tuple[int, str]], key: Optional[str] = None
+    ) -> tuple[str, Optional[str]]:
+        """
+        Adds an ephemeral onion service which lives as long as this control connection.
+
+        ports are tuples of virtual port and target (host:port). key is the private key in the
+        KeyType:KeyBlob form returned by an earlier call. If it is None a new key gets created.
+        Returns the service id and the new private key or None if key was given.
+        """
+        port_args = " ".join(f"Port={virt_port},{target}" for virt_port, target in ports)
+        reply = await self.send_command(
+            f"ADD_ONION {key or 'NEW:ED25519-V3'} {port_args}"
+        )
+        values = {}
+        for line in reply:
+            name, sep, value = line.partition("=")
+            if sep:
+                values[name] = value
+        if "ServiceID" not in values:
+            raise TorControlError("551", "ADD_ONION reply does not contain a ServiceID")
+        return values["ServiceID"], values.get("PrivateKey", None)
+
+    async def del_onion(self, service_id: str):
+        await self.send_command(f"DEL_ONION {service_id}")
+
+    def add_event_listener(self, event: str, listener: Callable[[str], None]):
+        """listener gets called with the event line without the event name."""
+        self._event_listeners.setdefault(event, []).append(listener)
+
+    async def set_events(self, events: list[str]):
+        await self.send_command(f"SETEVENTS {' '.join(events)}")
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+            self._writer = None
+        if self._read_task is not None:
+            await asyncio.gather(self._read_task, return_exceptions=True)
+            self._read_task = None
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // Private
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    async def _read_loop(self):
+        try:
+            while True:
+                code, lines = await self._read_reply()
+                if code == "650":
+                    self._dispatch_event(lines)
+                elif code.startswith("2"):
+                    await self._pending_replies.put(lines)
+                else:
+                    await self._pending_replies.put(
+                        TorControlError(code, " ".join(lines))
+                    )
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            self.logger.info(f"Tor control connection closed: {e}")
+        finally:
+            # Do not leave a command waiting forever
+            await self._pending_replies.put(
+                ConnectionError("Tor control connection closed")
+            )
+
+    async def _read_reply(self) -> tuple[str, list[str]]:
+        lines = []
+        while True:
+            line = await self._read_line()
+            if len(line) < 4:
+                raise ConnectionError(f"Malformed reply line from tor: {line!r}")
+            code, separator, text = line[:3], line[3], line[4:]
+            if separator == "+":
+                # data reply, terminated by a line with a single dot
+                data_lines = []
+                while (data_line := await self._read_line()) != ".":
+                    data_lines.append(
+                        data_line[1:] if data_line.startswith(".") else data_line
+                    )
+                text = "\n".join([text] + data_lines)
+            lines.append(text)
+            if separator == " ":
+                return code, lines
+
+    async def _read_line(self) -> str:
+        line = await self._reader.readuntil(b"\n")
+        return line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    def _dispatch_event(self, lines: list[str]):
+        event, _, rest = lines[0].partition(" ")
+        for listener in self._event_listeners.get(event, []):
+            try:
+                listener(rest)
+            except Exception as e:
+                self.logger.error(f"Error in tor event listener for {event}", exc_info=e)
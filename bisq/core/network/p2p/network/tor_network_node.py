@@ -2,6 +2,7 @@ from python_socks import ProxyType
 from utils.aio import FutureCallback, as_future, get_asyncio_loop, run_in_thread, wait_future_blocking
 from asyncio import Future
 from bisq.core.network.p2p.network.limited_running_tor import LimitedRunningTor
+from bisq.core.network.p2p.network.shared_tor_manager import SharedTor
 from typing import TYPE_CHECKING, Optional
 from collections.abc import Callable
 from datetime import timedelta
@@ -148,6 +149,9 @@ class TorNetworkNode(NetworkNode):
                 if self.tor:
                     f = as_future(self.tor.quit())
                     self.tor = None
+                elif isinstance(self.tor_mode, SharedTor):
+                    # the shared tor keeps running for the other users
+                    f = as_future(self.tor_mode.remove_hidden_service())
                 self.logger.info(f"Tor shutdown completed at {get_time_ms()}")
             except Exception as e:
                 self.logger.error("Shutdown torNetworkNode failed with exception", exc_info=e)
@@ -171,6 +175,8 @@ class TorNetworkNode(NetworkNode):
         ts = get_time_ms()
         try:
             self.tor = await self.tor_mode.get_tor()
+            if isinstance(self.tor_mode, SharedTor):
+                self._socks_proxy = self.tor_mode.get_socks_proxy()
             
             def call_listeners():
                 for listener in self.setup_listeners:
@@ -184,6 +190,8 @@ class TorNetworkNode(NetworkNode):
             
             if isinstance(self.tor_mode, LimitedRunningTor):
                 self.hidden_service_socket._onion_hostname = self.tor_mode.hiddenservice_hostname
+            elif isinstance(self.tor_mode, SharedTor):
+                self.hidden_service_socket._onion_hostname = await self.tor_mode.publish_hidden_service(service_port, local_port)
             
             node_address = NodeAddress.from_full_address(f"{self.hidden_service_socket.service_name}:{self.hidden_service_socket.hidden_service_port}")
             self.node_address_property.set(node_address)
@@ -7,6 +7,7 @@ from bisq.core.network.p2p.network.localhost_network_node import LocalhostNetwor
 from bisq.core.network.p2p.network.network_node import NetworkNode
 from bisq.core.network.p2p.network.new_tor import NewTor
 from bisq.core.network.p2p.network.running_tor import RunningTor
+from bisq.core.network.p2p.network.shared_tor_manager import SharedTor
 from bisq.core.network.p2p.network.tor_network_node import TorNetworkNode
 from bisq.core.network.p2p.network.tor_mode import TorMode
 
@@ -16,6 +17,7 @@ if TYPE_CHECKING:
         BridgeAddressProvider,
     )
     from bisq.core.network.p2p.network.ban_filter import BanFilter
+    from bisq.core.network.p2p.network.shared_tor_manager import SharedTorManager
 
 
 class NetworkNodeProvider:
@@ -26,8 +28,12 @@ class NetworkNodeProvider:
         ban_filter: Optional["BanFilter"],
         config: "Config",
         tor_dir: Path,
+        shared_tor_manager: Optional["SharedTorManager"] = None,
+        user_id: str = "",
     ):
         self.tor_dir = tor_dir
+        self.shared_tor_manager = shared_tor_manager
+        self.user_id = user_id
         if config.use_localhost_for_p2p:
             self.network_node = LocalhostNetworkNode(
                 config.node_port,
@@ -51,6 +57,9 @@ class NetworkNodeProvider:
     def _get_tor_mode(
         self, bridge_address_provider: "BridgeAddressProvider", config: "Config"
     ) -> TorMode:
+        if self.shared_tor_manager is not None:
+            return SharedTor(self.shared_tor_manager, self.tor_dir, self.user_id)
+
         if config.tor_control_port != Config.UNSPECIFIED_PORT:
             return RunningTor(
                 self.tor_dir,
@@ -15,6 +15,7 @@ from utils.concurrency import AtomicBoolean, AtomicInt, ThreadSafeSet
 if TYPE_CHECKING:
     from bisq.core.network.p2p.network.network_node import NetworkNode
     from bisq.core.network.p2p.network.connection import Connection
+    from bisq.core.network.p2p.peers.broadcast_send_batcher import BroadcastSendBatcher
     from bisq.core.network.p2p.peers.broadcaster import BroadcastRequest
     from bisq.core.network.p2p.peers.peer_manager import PeerManager
 
@@ -45,11 +46,13 @@ class BroadcastHandler:
         network_node: "NetworkNode",
         peer_manager: "PeerManager",
         result_handler: "ResultHandler",
+        send_batcher: Optional["BroadcastSendBatcher"] = None,
     ):
         self.logger = get_ctx_logger(__name__)
         self._network_node = network_node
         self._peer_manager = peer_manager
         self._result_handler = result_handler
+        self._send_batcher = send_batcher
         self._uid = str(uuid.uuid4())
 
         self._stopped = AtomicBoolean(False)
@@ -93,52 +96,72 @@ class BroadcastHandler:
         self._setup_timeout_handler(broadcast_requests, delay, shutdown_requested)
 
         for i in range(self._num_peers_for_broadcast.get()):
-            min_delay = (i + 1) * delay
-            max_delay = (i + 2) * delay
+            min_delay = timedelta(milliseconds=(i + 1) * delay)
+            max_delay = timedelta(milliseconds=(i + 2) * delay)
             connection = confirmed_connections[i]
+            if self._send_batcher:
+                self._send_batcher.schedule(
+                    connection,
+                    self,
+                    broadcast_requests,
+                    min_delay,
+                    max_delay,
+                    executor,
+                )
+            else:
+                UserThread.run_after_random_delay(
+                    lambda c=connection: self._send_after_delay(
+                        c, broadcast_requests, executor
+                    ),
+                    min_delay,
+                    max_delay,
+                )
 
-            def send_after_delay():
-                if self._stopped:
-                    return
+    def _send_after_delay(
+        self,
+        connection: "Connection",
+        broadcast_requests: list["BroadcastRequest"],
+        executor: "ThreadPoolExecutor",
+    ):
+        broadcast_requests_for_connection = self.prepare_send(
+            connection, broadcast_requests
+        )
+        if not broadcast_requests_for_connection:
+            return
 
-                # We use broadcastRequests which have excluded the requests for messages the connection has
-                # originated to avoid sending back the message we received. We also remove messages not satisfying
-                # capability checks.
-                broadcast_requests_for_connection = (
-                    self._get_broadcast_requests_for_connection(
-                        connection, broadcast_requests
-                    )
-                )
+        try:
+            self._send_to_peer(connection, broadcast_requests_for_connection, executor)
+        except Exception as e:
+            self.logger.error(f"Exception at broadcast: {e}")
+            self._cleanup()
 
-                # Could be empty list...
-                if not broadcast_requests_for_connection:
-                    # We decrease numPeers in that case for making completion checks correct.
-                    if self._num_peers_for_broadcast.get() > 0:
-                        self._num_peers_for_broadcast.decrement_and_get()
-                    self._check_for_completion()
-                    return
-
-                if connection.stopped:
-                    # Connection has died in the meantime. We skip it.
-                    # We decrease numPeers in that case for making completion checks correct.
-                    if self._num_peers_for_broadcast.get() > 0:
-                        self._num_peers_for_broadcast.decrement_and_get()
-                    self._check_for_completion()
-                    return
-
-                try:
-                    self._send_to_peer(
-                        connection, broadcast_requests_for_connection, executor
-                    )
-                except Exception as e:
-                    self.logger.error(f"Exception at broadcast: {e}")
-                    self._cleanup()
-
-            UserThread.run_after_random_delay(
-                send_after_delay,
-                timedelta(milliseconds=min_delay),
-                timedelta(milliseconds=max_delay),
-            )
+    def prepare_send(
+        self, connection: "Connection", broadcast_requests: list["BroadcastRequest"]
+    ) -> list["BroadcastRequest"]:
+        """
+        Returns the requests to send to the connection once its delay has passed. If
+        there is nothing to send the peer does not count for the broadcast anymore.
+        """
+        if self._stopped:
+            return []
+
+        # We use broadcastRequests which have excluded the requests for messages the connection has
+        # originated to avoid sending back the message we received. We also remove messages not satisfying
+        # capability checks.
+        broadcast_requests_for_connection = self._get_broadcast_requests_for_connection(
+            connection, broadcast_requests
+        )
+
+        # Could be empty list...
+        # or the connection has died in the meantime. We skip it.
+        if not broadcast_requests_for_connection or connection.stopped:
+            # We decrease numPeers in that case for making completion checks correct.
+            if self._num_peers_for_broadcast.get() > 0:
+                self._num_peers_for_broadcast.decrement_and_get()
+            self._check_for_completion()
+            return []
+
+        return broadcast_requests_for_connection
 
     def cancel(self) -> None:
         self._cleanup()
@@ -225,48 +248,56 @@ class BroadcastHandler:
         future = self._network_node.send_message(
             connection, broadcast_message, executor
         )
-        self._send_message_futures.add(future)
-
-        def on_success(result: "Connection"):
-            self._num_completed_broadcasts.increment_and_get()
-            if self._stopped:
-                return
-            self._maybe_notify_listeners(broadcast_requests_for_connection)
-            self._check_for_completion()
-
-        def on_failure(e: Exception):
-            self.logger.warning(
-                f"Broadcast to {connection.peers_node_address} failed. ",
-                exc_info=(
-                    e if not isinstance(e, (ConnectionError, BrokenPipeError)) else None
+        self.track_send_future(future)
+        future.add_done_callback(
+            FutureCallback(
+                lambda result: self.on_sent(broadcast_requests_for_connection),
+                lambda e: self.on_send_failed(
+                    connection, broadcast_requests_for_connection, e
                 ),
             )
-            self._num_failed_broadcasts.increment_and_get()
+        )
 
-            if self._stopped:
-                return
+    def track_send_future(self, future: Future):
+        """The send gets cancelled if this handler completes before."""
+        self._send_message_futures.add(future)
 
-            self._maybe_notify_listeners(broadcast_requests_for_connection)
-            self._check_for_completion()
+    def on_sent(self, broadcast_requests_for_connection: list["BroadcastRequest"]):
+        self._num_completed_broadcasts.increment_and_get()
+        if self._stopped:
+            return
+        self._maybe_notify_listeners(broadcast_requests_for_connection)
+        self._check_for_completion()
 
-        future.add_done_callback(
-            FutureCallback(
-                on_success,
-                on_failure,
-            )
+    def on_send_failed(
+        self,
+        connection: "Connection",
+        broadcast_requests_for_connection: list["BroadcastRequest"],
+        e: Exception,
+    ):
+        self.logger.warning(
+            f"Broadcast to {connection.peers_node_address} failed. ",
+            exc_info=(
+                e if not isinstance(e, (ConnectionError, BrokenPipeError)) else None
+            ),
         )
+        self._num_failed_broadcasts.increment_and_get()
+
+        if self._stopped:
+            return
+
+        self._maybe_notify_listeners(broadcast_requests_for_connection)
+        self._check_for_completion()
 
     def _get_message(self, broadcast_requests: list["BroadcastRequest"]):
         if len(broadcast_requests) == 1:
             # If we only have 1 message we avoid the overhead of the BundleOfEnvelopes and send the message directly
             return broadcast_requests[0].message
         else:
-            return BundleOfEnvelopes(
-                envelopes=[
-                    broadcast_request.message
-                    for broadcast_request in broadcast_requests
-                ]
-            )
+            bundle = BundleOfEnvelopes()
+            for broadcast_request in broadcast_requests:
+                bundle.add(broadcast_request.message, broadcast_request.proto)
+            return bundle
 
     def _maybe_notify_listeners(self, broadcast_requests: list["BroadcastRequest"]):
         num_of_completed_broadcasts_target = max(
@@ -0,0 +1,127 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, Optional
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.common.timer import Timer
+from bisq.common.user_thread import UserThread
+from bisq.core.network.p2p.bundle_of_envelopes import BundleOfEnvelopes
+from utils.aio import FutureCallback
+
+if TYPE_CHECKING:
+    from bisq.core.network.p2p.network.connection import Connection
+    from bisq.core.network.p2p.network.network_node import NetworkNode
+    from bisq.core.network.p2p.peers.broadcast_handler import BroadcastHandler
+    from bisq.core.network.p2p.peers.broadcaster import BroadcastRequest
+
+
+class _PendingSend:
+    def __init__(self, connection: "Connection"):
+        self.connection = connection
+        self.contributions: list[tuple["BroadcastHandler", list["BroadcastRequest"]]] = []
+        self.size = 0
+        self.timer: Optional[Timer] = None
+
+    def add(self, handler: "BroadcastHandler", broadcast_requests: list["BroadcastRequest"]):
+        self.contributions.append((handler, broadcast_requests))
+        self.size += sum(request.size for request in broadcast_requests)
+
+
+class BroadcastSendBatcher:
+    """
+    Sends the bundles of concurrent broadcast handlers to the same connection as one
+    message.
+
+    Each handler staggers its sends to its peers with random delays. If another
+    handler already has a send to that connection waiting for its delay, the requests
+    are added to that send instead of scheduling one more timer and message. The
+    result of the send is reported to each participating handler for its own
+    requests, so the sufficiently broadcast accounting stays per handler.
+    """
+
+    def __init__(self, network_node: "NetworkNode", max_bundle_size_bytes: int):
+        self.logger = get_ctx_logger(__name__)
+        self._network_node = network_node
+        self._max_bundle_size_bytes = max_bundle_size_bytes
+        self._pending_sends: dict["Connection", _PendingSend] = {}
+
+    @property
+    def num_pending_sends(self) -> int:
+        return len(self._pending_sends)
+
+    def schedule(
+        self,
+        connection: "Connection",
+        handler: "BroadcastHandler",
+        broadcast_requests: list["BroadcastRequest"],
+        min_delay: timedelta,
+        max_delay: timedelta,
+        executor: ThreadPoolExecutor,
+    ):
+        size = sum(request.size for request in broadcast_requests)
+        pending = self._pending_sends.get(connection)
+        if pending is not None and pending.size + size <= self._max_bundle_size_bytes:
+            pending.add(handler, broadcast_requests)
+            return
+
+        # A full pending send still gets sent by its own timer
+        pending = _PendingSend(connection)
+        pending.add(handler, broadcast_requests)
+        self._pending_sends[connection] = pending
+        pending.timer = UserThread.run_after_random_delay(
+            lambda: self._send(pending, executor), min_delay, max_delay
+        )
+
+    def _send(self, pending: _PendingSend, executor: ThreadPoolExecutor):
+        connection = pending.connection
+        if self._pending_sends.get(connection) is pending:
+            del self._pending_sends[connection]
+
+        parts: list[tuple["BroadcastHandler", list["BroadcastRequest"]]] = []
+        for handler, broadcast_requests in pending.contributions:
+            requests_for_connection = handler.prepare_send(connection, broadcast_requests)
+            if requests_for_connection:
+                parts.append((handler, requests_for_connection))
+        if not parts:
+            return
+
+        requests = [
+            request
+            for _, requests_for_connection in parts
+            for request in requests_for_connection
+        ]
+        if len(requests) == 1:
+            # If we only have 1 message we avoid the overhead of the BundleOfEnvelopes
+            message = requests[0].message
+        else:
+            # The messages were serialized for their size already
+            message = BundleOfEnvelopes()
+            for request in requests:
+                message.add(request.message, request.proto)
+        try:
+            future = self._network_node.send_message(connection, message, executor)
+        except Exception as e:
+            self.logger.error(f"Exception at broadcast: {e}")
+            for handler, _ in parts:
+                handler.cancel()
+            return
+
+        if len(parts) == 1:
+            # Only a send nobody else waits for may get cancelled by its handler
+            parts[0][0].track_send_future(future)
+
+        def on_success(result: "Connection"):
+            for handler, requests_for_connection in parts:
+                handler.on_sent(requests_for_connection)
+
+        def on_failure(e: Exception):
+            for handler, requests_for_connection in parts:
+                handler.on_send_failed(connection, requests_for_connection, e)
+
+        future.add_done_callback(FutureCallback(on_success, on_failure))
+
+    def shut_down(self):
+        for pending in self._pending_sends.values():
+            if pending.timer:
+                pending.timer.stop()
+        self._pending_sends.clear()
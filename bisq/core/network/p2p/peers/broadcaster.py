@@ -7,12 +7,16 @@ from dataclasses import dataclass
 
 from bisq.common.timer import Timer
 from bisq.common.user_thread import UserThread
+from bisq.core.network.p2p.network.connection import Connection
 from bisq.core.network.p2p.node_address import NodeAddress
 from bisq.core.network.p2p.storage.messages.broadcast_message import BroadcastMessage
 from utils.concurrency import ThreadSafeSet
 from bisq.core.network.p2p.peers.broadcast_handler import BroadcastHandler
+from bisq.core.network.p2p.peers.broadcast_send_batcher import BroadcastSendBatcher
+from utils.time import get_time_ms
 
 if TYPE_CHECKING:
+    import pb_pb2 as protobuf
     from bisq.core.network.p2p.network.network_node import NetworkNode
     from bisq.core.network.p2p.peers.peer_manager import PeerManager
 
@@ -23,10 +27,25 @@ class BroadcastRequest:
     message: "BroadcastMessage"
     sender: Optional["NodeAddress"] = None
     listener: Optional["BroadcastHandler.Listener"] = None
+    # serialized size of the message
+    size: int = 0
+    # the message serialized for its size, reused when it gets bundled
+    proto: Optional["protobuf.NetworkEnvelope"] = None
 
 
 class Broadcaster(BroadcastHandler.ResultHandler):
+    """
+    Collects broadcast requests into bundles. A bundle gets sent at the latest
+    BROADCAST_INTERVAL_MS after its first request. The fuller the bundle gets (by number
+    of messages or bytes), the shorter the window, down to MIN_BROADCAST_INTERVAL_MS, and
+    a full bundle is sent right away. So bursts like offer republishing result in few
+    large bundles, while single messages still get bundled with what comes shortly after.
+    """
+
     BROADCAST_INTERVAL_MS = 2000
+    MIN_BROADCAST_INTERVAL_MS = 100
+    MAX_BUNDLE_SIZE_BYTES = Connection.PERMITTED_MESSAGE_SIZE
+    MAX_BUNDLE_MESSAGES = 1000
 
     def __init__(
         self,
@@ -39,7 +58,12 @@ class Broadcaster(BroadcastHandler.ResultHandler):
         self._peer_manager = peer_manager
         self._broadcast_handlers: ThreadSafeSet["BroadcastHandler"] = ThreadSafeSet()
         self._broadcast_requests: list["BroadcastRequest"] = []
+        self._queued_bytes = 0
         self._timer: Optional[Timer] = None
+        self._timer_due_ms = 0
+        self._send_batcher = BroadcastSendBatcher(
+            network_node, Broadcaster.MAX_BUNDLE_SIZE_BYTES
+        )
         self._shut_down_requested = False
         self._shut_down_result_handler: Optional[Callable[[], None]] = None
 
@@ -73,6 +97,7 @@ class Broadcaster(BroadcastHandler.ResultHandler):
         self._broadcast_handlers.clear()
         if self._timer:
             self._timer.stop()
+        self._send_batcher.shut_down()
         if self._shut_down_result_handler:
             self._shut_down_result_handler()
             self._shut_down_result_handler = None
@@ -87,17 +112,50 @@ class Broadcaster(BroadcastHandler.ResultHandler):
         sender: Optional["NodeAddress"] = None,
         listener: Optional["BroadcastHandler.Listener"] = None,
     ):
-        self._broadcast_requests.append(BroadcastRequest(message, sender, listener))
+        proto = message.to_proto_network_envelope()
+        size = proto.ByteSize()
+        if (
+            self._broadcast_requests
+            and self._queued_bytes + size > Broadcaster.MAX_BUNDLE_SIZE_BYTES
+        ):
+            # The message does not fit into the bundle anymore
+            self.maybe_broadcast_bundle()
+
+        self._broadcast_requests.append(
+            BroadcastRequest(message, sender, listener, size, proto)
+        )
+        self._queued_bytes += size
+
+        fill_ratio = max(
+            self._queued_bytes / Broadcaster.MAX_BUNDLE_SIZE_BYTES,
+            len(self._broadcast_requests) / Broadcaster.MAX_BUNDLE_MESSAGES,
+        )
+        if fill_ratio >= 1:
+            self.maybe_broadcast_bundle()
+            return
+
+        interval_ms = Broadcaster.MIN_BROADCAST_INTERVAL_MS + int(
+            (Broadcaster.BROADCAST_INTERVAL_MS - Broadcaster.MIN_BROADCAST_INTERVAL_MS)
+            * (1 - fill_ratio)
+        )
+        due_ms = get_time_ms() + interval_ms
         if not self._timer:
-            self._timer = UserThread.run_after(
-                self.maybe_broadcast_bundle,
-                timedelta(milliseconds=Broadcaster.BROADCAST_INTERVAL_MS),
-            )
+            self._schedule_bundle(interval_ms, due_ms)
+        elif due_ms + Broadcaster.MIN_BROADCAST_INTERVAL_MS <= self._timer_due_ms:
+            # The window only gets shorter, and we do not restart the timer for small changes
+            self._timer.stop()
+            self._schedule_bundle(interval_ms, due_ms)
+
+    def _schedule_bundle(self, interval_ms: int, due_ms: int):
+        self._timer_due_ms = due_ms
+        self._timer = UserThread.run_after(
+            self.maybe_broadcast_bundle, timedelta(milliseconds=interval_ms)
+        )
 
     def maybe_broadcast_bundle(self) -> None:
         if self._broadcast_requests:
             broadcast_handler = BroadcastHandler(
-                self._network_node, self._peer_manager, self
+                self._network_node, self._peer_manager, self, self._send_batcher
             )
             self._broadcast_handlers.add(broadcast_handler)
             broadcast_handler.broadcast(
@@ -106,6 +164,7 @@ class Broadcaster(BroadcastHandler.ResultHandler):
                 self._executor,
             )
             self._broadcast_requests.clear()
+            self._queued_bytes = 0
 
             if self._timer:
                 self._timer.stop()
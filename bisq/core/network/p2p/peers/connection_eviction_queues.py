@@ -0,0 +1,149 @@
+from collections.abc import Callable
+from enum import Enum
+import heapq
+import itertools
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from bisq.core.network.p2p.network.inbound_connection import InboundConnection
+from bisq.core.network.p2p.network.peer_type import PeerType
+
+if TYPE_CHECKING:
+    from bisq.core.network.p2p.network.connection import Connection
+
+
+class EvictionCategory(Enum):
+    """The groups of connections PeerManager closes from when it has too many connections."""
+
+    INBOUND_PEER = 0
+    PEER = 1
+    INITIAL_DATA_EXCHANGE = 2
+    ANY = 3
+
+    def contains(self, connection: "Connection") -> bool:
+        peer_type = connection.connection_state.peer_type
+        if self is EvictionCategory.INBOUND_PEER:
+            return (
+                isinstance(connection, InboundConnection)
+                and peer_type == PeerType.PEER
+            )
+        if self is EvictionCategory.PEER:
+            return peer_type == PeerType.PEER
+        if self is EvictionCategory.INITIAL_DATA_EXCHANGE:
+            return peer_type == PeerType.INITIAL_DATA_EXCHANGE
+        return True
+
+    def get_sort_key(self, connection: "Connection") -> int:
+        if self is EvictionCategory.INITIAL_DATA_EXCHANGE:
+            return connection.connection_state.last_initial_data_msg_timestamp
+        return connection.statistic.last_activity_timestamp
+
+
+class _HeapEntry:
+    __slots__ = ("key", "seq", "connection")
+
+    def __init__(self, key: int, seq: int, connection: "Connection"):
+        self.key = key
+        self.seq = seq
+        self.connection = connection
+
+    def __lt__(self, other: "_HeapEntry") -> bool:
+        return (self.key, self.seq) < (other.key, other.seq)
+
+
+class ConnectionEvictionQueues:
+    """
+    Keeps the connections per eviction category in a min heap ordered by the time of
+    their last activity (or last initial data message), so the peer manager gets the
+    oldest candidate without filtering and sorting all connections each time.
+
+    Connections report changes of their activity timestamp and peer type. Changed
+    connections are only marked dirty and get re-queued at the next lookup, so the busy
+    message path stays O(1). Entries of outdated positions stay in the heaps and are
+    skipped when they come up.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._heaps: dict[EvictionCategory, list[_HeapEntry]] = {
+            category: [] for category in EvictionCategory
+        }
+        # the sequence number of the valid heap entry per category and connection
+        self._entries: dict[EvictionCategory, dict["Connection", int]] = {
+            category: {} for category in EvictionCategory
+        }
+        self._subscriptions: dict["Connection", list[Callable[[], None]]] = {}
+        self._dirty: set["Connection"] = set()
+        self._counter = itertools.count()
+
+    def add(self, connection: "Connection"):
+        with self._lock:
+            if connection in self._subscriptions:
+                return
+            on_changed = lambda: self.on_changed(connection)
+            self._subscriptions[connection] = [
+                connection.statistic.add_last_activity_listener(on_changed),
+                connection.connection_state.add_change_listener(on_changed),
+            ]
+            self._dirty.add(connection)
+
+    def remove(self, connection: "Connection"):
+        with self._lock:
+            unsubscribes = self._subscriptions.pop(connection, None)
+            if unsubscribes is None:
+                return
+            for unsubscribe in unsubscribes:
+                unsubscribe()
+            self._dirty.discard(connection)
+            for entries in self._entries.values():
+                entries.pop(connection, None)
+
+    def on_changed(self, connection: "Connection"):
+        with self._lock:
+            if connection in self._subscriptions:
+                self._dirty.add(connection)
+
+    def count(self, category: EvictionCategory) -> int:
+        with self._lock:
+            self._requeue_dirty()
+            return len(self._entries[category])
+
+    def get_oldest(self, category: EvictionCategory) -> Optional["Connection"]:
+        with self._lock:
+            self._requeue_dirty()
+            heap = self._heaps[category]
+            entries = self._entries[category]
+            while heap:
+                entry = heap[0]
+                if entries.get(entry.connection) == entry.seq:
+                    if not entry.connection.stopped.get():
+                        return entry.connection
+                    # stopped, but its on_disconnect has not removed it yet
+                    del entries[entry.connection]
+                heapq.heappop(heap)
+            return None
+
+    def _requeue_dirty(self):
+        for connection in self._dirty:
+            for category in EvictionCategory:
+                entries = self._entries[category]
+                if category.contains(connection):
+                    seq = next(self._counter)
+                    entries[connection] = seq
+                    heapq.heappush(
+                        self._heaps[category],
+                        _HeapEntry(category.get_sort_key(connection), seq, connection),
+                    )
+                else:
+                    entries.pop(connection, None)
+        self._dirty.clear()
+        for category, heap in self._heaps.items():
+            entries = self._entries[category]
+            if len(heap) > 2 * len(entries) + 64:
+                self._heaps[category] = [
+                    entry for entry in heap if entries.get(entry.connection) == entry.seq
+                ]
+                heapq.heapify(self._heaps[category])
+
+    def __len__(self):
+        return len(self._subscriptions)
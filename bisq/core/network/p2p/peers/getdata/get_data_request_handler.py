@@ -19,6 +19,9 @@ if TYPE_CHECKING:
     from bisq.core.network.p2p.peers.getdata.messages.get_data_request import (
         GetDataRequest,
     )
+    from bisq.core.network.p2p.peers.getdata.messages.get_data_response import (
+        GetDataResponse,
+    )
 
 
 class GetDataRequestHandler:
@@ -59,13 +62,24 @@ class GetDataRequestHandler:
 
         was_persistable_network_payloads_truncated = AtomicBoolean()
         was_protected_storage_entries_truncated = AtomicBoolean()
-        data_response = self.data_storage.build_get_data_response(
-            get_data_request,
-            GetDataRequestHandler.MAX_ENTRIES,
-            was_persistable_network_payloads_truncated,
-            was_protected_storage_entries_truncated,
-            connection.capabilities,
-        )
+        if get_data_request.supports_split_response:
+            data_responses = self.data_storage.build_get_data_response_parts(
+                get_data_request,
+                GetDataRequestHandler.MAX_ENTRIES,
+                was_persistable_network_payloads_truncated,
+                was_protected_storage_entries_truncated,
+                connection.capabilities,
+            )
+        else:
+            data_responses = [
+                self.data_storage.build_get_data_response(
+                    get_data_request,
+                    GetDataRequestHandler.MAX_ENTRIES,
+                    was_persistable_network_payloads_truncated,
+                    was_protected_storage_entries_truncated,
+                    connection.capabilities,
+                )
+            ]
 
         if was_persistable_network_payloads_truncated.get():
             self.logger.info(
@@ -77,7 +91,12 @@ class GetDataRequestHandler:
             )
 
         self.logger.info(
-            f"The getDataResponse to peer with {connection_info} contains {len(data_response.data_set)} ProtectedStorageEntries and {len(data_response.persistable_network_payload_set)} PersistableNetworkPayloads"
+            f"The getDataResponse to peer with {connection_info} contains {sum(len(r.data_set) for r in data_responses)} ProtectedStorageEntries and {sum(len(r.persistable_network_payload_set) for r in data_responses)} PersistableNetworkPayloads"
+            + (
+                f" in {len(data_responses)} messages"
+                if len(data_responses) > 1
+                else ""
+            )
         )
 
         if self.timeout_timer is None:
@@ -95,6 +114,19 @@ class GetDataRequestHandler:
                 timedelta(seconds=GetDataRequestHandler.TIMEOUT_SEC),
             )
 
+        self._send_data_response(data_responses, 0, 0, connection)
+        self.logger.info(f"handle GetDataRequest took {get_time_ms() - ts} ms")
+
+    def _send_data_response(
+        self,
+        data_responses: list["GetDataResponse"],
+        index: int,
+        serialized_size: int,
+        connection: "Connection",
+    ):
+        # The parts of a split response are sent one after the other, so only one of them is held
+        # in the send queue of the connection at a time.
+        data_response = data_responses[index]
         future = self.network_node.send_message(connection, data_response)
 
         def on_success(r):
@@ -104,10 +136,17 @@ class GetDataRequestHandler:
                 self.logger.trace(
                     f"Send DataResponse to {connection.peers_node_address} succeeded. getDataResponse={data_response}"
                 )
-                self.listener.on_complete(
-                    data_response.to_proto_network_envelope().ByteSize()
+                size = (
+                    serialized_size
+                    + data_response.to_proto_network_envelope().ByteSize()
                 )
-                self._cleanup()
+                if index + 1 < len(data_responses):
+                    self._send_data_response(
+                        data_responses, index + 1, size, connection
+                    )
+                else:
+                    self.listener.on_complete(size)
+                    self._cleanup()
 
         def on_failure(e):
             if not self.stopped:
@@ -126,7 +165,6 @@ class GetDataRequestHandler:
                 on_failure,
             )
         )
-        self.logger.info(f"handle GetDataRequest took {get_time_ms() - ts} ms")
 
     def stop(self):
         self._cleanup()
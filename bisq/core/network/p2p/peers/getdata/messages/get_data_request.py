@@ -14,4 +14,7 @@ class GetDataRequest(NetworkEnvelope, ExtendedDataSizePermission, InitialDataReq
     excluded_keys: set[bytes] = field(default_factory=raise_required)
     # Added at v1.4.0
     # The version of the requester. Used for response to send potentially missing historical data
-    version: Optional[str] = field(default=Version.VERSION)
\ No newline at end of file
+    version: Optional[str] = field(default=Version.VERSION)
+    # Specific to bisq light client
+    # The requester accepts a response split into several GetDataResponse messages
+    supports_split_response: bool = field(default=False)
@@ -1,5 +1,5 @@
 from bisq.common.setup.log_setup import get_ctx_logger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass, field
 
 from bisq.common.capabilities import Capabilities
@@ -37,17 +37,33 @@ class GetDataResponse(NetworkEnvelope, SupportedCapabilitiesMessage, ExtendedDat
     # Added at v1.9.6
     was_truncated: bool = field(default_factory=raise_required)
 
+    # Specific to bisq light client
+    # Set at all but the last message of a response which got split into several messages
+    has_more_parts: bool = field(default=False)
+
+    # The protobuf messages of data_set and persistable_network_payload_set if they got serialized
+    # already while building the response, so they are not serialized a second time for sending
+    serialized_data_set: Optional[list[protobuf.StorageEntryWrapper]] = field(default=None, compare=False, repr=False)
+    serialized_persistable_network_payload_items: Optional[list[protobuf.PersistableNetworkPayload]] = field(default=None, compare=False, repr=False)
+
     def __post_init__(self):
         self.logger = get_ctx_logger(__name__)
 
     def to_proto_network_envelope(self) -> protobuf.NetworkEnvelope:
+        data_set = self.serialized_data_set
+        if data_set is None:
+            data_set = [entry.to_proto_message() for entry in self.data_set]
+        persistable_network_payload_items = self.serialized_persistable_network_payload_items
+        if persistable_network_payload_items is None:
+            persistable_network_payload_items = [payload.to_proto_message() for payload in self.persistable_network_payload_set]
         get_data_response = protobuf.GetDataResponse(
-            data_set=[entry.to_proto_message() for entry in self.data_set],
-            persistable_network_payload_items = [payload.to_proto_message() for payload in self.persistable_network_payload_set],
+            data_set=data_set,
+            persistable_network_payload_items = persistable_network_payload_items,
             request_nonce = self.request_nonce,
             is_get_updated_data_response = self.is_get_updated_data_response,
             was_truncated = self.was_truncated,
-            supported_capabilities = self.supported_capabilities.to_int_list()
+            supported_capabilities = Capabilities.to_int_list(self.supported_capabilities),
+            has_more_parts = self.has_more_parts,
         )
 
         network_envelope = self.get_network_envelope_builder()
@@ -60,7 +76,7 @@ class GetDataResponse(NetworkEnvelope, SupportedCapabilitiesMessage, ExtendedDat
     def from_proto(proto: 'protobuf.GetDataResponse', resolver: 'NetworkProtoResolver', message_version: int) -> 'GetDataResponse':
         was_truncated = proto.was_truncated
         logger = get_ctx_logger(__name__)
-        logger.info(f"\n\n<< Received a GetDataResponse with {readable_file_size(proto.ByteSize())} {' (still data missing)' if was_truncated else ' (all data received)'}\n")
+        logger.info(f"\n\n<< Received a GetDataResponse with {readable_file_size(proto.ByteSize())} {' (more parts follow)' if proto.has_more_parts else ' (still data missing)' if was_truncated else ' (all data received)'}\n")
         
         data_set = frozenset(
             resolver.from_proto(entry) for entry in proto.data_set
@@ -78,6 +94,7 @@ class GetDataResponse(NetworkEnvelope, SupportedCapabilitiesMessage, ExtendedDat
             is_get_updated_data_response=proto.is_get_updated_data_response,
             supported_capabilities=Capabilities.from_int_list(proto.supported_capabilities),
             was_truncated=was_truncated,
+            has_more_parts=proto.has_more_parts,
         )
 
     def associated_request(self) -> type:
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 from bisq.common.protocol.proto_util import ProtoUtil
 from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.core.network.p2p.node_address import NodeAddress
 from bisq.core.network.p2p.peers.getdata.messages.get_data_request import GetDataRequest
 from bisq.core.network.p2p.senders_node_address_message import SendersNodeAddressMessage
 import pb_pb2 as protobuf
@@ -10,7 +11,6 @@ from utils.data import raise_required
 
 if TYPE_CHECKING:
     from bisq.common.protocol.network.network_envelope import NetworkEnvelope
-    from bisq.core.network.p2p.node_address import NodeAddress
 
 
 
@@ -27,6 +27,7 @@ class GetUpdatedDataRequest(GetDataRequest, SendersNodeAddressMessage):
             nonce=self.nonce,
             excluded_keys=self.excluded_keys,
             version=self.version,
+            supports_split_response=self.supports_split_response,
         )
         envelope = self.get_network_envelope_builder()
         envelope.get_updated_data_request.CopyFrom(get_updated_data_request)
@@ -56,4 +57,5 @@ class GetUpdatedDataRequest(GetDataRequest, SendersNodeAddressMessage):
             excluded_keys=excluded_keys,
             version=requesters_version,
             sender_node_address=NodeAddress.from_proto(proto.sender_node_address),
+            supports_split_response=proto.supports_split_response,
         )
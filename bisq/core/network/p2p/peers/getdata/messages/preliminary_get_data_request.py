@@ -31,6 +31,7 @@ class PreliminaryGetDataRequest(
                 self.supported_capabilities
             ),
             version=self.version,
+            supports_split_response=self.supports_split_response,
         )
         envelope = self.get_network_envelope_builder()
         envelope.preliminary_get_data_request.CopyFrom(request)
@@ -58,4 +59,5 @@ class PreliminaryGetDataRequest(
             excluded_keys=excluded_keys,
             version=requesters_version,
             supported_capabilities=supported_capabilities,
+            supports_split_response=proto.supports_split_response,
         )
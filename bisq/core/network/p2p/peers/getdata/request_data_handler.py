@@ -164,8 +164,8 @@ class RequestDataHandler(MessageListener):
                     get_data_response = network_envelope
                     self._log_contents(get_data_response)
                     if get_data_response.request_nonce == self._nonce:
-                        self._stop_timeout_timer()
                         if not connection.peers_node_address:
+                            self._stop_timeout_timer()
                             self.logger.error(
                                 "RequestDataHandler.onMessage: connection.peers_node_address must be present at that moment"
                             )
@@ -174,8 +174,16 @@ class RequestDataHandler(MessageListener):
                         self._data_storage.process_get_data_response(
                             get_data_response, connection.peers_node_address
                         )
-                        self._cleanup()
-                        self._listener.on_complete(get_data_response.was_truncated)
+                        if get_data_response.has_more_parts:
+                            # The timeout covers all parts of a split response
+                            self.logger.info(
+                                "We wait for the next part of the GetDataResponse"
+                            )
+                        else:
+                            self._cleanup()
+                            self._listener.on_complete(
+                                get_data_response.was_truncated
+                            )
                     else:
                         self.logger.warning(
                             f"Nonce not matching. That can happen rarely if we get a response after a canceled "
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from concurrent.futures import Future
 from datetime import timedelta
 from bisq.common.setup.log_setup import get_ctx_logger
-from bisq.common.user_thread import UserThread
+from bisq.common.timing_wheel import TimingWheel
 from bisq.core.network.p2p.network.message_listener import MessageListener
 from typing import TYPE_CHECKING, Optional
 from bisq.core.network.p2p.peers.keepalive.messages.ping import Ping
@@ -31,12 +31,13 @@ class KeepAliveHandler(MessageListener):
         def on_fault(self_, error_message: str):
             pass
     
-    def __init__(self, network_node: "NetworkNode", peer_manager: "PeerManager", listener: "Listener") -> None:
+    def __init__(self, network_node: "NetworkNode", peer_manager: "PeerManager", listener: "Listener", timing_wheel: Optional["TimingWheel"] = None) -> None:
         super().__init__()
         self.logger = get_ctx_logger(__name__)
         self.network_node: "NetworkNode" = network_node
         self.peer_manager: "PeerManager" = peer_manager
         self.listener: "KeepAliveHandler.Listener" = listener
+        self.timing_wheel = timing_wheel or TimingWheel.get_default()
         self.nonce: int = next_random_int()
         self.connection: Optional["Connection"] = None
         self.stopped: bool = False
@@ -53,7 +54,7 @@ class KeepAliveHandler(MessageListener):
 
     def send_ping_after_random_delay(self, connection: "Connection") -> None:
         # run randomly between 1 ms and 10 seconds
-        self.delay_timer = UserThread.run_after_random_delay(lambda: self.send_ping(connection), timedelta(milliseconds=1), timedelta(milliseconds=KeepAliveHandler.MAX_DELAY_MS))
+        self.delay_timer = self.timing_wheel.run_after_random_delay(lambda: self.send_ping(connection), timedelta(milliseconds=1), timedelta(milliseconds=KeepAliveHandler.MAX_DELAY_MS))
 
     def send_ping(self, connection: "Connection") -> None:
         if not self.stopped:
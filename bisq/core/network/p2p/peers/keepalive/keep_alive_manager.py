@@ -3,7 +3,7 @@ from bisq.common.setup.log_setup import get_ctx_logger
 import random
 from typing import TYPE_CHECKING, Optional
 from bisq.common.protocol.network.network_envelope import NetworkEnvelope
-from bisq.common.user_thread import UserThread
+from bisq.common.timing_wheel import TimingWheel
 from bisq.core.network.p2p.network.close_connection_reason import CloseConnectionReason
 from bisq.core.network.p2p.network.connection import Connection
 from bisq.core.network.p2p.network.connection_listener import ConnectionListener
@@ -25,10 +25,12 @@ class KeepAliveManager(MessageListener, ConnectionListener, PeerManager.Listener
     INTERVAL_SEC = random.randint(0, 30) + 30
     LAST_ACTIVITY_AGE_MS = INTERVAL_SEC * 1000 / 2
 
-    def __init__(self, network_node: "NetworkNode", peer_manager: PeerManager) -> None:
+    def __init__(self, network_node: "NetworkNode", peer_manager: PeerManager, timing_wheel: Optional["TimingWheel"] = None) -> None:
         self.logger = get_ctx_logger(__name__)
         self.network_node: "NetworkNode" = network_node
         self.peer_manager: PeerManager = peer_manager
+        # Shared with the keep alive handlers and other users, so the timers of all connections share wakeups
+        self.timing_wheel = timing_wheel or TimingWheel.get_default()
         self.handler_map: dict[str, "KeepAliveHandler"] = {}
         
         self.stopped: bool = False
@@ -60,7 +62,7 @@ class KeepAliveManager(MessageListener, ConnectionListener, PeerManager.Listener
 
     def on_message(self, network_envelope: "NetworkEnvelope", connection: "Connection") -> None:
         if isinstance(network_envelope, Ping):
-            if self.stopped:
+            if not self.stopped:
                 ping = network_envelope
                 
                 # We get from peer last measured rrt
@@ -122,7 +124,7 @@ class KeepAliveManager(MessageListener, ConnectionListener, PeerManager.Listener
                 self.stopped = False
                 self.keep_alive()
             
-            self.keep_alive_timer = UserThread.run_periodically(keep_alive_task, timedelta(seconds=KeepAliveManager.INTERVAL_SEC))
+            self.keep_alive_timer = self.timing_wheel.run_periodically(keep_alive_task, timedelta(seconds=KeepAliveManager.INTERVAL_SEC))
 
     def keep_alive(self) -> None:
         if not self.stopped:
@@ -144,7 +146,8 @@ class KeepAliveManager(MessageListener, ConnectionListener, PeerManager.Listener
                         keep_alive_handler = KeepAliveHandler(
                             self.network_node, 
                             self.peer_manager,
-                            KeepAliveListener(uid)
+                            KeepAliveListener(uid),
+                            self.timing_wheel,
                         )
                         self.handler_map[uid] = keep_alive_handler
                         keep_alive_handler.send_ping_after_random_delay(connection)
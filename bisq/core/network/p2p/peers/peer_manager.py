@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+import logging
 from bisq.common.setup.log_setup import get_ctx_logger
-import random
 from datetime import timedelta
 from typing import Optional, TYPE_CHECKING
 
@@ -13,10 +13,14 @@ from bisq.common.timer import Timer
 from bisq.common.user_thread import UserThread
 from bisq.core.network.p2p.network.close_connection_reason import CloseConnectionReason
 from bisq.core.network.p2p.network.connection_listener import ConnectionListener
-from bisq.core.network.p2p.network.inbound_connection import InboundConnection
 from bisq.core.network.p2p.network.peer_type import PeerType
 from bisq.core.network.p2p.network.rule_violation import RuleViolation
+from bisq.core.network.p2p.peers.connection_eviction_queues import (
+    ConnectionEvictionQueues,
+    EvictionCategory,
+)
 from bisq.core.network.p2p.peers.peerexchange.peer_list import PeerList
+from bisq.core.network.p2p.peers.peerexchange.peer_registry import PeerRegistry
 from utils.concurrency import ThreadSafeSet
 from utils.preconditions import check_argument
 from utils.time import get_time_ms
@@ -87,9 +91,12 @@ class PeerManager(ConnectionListener, PersistedDataHost):
         self._peer_list = PeerList()
 
         # Peers we got reported from other peers
-        self._reported_peers = ThreadSafeSet["Peer"]()
+        self._reported_peers = PeerRegistry()
         # Most recent peers with activity date of last 30 min.
-        self._latest_live_peers = ThreadSafeSet["Peer"]()
+        self._latest_live_peers = PeerRegistry()
+
+        # Connections ordered by last activity per group we close connections from
+        self._eviction_candidates = ConnectionEvictionQueues()
 
         self._check_max_connections_timer: Timer = None
         self._stopped = False
@@ -103,6 +110,9 @@ class PeerManager(ConnectionListener, PersistedDataHost):
             self._peer_list, PersistenceManagerSource.PRIVATE_LOW_PRIO
         )
         self._network_node.add_connection_listener(self)
+        # later connections get added and removed by on_connection and on_disconnect
+        for connection in self._network_node.get_all_connections():
+            self._eviction_candidates.add(connection)
 
         # we check if app was idle for more then 5 sec.
         class Listener(ClockWatcherListener):
@@ -189,6 +199,7 @@ class PeerManager(ConnectionListener, PersistedDataHost):
     def on_connection(self, connection: "Connection"):
         connection.connection_state.is_seed_node = self.is_seed_node(connection.peers_node_address)
 
+        self._eviction_candidates.add(connection)
         self._do_housekeeping()
 
         self._num_on_connections += 1
@@ -214,6 +225,7 @@ class PeerManager(ConnectionListener, PersistedDataHost):
         self.logger.debug(
             f"on_disconnect called: node_address={connection.peers_node_address}, reason={close_connection_reason}"
         )
+        self._eviction_candidates.remove(connection)
         self.handle_connection_fault(connection=connection)
 
         previous_lost_all_connections = self._lost_all_connections
@@ -327,23 +339,24 @@ class PeerManager(ConnectionListener, PersistedDataHost):
     # ///////////////////////////////////////////////////////////////////////////////////////////
 
     def find_peer(self, node_address: "NodeAddress") -> Optional["Peer"]:
-        return next(
-            (
-                peer
-                for peer in self.get_all_peers()
-                if peer.node_address == node_address
-            ),
-            None,
-        )
+        for peers in self._get_peer_registries():
+            peer = peers.get(node_address)
+            if peer:
+                return peer
+        return None
 
     def get_all_peers(self):
         return (
             self.get_live_peers()
-            .union(self.get_persisted_peers())
-            .union(self._reported_peers)
+            .copy()
+            .union(self.get_persisted_peers().copy())
+            .union(self._reported_peers.copy())
         )
 
-    def get_persisted_peers(self):
+    def _get_peer_registries(self) -> tuple[PeerRegistry, PeerRegistry, PeerRegistry]:
+        return self._latest_live_peers, self.get_persisted_peers(), self._reported_peers
+
+    def get_persisted_peers(self) -> PeerRegistry:
         return self._peer_list.set
 
     # TODO: replace usages with prop access
@@ -388,23 +401,21 @@ class PeerManager(ConnectionListener, PersistedDataHost):
 
     # Delivers the live peers from the last 30 min (MAX_AGE_LIVE_PEERS)
     # We include older peers to avoid risks for network partitioning
-    def get_live_peers(self, excluded_node_address: Optional["NodeAddress"] = None):
+    def get_live_peers(
+        self, excluded_node_address: Optional["NodeAddress"] = None
+    ) -> PeerRegistry:
         old_num_latest_live_peers = len(self._latest_live_peers)
 
-        peers = self._latest_live_peers.copy()
-
-        current_live_peers = {
+        # Peers we know already keep their date, the new ones get added
+        self._latest_live_peers.update(
             peer
             for peer in self._get_connected_reported_peers()
-            if not self.is_seed_node(peer)
+            if not self.is_seed_node(peer.node_address)
             and peer.node_address != excluded_node_address
-        }
-        peers.update(current_live_peers)
-
-        max_age = get_time_ms() - PeerManager.MAX_AGE_LIVE_PEERS
-        self._latest_live_peers.clear()
-        recent_peers = {peer for peer in peers if peer.date > max_age}
-        self._latest_live_peers.update(recent_peers)
+        )
+        self._latest_live_peers.remove_older_than(
+            get_time_ms() - PeerManager.MAX_AGE_LIVE_PEERS + 1
+        )
 
         if old_num_latest_live_peers != len(self._latest_live_peers):
             self.logger.info(f"Num of latest_live_peers={len(self._latest_live_peers)}")
@@ -437,10 +448,16 @@ class PeerManager(ConnectionListener, PersistedDataHost):
         # inefficient.
         # Also this risk is only for not updated peers, so in case that would be abused for an
         # attack all users have a strong incentive to update ;-).
-        for peer in self.get_all_peers():
-            if peer.node_address == node_address:
-                return peer.capabilities
-        return None
+        peer = self.find_peer(node_address)
+        return peer.capabilities if peer else None
+
+    def _find_known_capabilities(
+        self, node_address: "NodeAddress"
+    ) -> Optional["Capabilities"]:
+        # Looks up the capabilities we got set from any of the persisted or reported peers
+        return self.get_persisted_peers().find_capabilities(
+            node_address
+        ) or self._reported_peers.find_capabilities(node_address)
 
     def _apply_capabilities(
         self, connection: "Connection", new_capabilities: "Capabilities"
@@ -450,10 +467,9 @@ class PeerManager(ConnectionListener, PersistedDataHost):
 
         node_address = connection.peers_node_address
         if node_address:
-            for peer in self.get_all_peers():
-                if peer.node_address == node_address and peer.capabilities.has_less(
-                    new_capabilities
-                ):
+            for peers in self._get_peer_registries():
+                peer = peers.get(node_address)
+                if peer and peer.capabilities.has_less(new_capabilities):
                     peer.capabilities = new_capabilities
         self._request_persistence()
 
@@ -503,17 +519,10 @@ class PeerManager(ConnectionListener, PersistedDataHost):
             "We have too many connections open. "
             "Lets try first to remove the inbound connections of type PEER."
         )
-        candidates = sorted(
-            [
-                conn
-                for conn in all_connections
-                if isinstance(conn, InboundConnection)
-                and conn.connection_state.peer_type == PeerType.PEER
-            ],
-            key=lambda x: x.statistic.last_activity_timestamp,
-        )
+        category = EvictionCategory.INBOUND_PEER
+        connection = self._eviction_candidates.get_oldest(category)
 
-        if not candidates:
+        if not connection:
             self.logger.info(
                 "No candidates found. We check if we exceed our "
                 f"out_bound_peer_trigger of {self._out_bound_peer_trigger}"
@@ -529,16 +538,10 @@ class PeerManager(ConnectionListener, PersistedDataHost):
                 f"We have exceeded out_bound_peer_trigger of {self._out_bound_peer_trigger}. "
                 "Lets try to remove outbound connection of type PEER."
             )
-            candidates = sorted(
-                [
-                    conn
-                    for conn in all_connections
-                    if conn.connection_state.peer_type == PeerType.PEER
-                ],
-                key=lambda x: x.statistic.last_activity_timestamp,
-            )
+            category = EvictionCategory.PEER
+            connection = self._eviction_candidates.get_oldest(category)
 
-            if not candidates:
+            if not connection:
                 self.logger.info(
                     "No candidates found. We check if we exceed our "
                     f"initial_data_exchange_trigger of {self._initial_data_exchange_trigger}"
@@ -554,17 +557,10 @@ class PeerManager(ConnectionListener, PersistedDataHost):
                     f"We have exceeded initial_data_exchange_trigger of {self._initial_data_exchange_trigger}. "
                     "Lets try to remove the oldest INITIAL_DATA_EXCHANGE connection"
                 )
-                candidates = sorted(
-                    [
-                        conn
-                        for conn in all_connections
-                        if conn.connection_state.peer_type
-                        == PeerType.INITIAL_DATA_EXCHANGE
-                    ],
-                    key=lambda x: x.connection_state.last_initial_data_msg_timestamp,
-                )
+                category = EvictionCategory.INITIAL_DATA_EXCHANGE
+                connection = self._eviction_candidates.get_oldest(category)
 
-                if not candidates:
+                if not connection:
                     self.logger.info(
                         "No candidates found. We check if we exceed our "
                         f"max_connections_absolute of {self._max_connections_absolute}"
@@ -578,17 +574,16 @@ class PeerManager(ConnectionListener, PersistedDataHost):
                     self.logger.info(
                         "We reached abs. max. connections. Lets try to remove ANY connection."
                     )
-                    candidates = sorted(
-                        all_connections,
-                        key=lambda x: x.statistic.last_activity_timestamp,
-                    )
+                    category = EvictionCategory.ANY
+                    connection = self._eviction_candidates.get_oldest(category)
 
-        if candidates:
-            connection = candidates.pop(0)
+        if connection:
             self.logger.info(
-                f"check_max_connections: Num candidates (inbound/peer) for shut down={len(candidates)}. We close oldest connection to peer {connection.peers_node_address}"
+                f"check_max_connections: Num candidates ({category.name.lower()}) for shut down={self._eviction_candidates.count(category) - 1}. We close oldest connection to peer {connection.peers_node_address}"
             )
-            if not connection.stopped:
+            if not connection.stopped.get():
+                # we do not wait for on_disconnect, so the next check does not pick it again
+                self._eviction_candidates.remove(connection)
                 connection.shut_down(
                     CloseConnectionReason.TOO_MANY_CONNECTIONS_OPEN,
                     lambda: UserThread.run_after(
@@ -637,25 +632,14 @@ class PeerManager(ConnectionListener, PersistedDataHost):
     def _remove_reported_peer_address(self, node_address: "NodeAddress"):
         if not node_address:
             return
-        peer = next(
-            (
-                peer
-                for peer in self._reported_peers
-                if peer.node_address == node_address
-            ),
-            None,
-        )
-        if peer:
-            self._remove_reported_peer(peer)
+        if self._reported_peers.remove(node_address):
+            self._print_reported_peers()
 
     def _remove_too_old_reported_peers(self):
-        old_peers = {
-            peer
-            for peer in self._reported_peers
-            if get_time_ms() - peer.date > PeerManager.MAX_AGE
-        }
-        for peer in old_peers:
-            self._remove_reported_peer(peer)
+        if self._reported_peers.remove_older_than(
+            get_time_ms() - PeerManager.MAX_AGE
+        ):
+            self._print_reported_peers()
 
     def _purge_reported_peers_if_exceeds(self):
         size = len(self._reported_peers)
@@ -665,11 +649,11 @@ class PeerManager(ConnectionListener, PersistedDataHost):
                 + "We remove random peers from the reported peers list."
             )
             # we randomly remove peers
-            peers_to_remove = random.sample(
-                list(self._reported_peers), size - PeerManager.MAX_REPORTED_PEERS
-            )
-            for peer in peers_to_remove:
-                self._remove_reported_peer(peer)
+            for peer in self._reported_peers.sample(
+                size - PeerManager.MAX_REPORTED_PEERS
+            ):
+                self._reported_peers.discard(peer)
+            self._print_reported_peers()
         else:
             self.logger.trace(
                 f"No need to purge reported peers.\n\tWe don't have more then {PeerManager.MAX_REPORTED_PEERS} reported peers yet."
@@ -677,7 +661,9 @@ class PeerManager(ConnectionListener, PersistedDataHost):
 
     def _print_reported_peers(self):
         if self._reported_peers:
-            if PeerManager.PRINT_REPORTED_PEERS_DETAILS:
+            if PeerManager.PRINT_REPORTED_PEERS_DETAILS and self.logger.isEnabledFor(
+                logging.TRACE
+            ):
                 result = (
                     "\n\n------------------------------------------------------------\n"
                     "Collected reported peers:"
@@ -693,7 +679,9 @@ class PeerManager(ConnectionListener, PersistedDataHost):
             self.logger.debug(f"Number of reported peers: {len(self._reported_peers)}")
 
     def _print_new_reported_peers(self, reported_peers: set["Peer"]):
-        if PeerManager.PRINT_REPORTED_PEERS_DETAILS:
+        if PeerManager.PRINT_REPORTED_PEERS_DETAILS and self.logger.isEnabledFor(
+            logging.TRACE
+        ):
             peers_details = "\n\t".join(str(peer) for peer in reported_peers)
             self.logger.trace(f"We received new reportedPeers:\n\t{peers_details}")
         self.logger.debug(f"Number of new arrived reported peers: {len(reported_peers)}")
@@ -719,23 +707,13 @@ class PeerManager(ConnectionListener, PersistedDataHost):
         return False
 
     def _find_persisted_peer(self, node_address: "NodeAddress") -> Optional["Peer"]:
-        return next(
-            (
-                peer
-                for peer in self.get_persisted_peers()
-                if peer.node_address == node_address
-            ),
-            None,
-        )
+        return self.get_persisted_peers().get(node_address)
 
     def _remove_too_old_persisted_peers(self):
-        old_peers = {
-            reported_peer
-            for reported_peer in self.get_persisted_peers()
-            if get_time_ms() - reported_peer.date > PeerManager.MAX_AGE
-        }
-        for peer in old_peers:
-            self._remove_persisted_peer(peer)
+        if self.get_persisted_peers().remove_older_than(
+            get_time_ms() - PeerManager.MAX_AGE
+        ):
+            self._request_persistence()
 
     def _purge_persisted_peers_if_exceeds(self):
         size = len(self.get_persisted_peers())
@@ -745,10 +723,9 @@ class PeerManager(ConnectionListener, PersistedDataHost):
                 + "We remove random peers from the persisted peers list."
             )
             # we don't use sorting by lastActivityDate to avoid attack vectors and keep it more random
-            peers_to_remove = random.sample(
-                list(self.get_persisted_peers()), size - PeerManager.MAX_PERSISTED_PEERS
-            )
-            for peer in peers_to_remove:
+            for peer in self.get_persisted_peers().sample(
+                size - PeerManager.MAX_PERSISTED_PEERS
+            ):
                 self._remove_persisted_peer(peer)
         else:
             self.logger.trace(
@@ -796,21 +773,9 @@ class PeerManager(ConnectionListener, PersistedDataHost):
             if capabilities_not_found_in_connection:
                 # If not found in connection we look up if we got the Capabilities set from any of the
                 # reported or persisted peers
-                persisted_and_reported = self.get_persisted_peers().copy()
-                persisted_and_reported.update(self.get_reported_peers())
-
-                candidate = next(
-                    (
-                        peer
-                        for peer in persisted_and_reported
-                        if peer.node_address == peers_node_address
-                        and not peer.capabilities.is_empty()
-                    ),
-                    None,
-                )
-
-                if candidate:
-                    supported_capabilities = candidate.capabilities
+                known_capabilities = self._find_known_capabilities(peers_node_address)
+                if known_capabilities:
+                    supported_capabilities = known_capabilities
 
             peer = Peer(
                 node_address=peers_node_address, capabilities=supported_capabilities
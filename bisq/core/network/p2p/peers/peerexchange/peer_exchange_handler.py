@@ -4,7 +4,7 @@ from datetime import timedelta
 from typing import TYPE_CHECKING, Optional
 from bisq.common.protocol.network.network_envelope import NetworkEnvelope
 from bisq.common.setup.log_setup import get_ctx_logger
-from bisq.common.user_thread import UserThread
+from bisq.common.timing_wheel import TimingWheel
 from bisq.core.network.p2p.network.message_listener import MessageListener
 from utils.aio import FutureCallback
 from utils.random import next_random_int
@@ -34,11 +34,12 @@ class PeerExchangeHandler(MessageListener):
         def on_fault(self_, error_message: str, connection: Optional["Connection"]):
             pass
 
-    def __init__(self, network_node: "NetworkNode", peer_manager: "PeerManager", listener: "PeerExchangeHandler.Listener"):
+    def __init__(self, network_node: "NetworkNode", peer_manager: "PeerManager", listener: "PeerExchangeHandler.Listener", timing_wheel: Optional["TimingWheel"] = None):
         self.logger = get_ctx_logger(__name__)
         self.network_node = network_node
         self.peer_manager = peer_manager
         self.listener = listener
+        self.timing_wheel = timing_wheel or TimingWheel.get_default()
         self.nonce = next_random_int()
         self.timeout_timer: "Timer" = None
         self.connection: Optional["Connection"] = None
@@ -54,7 +55,7 @@ class PeerExchangeHandler(MessageListener):
     # ///////////////////////////////////////////////////////////////////////////////////////////
 
     def send_get_peers_request_after_random_delay(self, node_address: "NodeAddress"):
-        self.delay_timer = UserThread.run_after_random_delay(
+        self.delay_timer = self.timing_wheel.run_after_random_delay(
             lambda: self.send_get_peers_request(node_address),
             timedelta(milliseconds=1),
             timedelta(milliseconds=self.DELAY_MS)
@@ -79,7 +80,7 @@ class PeerExchangeHandler(MessageListener):
 
         if self.timeout_timer is None:
             #  setup before sending to avoid race conditions
-            self.timeout_timer = UserThread.run_after(
+            self.timeout_timer = self.timing_wheel.run_after(
                 lambda: self._handle_timeout(node_address),
                 timedelta(seconds=self.TIMEOUT_SEC)
             )
@@ -2,7 +2,7 @@ from datetime import timedelta
 from bisq.common.setup.log_setup import get_ctx_logger
 from typing import TYPE_CHECKING, Optional
 from bisq.common.timer import Timer
-from bisq.common.user_thread import UserThread
+from bisq.common.timing_wheel import TimingWheel
 from bisq.core.network.p2p.network.connection_listener import ConnectionListener
 from bisq.core.network.p2p.network.message_listener import MessageListener
 from bisq.core.network.p2p.node_address import NodeAddress
@@ -28,8 +28,11 @@ class PeerExchangeManager(MessageListener, ConnectionListener, PeerManager.Liste
     def __init__(self,
                  network_node: "NetworkNode",
                  seed_node_repository: "SeedNodeRepository",
-                 peer_manager: "PeerManager"):
+                 peer_manager: "PeerManager",
+                 timing_wheel: Optional["TimingWheel"] = None):
         self.logger = get_ctx_logger(__name__)
+        # Shared with the peer exchange handlers and other users, so the timers of all connections share wakeups
+        self.timing_wheel = timing_wheel or TimingWheel.get_default()
         self.handler_map: dict["NodeAddress", "PeerExchangeHandler"] = {}
         
         self.retry_timer: Optional["Timer"] = None
@@ -100,7 +103,7 @@ class PeerExchangeManager(MessageListener, ConnectionListener, PeerManager.Liste
                 self._stop_retry_timer()
                 self.request_with_available_peers()
 
-            self.retry_timer = UserThread.run_after(retry_action, timedelta(seconds=PeerExchangeManager.RETRY_DELAY_SEC))
+            self.retry_timer = self.timing_wheel.run_after(retry_action, timedelta(seconds=PeerExchangeManager.RETRY_DELAY_SEC))
 
         if self.peer_manager.is_peer_banned(close_connection_reason, connection):
             node_address = connection.peers_node_address
@@ -207,12 +210,13 @@ class PeerExchangeManager(MessageListener, ConnectionListener, PeerManager.Liste
                                     self._stop_retry_timer()
                                     self.logger.warning("We have stopped already. We ignore that retryTimer.run call.")
 
-                            self.retry_timer = UserThread.run_after(retry_action, timedelta(seconds=PeerExchangeManager.RETRY_DELAY_SEC))
+                            self.retry_timer = self.timing_wheel.run_after(retry_action, timedelta(seconds=PeerExchangeManager.RETRY_DELAY_SEC))
 
             peer_exchange_handler = PeerExchangeHandler(
                 self.network_node,
                 self.peer_manager,
-                Listener()
+                Listener(),
+                self.timing_wheel,
             )
             self.handler_map[node_address] = peer_exchange_handler
             peer_exchange_handler.send_get_peers_request_after_random_delay(node_address)
@@ -277,7 +281,7 @@ class PeerExchangeManager(MessageListener, ConnectionListener, PeerManager.Liste
                         self._stop_retry_timer()
                         self.logger.warning("We have stopped already. We ignore that retryTimer.run call.")
 
-                self.retry_timer = UserThread.run_after(retry_action, timedelta(seconds=PeerExchangeManager.RETRY_DELAY_SEC))
+                self.retry_timer = self.timing_wheel.run_after(retry_action, timedelta(seconds=PeerExchangeManager.RETRY_DELAY_SEC))
             
 
 
@@ -288,7 +292,7 @@ class PeerExchangeManager(MessageListener, ConnectionListener, PeerManager.Liste
     def _start_periodic_timer(self):
         self.stopped = False
         if self.periodic_timer is None:
-            self.periodic_timer = UserThread.run_periodically(
+            self.periodic_timer = self.timing_wheel.run_periodically(
                 self.request_with_available_peers,
                 timedelta(minutes=PeerExchangeManager.REQUEST_PERIODICALLY_INTERVAL_MIN)
             )
@@ -306,7 +310,7 @@ class PeerExchangeManager(MessageListener, ConnectionListener, PeerManager.Liste
             self._stop_retry_timer()
             self.request_with_available_peers()
 
-        self.retry_timer = UserThread.run_after(
+        self.retry_timer = self.timing_wheel.run_after(
             retry_action,
             timedelta(seconds=PeerExchangeManager.RETRY_DELAY_AFTER_ALL_CON_LOST_SEC)
         )
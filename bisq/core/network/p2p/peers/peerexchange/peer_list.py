@@ -1,16 +1,21 @@
 from dataclasses import dataclass, field
-from typing import Set, Iterable
+from typing import Iterable
 from google.protobuf.message import Message
 
 from bisq.common.protocol.persistable.persistable_envelope import PersistableEnvelope
 import pb_pb2 as protobuf
 
 from .peer import Peer
+from .peer_registry import PeerRegistry
 
 
 @dataclass
 class PeerList(PersistableEnvelope):
-    set: Set[Peer] = field(default_factory=set)
+    set: PeerRegistry = field(default_factory=PeerRegistry)
+
+    def __post_init__(self):
+        if not isinstance(self.set, PeerRegistry):
+            self.set = PeerRegistry(self.set)
 
     def size(self) -> int:
         return len(self.set)
@@ -0,0 +1,138 @@
+import heapq
+import itertools
+import random
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from bisq.common.capabilities import Capabilities
+    from bisq.core.network.p2p.node_address import NodeAddress
+    from bisq.core.network.p2p.peers.peerexchange.peer import Peer
+
+
+class PeerRegistry:
+    """
+    Set of peers keyed by their node address.
+
+    Behaves like the plain peer sets used before (a peer already known by its address
+    is not replaced when added again), but lookups by address, removal of the oldest
+    peers and random eviction do not need to iterate all peers. Seed nodes can see
+    thousands of reported peers, and the peer manager looks them up on each
+    connection, disconnect and peer exchange.
+    """
+
+    def __init__(self, peers: Optional[Iterable["Peer"]] = None):
+        self._lock = threading.RLock()
+        self._peers: dict["NodeAddress", "Peer"] = {}
+        # node addresses in a list with their positions, for O(1) random sampling and removal
+        self._addresses: list["NodeAddress"] = []
+        self._positions: dict["NodeAddress", int] = {}
+        # min heap of (date, tie breaker, peer), stale entries are skipped when popped
+        self._by_age: list[tuple[int, int, "Peer"]] = []
+        self._counter = itertools.count()
+        if peers is not None:
+            self.update(peers)
+
+    def add(self, peer: "Peer") -> bool:
+        with self._lock:
+            node_address = peer.node_address
+            if node_address in self._peers:
+                return False
+            self._peers[node_address] = peer
+            self._positions[node_address] = len(self._addresses)
+            self._addresses.append(node_address)
+            heapq.heappush(self._by_age, (peer.date, next(self._counter), peer))
+            return True
+
+    def update(self, peers: Iterable["Peer"]):
+        with self._lock:
+            for peer in peers:
+                self.add(peer)
+
+    def get(self, node_address: Optional["NodeAddress"]) -> Optional["Peer"]:
+        return self._peers.get(node_address)
+
+    def find_capabilities(
+        self, node_address: Optional["NodeAddress"]
+    ) -> Optional["Capabilities"]:
+        """Returns the capabilities of the peer if we know any of them."""
+        peer = self._peers.get(node_address)
+        if peer is not None and not peer.capabilities.is_empty():
+            return peer.capabilities
+        return None
+
+    def remove(self, node_address: Optional["NodeAddress"]) -> Optional["Peer"]:
+        with self._lock:
+            peer = self._peers.pop(node_address, None)
+            if peer is None:
+                return None
+            position = self._positions.pop(node_address)
+            last = self._addresses.pop()
+            if last != node_address:
+                self._addresses[position] = last
+                self._positions[last] = position
+            self._maybe_compact()
+            return peer
+
+    def discard(self, peer: "Peer"):
+        self.remove(peer.node_address)
+
+    def remove_older_than(self, min_date: int) -> list["Peer"]:
+        """Removes and returns all peers with a date before `min_date`."""
+        removed = []
+        with self._lock:
+            while self._by_age and self._by_age[0][0] < min_date:
+                _, _, peer = heapq.heappop(self._by_age)
+                if self._peers.get(peer.node_address) is peer:
+                    self.remove(peer.node_address)
+                    removed.append(peer)
+        return removed
+
+    def sample(self, k: int) -> list["Peer"]:
+        with self._lock:
+            addresses = random.sample(self._addresses, min(k, len(self._addresses)))
+            return [self._peers[address] for address in addresses]
+
+    def _maybe_compact(self):
+        if len(self._by_age) > 2 * len(self._peers) + 64:
+            self._by_age = [
+                entry
+                for entry in self._by_age
+                if self._peers.get(entry[2].node_address) is entry[2]
+            ]
+            heapq.heapify(self._by_age)
+
+    def clear(self):
+        with self._lock:
+            self._peers.clear()
+            self._addresses.clear()
+            self._positions.clear()
+            self._by_age.clear()
+
+    def copy(self) -> set["Peer"]:
+        with self._lock:
+            return set(self._peers.values())
+
+    def __iter__(self) -> Iterator["Peer"]:
+        with self._lock:
+            return iter(list(self._peers.values()))
+
+    def __contains__(self, item: Union["Peer", "NodeAddress"]) -> bool:
+        node_address = getattr(item, "node_address", item)
+        return node_address in self._peers
+
+    def __len__(self) -> int:
+        return len(self._peers)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PeerRegistry):
+            return self.copy() == other.copy()
+        if isinstance(other, set):
+            return self.copy() == other
+        return False
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return str(self.copy())
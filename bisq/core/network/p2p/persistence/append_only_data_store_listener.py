@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,3 +12,8 @@ class AppendOnlyDataStoreListener(ABC):
     @abstractmethod
     def on_added(self, payload: "PersistableNetworkPayload"):
         pass
+
+    def on_added_all(self, payloads: Collection["PersistableNetworkPayload"]):
+        """Called once for the payloads added from a GetDataResponse. Override to handle them at once."""
+        for payload in payloads:
+            self.on_added(payload)
@@ -0,0 +1,103 @@
+import heapq
+import itertools
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from bisq.core.network.p2p.storage.payload.expirable_payload import ExpirablePayload
+
+if TYPE_CHECKING:
+    from bisq.core.network.p2p.storage.storage_byte_array import StorageByteArray
+    from bisq.core.network.p2p.storage.payload.protected_storage_entry import (
+        ProtectedStorageEntry,
+    )
+
+
+class ExpiryIndex:
+    """
+    Min heap of the expiry dates of the protected storage entries held by
+    P2PDataStorage, so the periodic TTL check only touches the entries which are
+    actually due instead of testing every entry of the map.
+
+    Each hash has at most one valid heap entry. Adding an entry again (update, refresh
+    or back dating) supersedes the previous one, and superseded or removed heap entries
+    are skipped when they come up. Entries with a payload which does not expire are not
+    indexed.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # min heap of (expiry date, sequence, hash)
+        self._heap: list[tuple[int, int, "StorageByteArray"]] = []
+        # the sequence of the valid heap entry per hash
+        self._entries: dict["StorageByteArray", int] = {}
+        self._counter = itertools.count()
+
+    @staticmethod
+    def get_expiry_date(entry: "ProtectedStorageEntry") -> Optional[int]:
+        payload = entry.protected_storage_payload
+        if not isinstance(payload, ExpirablePayload):
+            return None
+        return entry.creation_time_stamp + payload.get_ttl()
+
+    def add(self, hash_of_payload: "StorageByteArray", entry: "ProtectedStorageEntry"):
+        expiry_date = ExpiryIndex.get_expiry_date(entry)
+        with self._lock:
+            if expiry_date is None:
+                self.remove(hash_of_payload)
+                return
+            seq = next(self._counter)
+            self._entries[hash_of_payload] = seq
+            heapq.heappush(self._heap, (expiry_date, seq, hash_of_payload))
+            self._maybe_compact()
+
+    def update(self, entries: dict["StorageByteArray", "ProtectedStorageEntry"]):
+        with self._lock:
+            for hash_of_payload, entry in entries.items():
+                self.add(hash_of_payload, entry)
+
+    def remove(self, hash_of_payload: "StorageByteArray"):
+        with self._lock:
+            if self._entries.pop(hash_of_payload, None) is not None:
+                self._maybe_compact()
+
+    def pop_due(self, now: int) -> list["StorageByteArray"]:
+        """
+        Removes and returns the hashes of all entries with an expiry date before `now`.
+        Same as `ProtectedStorageEntry.is_expired`, an entry is due once more than its
+        TTL has passed since its creation.
+        """
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] < now:
+                _, seq, hash_of_payload = heapq.heappop(self._heap)
+                if self._entries.get(hash_of_payload) == seq:
+                    del self._entries[hash_of_payload]
+                    due.append(hash_of_payload)
+        return due
+
+    def peek_next_expiry_date(self) -> Optional[int]:
+        with self._lock:
+            while self._heap:
+                expiry_date, seq, hash_of_payload = self._heap[0]
+                if self._entries.get(hash_of_payload) == seq:
+                    return expiry_date
+                heapq.heappop(self._heap)
+            return None
+
+    def _maybe_compact(self):
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                item for item in self._heap if self._entries.get(item[2]) == item[1]
+            ]
+            heapq.heapify(self._heap)
+
+    def clear(self):
+        with self._lock:
+            self._heap.clear()
+            self._entries.clear()
+
+    def __contains__(self, hash_of_payload: "StorageByteArray") -> bool:
+        return hash_of_payload in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
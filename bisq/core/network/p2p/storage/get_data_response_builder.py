@@ -0,0 +1,334 @@
+from collections import Counter
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+from bisq.common.protocol.network.get_data_response_priority import (
+    GetDataResponsePriority,
+)
+from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.core.network.p2p.network.connection import Connection
+from bisq.core.network.p2p.peers.getdata.messages.get_data_response import (
+    GetDataResponse,
+)
+from bisq.core.network.p2p.peers.getdata.messages.get_updated_data_request import (
+    GetUpdatedDataRequest,
+)
+from bisq.core.network.p2p.persistence.historical_data_store_service import (
+    HistoricalDataStoreService,
+)
+from bisq.core.network.p2p.storage.payload.data_sorted_truncatable_payload import (
+    DateSortedTruncatablePayload,
+)
+
+if TYPE_CHECKING:
+    from bisq.common.capabilities import Capabilities
+    from bisq.common.protocol.network.network_payload import NetworkPayload
+    from bisq.core.network.p2p.peers.getdata.messages.get_data_request import (
+        GetDataRequest,
+    )
+    from bisq.core.network.p2p.storage.p2p_data_storage import P2PDataStorage
+    from bisq.core.network.p2p.storage.payload.persistable_network_payload import (
+        PersistableNetworkPayload,
+    )
+    from bisq.core.network.p2p.storage.payload.protected_storage_entry import (
+        ProtectedStorageEntry,
+    )
+
+T = TypeVar("T")
+
+
+class _Item(Generic[T]):
+    """An item of the response with its protobuf message, which gets created only once."""
+
+    __slots__ = ("item", "_proto")
+
+    def __init__(self, item: T):
+        self.item = item
+        self._proto = None
+
+    @property
+    def proto(self):
+        if self._proto is None:
+            self._proto = self.item.to_proto_message()
+        return self._proto
+
+    def get_size(self) -> int:
+        return self.proto.ByteSize()
+
+
+class _Selection(Generic[T]):
+    def __init__(self):
+        self.high_prio_items: list[_Item[T]] = []
+        # MID and LOW priority items, in the order they get truncated from the end
+        self.items: list[_Item[T]] = []
+        self.was_truncated = False
+
+    def __len__(self):
+        return len(self.high_prio_items) + len(self.items)
+
+
+class GetDataResponseBuilder:
+    """
+    Builds the GetDataResponse with the payloads known locally but not by the requester.
+
+    The stores are iterated directly instead of copying them into one map first. Each selected item is
+    serialized once, when its size is needed for the size limit, and the protobuf messages are reused
+    for sending the response.
+
+    `build` returns the response we always sent, truncated to the size limit of one message. Requesters
+    which set `supports_split_response` get `build_parts`: up to about MAX_PARTS times the data, split
+    into messages which each stay within the size limit.
+    """
+
+    # Give a bit of tolerance for message overhead
+    MAX_SIZE = Connection.MAX_PERMITTED_MESSAGE_SIZE * 0.6
+    MAX_PARTS = 4
+
+    def __init__(
+        self,
+        data_storage: "P2PDataStorage",
+        get_data_request: "GetDataRequest",
+        max_entries_per_type: int,
+        peer_capabilities: "Capabilities",
+    ):
+        self.logger = get_ctx_logger(__name__)
+        self.data_storage = data_storage
+        self.get_data_request = get_data_request
+        self.max_entries_per_type = max_entries_per_type
+        self.peer_capabilities = peer_capabilities
+        self.known_hashes: set[bytes] = get_data_request.excluded_keys
+        self.was_persistable_network_payloads_truncated = False
+        self.was_protected_storage_entries_truncated = False
+
+    @property
+    def was_truncated(self) -> bool:
+        return (
+            self.was_persistable_network_payloads_truncated
+            or self.was_protected_storage_entries_truncated
+        )
+
+    def build(self) -> GetDataResponse:
+        payloads, entries = self._select(1)
+        return self._new_response(
+            entries.high_prio_items + entries.items,
+            payloads.high_prio_items + payloads.items,
+            False,
+        )
+
+    def build_parts(self, max_parts: int = MAX_PARTS) -> list[GetDataResponse]:
+        payloads, entries = self._select(max_parts)
+
+        # High priority data goes into the first messages
+        items: list[tuple[bool, _Item]] = [
+            *((True, item) for item in entries.high_prio_items),
+            *((False, item) for item in payloads.high_prio_items),
+            *((True, item) for item in entries.items),
+            *((False, item) for item in payloads.items),
+        ]
+        parts: list[tuple[list[_Item], list[_Item]]] = []
+        part_entries, part_payloads = [], []
+        part_size = 0
+        for is_entry, item in items:
+            size = item.get_size()
+            if part_size + size > self.MAX_SIZE and (part_entries or part_payloads):
+                parts.append((part_entries, part_payloads))
+                part_entries, part_payloads = [], []
+                part_size = 0
+            (part_entries if is_entry else part_payloads).append(item)
+            part_size += size
+        parts.append((part_entries, part_payloads))
+
+        self.logger.info(
+            f"GetDataResponse with {len(entries)} ProtectedStorageEntries and "
+            f"{len(payloads)} PersistableNetworkPayloads got split into {len(parts)} parts"
+        )
+        return [
+            self._new_response(part_entries, part_payloads, i < len(parts) - 1)
+            for i, (part_entries, part_payloads) in enumerate(parts)
+        ]
+
+    def _select(
+        self, max_parts: int
+    ) -> tuple[
+        _Selection["PersistableNetworkPayload"], _Selection["ProtectedStorageEntry"]
+    ]:
+        # 25% of space is allocated for PersistableNetworkPayloads
+        payloads = self._filter_known_hashes(
+            self._get_persistable_network_payloads(),
+            lambda x: x,
+            round(self.MAX_SIZE * 0.25) * max_parts,
+            self.max_entries_per_type * max_parts,
+            "PersistableNetworkPayload",
+        )
+        self.was_persistable_network_payloads_truncated = payloads.was_truncated
+        # We give 75% space to ProtectedStorageEntries as they contain MailBoxMessages and those can be larger.
+        entries = self._filter_known_hashes(
+            self._get_protected_storage_entries(),
+            lambda x: x.protected_storage_payload,
+            round(self.MAX_SIZE * 0.75) * max_parts,
+            self.max_entries_per_type * max_parts,
+            "ProtectedStorageEntry",
+        )
+        self.was_protected_storage_entries_truncated = entries.was_truncated
+        return payloads, entries
+
+    def _get_persistable_network_payloads(
+        self,
+    ) -> Iterator[tuple[bytes, "PersistableNetworkPayload"]]:
+        # Pre v 1.4.0 requests do not have set the requesters version field so it is null.
+        # The methods in HistoricalDataStoreService will return all historical data in that case.
+        for service in self.data_storage.append_only_data_store_service.services:
+            if isinstance(service, HistoricalDataStoreService):
+                service_map = service.get_map_since_version(
+                    self.get_data_request.version
+                )
+            else:
+                service_map = service.get_map()
+            for key, payload in service_map.items():
+                yield key.bytes, payload
+
+    def _get_protected_storage_entries(
+        self,
+    ) -> Iterator[tuple[bytes, "ProtectedStorageEntry"]]:
+        for key, entry in self.data_storage.map.items():
+            yield key.bytes, entry
+
+    def _filter_known_hashes(
+        self,
+        to_filter: Iterator[tuple[bytes, T]],
+        as_payload: Callable[[T], "NetworkPayload"],
+        limit: int,
+        max_entries: int,
+        type_name: str,
+    ) -> _Selection[T]:
+        """
+        Selects the items not in the known hashes which should be transmitted to the peer.
+
+        Truncation follows this rules
+        1. Add all payloads with GetDataResponsePriority.MID
+        2. Add all payloads with GetDataResponsePriority.LOW && !DateSortedTruncatablePayload until exceededSizeLimit is reached
+        3. if(!exceededSizeLimit) Add all payloads with GetDataResponsePriority.LOW && DateSortedTruncatablePayload until
+           exceededSizeLimit is reached and truncate by maxItems (sorted by date). We add the sublist to our resultItems in
+           reverse order so in case we cut off at next step we cut off oldest items.
+        4. We truncate list if resultList size > maxEntries
+        5. Add all payloads with GetDataResponsePriority.HIGH
+        """
+        num_items_by_class_name = Counter()
+        mid_prio_items: list[_Item[T]] = []
+        low_prio_items: list[_Item[T]] = []
+        date_sorted_items: list[_Item[T]] = []
+        selection = _Selection[T]()
+        # The same payload might be held by more than one store
+        seen_keys: set[bytes] = set()
+        for key, item in to_filter:
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            payload = as_payload(item)
+            num_items_by_class_name[payload.__class__.__name__] += 1
+            if (
+                key in self.known_hashes
+                or not self.data_storage.should_transmit_payload_to_peer(
+                    self.peer_capabilities, payload
+                )
+            ):
+                continue
+            priority = item.get_data_response_priority()
+            if priority == GetDataResponsePriority.MID:
+                mid_prio_items.append(_Item(item))
+            elif priority == GetDataResponsePriority.HIGH:
+                selection.high_prio_items.append(_Item(item))
+            elif isinstance(payload, DateSortedTruncatablePayload):
+                date_sorted_items.append(_Item(item))
+            else:
+                low_prio_items.append(_Item(item))
+        self.logger.info(
+            f"Filter {type_name} data based on {len(self.known_hashes)} knownHashes. "
+            f"numItemsByClassName: {dict(num_items_by_class_name)}"
+        )
+
+        # Only the LOW priority items are serialized here, all others at sending
+        total_size = 0
+        exceeded_size_limit = False
+
+        def check_size_limit(item: _Item[T]) -> bool:
+            nonlocal total_size, exceeded_size_limit
+            if exceeded_size_limit:
+                return False
+            total_size += item.get_size()
+            if total_size > limit:
+                exceeded_size_limit = True
+                return False
+            return True
+
+        result_items = mid_prio_items
+        result_items.extend(item for item in low_prio_items if check_size_limit(item))
+
+        if not exceeded_size_limit:
+            date_sorted_items = [
+                item for item in date_sorted_items if check_size_limit(item)
+            ]
+
+            def get_date(item: _Item[T]):
+                return cast(DateSortedTruncatablePayload, as_payload(item.item)).get_date()
+
+            if date_sorted_items:
+                date_sorted_items.sort(key=get_date)
+                max_items = cast(
+                    DateSortedTruncatablePayload, as_payload(date_sorted_items[0].item)
+                ).max_items()
+                size = len(date_sorted_items)
+                if size > max_items:
+                    from_index = size - max_items
+                    date_sorted_items = date_sorted_items[from_index:]
+                    selection.was_truncated = True
+                    self.logger.info(
+                        f"Removed oldest {from_index} dateSortedItems as we exceeded {max_items}"
+                    )
+
+            # We reverse sorting so in case we get truncated we cut off the older items
+            date_sorted_items.sort(key=get_date, reverse=True)
+            result_items.extend(date_sorted_items)
+        else:
+            self.logger.info(
+                f"No dateSortedItems added as we exceeded already the exceededSizeLimit of {limit}"
+            )
+
+        size = len(result_items)
+        if size > max_entries:
+            result_items = result_items[:max_entries]
+            selection.was_truncated = True
+            self.logger.info(
+                f"Removed last {size - max_entries} items as we exceeded {max_entries}"
+            )
+
+        selection.was_truncated = selection.was_truncated or exceeded_size_limit
+        selection.items = result_items
+        self.logger.info(
+            f"{len(selection)} {type_name} entries remained after filtered by excluded keys. "
+            f"Original stores had {sum(num_items_by_class_name.values())} entries. "
+            f"Number of items with GetDataResponsePriority.HIGH: {len(selection.high_prio_items)}. "
+            f"Was truncated: {selection.was_truncated}"
+        )
+        return selection
+
+    def _new_response(
+        self,
+        entries: list[_Item["ProtectedStorageEntry"]],
+        payloads: list[_Item["PersistableNetworkPayload"]],
+        has_more_parts: bool,
+    ) -> GetDataResponse:
+        return GetDataResponse(
+            data_set=frozenset(item.item for item in entries),
+            persistable_network_payload_set=frozenset(item.item for item in payloads),
+            request_nonce=self.get_data_request.nonce,
+            is_get_updated_data_response=isinstance(
+                self.get_data_request, GetUpdatedDataRequest
+            ),
+            was_truncated=self.was_truncated,
+            has_more_parts=has_more_parts,
+            serialized_data_set=[item.proto for item in entries],
+            serialized_persistable_network_payload_items=[
+                item.proto for item in payloads
+            ],
+        )
@@ -1,8 +1,7 @@
-from collections import defaultdict
 from datetime import timedelta
 import logging
 from bisq.common.setup.log_setup import get_ctx_logger
-from typing import TYPE_CHECKING, Optional, TypeVar, cast
+from typing import TYPE_CHECKING, Collection, Optional
 from collections.abc import Callable
 from bisq.common.crypto.hash import get_32_byte_hash
 from bisq.common.crypto.key_pair import KeyPair
@@ -35,6 +34,10 @@ from bisq.core.network.p2p.persistence.protected_data_store_service import (
     ProtectedDataStoreService,
 )
 from bisq.core.network.p2p.storage.data_and_seq_nr_pair import DataAndSeqNrPair
+from bisq.core.network.p2p.storage.expiry_index import ExpiryIndex
+from bisq.core.network.p2p.storage.get_data_response_builder import (
+    GetDataResponseBuilder,
+)
 from bisq.core.network.p2p.storage.messages.add_data_message import AddDataMessage
 from bisq.core.network.p2p.storage.messages.add_once_payload import AddOncePayload
 from bisq.core.network.p2p.storage.messages.add_persistable_network_payload_message import (
@@ -51,9 +54,6 @@ from bisq.core.network.p2p.storage.messages.remove_mailbox_data_message import (
 from bisq.core.network.p2p.storage.payload.capability_requiring_payload import (
     CapabilityRequiringPayload,
 )
-from bisq.core.network.p2p.storage.payload.data_sorted_truncatable_payload import (
-    DateSortedTruncatablePayload,
-)
 from bisq.core.network.p2p.storage.payload.data_tolerant_payload import (
     DateTolerantPayload,
 )
@@ -77,11 +77,14 @@ from bisq.core.network.p2p.storage.payload.requires_owner_is_online_payload impo
 )
 from bisq.core.network.p2p.storage.storage_byte_array import StorageByteArray
 from bisq.core.network.p2p.storage.storage_map_value import StorageMapValue
-from utils.concurrency import AtomicBoolean, AtomicInt, ThreadSafeDict, ThreadSafeSet
+from utils.concurrency import AtomicBoolean, ThreadSafeDict, ThreadSafeSet
 from utils.data import SimpleProperty, combine_simple_properties
 from utils.formatting import to_truncated_string
 from bisq.common.protocol.network.network_payload import NetworkPayload
 from bisq.core.network.p2p.storage.sequence_number_map import SequenceNumberMap
+from bisq.core.network.p2p.storage.sequence_number_journal import (
+    SequenceNumberJournal,
+)
 from bisq.core.network.p2p.storage.payload.protected_mailbox_storage_entry import (
     ProtectedMailboxStorageEntry,
 )
@@ -118,9 +121,6 @@ if TYPE_CHECKING:
     from bisq.common.persistence.persistence_manager import PersistenceManager
 
 
-T = TypeVar("T", bound=NetworkPayload)
-
-
 class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
     # How many days to keep an entry before it is purged.
     PURGE_AGE_DAYS = 10
@@ -150,6 +150,8 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         self.map: ThreadSafeDict["StorageByteArray", "ProtectedStorageEntry"] = (
             ThreadSafeDict()
         )
+        # Expiry dates of the entries in map. Needs to be updated on each change of map.
+        self.expiry_index = ExpiryIndex()
         self.hash_map_changed_listeners: ThreadSafeSet["HashMapChangedListener"] = (
             ThreadSafeSet()
         )
@@ -182,6 +184,11 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         self.persistence_manager.initialize(
             self.sequence_number_map, PersistenceManagerSource.PRIVATE_LOW_PRIO
         )
+        # Changes of the sequence number map are appended to a journal, the PersistenceManager
+        # only writes the whole map when the journal gets compacted.
+        self.sequence_number_journal = SequenceNumberJournal(
+            self.persistence_manager, self.sequence_number_map
+        )
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // PersistedDataHost
@@ -189,20 +196,24 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
 
     def read_persisted(self, complete_handler: Callable[[], None]):
         def callback(persisted: "SequenceNumberMap"):
-            self.sequence_number_map.map = self.get_purged_sequence_number_map(
-                persisted.map
-            )
+            self.load_sequence_number_map(persisted)
+            complete_handler()
+
+        def or_else():
+            self.load_sequence_number_map(None)
             complete_handler()
 
-        self.persistence_manager.read_persisted(callback, complete_handler)
+        self.persistence_manager.read_persisted(callback, or_else)
 
     def read_persisted_sync(self):
         """Uses synchronous execution on the userThread. Only used by tests. The async methods should be used by app code."""
         persisted = self.persistence_manager.get_persisted()
-        if persisted:
-            self.sequence_number_map.map = self.get_purged_sequence_number_map(
-                persisted.map
-            )
+        self.load_sequence_number_map(persisted)
+
+    def load_sequence_number_map(self, persisted: Optional["SequenceNumberMap"]):
+        self.sequence_number_map.load(persisted)
+        self.sequence_number_journal.replay()
+        self.sequence_number_map.purge_older_than(self.get_purge_max_age_ts())
 
     # Threading is done on the persistenceManager level
     def read_from_resources(self, postfix: str, complete_handler: Callable[[], None]):
@@ -232,7 +243,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         self.protected_data_store_service.read_from_resources(
             postfix,
             lambda: (
-                self.map.update(self.protected_data_store_service.get_map()),
+                self._add_protected_data_store_entries_to_map(),
                 protected_data_store_service_ready.set(True),
             ),
         )
@@ -246,7 +257,12 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         self.protected_data_store_service.read_from_resources_sync(postfix)
         self.resource_data_store_service.read_from_resources_sync(postfix)
 
-        self.map.update(self.protected_data_store_service.get_map())
+        self._add_protected_data_store_entries_to_map()
+
+    def _add_protected_data_store_entries_to_map(self):
+        protected_data_store_map = self.protected_data_store_service.get_map()
+        self.map.update(protected_data_store_map)
+        self.expiry_index.update(protected_data_store_map)
 
     # We get added mailbox message data from MailboxMessageService. We want to add those early so we can get it added
     # to our excluded keys to reduce initial data response data size.
@@ -256,6 +272,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         protected_storage_payload = protected_storage_entry.protected_storage_payload
         hash_of_payload = StorageByteArray(get_32_byte_hash(protected_storage_payload))
         self.map[hash_of_payload] = protected_storage_entry
+        self.expiry_index.add(hash_of_payload, protected_storage_entry)
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // RequestData API
@@ -264,7 +281,9 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
     def build_preliminary_get_data_request(self, nonce: int):
         """Returns a PreliminaryGetDataRequest that can be sent to a peer node to request missing Payload data."""
         return PreliminaryGetDataRequest(
-            nonce=nonce, excluded_keys=self.get_known_payload_hashes()
+            nonce=nonce,
+            excluded_keys=self.get_known_payload_hashes(),
+            supports_split_response=True,
         )
 
     def build_get_updated_data_request(
@@ -275,6 +294,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
             sender_node_address=sender_node_address,
             nonce=nonce,
             excluded_keys=self.get_known_payload_hashes(),
+            supports_split_response=True,
         )
 
     def get_known_payload_hashes(self) -> set[bytes]:
@@ -298,80 +318,43 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         was_persistable_network_payloads_truncated: "AtomicBoolean",
         was_protected_storage_entries_truncated: "AtomicBoolean",
         peer_capabilities: "Capabilities",
-    ):
+    ) -> "GetDataResponse":
         """Returns a GetDataResponse object that contains the Payloads known locally, but not remotely."""
-        excluded_keys_as_byte_array = (
-            StorageByteArray.convert_bytes_set_to_bytearray_set(
-                get_data_request.excluded_keys
-            )
+        builder = GetDataResponseBuilder(
+            self, get_data_request, max_entries_per_type, peer_capabilities
         )
-
-        # Pre v 1.4.0 requests do not have set the requesters version field so it is null.
-        # The methods in HistoricalDataStoreService will return all historical data in that case.
-        # mapForDataResponse contains the filtered by version data from HistoricalDataStoreService as well as all other
-        # maps of the remaining appendOnlyDataStoreServices.
-        map_for_data_response = self.get_map_for_data_response(get_data_request.version)
-
-        # Give a bit of tolerance for message overhead
-        max_size = Connection.MAX_PERMITTED_MESSAGE_SIZE * 0.6
-
-        # 25% of space is allocated for PersistableNetworkPayloads
-        limit = round(max_size * 0.25)
-
-        filtered_persistable_network_payloads = self.filter_known_hashes(
-            to_filter=map_for_data_response,
-            as_payload=lambda x: x,
-            known_hashes=excluded_keys_as_byte_array,
-            peer_capabilities=peer_capabilities,
-            max_entries=max_entries_per_type,
-            limit=limit,
-            out_truncated=was_persistable_network_payloads_truncated,
-            is_persistable_network_payload=True,
+        get_data_response = builder.build()
+        was_persistable_network_payloads_truncated.set(
+            builder.was_persistable_network_payloads_truncated
         )
-        self.logger.info(
-            f"{len(filtered_persistable_network_payloads)} PersistableNetworkPayload entries remained after filtered by excluded keys. "
-            + f"Original map had {len(map_for_data_response)} entries."
-        )
-        self.logger.trace(
-            f"## buildGetDataResponse filteredPersistableNetworkPayloadHashes={[payload.get_hash().hex() for payload in filtered_persistable_network_payloads]}"
+        was_protected_storage_entries_truncated.set(
+            builder.was_protected_storage_entries_truncated
         )
+        return get_data_response
 
-        # We give 75% space to ProtectedStorageEntries as they contain MailBoxMessages and those can be larger.
-        limit = round(max_size * 0.75)
-        _as_payload: Callable[["ProtectedStorageEntry"], "NetworkPayload"] = (
-            lambda x: x.protected_storage_payload
-        )
-        filtered_protected_storage_entries = self.filter_known_hashes(
-            to_filter=self.map,
-            as_payload=_as_payload,
-            known_hashes=excluded_keys_as_byte_array,
-            peer_capabilities=peer_capabilities,
-            max_entries=max_entries_per_type,
-            limit=limit,
-            out_truncated=was_protected_storage_entries_truncated,
-            is_persistable_network_payload=False,
-        )
-        self.logger.info(
-            f"{len(filtered_protected_storage_entries)} ProtectedStorageEntry entries remained after filtered by excluded keys. "
-            f"Original map had {len(self.map)} entries."
-        )
-        self.logger.trace(
-            f"## buildGetDataResponse filteredProtectedStorageEntryHashes={[StorageByteArray(get_32_byte_hash(entry.protected_storage_payload)) for entry in filtered_protected_storage_entries]}"
+    def build_get_data_response_parts(
+        self,
+        get_data_request: "GetDataRequest",
+        max_entries_per_type: int,
+        was_persistable_network_payloads_truncated: "AtomicBoolean",
+        was_protected_storage_entries_truncated: "AtomicBoolean",
+        peer_capabilities: "Capabilities",
+    ) -> list["GetDataResponse"]:
+        """
+        Same as build_get_data_response but for requesters which support split responses. Returns the
+        response split into several messages, which can contain more data than a single one.
+        """
+        builder = GetDataResponseBuilder(
+            self, get_data_request, max_entries_per_type, peer_capabilities
         )
-
-        was_truncated = (
-            was_persistable_network_payloads_truncated.get()
-            or was_protected_storage_entries_truncated.get()
+        get_data_responses = builder.build_parts()
+        was_persistable_network_payloads_truncated.set(
+            builder.was_persistable_network_payloads_truncated
         )
-        return GetDataResponse(
-            data_set=filtered_protected_storage_entries,
-            persistable_network_payload_set=filtered_persistable_network_payloads,
-            request_nonce=get_data_request.nonce,
-            is_get_updated_data_response=isinstance(
-                get_data_request, GetUpdatedDataRequest
-            ),  # NOTE: ???
-            was_truncated=was_truncated,
+        was_protected_storage_entries_truncated.set(
+            builder.was_protected_storage_entries_truncated
         )
+        return get_data_responses
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // Utils for collecting the exclude hashes
@@ -415,160 +398,6 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
 
         return result
 
-    @staticmethod
-    def filter_known_hashes(
-        to_filter: dict[StorageByteArray, T],
-        as_payload: Callable[[T], "NetworkPayload"],
-        known_hashes: set[StorageByteArray],
-        peer_capabilities: "Capabilities",
-        max_entries: int,
-        limit: int,
-        out_truncated: "AtomicBoolean",
-        is_persistable_network_payload: bool,
-    ) -> set[T]:
-        """Generic function that filters a dict[StorageByteArray, (ProtectedStorageEntry || PersistableNetworkPayload)]
-        by a given set of keys and peer capabilities."""
-        logger = get_ctx_logger(__name__)
-        logger.info(
-            f"Filter {'PersistableNetworkPayload' if is_persistable_network_payload else 'ProtectedStorageEntry'} "
-            f"data based on {len(known_hashes)} knownHashes"
-        )
-
-        total_size = AtomicInt()
-        exceeded_size_limit = AtomicBoolean()
-
-        # Count items by class name
-        num_items_by_class_name = defaultdict(AtomicInt)
-        for entry in to_filter.values():
-            name = as_payload(entry).__class__.__name__
-            num_items_by_class_name[name].increment_and_get()
-        logger.info(f"numItemsByClassName: {num_items_by_class_name}")
-
-        # Filter items not in known_hashes and should transmit to peer
-        filtered_items = [
-            item
-            for key, item in to_filter.items()
-            if key not in known_hashes
-            and P2PDataStorage.should_transmit_payload_to_peer(
-                peer_capabilities, as_payload(item)
-            )
-        ]
-
-        result_items = []
-
-        # Truncation follows this rules
-        # 1. Add all payloads with GetDataResponsePriority.MID
-        # 2. Add all payloads with GetDataResponsePriority.LOW && !DateSortedTruncatablePayload until exceededSizeLimit is reached
-        # 3. if(!exceededSizeLimit) Add all payloads with GetDataResponsePriority.LOW && DateSortedTruncatablePayload until
-        #    exceededSizeLimit is reached and truncate by maxItems (sorted by date). We add the sublist to our resultItems in
-        #    reverse order so in case we cut off at next step we cut off oldest items.
-        # 4. We truncate list if resultList size > maxEntries
-        # 5. Add all payloads with GetDataResponsePriority.HIGH
-
-        # 1. Add all payloads with GetDataResponsePriority.MID
-        mid_prio_items = [
-            item
-            for item in filtered_items
-            if item.get_data_response_priority() == GetDataResponsePriority.MID
-        ]
-        result_items.extend(mid_prio_items)
-        logger.info(
-            f"Number of items with GetDataResponsePriority.MID: {len(mid_prio_items)}"
-        )
-
-        # 2. Add LOW priority non-DateSortedTruncatable items until exceededSizeLimit is reached
-        def check_size_limit(item: "NetworkPayload"):
-            if exceeded_size_limit.get():
-                return False
-            if total_size.add_and_get(item.to_proto_message().ByteSize()) > limit:
-                exceeded_size_limit.set(True)
-                return False
-            return True
-
-        low_prio_items = [
-            item
-            for item in filtered_items
-            if item.get_data_response_priority() == GetDataResponsePriority.LOW
-            and not isinstance(as_payload(item), DateSortedTruncatablePayload)
-            and check_size_limit(item)
-        ]
-        result_items.extend(low_prio_items)
-        logger.info(
-            f"Number of items with GetDataResponsePriority.LOW and !DateSortedTruncatablePayload: {len(low_prio_items)}. Exceeded size limit: {exceeded_size_limit.get()}"
-        )
-
-        # 3. if(!exceededSizeLimit) Add all payloads with GetDataResponsePriority.LOW && DateSortedTruncatablePayload until
-        #    exceededSizeLimit is reached and truncate by maxItems (sorted by date). We add the sublist to our resultItems in
-        #    reverse order so in case we cut off at next step we cut off oldest items.
-        if not exceeded_size_limit.get():
-            date_sorted_items = [
-                item
-                for item in filtered_items
-                if item.get_data_response_priority() == GetDataResponsePriority.LOW
-                and isinstance(as_payload(item), DateSortedTruncatablePayload)
-                and check_size_limit(item)
-            ]
-
-            if date_sorted_items:
-                date_sorted_items.sort(
-                    key=lambda x: cast(  # We checked earlier that It's for sure DateSortedTruncatablePayload
-                        DateSortedTruncatablePayload, as_payload(x)
-                    ).get_date()
-                )
-                max_items = cast(
-                    DateSortedTruncatablePayload, as_payload(date_sorted_items[0])
-                ).max_items()
-                size = len(date_sorted_items)
-                if size > max_items:
-                    from_index = size - max_items
-                    date_sorted_items = date_sorted_items[from_index:size]
-                    out_truncated.set(True)
-                    logger.info(f"Num truncated dateSortedItems {size}")
-                    logger.info(
-                        f"Removed oldest {from_index} dateSortedItems as we exceeded {max_items}"
-                    )
-
-            logger.info(
-                f"Number of items with GetDataResponsePriority.LOW and DateSortedTruncatablePayload: {len(date_sorted_items)}. Was truncated: {out_truncated.get()}"
-            )
-
-            # We reverse sorting so in case we get truncated we cut off the older items
-            date_sorted_items.sort(
-                key=lambda x: cast(
-                    DateSortedTruncatablePayload, as_payload(x)
-                ).get_date(),
-                reverse=True,
-            )
-            result_items.extend(date_sorted_items)
-        else:
-            logger.info(
-                f"No dateSortedItems added as we exceeded already the exceededSizeLimit of {limit}"
-            )
-
-        # 4. We truncate list if resultList size > maxEntries
-        size = len(result_items)
-        if size > max_entries:
-            result_items = result_items[:max_entries]
-            out_truncated.set(True)
-            logger.info(
-                f"Removed last {size - max_entries} items as we exceeded {max_entries}"
-            )
-
-        out_truncated.set(out_truncated.get() or exceeded_size_limit.get())
-
-        # 5. Add all payloads with GetDataResponsePriority.HIGH
-        high_prio_items = [
-            item
-            for item in filtered_items
-            if item.get_data_response_priority() == GetDataResponsePriority.HIGH
-        ]
-        result_items.extend(high_prio_items)
-        logger.info(
-            f"Number of items with GetDataResponsePriority.HIGH: {len(high_prio_items)}"
-        )
-        logger.info(f"Number of result items we send to requester: {len(result_items)}")
-        return set(result_items)
-
     def get_persistable_network_payload_collection(
         self,
     ) -> list["PersistableNetworkPayload"]:
@@ -629,7 +458,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
                 == GetDataResponsePriority.HIGH
             ):
                 # We rebroadcast high priority data after a delay for better resilience
-                def rebroadcast():
+                def rebroadcast(protected_storage_entry=protected_storage_entry):
                     self.logger.info(
                         f"Rebroadcast {protected_storage_entry.protected_storage_payload.__class__.__name__}"
                     )
@@ -641,16 +470,17 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
 
                 UserThread.run_after(rebroadcast, timedelta(seconds=60))
 
-            # We don't broadcast here (last param) as we are only connected to the seed node and would be pointless
-            self.add_protected_storage_entry(
-                protected_storage_entry, sender, None, False
-            )
+        # We don't broadcast here as we are only connected to the seed node and would be pointless
+        self.add_protected_storage_entries_from_initial_request(
+            protected_storage_entries, sender
+        )
 
         self.logger.info(
             f"Processing {len(protected_storage_entries)} protectedStorageEntries took {self.clock.millis() - ts} ms."
         )
 
         ts = self.clock.millis()
+        added_payloads: list["PersistableNetworkPayload"] = []
         for payload in persistable_network_payload_set:
             if isinstance(payload, ProcessOncePersistableNetworkPayload):
                 # We use an optimized method as many checks are not required in that case to avoid
@@ -665,17 +495,22 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
             else:
                 # We don't broadcast here as we are only connected to the seed node and would be pointless
                 self._add_persistable_network_payload_internal(
-                    payload, sender, False, False, False
+                    payload, sender, False, False, False, added_payloads
                 )
 
+        if added_payloads:
+            for listener in self.append_only_data_store_listeners:
+                listener.on_added_all(added_payloads)
+
         self.logger.info(
             f"Processing {len(persistable_network_payload_set)} persistableNetworkPayloads took {self.clock.millis() - ts} ms."
         )
 
         # We only process PersistableNetworkPayloads implementing ProcessOncePersistableNetworkPayload once. It can cause performance
         # issues and since the data is rarely out of sync it is not worth it to apply them from multiple peers during
-        # startup.
-        self.initial_request_applied = True
+        # startup. The parts of a split response count as one response.
+        if not get_data_response.has_more_parts:
+            self.initial_request_applied = True
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // API
@@ -685,6 +520,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         if self.remove_expired_entries_timer:
             self.remove_expired_entries_timer.stop()
             self.remove_expired_entries_timer = None
+        self.sequence_number_journal.shut_down()
         self._network_node.remove_message_listener(self)
         self._network_node.remove_connection_listener(self)
 
@@ -694,9 +530,17 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         # object when we get it sent from new peers, we don't remove the sequence number from the map.
         # That way an ADD message for an already expired data will fail because the sequence number
         # is equal and not larger as expected.
-        to_remove_list = [
-            entry for entry in self.map.items() if entry[1].is_expired(self.clock)
-        ]
+        # Only the entries which are due according to the expiry index get checked.
+        to_remove_list = []
+        for hash_of_payload in self.expiry_index.pop_due(self.clock.millis()):
+            entry = self.map.get(hash_of_payload)
+            if entry is None:
+                continue
+            if entry.is_expired(self.clock):
+                to_remove_list.append((hash_of_payload, entry))
+            else:
+                # Can only happen if the entry got changed without updating the index
+                self.expiry_index.add(hash_of_payload, entry)
 
         # Batch processing can cause performance issues, so do all of the removes first, then update the listeners
         # to let them know about the removes.
@@ -714,9 +558,8 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
             len(self.sequence_number_map)
             > self.max_sequence_number_map_size_before_purge
         ):
-            self.sequence_number_map.map = self.get_purged_sequence_number_map(
-                self.sequence_number_map.map
-            )
+            # The entries are ordered by their last update, so only the purged ones get visited
+            self.sequence_number_map.purge_older_than(self.get_purge_max_age_ts())
             self.request_persistence()
 
     def on_bootstrapped(self):
@@ -779,7 +622,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
             return
 
         # Backdate all the eligible payloads based on the node that disconnected
-        for protected_storage_entry in self.map.values():
+        for hash_of_payload, protected_storage_entry in self.map.items():
             payload = protected_storage_entry.protected_storage_payload
             if (
                 isinstance(payload, RequiresOwnerIsOnlinePayload)
@@ -798,6 +641,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
                     f"Backdating {protected_storage_entry} due to closeConnectionReason={close_connection_reason}"
                 )
                 protected_storage_entry.back_date()
+                self.expiry_index.add(hash_of_payload, protected_storage_entry)
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // Client API
@@ -833,8 +677,14 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         allow_broadcast: bool,
         re_broadcast: bool,
         check_date: bool,
+        out_added_payloads: Optional[list["PersistableNetworkPayload"]] = None,
     ) -> bool:
-        self.logger.debug(f"add_persistable_network_payload payload={payload}")
+        """
+        If `out_added_payloads` is given, added payloads are appended to it instead of notifying the
+        appendOnlyDataStoreListeners, so the caller can notify them once for many payloads.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"add_persistable_network_payload payload={payload}")
 
         # Payload hash size does not match expectation for that type of message
         if not payload.verify_hash_size():
@@ -872,8 +722,11 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
                 hash_as_byte_array, payload
             )
             if was_added:
-                for listener in self.append_only_data_store_listeners:
-                    listener.on_added(payload)
+                if out_added_payloads is not None:
+                    out_added_payloads.append(payload)
+                else:
+                    for listener in self.append_only_data_store_listeners:
+                        listener.on_added(payload)
 
         # Broadcast the payload if requested by caller
         if allow_broadcast and was_added:
@@ -923,6 +776,131 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         protected_storage_payload = protected_storage_entry.protected_storage_payload
         hash_of_payload = StorageByteArray(get_32_byte_hash(protected_storage_payload))
 
+        if not self._can_add_protected_storage_entry(
+            protected_storage_entry, hash_of_payload, sender
+        ):
+            return False
+
+        # This is an updated entry. Record it and signal listeners.
+        self.map[hash_of_payload] = protected_storage_entry
+        self.expiry_index.add(hash_of_payload, protected_storage_entry)
+        for l in self.hash_map_changed_listeners:
+            l.on_added([protected_storage_entry])
+
+        # Record the updated sequence number and persist it. Higher delay so we can batch more items.
+        self.sequence_number_map[hash_of_payload] = StorageMapValue(
+            sequence_nr=protected_storage_entry.sequence_number,
+            time_stamp=self.clock.millis(),
+        )
+        self.request_persistence()
+
+        # Optionally, broadcast the add/update depending on the calling environment
+        if allow_broadcast:
+            self.broadcaster.broadcast(
+                AddDataMessage(protected_storage_entry=protected_storage_entry),
+                sender,
+                listener,
+            )
+            self.logger.trace(
+                f"## broadcasted ProtectedStorageEntry. hash={hash_of_payload}"
+            )
+
+        # Persist ProtectedStorageEntries carrying PersistablePayload payloads
+        if isinstance(protected_storage_payload, PersistablePayload):
+            self.protected_data_store_service.put(
+                hash_of_payload, protected_storage_entry
+            )
+
+        return True
+
+    def add_protected_storage_entries_from_initial_request(
+        self,
+        protected_storage_entries: Collection["ProtectedStorageEntry"],
+        sender: Optional["NodeAddress"],
+    ) -> list["ProtectedStorageEntry"]:
+        """
+        Adds the ProtectedStorageEntries of a GetDataResponse without broadcasting them. Accepts and rejects
+        the same entries as calling add_protected_storage_entry for each of them, but is faster for many entries:
+        The cheap checks run first, so the signature gets verified only for entries which pass them, all
+        accepted entries get inserted in one pass and listeners get notified once with all of them.
+
+        Returns:
+            list[ProtectedStorageEntry]: the added entries
+        """
+        entries_by_hash: dict["StorageByteArray", "ProtectedStorageEntry"] = {}
+        # Later entries with the same hash need to be checked against the earlier ones
+        same_hash_entries: list["ProtectedStorageEntry"] = []
+        for protected_storage_entry in protected_storage_entries:
+            hash_of_payload = StorageByteArray(
+                get_32_byte_hash(protected_storage_entry.protected_storage_payload)
+            )
+            if hash_of_payload in entries_by_hash:
+                same_hash_entries.append(protected_storage_entry)
+            else:
+                entries_by_hash[hash_of_payload] = protected_storage_entry
+
+        candidates = [
+            (hash_of_payload, protected_storage_entry)
+            for hash_of_payload, protected_storage_entry in entries_by_hash.items()
+            if self._can_add_protected_storage_entry(
+                protected_storage_entry, hash_of_payload, sender, False
+            )
+        ]
+        added: dict["StorageByteArray", "ProtectedStorageEntry"] = {}
+        for hash_of_payload, protected_storage_entry in candidates:
+            if protected_storage_entry.is_valid_for_add_operation():
+                added[hash_of_payload] = protected_storage_entry
+            else:
+                self.logger.trace(f"## !isValidForAddOperation hash={hash_of_payload}")
+
+        if added:
+            self.map.update(added)
+            self.expiry_index.update(added)
+            time_stamp = self.clock.millis()
+            for hash_of_payload, protected_storage_entry in added.items():
+                self.sequence_number_map[hash_of_payload] = StorageMapValue(
+                    sequence_nr=protected_storage_entry.sequence_number,
+                    time_stamp=time_stamp,
+                )
+                # Persist ProtectedStorageEntries carrying PersistablePayload payloads
+                if isinstance(
+                    protected_storage_entry.protected_storage_payload, PersistablePayload
+                ):
+                    self.protected_data_store_service.put(
+                        hash_of_payload, protected_storage_entry
+                    )
+            self.request_persistence()
+            added_entries = list(added.values())
+            for l in self.hash_map_changed_listeners:
+                l.on_added(added_entries)
+        else:
+            added_entries = []
+
+        for protected_storage_entry in same_hash_entries:
+            if self.add_protected_storage_entry(
+                protected_storage_entry, sender, None, False
+            ):
+                added_entries.append(protected_storage_entry)
+
+        self.logger.info(
+            f"Added {len(added_entries)} of {len(protected_storage_entries)} protectedStorageEntries. "
+            f"Signatures of {len(candidates)} entries got verified."
+        )
+        return added_entries
+
+    def _can_add_protected_storage_entry(
+        self,
+        protected_storage_entry: "ProtectedStorageEntry",
+        hash_of_payload: "StorageByteArray",
+        sender: Optional["NodeAddress"],
+        verify_signature: bool = True,
+    ) -> bool:
+        """
+        Returns true if all checks for adding the ProtectedStorageEntry pass. The signature check of
+        `is_valid_for_add_operation` is skipped if `verify_signature` is False, the caller has to do it then.
+        """
+        protected_storage_payload = protected_storage_entry.protected_storage_payload
+
         # We do that check early as it is a very common case for returning, so we return early
         # If we have seen a more recent operation for this payload and we have a payload locally, ignore it
         stored_entry = self.map.get(hash_of_payload)
@@ -964,7 +942,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
             return False
 
         # Verify the ProtectedStorageEntry is well formed and valid for the add operation
-        if not protected_storage_entry.is_valid_for_add_operation():
+        if verify_signature and not protected_storage_entry.is_valid_for_add_operation():
             self.logger.trace(f"## !isValidForAddOperation hash={hash_of_payload}")
             return False
 
@@ -985,35 +963,6 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
             )
             return False
 
-        # This is an updated entry. Record it and signal listeners.
-        self.map[hash_of_payload] = protected_storage_entry
-        for l in self.hash_map_changed_listeners:
-            l.on_added([protected_storage_entry])
-
-        # Record the updated sequence number and persist it. Higher delay so we can batch more items.
-        self.sequence_number_map[hash_of_payload] = StorageMapValue(
-            sequence_nr=protected_storage_entry.sequence_number,
-            time_stamp=self.clock.millis(),
-        )
-        self.request_persistence()
-
-        # Optionally, broadcast the add/update depending on the calling environment
-        if allow_broadcast:
-            self.broadcaster.broadcast(
-                AddDataMessage(protected_storage_entry=protected_storage_entry),
-                sender,
-                listener,
-            )
-            self.logger.trace(
-                f"## broadcasted ProtectedStorageEntry. hash={hash_of_payload}"
-            )
-
-        # Persist ProtectedStorageEntries carrying PersistablePayload payloads
-        if isinstance(protected_storage_payload, PersistablePayload):
-            self.protected_data_store_service.put(
-                hash_of_payload, protected_storage_entry
-            )
-
         return True
 
     def republish_existing_protected_mailbox_storage_entry(
@@ -1121,6 +1070,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
 
             # Update the hash map with the updated entry
             self.map[hash_of_payload] = updated_entry
+            self.expiry_index.add(hash_of_payload, updated_entry)
 
             # Record the latest sequence number and persist it
             self.sequence_number_map[hash_of_payload] = StorageMapValue(
@@ -1334,6 +1284,7 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
         for hash_of_payload, protected_storage_entry in entries_to_remove:
             # self.logger.trace("## removeFromMapAndDataStore: hashOfPayload={hash_of_payload}, map before remove={self.print_map()}")
             self.map.remove(hash_of_payload)  # Remove if exists
+            self.expiry_index.remove(hash_of_payload)
             # self.logger.trace("## removeFromMapAndDataStore: map after remove={self.print_map()}")
 
             # We inform listeners even if the entry was not found in our map
@@ -1386,24 +1337,15 @@ class P2PDataStorage(MessageListener, ConnectionListener, PersistedDataHost):
             return True
 
     def request_persistence(self):
-        """Request persistence of the current state"""
-        self.persistence_manager.request_persistence()
-
-    def get_purged_sequence_number_map(
-        self, persisted: dict["StorageByteArray", "StorageMapValue"]
-    ) -> dict["StorageByteArray", "StorageMapValue"]:
-        """Get a new map with entries older than PURGE_AGE_DAYS purged from the given map."""
-        purged = {}
-        max_age_ts = self.clock.millis() - int(
+        """Request persistence of the changes of the sequence number map"""
+        self.sequence_number_journal.request_flush()
+
+    def get_purge_max_age_ts(self) -> int:
+        """Entries of the sequence number map with a time stamp up to that one are older than PURGE_AGE_DAYS."""
+        return self.clock.millis() - int(
             timedelta(days=P2PDataStorage.PURGE_AGE_DAYS).total_seconds() * 1000
         )
 
-        for key, value in persisted.items():
-            if value.time_stamp > max_age_ts:
-                purged[key] = value
-
-        return purged
-
     def print_data(self, info: str):
         """Print debug info about the current data set."""
         if self.logger.isEnabledFor(logging.TRACE):
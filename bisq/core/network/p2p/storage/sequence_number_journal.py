@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING
+
+from bisq.common.persistence.append_only_journal import AppendOnlyJournal
+from bisq.core.network.p2p.storage.sequence_number_map import (
+    pack_map_value,
+    unpack_map_value,
+)
+import pb_pb2 as protobuf
+
+if TYPE_CHECKING:
+    from bisq.common.persistence.persistence_manager import PersistenceManager
+    from bisq.core.network.p2p.storage.sequence_number_map import SequenceNumberMap
+
+
+class SequenceNumberJournal(AppendOnlyJournal[protobuf.SequenceNumberEntry]):
+    """
+    Append-only journal of the changes of the SequenceNumberMap.
+
+    The changes collected by the map get appended to the journal instead of writing the whole map
+    on each change. Once the journal holds more records than the map has entries, it gets compacted.
+
+    Each record sets or removes one entry, so replaying a journal file which is already covered by the
+    snapshot does not change the result. That way a failed or interrupted snapshot write never loses
+    changes.
+    """
+
+    MIN_RECORDS_BEFORE_COMPACTION = 10_000
+
+    def __init__(
+        self,
+        persistence_manager: "PersistenceManager[SequenceNumberMap]",
+        sequence_number_map: "SequenceNumberMap",
+    ):
+        super().__init__(persistence_manager, protobuf.SequenceNumberEntry)
+        self.sequence_number_map = sequence_number_map
+
+    def _apply_record(self, record: protobuf.SequenceNumberEntry):
+        packed = None
+        if record.HasField("map_value"):
+            packed = pack_map_value(
+                record.map_value.sequence_nr, record.map_value.time_stamp
+            )
+        self.sequence_number_map.apply_journal_record(record.bytes.bytes, packed)
+
+    def _drain_records(self) -> list[protobuf.SequenceNumberEntry]:
+        records = []
+        for key, packed in self.sequence_number_map.drain_changes():
+            entry = protobuf.SequenceNumberEntry(bytes=protobuf.ByteArray(bytes=key))
+            if packed is not None:
+                entry.map_value.CopyFrom(unpack_map_value(packed).to_proto_message())
+            records.append(entry)
+        return records
+
+    def _is_compaction_due(self) -> bool:
+        return self.num_records > max(
+            self.MIN_RECORDS_BEFORE_COMPACTION, len(self.sequence_number_map)
+        )
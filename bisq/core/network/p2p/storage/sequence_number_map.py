@@ -1,63 +1,167 @@
+from collections.abc import Iterable, Iterator
+import threading
+from typing import Optional
+
 from bisq.common.protocol.persistable.persistable_envelope import PersistableEnvelope
 from bisq.core.network.p2p.storage.storage_byte_array import StorageByteArray
 from bisq.core.network.p2p.storage.storage_map_value import StorageMapValue
 import pb_pb2 as protobuf
-from utils.concurrency import ThreadSafeDict
+
+_SEQUENCE_NR_MASK = 0xFFFFFFFF
+_SEQUENCE_NR_SIGN = 0x80000000
+
+
+def pack_map_value(sequence_nr: int, time_stamp: int) -> int:
+    # sequence_nr is an int32 in the protobuf definition
+    return (time_stamp << 32) | (sequence_nr & _SEQUENCE_NR_MASK)
+
+
+def unpack_map_value(packed: int) -> StorageMapValue:
+    sequence_nr = packed & _SEQUENCE_NR_MASK
+    if sequence_nr & _SEQUENCE_NR_SIGN:
+        sequence_nr -= 1 << 32
+    return StorageMapValue(sequence_nr=sequence_nr, time_stamp=packed >> 32)
+
+
+def get_packed_time_stamp(packed: int) -> int:
+    return packed >> 32
+
 
 class SequenceNumberMap(PersistableEnvelope):
     """
     This class was not generalized to HashMapPersistable (like we did with #ListPersistable) because
     in protobuffer the map construct can't be anything, so the straightforward mapping was not possible.
     Hence this Persistable class.
+
+    The entries are held as raw hash bytes mapped to an int which packs the sequence number and the time
+    stamp, instead of StorageByteArray and StorageMapValue objects. Those are only created when an entry
+    is read. Entries are kept in the order of their last update, so the purge of old entries stops at the
+    first entry which is recent enough. All changes since the last `drain_changes` call are recorded for
+    the SequenceNumberJournal.
     """
-    
+
     def __init__(self, map: dict[StorageByteArray, StorageMapValue] = None):
-        self.map: ThreadSafeDict[StorageByteArray, StorageMapValue] = ThreadSafeDict()
+        self._lock = threading.RLock()
+        self._map: dict[bytes, int] = {}
+        # latest change per key which was not written to the journal yet, None for a removal
+        self._changes: dict[bytes, Optional[int]] = {}
         if map:
-            self.map.update(map)
-    
+            self._load_packed(
+                (key.bytes, pack_map_value(value.sequence_nr, value.time_stamp))
+                for key, value in map.items()
+            )
+
     def to_proto_message(self):
+        with self._lock:
+            items = list(self._map.items())
         return protobuf.PersistableEnvelope(
             sequence_number_map=protobuf.SequenceNumberMap(
                 sequence_number_entries=[
                     protobuf.SequenceNumberEntry(
-                        bytes=key.to_proto_message(),
-                        map_value=value.to_proto_message()
-                    ) for key, value in self.map.items()
+                        bytes=protobuf.ByteArray(bytes=key),
+                        map_value=unpack_map_value(packed).to_proto_message(),
+                    )
+                    for key, packed in items
                 ]
             )
         )
-    
+
     @staticmethod
     def from_proto(proto: protobuf.SequenceNumberMap):
-        map = {}
-        for e in proto.sequence_number_entries:
-            key = StorageByteArray.from_proto(e.bytes)
-            value = StorageMapValue.from_proto(e.map_value)
-            map[key] = value
-        return SequenceNumberMap(map)
-    
+        sequence_number_map = SequenceNumberMap()
+        sequence_number_map._load_packed(
+            (
+                e.bytes.bytes,
+                pack_map_value(e.map_value.sequence_nr, e.map_value.time_stamp),
+            )
+            for e in proto.sequence_number_entries
+        )
+        return sequence_number_map
+
+    def _load_packed(self, entries: Iterable[tuple[bytes, int]]):
+        packed_entries = sorted(
+            entries, key=lambda item: get_packed_time_stamp(item[1])
+        )
+        with self._lock:
+            self._map = dict(packed_entries)
+
+    def load(self, persisted: Optional["SequenceNumberMap"]):
+        """Replaces all entries with the persisted ones. Loading is not recorded for the journal."""
+        with self._lock:
+            self._map = dict(persisted._map) if persisted is not None else {}
+
+    def apply_journal_record(self, key: bytes, packed: Optional[int]):
+        with self._lock:
+            self._map.pop(key, None)
+            if packed is not None:
+                self._map[key] = packed
+
+    def drain_changes(self) -> list[tuple[bytes, Optional[int]]]:
+        with self._lock:
+            changes = list(self._changes.items())
+            self._changes.clear()
+            return changes
+
+    def purge_older_than(self, max_age_ts: int) -> int:
+        """
+        Removes the entries with a time stamp not after `max_age_ts` and returns how many got removed.
+
+        As the entries are ordered by their last update, only the removed entries get visited. An entry
+        which got updated with an older time stamp than a preceding one (e.g. after a clock change) is
+        purged with a later call.
+        """
+        removed = 0
+        with self._lock:
+            for key, packed in self._map.items():
+                if get_packed_time_stamp(packed) > max_age_ts:
+                    break
+                removed += 1
+            for _ in range(removed):
+                key = next(iter(self._map))
+                del self._map[key]
+                self._changes[key] = None
+        return removed
+
     def clear(self):
-        self.map.clear()
+        with self._lock:
+            for key in self._map:
+                self._changes[key] = None
+            self._map.clear()
+
+    def items(self) -> list[tuple[StorageByteArray, StorageMapValue]]:
+        with self._lock:
+            items = list(self._map.items())
+        return [(StorageByteArray(key), unpack_map_value(packed)) for key, packed in items]
 
     def __len__(self):
-        return len(self.map)
-    
+        return len(self._map)
+
     def __contains__(self, key: StorageByteArray):
-        return key in self.map
-    
-    def get(self, key: StorageByteArray, default = None) -> StorageMapValue:
-        return self.map.get(key, default)
-    
+        return key.bytes in self._map
+
+    def get(self, key: StorageByteArray, default=None) -> StorageMapValue:
+        packed = self._map.get(key.bytes)
+        if packed is None:
+            return default
+        return unpack_map_value(packed)
+
     def __getitem__(self, key: StorageByteArray) -> StorageMapValue:
-        return self.map[key]
-    
+        return unpack_map_value(self._map[key.bytes])
+
     def __setitem__(self, key: StorageByteArray, value: StorageMapValue):
-        self.map[key] = value
-            
+        packed = pack_map_value(value.sequence_nr, value.time_stamp)
+        with self._lock:
+            # re-insert so the entry moves to the end of the update order
+            self._map.pop(key.bytes, None)
+            self._map[key.bytes] = packed
+            self._changes[key.bytes] = packed
+
     def __delitem__(self, key: StorageByteArray) -> None:
-        del self.map[key]
-            
-    def __iter__(self):
-        return iter(self.map)
-    
\ No newline at end of file
+        with self._lock:
+            del self._map[key.bytes]
+            self._changes[key.bytes] = None
+
+    def __iter__(self) -> Iterator[StorageByteArray]:
+        with self._lock:
+            keys = list(self._map)
+        return (StorageByteArray(key) for key in keys)
@@ -485,7 +485,7 @@ class Offer(NetworkPayload, PersistablePayload):
 
     @property
     def bsq_swap_offer_payload(self) -> Optional['BsqSwapOfferPayload']:
-        if isinstance(self.offer_payload_base, 'BsqSwapOfferPayload'):
+        if isinstance(self.offer_payload_base, BsqSwapOfferPayload):
             return self.offer_payload_base
         return None
 
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Collection, Optional
 
 from bisq.common.handlers.error_message_handler import ErrorMessageHandler
+from bisq.common.setup.log_setup import get_ctx_logger
 from bisq.common.handlers.result_handler import ResultHandler
 from bisq.core.locale.currency_util import is_crypto_currency
 from bisq.core.locale.res import Res
@@ -43,6 +44,7 @@ class OfferBookService:
         storage_dir: Path,
         dump_statistics: bool,
     ):
+        self.logger = get_ctx_logger(__name__)
         self.p2p_service = p2p_service
         self.price_feed_service = price_feed_service
         self.filter_manager = filter_manager
@@ -53,22 +55,16 @@ class OfferBookService:
 
         class HashMapListener(HashMapChangedListener):
             def on_added(self_, entries: Collection["ProtectedStorageEntry"]):
-                for entry in entries:
-                    if isinstance(entry.protected_storage_payload, OfferPayloadBase):
-                        payload = entry.protected_storage_payload
-                        offer = Offer(payload)
-                        offer.price_feed_service = self.price_feed_service
-                        for listener in self.offer_book_changed_listeners:
-                            listener.on_added(offer)
+                for offer in self._get_offers_with_valid_proof_of_work(entries):
+                    for listener in self.offer_book_changed_listeners:
+                        listener.on_added(offer)
 
             def on_removed(self_, entries: Collection["ProtectedStorageEntry"]):
-                for entry in entries:
-                    if isinstance(entry.protected_storage_payload, OfferPayloadBase):
-                        payload = entry.protected_storage_payload
-                        offer = Offer(payload)
-                        offer.price_feed_service = self.price_feed_service
-                        for listener in self.offer_book_changed_listeners:
-                            listener.on_removed(offer)
+                # Not filtered, as an offer may have passed the check when it was added
+                # (e.g. before the pow difficulty was raised) and must not stay listed.
+                for offer in self._get_offers_of_entries(entries):
+                    for listener in self.offer_book_changed_listeners:
+                        listener.on_removed(offer)
 
         self._subscriptions.append(
             p2p_service.add_hash_set_changed_listener(HashMapListener())
@@ -166,6 +162,44 @@ class OfferBookService:
                 offer.price_feed_service = self.price_feed_service
                 yield offer
 
+    def _get_offers_of_entries(
+        self, entries: Collection["ProtectedStorageEntry"]
+    ) -> list["Offer"]:
+        offers: list["Offer"] = []
+        for entry in entries:
+            if isinstance(entry.protected_storage_payload, OfferPayloadBase):
+                offer = Offer(entry.protected_storage_payload)
+                offer.price_feed_service = self.price_feed_service
+                offers.append(offer)
+        return offers
+
+    def _get_offers_with_valid_proof_of_work(
+        self, entries: Collection["ProtectedStorageEntry"]
+    ) -> list["Offer"]:
+        """
+        Returns the offers of the entries, without BSQ swap offers with an invalid
+        proof of work. Initial data delivers many offers at once, so their proofs
+        are verified as one batch.
+        """
+        offers = self._get_offers_of_entries(entries)
+        bsq_swap_offers = [offer for offer in offers if offer.is_bsq_swap_offer]
+        if not bsq_swap_offers:
+            return offers
+
+        invalid_offer_ids = {
+            offer.id
+            for offer, is_valid in zip(
+                bsq_swap_offers,
+                self.filter_manager.are_proofs_of_work_valid(bsq_swap_offers),
+            )
+            if not is_valid
+        }
+        if invalid_offer_ids:
+            self.logger.info(
+                f"Ignoring {len(invalid_offer_ids)} BSQ swap offer(s) with invalid proof of work"
+            )
+        return [offer for offer in offers if offer.id not in invalid_offer_ids]
+
     def remove_offer_at_shut_down(self, offer_payload_base: "OfferPayloadBase") -> None:
         self.remove_offer(offer_payload_base, None, None)
 
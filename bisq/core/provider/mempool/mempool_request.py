@@ -2,6 +2,9 @@ from asyncio import Future
 from typing import TYPE_CHECKING, Optional
 import random
 from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.core.provider.mempool.mempool_request_coalescer import (
+    MempoolRequestCoalescer,
+)
 from bisq.core.provider.mempool_http_client import MempoolHttpClient
 from utils.aio import FutureCallback, as_future
 
@@ -13,10 +16,16 @@ if TYPE_CHECKING:
 
 class MempoolRequest:
 
-    def __init__(self, preferences: "Preferences", socks5_proxy_provider: "Socks5ProxyProvider"):
+    def __init__(
+        self,
+        preferences: "Preferences",
+        socks5_proxy_provider: "Socks5ProxyProvider",
+        coalescer: Optional[MempoolRequestCoalescer] = None,
+    ):
         self.logger = get_ctx_logger(__name__)
         self.tx_broadcast_services: list[str] = preferences.get_default_tx_broadcast_services()
         self.mempool_http_client = MempoolHttpClient(socks5_proxy_provider)
+        self.coalescer = coalescer or MempoolRequestCoalescer.get_default()
 
     def get_tx_status(self, mempool_service_callback: Future[str], tx_id: str):
         self.mempool_http_client.base_url = self.get_random_service_address(self.tx_broadcast_services)
@@ -32,14 +41,24 @@ class MempoolRequest:
                 pass
         
         as_future(
-            self.mempool_http_client.get_tx_details(tx_id)
+            self.coalescer.get_tx_details(
+                tx_id,
+                self.mempool_http_client.base_url,
+                lambda: self.mempool_http_client.get_tx_details(tx_id),
+            )
         ).add_done_callback(
             FutureCallback(on_success, on_failure)
         )
     
     def request_tx_as_hex(self, tx_id: str) -> Future[str]:
         self.mempool_http_client.base_url = self.get_random_service_address(self.tx_broadcast_services)
-        return as_future(self.mempool_http_client.request_tx_as_hex(tx_id))
+        return as_future(
+            self.coalescer.get_tx_as_hex(
+                tx_id,
+                self.mempool_http_client.base_url,
+                lambda: self.mempool_http_client.request_tx_as_hex(tx_id),
+            )
+        )
     
     def switch_to_another_provider(self):
         try:
@@ -0,0 +1,137 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import json
+from typing import Optional
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from utils.aio import as_future
+from utils.clock import Clock
+
+
+class MempoolRequestCoalescer:
+    """
+    Process wide deduplication of mempool lookups.
+
+    Offer books of all users on a daemon contain mostly the same offers, so the same
+    fee transactions get looked up over and over. Lookups of a txid which is already
+    being requested from the same provider join the pending request, results which
+    can not change anymore (confirmed transactions, raw transaction hex) are cached
+    for `cache_ttl_sec`, and each provider gets at most `max_requests_per_provider`
+    concurrent requests.
+    Failures are passed to the waiters of the failed provider only, so each
+    MempoolRequest rotates away from a provider only if that one was asked.
+    Cached results are shared regardless of the provider which returned them.
+    """
+
+    DEFAULT_CACHE_TTL_SEC = 10 * 60
+    DEFAULT_MAX_CACHE_SIZE = 10_000
+    DEFAULT_MAX_REQUESTS_PER_PROVIDER = 3
+
+    _default_coalescer: Optional["MempoolRequestCoalescer"] = None
+
+    def __init__(
+        self,
+        cache_ttl_sec: float = DEFAULT_CACHE_TTL_SEC,
+        max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+        max_requests_per_provider: int = DEFAULT_MAX_REQUESTS_PER_PROVIDER,
+        clock: Optional[Clock] = None,
+    ):
+        self.logger = get_ctx_logger(__name__)
+        self.cache_ttl_sec = cache_ttl_sec
+        self.max_cache_size = max_cache_size
+        self.max_requests_per_provider = max_requests_per_provider
+        self.clock = clock or Clock()
+        # (kind, tx_id) -> (time of caching in ms, response)
+        self._cache = OrderedDict[tuple[str, str], tuple[int, str]]()
+        # ((kind, tx_id), provider) -> pending request
+        self._in_flight: dict[tuple[tuple[str, str], str], asyncio.Future[str]] = {}
+        self._provider_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def get_default() -> "MempoolRequestCoalescer":
+        if MempoolRequestCoalescer._default_coalescer is None:
+            MempoolRequestCoalescer._default_coalescer = MempoolRequestCoalescer()
+        return MempoolRequestCoalescer._default_coalescer
+
+    async def get_tx_details(
+        self, tx_id: str, provider: str, fetch: Callable[[], Awaitable[str]]
+    ) -> str:
+        return await self._get(
+            ("tx", tx_id), provider, fetch, MempoolRequestCoalescer.is_confirmed
+        )
+
+    async def get_tx_as_hex(
+        self, tx_id: str, provider: str, fetch: Callable[[], Awaitable[str]]
+    ) -> str:
+        return await self._get(("hex", tx_id), provider, fetch, lambda _: True)
+
+    @staticmethod
+    def is_confirmed(tx_details_json: str) -> bool:
+        try:
+            status = json.loads(tx_details_json).get("status")
+            return isinstance(status, dict) and status.get("confirmed") is True
+        except (ValueError, AttributeError):
+            return False
+
+    async def _get(
+        self,
+        key: tuple[str, str],
+        provider: str,
+        fetch: Callable[[], Awaitable[str]],
+        is_final: Callable[[str], bool],
+    ) -> str:
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        in_flight_key = (key, provider)
+        pending = self._in_flight.get(in_flight_key)
+        if pending is None:
+            pending = as_future(self._fetch(key, provider, fetch, is_final))
+            self._in_flight[in_flight_key] = pending
+            pending.add_done_callback(
+                lambda _: self._in_flight.pop(in_flight_key, None)
+            )
+        else:
+            self.logger.debug(
+                f"Joining pending mempool request for {key} to {provider}"
+            )
+        # shielded, so a cancelled waiter does not cancel the request of the others
+        return await asyncio.shield(pending)
+
+    async def _fetch(
+        self,
+        key: tuple[str, str],
+        provider: str,
+        fetch: Callable[[], Awaitable[str]],
+        is_final: Callable[[str], bool],
+    ) -> str:
+        semaphore = self._provider_semaphores.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_requests_per_provider)
+            self._provider_semaphores[provider] = semaphore
+        async with semaphore:
+            result = await fetch()
+        if is_final(result):
+            self._put_cached(key, result)
+        return result
+
+    def _get_cached(self, key: tuple[str, str]) -> Optional[str]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        cached_at, result = entry
+        if self.clock.millis() - cached_at > self.cache_ttl_sec * 1000:
+            del self._cache[key]
+            return None
+        return result
+
+    def _put_cached(self, key: tuple[str, str], result: str):
+        self._cache[key] = (self.clock.millis(), result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+
+    def clear(self):
+        self._cache.clear()
@@ -6,30 +6,55 @@ if TYPE_CHECKING:
     from bisq.common.protocol.persistable.persistable_data_host import PersistedDataHost
 
 
+_TRADE_HOSTS = ("trade_manager", "closed_tradable_manager")
+
+
 class CorePersistedDataHost:
 
+    # Hosts by name which must have completed reading before the data of the host gets
+    # applied. Hosts not listed here get their data applied as soon as it is read.
+    DEPENDENCIES: dict[str, tuple[str, ...]] = {
+        # The disputes are applied after the trades they belong to
+        "arbitration_dispute_list_service": _TRADE_HOSTS,
+        "mediation_dispute_list_service": _TRADE_HOSTS,
+        "refund_dispute_list_service": _TRADE_HOSTS,
+        # The mailbox messages get added to the map of the p2p data storage
+        "mailbox_message_service": ("p2p_data_storage",),
+    }
+
     @staticmethod
     def get_persisted_data_hosts(global_container: "GlobalContainer"):
-        persisted_data_hosts: list["PersistedDataHost"] = []
-        persisted_data_hosts.append(global_container.address_entry_list)
-        persisted_data_hosts.append(global_container.open_offer_manager)
-        persisted_data_hosts.append(global_container.trade_manager)
-        persisted_data_hosts.append(global_container.closed_tradable_manager)
-        persisted_data_hosts.append(global_container.bsq_swap_trade_manager)
-        persisted_data_hosts.append(global_container.failed_trades_manager)
-        persisted_data_hosts.append(global_container.arbitration_dispute_list_service)
-        persisted_data_hosts.append(global_container.mediation_dispute_list_service)
-        persisted_data_hosts.append(global_container.refund_dispute_list_service)
-        persisted_data_hosts.append(global_container.p2p_data_storage)
-        persisted_data_hosts.append(global_container.peer_manager)
-        persisted_data_hosts.append(global_container.mailbox_message_service)
-        persisted_data_hosts.append(global_container.ignored_mailbox_service)
-        persisted_data_hosts.append(global_container.removed_payloads_service)
-        persisted_data_hosts.append(global_container.ballot_list_service)
-        persisted_data_hosts.append(global_container.my_blind_vote_list_service)
-        persisted_data_hosts.append(global_container.my_vote_list_service)
-        persisted_data_hosts.append(global_container.my_proposal_list_service)
-        persisted_data_hosts.append(global_container.my_reputation_list_service)
-        persisted_data_hosts.append(global_container.my_proof_of_burn_list_service)
-        persisted_data_hosts.append(global_container.unconfirmed_bsq_change_output_list_service)
-        return persisted_data_hosts
+        return list(
+            CorePersistedDataHost.get_persisted_data_hosts_by_name(
+                global_container
+            ).values()
+        )
+
+    @staticmethod
+    def get_persisted_data_hosts_by_name(
+        global_container: "GlobalContainer",
+    ) -> dict[str, "PersistedDataHost"]:
+        names = [
+            "address_entry_list",
+            "open_offer_manager",
+            "trade_manager",
+            "closed_tradable_manager",
+            "bsq_swap_trade_manager",
+            "failed_trades_manager",
+            "arbitration_dispute_list_service",
+            "mediation_dispute_list_service",
+            "refund_dispute_list_service",
+            "p2p_data_storage",
+            "peer_manager",
+            "mailbox_message_service",
+            "ignored_mailbox_service",
+            "removed_payloads_service",
+            "ballot_list_service",
+            "my_blind_vote_list_service",
+            "my_vote_list_service",
+            "my_proposal_list_service",
+            "my_reputation_list_service",
+            "my_proof_of_burn_list_service",
+            "unconfirmed_bsq_change_output_list_service",
+        ]
+        return {name: getattr(global_container, name) for name in names}
@@ -0,0 +1,163 @@
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import math
+from typing import TYPE_CHECKING, Optional
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.common.user_thread import UserThread
+from utils.time import get_time_ms
+
+if TYPE_CHECKING:
+    from bisq.common.persistence.persistence_orchestrator import (
+        PersistenceOrchestrator,
+    )
+    from bisq.common.protocol.persistable.persistable_data_host import (
+        PersistedDataHost,
+    )
+
+
+@dataclass
+class _HostEntry:
+    name: str
+    host: "PersistedDataHost"
+    depends_on: tuple[str, ...]
+    dependents: list["_HostEntry"] = field(default_factory=list)
+    num_pending_dependencies: int = 0
+    # ms since the start of read_all
+    started_at: Optional[int] = None
+    completed_at: Optional[int] = None
+
+
+class StartupOrchestrator:
+    """
+    Reads the persisted data of the PersistedDataHosts of a user at startup.
+
+    The files of all PersistenceManagers which have not been read yet get read and parsed on a
+    shared thread pool right away, independent of the order of the hosts. A host gets its
+    read_persisted called once all hosts it depends on have completed, so the data is applied on
+    the user thread in dependency order while the reading of all files overlaps.
+    """
+
+    _default_read_executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(
+        self,
+        persistence_orchestrator: "PersistenceOrchestrator",
+        read_executor: Optional[Executor] = None,
+    ):
+        self.logger = get_ctx_logger(__name__)
+        self._persistence_orchestrator = persistence_orchestrator
+        self._read_executor = read_executor
+        self._entries: dict[str, _HostEntry] = {}
+        self._file_read_at: dict[str, int] = {}
+        self._start_ts = 0
+        self._num_pending = 0
+        self._complete_handler: Optional[Callable[[], None]] = None
+
+    @staticmethod
+    def get_default_read_executor() -> ThreadPoolExecutor:
+        """The read executor shared by all users, which limits the number of concurrent reads."""
+        if StartupOrchestrator._default_read_executor is None:
+            StartupOrchestrator._default_read_executor = ThreadPoolExecutor(
+                thread_name_prefix="PersistedDataRead"
+            )
+        return StartupOrchestrator._default_read_executor
+
+    def add_host(
+        self, name: str, host: "PersistedDataHost", depends_on: Iterable[str] = ()
+    ):
+        if name in self._entries:
+            raise ValueError(f"Host {name} was added already")
+        self._entries[name] = _HostEntry(name, host, tuple(depends_on))
+
+    def read_all(self, complete_handler: Callable[[], None]):
+        """Calls complete_handler on the user thread once all hosts have read their data."""
+        roots = self._link_dependencies()
+        self._start_ts = get_time_ms()
+        self._num_pending = len(self._entries)
+        self._complete_handler = complete_handler
+        if self._num_pending == 0:
+            UserThread.execute(complete_handler)
+            return
+
+        read_executor = (
+            self._read_executor or StartupOrchestrator.get_default_read_executor()
+        )
+        futures = self._persistence_orchestrator.prefetch_persisted(read_executor)
+        for file_name, future in futures.items():
+            future.add_done_callback(
+                lambda _, file_name=file_name: self._file_read_at.setdefault(
+                    file_name, get_time_ms() - self._start_ts
+                )
+            )
+
+        for entry in roots:
+            self._start(entry)
+
+    def get_timing_report(self) -> str:
+        lines = ["Startup timing report (ms since start):"]
+        for file_name, read_at in sorted(
+            self._file_read_at.items(), key=lambda item: item[1]
+        ):
+            lines.append(f"    file {file_name}: read at {read_at}")
+        for entry in sorted(
+            self._entries.values(),
+            key=lambda e: e.completed_at if e.completed_at is not None else math.inf,
+        ):
+            lines.append(
+                f"    store {entry.name}: started at {entry.started_at}, "
+                f"completed at {entry.completed_at}"
+                + (f", after {', '.join(entry.depends_on)}" if entry.depends_on else "")
+            )
+        return "\n".join(lines)
+
+    def _link_dependencies(self) -> list[_HostEntry]:
+        for entry in self._entries.values():
+            entry.dependents.clear()
+            entry.num_pending_dependencies = len(entry.depends_on)
+        for entry in self._entries.values():
+            for name in entry.depends_on:
+                dependency = self._entries.get(name, None)
+                if dependency is None:
+                    raise ValueError(
+                        f"Host {entry.name} depends on unknown host {name}"
+                    )
+                dependency.dependents.append(entry)
+
+        roots = [e for e in self._entries.values() if not e.num_pending_dependencies]
+        # Kahn's algorithm to detect cycles before anything gets started
+        num_pending = {
+            e.name: e.num_pending_dependencies for e in self._entries.values()
+        }
+        queue = list(roots)
+        num_sorted = 0
+        while queue:
+            entry = queue.pop()
+            num_sorted += 1
+            for dependent in entry.dependents:
+                num_pending[dependent.name] -= 1
+                if num_pending[dependent.name] == 0:
+                    queue.append(dependent)
+        if num_sorted != len(self._entries):
+            raise ValueError("Dependencies of the persisted data hosts contain a cycle")
+        return roots
+
+    def _start(self, entry: _HostEntry):
+        entry.started_at = get_time_ms() - self._start_ts
+        entry.host.read_persisted(lambda: self._on_completed(entry))
+
+    def _on_completed(self, entry: _HostEntry):
+        if entry.completed_at is not None:
+            self.logger.warning(f"Host {entry.name} completed reading more than once")
+            return
+        entry.completed_at = get_time_ms() - self._start_ts
+        self._num_pending -= 1
+        for dependent in entry.dependents:
+            dependent.num_pending_dependencies -= 1
+            if dependent.num_pending_dependencies == 0:
+                self._start(dependent)
+
+        if self._num_pending == 0:
+            self.logger.info(self.get_timing_report())
+            self._complete_handler()
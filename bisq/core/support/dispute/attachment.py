@@ -1,12 +1,67 @@
-from dataclasses import dataclass
+from io import BytesIO
+from typing import TYPE_CHECKING, BinaryIO, Optional
+from bisq.common.crypto.hash import get_sha256_hash
 from bisq.common.protocol.network.network_payload import NetworkPayload
+from bisq.core.exceptions.illegal_state_exception import IllegalStateException
 import pb_pb2 as protobuf
 
+if TYPE_CHECKING:
+    from bisq.core.support.dispute.attachment_store import AttachmentStore
+
 
-@dataclass(frozen=True)
 class Attachment(NetworkPayload):
-    file_name: str
-    bytes: bytes
+    """
+    The content is either held in memory or, once the owning dispute list got
+    persisted, in an `AttachmentStore` and only loaded from disk when needed.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        bytes: Optional[bytes] = None,
+        content_hash: Optional[bytes] = None,
+    ):
+        if bytes is None and content_hash is None:
+            raise ValueError("Either bytes or content_hash must be set")
+        self.file_name = file_name
+        self._bytes = bytes
+        self._content_hash = content_hash
+        self._store: Optional["AttachmentStore"] = None  # transient
+
+    @property
+    def content_hash(self) -> bytes:
+        if self._content_hash is None:
+            self._content_hash = get_sha256_hash(self._bytes)
+        return self._content_hash
+
+    @property
+    def bytes(self) -> bytes:
+        if self._bytes is not None:
+            return self._bytes
+        return self._get_store().read(self._content_hash)
+
+    @property
+    def is_stored(self) -> bool:
+        return self._bytes is None
+
+    def open(self) -> BinaryIO:
+        if self._bytes is not None:
+            return BytesIO(self._bytes)
+        return self._get_store().open(self._content_hash)
+
+    def move_to_store(self, store: "AttachmentStore") -> None:
+        """Writes the content to the store if needed and releases the in memory copy."""
+        if self._bytes is not None:
+            self._content_hash = store.put(self._bytes)
+            self._bytes = None
+        self._store = store
+
+    def _get_store(self) -> "AttachmentStore":
+        if self._store is None:
+            raise IllegalStateException(
+                f"Attachment {self.file_name} is not held in memory and has no store assigned"
+            )
+        return self._store
 
     def to_proto_message(self) -> protobuf.Attachment:
         return protobuf.Attachment(
@@ -14,9 +69,29 @@ class Attachment(NetworkPayload):
             bytes=self.bytes,
         )
 
+    def to_stored_proto_message(self) -> protobuf.Attachment:
+        """Persisted form which references the content by its hash."""
+        return protobuf.Attachment(
+            file_name=self.file_name,
+            content_hash=self.content_hash,
+        )
+
     @staticmethod
     def from_proto(proto: protobuf.Attachment) -> "Attachment":
+        if not proto.bytes and proto.content_hash:
+            return Attachment(file_name=proto.file_name, content_hash=proto.content_hash)
         return Attachment(file_name=proto.file_name, bytes=proto.bytes)
 
+    def __eq__(self, other):
+        if not isinstance(other, Attachment):
+            return False
+        return (
+            self.file_name == other.file_name
+            and self.content_hash == other.content_hash
+        )
+
+    def __hash__(self):
+        return hash((self.file_name, self.content_hash))
+
     def __str__(self) -> str:
-        return f"Attachment{{file_name='{self.file_name}', bytes={len(self.bytes)}}}"
+        return f"Attachment{{file_name='{self.file_name}', content_hash={self.content_hash.hex()}}}"
@@ -0,0 +1,80 @@
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterator, Set
+
+from bisq.common.crypto.hash import get_sha256_hash
+from bisq.common.file.file_util import create_temp_file, rename_file, unlink
+from bisq.common.setup.log_setup import get_ctx_logger
+
+
+class AttachmentStore:
+    """
+    Content addressed blob directory for dispute attachments.
+
+    Attachments are written once, named after the sha256 hash of their content and
+    referenced by that hash from the persisted dispute list, so persisting a dispute
+    list does not need to re-serialize the attachment payloads.
+    """
+
+    def __init__(self, dir: Path):
+        self.logger = get_ctx_logger(__name__)
+        self.dir = dir
+
+    def get_path(self, content_hash: bytes) -> Path:
+        hex_hash = content_hash.hex()
+        return self.dir.joinpath(hex_hash[:2], hex_hash)
+
+    def contains(self, content_hash: bytes) -> bool:
+        return self.get_path(content_hash).is_file()
+
+    def put(self, data: bytes) -> bytes:
+        """Writes the data if not present yet and returns its content hash."""
+        content_hash = get_sha256_hash(data)
+        path = self.get_path(content_hash)
+        if path.is_file():
+            return content_hash
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = create_temp_file("temp_", None, path.parent)
+        try:
+            with temp_file.open("wb") as file_out:
+                file_out.write(data)
+                file_out.flush()
+                os.fsync(file_out.fileno())
+            rename_file(temp_file, path)
+        finally:
+            if temp_file.exists():
+                unlink(temp_file)
+        return content_hash
+
+    def open(self, content_hash: bytes) -> BinaryIO:
+        return self.get_path(content_hash).open("rb")
+
+    def read(self, content_hash: bytes) -> bytes:
+        with self.open(content_hash) as f:
+            return f.read()
+
+    def remove(self, content_hash: bytes) -> bool:
+        return unlink(self.get_path(content_hash))
+
+    def get_all_hashes(self) -> Iterator[bytes]:
+        if not self.dir.is_dir():
+            return
+        for sub_dir in self.dir.iterdir():
+            if not sub_dir.is_dir():
+                continue
+            for file in sub_dir.iterdir():
+                try:
+                    yield bytes.fromhex(file.name)
+                except ValueError:
+                    # leftover temp files or foreign files
+                    pass
+
+    def remove_unreferenced(self, referenced_hashes: Set[bytes]) -> int:
+        removed = 0
+        for content_hash in list(self.get_all_hashes()):
+            if content_hash not in referenced_hashes and self.remove(content_hash):
+                removed += 1
+        if removed:
+            self.logger.info(f"Removed {removed} unreferenced attachment(s) from {self.dir}")
+        return removed
@@ -167,7 +167,7 @@ class Dispute(NetworkPayload, PersistablePayload):
             is_test=False,
         )
         
-    def to_proto_message(self):
+    def to_proto_message(self, stored_attachments: bool = False):
         message = protobuf.Dispute(
             trade_id=self.trade_id,
             trader_id=self.trader_id,
@@ -180,7 +180,7 @@ class Dispute(NetworkPayload, PersistablePayload):
             contract_as_json=self.contract_as_json,
             agent_pub_key_ring=self.agent_pub_key_ring.to_proto_message(),
             is_support_ticket=self.is_support_ticket,
-            chat_message=[m.to_proto_network_envelope().chat_message for m in self.chat_messages],
+            chat_message=[m.to_proto_chat_message(stored_attachments) for m in self.chat_messages],
             is_closed=self.is_closed,
             opening_date=self.opening_date,
             state=DisputeState.to_proto_message(self.dispute_state_property.value),
@@ -196,7 +196,7 @@ class Dispute(NetworkPayload, PersistablePayload):
             dispute_payout_tx_id=self.dispute_payout_tx_id,
             maker_contract_signature=self.maker_contract_signature,
             taker_contract_signature=self.taker_contract_signature,
-            dispute_result=self.dispute_result_property.value.to_proto_message() if self.dispute_result_property.value else None,
+            dispute_result=self.dispute_result_property.value.to_proto_message(stored_attachments) if self.dispute_result_property.value else None,
             support_type=SupportType.to_proto_message(self.support_type) if self.support_type else None,
             mediators_dispute_result=self.mediators_dispute_result,
             delayed_payout_tx_id=self.delayed_payout_tx_id,
@@ -274,6 +274,13 @@ class Dispute(NetworkPayload, PersistablePayload):
         else:
             self.logger.error("disputeDirectMessage already exists")
             
+    def get_all_chat_messages_with_attachments(self) -> list["ChatMessage"]:
+        messages = [m for m in self.chat_messages if m.attachments]
+        dispute_result = self.dispute_result_property.value
+        if dispute_result and dispute_result.chat_message and dispute_result.chat_message.attachments:
+            messages.append(dispute_result.chat_message)
+        return messages
+
     def remove_all_chat_messages(self):
         if len(self.chat_messages) > 1:
             # removes all chat except the initial guidelines message.
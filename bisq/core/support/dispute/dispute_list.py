@@ -1,10 +1,13 @@
 from abc import ABC
-from typing import TypeVar
+from typing import TYPE_CHECKING, Optional, TypeVar
 from bisq.common.protocol.persistable.persistable_list_as_observable import (
     PersistableListAsObservable,
 )
 from bisq.common.protocol.persistable.persistable_payload import PersistablePayload
 
+if TYPE_CHECKING:
+    from bisq.core.support.dispute.attachment_store import AttachmentStore
+
 
 _T = TypeVar("T", bound=PersistablePayload)
 
@@ -15,6 +18,56 @@ class DisputeList(PersistableListAsObservable[_T], ABC):
 
     Calls to the List are delegated because this class intercepts the add/remove calls so changes
     can be saved to disc.
+
+    If an attachment store is set, attachments are moved to it when the list gets persisted
+    and the persisted list only references them by their content hash.
     """
 
-    pass
+    def __init__(self, collection=None):
+        super().__init__(collection)
+        self.attachment_store: Optional["AttachmentStore"] = None  # transient
+        # hashes referenced by the last two serialized versions of the list, as the
+        # previous one stays on disk until the write of the latest one has completed
+        self._persisted_attachment_hashes: set[bytes] = set()
+        self._previous_persisted_attachment_hashes: set[bytes] = set()
+
+    def to_persistable_message(self):
+        if self.attachment_store is None:
+            return self.to_proto_message()
+
+        hashes: set[bytes] = set()
+        for dispute in self.list:
+            for chat_message in dispute.get_all_chat_messages_with_attachments():
+                chat_message.move_attachments_to_store(self.attachment_store)
+                hashes.update(a.content_hash for a in chat_message.attachments)
+        self._previous_persisted_attachment_hashes = self._persisted_attachment_hashes
+        self._persisted_attachment_hashes = hashes
+        return self.to_proto_message(stored_attachments=True)
+
+    def set_attachment_store(self, attachment_store: "AttachmentStore"):
+        """Assigns the store to the list and all attachments currently in it."""
+        self.attachment_store = attachment_store
+        hashes: set[bytes] = set()
+        for dispute in self.list:
+            for chat_message in dispute.get_all_chat_messages_with_attachments():
+                for attachment in chat_message.attachments:
+                    if attachment.is_stored:
+                        attachment.move_to_store(attachment_store)
+                        hashes.add(attachment.content_hash)
+        # what we just read from disk is what has been persisted last
+        self._persisted_attachment_hashes = hashes
+
+    def remove_unreferenced_attachments(self) -> int:
+        """
+        Deletes all blobs which are neither referenced by the in-memory list nor by
+        the recently persisted versions of it, so a crash before the next write can
+        not leave the file on disk with dangling references.
+        """
+        if self.attachment_store is None:
+            return 0
+
+        referenced = self._persisted_attachment_hashes | self._previous_persisted_attachment_hashes
+        for dispute in self.list:
+            for chat_message in dispute.get_all_chat_messages_with_attachments():
+                referenced.update(a.content_hash for a in chat_message.attachments)
+        return self.attachment_store.remove_unreferenced(referenced)
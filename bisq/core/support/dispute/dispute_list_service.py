@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, TypeVar, Generic, Set, List, Optional
 from bisq.common.persistence.persistence_manager_source import PersistenceManagerSource
 from bisq.common.protocol.persistable.persistable_data_host import PersistedDataHost
 from bisq.common.user_thread import UserThread
+from bisq.core.support.dispute.attachment_store import AttachmentStore
 from utils.data import ObservableChangeEvent, SimpleProperty
 
 if TYPE_CHECKING:
@@ -23,6 +24,10 @@ class DisputeListService(Generic[T], PersistedDataHost, ABC):
         self._subscriptions: list[Callable[[], None]] = []
         
         self._persistence_manager.initialize(self._dispute_list, PersistenceManagerSource.PRIVATE, self.get_file_name())
+        self._attachment_store = AttachmentStore(
+            self._persistence_manager.dir.joinpath(f"{self.get_file_name()}_attachments")
+        )
+        self._dispute_list.set_attachment_store(self._attachment_store)
 
     @property
     def persistence_manager(self) -> "PersistenceManager[T]":
@@ -51,6 +56,7 @@ class DisputeListService(Generic[T], PersistedDataHost, ABC):
     def read_persisted(self, complete_handler: Callable[[], None]) -> None:
         def on_persisted(persisted: T) -> None:
             self._dispute_list.set_all(persisted.list)
+            self._dispute_list.set_attachment_store(self._attachment_store)
             complete_handler()
         
         self._persistence_manager.read_persisted(on_persisted, complete_handler, file_name=self.get_file_name())
@@ -68,6 +74,10 @@ class DisputeListService(Generic[T], PersistedDataHost, ABC):
             trade_id = dispute.trade_id
             if dispute.is_result_proposed and closed_dispute_handler:
                 closed_dispute_handler(trade_id)
+        self.remove_unreferenced_attachments()
+
+    def remove_unreferenced_attachments(self) -> None:
+        self._dispute_list.remove_unreferenced_attachments()
                 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // (JAVA) Package scope
@@ -299,6 +299,7 @@ class DisputeManager(Generic[_T], SupportManager, ABC):
                 dispute.maybe_clear_sensitive_data()
         
         self.request_persistence()
+        self.dispute_list_service.remove_unreferenced_attachments()
 
     # ///////////////////////////////////////////////////////////////////////////////////////////
     # // Message handler
@@ -76,7 +76,7 @@ class DisputeResult(NetworkPayload):
             payout_suggestion=DisputeResultPayoutSuggestion.from_proto(proto.payout_suggestion)
         )
         
-    def to_proto_message(self):
+    def to_proto_message(self, stored_attachments: bool = False):
         result = protobuf.DisputeResult(
             trade_id=self.trade_id,
             trader_id=self.trader_id,
@@ -96,7 +96,7 @@ class DisputeResult(NetworkPayload):
         if self.winner:
             result.winner = DisputeResultWinner.to_proto_message(self.winner)
         if self.chat_message:
-            result.chat_message.CopyFrom(self.chat_message.to_proto_network_envelope().chat_message)
+            result.chat_message.CopyFrom(self.chat_message.to_proto_chat_message(stored_attachments))
         if self.payout_suggestion:
             result.payout_suggestion = DisputeResultPayoutSuggestion.to_proto_message(self.payout_suggestion)
         return result
@@ -1,5 +1,4 @@
-from datetime import timedelta
-from typing import Optional
+from typing import BinaryIO, Optional
 from bisq.common.config.config import Config
 from bisq.common.setup.log_setup import get_ctx_logger
 from bisq.common.user_thread import UserThread
@@ -13,6 +12,10 @@ from utils.formatting import get_short_id
 
 
 class FileTransferReceiver(FileTransferSession):
+    """
+    Receives the blocks sent by a FileTransferSender. Every block is written into place
+    at its offset, so blocks do not need to arrive in order.
+    """
 
     def __init__(
         self,
@@ -24,6 +27,8 @@ class FileTransferReceiver(FileTransferSession):
         config: Config,
         callback: Optional[FileTransferSession.FtpCallback] = None,
     ):
+        self.received_block_seq_nums: set[int] = set()
+        self._file: Optional[BinaryIO] = None
         super().__init__(
             network_node, peer_node_address, trade_id, trader_id, trader_role, callback
         )
@@ -31,24 +36,35 @@ class FileTransferReceiver(FileTransferSession):
         self._config = config
         self.zip_file_path = self.ensure_receiving_directory_exists().joinpath(self.zip_id + ".zip")
     
+    def reset_session(self) -> None:
+        super().reset_session()
+        self.received_block_seq_nums = set()
+        self._close_file()
+
+    def _close_file(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
     def process_file_part_received(self, ftp: FileTransferPart):
         self.checkpoint_last_activity()
-        # check that the supplied sequence number is in line with what we are expecting
         if self.current_block_seq_num < 0:
             # we have not yet started receiving a file, validate this ftp packet as the initiation request
             self.init_receive_session(ftp.uid, ftp.seq_num_or_file_length)
-        elif self.current_block_seq_num == ftp.seq_num_or_file_length:
-            # we are in the middle of receiving a file; add the block of data to the file
-            self.process_received_block(ftp, self.network_node, self.peer_node_address)
+        elif ftp.is_initial_request:
+            # our ACK for the initiation request got lost and the peer sent it again
+            UserThread.execute(lambda: self.ack_received_part(ftp.uid, self.network_node, self.peer_node_address))
         else:
-            self.logger.error(f"ftp sequence num mismatch, expected {self.current_block_seq_num} received {ftp.seq_num_or_file_length}")
-            self.reset_session() # aborts the file transfer
+            # blocks can arrive out of order or more than once, as the sender keeps several blocks in flight
+            # and re-sends blocks it did not get an ACK for
+            self.process_received_block(ftp, self.network_node, self.peer_node_address)
     
     def init_receive_session(self, uid: str, expected_file_bytes: int):
         self.network_node.add_message_listener(self)
         self.expected_file_length = expected_file_bytes
         self.file_offset_bytes = 0
         self.current_block_seq_num = 0
+        self.received_block_seq_nums = set()
         self.init_session_timer()
         self.logger.info(f"Received a start file transfer request, tradeId={self.full_trade_id}, traderId={self.trader_id}, size={self.expected_file_length}")
         self.logger.info(f"New file will be written to {self.zip_file_path}")
@@ -56,33 +72,53 @@ class FileTransferReceiver(FileTransferSession):
     
     def shut_down(self):
         self.network_node.remove_message_listener(self)
+        self._close_file()
     
     def process_received_block(self, ftp: FileTransferPart, network_node: NetworkNode, peer_node_address: NodeAddress):
-        try:
-            with open(self.zip_file_path, "rb+" if self.zip_file_path.exists() else "wb+") as file:
-                file.seek(self.file_offset_bytes)
-                file.write(ftp.message_data)
-                self.file_offset_bytes += len(ftp.message_data)
-                self.logger.info(f"Sequence number {ftp.seq_num_or_file_length} for {get_short_id(ftp.trade_id)}, "
-                          f"received data {self.file_offset_bytes} / {self.expected_file_length}")
-                self.current_block_seq_num += 1
-                
-                def completion_check():
-                    self.ack_received_part(ftp.uid, network_node, peer_node_address)
-                    if self.file_offset_bytes >= self.expected_file_length:
-                        self.logger.info(f"Success! We have reached the EOF, received {self.file_offset_bytes} "
-                                  f"expected {self.expected_file_length}")
-                        if self.ftp_callback:
-                            self.ftp_callback.on_ftp_complete(self)
-                        self.reset_session()
+        seq_num = ftp.seq_num_or_file_length
+        if seq_num in self.received_block_seq_nums:
+            self.logger.info(f"Received block {seq_num} again, our ACK probably got lost. Sending ACK again")
+            UserThread.execute(lambda: self.ack_received_part(ftp.uid, network_node, peer_node_address))
+            return
 
-                UserThread.run_after(completion_check, timedelta(milliseconds=100))
+        offset = seq_num * self.FILE_BLOCK_SIZE
+        if seq_num < 0 or offset + len(ftp.message_data) > self.expected_file_length:
+            self.logger.error(f"ftp sequence num {seq_num} with length {len(ftp.message_data)} is out of bounds for expected file length {self.expected_file_length}")
+            self.reset_session() # aborts the file transfer
+            return
+
+        try:
+            if self._file is None:
+                # first block of this session, truncate what an earlier upload may have left
+                self._file = open(self.zip_file_path, "wb+")
+            self._file.seek(offset)
+            self._file.write(ftp.message_data)
         except IOError as e:
             self.logger.error(str(e), exc_info=e)
+            return
+
+        self.received_block_seq_nums.add(seq_num)
+        self.file_offset_bytes += len(ftp.message_data)
+        self.current_block_seq_num = len(self.received_block_seq_nums)
+        self.logger.info(f"Sequence number {seq_num} for {get_short_id(ftp.trade_id)}, "
+                         f"received data {self.file_offset_bytes} / {self.expected_file_length}")
+
+        def completion_check():
+            self.ack_received_part(ftp.uid, network_node, peer_node_address)
+            if self.transfer_is_in_progress or self._file is None:
+                return
+            self.logger.info(f"Success! We have reached the EOF, received {self.file_offset_bytes} "
+                             f"expected {self.expected_file_length}")
+            self._close_file()
+            if self.ftp_callback:
+                self.ftp_callback.on_ftp_complete(self)
+            self.reset_session()
+
+        UserThread.execute(completion_check)
 
     def ack_received_part(self, uid: str, network_node: NetworkNode, peer_node_address: NodeAddress):
         ack_message = AckMessage(
-            sender_node_address=peer_node_address,
+            sender_node_address=network_node.node_address_property.value,
             source_type=AckMessageSourceType.LOG_TRANSFER,
             source_msg_class_name=FileTransferPart.__name__,
             source_uid=uid,
@@ -1,19 +1,29 @@
 from datetime import timedelta
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 import zipfile
 import uuid
 from bisq.common.file.file_util import does_file_contain_keyword
 from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.common.timer import Timer
 from bisq.common.user_thread import UserThread
 from bisq.core.network.p2p.file_transfer_part import FileTransferPart
 from bisq.core.network.p2p.network.network_node import NetworkNode
 from bisq.core.network.p2p.node_address import NodeAddress
 from bisq.core.support.dispute.mediation.file_transfer_session import FileTransferSession
 from bisq.core.user.user import User
+from utils.time import get_time_ms
 
 
 class FileTransferSender(FileTransferSession):
+    """
+    Sends the zipped log files in blocks, keeping up to WINDOW_SIZE blocks in flight
+    instead of waiting for the ACK of each block before sending the next one.
+    Blocks which are not acknowledged in time are sent again.
+    """
+
+    WINDOW_SIZE = 8
+    PART_ACK_TIMEOUT_MILLIS = int(timedelta(seconds=20).total_seconds()*1000)
 
     def __init__(
         self,
@@ -26,6 +36,11 @@ class FileTransferSender(FileTransferSession):
         callback: Optional[FileTransferSession.FtpCallback] = None,
         is_test: bool = False,
     ):
+        self.parts_awaiting_ack: dict[str, FileTransferPart] = {}
+        self._part_send_times: dict[str, int] = {}
+        self._file: Optional[BinaryIO] = None
+        self._transfer_start_time = 0
+        self._resend_timer: Optional[Timer] = None
         super().__init__(
             network_node, peer_node_address, trade_id, trader_id, trader_role, callback
         )
@@ -64,82 +79,119 @@ class FileTransferSender(FileTransferSession):
         # Get file size
         file_size = self.zip_file_path.stat().st_size
         self.expected_file_length = file_size
-        
-        # an empty block is sent as request to initiate file transfer, peer must ACK for transfer to continue
-        self.data_awaiting_ack = FileTransferPart(
-            self.network_node.node_address_property.value,
-            self.full_trade_id,
-            self.trader_id,
-            str(uuid.uuid4()),
-            self.expected_file_length,
-            bytes()
+        # the file stays open for the whole transfer, blocks are read sequentially
+        self._file = open(self.zip_file_path, "rb")
+        self._transfer_start_time = get_time_ms()
+        self._resend_timer = UserThread.run_periodically(
+            self._resend_timed_out_parts,
+            timedelta(milliseconds=self.PART_ACK_TIMEOUT_MILLIS / 2),
         )
         
-        self.upload_data()
+        # an empty block is sent as request to initiate file transfer, peer must ACK for transfer to continue
+        self._send_part(FileTransferPart(
+            sender_node_address=self.network_node.node_address_property.value,
+            trade_id=self.full_trade_id,
+            trader_id=self.trader_id,
+            uid=str(uuid.uuid4()),
+            seq_num_or_file_length=self.expected_file_length,
+            message_data=bytes(),
+        ))
 
-    
-    def send_next_block(self):
-        if self.data_awaiting_ack is not None:
-            error_msg = "prep_next_block_to_send invoked, but we are still waiting for a previous ACK"
-            self.logger.warning(error_msg)
-            raise RuntimeError(error_msg)
+    def reset_session(self) -> None:
+        super().reset_session()
+        self.parts_awaiting_ack = {}
+        self._part_send_times = {}
+        self._close_file()
+        if self._resend_timer:
+            self._resend_timer.stop()
+            self._resend_timer = None
 
-        with open(self.zip_file_path, "rb") as file:
-            file.seek(self.file_offset_bytes)
-            buff = file.read(self.FILE_BLOCK_SIZE)
+    def _close_file(self):
+        if self._file:
+            self._file.close()
+            self._file = None
 
-        if not buff:  # EOF reached
-            self.logger.info(f"Success! We have reached the EOF, {self.file_offset_bytes} bytes sent. Removing zip file {self.zip_file_path}")
-            self.zip_file_path.unlink(True)
-            if self.ftp_callback:
-                self.ftp_callback.on_ftp_complete(self)
-            UserThread.run_after(self.reset_session, timedelta(seconds=1))
+    @property
+    def _initial_request_pending(self) -> bool:
+        return self.current_block_seq_num < 0
+
+    def fill_window(self):
+        """Sends blocks until WINDOW_SIZE parts are waiting for their ACK or EOF is reached."""
+        if self._file is None or self._initial_request_pending:
             return
 
-        self.data_awaiting_ack = FileTransferPart(
-            self.network_node.node_address_property.value,
-            self.full_trade_id,
-            self.trader_id,
-            str(uuid.uuid4()),
-            self.current_block_seq_num,
-            buff
-        )
-        
-        self.upload_data()
+        while len(self.parts_awaiting_ack) < self.WINDOW_SIZE:
+            if not self.send_next_block():
+                break
+
+        if not self.parts_awaiting_ack and self.file_offset_bytes >= self.expected_file_length:
+            self._on_transfer_complete()
+
+    def send_next_block(self) -> bool:
+        """Reads and sends the next block. Returns False if EOF was reached."""
+        buff = self._file.read(self.FILE_BLOCK_SIZE)
+        if not buff:  # EOF reached
+            return False
+
+        self._send_part(FileTransferPart(
+            sender_node_address=self.network_node.node_address_property.value,
+            trade_id=self.full_trade_id,
+            trader_id=self.trader_id,
+            uid=str(uuid.uuid4()),
+            seq_num_or_file_length=self.current_block_seq_num,
+            message_data=buff,
+        ))
+        self.current_block_seq_num += 1
+        return True
+
+    def _on_transfer_complete(self):
+        duration = max(get_time_ms() - self._transfer_start_time, 1)
+        self.logger.info(f"Success! We have reached the EOF, {self.file_offset_bytes} bytes sent in {duration} ms "
+                         f"({self.throughput_bytes_per_sec / 1024:.1f} kB/s). Removing zip file {self.zip_file_path}")
+        self._close_file()
+        self.zip_file_path.unlink(True)
+        if self.ftp_callback:
+            self.ftp_callback.on_ftp_complete(self)
+        UserThread.run_after(self.reset_session, timedelta(seconds=1))
 
     def retry_send(self):
         if self.transfer_is_in_progress:
-            self.logger.info("Retry send of current block")
+            self.logger.info(f"Retry send of {len(self.parts_awaiting_ack)} unacknowledged block(s)")
             self.init_session_timer()
-            self.upload_data()
+            for ftp in list(self.parts_awaiting_ack.values()):
+                self._send_part(ftp)
         else:
             def timeout_callback():
                 if self.ftp_callback:
                     self.ftp_callback.on_ftp_timeout("Could not re-send", self)
             UserThread.run_after(timeout_callback, timedelta(seconds=1))
 
-    def upload_data(self):
-        if self.data_awaiting_ack is None:
-            return
-        
-        ftp = self.data_awaiting_ack
+    def _resend_timed_out_parts(self):
+        now = get_time_ms()
+        for uid, ftp in list(self.parts_awaiting_ack.items()):
+            if now - self._part_send_times.get(uid, now) >= self.PART_ACK_TIMEOUT_MILLIS:
+                self.logger.info(f"No ACK for FileTransferPart seq {ftp.seq_num_or_file_length} received in time, sending it again")
+                self._send_part(ftp)
+
+    def _send_part(self, ftp: FileTransferPart):
+        self.parts_awaiting_ack[ftp.uid] = ftp
+        self._part_send_times[ftp.uid] = get_time_ms()
         self.logger.info(f"Send FileTransferPart seq {ftp.seq_num_or_file_length} length {len(ftp.message_data)} to peer {self.peer_node_address}, UID={ftp.uid}")
         self.send_message(ftp, self.network_node, self.peer_node_address)
 
     def process_ack_for_file_part(self, ack_uid: str) -> bool:
-        if self.data_awaiting_ack is None:
+        ftp = self.parts_awaiting_ack.pop(ack_uid, None)
+        if ftp is None:
+            # can be the late ACK of a part we have sent twice
             self.logger.warning(f"We received an ACK we were not expecting. {ack_uid}")
             return False
-            
-        if self.data_awaiting_ack.uid != ack_uid:
-            self.logger.warning("We received an ACK that has a different UID to what we were expecting. We ignore and wait for the correct ACK")
-            self.logger.info(f"Received {ack_uid} expecting {self.data_awaiting_ack.uid}")
-            return False
-            
-        # fileOffsetBytes gets incremented by the size of the block that was ack'd
-        self.file_offset_bytes += len(self.data_awaiting_ack.message_data)
-        self.current_block_seq_num += 1
-        self.data_awaiting_ack = None
+        self._part_send_times.pop(ack_uid, None)
+
+        if ftp.is_initial_request:
+            self.current_block_seq_num = 0
+        else:
+            # fileOffsetBytes gets incremented by the size of the block that was ack'd
+            self.file_offset_bytes += len(ftp.message_data)
         self.checkpoint_last_activity()
         self.update_progress()
         
@@ -148,15 +200,22 @@ class FileTransferSender(FileTransferSession):
             
         def send_next():
             try:
-                self.send_next_block()
+                self.fill_window()
             except Exception as e:
                 self.logger.error(str(e), exc_info=e)
                 
-        UserThread.run_after(send_next, timedelta(milliseconds=100)) # to trigger continuing the file transfer
+        UserThread.execute(send_next) # to trigger continuing the file transfer
         return True
 
+    @property
+    def throughput_bytes_per_sec(self) -> float:
+        duration = get_time_ms() - self._transfer_start_time
+        if duration <= 0:
+            return 0.0
+        return self.file_offset_bytes * 1000 / duration
+
     def update_progress(self):
         progress_pct = (self.file_offset_bytes / self.expected_file_length if self.expected_file_length > 0 else 0.0)
         if self.ftp_callback:
             self.ftp_callback.on_ftp_progress(progress_pct)
-        self.logger.info(f"ftp progress: {progress_pct * 100:.0f}%")
+        self.logger.info(f"ftp progress: {progress_pct * 100:.0f}%, {self.throughput_bytes_per_sec / 1024:.1f} kB/s")
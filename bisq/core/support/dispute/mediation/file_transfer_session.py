@@ -48,7 +48,6 @@ class FileTransferSession(MessageListener, ABC):
         self.ftp_callback = callback
         self.zip_id = f"{get_short_id(self.full_trade_id)}_{trader_role.upper()}_" \
                      f"{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self.data_awaiting_ack: Optional[FileTransferPart] = None
         self.file_offset_bytes = 0
         self.current_block_seq_num = -1
         self.expected_file_length = 0
@@ -56,7 +55,6 @@ class FileTransferSession(MessageListener, ABC):
         self.reset_session()
 
     def reset_session(self) -> None:
-        self.data_awaiting_ack = None
         self.file_offset_bytes = 0
         self.current_block_seq_num = -1
         self.expected_file_length = 0
@@ -100,7 +98,7 @@ class FileTransferSession(MessageListener, ABC):
         else:
             self.logger.warning(f"File transfer session timed out. expected: {self.expected_file_length} received: {self.file_offset_bytes}")
             if self.ftp_callback:
-                self.ftp_callback.on_ftp_timeout("Timed out during send")
+                self.ftp_callback.on_ftp_timeout("Timed out during send", self)
     
     def init_session_timer(self):
         UserThread.run_after(self._session_timer_handler, timedelta(milliseconds=self.FTP_SESSION_TIMEOUT_MILLIS/4)) # check more frequently than the timeout
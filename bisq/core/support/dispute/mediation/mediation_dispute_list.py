@@ -1,5 +1,4 @@
 from typing import TYPE_CHECKING, TypeVar 
-from bisq.common.protocol.proto_util import ProtoUtil
 from bisq.core.support.dispute.dispute_list import DisputeList
 from bisq.core.support.support_type import SupportType
 import pb_pb2 as protobuf
@@ -18,13 +17,13 @@ class MediationDisputeList(DisputeList[_T]):
     can be saved to disc.
     """
         
-    def to_proto_message(self):
+    def to_proto_message(self, stored_attachments: bool = False):
         for dispute in self.list:
             assert dispute.support_type == SupportType.MEDIATION, "Support type has to be MEDIATION"
 
         return protobuf.PersistableEnvelope(
             mediation_dispute_list=protobuf.MediationDisputeList(
-                dispute=ProtoUtil.collection_to_proto(self.list, protobuf.Dispute)
+                dispute=[dispute.to_proto_message(stored_attachments) for dispute in self.list]
             )
         )
 
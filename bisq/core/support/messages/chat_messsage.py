@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
 from datetime import timedelta
-from typing import ClassVar, List, Optional
+from typing import TYPE_CHECKING, ClassVar, List, Optional
 from uuid import uuid4
 from weakref import ref
 
@@ -17,6 +17,9 @@ from utils.formatting import get_short_id
 from utils.time import get_time_ms
 import pb_pb2 as protobuf
 
+if TYPE_CHECKING:
+    from bisq.core.support.dispute.attachment_store import AttachmentStore
+
 
 class ChatMessageListener(ABC):
     @abstractmethod
@@ -82,14 +85,28 @@ class ChatMessage(SupportMessage):
 
     # We cannot rename protobuf definition because it would break backward compatibility (???)
     def to_proto_network_envelope(self) -> protobuf.NetworkEnvelope:
-        message = protobuf.ChatMessage(
+        envelope = self.get_network_envelope_builder()
+        envelope.chat_message.CopyFrom(self.to_proto_chat_message())
+        return envelope
+
+    def to_proto_chat_message(self, stored_attachments: bool = False) -> protobuf.ChatMessage:
+        """
+        If stored_attachments is True, attachments are referenced by their content hash
+        instead of carrying their bytes. Only used for persistence.
+        """
+        return protobuf.ChatMessage(
             type=SupportType.to_proto_message(self.support_type),
             trade_id=self.trade_id,
             trader_id=self.trader_id,
             sender_is_trader=self.sender_is_trader,
             message=self.message,
             attachments=[
-                attachment.to_proto_message() for attachment in self.attachments
+                (
+                    attachment.to_stored_proto_message()
+                    if stored_attachments
+                    else attachment.to_proto_message()
+                )
+                for attachment in self.attachments
             ],
             sender_node_address=self.sender_node_address.to_proto_message(),
             date=self.date,
@@ -104,9 +121,6 @@ class ChatMessage(SupportMessage):
             ),
             ack_error=self.ack_error_property.value if self.ack_error_property else None,
         )
-        envelope = self.get_network_envelope_builder()
-        envelope.chat_message.CopyFrom(message)
-        return envelope
 
     # The protobuf definition ChatMessage cannot be changed as it would break backward compatibility.
     @staticmethod
@@ -148,6 +162,10 @@ class ChatMessage(SupportMessage):
     def add_all_attachments(self, attachments: List[Attachment]):
         self.attachments.extend(attachments)
 
+    def move_attachments_to_store(self, store: "AttachmentStore"):
+        for attachment in self.attachments:
+            attachment.move_to_store(store)
+
     def set_arrived(self, arrived: bool):
         self.arrived_property.value = arrived
         self.notify_change_listener()
@@ -85,6 +85,21 @@ class TradeStatisticsManager:
                     )
                     self.maybe_dump_statistics()
 
+            def on_added_all(self_, payloads):
+                trade_statistics = [
+                    payload
+                    for payload in payloads
+                    if isinstance(payload, TradeStatistics3) and payload.is_valid()
+                ]
+                if not trade_statistics:
+                    return
+                self.observable_trade_statistics_set.update(trade_statistics)
+                for payload in trade_statistics:
+                    self._price_feed_service.set_bisq_market_price(
+                        payload.currency, payload.get_trade_price()
+                    )
+                self.maybe_dump_statistics()
+
         self._subscriptions.append(
             self._p2p_service.p2p_data_storage.add_append_only_data_store_listener(
                 Listener()
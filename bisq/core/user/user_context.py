@@ -20,10 +20,11 @@ from bisq.common.setup.log_setup import (
     add_user_handler_to_shared,
 )
 from bisq.core.setup.core_persisted_data_host import CorePersistedDataHost
+from bisq.core.setup.startup_orchestrator import StartupOrchestrator
 from bisq.core.user.user import User
 from global_container import GlobalContainer
-from utils.concurrency import AtomicInt
 from twisted.internet.defer import Deferred
+from utils.time import get_time_ms
 import asyncio
 
 
@@ -38,6 +39,12 @@ class UserContext:
     _bisq_app: Optional[BisqApp] = field(default=None, init=False)
     _lock: Lock = field(default_factory=lambda: Lock(), init=False)
     """only not None when UserManager.init_user has been called for user_id"""
+    last_activity_ms: int = field(default_factory=get_time_ms, init=False)
+    hibernated: bool = field(default=False, init=False)
+    """True if the services of the user got shut down by UserManager.hibernate_user"""
+    _transition_lock: asyncio.Lock = field(
+        default_factory=lambda: asyncio.Lock(), init=False
+    )
 
     @property
     def key_ring(self):
@@ -51,22 +58,32 @@ class UserContext:
     def __repr__(self):
         return f"User(id={self.user_id}, alias={self.alias})"
 
+    @property
+    def is_running(self):
+        return self.global_container is not None
+
+    @property
+    def transition_lock(self):
+        """Serializes starting and hibernating of the user"""
+        return self._transition_lock
+
+    def touch(self):
+        self.last_activity_ms = get_time_ms()
+
     async def _read_all_persisted_user_data(
         self,
     ):
-        # TODO: make reading async at persistence manager
-        hosts = CorePersistedDataHost.get_persisted_data_hosts(self.global_container)
+        startup_orchestrator = StartupOrchestrator(self.persistence_orchestrator)
+        hosts = CorePersistedDataHost.get_persisted_data_hosts_by_name(
+            self.global_container
+        )
+        for name, host in hosts.items():
+            startup_orchestrator.add_host(
+                name, host, CorePersistedDataHost.DEPENDENCIES.get(name, ())
+            )
 
-        remaining = AtomicInt(len(hosts))
         d = Deferred()
-
-        def _on_host_read():
-            if remaining.decrement_and_get() == 0:
-                d.callback(True)
-
-        for host in hosts:
-            host.read_persisted(_on_host_read)
-
+        startup_orchestrator.read_all(lambda: d.callback(True))
         await as_future(d)
 
     async def start(
@@ -0,0 +1,279 @@
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Optional
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.common.user_thread import UserThread
+from bisq.common.util.profiler import Profiler
+from bisq.core.network.p2p.storage.hash_map_changed_listener import (
+    HashMapChangedListener,
+)
+from bisq.core.network.p2p.storage.payload.protected_mailbox_storage_entry import (
+    ProtectedMailboxStorageEntry,
+)
+from utils.aio import FutureCallback, as_future
+from utils.time import get_time_ms
+
+if TYPE_CHECKING:
+    from bisq.common.config.config import Config
+    from bisq.common.timer import Timer
+    from bisq.core.network.p2p.storage.p2p_data_storage import P2PDataStorage
+    from bisq.core.network.p2p.storage.payload.protected_storage_entry import (
+        ProtectedStorageEntry,
+    )
+    from bisq.core.user.user_context import UserContext
+    from bisq.core.user.user_manager import UserManager
+    from shared_container import SharedContainer
+
+
+@dataclass(frozen=True)
+class UserHibernationPolicy:
+    # 0 disables the respective rule
+    idle_timeout_sec: int = 0
+    max_awake_users: int = 0
+    memory_cap_mb: int = 0
+    always_online_user_ids: frozenset[str] = frozenset()
+    mailbox_check_interval_sec: int = 0
+    check_interval_sec: int = 30
+
+    @staticmethod
+    def from_config(config: "Config") -> "UserHibernationPolicy":
+        return UserHibernationPolicy(
+            idle_timeout_sec=config.user_hibernation_idle_timeout_sec,
+            max_awake_users=config.max_awake_users,
+            memory_cap_mb=config.user_memory_cap_mb,
+            always_online_user_ids=frozenset(config.always_online_users),
+            mailbox_check_interval_sec=config.hibernated_user_mailbox_check_interval_sec,
+        )
+
+    @property
+    def is_hibernation_enabled(self):
+        return (
+            self.idle_timeout_sec > 0
+            or self.max_awake_users > 0
+            or self.memory_cap_mb > 0
+        )
+
+
+class UserHibernationService(HashMapChangedListener):
+    """
+    Hibernates users which do not need to be online according to the UserHibernationPolicy and
+    wakes them up again when they are needed.
+
+    A hibernated user keeps only its User with the keys loaded, all its services get shut down
+    after its data got flushed to disk. It gets woken up by an api call while it is the active
+    user, if a mailbox message addressed to it shows up in the data storage of another awake user
+    or periodically to receive its mailbox messages from the seed nodes.
+
+    CPython rarely returns freed memory to the OS, so the used memory might not drop after a user
+    got hibernated for the memory cap. Then no further users get hibernated for the cap until
+    another user got woken up.
+    """
+
+    # Minimum drop of the used memory after a hibernation for the memory cap to hibernate the next
+    MIN_MEMORY_GAIN_MB = 10
+
+    def __init__(
+        self,
+        user_manager: "UserManager",
+        shared_container: "SharedContainer",
+        policy: "UserHibernationPolicy",
+    ):
+        self.logger = get_ctx_logger(__name__)
+        self._user_manager = user_manager
+        self._shared_container = shared_container
+        self.policy = policy
+        self._timer: Optional["Timer"] = None
+        # user_id -> data storage we listen to for mailbox entries of hibernated users
+        self._observed_storages: dict[str, "P2PDataStorage"] = {}
+        # user_id -> ms when the user got hibernated
+        self._hibernated_at: dict[str, int] = {}
+        # used memory when the last user got selected for the memory cap
+        self._memory_before_cap_hibernation_mb: Optional[float] = None
+
+    def start(self):
+        for user_id in self.policy.always_online_user_ids:
+            try:
+                self._user_manager.get_user_context(user_id)
+            except Exception:
+                self.logger.warning(f"Always online user `{user_id}` does not exist")
+                continue
+            self._wake_user(user_id, "user is always online")
+
+        if self.policy.is_hibernation_enabled or self.policy.mailbox_check_interval_sec:
+            self._timer = UserThread.run_periodically(
+                self.check, timedelta(seconds=self.policy.check_interval_sec)
+            )
+
+    def shut_down(self):
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+        for storage in self._observed_storages.values():
+            storage.remove_hash_map_changed_listener(self)
+        self._observed_storages.clear()
+
+    def on_user_activity(self, user_id: str):
+        self._user_manager.get_user_context(user_id).touch()
+
+    async def wake_user(self, user_id: str) -> bool:
+        woken = await self._user_manager.wake_user(user_id, self._shared_container)
+        self._hibernated_at.pop(user_id, None)
+        if woken:
+            # The woken user needs memory again, so hibernating another one can reduce it
+            self._memory_before_cap_hibernation_mb = None
+        self._update_observed_storages()
+        return woken
+
+    async def hibernate_user(self, user_id: str) -> bool:
+        storage = self._observed_storages.pop(user_id, None)
+        if storage is not None:
+            storage.remove_hash_map_changed_listener(self)
+        hibernated = await self._user_manager.hibernate_user(user_id)
+        if hibernated:
+            self._hibernated_at[user_id] = get_time_ms()
+        return hibernated
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // Policy
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    def get_keep_awake_reason(self, ctx: "UserContext") -> Optional[str]:
+        if ctx.user_id in self.policy.always_online_user_ids:
+            return "user is always online"
+        if not ctx.persistence_orchestrator.all_services_initialized.get():
+            return "user is starting up"
+        global_container = ctx.global_container
+        if not global_container.p2p_service.is_bootstrapped:
+            # Until then the mailbox messages were not received and processed
+            return "user is receiving its mailbox messages"
+        if global_container.open_offer_manager.get_observable_list():
+            return "user has open offers"
+        if global_container.trade_manager.get_observable_list():
+            return "user has pending trades"
+        return None
+
+    def select_users_to_hibernate(
+        self, now_ms: int, used_memory_mb: float
+    ) -> list["UserContext"]:
+        """Returns the users to hibernate, least recently active first."""
+        if not self.policy.is_hibernation_enabled:
+            return []
+        awake = [ctx for ctx in self._user_manager.get_all_contexts() if ctx.is_running]
+        candidates = sorted(
+            (ctx for ctx in awake if self.get_keep_awake_reason(ctx) is None),
+            key=lambda ctx: ctx.last_activity_ms,
+        )
+
+        selected = []
+        if self.policy.idle_timeout_sec:
+            idle_timeout_ms = self.policy.idle_timeout_sec * 1000
+            selected = [
+                ctx
+                for ctx in candidates
+                if now_ms - ctx.last_activity_ms >= idle_timeout_ms
+            ]
+        remaining = [ctx for ctx in candidates if ctx not in selected]
+
+        if self.policy.max_awake_users:
+            num_awake = len(awake) - len(selected)
+            while num_awake > self.policy.max_awake_users and remaining:
+                selected.append(remaining.pop(0))
+                num_awake -= 1
+
+        if self.policy.memory_cap_mb and used_memory_mb > self.policy.memory_cap_mb:
+            memory_before_mb = self._memory_before_cap_hibernation_mb
+            if (
+                memory_before_mb is not None
+                and memory_before_mb - used_memory_mb < self.MIN_MEMORY_GAIN_MB
+            ):
+                self.logger.warning(
+                    f"Used memory of {used_memory_mb:.0f} MB exceeds the cap of "
+                    f"{self.policy.memory_cap_mb} MB, but did not drop after the last user "
+                    f"got hibernated for it. No further users get hibernated for the cap."
+                )
+            elif not selected and remaining:
+                # The memory gets released only gradually, so we hibernate one user per check
+                selected.append(remaining.pop(0))
+                self._memory_before_cap_hibernation_mb = used_memory_mb
+            elif not selected:
+                self.logger.warning(
+                    f"Used memory of {used_memory_mb:.0f} MB exceeds the cap of "
+                    f"{self.policy.memory_cap_mb} MB, but no user can be hibernated"
+                )
+        else:
+            self._memory_before_cap_hibernation_mb = None
+        return selected
+
+    def select_users_to_wake_for_mailbox(self, now_ms: int) -> list["UserContext"]:
+        if not self.policy.mailbox_check_interval_sec:
+            return []
+        interval_ms = self.policy.mailbox_check_interval_sec * 1000
+        return [
+            ctx
+            for ctx in self._user_manager.get_all_contexts()
+            if ctx.hibernated
+            and not ctx.is_running
+            and now_ms - self._hibernated_at.get(ctx.user_id, 0) >= interval_ms
+        ]
+
+    def check(self):
+        self._update_observed_storages()
+        now_ms = get_time_ms()
+        for ctx in self.select_users_to_hibernate(
+            now_ms, Profiler.get_used_memory_in_mb()
+        ):
+            as_future(self.hibernate_user(ctx.user_id)).add_done_callback(
+                FutureCallback(
+                    on_failure=lambda e, user_id=ctx.user_id: self.logger.error(
+                        f"Failed to hibernate user `{user_id}`", exc_info=e
+                    )
+                )
+            )
+        for ctx in self.select_users_to_wake_for_mailbox(now_ms):
+            self._wake_user(ctx.user_id, "periodic mailbox check")
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // HashMapChangedListener implementation
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    def on_added(self, protected_storage_entries: Collection["ProtectedStorageEntry"]):
+        for entry in protected_storage_entries:
+            if not isinstance(entry, ProtectedMailboxStorageEntry):
+                continue
+            ctx = self._user_manager.find_user_context_for_sig_pub_key(
+                entry.receivers_pub_key_bytes
+            )
+            if ctx is not None and ctx.hibernated and not ctx.is_running:
+                self._wake_user(ctx.user_id, "pending mailbox message")
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // Private
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    def _wake_user(self, user_id: str, reason: str):
+        self.logger.info(f"Waking up user `{user_id}`: {reason}")
+        as_future(self.wake_user(user_id)).add_done_callback(
+            FutureCallback(
+                on_failure=lambda e: self.logger.error(
+                    f"Failed to wake up user `{user_id}`", exc_info=e
+                )
+            )
+        )
+
+    def _update_observed_storages(self):
+        running_user_ids = {
+            ctx.user_id
+            for ctx in self._user_manager.get_all_contexts()
+            if ctx.is_running
+        }
+        for user_id in list(self._observed_storages.keys()):
+            if user_id not in running_user_ids:
+                storage = self._observed_storages.pop(user_id)
+                storage.remove_hash_map_changed_listener(self)
+        for ctx in self._user_manager.get_all_contexts():
+            if ctx.is_running and ctx.user_id not in self._observed_storages:
+                storage = ctx.global_container.p2p_data_storage
+                storage.add_hash_map_changed_listener(self)
+                self._observed_storages[ctx.user_id] = storage
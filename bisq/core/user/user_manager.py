@@ -19,12 +19,13 @@ from bisq.common.setup.log_setup import (
     get_ctx_logger,
     get_user_logger,
     logger_context,
+    switch_std_handler_to,
 )
 from bisq.common.user_thread import UserThread
 from bisq.core.user.user import User
 from bisq.core.user.user_context import UserContext
 from bisq.core.user.user_manager_payload import UserManagerPayload
-from utils.aio import as_future
+from utils.aio import as_future, run_in_thread
 from utils.concurrency import AtomicInt
 from utils.data import SimpleProperty
 from utils.preconditions import check_argument
@@ -113,6 +114,16 @@ class UserManager(PersistedDataHost):
 
     def _load_user_context(self, user_id: str):
         alias = self._user_manager_payload.user_alias_entries[user_id]
+        user, persistence_orchestrator, logger = self._create_user(user_id)
+        self._user_contexts[user_id] = UserContext(
+            user_id=user_id,
+            alias=alias,
+            user=user,
+            persistence_orchestrator=persistence_orchestrator,
+            logger=logger,
+        )
+
+    def _create_user(self, user_id: str):
         user_data_dir = self._config.app_data_dir.joinpath("users", user_id)
         user_data_dir.mkdir(parents=True, exist_ok=True)
         storage_dir = user_data_dir.joinpath(
@@ -137,14 +148,7 @@ class UserManager(PersistedDataHost):
                 ),
                 key_ring,
             )
-
-        self._user_contexts[user_id] = UserContext(
-            user_id=user_id,
-            alias=alias,
-            user=user,
-            persistence_orchestrator=persistence_orchestrator,
-            logger=logger,
-        )
+        return user, persistence_orchestrator, logger
 
     def _read_persisted_user(
         self, user_id: str, complete_handler: Callable[[], None]
@@ -265,11 +269,65 @@ class UserManager(PersistedDataHost):
             if to_user_id is None:
                 to_user_id = next(iter(self._user_contexts.keys()))
             ctx = self.get_user_context(to_user_id)
-            self._user_manager_payload.active_user_id = to_user_id
-            self.force_persist_now()
-            await ctx.start(shared_container, True)
+            if not self._config.user_worker_id:
+                # The shared stores are written only by the front end in process per user mode
+                self._user_manager_payload.active_user_id = to_user_id
+                self.force_persist_now()
+            if not await self.wake_user(ctx.user_id, shared_container, True):
+                switch_std_handler_to(ctx.user_id)
             self.active_user_context_property.value = ctx
 
+    async def wake_user(
+        self,
+        user_id: str,
+        shared_container: "SharedContainer",
+        should_take_std_out=False,
+    ) -> bool:
+        """Starts the services of the user if not running. Returns True if the user got started."""
+        ctx = self.get_user_context(user_id)
+        if self._config.process_per_user:
+            # The services of the user run in its worker process
+            await run_in_thread(
+                shared_container.user_worker_supervisor.ensure_worker, user_id
+            )
+            return True
+        async with ctx.transition_lock:
+            if ctx.is_running:
+                return False
+            if ctx.hibernated:
+                ctx.logger.info(f"Waking up hibernated user `{user_id}`")
+            await ctx.start(shared_container, should_take_std_out)
+            ctx.hibernated = False
+            ctx.touch()
+            return True
+
+    async def hibernate_user(self, user_id: str) -> bool:
+        """
+        Shuts down the services of a running user after all its data got flushed to disk.
+
+        Only the user with its keys stays loaded, which is enough to find the user for incoming
+        messages and to wake it up again. Returns True if the user got hibernated.
+        """
+        ctx = self.get_user_context(user_id)
+        async with ctx.transition_lock:
+            if not ctx.is_running:
+                return False
+            ctx.logger.info(f"Hibernating user `{user_id}`")
+            await ctx.shut_down()
+            # The persistence managers of the user got shut down with the flush, so we load the
+            # user again with a fresh persistence orchestrator like at startup.
+            user, persistence_orchestrator, _ = self._create_user(user_id)
+            ctx.user = user
+            ctx.persistence_orchestrator = persistence_orchestrator
+            d = Deferred()
+            try:
+                self._read_persisted_user(user_id, lambda: d.callback(True))
+            except Exception as e:
+                d.errback(e)
+            await as_future(d)
+            ctx.hibernated = True
+            return True
+
     async def delete_user(
         self, user_id: str, remove_user_data: bool, shared_container: "SharedContainer"
     ):
@@ -277,6 +335,10 @@ class UserManager(PersistedDataHost):
             created_new_user = False
             new_user_id = None
             ctx = self.get_user_context(user_id)
+            if self._config.process_per_user:
+                await run_in_thread(
+                    shared_container.user_worker_supervisor.stop_worker, user_id
+                )
             await ctx.shut_down()
             await ctx.user.shut_down_for_removal(remove_user_data)
             user_data_dir = ctx.user.data_dir
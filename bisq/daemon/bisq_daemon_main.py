@@ -1,10 +1,12 @@
 import contextvars
+from datetime import timedelta
+import os
 from bisq.core.api.core_context import CoreContext
 from bisq.core.protocol.persistable.core_persistence_proto_resolver import (
     CorePersistenceProtoResolver,
 )
 from bisq.daemon.grpc.grpc_container import GrpcContainer
-from utils.aio import as_future, stop_reactor_and_exit
+from utils.aio import as_future, run_in_thread, stop_reactor_and_exit
 from collections.abc import Callable
 import sys
 from threading import Thread, Timer
@@ -21,7 +23,9 @@ from bisq.common.setup.log_setup import (
     logger_context,
 )
 from bisq.common.setup.uncought_exception_handler import UncaughtExceptionHandler
+from bisq.common.user_thread import UserThread
 from bisq.common.version import Version
+from bisq.core.network.http.http_session_pool import HttpSessionPool
 from bisq.core.setup.core_setup import CoreSetup
 from shared_container import SharedContainer
 import asyncio
@@ -73,7 +77,15 @@ class BisqDaemonMain(
         # entry point
         try:
             self._config = Config(self.app_name, user_data_dir())
-            setup_aggregated_logger(self._config.app_data_dir, self._config.log_level)
+            setup_aggregated_logger(
+                self._config.app_data_dir,
+                self._config.log_level,
+                (
+                    f"bisq_worker_{self._config.user_worker_id}.log"
+                    if self._config.user_worker_id
+                    else "bisq.log"
+                ),
+            )
 
             if self._config.help_requested:
                 self._config.parser.print_help()
@@ -109,7 +121,10 @@ class BisqDaemonMain(
                     shared_persistence_orchestrator,
                 )
 
-                shared_persistence_orchestrator.on_all_services_initialized()
+                if not self._config.user_worker_id:
+                    # Workers only read the shared stores. As long as the orchestrator is not
+                    # initialized they do not get written.
+                    shared_persistence_orchestrator.on_all_services_initialized()
 
                 self._shared_container = SharedContainer(
                     self._core_context,
@@ -169,9 +184,16 @@ class BisqDaemonMain(
                     "User tried to launch with an older version. Exiting to prevent data corruption..."
                 )
                 return stop_reactor_and_exit(BisqDaemonMain.EXIT_FAILURE)
+            elif self._config.user_worker_id:
+                self._watch_parent_process()
+                await self._user_manager.switch_user(
+                    self._config.user_worker_id, self._shared_container
+                )
             elif not self._has_downgraded:
                 CommonSetup.persist_bisq_version(self._config)
                 self.setup_avoid_standby_mode()
+                if self._config.process_per_user:
+                    self._shared_container.user_worker_supervisor.start()
                 # TODO: create a function that does the following:
                 #   init the active user id in user_manager and call headlessapp.start_user_instance for it
                 try:
@@ -192,6 +214,7 @@ class BisqDaemonMain(
                     ),
                     self._shared_container,
                 )
+                self._shared_container.user_hibernation_service.start()
 
             await BisqDaemonMain.keep_running()
 
@@ -257,6 +280,17 @@ class BisqDaemonMain(
                 )
             )
 
+    def _watch_parent_process(self):
+        # A worker must not outlive its front end daemon
+        parent_pid = os.getppid()
+
+        def check_parent():
+            if os.getppid() != parent_pid:
+                base_logger.warning("Front end daemon exited. Shutting down worker.")
+                self.graceful_shut_down()
+
+        UserThread.run_periodically(check_parent, timedelta(seconds=5))
+
     def setup_avoid_standby_mode(self):
         # TODO: setup in gui mode
         # we setup avoid standby mode on server because it's where it matters
@@ -309,9 +343,17 @@ class BisqDaemonMain(
                 finished
             )
 
+        shut_down_timeout_sec = 10
+        if self._config.process_per_user:
+            # The workers get killed if they do not exit in time, their data is flushed by then
+            shut_down_timeout_sec = (
+                self._shared_container.user_worker_supervisor.SHUT_DOWN_TIMEOUT_SEC + 5
+            )
+
         def timeout_handler():
             shared_logger.warning(
-                "Graceful shutdown not completed in 10 sec. Triggering timeout handler."
+                f"Graceful shutdown not completed in {shut_down_timeout_sec} sec. "
+                "Triggering timeout handler."
             )
             # We create another thread because:
             # - UserThread can be blocked by a shutdown routine
@@ -328,14 +370,42 @@ class BisqDaemonMain(
 
         # We do not use the UserThread to avoid that the timeout would not get triggered in case the UserThread
         # would get blocked by a shutdown routine.
-        timer = Timer(10.0, timeout_handler)
+        timer = Timer(shut_down_timeout_sec, timeout_handler)
         timer.daemon = True
         timer.start()
 
         try:
             self._shared_container.clock_watcher.shut_down()
+            self._shared_container.user_hibernation_service.shut_down()
+            workers_stopped: Optional["asyncio.Future"] = None
+            if self._config.process_per_user:
+                # Blocks until the workers flushed their data, so it must not run on the user
+                # thread
+                workers_stopped = run_in_thread(
+                    self._shared_container.user_worker_supervisor.shut_down
+                )
             # self._shared_container.avoid_standby_mode_service.shut_down() # TODO
-            self._user_manager.shut_down_all_users(flush_and_exit)
+
+            async def shut_down_shared_services():
+                if workers_stopped is not None:
+                    await workers_stopped
+                # the users do not send requests or use their onion services anymore
+                await HttpSessionPool.shut_down_default()
+                if self._config.shared_tor:
+                    await self._shared_container.shared_tor_manager.shut_down()
+
+            def on_users_shut_down(status: int):
+                def on_done(future: "asyncio.Future"):
+                    if not future.cancelled() and future.exception() is not None:
+                        base_logger.error(
+                            "Shutting down shared services failed",
+                            exc_info=future.exception(),
+                        )
+                    flush_and_exit(status)
+
+                as_future(shut_down_shared_services()).add_done_callback(on_done)
+
+            self._user_manager.shut_down_all_users(on_users_shut_down)
         except Exception as e:
             base_logger.error("App shutdown failed with an exception", exc_info=e)
             flush_and_exit(BisqDaemonMain.EXIT_FAILURE)
@@ -138,6 +138,13 @@ class GrpcContainer:
                 self.grpc_wallets_service,
                 self.grpc_dev_commands_service,
                 self.grpc_user_manager_commands_service,
+                self._user_manager,
+                self._shared_container.user_hibernation_service,
+                (
+                    self._shared_container.user_worker_supervisor
+                    if self._config.process_per_user
+                    else None
+                ),
             )
         return self._grpc_server
 
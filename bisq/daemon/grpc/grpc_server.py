@@ -1,5 +1,5 @@
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from bisq.common.config.config import Config
 from bisq.common.setup.log_setup import get_ctx_logger
 from bisq.core.api.core_context import CoreContext
@@ -15,6 +15,9 @@ from bisq.daemon.grpc.grpc_wallets_service import GrpcWalletsService
 from bisq.daemon.grpc.interceptor.password_auth_interceptor import (
     PasswordAuthInterceptor,
 )
+from bisq.daemon.grpc.interceptor.user_wake_interceptor import UserWakeInterceptor
+from bisq.daemon.worker.user_worker_proxy_handler import UserWorkerProxyHandler
+from bisq.daemon.worker.user_worker_supervisor import UserWorkerSupervisor
 import grpc
 import grpc_pb2_grpc
 import grpc_extra_pb2_grpc
@@ -22,6 +25,8 @@ import grpc_extra_pb2_grpc
 if TYPE_CHECKING:
     from bisq.daemon.grpc.grpc_dispute_agent_service import GrpcDisputeAgentsService
     from bisq.daemon.grpc.grpc_help_service import GrpcHelpService
+    from bisq.core.user.user_hibernation_service import UserHibernationService
+    from bisq.core.user.user_manager import UserManager
 
 
 class GrpcServer:
@@ -41,37 +46,62 @@ class GrpcServer:
         wallets_service: "GrpcWalletsService",
         dev_commands_service: "GrpcDevCommandsService",
         user_manager_commands_service: "GrpcUserManagerCommandsService",
+        user_manager: "UserManager",
+        user_hibernation_service: "UserHibernationService",
+        user_worker_supervisor: Optional["UserWorkerSupervisor"] = None,
     ):
         self.logger = get_ctx_logger(__name__)
         self.config = config
         self.server = grpc.server(
             ThreadPoolExecutor(max_workers=10, thread_name_prefix="grpc-server"),
-            interceptors=(PasswordAuthInterceptor(self.config),),
-        )
-        grpc_pb2_grpc.add_DisputeAgentsServicer_to_server(
-            dispute_agents_service, self.server
+            interceptors=(
+                (PasswordAuthInterceptor(self.config),)
+                if user_worker_supervisor
+                # the worker of the user gets woken up by the proxy handler
+                else (
+                    PasswordAuthInterceptor(self.config),
+                    UserWakeInterceptor(user_manager, user_hibernation_service),
+                )
+            ),
         )
         grpc_pb2_grpc.add_HelpServicer_to_server(help_service, self.server)
-        grpc_pb2_grpc.add_OffersServicer_to_server(offers_service, self.server)
-        grpc_pb2_grpc.add_PaymentAccountsServicer_to_server(
-            payment_accounts_service, self.server
-        )
-        grpc_pb2_grpc.add_PriceServicer_to_server(price_service, self.server)
         grpc_pb2_grpc.add_ShutdownServerServicer_to_server(
             shutdown_service, self.server
         )
         grpc_pb2_grpc.add_GetVersionServicer_to_server(version_service, self.server)
-        grpc_pb2_grpc.add_TradesServicer_to_server(trades_service, self.server)
-        grpc_pb2_grpc.add_WalletsServicer_to_server(wallets_service, self.server)
-        grpc_extra_pb2_grpc.add_DevCommandsServicer_to_server(dev_commands_service, self.server)
         grpc_extra_pb2_grpc.add_UserManagerCommandsServicer_to_server(user_manager_commands_service, self.server)
-        # TODO: generate ssl certs and random password to file and use for cli to secure the connection
-        self.server.add_insecure_port(f"127.0.0.1:{self.config.api_port}")
+        if user_worker_supervisor:
+            # In process per user mode the services of the users are served by their workers
+            self.server.add_generic_rpc_handlers(
+                (UserWorkerProxyHandler(user_manager, user_worker_supervisor),)
+            )
+        else:
+            grpc_pb2_grpc.add_DisputeAgentsServicer_to_server(
+                dispute_agents_service, self.server
+            )
+            grpc_pb2_grpc.add_OffersServicer_to_server(offers_service, self.server)
+            grpc_pb2_grpc.add_PaymentAccountsServicer_to_server(
+                payment_accounts_service, self.server
+            )
+            grpc_pb2_grpc.add_PriceServicer_to_server(price_service, self.server)
+            grpc_pb2_grpc.add_TradesServicer_to_server(trades_service, self.server)
+            grpc_pb2_grpc.add_WalletsServicer_to_server(wallets_service, self.server)
+            grpc_extra_pb2_grpc.add_DevCommandsServicer_to_server(dev_commands_service, self.server)
+        if self.config.user_worker_id:
+            # The worker of a user is only reachable by the front end daemon
+            socket_path = UserWorkerSupervisor.get_socket_path(
+                self.config.app_data_dir, self.config.user_worker_id
+            )
+            self.address = f"unix:{socket_path}"
+        else:
+            # TODO: generate ssl certs and random password to file and use for cli to secure the connection
+            self.address = f"127.0.0.1:{self.config.api_port}"
+        self.server.add_insecure_port(self.address)
         core_context.is_api_user = True # TODO: set to false in GUI mode
 
     def start(self):
         self.server.start()
-        self.logger.info(f"Grpc server started on port {self.config.api_port}")
+        self.logger.info(f"Grpc server started on {self.address}")
 
     def shut_down(self):
         self.logger.info("Grpc server shutdown started")
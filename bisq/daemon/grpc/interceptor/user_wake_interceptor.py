@@ -0,0 +1,72 @@
+import asyncio
+from typing import TYPE_CHECKING, Callable
+from grpc import ServerInterceptor, StatusCode
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.daemon.grpc.interceptor.password_auth_interceptor import (
+    _unary_unary_rpc_terminator,
+)
+from utils.aio import get_asyncio_loop
+
+
+if TYPE_CHECKING:
+    from bisq.core.user.user_hibernation_service import UserHibernationService
+    from bisq.core.user.user_manager import UserManager
+    from utils.grpc_type_hints import HandlerCallDetails
+
+
+class UserWakeInterceptor(ServerInterceptor):
+    """
+    Records rpc calls as activity of the active user and wakes the active user up before the
+    call gets handled if it was hibernated.
+
+    see UserHibernationService
+    """
+
+    # Services which do not use the services of the active user
+    EXEMPT_SERVICES = frozenset(
+        {
+            "io.bisq.protobuffer.GetVersion",
+            "io.bisq.protobuffer.Help",
+            "io.bisq.protobuffer.ShutdownServer",
+            "io.bisq.protobuffer.UserManagerCommands",
+        }
+    )
+
+    def __init__(
+        self,
+        user_manager: "UserManager",
+        user_hibernation_service: "UserHibernationService",
+    ):
+        super().__init__()
+        self.logger = get_ctx_logger(__name__)
+        self._user_manager = user_manager
+        self._user_hibernation_service = user_hibernation_service
+        self._wake_failed_terminator = _unary_unary_rpc_terminator(
+            StatusCode.UNAVAILABLE,
+            "failed to wake up the hibernated user",
+        )
+
+    def intercept_service(
+        self, continuation: Callable, handler_call_details: "HandlerCallDetails"
+    ) -> Callable:
+        # method is of the form /package.Service/Method
+        service_name = handler_call_details.method.lstrip("/").split("/", 1)[0]
+        ctx = self._user_manager.active_user_context_property.value
+        if service_name in UserWakeInterceptor.EXEMPT_SERVICES or ctx is None:
+            return continuation(handler_call_details)
+
+        ctx.touch()
+        if not ctx.is_running:
+            try:
+                # rpc calls are handled on the grpc server threads, so we can block here
+                asyncio.run_coroutine_threadsafe(
+                    self._user_hibernation_service.wake_user(ctx.user_id),
+                    get_asyncio_loop(),
+                ).result()
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to wake up user `{ctx.user_id}` for rpc call", exc_info=e
+                )
+                return self._wake_failed_terminator
+        return continuation(handler_call_details)
@@ -0,0 +1,79 @@
+from typing import TYPE_CHECKING, Optional
+
+import grpc
+
+from bisq.common.setup.log_setup import get_ctx_logger
+
+if TYPE_CHECKING:
+    from bisq.core.user.user_manager import UserManager
+    from bisq.daemon.worker.user_worker_supervisor import UserWorkerSupervisor
+    from utils.grpc_type_hints import HandlerCallDetails
+
+
+class UserWorkerProxyHandler(grpc.GenericRpcHandler):
+    """
+    Forwards the rpc calls which are not served by the front end daemon to the worker process of
+    the active user in process per user mode.
+
+    The serialized requests and responses are passed through as they are, so the front end does
+    not need to parse them. The metadata including the password header gets forwarded, so the
+    worker authorizes the call itself.
+
+    Calls which change the shared preferences get rejected, as the workers never write the shared
+    stores and the change would get lost.
+    """
+
+    SHARED_PREFERENCES_METHODS = frozenset(
+        {
+            "/io.bisq.protobuffer.Wallets/SetTxFeeRatePreference",
+            "/io.bisq.protobuffer.Wallets/UnsetTxFeeRatePreference",
+        }
+    )
+
+    def __init__(
+        self,
+        user_manager: "UserManager",
+        user_worker_supervisor: "UserWorkerSupervisor",
+    ):
+        self.logger = get_ctx_logger(__name__)
+        self._user_manager = user_manager
+        self._user_worker_supervisor = user_worker_supervisor
+
+    def service(
+        self, handler_call_details: "HandlerCallDetails"
+    ) -> Optional[grpc.RpcMethodHandler]:
+        method = handler_call_details.method
+        if method in UserWorkerProxyHandler.SHARED_PREFERENCES_METHODS:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, context: context.abort(
+                    grpc.StatusCode.FAILED_PRECONDITION,
+                    f"{method.rpartition('/')[2]} changes the preferences shared by all "
+                    "users, which is not supported in process per user mode",
+                )
+            )
+        # without (de)serializers requests and responses are handled as bytes
+        return grpc.unary_unary_rpc_method_handler(
+            lambda request, context: self._forward(method, request, context)
+        )
+
+    def _forward(self, method: str, request: bytes, context: grpc.ServicerContext):
+        user_id = self._user_manager.active_user_id
+        try:
+            channel = self._user_worker_supervisor.ensure_worker(user_id)
+        except Exception as e:
+            self.logger.error(f"Worker of user `{user_id}` is not available", exc_info=e)
+            context.abort(
+                grpc.StatusCode.UNAVAILABLE, f"worker of user `{user_id}` is not available"
+            )
+
+        metadata = [
+            (key, value)
+            for key, value in context.invocation_metadata()
+            if key != "user-agent" and not key.startswith(("grpc-", ":"))
+        ]
+        try:
+            return channel.unary_unary(method)(
+                request, metadata=metadata, timeout=context.time_remaining()
+            )
+        except grpc.RpcError as e:
+            context.abort(e.code(), e.details())
@@ -0,0 +1,204 @@
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+import subprocess
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+import grpc
+
+from bisq.common.setup.log_setup import get_ctx_logger
+from bisq.common.user_thread import UserThread
+from bisq.core.exceptions.illegal_state_exception import IllegalStateException
+
+if TYPE_CHECKING:
+    from bisq.common.config.config import Config
+    from bisq.common.timer import Timer
+
+
+@dataclass(eq=False)
+class _Worker:
+    user_id: str
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    process: Optional[subprocess.Popen] = None
+    channel: Optional[grpc.Channel] = None
+    num_restarts: int = 0
+    # monotonic time before which a crashed worker does not get restarted
+    restart_not_before: float = 0
+    stopping: bool = False
+
+    @property
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+
+class UserWorkerSupervisor:
+    """
+    Runs the users in their own worker processes in process per user mode, so the work of one
+    user does not block the api calls of the others.
+
+    A worker is a daemon started with --userWorkerId which runs only the services of that user and
+    serves the api on a unix domain socket in the data directory of the user. It reads the shared
+    stores (users, preferences) and the resource files from disk but never writes the shared
+    stores, which are owned by the front end daemon. Workers which exit unexpectedly get
+    restarted with an increasing delay.
+    """
+
+    CHECK_INTERVAL_SEC = 2
+    READY_TIMEOUT_SEC = 120
+    # Longer than the 10 sec the graceful shutdown of a worker may take
+    SHUT_DOWN_TIMEOUT_SEC = 15
+    MAX_RESTART_DELAY_SEC = 60
+
+    def __init__(self, config: "Config"):
+        self.logger = get_ctx_logger(__name__)
+        self._config = config
+        self._workers: dict[str, _Worker] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional["Timer"] = None
+        self._shut_down_called = False
+
+    @staticmethod
+    def get_socket_path(app_data_dir: Path, user_id: str) -> Path:
+        return app_data_dir.joinpath("users", user_id, "worker.sock")
+
+    def start(self):
+        self._timer = UserThread.run_periodically(
+            self._restart_crashed_workers,
+            timedelta(seconds=UserWorkerSupervisor.CHECK_INTERVAL_SEC),
+        )
+
+    def ensure_worker(self, user_id: str) -> grpc.Channel:
+        """
+        Starts the worker of the user if it is not running and returns the channel to it once it
+        accepts calls. Blocks, so it must not be called on the user thread.
+        """
+        worker = self._get_worker(user_id)
+        with worker.lock:
+            if self._shut_down_called:
+                raise IllegalStateException("Worker supervisor is shut down")
+            worker.stopping = False
+            if not worker.is_alive:
+                self._start_process(worker)
+            try:
+                grpc.channel_ready_future(worker.channel).result(
+                    timeout=UserWorkerSupervisor.READY_TIMEOUT_SEC
+                )
+            except grpc.FutureTimeoutError:
+                raise IllegalStateException(
+                    f"Worker of user `{user_id}` did not get ready in time"
+                )
+            return worker.channel
+
+    def stop_worker(self, user_id: str):
+        """Stops the worker of the user gracefully. Blocks until it exited."""
+        worker = self._get_worker(user_id)
+        with worker.lock:
+            worker.stopping = True
+            self._stop_processes([worker])
+
+    def is_worker_alive(self, user_id: str) -> bool:
+        with self._lock:
+            worker = self._workers.get(user_id, None)
+        return worker is not None and worker.is_alive
+
+    def shut_down(self):
+        """Stops all workers gracefully, killing those which do not exit in time."""
+        self._shut_down_called = True
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+        with self._lock:
+            workers = list(self._workers.values())
+        for worker in workers:
+            worker.stopping = True
+        self._stop_processes(workers)
+
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+    # // Private
+    # ///////////////////////////////////////////////////////////////////////////////////////////
+
+    def _get_worker(self, user_id: str) -> _Worker:
+        with self._lock:
+            worker = self._workers.get(user_id, None)
+            if worker is None:
+                worker = _Worker(user_id)
+                self._workers[user_id] = worker
+            return worker
+
+    def _get_worker_command(self, user_id: str) -> list[str]:
+        # The worker gets the same options as the front end, the last occurrence of an option wins
+        return [
+            sys.executable,
+            sys.argv[0],
+            *sys.argv[1:],
+            f"--appDataDir={self._config.app_data_dir}",
+            f"--userWorkerId={user_id}",
+        ]
+
+    def _start_process(self, worker: _Worker):
+        if worker.channel is not None:
+            worker.channel.close()
+        socket_path = UserWorkerSupervisor.get_socket_path(
+            self._config.app_data_dir, worker.user_id
+        )
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        socket_path.unlink(missing_ok=True)
+        worker.restart_not_before = 0
+        command = self._get_worker_command(worker.user_id)
+        self.logger.info(f"Starting worker of user `{worker.user_id}`")
+        worker.process = subprocess.Popen(command, stdin=subprocess.DEVNULL)
+        worker.channel = grpc.insecure_channel(f"unix:{socket_path}")
+
+    def _stop_processes(self, workers: list[_Worker]):
+        alive = [worker for worker in workers if worker.is_alive]
+        for worker in alive:
+            self.logger.info(f"Stopping worker of user `{worker.user_id}`")
+            # The worker shuts down gracefully on SIGTERM
+            worker.process.terminate()
+        deadline = time.monotonic() + UserWorkerSupervisor.SHUT_DOWN_TIMEOUT_SEC
+        for worker in alive:
+            try:
+                worker.process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                self.logger.warning(
+                    f"Worker of user `{worker.user_id}` did not stop in time. Killing it."
+                )
+                worker.process.kill()
+                worker.process.wait()
+        for worker in workers:
+            if worker.channel is not None:
+                worker.channel.close()
+                worker.channel = None
+
+    def _restart_crashed_workers(self):
+        now = time.monotonic()
+        with self._lock:
+            workers = list(self._workers.values())
+        for worker in workers:
+            if (
+                worker.stopping
+                or worker.process is None
+                or worker.is_alive
+                or self._shut_down_called
+            ):
+                continue
+            if not worker.restart_not_before:
+                worker.num_restarts += 1
+                delay = min(
+                    2**worker.num_restarts, UserWorkerSupervisor.MAX_RESTART_DELAY_SEC
+                )
+                worker.restart_not_before = now + delay
+                self.logger.warning(
+                    f"Worker of user `{worker.user_id}` exited with code "
+                    f"{worker.process.returncode}. Restarting it in {delay} sec."
+                )
+            elif now >= worker.restart_not_before and worker.lock.acquire(
+                blocking=False
+            ):
+                try:
+                    self._start_process(worker)
+                finally:
+                    worker.lock.release()
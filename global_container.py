@@ -1591,6 +1591,12 @@ class GlobalContainer:
                 self.ban_filter,
                 self.config,
                 self.tor_dir,
+                (
+                    self._shared_container.shared_tor_manager
+                    if self.config.shared_tor
+                    else None
+                ),
+                self.user.data_dir.name,
             )
 
         return self._network_node_provider
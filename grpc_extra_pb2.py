@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: grpc_extra.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'grpc_extra.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import pb_pb2 as pb__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10grpc_extra.proto\x12\x13io.bisq.protobuffer\x1a\x08pb.proto\"\x96\x01\n\x10SendProtoRequest\x12\x42\n\x18\x64\x65stination_node_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12>\n\x10network_envelope\x18\x02 \x01(\x0b\x32$.io.bisq.protobuffer.NetworkEnvelope\"8\n\x0eSendProtoReply\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\"$\n\x11SwitchUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"\x11\n\x0fSwitchUserReply\"\x16\n\x14\x43reateNewUserRequest\"%\n\x12\x43reateNewUserReply\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"9\n\x11\x44\x65leteUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65lete_data\x18\x02 \x01(\x08\"@\n\x0f\x44\x65leteUserReply\x12\x13\n\x0bnew_user_id\x18\x01 \x01(\t\x12\x18\n\x10\x63reated_new_user\x18\x02 \x01(\x08\"5\n\x13SetUserAliasRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\r\n\x05\x61lias\x18\x02 \x01(\t\"\x13\n\x11SetUserAliasReply\"\x15\n\x13GetUsersListRequest\"K\n\x11GetUsersListReply\x12\x36\n\nusers_list\x18\x01 \x03(\x0b\x32\".io.bisq.protobuffer.BriefUserInfo\"/\n\rBriefUserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\r\n\x05\x61lias\x18\x02 \x01(\t\"%\n\x12RestoreUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"\x12\n\x10RestoreUserReply2h\n\x0b\x44\x65vCommands\x12Y\n\tSendProto\x12%.io.bisq.protobuffer.SendProtoRequest\x1a#.io.bisq.protobuffer.SendProtoReply\"\x00\x32\xe2\x04\n\x13UserManagerCommands\x12\\\n\nSwitchUser\x12&.io.bisq.protobuffer.SwitchUserRequest\x1a$.io.bisq.protobuffer.SwitchUserReply\"\x00\x12\x65\n\rCreateNewUser\x12).io.bisq.protobuffer.CreateNewUserRequest\x1a\'.io.bisq.protobuffer.CreateNewUserReply\"\x00\x12\\\n\nDeleteUser\x12&.io.bisq.protobuffer.DeleteUserRequest\x1a$.io.bisq.protobuffer.DeleteUserReply\"\x00\x12\x62\n\x0cSetUserAlias\x12(.io.bisq.protobuffer.SetUserAliasRequest\x1a&.io.bisq.protobuffer.SetUserAliasReply\"\x00\x12\x63\n\x0cGetUsersList\x12).io.bisq.protobuffer.CreateNewUserRequest\x1a&.io.bisq.protobuffer.GetUsersListReply\"\x00\x12_\n\x0bRestoreUser\x12\'.io.bisq.protobuffer.RestoreUserRequest\x1a%.io.bisq.protobuffer.RestoreUserReply\"\x00\x42\x13\n\x0f\x62isq.proto.grpcP\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_extra_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\017bisq.proto.grpcP\001'
+  _globals['_SENDPROTOREQUEST']._serialized_start=52
+  _globals['_SENDPROTOREQUEST']._serialized_end=202
+  _globals['_SENDPROTOREPLY']._serialized_start=204
+  _globals['_SENDPROTOREPLY']._serialized_end=260
+  _globals['_SWITCHUSERREQUEST']._serialized_start=262
+  _globals['_SWITCHUSERREQUEST']._serialized_end=298
+  _globals['_SWITCHUSERREPLY']._serialized_start=300
+  _globals['_SWITCHUSERREPLY']._serialized_end=317
+  _globals['_CREATENEWUSERREQUEST']._serialized_start=319
+  _globals['_CREATENEWUSERREQUEST']._serialized_end=341
+  _globals['_CREATENEWUSERREPLY']._serialized_start=343
+  _globals['_CREATENEWUSERREPLY']._serialized_end=380
+  _globals['_DELETEUSERREQUEST']._serialized_start=382
+  _globals['_DELETEUSERREQUEST']._serialized_end=439
+  _globals['_DELETEUSERREPLY']._serialized_start=441
+  _globals['_DELETEUSERREPLY']._serialized_end=505
+  _globals['_SETUSERALIASREQUEST']._serialized_start=507
+  _globals['_SETUSERALIASREQUEST']._serialized_end=560
+  _globals['_SETUSERALIASREPLY']._serialized_start=562
+  _globals['_SETUSERALIASREPLY']._serialized_end=581
+  _globals['_GETUSERSLISTREQUEST']._serialized_start=583
+  _globals['_GETUSERSLISTREQUEST']._serialized_end=604
+  _globals['_GETUSERSLISTREPLY']._serialized_start=606
+  _globals['_GETUSERSLISTREPLY']._serialized_end=681
+  _globals['_BRIEFUSERINFO']._serialized_start=683
+  _globals['_BRIEFUSERINFO']._serialized_end=730
+  _globals['_RESTOREUSERREQUEST']._serialized_start=732
+  _globals['_RESTOREUSERREQUEST']._serialized_end=769
+  _globals['_RESTOREUSERREPLY']._serialized_start=771
+  _globals['_RESTOREUSERREPLY']._serialized_end=789
+  _globals['_DEVCOMMANDS']._serialized_start=791
+  _globals['_DEVCOMMANDS']._serialized_end=895
+  _globals['_USERMANAGERCOMMANDS']._serialized_start=898
+  _globals['_USERMANAGERCOMMANDS']._serialized_end=1508
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,100 @@
+import pb_pb2 as _pb_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SendProtoRequest(_message.Message):
+    __slots__ = ("destination_node_address", "network_envelope")
+    DESTINATION_NODE_ADDRESS_FIELD_NUMBER: _ClassVar[int]
+    NETWORK_ENVELOPE_FIELD_NUMBER: _ClassVar[int]
+    destination_node_address: _pb_pb2.NodeAddress
+    network_envelope: _pb_pb2.NetworkEnvelope
+    def __init__(self, destination_node_address: _Optional[_Union[_pb_pb2.NodeAddress, _Mapping]] = ..., network_envelope: _Optional[_Union[_pb_pb2.NetworkEnvelope, _Mapping]] = ...) -> None: ...
+
+class SendProtoReply(_message.Message):
+    __slots__ = ("success", "error_message")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    error_message: str
+    def __init__(self, success: _Optional[bool] = ..., error_message: _Optional[str] = ...) -> None: ...
+
+class SwitchUserRequest(_message.Message):
+    __slots__ = ("user_id",)
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    def __init__(self, user_id: _Optional[str] = ...) -> None: ...
+
+class SwitchUserReply(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class CreateNewUserRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class CreateNewUserReply(_message.Message):
+    __slots__ = ("user_id",)
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    def __init__(self, user_id: _Optional[str] = ...) -> None: ...
+
+class DeleteUserRequest(_message.Message):
+    __slots__ = ("user_id", "delete_data")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    DELETE_DATA_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    delete_data: bool
+    def __init__(self, user_id: _Optional[str] = ..., delete_data: _Optional[bool] = ...) -> None: ...
+
+class DeleteUserReply(_message.Message):
+    __slots__ = ("new_user_id", "created_new_user")
+    NEW_USER_ID_FIELD_NUMBER: _ClassVar[int]
+    CREATED_NEW_USER_FIELD_NUMBER: _ClassVar[int]
+    new_user_id: str
+    created_new_user: bool
+    def __init__(self, new_user_id: _Optional[str] = ..., created_new_user: _Optional[bool] = ...) -> None: ...
+
+class SetUserAliasRequest(_message.Message):
+    __slots__ = ("user_id", "alias")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    ALIAS_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    alias: str
+    def __init__(self, user_id: _Optional[str] = ..., alias: _Optional[str] = ...) -> None: ...
+
+class SetUserAliasReply(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class GetUsersListRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class GetUsersListReply(_message.Message):
+    __slots__ = ("users_list",)
+    USERS_LIST_FIELD_NUMBER: _ClassVar[int]
+    users_list: _containers.RepeatedCompositeFieldContainer[BriefUserInfo]
+    def __init__(self, users_list: _Optional[_Iterable[_Union[BriefUserInfo, _Mapping]]] = ...) -> None: ...
+
+class BriefUserInfo(_message.Message):
+    __slots__ = ("user_id", "alias")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    ALIAS_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    alias: str
+    def __init__(self, user_id: _Optional[str] = ..., alias: _Optional[str] = ...) -> None: ...
+
+class RestoreUserRequest(_message.Message):
+    __slots__ = ("user_id",)
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    def __init__(self, user_id: _Optional[str] = ...) -> None: ...
+
+class RestoreUserReply(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
@@ -0,0 +1,390 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+import grpc_extra_pb2 as grpc__extra__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in grpc_extra_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class DevCommandsStub:
+    """
+    The DevCommmands service is provided for development only
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.SendProto = channel.unary_unary(
+                '/io.bisq.protobuffer.DevCommands/SendProto',
+                request_serializer=grpc__extra__pb2.SendProtoRequest.SerializeToString,
+                response_deserializer=grpc__extra__pb2.SendProtoReply.FromString,
+                _registered_method=True)
+
+
+class DevCommandsServicer:
+    """
+    The DevCommmands service is provided for development only
+    """
+
+    def SendProto(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_DevCommandsServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'SendProto': grpc.unary_unary_rpc_method_handler(
+                    servicer.SendProto,
+                    request_deserializer=grpc__extra__pb2.SendProtoRequest.FromString,
+                    response_serializer=grpc__extra__pb2.SendProtoReply.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'io.bisq.protobuffer.DevCommands', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('io.bisq.protobuffer.DevCommands', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class DevCommands:
+    """
+    The DevCommmands service is provided for development only
+    """
+
+    @staticmethod
+    def SendProto(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/io.bisq.protobuffer.DevCommands/SendProto',
+            grpc__extra__pb2.SendProtoRequest.SerializeToString,
+            grpc__extra__pb2.SendProtoReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class UserManagerCommandsStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.SwitchUser = channel.unary_unary(
+                '/io.bisq.protobuffer.UserManagerCommands/SwitchUser',
+                request_serializer=grpc__extra__pb2.SwitchUserRequest.SerializeToString,
+                response_deserializer=grpc__extra__pb2.SwitchUserReply.FromString,
+                _registered_method=True)
+        self.CreateNewUser = channel.unary_unary(
+                '/io.bisq.protobuffer.UserManagerCommands/CreateNewUser',
+                request_serializer=grpc__extra__pb2.CreateNewUserRequest.SerializeToString,
+                response_deserializer=grpc__extra__pb2.CreateNewUserReply.FromString,
+                _registered_method=True)
+        self.DeleteUser = channel.unary_unary(
+                '/io.bisq.protobuffer.UserManagerCommands/DeleteUser',
+                request_serializer=grpc__extra__pb2.DeleteUserRequest.SerializeToString,
+                response_deserializer=grpc__extra__pb2.DeleteUserReply.FromString,
+                _registered_method=True)
+        self.SetUserAlias = channel.unary_unary(
+                '/io.bisq.protobuffer.UserManagerCommands/SetUserAlias',
+                request_serializer=grpc__extra__pb2.SetUserAliasRequest.SerializeToString,
+                response_deserializer=grpc__extra__pb2.SetUserAliasReply.FromString,
+                _registered_method=True)
+        self.GetUsersList = channel.unary_unary(
+                '/io.bisq.protobuffer.UserManagerCommands/GetUsersList',
+                request_serializer=grpc__extra__pb2.CreateNewUserRequest.SerializeToString,
+                response_deserializer=grpc__extra__pb2.GetUsersListReply.FromString,
+                _registered_method=True)
+        self.RestoreUser = channel.unary_unary(
+                '/io.bisq.protobuffer.UserManagerCommands/RestoreUser',
+                request_serializer=grpc__extra__pb2.RestoreUserRequest.SerializeToString,
+                response_deserializer=grpc__extra__pb2.RestoreUserReply.FromString,
+                _registered_method=True)
+
+
+class UserManagerCommandsServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def SwitchUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateNewUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SetUserAlias(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUsersList(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RestoreUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_UserManagerCommandsServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'SwitchUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.SwitchUser,
+                    request_deserializer=grpc__extra__pb2.SwitchUserRequest.FromString,
+                    response_serializer=grpc__extra__pb2.SwitchUserReply.SerializeToString,
+            ),
+            'CreateNewUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateNewUser,
+                    request_deserializer=grpc__extra__pb2.CreateNewUserRequest.FromString,
+                    response_serializer=grpc__extra__pb2.CreateNewUserReply.SerializeToString,
+            ),
+            'DeleteUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteUser,
+                    request_deserializer=grpc__extra__pb2.DeleteUserRequest.FromString,
+                    response_serializer=grpc__extra__pb2.DeleteUserReply.SerializeToString,
+            ),
+            'SetUserAlias': grpc.unary_unary_rpc_method_handler(
+                    servicer.SetUserAlias,
+                    request_deserializer=grpc__extra__pb2.SetUserAliasRequest.FromString,
+                    response_serializer=grpc__extra__pb2.SetUserAliasReply.SerializeToString,
+            ),
+            'GetUsersList': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUsersList,
+                    request_deserializer=grpc__extra__pb2.CreateNewUserRequest.FromString,
+                    response_serializer=grpc__extra__pb2.GetUsersListReply.SerializeToString,
+            ),
+            'RestoreUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.RestoreUser,
+                    request_deserializer=grpc__extra__pb2.RestoreUserRequest.FromString,
+                    response_serializer=grpc__extra__pb2.RestoreUserReply.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'io.bisq.protobuffer.UserManagerCommands', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('io.bisq.protobuffer.UserManagerCommands', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class UserManagerCommands:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def SwitchUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/io.bisq.protobuffer.UserManagerCommands/SwitchUser',
+            grpc__extra__pb2.SwitchUserRequest.SerializeToString,
+            grpc__extra__pb2.SwitchUserReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateNewUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/io.bisq.protobuffer.UserManagerCommands/CreateNewUser',
+            grpc__extra__pb2.CreateNewUserRequest.SerializeToString,
+            grpc__extra__pb2.CreateNewUserReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/io.bisq.protobuffer.UserManagerCommands/DeleteUser',
+            grpc__extra__pb2.DeleteUserRequest.SerializeToString,
+            grpc__extra__pb2.DeleteUserReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SetUserAlias(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/io.bisq.protobuffer.UserManagerCommands/SetUserAlias',
+            grpc__extra__pb2.SetUserAliasRequest.SerializeToString,
+            grpc__extra__pb2.SetUserAliasReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetUsersList(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/io.bisq.protobuffer.UserManagerCommands/GetUsersList',
+            grpc__extra__pb2.CreateNewUserRequest.SerializeToString,
+            grpc__extra__pb2.GetUsersListReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RestoreUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/io.bisq.protobuffer.UserManagerCommands/RestoreUser',
+            grpc__extra__pb2.RestoreUserRequest.SerializeToString,
+            grpc__extra__pb2.RestoreUserReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
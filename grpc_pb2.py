@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: grpc.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'grpc.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import pb_pb2 as pb__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ngrpc.proto\x12\x13io.bisq.protobuffer\x1a\x08pb.proto\"S\n\x1bRegisterDisputeAgentRequest\x12\x1a\n\x12\x64ispute_agent_type\x18\x01 \x01(\t\x12\x18\n\x10registration_key\x18\x02 \x01(\t\"\x1b\n\x19RegisterDisputeAgentReply\"+\n\x14GetMethodHelpRequest\x12\x13\n\x0bmethod_name\x18\x01 \x01(\t\")\n\x12GetMethodHelpReply\x12\x13\n\x0bmethod_help\x18\x01 \x01(\t\":\n\x17GetOfferCategoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0bis_my_offer\x18\x02 \x01(\x08\"\xac\x01\n\x15GetOfferCategoryReply\x12P\n\x0eoffer_category\x18\x01 \x01(\x0e\x32\x38.io.bisq.protobuffer.GetOfferCategoryReply.OfferCategory\"A\n\rOfferCategory\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x08\n\x04\x46IAT\x10\x01\x12\x0b\n\x07\x41LTCOIN\x10\x02\x12\x0c\n\x08\x42SQ_SWAP\x10\x03\"N\n\x14GetBsqSwapOfferReply\x12\x36\n\x0e\x62sq_swap_offer\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\"\x1d\n\x0fGetOfferRequest\x12\n\n\x02id\x18\x01 \x01(\t\">\n\rGetOfferReply\x12-\n\x05offer\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\"P\n\x16GetMyBsqSwapOfferReply\x12\x36\n\x0e\x62sq_swap_offer\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\"\x1f\n\x11GetMyOfferRequest\x12\n\n\x02id\x18\x01 \x01(\t\"@\n\x0fGetMyOfferReply\x12-\n\x05offer\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\"B\n\x10GetOffersRequest\x12\x11\n\tdirection\x18\x01 \x01(\t\x12\x15\n\rcurrency_code\x18\x02 \x01(\tJ\x04\x08\x03\x10\x04\"@\n\x0eGetOffersReply\x12.\n\x06offers\x18\x01 \x03(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\",\n\x17GetBsqSwapOffersRequest\x12\x11\n\tdirection\x18\x01 \x01(\t\"P\n\x15GetBsqSwapOffersReply\x12\x37\n\x0f\x62sq_swap_offers\x18\x01 \x03(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\">\n\x12GetMyOffersRequest\x12\x11\n\tdirection\x18\x01 \x01(\t\x12\x15\n\rcurrency_code\x18\x02 \x01(\t\"B\n\x10GetMyOffersReply\x12.\n\x06offers\x18\x01 \x03(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\"R\n\x17GetMyBsqSwapOffersReply\x12\x37\n\x0f\x62sq_swap_offers\x18\x01 \x03(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\"a\n\x19\x43reateBsqSwapOfferRequest\x12\x11\n\tdirection\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\x12\x12\n\nmin_amount\x18\x03 \x01(\x04\x12\r\n\x05price\x18\x04 \x01(\t\"Q\n\x17\x43reateBsqSwapOfferReply\x12\x36\n\x0e\x62sq_swap_offer\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\"\xaa\x02\n\x12\x43reateOfferRequest\x12\x15\n\rcurrency_code\x18\x01 \x01(\t\x12\x11\n\tdirection\x18\x02 \x01(\t\x12\r\n\x05price\x18\x03 \x01(\t\x12\x1e\n\x16use_market_based_price\x18\x04 \x01(\x08\x12\x1f\n\x17market_price_margin_pct\x18\x05 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x06 \x01(\x04\x12\x12\n\nmin_amount\x18\x07 \x01(\x04\x12\"\n\x1a\x62uyer_security_deposit_pct\x18\x08 \x01(\x01\x12\x15\n\rtrigger_price\x18\t \x01(\t\x12\x1a\n\x12payment_account_id\x18\n \x01(\t\x12\x1f\n\x17maker_fee_currency_code\x18\x0b \x01(\t\"A\n\x10\x43reateOfferReply\x12-\n\x05offer\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\"\xa7\x04\n\x10\x45\x64itOfferRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\t\x12\x1e\n\x16use_market_based_price\x18\x03 \x01(\x08\x12\x1f\n\x17market_price_margin_pct\x18\x04 \x01(\x01\x12\x15\n\rtrigger_price\x18\x05 \x01(\t\x12\x0e\n\x06\x65nable\x18\x06 \x01(\x11\x12\x41\n\tedit_type\x18\x07 \x01(\x0e\x32..io.bisq.protobuffer.EditOfferRequest.EditType\"\xcc\x02\n\x08\x45\x64itType\x12\x19\n\x15\x41\x43TIVATION_STATE_ONLY\x10\x00\x12\x14\n\x10\x46IXED_PRICE_ONLY\x10\x01\x12$\n FIXED_PRICE_AND_ACTIVATION_STATE\x10\x02\x12\x19\n\x15MKT_PRICE_MARGIN_ONLY\x10\x03\x12)\n%MKT_PRICE_MARGIN_AND_ACTIVATION_STATE\x10\x04\x12\x16\n\x12TRIGGER_PRICE_ONLY\x10\x05\x12&\n\"TRIGGER_PRICE_AND_ACTIVATION_STATE\x10\x06\x12&\n\"MKT_PRICE_MARGIN_AND_TRIGGER_PRICE\x10\x07\x12;\n7MKT_PRICE_MARGIN_AND_TRIGGER_PRICE_AND_ACTIVATION_STATE\x10\x08\"\x10\n\x0e\x45\x64itOfferReply\" \n\x12\x43\x61ncelOfferRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x12\n\x10\x43\x61ncelOfferReply\"\xfa\x05\n\tOfferInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tdirection\x18\x02 \x01(\t\x12\r\n\x05price\x18\x03 \x01(\t\x12\x1e\n\x16use_market_based_price\x18\x04 \x01(\x08\x12\x1f\n\x17market_price_margin_pct\x18\x05 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x06 \x01(\x04\x12\x12\n\nmin_amount\x18\x07 \x01(\x04\x12\x0e\n\x06volume\x18\x08 \x01(\t\x12\x12\n\nmin_volume\x18\t \x01(\t\x12\x1e\n\x16\x62uyer_security_deposit\x18\n \x01(\x04\x12\x15\n\rtrigger_price\x18\x0b \x01(\t\x12%\n\x1dis_currency_for_maker_fee_btc\x18\x0c \x01(\x08\x12\x1a\n\x12payment_account_id\x18\r \x01(\t\x12\x19\n\x11payment_method_id\x18\x0e \x01(\t\x12!\n\x19payment_method_short_name\x18\x0f \x01(\t\x12\x1a\n\x12\x62\x61se_currency_code\x18\x10 \x01(\t\x12\x1d\n\x15\x63ounter_currency_code\x18\x11 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x12 \x01(\x04\x12\r\n\x05state\x18\x13 \x01(\t\x12\x1f\n\x17seller_security_deposit\x18\x14 \x01(\x04\x12\x1f\n\x17offer_fee_payment_tx_id\x18\x15 \x01(\t\x12\x0e\n\x06tx_fee\x18\x16 \x01(\x04\x12\x11\n\tmaker_fee\x18\x17 \x01(\x04\x12\x14\n\x0cis_activated\x18\x18 \x01(\x08\x12\x13\n\x0bis_my_offer\x18\x19 \x01(\x08\x12\x1b\n\x13is_my_pending_offer\x18\x1a \x01(\x08\x12\x19\n\x11is_bsq_swap_offer\x18\x1b \x01(\x08\x12\x1a\n\x12owner_node_address\x18\x1c \x01(\t\x12\x14\n\x0cpub_key_ring\x18\x1d \x01(\t\x12\x12\n\nversion_nr\x18\x1e \x01(\t\x12\x18\n\x10protocol_version\x18\x1f \x01(\x05\"~\n!AvailabilityResultWithDescription\x12\x44\n\x13\x61vailability_result\x18\x01 \x01(\x0e\x32\'.io.bisq.protobuffer.AvailabilityResult\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\";\n\x1b\x43reatePaymentAccountRequest\x12\x1c\n\x14payment_account_form\x18\x01 \x01(\t\"Y\n\x19\x43reatePaymentAccountReply\x12<\n\x0fpayment_account\x18\x01 \x01(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\"\x1b\n\x19GetPaymentAccountsRequest\"X\n\x17GetPaymentAccountsReply\x12=\n\x10payment_accounts\x18\x01 \x03(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\"\x1a\n\x18GetPaymentMethodsRequest\"U\n\x16GetPaymentMethodsReply\x12;\n\x0fpayment_methods\x18\x01 \x03(\x0b\x32\".io.bisq.protobuffer.PaymentMethod\"9\n\x1cGetPaymentAccountFormRequest\x12\x19\n\x11payment_method_id\x18\x01 \x01(\t\"?\n\x1aGetPaymentAccountFormReply\x12!\n\x19payment_account_form_json\x18\x01 \x01(\t\"\x80\x01\n)CreateCryptoCurrencyPaymentAccountRequest\x12\x14\n\x0c\x61\x63\x63ount_name\x18\x01 \x01(\t\x12\x15\n\rcurrency_code\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12\x15\n\rtrade_instant\x18\x04 \x01(\x08\"g\n\'CreateCryptoCurrencyPaymentAccountReply\x12<\n\x0fpayment_account\x18\x01 \x01(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\"(\n&GetCryptoCurrencyPaymentMethodsRequest\"c\n$GetCryptoCurrencyPaymentMethodsReply\x12;\n\x0fpayment_methods\x18\x01 \x03(\x0b\x32\".io.bisq.protobuffer.PaymentMethod\"+\n\x12MarketPriceRequest\x12\x15\n\rcurrency_code\x18\x01 \x01(\t\"!\n\x10MarketPriceReply\x12\r\n\x05price\x18\x01 \x01(\x01\".\n\x1eGetAverageBsqTradePriceRequest\x12\x0c\n\x04\x64\x61ys\x18\x01 \x01(\x11\"X\n\x1cGetAverageBsqTradePriceReply\x12\x38\n\x05price\x18\x01 \x01(\x0b\x32).io.bisq.protobuffer.AverageBsqTradePrice\"<\n\x14\x41verageBsqTradePrice\x12\x11\n\tusd_price\x18\x01 \x01(\t\x12\x11\n\tbtc_price\x18\x02 \x01(\t\"\r\n\x0bStopRequest\"\x0b\n\tStopReply\"q\n\x10TakeOfferRequest\x12\x10\n\x08offer_id\x18\x01 \x01(\t\x12\x1a\n\x12payment_account_id\x18\x02 \x01(\t\x12\x1f\n\x17taker_fee_currency_code\x18\x03 \x01(\t\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x04\"\x8f\x01\n\x0eTakeOfferReply\x12-\n\x05trade\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.TradeInfo\x12N\n\x0e\x66\x61ilure_reason\x18\x02 \x01(\x0b\x32\x36.io.bisq.protobuffer.AvailabilityResultWithDescription\"0\n\x1c\x43onfirmPaymentStartedRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\"R\n\x1f\x43onfirmPaymentStartedXmrRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\r\n\x05tx_id\x18\x02 \x01(\t\x12\x0e\n\x06tx_key\x18\x03 \x01(\t\"\x1c\n\x1a\x43onfirmPaymentStartedReply\"1\n\x1d\x43onfirmPaymentReceivedRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\"\x1d\n\x1b\x43onfirmPaymentReceivedReply\"#\n\x0fGetTradeRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\">\n\rGetTradeReply\x12-\n\x05trade\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.TradeInfo\"\x82\x01\n\x10GetTradesRequest\x12@\n\x08\x63\x61tegory\x18\x01 \x01(\x0e\x32..io.bisq.protobuffer.GetTradesRequest.Category\",\n\x08\x43\x61tegory\x12\x08\n\x04OPEN\x10\x00\x12\n\n\x06\x43LOSED\x10\x01\x12\n\n\x06\x46\x41ILED\x10\x02\"@\n\x0eGetTradesReply\x12.\n\x06trades\x18\x01 \x03(\x0b\x32\x1e.io.bisq.protobuffer.TradeInfo\"%\n\x11\x43loseTradeRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\"\x11\n\x0f\x43loseTradeReply\"$\n\x10\x46\x61ilTradeRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\"\x10\n\x0e\x46\x61ilTradeReply\"&\n\x12UnFailTradeRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\"\x12\n\x10UnFailTradeReply\"G\n\x14WithdrawFundsRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04memo\x18\x03 \x01(\t\"\x14\n\x12WithdrawFundsReply\"\x8b\x07\n\tTradeInfo\x12-\n\x05offer\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.OfferInfo\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12\x10\n\x08short_id\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x04 \x01(\x04\x12\x0c\n\x04role\x18\x05 \x01(\t\x12%\n\x1dis_currency_for_taker_fee_btc\x18\x06 \x01(\x08\x12\x16\n\x0etx_fee_as_long\x18\x07 \x01(\x04\x12\x19\n\x11taker_fee_as_long\x18\x08 \x01(\x04\x12\x17\n\x0ftaker_fee_tx_id\x18\t \x01(\t\x12\x15\n\rdeposit_tx_id\x18\n \x01(\t\x12\x14\n\x0cpayout_tx_id\x18\x0b \x01(\t\x12\x1c\n\x14trade_amount_as_long\x18\x0c \x01(\x04\x12\x13\n\x0btrade_price\x18\r \x01(\t\x12!\n\x19trading_peer_node_address\x18\x0e \x01(\t\x12\r\n\x05state\x18\x0f \x01(\t\x12\r\n\x05phase\x18\x10 \x01(\t\x12\x1a\n\x12trade_period_state\x18\x11 \x01(\t\x12\x1c\n\x14is_deposit_published\x18\x12 \x01(\x08\x12\x1c\n\x14is_deposit_confirmed\x18\x13 \x01(\x08\x12\'\n\x1fis_payment_started_message_sent\x18\x14 \x01(\x08\x12(\n is_payment_received_message_sent\x18\x15 \x01(\x08\x12\x1b\n\x13is_payout_published\x18\x16 \x01(\x08\x12\x14\n\x0cis_completed\x18\x17 \x01(\x08\x12\x18\n\x10\x63ontract_as_json\x18\x18 \x01(\t\x12\x33\n\x08\x63ontract\x18\x19 \x01(\x0b\x32!.io.bisq.protobuffer.ContractInfo\x12\x14\n\x0ctrade_volume\x18\x1a \x01(\t\x12\x42\n\x13\x62sq_swap_trade_info\x18\x1c \x01(\x0b\x32%.io.bisq.protobuffer.BsqSwapTradeInfo\x12\x16\n\x0e\x63losing_status\x18\x1d \x01(\t\x12\x12\n\nhas_failed\x18\x1e \x01(\x08\x12\x15\n\rerror_message\x18\x1f \x01(\t\x12\x17\n\x0f\x61uto_conf_tx_id\x18  \x01(\t\x12\x18\n\x10\x61uto_conf_tx_key\x18! \x01(\t\"\xf1\x03\n\x0c\x43ontractInfo\x12\x1a\n\x12\x62uyer_node_address\x18\x01 \x01(\t\x12\x1b\n\x13seller_node_address\x18\x02 \x01(\t\x12\x1d\n\x15mediator_node_address\x18\x03 \x01(\t\x12!\n\x19refund_agent_node_address\x18\x04 \x01(\t\x12\'\n\x1fis_buyer_maker_and_seller_taker\x18\x05 \x01(\x08\x12\x18\n\x10maker_account_id\x18\x06 \x01(\t\x12\x18\n\x10taker_account_id\x18\x07 \x01(\t\x12U\n\x1dmaker_payment_account_payload\x18\x08 \x01(\x0b\x32..io.bisq.protobuffer.PaymentAccountPayloadInfo\x12U\n\x1dtaker_payment_account_payload\x18\t \x01(\x0b\x32..io.bisq.protobuffer.PaymentAccountPayloadInfo\x12#\n\x1bmaker_payout_address_string\x18\n \x01(\t\x12#\n\x1btaker_payout_address_string\x18\x0b \x01(\t\x12\x11\n\tlock_time\x18\x0c \x01(\x04\"\xf1\x02\n\x10\x42sqSwapTradeInfo\x12\r\n\x05tx_id\x18\x01 \x01(\t\x12\x18\n\x10\x62sq_trade_amount\x18\x02 \x01(\x04\x12\x18\n\x10\x62tc_trade_amount\x18\x03 \x01(\x04\x12\x1b\n\x13\x62sq_maker_trade_fee\x18\x04 \x01(\x04\x12\x1b\n\x13\x62sq_taker_trade_fee\x18\x05 \x01(\x04\x12\x18\n\x10tx_fee_per_vbyte\x18\x06 \x01(\x04\x12\x19\n\x11maker_bsq_address\x18\x07 \x01(\t\x12\x19\n\x11maker_btc_address\x18\x08 \x01(\t\x12\x19\n\x11taker_bsq_address\x18\t \x01(\t\x12\x19\n\x11taker_btc_address\x18\n \x01(\t\x12\x19\n\x11num_confirmations\x18\x0b \x01(\x04\x12\x15\n\rerror_message\x18\x0c \x01(\t\x12\x0e\n\x06payout\x18\r \x01(\x04\x12\x18\n\x10swap_peer_payout\x18\x0e \x01(\x04\"l\n\x19PaymentAccountPayloadInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12\x19\n\x11payment_method_id\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12\x17\n\x0fpayment_details\x18\x04 \x01(\t\"\xa8\x01\n\rTxFeeRateInfo\x12\x1e\n\x16use_custom_tx_fee_rate\x18\x01 \x01(\x08\x12\x1a\n\x12\x63ustom_tx_fee_rate\x18\x02 \x01(\x04\x12\x18\n\x10\x66\x65\x65_service_rate\x18\x03 \x01(\x04\x12#\n\x1blast_fee_service_request_ts\x18\x04 \x01(\x04\x12\x1c\n\x14min_fee_service_rate\x18\x05 \x01(\x04\"{\n\x06TxInfo\x12\r\n\x05tx_id\x18\x01 \x01(\t\x12\x11\n\tinput_sum\x18\x02 \x01(\x04\x12\x12\n\noutput_sum\x18\x03 \x01(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x0c\n\x04size\x18\x05 \x01(\x05\x12\x12\n\nis_pending\x18\x06 \x01(\x08\x12\x0c\n\x04memo\x18\x07 \x01(\t\"\x13\n\x11GetNetworkRequest\"\"\n\x0fGetNetworkReply\x12\x0f\n\x07network\x18\x01 \x01(\t\"\x15\n\x13GetDaoStatusRequest\";\n\x11GetDaoStatusReply\x12&\n\x1eis_dao_state_ready_and_in_sync\x18\x01 \x01(\x08\"+\n\x12GetBalancesRequest\x12\x15\n\rcurrency_code\x18\x01 \x01(\t\"G\n\x10GetBalancesReply\x12\x33\n\x08\x62\x61lances\x18\x01 \x01(\x0b\x32!.io.bisq.protobuffer.BalancesInfo\"+\n\x18GetAddressBalanceRequest\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"_\n\x16GetAddressBalanceReply\x12\x45\n\x14\x61\x64\x64ress_balance_info\x18\x01 \x01(\x0b\x32\'.io.bisq.protobuffer.AddressBalanceInfo\"\x1c\n\x1aGetUnusedBsqAddressRequest\"+\n\x18GetUnusedBsqAddressReply\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"F\n\x0eSendBsqRequest\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\t\x12\x13\n\x0btx_fee_rate\x18\x03 \x01(\t\"<\n\x0cSendBsqReply\x12,\n\x07tx_info\x18\x01 \x01(\x0b\x32\x1b.io.bisq.protobuffer.TxInfo\"T\n\x0eSendBtcRequest\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\t\x12\x13\n\x0btx_fee_rate\x18\x03 \x01(\t\x12\x0c\n\x04memo\x18\x04 \x01(\t\"<\n\x0cSendBtcReply\x12,\n\x07tx_info\x18\x01 \x01(\x0b\x32\x1b.io.bisq.protobuffer.TxInfo\"@\n\x1dVerifyBsqSentToAddressRequest\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\t\"9\n\x1bVerifyBsqSentToAddressReply\x12\x1a\n\x12is_amount_received\x18\x01 \x01(\x08\"\x15\n\x13GetTxFeeRateRequest\"Q\n\x11GetTxFeeRateReply\x12<\n\x10tx_fee_rate_info\x18\x01 \x01(\x0b\x32\".io.bisq.protobuffer.TxFeeRateInfo\"?\n\x1dSetTxFeeRatePreferenceRequest\x12\x1e\n\x16tx_fee_rate_preference\x18\x01 \x01(\x04\"[\n\x1bSetTxFeeRatePreferenceReply\x12<\n\x10tx_fee_rate_info\x18\x01 \x01(\x0b\x32\".io.bisq.protobuffer.TxFeeRateInfo\"!\n\x1fUnsetTxFeeRatePreferenceRequest\"]\n\x1dUnsetTxFeeRatePreferenceReply\x12<\n\x10tx_fee_rate_info\x18\x01 \x01(\x0b\x32\".io.bisq.protobuffer.TxFeeRateInfo\"\x18\n\x16GetTransactionsRequest\"D\n\x14GetTransactionsReply\x12,\n\x07tx_info\x18\x01 \x03(\x0b\x32\x1b.io.bisq.protobuffer.TxInfo\"&\n\x15GetTransactionRequest\x12\r\n\x05tx_id\x18\x01 \x01(\t\"C\n\x13GetTransactionReply\x12,\n\x07tx_info\x18\x01 \x01(\x0b\x32\x1b.io.bisq.protobuffer.TxInfo\"\x1c\n\x1aGetFundingAddressesRequest\"a\n\x18GetFundingAddressesReply\x12\x45\n\x14\x61\x64\x64ress_balance_info\x18\x01 \x03(\x0b\x32\'.io.bisq.protobuffer.AddressBalanceInfo\"B\n\x18SetWalletPasswordRequest\x12\x10\n\x08password\x18\x01 \x01(\t\x12\x14\n\x0cnew_password\x18\x02 \x01(\t\"\x18\n\x16SetWalletPasswordReply\"/\n\x1bRemoveWalletPasswordRequest\x12\x10\n\x08password\x18\x01 \x01(\t\"\x1b\n\x19RemoveWalletPasswordReply\"\x13\n\x11LockWalletRequest\"\x11\n\x0fLockWalletReply\"8\n\x13UnlockWalletRequest\x12\x10\n\x08password\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x04\"\x13\n\x11UnlockWalletReply\"r\n\x0c\x42\x61lancesInfo\x12\x30\n\x03\x62sq\x18\x01 \x01(\x0b\x32#.io.bisq.protobuffer.BsqBalanceInfo\x12\x30\n\x03\x62tc\x18\x02 \x01(\x0b\x32#.io.bisq.protobuffer.BtcBalanceInfo\"\xd7\x01\n\x0e\x42sqBalanceInfo\x12#\n\x1b\x61vailable_confirmed_balance\x18\x01 \x01(\x04\x12\x1a\n\x12unverified_balance\x18\x02 \x01(\x04\x12\"\n\x1aunconfirmed_change_balance\x18\x03 \x01(\x04\x12!\n\x19locked_for_voting_balance\x18\x04 \x01(\x04\x12\x1c\n\x14lockup_bonds_balance\x18\x05 \x01(\x04\x12\x1f\n\x17unlocking_bonds_balance\x18\x06 \x01(\x04\"~\n\x0e\x42tcBalanceInfo\x12\x19\n\x11\x61vailable_balance\x18\x01 \x01(\x04\x12\x18\n\x10reserved_balance\x18\x02 \x01(\x04\x12\x1f\n\x17total_available_balance\x18\x03 \x01(\x04\x12\x16\n\x0elocked_balance\x18\x04 \x01(\x04\"l\n\x12\x41\x64\x64ressBalanceInfo\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x03\x12\x19\n\x11num_confirmations\x18\x03 \x01(\x03\x12\x19\n\x11is_address_unused\x18\x04 \x01(\x08\"\x13\n\x11GetVersionRequest\"\"\n\x0fGetVersionReply\x12\x0f\n\x07version\x18\x01 \x01(\t2\x8b\x01\n\rDisputeAgents\x12z\n\x14RegisterDisputeAgent\x12\x30.io.bisq.protobuffer.RegisterDisputeAgentRequest\x1a..io.bisq.protobuffer.RegisterDisputeAgentReply\"\x00\x32m\n\x04Help\x12\x65\n\rGetMethodHelp\x12).io.bisq.protobuffer.GetMethodHelpRequest\x1a\'.io.bisq.protobuffer.GetMethodHelpReply\"\x00\x32\xb3\n\n\x06Offers\x12n\n\x10GetOfferCategory\x12,.io.bisq.protobuffer.GetOfferCategoryRequest\x1a*.io.bisq.protobuffer.GetOfferCategoryReply\"\x00\x12\x64\n\x0fGetBsqSwapOffer\x12$.io.bisq.protobuffer.GetOfferRequest\x1a).io.bisq.protobuffer.GetBsqSwapOfferReply\"\x00\x12V\n\x08GetOffer\x12$.io.bisq.protobuffer.GetOfferRequest\x1a\".io.bisq.protobuffer.GetOfferReply\"\x00\x12j\n\x11GetMyBsqSwapOffer\x12&.io.bisq.protobuffer.GetMyOfferRequest\x1a+.io.bisq.protobuffer.GetMyBsqSwapOfferReply\"\x00\x12\\\n\nGetMyOffer\x12&.io.bisq.protobuffer.GetMyOfferRequest\x1a$.io.bisq.protobuffer.GetMyOfferReply\"\x00\x12n\n\x10GetBsqSwapOffers\x12,.io.bisq.protobuffer.GetBsqSwapOffersRequest\x1a*.io.bisq.protobuffer.GetBsqSwapOffersReply\"\x00\x12Y\n\tGetOffers\x12%.io.bisq.protobuffer.GetOffersRequest\x1a#.io.bisq.protobuffer.GetOffersReply\"\x00\x12r\n\x12GetMyBsqSwapOffers\x12,.io.bisq.protobuffer.GetBsqSwapOffersRequest\x1a,.io.bisq.protobuffer.GetMyBsqSwapOffersReply\"\x00\x12_\n\x0bGetMyOffers\x12\'.io.bisq.protobuffer.GetMyOffersRequest\x1a%.io.bisq.protobuffer.GetMyOffersReply\"\x00\x12t\n\x12\x43reateBsqSwapOffer\x12..io.bisq.protobuffer.CreateBsqSwapOfferRequest\x1a,.io.bisq.protobuffer.CreateBsqSwapOfferReply\"\x00\x12_\n\x0b\x43reateOffer\x12\'.io.bisq.protobuffer.CreateOfferRequest\x1a%.io.bisq.protobuffer.CreateOfferReply\"\x00\x12Y\n\tEditOffer\x12%.io.bisq.protobuffer.EditOfferRequest\x1a#.io.bisq.protobuffer.EditOfferReply\"\x00\x12_\n\x0b\x43\x61ncelOffer\x12\'.io.bisq.protobuffer.CancelOfferRequest\x1a%.io.bisq.protobuffer.CancelOfferReply\"\x00\x32\xba\x06\n\x0fPaymentAccounts\x12z\n\x14\x43reatePaymentAccount\x12\x30.io.bisq.protobuffer.CreatePaymentAccountRequest\x1a..io.bisq.protobuffer.CreatePaymentAccountReply\"\x00\x12t\n\x12GetPaymentAccounts\x12..io.bisq.protobuffer.GetPaymentAccountsRequest\x1a,.io.bisq.protobuffer.GetPaymentAccountsReply\"\x00\x12q\n\x11GetPaymentMethods\x12-.io.bisq.protobuffer.GetPaymentMethodsRequest\x1a+.io.bisq.protobuffer.GetPaymentMethodsReply\"\x00\x12}\n\x15GetPaymentAccountForm\x12\x31.io.bisq.protobuffer.GetPaymentAccountFormRequest\x1a/.io.bisq.protobuffer.GetPaymentAccountFormReply\"\x00\x12\xa4\x01\n\"CreateCryptoCurrencyPaymentAccount\x12>.io.bisq.protobuffer.CreateCryptoCurrencyPaymentAccountRequest\x1a<.io.bisq.protobuffer.CreateCryptoCurrencyPaymentAccountReply\"\x00\x12\x9b\x01\n\x1fGetCryptoCurrencyPaymentMethods\x12;.io.bisq.protobuffer.GetCryptoCurrencyPaymentMethodsRequest\x1a\x39.io.bisq.protobuffer.GetCryptoCurrencyPaymentMethodsReply\"\x00\x32\xf1\x01\n\x05Price\x12\x62\n\x0eGetMarketPrice\x12\'.io.bisq.protobuffer.MarketPriceRequest\x1a%.io.bisq.protobuffer.MarketPriceReply\"\x00\x12\x83\x01\n\x17GetAverageBsqTradePrice\x12\x33.io.bisq.protobuffer.GetAverageBsqTradePriceRequest\x1a\x31.io.bisq.protobuffer.GetAverageBsqTradePriceReply\"\x00\x32\\\n\x0eShutdownServer\x12J\n\x04Stop\x12 .io.bisq.protobuffer.StopRequest\x1a\x1e.io.bisq.protobuffer.StopReply\"\x00\x32\x9f\x08\n\x06Trades\x12V\n\x08GetTrade\x12$.io.bisq.protobuffer.GetTradeRequest\x1a\".io.bisq.protobuffer.GetTradeReply\"\x00\x12Y\n\tGetTrades\x12%.io.bisq.protobuffer.GetTradesRequest\x1a#.io.bisq.protobuffer.GetTradesReply\"\x00\x12Y\n\tTakeOffer\x12%.io.bisq.protobuffer.TakeOfferRequest\x1a#.io.bisq.protobuffer.TakeOfferReply\"\x00\x12}\n\x15\x43onfirmPaymentStarted\x12\x31.io.bisq.protobuffer.ConfirmPaymentStartedRequest\x1a/.io.bisq.protobuffer.ConfirmPaymentStartedReply\"\x00\x12\x83\x01\n\x18\x43onfirmPaymentStartedXmr\x12\x34.io.bisq.protobuffer.ConfirmPaymentStartedXmrRequest\x1a/.io.bisq.protobuffer.ConfirmPaymentStartedReply\"\x00\x12\x80\x01\n\x16\x43onfirmPaymentReceived\x12\x32.io.bisq.protobuffer.ConfirmPaymentReceivedRequest\x1a\x30.io.bisq.protobuffer.ConfirmPaymentReceivedReply\"\x00\x12\\\n\nCloseTrade\x12&.io.bisq.protobuffer.CloseTradeRequest\x1a$.io.bisq.protobuffer.CloseTradeReply\"\x00\x12Y\n\tFailTrade\x12%.io.bisq.protobuffer.FailTradeRequest\x1a#.io.bisq.protobuffer.FailTradeReply\"\x00\x12_\n\x0bUnFailTrade\x12\'.io.bisq.protobuffer.UnFailTradeRequest\x1a%.io.bisq.protobuffer.UnFailTradeReply\"\x00\x12\x65\n\rWithdrawFunds\x12).io.bisq.protobuffer.WithdrawFundsRequest\x1a\'.io.bisq.protobuffer.WithdrawFundsReply\"\x00\x32\xb6\x0f\n\x07Wallets\x12\\\n\nGetNetwork\x12&.io.bisq.protobuffer.GetNetworkRequest\x1a$.io.bisq.protobuffer.GetNetworkReply\"\x00\x12\x62\n\x0cGetDaoStatus\x12(.io.bisq.protobuffer.GetDaoStatusRequest\x1a&.io.bisq.protobuffer.GetDaoStatusReply\"\x00\x12_\n\x0bGetBalances\x12\'.io.bisq.protobuffer.GetBalancesRequest\x1a%.io.bisq.protobuffer.GetBalancesReply\"\x00\x12q\n\x11GetAddressBalance\x12-.io.bisq.protobuffer.GetAddressBalanceRequest\x1a+.io.bisq.protobuffer.GetAddressBalanceReply\"\x00\x12w\n\x13GetUnusedBsqAddress\x12/.io.bisq.protobuffer.GetUnusedBsqAddressRequest\x1a-.io.bisq.protobuffer.GetUnusedBsqAddressReply\"\x00\x12S\n\x07SendBsq\x12#.io.bisq.protobuffer.SendBsqRequest\x1a!.io.bisq.protobuffer.SendBsqReply\"\x00\x12S\n\x07SendBtc\x12#.io.bisq.protobuffer.SendBtcRequest\x1a!.io.bisq.protobuffer.SendBtcReply\"\x00\x12\x80\x01\n\x16VerifyBsqSentToAddress\x12\x32.io.bisq.protobuffer.VerifyBsqSentToAddressRequest\x1a\x30.io.bisq.protobuffer.VerifyBsqSentToAddressReply\"\x00\x12\x62\n\x0cGetTxFeeRate\x12(.io.bisq.protobuffer.GetTxFeeRateRequest\x1a&.io.bisq.protobuffer.GetTxFeeRateReply\"\x00\x12\x80\x01\n\x16SetTxFeeRatePreference\x12\x32.io.bisq.protobuffer.SetTxFeeRatePreferenceRequest\x1a\x30.io.bisq.protobuffer.SetTxFeeRatePreferenceReply\"\x00\x12\x86\x01\n\x18UnsetTxFeeRatePreference\x12\x34.io.bisq.protobuffer.UnsetTxFeeRatePreferenceRequest\x1a\x32.io.bisq.protobuffer.UnsetTxFeeRatePreferenceReply\"\x00\x12k\n\x0fGetTransactions\x12+.io.bisq.protobuffer.GetTransactionsRequest\x1a).io.bisq.protobuffer.GetTransactionsReply\"\x00\x12h\n\x0eGetTransaction\x12*.io.bisq.protobuffer.GetTransactionRequest\x1a(.io.bisq.protobuffer.GetTransactionReply\"\x00\x12w\n\x13GetFundingAddresses\x12/.io.bisq.protobuffer.GetFundingAddressesRequest\x1a-.io.bisq.protobuffer.GetFundingAddressesReply\"\x00\x12q\n\x11SetWalletPassword\x12-.io.bisq.protobuffer.SetWalletPasswordRequest\x1a+.io.bisq.protobuffer.SetWalletPasswordReply\"\x00\x12z\n\x14RemoveWalletPassword\x12\x30.io.bisq.protobuffer.RemoveWalletPasswordRequest\x1a..io.bisq.protobuffer.RemoveWalletPasswordReply\"\x00\x12\\\n\nLockWallet\x12&.io.bisq.protobuffer.LockWalletRequest\x1a$.io.bisq.protobuffer.LockWalletReply\"\x00\x12\x62\n\x0cUnlockWallet\x12(.io.bisq.protobuffer.UnlockWalletRequest\x1a&.io.bisq.protobuffer.UnlockWalletReply\"\x00\x32j\n\nGetVersion\x12\\\n\nGetVersion\x12&.io.bisq.protobuffer.GetVersionRequest\x1a$.io.bisq.protobuffer.GetVersionReply\"\x00\x42\x13\n\x0f\x62isq.proto.grpcP\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'grpc_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\017bisq.proto.grpcP\001'
+  _globals['_REGISTERDISPUTEAGENTREQUEST']._serialized_start=45
+  _globals['_REGISTERDISPUTEAGENTREQUEST']._serialized_end=128
+  _globals['_REGISTERDISPUTEAGENTREPLY']._serialized_start=130
+  _globals['_REGISTERDISPUTEAGENTREPLY']._serialized_end=157
+  _globals['_GETMETHODHELPREQUEST']._serialized_start=159
+  _globals['_GETMETHODHELPREQUEST']._serialized_end=202
+  _globals['_GETMETHODHELPREPLY']._serialized_start=204
+  _globals['_GETMETHODHELPREPLY']._serialized_end=245
+  _globals['_GETOFFERCATEGORYREQUEST']._serialized_start=247
+  _globals['_GETOFFERCATEGORYREQUEST']._serialized_end=305
+  _globals['_GETOFFERCATEGORYREPLY']._serialized_start=308
+  _globals['_GETOFFERCATEGORYREPLY']._serialized_end=480
+  _globals['_GETOFFERCATEGORYREPLY_OFFERCATEGORY']._serialized_start=415
+  _globals['_GETOFFERCATEGORYREPLY_OFFERCATEGORY']._serialized_end=480
+  _globals['_GETBSQSWAPOFFERREPLY']._serialized_start=482
+  _globals['_GETBSQSWAPOFFERREPLY']._serialized_end=560
+  _globals['_GETOFFERREQUEST']._serialized_start=562
+  _globals['_GETOFFERREQUEST']._serialized_end=591
+  _globals['_GETOFFERREPLY']._serialized_start=593
+  _globals['_GETOFFERREPLY']._serialized_end=655
+  _globals['_GETMYBSQSWAPOFFERREPLY']._serialized_start=657
+  _globals['_GETMYBSQSWAPOFFERREPLY']._serialized_end=737
+  _globals['_GETMYOFFERREQUEST']._serialized_start=739
+  _globals['_GETMYOFFERREQUEST']._serialized_end=770
+  _globals['_GETMYOFFERREPLY']._serialized_start=772
+  _globals['_GETMYOFFERREPLY']._serialized_end=836
+  _globals['_GETOFFERSREQUEST']._serialized_start=838
+  _globals['_GETOFFERSREQUEST']._serialized_end=904
+  _globals['_GETOFFERSREPLY']._serialized_start=906
+  _globals['_GETOFFERSREPLY']._serialized_end=970
+  _globals['_GETBSQSWAPOFFERSREQUEST']._serialized_start=972
+  _globals['_GETBSQSWAPOFFERSREQUEST']._serialized_end=1016
+  _globals['_GETBSQSWAPOFFERSREPLY']._serialized_start=1018
+  _globals['_GETBSQSWAPOFFERSREPLY']._serialized_end=1098
+  _globals['_GETMYOFFERSREQUEST']._serialized_start=1100
+  _globals['_GETMYOFFERSREQUEST']._serialized_end=1162
+  _globals['_GETMYOFFERSREPLY']._serialized_start=1164
+  _globals['_GETMYOFFERSREPLY']._serialized_end=1230
+  _globals['_GETMYBSQSWAPOFFERSREPLY']._serialized_start=1232
+  _globals['_GETMYBSQSWAPOFFERSREPLY']._serialized_end=1314
+  _globals['_CREATEBSQSWAPOFFERREQUEST']._serialized_start=1316
+  _globals['_CREATEBSQSWAPOFFERREQUEST']._serialized_end=1413
+  _globals['_CREATEBSQSWAPOFFERREPLY']._serialized_start=1415
+  _globals['_CREATEBSQSWAPOFFERREPLY']._serialized_end=1496
+  _globals['_CREATEOFFERREQUEST']._serialized_start=1499
+  _globals['_CREATEOFFERREQUEST']._serialized_end=1797
+  _globals['_CREATEOFFERREPLY']._serialized_start=1799
+  _globals['_CREATEOFFERREPLY']._serialized_end=1864
+  _globals['_EDITOFFERREQUEST']._serialized_start=1867
+  _globals['_EDITOFFERREQUEST']._serialized_end=2418
+  _globals['_EDITOFFERREQUEST_EDITTYPE']._serialized_start=2086
+  _globals['_EDITOFFERREQUEST_EDITTYPE']._serialized_end=2418
+  _globals['_EDITOFFERREPLY']._serialized_start=2420
+  _globals['_EDITOFFERREPLY']._serialized_end=2436
+  _globals['_CANCELOFFERREQUEST']._serialized_start=2438
+  _globals['_CANCELOFFERREQUEST']._serialized_end=2470
+  _globals['_CANCELOFFERREPLY']._serialized_start=2472
+  _globals['_CANCELOFFERREPLY']._serialized_end=2490
+  _globals['_OFFERINFO']._serialized_start=2493
+  _globals['_OFFERINFO']._serialized_end=3255
+  _globals['_AVAILABILITYRESULTWITHDESCRIPTION']._serialized_start=3257
+  _globals['_AVAILABILITYRESULTWITHDESCRIPTION']._serialized_end=3383
+  _globals['_CREATEPAYMENTACCOUNTREQUEST']._serialized_start=3385
+  _globals['_CREATEPAYMENTACCOUNTREQUEST']._serialized_end=3444
+  _globals['_CREATEPAYMENTACCOUNTREPLY']._serialized_start=3446
+  _globals['_CREATEPAYMENTACCOUNTREPLY']._serialized_end=3535
+  _globals['_GETPAYMENTACCOUNTSREQUEST']._serialized_start=3537
+  _globals['_GETPAYMENTACCOUNTSREQUEST']._serialized_end=3564
+  _globals['_GETPAYMENTACCOUNTSREPLY']._serialized_start=3566
+  _globals['_GETPAYMENTACCOUNTSREPLY']._serialized_end=3654
+  _globals['_GETPAYMENTMETHODSREQUEST']._serialized_start=3656
+  _globals['_GETPAYMENTMETHODSREQUEST']._serialized_end=3682
+  _globals['_GETPAYMENTMETHODSREPLY']._serialized_start=3684
+  _globals['_GETPAYMENTMETHODSREPLY']._serialized_end=3769
+  _globals['_GETPAYMENTACCOUNTFORMREQUEST']._serialized_start=3771
+  _globals['_GETPAYMENTACCOUNTFORMREQUEST']._serialized_end=3828
+  _globals['_GETPAYMENTACCOUNTFORMREPLY']._serialized_start=3830
+  _globals['_GETPAYMENTACCOUNTFORMREPLY']._serialized_end=3893
+  _globals['_CREATECRYPTOCURRENCYPAYMENTACCOUNTREQUEST']._serialized_start=3896
+  _globals['_CREATECRYPTOCURRENCYPAYMENTACCOUNTREQUEST']._serialized_end=4024
+  _globals['_CREATECRYPTOCURRENCYPAYMENTACCOUNTREPLY']._serialized_start=4026
+  _globals['_CREATECRYPTOCURRENCYPAYMENTACCOUNTREPLY']._serialized_end=4129
+  _globals['_GETCRYPTOCURRENCYPAYMENTMETHODSREQUEST']._serialized_start=4131
+  _globals['_GETCRYPTOCURRENCYPAYMENTMETHODSREQUEST']._serialized_end=4171
+  _globals['_GETCRYPTOCURRENCYPAYMENTMETHODSREPLY']._serialized_start=4173
+  _globals['_GETCRYPTOCURRENCYPAYMENTMETHODSREPLY']._serialized_end=4272
+  _globals['_MARKETPRICEREQUEST']._serialized_start=4274
+  _globals['_MARKETPRICEREQUEST']._serialized_end=4317
+  _globals['_MARKETPRICEREPLY']._serialized_start=4319
+  _globals['_MARKETPRICEREPLY']._serialized_end=4352
+  _globals['_GETAVERAGEBSQTRADEPRICEREQUEST']._serialized_start=4354
+  _globals['_GETAVERAGEBSQTRADEPRICEREQUEST']._serialized_end=4400
+  _globals['_GETAVERAGEBSQTRADEPRICEREPLY']._serialized_start=4402
+  _globals['_GETAVERAGEBSQTRADEPRICEREPLY']._serialized_end=4490
+  _globals['_AVERAGEBSQTRADEPRICE']._serialized_start=4492
+  _globals['_AVERAGEBSQTRADEPRICE']._serialized_end=4552
+  _globals['_STOPREQUEST']._serialized_start=4554
+  _globals['_STOPREQUEST']._serialized_end=4567
+  _globals['_STOPREPLY']._serialized_start=4569
+  _globals['_STOPREPLY']._serialized_end=4580
+  _globals['_TAKEOFFERREQUEST']._serialized_start=4582
+  _globals['_TAKEOFFERREQUEST']._serialized_end=4695
+  _globals['_TAKEOFFERREPLY']._serialized_start=4698
+  _globals['_TAKEOFFERREPLY']._serialized_end=4841
+  _globals['_CONFIRMPAYMENTSTARTEDREQUEST']._serialized_start=4843
+  _globals['_CONFIRMPAYMENTSTARTEDREQUEST']._serialized_end=4891
+  _globals['_CONFIRMPAYMENTSTARTEDXMRREQUEST']._serialized_start=4893
+  _globals['_CONFIRMPAYMENTSTARTEDXMRREQUEST']._serialized_end=4975
+  _globals['_CONFIRMPAYMENTSTARTEDREPLY']._serialized_start=4977
+  _globals['_CONFIRMPAYMENTSTARTEDREPLY']._serialized_end=5005
+  _globals['_CONFIRMPAYMENTRECEIVEDREQUEST']._serialized_start=5007
+  _globals['_CONFIRMPAYMENTRECEIVEDREQUEST']._serialized_end=5056
+  _globals['_CONFIRMPAYMENTRECEIVEDREPLY']._serialized_start=5058
+  _globals['_CONFIRMPAYMENTRECEIVEDREPLY']._serialized_end=5087
+  _globals['_GETTRADEREQUEST']._serialized_start=5089
+  _globals['_GETTRADEREQUEST']._serialized_end=5124
+  _globals['_GETTRADEREPLY']._serialized_start=5126
+  _globals['_GETTRADEREPLY']._serialized_end=5188
+  _globals['_GETTRADESREQUEST']._serialized_start=5191
+  _globals['_GETTRADESREQUEST']._serialized_end=5321
+  _globals['_GETTRADESREQUEST_CATEGORY']._serialized_start=5277
+  _globals['_GETTRADESREQUEST_CATEGORY']._serialized_end=5321
+  _globals['_GETTRADESREPLY']._serialized_start=5323
+  _globals['_GETTRADESREPLY']._serialized_end=5387
+  _globals['_CLOSETRADEREQUEST']._serialized_start=5389
+  _globals['_CLOSETRADEREQUEST']._serialized_end=5426
+  _globals['_CLOSETRADEREPLY']._serialized_start=5428
+  _globals['_CLOSETRADEREPLY']._serialized_end=5445
+  _globals['_FAILTRADEREQUEST']._serialized_start=5447
+  _globals['_FAILTRADEREQUEST']._serialized_end=5483
+  _globals['_FAILTRADEREPLY']._serialized_start=5485
+  _globals['_FAILTRADEREPLY']._serialized_end=5501
+  _globals['_UNFAILTRADEREQUEST']._serialized_start=5503
+  _globals['_UNFAILTRADEREQUEST']._serialized_end=5541
+  _globals['_UNFAILTRADEREPLY']._serialized_start=5543
+  _globals['_UNFAILTRADEREPLY']._serialized_end=5561
+  _globals['_WITHDRAWFUNDSREQUEST']._serialized_start=5563
+  _globals['_WITHDRAWFUNDSREQUEST']._serialized_end=5634
+  _globals['_WITHDRAWFUNDSREPLY']._serialized_start=5636
+  _globals['_WITHDRAWFUNDSREPLY']._serialized_end=5656
+  _globals['_TRADEINFO']._serialized_start=5659
+  _globals['_TRADEINFO']._serialized_end=6566
+  _globals['_CONTRACTINFO']._serialized_start=6569
+  _globals['_CONTRACTINFO']._serialized_end=7066
+  _globals['_BSQSWAPTRADEINFO']._serialized_start=7069
+  _globals['_BSQSWAPTRADEINFO']._serialized_end=7438
+  _globals['_PAYMENTACCOUNTPAYLOADINFO']._serialized_start=7440
+  _globals['_PAYMENTACCOUNTPAYLOADINFO']._serialized_end=7548
+  _globals['_TXFEERATEINFO']._serialized_start=7551
+  _globals['_TXFEERATEINFO']._serialized_end=7719
+  _globals['_TXINFO']._serialized_start=7721
+  _globals['_TXINFO']._serialized_end=7844
+  _globals['_GETNETWORKREQUEST']._serialized_start=7846
+  _globals['_GETNETWORKREQUEST']._serialized_end=7865
+  _globals['_GETNETWORKREPLY']._serialized_start=7867
+  _globals['_GETNETWORKREPLY']._serialized_end=7901
+  _globals['_GETDAOSTATUSREQUEST']._serialized_start=7903
+  _globals['_GETDAOSTATUSREQUEST']._serialized_end=7924
+  _globals['_GETDAOSTATUSREPLY']._serialized_start=7926
+  _globals['_GETDAOSTATUSREPLY']._serialized_end=7985
+  _globals['_GETBALANCESREQUEST']._serialized_start=7987
+  _globals['_GETBALANCESREQUEST']._serialized_end=8030
+  _globals['_GETBALANCESREPLY']._serialized_start=8032
+  _globals['_GETBALANCESREPLY']._serialized_end=8103
+  _globals['_GETADDRESSBALANCEREQUEST']._serialized_start=8105
+  _globals['_GETADDRESSBALANCEREQUEST']._serialized_end=8148
+  _globals['_GETADDRESSBALANCEREPLY']._serialized_start=8150
+  _globals['_GETADDRESSBALANCEREPLY']._serialized_end=8245
+  _globals['_GETUNUSEDBSQADDRESSREQUEST']._serialized_start=8247
+  _globals['_GETUNUSEDBSQADDRESSREQUEST']._serialized_end=8275
+  _globals['_GETUNUSEDBSQADDRESSREPLY']._serialized_start=8277
+  _globals['_GETUNUSEDBSQADDRESSREPLY']._serialized_end=8320
+  _globals['_SENDBSQREQUEST']._serialized_start=8322
+  _globals['_SENDBSQREQUEST']._serialized_end=8392
+  _globals['_SENDBSQREPLY']._serialized_start=8394
+  _globals['_SENDBSQREPLY']._serialized_end=8454
+  _globals['_SENDBTCREQUEST']._serialized_start=8456
+  _globals['_SENDBTCREQUEST']._serialized_end=8540
+  _globals['_SENDBTCREPLY']._serialized_start=8542
+  _globals['_SENDBTCREPLY']._serialized_end=8602
+  _globals['_VERIFYBSQSENTTOADDRESSREQUEST']._serialized_start=8604
+  _globals['_VERIFYBSQSENTTOADDRESSREQUEST']._serialized_end=8668
+  _globals['_VERIFYBSQSENTTOADDRESSREPLY']._serialized_start=8670
+  _globals['_VERIFYBSQSENTTOADDRESSREPLY']._serialized_end=8727
+  _globals['_GETTXFEERATEREQUEST']._serialized_start=8729
+  _globals['_GETTXFEERATEREQUEST']._serialized_end=8750
+  _globals['_GETTXFEERATEREPLY']._serialized_start=8752
+  _globals['_GETTXFEERATEREPLY']._serialized_end=8833
+  _globals['_SETTXFEERATEPREFERENCEREQUEST']._serialized_start=8835
+  _globals['_SETTXFEERATEPREFERENCEREQUEST']._serialized_end=8898
+  _globals['_SETTXFEERATEPREFERENCEREPLY']._serialized_start=8900
+  _globals['_SETTXFEERATEPREFERENCEREPLY']._serialized_end=8991
+  _globals['_UNSETTXFEERATEPREFERENCEREQUEST']._serialized_start=8993
+  _globals['_UNSETTXFEERATEPREFERENCEREQUEST']._serialized_end=9026
+  _globals['_UNSETTXFEERATEPREFERENCEREPLY']._serialized_start=9028
+  _globals['_UNSETTXFEERATEPREFERENCEREPLY']._serialized_end=9121
+  _globals['_GETTRANSACTIONSREQUEST']._serialized_start=9123
+  _globals['_GETTRANSACTIONSREQUEST']._serialized_end=9147
+  _globals['_GETTRANSACTIONSREPLY']._serialized_start=9149
+  _globals['_GETTRANSACTIONSREPLY']._serialized_end=9217
+  _globals['_GETTRANSACTIONREQUEST']._serialized_start=9219
+  _globals['_GETTRANSACTIONREQUEST']._serialized_end=9257
+  _globals['_GETTRANSACTIONREPLY']._serialized_start=9259
+  _globals['_GETTRANSACTIONREPLY']._serialized_end=9326
+  _globals['_GETFUNDINGADDRESSESREQUEST']._serialized_start=9328
+  _globals['_GETFUNDINGADDRESSESREQUEST']._serialized_end=9356
+  _globals['_GETFUNDINGADDRESSESREPLY']._serialized_start=9358
+  _globals['_GETFUNDINGADDRESSESREPLY']._serialized_end=9455
+  _globals['_SETWALLETPASSWORDREQUEST']._serialized_start=9457
+  _globals['_SETWALLETPASSWORDREQUEST']._serialized_end=9523
+  _globals['_SETWALLETPASSWORDREPLY']._serialized_start=9525
+  _globals['_SETWALLETPASSWORDREPLY']._serialized_end=9549
+  _globals['_REMOVEWALLETPASSWORDREQUEST']._serialized_start=9551
+  _globals['_REMOVEWALLETPASSWORDREQUEST']._serialized_end=9598
+  _globals['_REMOVEWALLETPASSWORDREPLY']._serialized_start=9600
+  _globals['_REMOVEWALLETPASSWORDREPLY']._serialized_end=9627
+  _globals['_LOCKWALLETREQUEST']._serialized_start=9629
+  _globals['_LOCKWALLETREQUEST']._serialized_end=9648
+  _globals['_LOCKWALLETREPLY']._serialized_start=9650
+  _globals['_LOCKWALLETREPLY']._serialized_end=9667
+  _globals['_UNLOCKWALLETREQUEST']._serialized_start=9669
+  _globals['_UNLOCKWALLETREQUEST']._serialized_end=9725
+  _globals['_UNLOCKWALLETREPLY']._serialized_start=9727
+  _globals['_UNLOCKWALLETREPLY']._serialized_end=9746
+  _globals['_BALANCESINFO']._serialized_start=9748
+  _globals['_BALANCESINFO']._serialized_end=9862
+  _globals['_BSQBALANCEINFO']._serialized_start=9865
+  _globals['_BSQBALANCEINFO']._serialized_end=10080
+  _globals['_BTCBALANCEINFO']._serialized_start=10082
+  _globals['_BTCBALANCEINFO']._serialized_end=10208
+  _globals['_ADDRESSBALANCEINFO']._serialized_start=10210
+  _globals['_ADDRESSBALANCEINFO']._serialized_end=10318
+  _globals['_GETVERSIONREQUEST']._serialized_start=10320
+  _globals['_GETVERSIONREQUEST']._serialized_end=10339
+  _globals['_GETVERSIONREPLY']._serialized_start=10341
+  _globals['_GETVERSIONREPLY']._serialized_end=10375
+  _globals['_DISPUTEAGENTS']._serialized_start=10378
+  _globals['_DISPUTEAGENTS']._serialized_end=10517
+  _globals['_HELP']._serialized_start=10519
+  _globals['_HELP']._serialized_end=10628
+  _globals['_OFFERS']._serialized_start=10631
+  _globals['_OFFERS']._serialized_end=11962
+  _globals['_PAYMENTACCOUNTS']._serialized_start=11965
+  _globals['_PAYMENTACCOUNTS']._serialized_end=12791
+  _globals['_PRICE']._serialized_start=12794
+  _globals['_PRICE']._serialized_end=13035
+  _globals['_SHUTDOWNSERVER']._serialized_start=13037
+  _globals['_SHUTDOWNSERVER']._serialized_end=13129
+  _globals['_TRADES']._serialized_start=13132
+  _globals['_TRADES']._serialized_end=14187
+  _globals['_WALLETS']._serialized_start=14190
+  _globals['_WALLETS']._serialized_end=16164
+  _globals['_GETVERSION']._serialized_start=16166
+  _globals['_GETVERSION']._serialized_end=16272
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,775 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: pb.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'pb.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x08pb.proto\x12\x13io.bisq.protobuffer\"=\n\x0eStringMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x0f\n\x05value\x18\x02 \x01(\tH\x00\x42\r\n\x0bvalue_oneof\"\xea)\n\x0fNetworkEnvelope\x12\x17\n\x0fmessage_version\x18\x01 \x01(\x05\x12V\n\x1cpreliminary_get_data_request\x18\x02 \x01(\x0b\x32..io.bisq.protobuffer.PreliminaryGetDataRequestH\x00\x12\x41\n\x11get_data_response\x18\x03 \x01(\x0b\x32$.io.bisq.protobuffer.GetDataResponseH\x00\x12N\n\x18get_updated_data_request\x18\x04 \x01(\x0b\x32*.io.bisq.protobuffer.GetUpdatedDataRequestH\x00\x12\x41\n\x11get_peers_request\x18\x05 \x01(\x0b\x32$.io.bisq.protobuffer.GetPeersRequestH\x00\x12\x43\n\x12get_peers_response\x18\x06 \x01(\x0b\x32%.io.bisq.protobuffer.GetPeersResponseH\x00\x12)\n\x04ping\x18\x07 \x01(\x0b\x32\x19.io.bisq.protobuffer.PingH\x00\x12)\n\x04pong\x18\x08 \x01(\x0b\x32\x19.io.bisq.protobuffer.PongH\x00\x12S\n\x1aoffer_availability_request\x18\t \x01(\x0b\x32-.io.bisq.protobuffer.OfferAvailabilityRequestH\x00\x12U\n\x1boffer_availability_response\x18\n \x01(\x0b\x32..io.bisq.protobuffer.OfferAvailabilityResponseH\x00\x12I\n\x15refresh_offer_message\x18\x0b \x01(\x0b\x32(.io.bisq.protobuffer.RefreshOfferMessageH\x00\x12?\n\x10\x61\x64\x64_data_message\x18\x0c \x01(\x0b\x32#.io.bisq.protobuffer.AddDataMessageH\x00\x12\x45\n\x13remove_data_message\x18\r \x01(\x0b\x32&.io.bisq.protobuffer.RemoveDataMessageH\x00\x12T\n\x1bremove_mailbox_data_message\x18\x0e \x01(\x0b\x32-.io.bisq.protobuffer.RemoveMailboxDataMessageH\x00\x12O\n\x18\x63lose_connection_message\x18\x0f \x01(\x0b\x32+.io.bisq.protobuffer.CloseConnectionMessageH\x00\x12\x61\n\"prefixed_sealed_and_signed_message\x18\x10 \x01(\x0b\x32\x33.io.bisq.protobuffer.PrefixedSealedAndSignedMessageH\x00\x12W\n\x1dinputs_for_deposit_tx_request\x18\x11 \x01(\x0b\x32..io.bisq.protobuffer.InputsForDepositTxRequestH\x00\x12Y\n\x1einputs_for_deposit_tx_response\x18\x12 \x01(\x0b\x32/.io.bisq.protobuffer.InputsForDepositTxResponseH\x00\x12\x43\n\x12\x64\x65posit_tx_message\x18\x13 \x01(\x0b\x32%.io.bisq.protobuffer.DepositTxMessageH\x00\x12o\n)counter_currency_transfer_started_message\x18\x14 \x01(\x0b\x32:.io.bisq.protobuffer.CounterCurrencyTransferStartedMessageH\x00\x12T\n\x1bpayout_tx_published_message\x18\x15 \x01(\x0b\x32-.io.bisq.protobuffer.PayoutTxPublishedMessageH\x00\x12N\n\x18open_new_dispute_message\x18\x16 \x01(\x0b\x32*.io.bisq.protobuffer.OpenNewDisputeMessageH\x00\x12T\n\x1bpeer_opened_dispute_message\x18\x17 \x01(\x0b\x32-.io.bisq.protobuffer.PeerOpenedDisputeMessageH\x00\x12\x38\n\x0c\x63hat_message\x18\x18 \x01(\x0b\x32 .io.bisq.protobuffer.ChatMessageH\x00\x12K\n\x16\x64ispute_result_message\x18\x19 \x01(\x0b\x32).io.bisq.protobuffer.DisputeResultMessageH\x00\x12l\n(peer_published_dispute_payout_tx_message\x18\x1a \x01(\x0b\x32\x38.io.bisq.protobuffer.PeerPublishedDisputePayoutTxMessageH\x00\x12W\n\x1cprivate_notification_message\x18\x1b \x01(\x0b\x32/.io.bisq.protobuffer.PrivateNotificationMessageH\x00\x12\x43\n\x12get_blocks_request\x18\x1c \x01(\x0b\x32%.io.bisq.protobuffer.GetBlocksRequestH\x00\x12\x45\n\x13get_blocks_response\x18\x1d \x01(\x0b\x32&.io.bisq.protobuffer.GetBlocksResponseH\x00\x12T\n\x1bnew_block_broadcast_message\x18\x1e \x01(\x0b\x32-.io.bisq.protobuffer.NewBlockBroadcastMessageH\x00\x12k\n\'add_persistable_network_payload_message\x18\x1f \x01(\x0b\x32\x38.io.bisq.protobuffer.AddPersistableNetworkPayloadMessageH\x00\x12\x36\n\x0b\x61\x63k_message\x18  \x01(\x0b\x32\x1f.io.bisq.protobuffer.AckMessageH\x00\x12`\n!republish_governance_data_request\x18! \x01(\x0b\x32\x33.io.bisq.protobuffer.RepublishGovernanceDataRequestH\x00\x12Q\n\x1anew_dao_state_hash_message\x18\" \x01(\x0b\x32+.io.bisq.protobuffer.NewDaoStateHashMessageH\x00\x12U\n\x1cget_dao_state_hashes_request\x18# \x01(\x0b\x32-.io.bisq.protobuffer.GetDaoStateHashesRequestH\x00\x12W\n\x1dget_dao_state_hashes_response\x18$ \x01(\x0b\x32..io.bisq.protobuffer.GetDaoStateHashesResponseH\x00\x12[\n\x1fnew_proposal_state_hash_message\x18% \x01(\x0b\x32\x30.io.bisq.protobuffer.NewProposalStateHashMessageH\x00\x12_\n!get_proposal_state_hashes_request\x18& \x01(\x0b\x32\x32.io.bisq.protobuffer.GetProposalStateHashesRequestH\x00\x12\x61\n\"get_proposal_state_hashes_response\x18\' \x01(\x0b\x32\x33.io.bisq.protobuffer.GetProposalStateHashesResponseH\x00\x12^\n!new_blind_vote_state_hash_message\x18( \x01(\x0b\x32\x31.io.bisq.protobuffer.NewBlindVoteStateHashMessageH\x00\x12\x62\n#get_blind_vote_state_hashes_request\x18) \x01(\x0b\x32\x33.io.bisq.protobuffer.GetBlindVoteStateHashesRequestH\x00\x12\x64\n$get_blind_vote_state_hashes_response\x18* \x01(\x0b\x32\x34.io.bisq.protobuffer.GetBlindVoteStateHashesResponseH\x00\x12\x45\n\x13\x62undle_of_envelopes\x18+ \x01(\x0b\x32&.io.bisq.protobuffer.BundleOfEnvelopesH\x00\x12\x65\n$mediated_payout_tx_signature_message\x18, \x01(\x0b\x32\x35.io.bisq.protobuffer.MediatedPayoutTxSignatureMessageH\x00\x12\x65\n$mediated_payout_tx_published_message\x18- \x01(\x0b\x32\x35.io.bisq.protobuffer.MediatedPayoutTxPublishedMessageH\x00\x12\x63\n#delayed_payout_tx_signature_request\x18. \x01(\x0b\x32\x34.io.bisq.protobuffer.DelayedPayoutTxSignatureRequestH\x00\x12\x65\n$delayed_payout_tx_signature_response\x18/ \x01(\x0b\x32\x35.io.bisq.protobuffer.DelayedPayoutTxSignatureResponseH\x00\x12k\n(deposit_tx_and_delayed_payout_tx_message\x18\x30 \x01(\x0b\x32\x37.io.bisq.protobuffer.DepositTxAndDelayedPayoutTxMessageH\x00\x12l\n(peer_published_delayed_payout_tx_message\x18\x31 \x01(\x0b\x32\x38.io.bisq.protobuffer.PeerPublishedDelayedPayoutTxMessageH\x00\x12X\n\x1brefresh_trade_state_request\x18\x32 \x01(\x0b\x32-.io.bisq.protobuffer.RefreshTradeStateRequestB\x02\x18\x01H\x00\x12\\\n\x1dtrader_signed_witness_message\x18\x33 \x01(\x0b\x32/.io.bisq.protobuffer.TraderSignedWitnessMessageB\x02\x18\x01H\x00\x12I\n\x15get_inventory_request\x18\x34 \x01(\x0b\x32(.io.bisq.protobuffer.GetInventoryRequestH\x00\x12K\n\x16get_inventory_response\x18\x35 \x01(\x0b\x32).io.bisq.protobuffer.GetInventoryResponseH\x00\x12\x63\n#share_buyer_payment_account_message\x18\x36 \x01(\x0b\x32\x34.io.bisq.protobuffer.ShareBuyerPaymentAccountMessageH\x00\x12N\n\x18sellers_bsq_swap_request\x18\x37 \x01(\x0b\x32*.io.bisq.protobuffer.SellersBsqSwapRequestH\x00\x12L\n\x17\x62uyers_bsq_swap_request\x18\x38 \x01(\x0b\x32).io.bisq.protobuffer.BuyersBsqSwapRequestH\x00\x12Q\n\x1a\x62sq_swap_tx_inputs_message\x18\x39 \x01(\x0b\x32+.io.bisq.protobuffer.BsqSwapTxInputsMessageH\x00\x12U\n\x1c\x62sq_swap_finalize_tx_request\x18: \x01(\x0b\x32-.io.bisq.protobuffer.BsqSwapFinalizeTxRequestH\x00\x12W\n\x1d\x62sq_swap_finalized_tx_message\x18; \x01(\x0b\x32..io.bisq.protobuffer.BsqSwapFinalizedTxMessageH\x00\x12\x43\n\x12\x66ile_transfer_part\x18< \x01(\x0b\x32%.io.bisq.protobuffer.FileTransferPartH\x00\x12X\n\x1dget_accounting_blocks_request\x18= \x01(\x0b\x32/.io.bisq.protobuffer.GetAccountingBlocksRequestH\x00\x12Z\n\x1eget_accounting_blocks_response\x18> \x01(\x0b\x32\x30.io.bisq.protobuffer.GetAccountingBlocksResponseH\x00\x12i\n&new_accounting_block_broadcast_message\x18? \x01(\x0b\x32\x37.io.bisq.protobuffer.NewAccountingBlockBroadcastMessageH\x00\x42\t\n\x07message\"L\n\x11\x42undleOfEnvelopes\x12\x37\n\tenvelopes\x18\x01 \x03(\x0b\x32$.io.bisq.protobuffer.NetworkEnvelope\"\x93\x01\n\x19PreliminaryGetDataRequest\x12\r\n\x05nonce\x18\x15 \x01(\x05\x12\x15\n\rexcluded_keys\x18\x02 \x03(\x0c\x12\x1e\n\x16supported_capabilities\x18\x03 \x03(\x05\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x1f\n\x17supports_split_response\x18\x64 \x01(\x08\"\xb4\x02\n\x0fGetDataResponse\x12\x15\n\rrequest_nonce\x18\x01 \x01(\x05\x12$\n\x1cis_get_updated_data_response\x18\x02 \x01(\x08\x12:\n\x08\x64\x61ta_set\x18\x03 \x03(\x0b\x32(.io.bisq.protobuffer.StorageEntryWrapper\x12\x1e\n\x16supported_capabilities\x18\x04 \x03(\x05\x12Y\n!persistable_network_payload_items\x18\x05 \x03(\x0b\x32..io.bisq.protobuffer.PersistableNetworkPayload\x12\x15\n\rwas_truncated\x18\x06 \x01(\x08\x12\x16\n\x0ehas_more_parts\x18\x64 \x01(\x08\"\xae\x01\n\x15GetUpdatedDataRequest\x12=\n\x13sender_node_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\r\n\x05nonce\x18\x02 \x01(\x05\x12\x15\n\rexcluded_keys\x18\x03 \x03(\x0c\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x1f\n\x17supports_split_response\x18\x64 \x01(\x08\"\xb9\x01\n\x10\x46ileTransferPart\x12=\n\x13sender_node_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x02 \x01(\t\x12\x10\n\x08trade_id\x18\x03 \x01(\t\x12\x11\n\ttrader_id\x18\x04 \x01(\x05\x12\x1e\n\x16seq_num_or_file_length\x18\x05 \x01(\x03\x12\x14\n\x0cmessage_data\x18\x06 \x01(\x0c\"\xb2\x01\n\x0fGetPeersRequest\x12=\n\x13sender_node_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\r\n\x05nonce\x18\x02 \x01(\x05\x12\x1e\n\x16supported_capabilities\x18\x03 \x03(\x05\x12\x31\n\x0ereported_peers\x18\x04 \x03(\x0b\x32\x19.io.bisq.protobuffer.Peer\"|\n\x10GetPeersResponse\x12\x15\n\rrequest_nonce\x18\x01 \x01(\x05\x12\x31\n\x0ereported_peers\x18\x02 \x03(\x0b\x32\x19.io.bisq.protobuffer.Peer\x12\x1e\n\x16supported_capabilities\x18\x03 \x03(\x05\"3\n\x04Ping\x12\r\n\x05nonce\x18\x01 \x01(\x05\x12\x1c\n\x14last_round_trip_time\x18\x02 \x01(\x05\"\x1d\n\x04Pong\x12\x15\n\rrequest_nonce\x18\x01 \x01(\x05\"&\n\x13GetInventoryRequest\x12\x0f\n\x07version\x18\x01 \x01(\t\"N\n\x14GetInventoryResponse\x12\x36\n\tinventory\x18\x01 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"\xed\x01\n\x18OfferAvailabilityRequest\x12\x10\n\x08offer_id\x18\x01 \x01(\t\x12\x35\n\x0cpub_key_ring\x18\x02 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x1a\n\x12takers_trade_price\x18\x03 \x01(\x03\x12\x1e\n\x16supported_capabilities\x18\x04 \x03(\x05\x12\x0b\n\x03uid\x18\x05 \x01(\t\x12\x19\n\x11is_taker_api_user\x18\x06 \x01(\x08\x12$\n\x1c\x62urning_man_selection_height\x18\x07 \x01(\x05\"\xc2\x02\n\x19OfferAvailabilityResponse\x12\x10\n\x08offer_id\x18\x01 \x01(\t\x12\x44\n\x13\x61vailability_result\x18\x02 \x01(\x0e\x32\'.io.bisq.protobuffer.AvailabilityResult\x12\x1e\n\x16supported_capabilities\x18\x03 \x03(\x05\x12\x0b\n\x03uid\x18\x04 \x01(\t\x12\x34\n\narbitrator\x18\x05 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x32\n\x08mediator\x18\x06 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x36\n\x0crefund_agent\x18\x07 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\"{\n\x13RefreshOfferMessage\x12\x1f\n\x17hash_of_data_and_seq_nr\x18\x01 \x01(\x0c\x12\x11\n\tsignature\x18\x02 \x01(\x0c\x12\x17\n\x0fhash_of_payload\x18\x03 \x01(\x0c\x12\x17\n\x0fsequence_number\x18\x04 \x01(\x05\"I\n\x0e\x41\x64\x64\x44\x61taMessage\x12\x37\n\x05\x65ntry\x18\x01 \x01(\x0b\x32(.io.bisq.protobuffer.StorageEntryWrapper\"`\n\x11RemoveDataMessage\x12K\n\x17protected_storage_entry\x18\x01 \x01(\x0b\x32*.io.bisq.protobuffer.ProtectedStorageEntry\"n\n\x18RemoveMailboxDataMessage\x12R\n\x17protected_storage_entry\x18\x01 \x01(\x0b\x32\x31.io.bisq.protobuffer.ProtectedMailboxStorageEntry\"f\n#AddPersistableNetworkPayloadMessage\x12?\n\x07payload\x18\x01 \x01(\x0b\x32..io.bisq.protobuffer.PersistableNetworkPayload\"(\n\x16\x43loseConnectionMessage\x12\x0e\n\x06reason\x18\x01 \x01(\t\"\xdb\x01\n\nAckMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12=\n\x13sender_node_address\x18\x02 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x13\n\x0bsource_type\x18\x03 \x01(\t\x12\x1d\n\x15source_msg_class_name\x18\x04 \x01(\t\x12\x12\n\nsource_uid\x18\x05 \x01(\t\x12\x11\n\tsource_id\x18\x06 \x01(\t\x12\x0f\n\x07success\x18\x07 \x01(\x08\x12\x15\n\rerror_message\x18\x08 \x01(\t\"\xc3\x01\n\x1ePrefixedSealedAndSignedMessage\x12\x36\n\x0cnode_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12?\n\x11sealed_and_signed\x18\x02 \x01(\x0b\x32$.io.bisq.protobuffer.SealedAndSigned\x12\x1b\n\x13\x61\x64\x64ress_prefix_hash\x18\x03 \x01(\x0c\x12\x0b\n\x03uid\x18\x04 \x01(\t\"\xf0\t\n\x19InputsForDepositTxRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12=\n\x13sender_node_address\x18\x02 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x14\n\x0ctrade_amount\x18\x03 \x01(\x03\x12\x13\n\x0btrade_price\x18\x04 \x01(\x03\x12\x0e\n\x06tx_fee\x18\x05 \x01(\x03\x12\x11\n\ttaker_fee\x18\x06 \x01(\x03\x12%\n\x1dis_currency_for_taker_fee_btc\x18\x07 \x01(\x08\x12H\n\x16raw_transaction_inputs\x18\x08 \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x1b\n\x13\x63hange_output_value\x18\t \x01(\x03\x12\x1d\n\x15\x63hange_output_address\x18\n \x01(\t\x12\x1f\n\x17taker_multi_sig_pub_key\x18\x0b \x01(\x0c\x12#\n\x1btaker_payout_address_string\x18\x0c \x01(\t\x12;\n\x12taker_pub_key_ring\x18\r \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12Q\n\x1dtaker_payment_account_payload\x18\x0e \x01(\x0b\x32*.io.bisq.protobuffer.PaymentAccountPayload\x12\x18\n\x10taker_account_id\x18\x0f \x01(\t\x12\x17\n\x0ftaker_fee_tx_id\x18\x10 \x01(\t\x12L\n\"accepted_arbitrator_node_addresses\x18\x11 \x03(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12J\n accepted_mediator_node_addresses\x18\x12 \x03(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x41\n\x17\x61rbitrator_node_address\x18\x13 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12?\n\x15mediator_node_address\x18\x14 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x15 \x01(\t\x12\x31\n)account_age_witness_signature_of_offer_id\x18\x16 \x01(\x0c\x12\x14\n\x0c\x63urrent_date\x18\x17 \x01(\x03\x12N\n$accepted_refund_agent_node_addresses\x18\x18 \x03(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x43\n\x19refund_agent_node_address\x18\x19 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12.\n&hash_of_takers_payment_account_payload\x18\x1a \x01(\x0c\x12\x1f\n\x17takers_payout_method_id\x18\x1b \x01(\t\x12$\n\x1c\x62urning_man_selection_height\x18\x1c \x01(\x05\"\x84\x05\n\x1aInputsForDepositTxResponse\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12Q\n\x1dmaker_payment_account_payload\x18\x02 \x01(\x0b\x32*.io.bisq.protobuffer.PaymentAccountPayload\x12\x18\n\x10maker_account_id\x18\x03 \x01(\t\x12\x1e\n\x16maker_contract_as_json\x18\x04 \x01(\t\x12 \n\x18maker_contract_signature\x18\x05 \x01(\t\x12#\n\x1bmaker_payout_address_string\x18\x06 \x01(\t\x12\x1b\n\x13prepared_deposit_tx\x18\x07 \x01(\x0c\x12>\n\x0cmaker_inputs\x18\x08 \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x1f\n\x17maker_multi_sig_pub_key\x18\t \x01(\x0c\x12=\n\x13sender_node_address\x18\n \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x0b \x01(\t\x12<\n4account_age_witness_signature_of_prepared_deposit_tx\x18\x0c \x01(\x0c\x12\x14\n\x0c\x63urrent_date\x18\r \x01(\x03\x12\x11\n\tlock_time\x18\x0e \x01(\x03\x12.\n&hash_of_makers_payment_account_payload\x18\x0f \x01(\x0c\x12\x1f\n\x17makers_payout_method_id\x18\x10 \x01(\t\"\xc6\x01\n\x1f\x44\x65layedPayoutTxSignatureRequest\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x19\n\x11\x64\x65layed_payout_tx\x18\x04 \x01(\x0c\x12*\n\"delayed_payout_tx_seller_signature\x18\x05 \x01(\x0c\"\xbf\x01\n DelayedPayoutTxSignatureResponse\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12)\n!delayed_payout_tx_buyer_signature\x18\x04 \x01(\x0c\x12\x12\n\ndeposit_tx\x18\x05 \x01(\x0c\"\x85\x02\n\"DepositTxAndDelayedPayoutTxMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x12\n\ndeposit_tx\x18\x04 \x01(\x0c\x12\x19\n\x11\x64\x65layed_payout_tx\x18\x05 \x01(\x0c\x12R\n\x1eseller_payment_account_payload\x18\x06 \x01(\x0b\x32*.io.bisq.protobuffer.PaymentAccountPayload\"\xd2\x01\n\x1fShareBuyerPaymentAccountMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12Q\n\x1d\x62uyer_payment_account_payload\x18\x04 \x01(\x0b\x32*.io.bisq.protobuffer.PaymentAccountPayload\"\x96\x01\n\x10\x44\x65positTxMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12$\n\x1c\x64\x65posit_tx_without_witnesses\x18\x04 \x01(\x0c\"\x83\x01\n#PeerPublishedDelayedPayoutTxMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\"\x81\x02\n%CounterCurrencyTransferStartedMessage\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\x1c\n\x14\x62uyer_payout_address\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x17\n\x0f\x62uyer_signature\x18\x04 \x01(\x0c\x12\x1e\n\x16\x63ounter_currency_tx_id\x18\x05 \x01(\t\x12\x0b\n\x03uid\x18\x06 \x01(\t\x12#\n\x1b\x63ounter_currency_extra_data\x18\x07 \x01(\t\"\xb0\x01\n\x17\x46inalizePayoutTxRequest\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\x18\n\x10seller_signature\x18\x02 \x01(\x0c\x12\x1d\n\x15seller_payout_address\x18\x03 \x01(\t\x12=\n\x13sender_node_address\x18\x04 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x05 \x01(\t\"\xc7\x01\n\x18PayoutTxPublishedMessage\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\x11\n\tpayout_tx\x18\x02 \x01(\x0c\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x04 \x01(\t\x12:\n\x0esigned_witness\x18\x05 \x01(\x0b\x32\".io.bisq.protobuffer.SignedWitness\"\x93\x01\n MediatedPayoutTxPublishedMessage\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\x11\n\tpayout_tx\x18\x02 \x01(\x0c\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x04 \x01(\t\"\x96\x01\n MediatedPayoutTxSignatureMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x03 \x01(\t\x12\x14\n\x0ctx_signature\x18\x02 \x01(\x0c\x12=\n\x13sender_node_address\x18\x04 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\"\x84\x01\n\x18RefreshTradeStateRequest\x12\x0f\n\x03uid\x18\x01 \x01(\tB\x02\x18\x01\x12\x14\n\x08trade_id\x18\x02 \x01(\tB\x02\x18\x01\x12\x41\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddressB\x02\x18\x01\"\xc6\x01\n\x1aTraderSignedWitnessMessage\x12\x0f\n\x03uid\x18\x01 \x01(\tB\x02\x18\x01\x12\x14\n\x08trade_id\x18\x02 \x01(\tB\x02\x18\x01\x12\x41\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddressB\x02\x18\x01\x12>\n\x0esigned_witness\x18\x04 \x01(\x0b\x32\".io.bisq.protobuffer.SignedWitnessB\x02\x18\x01\"\x9c\x02\n\x15SellersBsqSwapRequest\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12;\n\x12taker_pub_key_ring\x18\x04 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x14\n\x0ctrade_amount\x18\x05 \x01(\x03\x12\x18\n\x10tx_fee_per_vbyte\x18\x06 \x01(\x03\x12\x11\n\tmaker_fee\x18\x07 \x01(\x03\x12\x11\n\ttaker_fee\x18\x08 \x01(\x03\x12\x12\n\ntrade_date\x18\t \x01(\x03\"\xb3\x03\n\x14\x42uyersBsqSwapRequest\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12;\n\x12taker_pub_key_ring\x18\x04 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x14\n\x0ctrade_amount\x18\x05 \x01(\x03\x12\x18\n\x10tx_fee_per_vbyte\x18\x06 \x01(\x03\x12\x11\n\tmaker_fee\x18\x07 \x01(\x03\x12\x11\n\ttaker_fee\x18\x08 \x01(\x03\x12\x12\n\ntrade_date\x18\t \x01(\x03\x12<\n\nbsq_inputs\x18\n \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x12\n\nbsq_change\x18\x0b \x01(\x03\x12!\n\x19\x62uyers_btc_payout_address\x18\x0c \x01(\t\x12!\n\x19\x62uyers_bsq_change_address\x18\r \x01(\t\"\x8e\x02\n\x16\x42sqSwapTxInputsMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12<\n\nbsq_inputs\x18\x04 \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x12\n\nbsq_change\x18\x05 \x01(\x03\x12!\n\x19\x62uyers_btc_payout_address\x18\x06 \x01(\t\x12!\n\x19\x62uyers_bsq_change_address\x18\x07 \x01(\t\"\x8e\x02\n\x18\x42sqSwapFinalizeTxRequest\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\n\n\x02tx\x18\x04 \x01(\x0c\x12<\n\nbtc_inputs\x18\x05 \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x12\n\nbtc_change\x18\x06 \x01(\x03\x12\x1a\n\x12\x62sq_payout_address\x18\x07 \x01(\t\x12\x1a\n\x12\x62tc_change_address\x18\x08 \x01(\t\"\x85\x01\n\x19\x42sqSwapFinalizedTxMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\n\n\x02tx\x18\x04 \x01(\x0c\"\xc2\x01\n\x15OpenNewDisputeMessage\x12-\n\x07\x64ispute\x18\x01 \x01(\x0b\x32\x1c.io.bisq.protobuffer.Dispute\x12=\n\x13sender_node_address\x18\x02 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x03 \x01(\t\x12.\n\x04type\x18\x04 \x01(\x0e\x32 .io.bisq.protobuffer.SupportType\"\xc5\x01\n\x18PeerOpenedDisputeMessage\x12-\n\x07\x64ispute\x18\x01 \x01(\x0b\x32\x1c.io.bisq.protobuffer.Dispute\x12=\n\x13sender_node_address\x18\x02 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x03 \x01(\t\x12.\n\x04type\x18\x04 \x01(\x0e\x32 .io.bisq.protobuffer.SupportType\"\xc0\x03\n\x0b\x43hatMessage\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\x03\x12\x10\n\x08trade_id\x18\x02 \x01(\t\x12\x11\n\ttrader_id\x18\x03 \x01(\x05\x12\x18\n\x10sender_is_trader\x18\x04 \x01(\x08\x12\x0f\n\x07message\x18\x05 \x01(\t\x12\x34\n\x0b\x61ttachments\x18\x06 \x03(\x0b\x32\x1f.io.bisq.protobuffer.Attachment\x12\x0f\n\x07\x61rrived\x18\x07 \x01(\x08\x12\x19\n\x11stored_in_mailbox\x18\x08 \x01(\x08\x12\x19\n\x11is_system_message\x18\t \x01(\x08\x12=\n\x13sender_node_address\x18\n \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x0b \x01(\t\x12\x1a\n\x12send_message_error\x18\x0c \x01(\t\x12\x14\n\x0c\x61\x63knowledged\x18\r \x01(\x08\x12\x11\n\tack_error\x18\x0e \x01(\t\x12.\n\x04type\x18\x0f \x01(\x0e\x32 .io.bisq.protobuffer.SupportType\x12\x15\n\rwas_displayed\x18\x10 \x01(\x08\"\xce\x01\n\x14\x44isputeResultMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12:\n\x0e\x64ispute_result\x18\x02 \x01(\x0b\x32\".io.bisq.protobuffer.DisputeResult\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12.\n\x04type\x18\x04 \x01(\x0e\x32 .io.bisq.protobuffer.SupportType\"\xc8\x01\n#PeerPublishedDisputePayoutTxMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x13\n\x0btransaction\x18\x02 \x01(\x0c\x12\x10\n\x08trade_id\x18\x03 \x01(\t\x12=\n\x13sender_node_address\x18\x04 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12.\n\x04type\x18\x05 \x01(\x0e\x32 .io.bisq.protobuffer.SupportType\"\xbf\x01\n\x1aPrivateNotificationMessage\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12=\n\x13sender_node_address\x18\x02 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12U\n\x1cprivate_notification_payload\x18\x03 \x01(\x0b\x32/.io.bisq.protobuffer.PrivateNotificationPayload\"\x9b\x01\n\x10GetBlocksRequest\x12\x19\n\x11\x66rom_block_height\x18\x01 \x01(\x05\x12\r\n\x05nonce\x18\x02 \x01(\x05\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x1e\n\x16supported_capabilities\x18\x04 \x03(\x05\"^\n\x11GetBlocksResponse\x12\x32\n\nraw_blocks\x18\x01 \x03(\x0b\x32\x1e.io.bisq.protobuffer.BaseBlock\x12\x15\n\rrequest_nonce\x18\x02 \x01(\x05\"M\n\x18NewBlockBroadcastMessage\x12\x31\n\traw_block\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.BaseBlock\" \n\x1eRepublishGovernanceDataRequest\"O\n\x16NewDaoStateHashMessage\x12\x35\n\nstate_hash\x18\x01 \x01(\x0b\x32!.io.bisq.protobuffer.DaoStateHash\"Y\n\x1bNewProposalStateHashMessage\x12:\n\nstate_hash\x18\x01 \x01(\x0b\x32&.io.bisq.protobuffer.ProposalStateHash\"[\n\x1cNewBlindVoteStateHashMessage\x12;\n\nstate_hash\x18\x01 \x01(\x0b\x32\'.io.bisq.protobuffer.BlindVoteStateHash\"9\n\x18GetDaoStateHashesRequest\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\r\n\x05nonce\x18\x02 \x01(\x05\">\n\x1dGetProposalStateHashesRequest\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\r\n\x05nonce\x18\x02 \x01(\x05\"?\n\x1eGetBlindVoteStateHashesRequest\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\r\n\x05nonce\x18\x02 \x01(\x05\"k\n\x19GetDaoStateHashesResponse\x12\x37\n\x0cstate_hashes\x18\x01 \x03(\x0b\x32!.io.bisq.protobuffer.DaoStateHash\x12\x15\n\rrequest_nonce\x18\x02 \x01(\x05\"u\n\x1eGetProposalStateHashesResponse\x12<\n\x0cstate_hashes\x18\x01 \x03(\x0b\x32&.io.bisq.protobuffer.ProposalStateHash\x12\x15\n\rrequest_nonce\x18\x02 \x01(\x05\"w\n\x1fGetBlindVoteStateHashesResponse\x12=\n\x0cstate_hashes\x18\x01 \x03(\x0b\x32\'.io.bisq.protobuffer.BlindVoteStateHash\x12\x15\n\rrequest_nonce\x18\x02 \x01(\x05\".\n\x0bNodeAddress\x12\x11\n\thost_name\x18\x01 \x01(\t\x12\x0c\n\x04port\x18\x02 \x01(\x05\"l\n\x04Peer\x12\x36\n\x0cnode_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\x03\x12\x1e\n\x16supported_capabilities\x18\x03 \x03(\x05\"U\n\nPubKeyRing\x12\x1f\n\x17signature_pub_key_bytes\x18\x01 \x01(\x0c\x12 \n\x18\x65ncryption_pub_key_bytes\x18\x02 \x01(\x0cJ\x04\x08\x03\x10\x04\"\x85\x01\n\x0fSealedAndSigned\x12\x1c\n\x14\x65ncrypted_secret_key\x18\x01 \x01(\x0c\x12#\n\x1b\x65ncrypted_payload_with_hmac\x18\x02 \x01(\x0c\x12\x11\n\tsignature\x18\x03 \x01(\x0c\x12\x1c\n\x14sig_public_key_bytes\x18\x04 \x01(\x0c\"\xbd\x04\n\x0eStoragePayload\x12+\n\x05\x61lert\x18\x01 \x01(\x0b\x32\x1a.io.bisq.protobuffer.AlertH\x00\x12\x35\n\narbitrator\x18\x02 \x01(\x0b\x32\x1f.io.bisq.protobuffer.ArbitratorH\x00\x12\x31\n\x08mediator\x18\x03 \x01(\x0b\x32\x1d.io.bisq.protobuffer.MediatorH\x00\x12-\n\x06\x66ilter\x18\x04 \x01(\x0b\x32\x1b.io.bisq.protobuffer.FilterH\x00\x12M\n\x17mailbox_storage_payload\x18\x06 \x01(\x0b\x32*.io.bisq.protobuffer.MailboxStoragePayloadH\x00\x12:\n\roffer_payload\x18\x07 \x01(\x0b\x32!.io.bisq.protobuffer.OfferPayloadH\x00\x12I\n\x15temp_proposal_payload\x18\x08 \x01(\x0b\x32(.io.bisq.protobuffer.TempProposalPayloadH\x00\x12\x38\n\x0crefund_agent\x18\t \x01(\x0b\x32 .io.bisq.protobuffer.RefundAgentH\x00\x12J\n\x16\x62sq_swap_offer_payload\x18\n \x01(\x0b\x32(.io.bisq.protobuffer.BsqSwapOfferPayloadH\x00\x42\t\n\x07message\"\xbe\x03\n\x19PersistableNetworkPayload\x12\x45\n\x13\x61\x63\x63ount_age_witness\x18\x01 \x01(\x0b\x32&.io.bisq.protobuffer.AccountAgeWitnessH\x00\x12\x46\n\x11trade_statistics2\x18\x02 \x01(\x0b\x32%.io.bisq.protobuffer.TradeStatistics2B\x02\x18\x01H\x00\x12@\n\x10proposal_payload\x18\x03 \x01(\x0b\x32$.io.bisq.protobuffer.ProposalPayloadH\x00\x12\x43\n\x12\x62lind_vote_payload\x18\x04 \x01(\x0b\x32%.io.bisq.protobuffer.BlindVotePayloadH\x00\x12<\n\x0esigned_witness\x18\x05 \x01(\x0b\x32\".io.bisq.protobuffer.SignedWitnessH\x00\x12\x42\n\x11trade_statistics3\x18\x06 \x01(\x0b\x32%.io.bisq.protobuffer.TradeStatistics3H\x00\x42\t\n\x07message\"\xbb\x01\n\x15ProtectedStorageEntry\x12<\n\x0fstorage_payload\x18\x01 \x01(\x0b\x32#.io.bisq.protobuffer.StoragePayload\x12\x1b\n\x13owner_pub_key_bytes\x18\x02 \x01(\x0c\x12\x17\n\x0fsequence_number\x18\x03 \x01(\x05\x12\x11\n\tsignature\x18\x04 \x01(\x0c\x12\x1b\n\x13\x63reation_time_stamp\x18\x05 \x01(\x03\"\xcd\x01\n\x13StorageEntryWrapper\x12M\n\x17protected_storage_entry\x18\x01 \x01(\x0b\x32*.io.bisq.protobuffer.ProtectedStorageEntryH\x00\x12\\\n\x1fprotected_mailbox_storage_entry\x18\x02 \x01(\x0b\x32\x31.io.bisq.protobuffer.ProtectedMailboxStorageEntryH\x00\x42\t\n\x07message\"z\n\x1cProtectedMailboxStorageEntry\x12\x39\n\x05\x65ntry\x18\x01 \x01(\x0b\x32*.io.bisq.protobuffer.ProtectedStorageEntry\x12\x1f\n\x17receivers_pub_key_bytes\x18\x02 \x01(\x0c\"a\n\x10\x44\x61taAndSeqNrPair\x12\x34\n\x07payload\x18\x01 \x01(\x0b\x32#.io.bisq.protobuffer.StoragePayload\x12\x17\n\x0fsequence_number\x18\x02 \x01(\x05\"L\n\x12MailboxMessageList\x12\x36\n\x0cmailbox_item\x18\x01 \x03(\x0b\x32 .io.bisq.protobuffer.MailboxItem\"\x9c\x01\n\x12RemovedPayloadsMap\x12Q\n\x0e\x64\x61te_by_hashes\x18\x01 \x03(\x0b\x32\x39.io.bisq.protobuffer.RemovedPayloadsMap.DateByHashesEntry\x1a\x33\n\x11\x44\x61teByHashesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\x80\x01\n\x11IgnoredMailboxMap\x12>\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x30.io.bisq.protobuffer.IgnoredMailboxMap.DataEntry\x1a+\n\tDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\xc2\x01\n\x0bMailboxItem\x12Z\n\x1fprotected_mailbox_storage_entry\x18\x01 \x01(\x0b\x32\x31.io.bisq.protobuffer.ProtectedMailboxStorageEntry\x12W\n\x1e\x64\x65\x63rypted_message_with_pub_key\x18\x02 \x01(\x0b\x32/.io.bisq.protobuffer.DecryptedMessageWithPubKey\"}\n\x1a\x44\x65\x63ryptedMessageWithPubKey\x12>\n\x10network_envelope\x18\x01 \x01(\x0b\x32$.io.bisq.protobuffer.NetworkEnvelope\x12\x1f\n\x17signature_pub_key_bytes\x18\x02 \x01(\x0c\"h\n\x1aPrivateNotificationPayload\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x1b\n\x13signature_as_base64\x18\x02 \x01(\t\x12\x1c\n\x14sig_public_key_bytes\x18\x03 \x01(\x0c\"Y\n\x14PaymentAccountFilter\x12\x19\n\x11payment_method_id\x18\x01 \x01(\t\x12\x17\n\x0fget_method_name\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"\xd1\x01\n\x05\x41lert\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x16\n\x0eis_update_info\x18\x03 \x01(\x08\x12\x1b\n\x13signature_as_base64\x18\x04 \x01(\t\x12\x1b\n\x13owner_pub_key_bytes\x18\x05 \x01(\x0c\x12\x37\n\nextra_data\x18\x06 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\x12\x1b\n\x13is_pre_release_info\x18\x07 \x01(\x08\"\xf4\x02\n\nArbitrator\x12\x36\n\x0cnode_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x16\n\x0elanguage_codes\x18\x02 \x03(\t\x12\x19\n\x11registration_date\x18\x03 \x01(\x03\x12\x1e\n\x16registration_signature\x18\x04 \x01(\t\x12\x1c\n\x14registration_pub_key\x18\x05 \x01(\x0c\x12\x35\n\x0cpub_key_ring\x18\x06 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x13\n\x0b\x62tc_pub_key\x18\x07 \x01(\x0c\x12\x13\n\x0b\x62tc_address\x18\x08 \x01(\t\x12\x15\n\remail_address\x18\t \x01(\t\x12\x0c\n\x04info\x18\n \x01(\t\x12\x37\n\nextra_data\x18\x0b \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"\xc8\x02\n\x08Mediator\x12\x36\n\x0cnode_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x16\n\x0elanguage_codes\x18\x02 \x03(\t\x12\x19\n\x11registration_date\x18\x03 \x01(\x03\x12\x1e\n\x16registration_signature\x18\x04 \x01(\t\x12\x1c\n\x14registration_pub_key\x18\x05 \x01(\x0c\x12\x35\n\x0cpub_key_ring\x18\x06 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x15\n\remail_address\x18\x07 \x01(\t\x12\x0c\n\x04info\x18\x08 \x01(\t\x12\x37\n\nextra_data\x18\t \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"\xcb\x02\n\x0bRefundAgent\x12\x36\n\x0cnode_address\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x16\n\x0elanguage_codes\x18\x02 \x03(\t\x12\x19\n\x11registration_date\x18\x03 \x01(\x03\x12\x1e\n\x16registration_signature\x18\x04 \x01(\t\x12\x1c\n\x14registration_pub_key\x18\x05 \x01(\x0c\x12\x35\n\x0cpub_key_ring\x18\x06 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x15\n\remail_address\x18\x07 \x01(\t\x12\x0c\n\x04info\x18\x08 \x01(\t\x12\x37\n\nextra_data\x18\t \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"\xd3\t\n\x06\x46ilter\x12*\n\"node_addresses_banned_from_trading\x18\x01 \x03(\t\x12\x18\n\x10\x62\x61nned_offer_ids\x18\x02 \x03(\t\x12J\n\x17\x62\x61nned_payment_accounts\x18\x03 \x03(\x0b\x32).io.bisq.protobuffer.PaymentAccountFilter\x12\x1b\n\x13signature_as_base64\x18\x04 \x01(\t\x12\x1b\n\x13owner_pub_key_bytes\x18\x05 \x01(\x0c\x12\x37\n\nextra_data\x18\x06 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\x12\x19\n\x11\x62\x61nned_currencies\x18\x07 \x03(\t\x12\x1e\n\x16\x62\x61nned_payment_methods\x18\x08 \x03(\t\x12\x13\n\x0b\x61rbitrators\x18\t \x03(\t\x12\x12\n\nseed_nodes\x18\n \x03(\t\x12\x19\n\x11price_relay_nodes\x18\x0b \x03(\t\x12\"\n\x1aprevent_public_btc_network\x18\x0c \x01(\x08\x12\x11\n\tbtc_nodes\x18\r \x03(\t\x12\x13\n\x0b\x64isable_dao\x18\x0e \x01(\x08\x12!\n\x19\x64isable_dao_below_version\x18\x0f \x01(\t\x12#\n\x1b\x64isable_trade_below_version\x18\x10 \x01(\t\x12\x11\n\tmediators\x18\x11 \x03(\t\x12\x15\n\rrefund_agents\x18\x12 \x03(\t\x12\x1e\n\x16\x62\x61nned_signer_pub_keys\x18\x13 \x03(\t\x12\"\n\x1a\x62tc_fee_receiver_addresses\x18\x14 \x03(\t\x12\x15\n\rcreation_date\x18\x15 \x01(\x03\x12\x1d\n\x15signer_pub_key_as_hex\x18\x16 \x01(\t\x12&\n\x1e\x62\x61nned_privileged_dev_pub_keys\x18\x17 \x03(\t\x12\x19\n\x11\x64isable_auto_conf\x18\x18 \x01(\x08\x12\"\n\x1a\x62\x61nned_auto_conf_explorers\x18\x19 \x03(\t\x12*\n\"node_addresses_banned_from_network\x18\x1a \x03(\t\x12\x13\n\x0b\x64isable_api\x18\x1b \x01(\x08\x12\"\n\x1a\x64isable_mempool_validation\x18\x1c \x01(\x08\x12\x1b\n\x13\x64isable_pow_message\x18\x1d \x01(\x08\x12\x16\n\x0epow_difficulty\x18\x1e \x01(\x01\x12\x15\n\rmaker_fee_btc\x18\x1f \x01(\x03\x12\x15\n\rtaker_fee_btc\x18  \x01(\x03\x12\x15\n\rmaker_fee_bsq\x18! \x01(\x03\x12\x15\n\rtaker_fee_bsq\x18\" \x01(\x03\x12\x1c\n\x14\x65nabled_pow_versions\x18# \x03(\x05\x12R\n\x1f\x64\x65layed_payout_payment_accounts\x18$ \x03(\x0b\x32).io.bisq.protobuffer.PaymentAccountFilter\x12\x17\n\x0f\x61\x64\x64\x65\x64_btc_nodes\x18% \x03(\t\x12\x18\n\x10\x61\x64\x64\x65\x64_seed_nodes\x18& \x03(\t\x12\x0b\n\x03uid\x18\' \x01(\t\"\x92\x04\n\x10TradeStatistics2\x12\x19\n\rbase_currency\x18\x01 \x01(\tB\x02\x18\x01\x12\x1c\n\x10\x63ounter_currency\x18\x02 \x01(\tB\x02\x18\x01\x12:\n\tdirection\x18\x03 \x01(\x0e\x32#.io.bisq.protobuffer.OfferDirectionB\x02\x18\x01\x12\x17\n\x0btrade_price\x18\x04 \x01(\x03\x42\x02\x18\x01\x12\x18\n\x0ctrade_amount\x18\x05 \x01(\x03\x42\x02\x18\x01\x12\x16\n\ntrade_date\x18\x06 \x01(\x03\x42\x02\x18\x01\x12\x1d\n\x11payment_method_id\x18\x07 \x01(\tB\x02\x18\x01\x12\x16\n\noffer_date\x18\x08 \x01(\x03\x42\x02\x18\x01\x12(\n\x1coffer_use_market_based_price\x18\t \x01(\x08\x42\x02\x18\x01\x12%\n\x19offer_market_price_margin\x18\n \x01(\x01\x42\x02\x18\x01\x12\x18\n\x0coffer_amount\x18\x0b \x01(\x03\x42\x02\x18\x01\x12\x1c\n\x10offer_min_amount\x18\x0c \x01(\x03\x42\x02\x18\x01\x12\x14\n\x08offer_id\x18\r \x01(\tB\x02\x18\x01\x12\x19\n\rdeposit_tx_id\x18\x0e \x01(\tB\x02\x18\x01\x12\x10\n\x04hash\x18\x0f \x01(\x0c\x42\x02\x18\x01\x12;\n\nextra_data\x18\x10 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntryB\x02\x18\x01\"\xd8\x01\n\x10TradeStatistics3\x12\x10\n\x08\x63urrency\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x03\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x03\x12\x16\n\x0epayment_method\x18\x04 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x05 \x01(\x03\x12\x10\n\x08mediator\x18\x06 \x01(\t\x12\x14\n\x0crefund_agent\x18\x07 \x01(\t\x12\x0c\n\x04hash\x18\x08 \x01(\x0c\x12\x37\n\nextra_data\x18\t \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"\xfe\x01\n\x15MailboxStoragePayload\x12_\n\"prefixed_sealed_and_signed_message\x18\x01 \x01(\x0b\x32\x33.io.bisq.protobuffer.PrefixedSealedAndSignedMessage\x12.\n&sender_pub_key_for_add_operation_bytes\x18\x02 \x01(\x0c\x12\x1b\n\x13owner_pub_key_bytes\x18\x03 \x01(\x0c\x12\x37\n\nextra_data\x18\x04 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"\xc6\t\n\x0cOfferPayload\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\x03\x12<\n\x12owner_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x35\n\x0cpub_key_ring\x18\x04 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x36\n\tdirection\x18\x05 \x01(\x0e\x32#.io.bisq.protobuffer.OfferDirection\x12\r\n\x05price\x18\x06 \x01(\x03\x12\x1b\n\x13market_price_margin\x18\x07 \x01(\x01\x12\x1e\n\x16use_market_based_price\x18\x08 \x01(\x08\x12\x0e\n\x06\x61mount\x18\t \x01(\x03\x12\x12\n\nmin_amount\x18\n \x01(\x03\x12\x1a\n\x12\x62\x61se_currency_code\x18\x0b \x01(\t\x12\x1d\n\x15\x63ounter_currency_code\x18\x0c \x01(\t\x12G\n\x19\x61rbitrator_node_addresses\x18\r \x03(\x0b\x32 .io.bisq.protobuffer.NodeAddressB\x02\x18\x01\x12\x45\n\x17mediator_node_addresses\x18\x0e \x03(\x0b\x32 .io.bisq.protobuffer.NodeAddressB\x02\x18\x01\x12\x19\n\x11payment_method_id\x18\x0f \x01(\t\x12 \n\x18maker_payment_account_id\x18\x10 \x01(\t\x12\x1f\n\x17offer_fee_payment_tx_id\x18\x11 \x01(\t\x12\x14\n\x0c\x63ountry_code\x18\x12 \x01(\t\x12\x1e\n\x16\x61\x63\x63\x65pted_country_codes\x18\x13 \x03(\t\x12\x0f\n\x07\x62\x61nk_id\x18\x14 \x01(\t\x12\x19\n\x11\x61\x63\x63\x65pted_bank_ids\x18\x15 \x03(\t\x12\x12\n\nversion_nr\x18\x16 \x01(\t\x12&\n\x1e\x62lock_height_at_offer_creation\x18\x17 \x01(\x03\x12\x0e\n\x06tx_fee\x18\x18 \x01(\x03\x12\x11\n\tmaker_fee\x18\x19 \x01(\x03\x12%\n\x1dis_currency_for_maker_fee_btc\x18\x1a \x01(\x08\x12\x1e\n\x16\x62uyer_security_deposit\x18\x1b \x01(\x03\x12\x1f\n\x17seller_security_deposit\x18\x1c \x01(\x03\x12\x17\n\x0fmax_trade_limit\x18\x1d \x01(\x03\x12\x18\n\x10max_trade_period\x18\x1e \x01(\x03\x12\x16\n\x0euse_auto_close\x18\x1f \x01(\x08\x12$\n\x1cuse_re_open_after_auto_close\x18  \x01(\x08\x12\x19\n\x11lower_close_price\x18! \x01(\x03\x12\x19\n\x11upper_close_price\x18\" \x01(\x03\x12\x18\n\x10is_private_offer\x18# \x01(\x08\x12\x19\n\x11hash_of_challenge\x18$ \x01(\t\x12\x37\n\nextra_data\x18% \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\x12\x18\n\x10protocol_version\x18& \x01(\x05\"\xaf\x03\n\x13\x42sqSwapOfferPayload\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\x03\x12<\n\x12owner_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x35\n\x0cpub_key_ring\x18\x04 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x36\n\tdirection\x18\x05 \x01(\x0e\x32#.io.bisq.protobuffer.OfferDirection\x12\r\n\x05price\x18\x06 \x01(\x03\x12\x0e\n\x06\x61mount\x18\x07 \x01(\x03\x12\x12\n\nmin_amount\x18\x08 \x01(\x03\x12\x37\n\rproof_of_work\x18\t \x01(\x0b\x32 .io.bisq.protobuffer.ProofOfWork\x12\x37\n\nextra_data\x18\n \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\x12\x12\n\nversion_nr\x18\x0b \x01(\t\x12\x18\n\x10protocol_version\x18\x0c \x01(\x05\"\x8b\x01\n\x0bProofOfWork\x12\x0f\n\x07payload\x18\x01 \x01(\x0c\x12\x0f\n\x07\x63ounter\x18\x02 \x01(\x03\x12\x11\n\tchallenge\x18\x03 \x01(\x0c\x12\x12\n\ndifficulty\x18\x04 \x01(\x01\x12\x10\n\x08\x64uration\x18\x05 \x01(\x03\x12\x10\n\x08solution\x18\x06 \x01(\x0c\x12\x0f\n\x07version\x18\x07 \x01(\x05\"/\n\x11\x41\x63\x63ountAgeWitness\x12\x0c\n\x04hash\x18\x01 \x01(\x0c\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\x03\"\xb2\x02\n\rSignedWitness\x12R\n\x13verification_method\x18\x01 \x01(\x0e\x32\x35.io.bisq.protobuffer.SignedWitness.VerificationMethod\x12 \n\x18\x61\x63\x63ount_age_witness_hash\x18\x02 \x01(\x0c\x12\x11\n\tsignature\x18\x03 \x01(\x0c\x12\x16\n\x0esigner_pub_key\x18\x04 \x01(\x0c\x12\x1d\n\x15witness_owner_pub_key\x18\x05 \x01(\x0c\x12\x0c\n\x04\x64\x61te\x18\x06 \x01(\x03\x12\x14\n\x0ctrade_amount\x18\x07 \x01(\x03\"=\n\x12VerificationMethod\x12\x0c\n\x08PB_ERROR\x10\x00\x12\x0e\n\nARBITRATOR\x10\x01\x12\t\n\x05TRADE\x10\x02\"\xb8\t\n\x07\x44ispute\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12\x11\n\ttrader_id\x18\x03 \x01(\x05\x12\x1f\n\x17\x64ispute_opener_is_buyer\x18\x04 \x01(\x08\x12\x1f\n\x17\x64ispute_opener_is_maker\x18\x05 \x01(\x08\x12\x14\n\x0copening_date\x18\x06 \x01(\x03\x12<\n\x13trader_pub_key_ring\x18\x07 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x12\n\ntrade_date\x18\x08 \x01(\x03\x12/\n\x08\x63ontract\x18\t \x01(\x0b\x32\x1d.io.bisq.protobuffer.Contract\x12\x15\n\rcontract_hash\x18\n \x01(\x0c\x12\x1d\n\x15\x64\x65posit_tx_serialized\x18\x0b \x01(\x0c\x12\x1c\n\x14payout_tx_serialized\x18\x0c \x01(\x0c\x12\x15\n\rdeposit_tx_id\x18\r \x01(\t\x12\x14\n\x0cpayout_tx_id\x18\x0e \x01(\t\x12\x18\n\x10\x63ontract_as_json\x18\x0f \x01(\t\x12 \n\x18maker_contract_signature\x18\x10 \x01(\t\x12 \n\x18taker_contract_signature\x18\x11 \x01(\t\x12;\n\x12\x61gent_pub_key_ring\x18\x12 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x19\n\x11is_support_ticket\x18\x13 \x01(\x08\x12\x36\n\x0c\x63hat_message\x18\x14 \x03(\x0b\x32 .io.bisq.protobuffer.ChatMessage\x12\x11\n\tis_closed\x18\x15 \x01(\x08\x12:\n\x0e\x64ispute_result\x18\x16 \x01(\x0b\x32\".io.bisq.protobuffer.DisputeResult\x12\x1c\n\x14\x64ispute_payout_tx_id\x18\x17 \x01(\t\x12\x36\n\x0csupport_type\x18\x18 \x01(\x0e\x32 .io.bisq.protobuffer.SupportType\x12 \n\x18mediators_dispute_result\x18\x19 \x01(\t\x12\x1c\n\x14\x64\x65layed_payout_tx_id\x18\x1a \x01(\t\x12-\n%donation_address_of_delayed_payout_tx\x18\x1b \x01(\t\x12\x31\n\x05state\x18\x1c \x01(\x0e\x32\".io.bisq.protobuffer.Dispute.State\x12\x18\n\x10trade_period_end\x18\x1d \x01(\x03\x12\x37\n\nextra_data\x18\x1e \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\x12$\n\x1c\x62urning_man_selection_height\x18\x1f \x01(\x05\x12\x14\n\x0ctrade_tx_fee\x18  \x01(\x03\"\\\n\x05State\x12\x11\n\rNEEDS_UPGRADE\x10\x00\x12\x07\n\x03NEW\x10\x01\x12\x08\n\x04OPEN\x10\x02\x12\x0c\n\x08REOPENED\x10\x03\x12\n\n\x06\x43LOSED\x10\x04\x12\x13\n\x0fRESULT_PROPOSED\x10\x05\"D\n\nAttachment\x12\x11\n\tfile_name\x18\x01 \x01(\t\x12\r\n\x05\x62ytes\x18\x02 \x01(\x0c\x12\x14\n\x0c\x63ontent_hash\x18\x64 \x01(\x0c\"\x85\t\n\rDisputeResult\x12\x10\n\x08trade_id\x18\x01 \x01(\t\x12\x11\n\ttrader_id\x18\x02 \x01(\x05\x12\x39\n\x06winner\x18\x03 \x01(\x0e\x32).io.bisq.protobuffer.DisputeResult.Winner\x12\x16\n\x0ereason_ordinal\x18\x04 \x01(\x05\x12\x1d\n\x15tamper_proof_evidence\x18\x05 \x01(\x08\x12\x17\n\x0fid_verification\x18\x06 \x01(\x08\x12\x13\n\x0bscreen_cast\x18\x07 \x01(\x08\x12\x15\n\rsummary_notes\x18\x08 \x01(\t\x12\x36\n\x0c\x63hat_message\x18\t \x01(\x0b\x32 .io.bisq.protobuffer.ChatMessage\x12\x1c\n\x14\x61rbitrator_signature\x18\n \x01(\x0c\x12\x1b\n\x13\x62uyer_payout_amount\x18\x0b \x01(\x03\x12\x1c\n\x14seller_payout_amount\x18\x0c \x01(\x03\x12\x1a\n\x12\x61rbitrator_pub_key\x18\r \x01(\x0c\x12\x12\n\nclose_date\x18\x0e \x01(\x03\x12\x1a\n\x12is_loser_publisher\x18\x0f \x01(\x08\x12!\n\x19payout_adjustment_percent\x18\x10 \x01(\t\x12N\n\x11payout_suggestion\x18\x11 \x01(\x0e\x32\x33.io.bisq.protobuffer.DisputeResult.PayoutSuggestion\"4\n\x06Winner\x12\x13\n\x0fPB_ERROR_WINNER\x10\x00\x12\t\n\x05\x42UYER\x10\x01\x12\n\n\x06SELLER\x10\x02\"\xf8\x01\n\x06Reason\x12\x13\n\x0fPB_ERROR_REASON\x10\x00\x12\t\n\x05OTHER\x10\x01\x12\x07\n\x03\x42UG\x10\x02\x12\r\n\tUSABILITY\x10\x03\x12\x08\n\x04SCAM\x10\x04\x12\x16\n\x12PROTOCOL_VIOLATION\x10\x05\x12\x0c\n\x08NO_REPLY\x10\x06\x12\x11\n\rBANK_PROBLEMS\x10\x07\x12\x10\n\x0cOPTION_TRADE\x10\x08\x12\x19\n\x15SELLER_NOT_RESPONDING\x10\t\x12\x18\n\x14WRONG_SENDER_ACCOUNT\x10\n\x12\x19\n\x15TRADE_ALREADY_SETTLED\x10\x0b\x12\x11\n\rPEER_WAS_LATE\x10\x0c\"\x96\x02\n\x10PayoutSuggestion\x12\x11\n\rCUSTOM_PAYOUT\x10\x00\x12\x1b\n\x17\x42UYER_GETS_TRADE_AMOUNT\x10\x01\x12-\n)BUYER_GETS_TRADE_AMOUNT_PLUS_COMPENSATION\x10\x02\x12)\n%BUYER_GETS_TRADE_AMOUNT_MINUS_PENALTY\x10\x03\x12\x1c\n\x18SELLER_GETS_TRADE_AMOUNT\x10\x04\x12.\n*SELLER_GETS_TRADE_AMOUNT_PLUS_COMPENSATION\x10\x05\x12*\n&SELLER_GETS_TRADE_AMOUNT_MINUS_PENALTY\x10\x06\"\xcf\x08\n\x08\x43ontract\x12\x38\n\roffer_payload\x18\x01 \x01(\x0b\x32!.io.bisq.protobuffer.OfferPayload\x12\x14\n\x0ctrade_amount\x18\x02 \x01(\x03\x12\x13\n\x0btrade_price\x18\x03 \x01(\x03\x12\x17\n\x0ftaker_fee_tx_id\x18\x04 \x01(\t\x12\'\n\x1fis_buyer_maker_and_seller_taker\x18\x06 \x01(\x08\x12\x18\n\x10maker_account_id\x18\x07 \x01(\t\x12\x18\n\x10taker_account_id\x18\x08 \x01(\t\x12Q\n\x1dmaker_payment_account_payload\x18\t \x01(\x0b\x32*.io.bisq.protobuffer.PaymentAccountPayload\x12Q\n\x1dtaker_payment_account_payload\x18\n \x01(\x0b\x32*.io.bisq.protobuffer.PaymentAccountPayload\x12;\n\x12maker_pub_key_ring\x18\x0b \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12;\n\x12taker_pub_key_ring\x18\x0c \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12<\n\x12\x62uyer_node_address\x18\r \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12=\n\x13seller_node_address\x18\x0e \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12#\n\x1bmaker_payout_address_string\x18\x0f \x01(\t\x12#\n\x1btaker_payout_address_string\x18\x10 \x01(\t\x12\x1f\n\x17maker_multi_sig_pub_key\x18\x11 \x01(\x0c\x12\x1f\n\x17taker_multi_sig_pub_key\x18\x12 \x01(\x0c\x12?\n\x15mediator_node_address\x18\x13 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x11\n\tlock_time\x18\x14 \x01(\x03\x12\x43\n\x19refund_agent_node_address\x18\x15 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12.\n&hash_of_makers_payment_account_payload\x18\x16 \x01(\x0c\x12.\n&hash_of_takers_payment_account_payload\x18\x17 \x01(\x0c\x12\x1f\n\x17maker_payment_method_id\x18\x18 \x01(\t\x12\x1f\n\x17taker_payment_method_id\x18\x19 \x01(\tJ\x04\x08\x05\x10\x06\"g\n\x13RawTransactionInput\x12\r\n\x05index\x18\x01 \x01(\x03\x12\x1a\n\x12parent_transaction\x18\x02 \x01(\x0c\x12\r\n\x05value\x18\x03 \x01(\x03\x12\x16\n\x0escript_type_id\x18\x04 \x01(\x05\"\xf5\x19\n\x15PaymentAccountPayload\x12\n\n\x02id\x18\x01 \x01(\t\x12\x19\n\x11payment_method_id\x18\x02 \x01(\t\x12\x1c\n\x10max_trade_period\x18\x03 \x01(\x03\x42\x02\x18\x01\x12L\n\x17\x61li_pay_account_payload\x18\x04 \x01(\x0b\x32).io.bisq.protobuffer.AliPayAccountPayloadH\x00\x12[\n\x1f\x63hase_quick_pay_account_payload\x18\x05 \x01(\x0b\x32\x30.io.bisq.protobuffer.ChaseQuickPayAccountPayloadH\x00\x12X\n\x1d\x63lear_xchange_account_payload\x18\x06 \x01(\x0b\x32/.io.bisq.protobuffer.ClearXchangeAccountPayloadH\x00\x12g\n%country_based_payment_account_payload\x18\x07 \x01(\x0b\x32\x36.io.bisq.protobuffer.CountryBasedPaymentAccountPayloadH\x00\x12\\\n\x1f\x63rypto_currency_account_payload\x18\x08 \x01(\x0b\x32\x31.io.bisq.protobuffer.CryptoCurrencyAccountPayloadH\x00\x12\\\n\x1f\x66\x61ster_payments_account_payload\x18\t \x01(\x0b\x32\x31.io.bisq.protobuffer.FasterPaymentsAccountPayloadH\x00\x12\x61\n\"interac_e_transfer_account_payload\x18\n \x01(\x0b\x32\x33.io.bisq.protobuffer.InteracETransferAccountPayloadH\x00\x12O\n\x17o_k_pay_account_payload\x18\x0b \x01(\x0b\x32(.io.bisq.protobuffer.OKPayAccountPayloadB\x02\x18\x01H\x00\x12X\n\x1dperfect_money_account_payload\x18\x0c \x01(\x0b\x32/.io.bisq.protobuffer.PerfectMoneyAccountPayloadH\x00\x12I\n\x15swish_account_payload\x18\r \x01(\x0b\x32(.io.bisq.protobuffer.SwishAccountPayloadH\x00\x12g\n&u_s_postal_money_order_account_payload\x18\x0e \x01(\x0b\x32\x35.io.bisq.protobuffer.USPostalMoneyOrderAccountPayloadH\x00\x12K\n\x16uphold_account_payload\x18\x10 \x01(\x0b\x32).io.bisq.protobuffer.UpholdAccountPayloadH\x00\x12R\n\x18\x63\x61sh_app_account_payload\x18\x11 \x01(\x0b\x32*.io.bisq.protobuffer.CashAppAccountPayloadB\x02\x18\x01H\x00\x12R\n\x1amoney_beam_account_payload\x18\x12 \x01(\x0b\x32,.io.bisq.protobuffer.MoneyBeamAccountPayloadH\x00\x12M\n\x15venmo_account_payload\x18\x13 \x01(\x0b\x32(.io.bisq.protobuffer.VenmoAccountPayloadB\x02\x18\x01H\x00\x12O\n\x18popmoney_account_payload\x18\x14 \x01(\x0b\x32+.io.bisq.protobuffer.PopmoneyAccountPayloadH\x00\x12M\n\x17revolut_account_payload\x18\x15 \x01(\x0b\x32*.io.bisq.protobuffer.RevolutAccountPayloadH\x00\x12S\n\x1bwe_chat_pay_account_payload\x18\x16 \x01(\x0b\x32,.io.bisq.protobuffer.WeChatPayAccountPayloadH\x00\x12R\n\x1amoney_gram_account_payload\x18\x17 \x01(\x0b\x32,.io.bisq.protobuffer.MoneyGramAccountPayloadH\x00\x12N\n\x18hal_cash_account_payload\x18\x18 \x01(\x0b\x32*.io.bisq.protobuffer.HalCashAccountPayloadH\x00\x12R\n\x1aprompt_pay_account_payload\x18\x19 \x01(\x0b\x32,.io.bisq.protobuffer.PromptPayAccountPayloadH\x00\x12X\n\x1d\x61\x64vanced_cash_account_payload\x18\x1a \x01(\x0b\x32/.io.bisq.protobuffer.AdvancedCashAccountPayloadH\x00\x12k\n\'instant_crypto_currency_account_payload\x18\x1b \x01(\x0b\x32\x38.io.bisq.protobuffer.InstantCryptoCurrencyAccountPayloadH\x00\x12R\n\x1ajapan_bank_account_payload\x18\x1c \x01(\x0b\x32,.io.bisq.protobuffer.JapanBankAccountPayloadH\x00\x12W\n\x1ctransferwise_account_payload\x18\x1d \x01(\x0b\x32/.io.bisq.protobuffer.TransferwiseAccountPayloadH\x00\x12M\n\x17\x61ustralia_payid_payload\x18\x1e \x01(\x0b\x32*.io.bisq.protobuffer.AustraliaPayidPayloadH\x00\x12]\n amazon_gift_card_account_payload\x18\x1f \x01(\x0b\x32\x31.io.bisq.protobuffer.AmazonGiftCardAccountPayloadH\x00\x12U\n\x1c\x63\x61sh_by_mail_account_payload\x18  \x01(\x0b\x32-.io.bisq.protobuffer.CashByMailAccountPayloadH\x00\x12O\n\x18\x63\x61pitual_account_payload\x18! \x01(\x0b\x32+.io.bisq.protobuffer.CapitualAccountPayloadH\x00\x12M\n\x17paysera_account_payload\x18\" \x01(\x0b\x32*.io.bisq.protobuffer.PayseraAccountPayloadH\x00\x12I\n\x15paxum_account_payload\x18# \x01(\x0b\x32(.io.bisq.protobuffer.PaxumAccountPayloadH\x00\x12I\n\x15swift_account_payload\x18$ \x01(\x0b\x32(.io.bisq.protobuffer.SwiftAccountPayloadH\x00\x12L\n\x17\x63\x65l_pay_account_payload\x18% \x01(\x0b\x32).io.bisq.protobuffer.CelPayAccountPayloadH\x00\x12K\n\x16monese_account_payload\x18& \x01(\x0b\x32).io.bisq.protobuffer.MoneseAccountPayloadH\x00\x12I\n\x15verse_account_payload\x18\' \x01(\x0b\x32(.io.bisq.protobuffer.VerseAccountPayloadH\x00\x12N\n\x18\x62sq_swap_account_payload\x18( \x01(\x0b\x32*.io.bisq.protobuffer.BsqSwapAccountPayloadH\x00\x12\x45\n\x13sbp_account_payload\x18) \x01(\x0b\x32&.io.bisq.protobuffer.SbpAccountPayloadH\x00\x12\x43\n\x16\x65xclude_from_json_data\x18\x0f \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntryB\t\n\x07message\"*\n\x14\x41liPayAccountPayload\x12\x12\n\naccount_nr\x18\x01 \x01(\t\"-\n\x17WeChatPayAccountPayload\x12\x12\n\naccount_nr\x18\x01 \x01(\t\"A\n\x1b\x43haseQuickPayAccountPayload\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\"M\n\x1a\x43learXchangeAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x1a\n\x12\x65mail_or_mobile_nr\x18\x02 \x01(\t\"\x8d\x0b\n!CountryBasedPaymentAccountPayload\x12\x14\n\x0c\x63ountry_code\x18\x01 \x01(\t\x12G\n\x14\x62\x61nk_account_payload\x18\x02 \x01(\x0b\x32\'.io.bisq.protobuffer.BankAccountPayloadH\x00\x12V\n\x1c\x63\x61sh_deposit_account_payload\x18\x03 \x01(\x0b\x32..io.bisq.protobuffer.CashDepositAccountPayloadH\x00\x12G\n\x14sepa_account_payload\x18\x04 \x01(\x0b\x32\'.io.bisq.protobuffer.SepaAccountPayloadH\x00\x12X\n\x1dwestern_union_account_payload\x18\x05 \x01(\x0b\x32/.io.bisq.protobuffer.WesternUnionAccountPayloadH\x00\x12V\n\x1csepa_instant_account_payload\x18\x06 \x01(\x0b\x32..io.bisq.protobuffer.SepaInstantAccountPayloadH\x00\x12\x45\n\x13\x66\x32\x66_account_payload\x18\x07 \x01(\x0b\x32&.io.bisq.protobuffer.F2FAccountPayloadH\x00\x12\x45\n\x13upi_account_payload\x18\t \x01(\x0b\x32&.io.bisq.protobuffer.UpiAccountPayloadH\x00\x12I\n\x15paytm_account_payload\x18\n \x01(\x0b\x32(.io.bisq.protobuffer.PaytmAccountPayloadH\x00\x12R\n\x1aifsc_based_account_payload\x18\x0b \x01(\x0b\x32,.io.bisq.protobuffer.IfscBasedAccountPayloadH\x00\x12I\n\x15nequi_account_payload\x18\x0c \x01(\x0b\x32(.io.bisq.protobuffer.NequiAccountPayloadH\x00\x12I\n\x15\x62izum_account_payload\x18\r \x01(\x0b\x32(.io.bisq.protobuffer.BizumAccountPayloadH\x00\x12\x45\n\x13pix_account_payload\x18\x0e \x01(\x0b\x32&.io.bisq.protobuffer.PixAccountPayloadH\x00\x12O\n\x18satispay_account_payload\x18\x0f \x01(\x0b\x32+.io.bisq.protobuffer.SatispayAccountPayloadH\x00\x12K\n\x16strike_account_payload\x18\x10 \x01(\x0b\x32).io.bisq.protobuffer.StrikeAccountPayloadH\x00\x12K\n\x16tikkie_account_payload\x18\x11 \x01(\x0b\x32).io.bisq.protobuffer.TikkieAccountPayloadH\x00\x12^\n transferwise_usd_account_payload\x18\x12 \x01(\x0b\x32\x32.io.bisq.protobuffer.TransferwiseUsdAccountPayloadH\x00\x12V\n\x1cmercado_pago_account_payload\x18\x13 \x01(\x0b\x32..io.bisq.protobuffer.MercadoPagoAccountPayloadH\x00\x42\t\n\x07message\"\xa6\x05\n\x12\x42\x61nkAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x11\n\tbank_name\x18\x02 \x01(\t\x12\x0f\n\x07\x62\x61nk_id\x18\x03 \x01(\t\x12\x11\n\tbranch_id\x18\x04 \x01(\t\x12\x12\n\naccount_nr\x18\x05 \x01(\t\x12\x14\n\x0c\x61\x63\x63ount_type\x18\x06 \x01(\t\x12\x15\n\rholder_tax_id\x18\x07 \x01(\t\x12\x11\n\x05\x65mail\x18\x08 \x01(\tB\x02\x18\x01\x12X\n\x1dnational_bank_account_payload\x18\t \x01(\x0b\x32/.io.bisq.protobuffer.NationalBankAccountPayloadH\x00\x12O\n\x18same_bank_accont_payload\x18\n \x01(\x0b\x32+.io.bisq.protobuffer.SameBankAccountPayloadH\x00\x12Z\n\x1especific_banks_account_payload\x18\x0b \x01(\x0b\x32\x30.io.bisq.protobuffer.SpecificBanksAccountPayloadH\x00\x12V\n\x1c\x61\x63h_transfer_account_payload\x18\r \x01(\x0b\x32..io.bisq.protobuffer.AchTransferAccountPayloadH\x00\x12i\n&domestic_wire_transfer_account_payload\x18\x0e \x01(\x0b\x32\x37.io.bisq.protobuffer.DomesticWireTransferAccountPayloadH\x00\x12\x1b\n\x13national_account_id\x18\x0c \x01(\tB\t\n\x07message\"3\n\x19\x41\x63hTransferAccountPayload\x12\x16\n\x0eholder_address\x18\x01 \x01(\t\"<\n\"DomesticWireTransferAccountPayload\x12\x16\n\x0eholder_address\x18\x01 \x01(\t\"\x1c\n\x1aNationalBankAccountPayload\"\x18\n\x16SameBankAccountPayload\"\xc6\x01\n\x17JapanBankAccountPayload\x12\x11\n\tbank_name\x18\x01 \x01(\t\x12\x11\n\tbank_code\x18\x02 \x01(\t\x12\x18\n\x10\x62\x61nk_branch_name\x18\x03 \x01(\t\x12\x18\n\x10\x62\x61nk_branch_code\x18\x04 \x01(\t\x12\x19\n\x11\x62\x61nk_account_type\x18\x05 \x01(\t\x12\x19\n\x11\x62\x61nk_account_name\x18\x06 \x01(\t\x12\x1b\n\x13\x62\x61nk_account_number\x18\x07 \x01(\t\"A\n\x15\x41ustraliaPayidPayload\x12\x19\n\x11\x62\x61nk_account_name\x18\x01 \x01(\t\x12\r\n\x05payid\x18\x02 \x01(\t\"5\n\x1bSpecificBanksAccountPayload\x12\x16\n\x0e\x61\x63\x63\x65pted_banks\x18\x01 \x03(\t\"\xf1\x01\n\x19\x43\x61shDepositAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x14\n\x0cholder_email\x18\x02 \x01(\t\x12\x11\n\tbank_name\x18\x03 \x01(\t\x12\x0f\n\x07\x62\x61nk_id\x18\x04 \x01(\t\x12\x11\n\tbranch_id\x18\x05 \x01(\t\x12\x12\n\naccount_nr\x18\x06 \x01(\t\x12\x14\n\x0c\x61\x63\x63ount_type\x18\x07 \x01(\t\x12\x14\n\x0crequirements\x18\x08 \x01(\t\x12\x15\n\rholder_tax_id\x18\t \x01(\t\x12\x1b\n\x13national_account_id\x18\n \x01(\t\"b\n\x17MoneyGramAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x14\n\x0c\x63ountry_code\x18\x02 \x01(\t\x12\r\n\x05state\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\"*\n\x15HalCashAccountPayload\x12\x11\n\tmobile_nr\x18\x01 \x01(\t\"]\n\x1aWesternUnionAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12\r\n\x05state\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\"P\n\x1c\x41mazonGiftCardAccountPayload\x12\x1a\n\x12\x65mail_or_mobile_nr\x18\x01 \x01(\t\x12\x14\n\x0c\x63ountry_code\x18\x02 \x01(\t\"w\n\x12SepaAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x0c\n\x04iban\x18\x02 \x01(\t\x12\x0b\n\x03\x62ic\x18\x03 \x01(\t\x12\x11\n\x05\x65mail\x18\x04 \x01(\tB\x02\x18\x01\x12\x1e\n\x16\x61\x63\x63\x65pted_country_codes\x18\x05 \x03(\t\"k\n\x19SepaInstantAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x0c\n\x04iban\x18\x02 \x01(\t\x12\x0b\n\x03\x62ic\x18\x03 \x01(\t\x12\x1e\n\x16\x61\x63\x63\x65pted_country_codes\x18\x04 \x03(\t\"/\n\x1c\x43ryptoCurrencyAccountPayload\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"6\n#InstantCryptoCurrencyAccountPayload\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"\x17\n\x15\x42sqSwapAccountPayload\"X\n\x1c\x46\x61sterPaymentsAccountPayload\x12\x11\n\tsort_code\x18\x01 \x01(\t\x12\x12\n\naccount_nr\x18\x02 \x01(\t\x12\x11\n\x05\x65mail\x18\x03 \x01(\tB\x02\x18\x01\"f\n\x1eInteracETransferAccountPayload\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\x12\x10\n\x08question\x18\x03 \x01(\t\x12\x0e\n\x06\x61nswer\x18\x04 \x01(\t\")\n\x13OKPayAccountPayload\x12\x12\n\naccount_nr\x18\x01 \x01(\t\"A\n\x14UpholdAccountPayload\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12\x15\n\raccount_owner\x18\x02 \x01(\t\")\n\x15\x43\x61shAppAccountPayload\x12\x10\n\x08\x63\x61sh_tag\x18\x01 \x01(\t\"-\n\x17MoneyBeamAccountPayload\x12\x12\n\naccount_id\x18\x01 \x01(\t\"C\n\x13VenmoAccountPayload\x12\x17\n\x0fvenmo_user_name\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\"A\n\x16PopmoneyAccountPayload\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\">\n\x15RevolutAccountPayload\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12\x11\n\tuser_name\x18\x02 \x01(\t\"0\n\x1aPerfectMoneyAccountPayload\x12\x12\n\naccount_nr\x18\x01 \x01(\t\"=\n\x13SwishAccountPayload\x12\x11\n\tmobile_nr\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\"O\n USPostalMoneyOrderAccountPayload\x12\x16\n\x0epostal_address\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\"F\n\x11\x46\x32\x46\x41\x63\x63ountPayload\x12\x0f\n\x07\x63ontact\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12\x12\n\nextra_info\x18\x03 \x01(\t\"\xb6\x02\n\x17IfscBasedAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x12\n\naccount_nr\x18\x02 \x01(\t\x12\x0c\n\x04ifsc\x18\x03 \x01(\t\x12G\n\x14neft_account_payload\x18\x04 \x01(\x0b\x32\'.io.bisq.protobuffer.NeftAccountPayloadH\x00\x12G\n\x14rtgs_account_payload\x18\x05 \x01(\x0b\x32\'.io.bisq.protobuffer.RtgsAccountPayloadH\x00\x12G\n\x14imps_account_payload\x18\x06 \x01(\x0b\x32\'.io.bisq.protobuffer.ImpsAccountPayloadH\x00\x42\t\n\x07message\"\x14\n\x12NeftAccountPayload\"\x14\n\x12RtgsAccountPayload\"\x14\n\x12ImpsAccountPayload\"4\n\x11UpiAccountPayload\x12\x1f\n\x17virtual_payment_address\x18\x01 \x01(\t\"1\n\x13PaytmAccountPayload\x12\x1a\n\x12\x65mail_or_mobile_nr\x18\x01 \x01(\t\"W\n\x18\x43\x61shByMailAccountPayload\x12\x16\n\x0epostal_address\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontact\x18\x02 \x01(\t\x12\x12\n\nextra_info\x18\x03 \x01(\t\"0\n\x17PromptPayAccountPayload\x12\x15\n\rprompt_pay_id\x18\x01 \x01(\t\"0\n\x1a\x41\x64vancedCashAccountPayload\x12\x12\n\naccount_nr\x18\x01 \x01(\t\"+\n\x1aTransferwiseAccountPayload\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"`\n\x1dTransferwiseUsdAccountPayload\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\x12\x1b\n\x13\x62\x65neficiary_address\x18\x03 \x01(\t\"&\n\x15PayseraAccountPayload\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"$\n\x13PaxumAccountPayload\x12\r\n\x05\x65mail\x18\x01 \x01(\t\",\n\x16\x43\x61pitualAccountPayload\x12\x12\n\naccount_nr\x18\x01 \x01(\t\"%\n\x14\x43\x65lPayAccountPayload\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"(\n\x13NequiAccountPayload\x12\x11\n\tmobile_nr\x18\x01 \x01(\t\"(\n\x13\x42izumAccountPayload\x12\x11\n\tmobile_nr\x18\x01 \x01(\t\"$\n\x11PixAccountPayload\x12\x0f\n\x07pix_key\x18\x01 \x01(\t\">\n\x14MoneseAccountPayload\x12\x11\n\tmobile_nr\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\"@\n\x16SatispayAccountPayload\x12\x11\n\tmobile_nr\x18\x01 \x01(\t\x12\x13\n\x0bholder_name\x18\x02 \x01(\t\"+\n\x14StrikeAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\"$\n\x14TikkieAccountPayload\x12\x0c\n\x04iban\x18\x01 \x01(\t\"*\n\x13VerseAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\"C\n\x19MercadoPagoAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x11\n\tholder_id\x18\x02 \x01(\t\"\xcb\x03\n\x13SwiftAccountPayload\x12\x18\n\x10\x62\x65neficiary_name\x18\x01 \x01(\t\x12\x1e\n\x16\x62\x65neficiary_account_nr\x18\x02 \x01(\t\x12\x1b\n\x13\x62\x65neficiary_address\x18\x03 \x01(\t\x12\x18\n\x10\x62\x65neficiary_city\x18\x04 \x01(\t\x12\x19\n\x11\x62\x65neficiary_phone\x18\x05 \x01(\t\x12\x1c\n\x14special_instructions\x18\x06 \x01(\t\x12\x17\n\x0f\x62\x61nk_swift_code\x18\x07 \x01(\t\x12\x19\n\x11\x62\x61nk_country_code\x18\x08 \x01(\t\x12\x11\n\tbank_name\x18\t \x01(\t\x12\x13\n\x0b\x62\x61nk_branch\x18\n \x01(\t\x12\x14\n\x0c\x62\x61nk_address\x18\x0b \x01(\t\x12\x1f\n\x17intermediary_swift_code\x18\x0c \x01(\t\x12!\n\x19intermediary_country_code\x18\r \x01(\t\x12\x19\n\x11intermediary_name\x18\x0e \x01(\t\x12\x1b\n\x13intermediary_branch\x18\x0f \x01(\t\x12\x1c\n\x14intermediary_address\x18\x10 \x01(\t\"R\n\x11SbpAccountPayload\x12\x13\n\x0bholder_name\x18\x01 \x01(\t\x12\x15\n\rmobile_number\x18\x02 \x01(\t\x12\x11\n\tbank_name\x18\x03 \x01(\t\"\xcd\x01\n\x12UserManagerPayload\x12\x16\n\x0e\x61\x63tive_user_id\x18\x01 \x01(\t\x12?\n\x12user_alias_entries\x18\x02 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\x12\x1c\n\x14keep_alive_on_switch\x18\x03 \x01(\x08\x12\x18\n\x10init_all_at_once\x18\x04 \x01(\x08\x12&\n\x1epreliminary_request_preference\x18\x05 \x01(\x05\"\xb9\x12\n\x13PersistableEnvelope\x12\x45\n\x13sequence_number_map\x18\x01 \x01(\x0b\x32&.io.bisq.protobuffer.SequenceNumberMapH\x00\x12I\n\x13persisted_entry_map\x18\x02 \x01(\x0b\x32&.io.bisq.protobuffer.PersistedEntryMapB\x02\x18\x01H\x00\x12\x32\n\tpeer_list\x18\x03 \x01(\x0b\x32\x1d.io.bisq.protobuffer.PeerListH\x00\x12\x43\n\x12\x61\x64\x64ress_entry_list\x18\x04 \x01(\x0b\x32%.io.bisq.protobuffer.AddressEntryListH\x00\x12>\n\x0fnavigation_path\x18\x05 \x01(\x0b\x32#.io.bisq.protobuffer.NavigationPathH\x00\x12:\n\rtradable_list\x18\x06 \x01(\x0b\x32!.io.bisq.protobuffer.TradableListH\x00\x12O\n\x18\x61rbitration_dispute_list\x18\x08 \x01(\x0b\x32+.io.bisq.protobuffer.ArbitrationDisputeListH\x00\x12\x46\n\x13preferences_payload\x18\t \x01(\x0b\x32\'.io.bisq.protobuffer.PreferencesPayloadH\x00\x12\x38\n\x0cuser_payload\x18\n \x01(\x0b\x32 .io.bisq.protobuffer.UserPayloadH\x00\x12G\n\x14payment_account_list\x18\x0b \x01(\x0b\x32\'.io.bisq.protobuffer.PaymentAccountListH\x00\x12P\n\x19\x61\x63\x63ount_age_witness_store\x18\r \x01(\x0b\x32+.io.bisq.protobuffer.AccountAgeWitnessStoreH\x00\x12Q\n\x17trade_statistics2_store\x18\x0e \x01(\x0b\x32*.io.bisq.protobuffer.TradeStatistics2StoreB\x02\x18\x01H\x00\x12<\n\x0eproposal_store\x18\x10 \x01(\x0b\x32\".io.bisq.protobuffer.ProposalStoreH\x00\x12\x45\n\x13temp_proposal_store\x18\x11 \x01(\x0b\x32&.io.bisq.protobuffer.TempProposalStoreH\x00\x12?\n\x10\x62lind_vote_store\x18\x12 \x01(\x0b\x32#.io.bisq.protobuffer.BlindVoteStoreH\x00\x12?\n\x10my_proposal_list\x18\x13 \x01(\x0b\x32#.io.bisq.protobuffer.MyProposalListH\x00\x12\x36\n\x0b\x62\x61llot_list\x18\x14 \x01(\x0b\x32\x1f.io.bisq.protobuffer.BallotListH\x00\x12\x37\n\x0cmy_vote_list\x18\x15 \x01(\x0b\x32\x1f.io.bisq.protobuffer.MyVoteListH\x00\x12\x42\n\x12my_blind_vote_list\x18\x16 \x01(\x0b\x32$.io.bisq.protobuffer.MyBlindVoteListH\x00\x12=\n\x0f\x64\x61o_state_store\x18\x18 \x01(\x0b\x32\".io.bisq.protobuffer.DaoStateStoreH\x00\x12\x43\n\x12my_reputation_list\x18\x19 \x01(\x0b\x32%.io.bisq.protobuffer.MyReputationListH\x00\x12G\n\x15my_proof_of_burn_list\x18\x1a \x01(\x0b\x32&.io.bisq.protobuffer.MyProofOfBurnListH\x00\x12\x61\n\"unconfirmed_bsq_change_output_list\x18\x1b \x01(\x0b\x32\x33.io.bisq.protobuffer.UnconfirmedBsqChangeOutputListH\x00\x12G\n\x14signed_witness_store\x18\x1c \x01(\x0b\x32\'.io.bisq.protobuffer.SignedWitnessStoreH\x00\x12K\n\x16mediation_dispute_list\x18\x1d \x01(\x0b\x32).io.bisq.protobuffer.MediationDisputeListH\x00\x12\x45\n\x13refund_dispute_list\x18\x1e \x01(\x0b\x32&.io.bisq.protobuffer.RefundDisputeListH\x00\x12M\n\x17trade_statistics3_store\x18\x1f \x01(\x0b\x32*.io.bisq.protobuffer.TradeStatistics3StoreH\x00\x12G\n\x14mailbox_message_list\x18  \x01(\x0b\x32\'.io.bisq.protobuffer.MailboxMessageListH\x00\x12\x45\n\x13ignored_mailbox_map\x18! \x01(\x0b\x32&.io.bisq.protobuffer.IgnoredMailboxMapH\x00\x12G\n\x14removed_payloads_map\x18\" \x01(\x0b\x32\'.io.bisq.protobuffer.RemovedPayloadsMapH\x00\x12=\n\x0f\x62sq_block_store\x18# \x01(\x0b\x32\".io.bisq.protobuffer.BsqBlockStoreH\x00\x12V\n\x1c\x62urning_man_accounting_store\x18$ \x01(\x0b\x32..io.bisq.protobuffer.BurningManAccountingStoreH\x00\x12G\n\x14user_manager_payload\x18\x64 \x01(\x0b\x32\'.io.bisq.protobuffer.UserManagerPayloadH\x00\x42\t\n\x07message\"^\n\x11SequenceNumberMap\x12I\n\x17sequence_number_entries\x18\x01 \x03(\x0b\x32(.io.bisq.protobuffer.SequenceNumberEntry\"v\n\x13SequenceNumberEntry\x12-\n\x05\x62ytes\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.ByteArray\x12\x30\n\tmap_value\x18\x02 \x01(\x0b\x32\x1d.io.bisq.protobuffer.MapValue\"\x1a\n\tByteArray\x12\r\n\x05\x62ytes\x18\x01 \x01(\x0c\"3\n\x08MapValue\x12\x13\n\x0bsequence_nr\x18\x01 \x01(\x05\x12\x12\n\ntime_stamp\x18\x02 \x01(\x03\"\xd5\x01\n\x11PersistedEntryMap\x12Z\n\x13persisted_entry_map\x18\x01 \x03(\x0b\x32=.io.bisq.protobuffer.PersistedEntryMap.PersistedEntryMapEntry\x1a\x64\n\x16PersistedEntryMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x39\n\x05value\x18\x02 \x01(\x0b\x32*.io.bisq.protobuffer.ProtectedStorageEntry:\x02\x38\x01\"O\n\x16\x41\x63\x63ountAgeWitnessStore\x12\x35\n\x05items\x18\x01 \x03(\x0b\x32&.io.bisq.protobuffer.AccountAgeWitness\"G\n\x12SignedWitnessStore\x12\x31\n\x05items\x18\x01 \x03(\x0b\x32\".io.bisq.protobuffer.SignedWitness\"Q\n\x15TradeStatistics2Store\x12\x38\n\x05items\x18\x01 \x03(\x0b\x32%.io.bisq.protobuffer.TradeStatistics2B\x02\x18\x01\"M\n\x15TradeStatistics3Store\x12\x34\n\x05items\x18\x01 \x03(\x0b\x32%.io.bisq.protobuffer.TradeStatistics3\"3\n\x08PeerList\x12\'\n\x04peer\x18\x01 \x03(\x0b\x32\x19.io.bisq.protobuffer.Peer\"L\n\x10\x41\x64\x64ressEntryList\x12\x38\n\raddress_entry\x18\x01 \x03(\x0b\x32!.io.bisq.protobuffer.AddressEntry\"\xba\x02\n\x0c\x41\x64\x64ressEntry\x12\x10\n\x08offer_id\x18\x07 \x01(\t\x12:\n\x07\x63ontext\x18\x08 \x01(\x0e\x32).io.bisq.protobuffer.AddressEntry.Context\x12\x0f\n\x07pub_key\x18\t \x01(\x0c\x12\x14\n\x0cpub_key_hash\x18\n \x01(\x0c\x12 \n\x18\x63oin_locked_in_multi_sig\x18\x0b \x01(\x03\x12\x0e\n\x06segwit\x18\x0c \x01(\x08\"\x82\x01\n\x07\x43ontext\x12\x0c\n\x08PB_ERROR\x10\x00\x12\x0e\n\nARBITRATOR\x10\x01\x12\r\n\tAVAILABLE\x10\x02\x12\x11\n\rOFFER_FUNDING\x10\x03\x12\x16\n\x12RESERVED_FOR_TRADE\x10\x04\x12\r\n\tMULTI_SIG\x10\x05\x12\x10\n\x0cTRADE_PAYOUT\x10\x06\"\x1e\n\x0eNavigationPath\x12\x0c\n\x04path\x18\x01 \x03(\t\"R\n\x12PaymentAccountList\x12<\n\x0fpayment_account\x18\x01 \x03(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\"?\n\x0cTradableList\x12/\n\x08tradable\x18\x01 \x03(\x0b\x32\x1d.io.bisq.protobuffer.Tradable\"\x94\x02\n\x05Offer\x12:\n\roffer_payload\x18\x01 \x01(\x0b\x32!.io.bisq.protobuffer.OfferPayloadH\x00\x12J\n\x16\x62sq_swap_offer_payload\x18\x02 \x01(\x0b\x32(.io.bisq.protobuffer.BsqSwapOfferPayloadH\x00\"x\n\x05State\x12\x0c\n\x08PB_ERROR\x10\x00\x12\x0b\n\x07UNKNOWN\x10\x01\x12\x12\n\x0eOFFER_FEE_PAID\x10\x02\x12\r\n\tAVAILABLE\x10\x03\x12\x11\n\rNOT_AVAILABLE\x10\x04\x12\x0b\n\x07REMOVED\x10\x05\x12\x11\n\rMAKER_OFFLINE\x10\x06\x42\t\n\x07message\"\xaa\x03\n\tOpenOffer\x12)\n\x05offer\x18\x01 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Offer\x12\x33\n\x05state\x18\x02 \x01(\x0e\x32$.io.bisq.protobuffer.OpenOffer.State\x12\x41\n\x17\x61rbitrator_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12?\n\x15mediator_node_address\x18\x04 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x43\n\x19refund_agent_node_address\x18\x05 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x15\n\rtrigger_price\x18\x06 \x01(\x03\"]\n\x05State\x12\x0c\n\x08PB_ERROR\x10\x00\x12\r\n\tAVAILABLE\x10\x01\x12\x0c\n\x08RESERVED\x10\x02\x12\n\n\x06\x43LOSED\x10\x03\x12\x0c\n\x08\x43\x41NCELED\x10\x04\x12\x0f\n\x0b\x44\x45\x41\x43TIVATED\x10\x05\"\xd3\x05\n\x08Tradable\x12\x34\n\nopen_offer\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.OpenOfferH\x00\x12\x46\n\x14\x62uyer_as_maker_trade\x18\x02 \x01(\x0b\x32&.io.bisq.protobuffer.BuyerAsMakerTradeH\x00\x12\x46\n\x14\x62uyer_as_taker_trade\x18\x03 \x01(\x0b\x32&.io.bisq.protobuffer.BuyerAsTakerTradeH\x00\x12H\n\x15seller_as_maker_trade\x18\x04 \x01(\x0b\x32\'.io.bisq.protobuffer.SellerAsMakerTradeH\x00\x12H\n\x15seller_as_taker_trade\x18\x05 \x01(\x0b\x32\'.io.bisq.protobuffer.SellerAsTakerTradeH\x00\x12V\n\x1d\x62sq_swap_buyer_as_maker_trade\x18\x06 \x01(\x0b\x32-.io.bisq.protobuffer.BsqSwapBuyerAsMakerTradeH\x00\x12V\n\x1d\x62sq_swap_buyer_as_taker_trade\x18\x07 \x01(\x0b\x32-.io.bisq.protobuffer.BsqSwapBuyerAsTakerTradeH\x00\x12X\n\x1e\x62sq_swap_seller_as_maker_trade\x18\x08 \x01(\x0b\x32..io.bisq.protobuffer.BsqSwapSellerAsMakerTradeH\x00\x12X\n\x1e\x62sq_swap_seller_as_taker_trade\x18\t \x01(\x0b\x32..io.bisq.protobuffer.BsqSwapSellerAsTakerTradeH\x00\x42\t\n\x07message\"\xc7\x1c\n\x05Trade\x12)\n\x05offer\x18\x01 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Offer\x12\x38\n\rprocess_model\x18\x02 \x01(\x0b\x32!.io.bisq.protobuffer.ProcessModel\x12\x17\n\x0ftaker_fee_tx_id\x18\x03 \x01(\t\x12\x15\n\rdeposit_tx_id\x18\x04 \x01(\t\x12\x14\n\x0cpayout_tx_id\x18\x05 \x01(\t\x12\x1c\n\x14trade_amount_as_long\x18\x06 \x01(\x03\x12\x16\n\x0etx_fee_as_long\x18\x07 \x01(\x03\x12\x19\n\x11taker_fee_as_long\x18\x08 \x01(\x03\x12\x17\n\x0ftake_offer_date\x18\t \x01(\x03\x12%\n\x1dis_currency_for_taker_fee_btc\x18\n \x01(\x08\x12\x13\n\x0btrade_price\x18\x0b \x01(\x03\x12\x43\n\x19trading_peer_node_address\x18\x0c \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12/\n\x05state\x18\r \x01(\x0e\x32 .io.bisq.protobuffer.Trade.State\x12>\n\rdispute_state\x18\x0e \x01(\x0e\x32\'.io.bisq.protobuffer.Trade.DisputeState\x12G\n\x12trade_period_state\x18\x0f \x01(\x0e\x32+.io.bisq.protobuffer.Trade.TradePeriodState\x12/\n\x08\x63ontract\x18\x10 \x01(\x0b\x32\x1d.io.bisq.protobuffer.Contract\x12\x18\n\x10\x63ontract_as_json\x18\x11 \x01(\t\x12\x15\n\rcontract_hash\x18\x12 \x01(\x0c\x12 \n\x18taker_contract_signature\x18\x13 \x01(\t\x12 \n\x18maker_contract_signature\x18\x14 \x01(\t\x12\x41\n\x17\x61rbitrator_node_address\x18\x15 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12?\n\x15mediator_node_address\x18\x16 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x1e\n\x16\x61rbitrator_btc_pub_key\x18\x17 \x01(\x0c\x12 \n\x18taker_payment_account_id\x18\x18 \x01(\t\x12\x15\n\rerror_message\x18\x19 \x01(\t\x12@\n\x17\x61rbitrator_pub_key_ring\x18\x1a \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12>\n\x15mediator_pub_key_ring\x18\x1b \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x1e\n\x16\x63ounter_currency_tx_id\x18\x1c \x01(\t\x12\x36\n\x0c\x63hat_message\x18\x1d \x03(\x0b\x32 .io.bisq.protobuffer.ChatMessage\x12I\n\x16mediation_result_state\x18\x1e \x01(\x0e\x32).io.bisq.protobuffer.MediationResultState\x12\x11\n\tlock_time\x18\x1f \x01(\x03\x12\x1f\n\x17\x64\x65layed_payout_tx_bytes\x18  \x01(\x0c\x12\x43\n\x19refund_agent_node_address\x18! \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x42\n\x19refund_agent_pub_key_ring\x18\" \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x43\n\x13refund_result_state\x18# \x01(\x0e\x32&.io.bisq.protobuffer.RefundResultState\x12%\n\x19last_refresh_request_date\x18$ \x01(\x03\x42\x02\x18\x01\x12#\n\x1b\x63ounter_currency_extra_data\x18% \x01(\t\x12\x1d\n\x15\x61sset_tx_proof_result\x18& \x01(\t\x12\x0b\n\x03uid\x18\' \x01(\t\x12-\n%seller_confirmed_payment_receipt_date\x18( \x01(\x03\"\xd1\n\n\x05State\x12\x12\n\x0ePB_ERROR_STATE\x10\x00\x12\x0f\n\x0bPREPARATION\x10\x01\x12 \n\x1cTAKER_PUBLISHED_TAKER_FEE_TX\x10\x02\x12)\n%MAKER_SENT_PUBLISH_DEPOSIT_TX_REQUEST\x10\x03\x12\x30\n,MAKER_SAW_ARRIVED_PUBLISH_DEPOSIT_TX_REQUEST\x10\x04\x12\x36\n2MAKER_STORED_IN_MAILBOX_PUBLISH_DEPOSIT_TX_REQUEST\x10\x05\x12\x30\n,MAKER_SEND_FAILED_PUBLISH_DEPOSIT_TX_REQUEST\x10\x06\x12-\n)TAKER_RECEIVED_PUBLISH_DEPOSIT_TX_REQUEST\x10\x07\x12\x1f\n\x1bSELLER_PUBLISHED_DEPOSIT_TX\x10\x08\x12,\n$SELLER_SENT_DEPOSIT_TX_PUBLISHED_MSG\x10\t\x1a\x02\x08\x01\x12\x33\n+SELLER_SAW_ARRIVED_DEPOSIT_TX_PUBLISHED_MSG\x10\n\x1a\x02\x08\x01\x12\x39\n1SELLER_STORED_IN_MAILBOX_DEPOSIT_TX_PUBLISHED_MSG\x10\x0b\x1a\x02\x08\x01\x12\x33\n+SELLER_SEND_FAILED_DEPOSIT_TX_PUBLISHED_MSG\x10\x0c\x1a\x02\x08\x01\x12+\n\'BUYER_RECEIVED_DEPOSIT_TX_PUBLISHED_MSG\x10\r\x12#\n\x1f\x42UYER_SAW_DEPOSIT_TX_IN_NETWORK\x10\x0e\x12$\n DEPOSIT_CONFIRMED_IN_BLOCK_CHAIN\x10\x0f\x12\x30\n,BUYER_CONFIRMED_IN_UI_FIAT_PAYMENT_INITIATED\x10\x10\x12)\n%BUYER_SENT_FIAT_PAYMENT_INITIATED_MSG\x10\x11\x12\x30\n,BUYER_SAW_ARRIVED_FIAT_PAYMENT_INITIATED_MSG\x10\x12\x12\x36\n2BUYER_STORED_IN_MAILBOX_FIAT_PAYMENT_INITIATED_MSG\x10\x13\x12\x30\n,BUYER_SEND_FAILED_FIAT_PAYMENT_INITIATED_MSG\x10\x14\x12.\n*SELLER_RECEIVED_FIAT_PAYMENT_INITIATED_MSG\x10\x15\x12/\n+SELLER_CONFIRMED_IN_UI_FIAT_PAYMENT_RECEIPT\x10\x16\x12\x1e\n\x1aSELLER_PUBLISHED_PAYOUT_TX\x10\x17\x12\'\n#SELLER_SENT_PAYOUT_TX_PUBLISHED_MSG\x10\x18\x12.\n*SELLER_SAW_ARRIVED_PAYOUT_TX_PUBLISHED_MSG\x10\x19\x12\x34\n0SELLER_STORED_IN_MAILBOX_PAYOUT_TX_PUBLISHED_MSG\x10\x1a\x12.\n*SELLER_SEND_FAILED_PAYOUT_TX_PUBLISHED_MSG\x10\x1b\x12*\n&BUYER_RECEIVED_PAYOUT_TX_PUBLISHED_MSG\x10\x1c\x12\"\n\x1e\x42UYER_SAW_PAYOUT_TX_IN_NETWORK\x10\x1d\x12\x16\n\x12WITHDRAW_COMPLETED\x10\x1e\"\xb3\x01\n\x05Phase\x12\x12\n\x0ePB_ERROR_PHASE\x10\x00\x12\x08\n\x04INIT\x10\x01\x12\x17\n\x13TAKER_FEE_PUBLISHED\x10\x02\x12\x15\n\x11\x44\x45POSIT_PUBLISHED\x10\x03\x12\x15\n\x11\x44\x45POSIT_CONFIRMED\x10\x04\x12\r\n\tFIAT_SENT\x10\x05\x12\x11\n\rFIAT_RECEIVED\x10\x06\x12\x14\n\x10PAYOUT_PUBLISHED\x10\x07\x12\r\n\tWITHDRAWN\x10\x08\"\xa5\x02\n\x0c\x44isputeState\x12\x1a\n\x16PB_ERROR_DISPUTE_STATE\x10\x00\x12\x0e\n\nNO_DISPUTE\x10\x01\x12\x15\n\x11\x44ISPUTE_REQUESTED\x10\x02\x12\x1b\n\x17\x44ISPUTE_STARTED_BY_PEER\x10\x03\x12\x12\n\x0e\x44ISPUTE_CLOSED\x10\x04\x12\x17\n\x13MEDIATION_REQUESTED\x10\x05\x12\x1d\n\x19MEDIATION_STARTED_BY_PEER\x10\x06\x12\x14\n\x10MEDIATION_CLOSED\x10\x07\x12\x14\n\x10REFUND_REQUESTED\x10\x08\x12\"\n\x1eREFUND_REQUEST_STARTED_BY_PEER\x10\t\x12\x19\n\x15REFUND_REQUEST_CLOSED\x10\n\"k\n\x10TradePeriodState\x12\x1f\n\x1bPB_ERROR_TRADE_PERIOD_STATE\x10\x00\x12\x0e\n\nFIRST_HALF\x10\x01\x12\x0f\n\x0bSECOND_HALF\x10\x02\x12\x15\n\x11TRADE_PERIOD_OVER\x10\x03\">\n\x11\x42uyerAsMakerTrade\x12)\n\x05trade\x18\x01 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Trade\">\n\x11\x42uyerAsTakerTrade\x12)\n\x05trade\x18\x01 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Trade\"?\n\x12SellerAsMakerTrade\x12)\n\x05trade\x18\x01 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Trade\"?\n\x12SellerAsTakerTrade\x12)\n\x05trade\x18\x01 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Trade\"\xe2\x03\n\x0c\x42sqSwapTrade\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12)\n\x05offer\x18\x02 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Offer\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x03\x12\x17\n\x0ftake_offer_date\x18\x04 \x01(\x03\x12;\n\x11peer_node_address\x18\x05 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x1b\n\x13mining_fee_per_byte\x18\x06 \x01(\x03\x12\x11\n\tmaker_fee\x18\x07 \x01(\x03\x12\x11\n\ttaker_fee\x18\x08 \x01(\x03\x12J\n\x17\x62sq_swap_protocol_model\x18\t \x01(\x0b\x32).io.bisq.protobuffer.BsqSwapProtocolModel\x12\r\n\x05tx_id\x18\n \x01(\t\x12\x15\n\rerror_message\x18\x0b \x01(\t\x12\x36\n\x05state\x18\x0c \x01(\x0e\x32\'.io.bisq.protobuffer.BsqSwapTrade.State\"G\n\x05State\x12\x12\n\x0ePB_ERROR_STATE\x10\x00\x12\x0f\n\x0bPREPARATION\x10\x01\x12\r\n\tCOMPLETED\x10\x02\x12\n\n\x06\x46\x41ILED\x10\x03\"U\n\x18\x42sqSwapBuyerAsMakerTrade\x12\x39\n\x0e\x62sq_swap_trade\x18\x01 \x01(\x0b\x32!.io.bisq.protobuffer.BsqSwapTrade\"U\n\x18\x42sqSwapBuyerAsTakerTrade\x12\x39\n\x0e\x62sq_swap_trade\x18\x01 \x01(\x0b\x32!.io.bisq.protobuffer.BsqSwapTrade\"V\n\x19\x42sqSwapSellerAsMakerTrade\x12\x39\n\x0e\x62sq_swap_trade\x18\x01 \x01(\x0b\x32!.io.bisq.protobuffer.BsqSwapTrade\"V\n\x19\x42sqSwapSellerAsTakerTrade\x12\x39\n\x0e\x62sq_swap_trade\x18\x01 \x01(\x0b\x32!.io.bisq.protobuffer.BsqSwapTrade\"\xc3\x06\n\x0cProcessModel\x12\x36\n\x0ctrading_peer\x18\x01 \x01(\x0b\x32 .io.bisq.protobuffer.TradingPeer\x12\x10\n\x08offer_id\x18\x02 \x01(\t\x12\x12\n\naccount_id\x18\x03 \x01(\t\x12\x35\n\x0cpub_key_ring\x18\x04 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x1c\n\x14take_offer_fee_tx_id\x18\x05 \x01(\t\x12\x1b\n\x13payout_tx_signature\x18\x06 \x01(\x0c\x12\x1b\n\x13prepared_deposit_tx\x18\t \x01(\x0c\x12H\n\x16raw_transaction_inputs\x18\n \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x1b\n\x13\x63hange_output_value\x18\x0b \x01(\x03\x12\x1d\n\x15\x63hange_output_address\x18\x0c \x01(\t\x12\x1a\n\x12use_savings_wallet\x18\r \x01(\x08\x12&\n\x1e\x66unds_needed_for_trade_as_long\x18\x0e \x01(\x03\x12\x1c\n\x14my_multi_sig_pub_key\x18\x0f \x01(\x0c\x12H\n\x1etemp_trading_peer_node_address\x18\x10 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12%\n\x1dpayment_started_message_state\x18\x11 \x01(\t\x12$\n\x1cmediated_payout_tx_signature\x18\x12 \x01(\x0c\x12*\n\"buyer_payout_amount_from_mediation\x18\x13 \x01(\x03\x12+\n#seller_payout_amount_from_mediation\x18\x14 \x01(\x03\x12<\n\x0fpayment_account\x18\x15 \x01(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\x12$\n\x1c\x62urning_man_selection_height\x18\x16 \x01(\x05J\x04\x08\x07\x10\x08J\x04\x08\x08\x10\t\"\xdd\x04\n\x0bTradingPeer\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12K\n\x17payment_account_payload\x18\x02 \x01(\x0b\x32*.io.bisq.protobuffer.PaymentAccountPayload\x12\x1d\n\x15payout_address_string\x18\x03 \x01(\t\x12\x18\n\x10\x63ontract_as_json\x18\x04 \x01(\t\x12\x1a\n\x12\x63ontract_signature\x18\x05 \x01(\t\x12\x11\n\tsignature\x18\x06 \x01(\x0c\x12\x35\n\x0cpub_key_ring\x18\x07 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x19\n\x11multi_sig_pub_key\x18\x08 \x01(\x0c\x12H\n\x16raw_transaction_inputs\x18\t \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x1b\n\x13\x63hange_output_value\x18\n \x01(\x03\x12\x1d\n\x15\x63hange_output_address\x18\x0b \x01(\t\x12!\n\x19\x61\x63\x63ount_age_witness_nonce\x18\x0c \x01(\x0c\x12%\n\x1d\x61\x63\x63ount_age_witness_signature\x18\r \x01(\x0c\x12\x14\n\x0c\x63urrent_date\x18\x0e \x01(\x03\x12$\n\x1cmediated_payout_tx_signature\x18\x0f \x01(\x0c\x12\'\n\x1fhash_of_payment_account_payload\x18\x10 \x01(\x0c\"\xa8\x02\n\x14\x42sqSwapProtocolModel\x12\x39\n\ntrade_peer\x18\x01 \x01(\x0b\x32%.io.bisq.protobuffer.BsqSwapTradePeer\x12\x35\n\x0cpub_key_ring\x18\x02 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x13\n\x0b\x62tc_address\x18\x03 \x01(\t\x12\x13\n\x0b\x62sq_address\x18\x04 \x01(\t\x12\x38\n\x06inputs\x18\x05 \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x0e\n\x06\x63hange\x18\x06 \x01(\x03\x12\x0e\n\x06payout\x18\x07 \x01(\x03\x12\n\n\x02tx\x18\x08 \x01(\x0c\x12\x0e\n\x06tx_fee\x18\t \x01(\x03\"\xd9\x01\n\x10\x42sqSwapTradePeer\x12\x35\n\x0cpub_key_ring\x18\x01 \x01(\x0b\x32\x1f.io.bisq.protobuffer.PubKeyRing\x12\x13\n\x0b\x62tc_address\x18\x02 \x01(\t\x12\x13\n\x0b\x62sq_address\x18\x03 \x01(\t\x12\x38\n\x06inputs\x18\x04 \x03(\x0b\x32(.io.bisq.protobuffer.RawTransactionInput\x12\x0e\n\x06\x63hange\x18\x05 \x01(\x03\x12\x0e\n\x06payout\x18\x06 \x01(\x03\x12\n\n\x02tx\x18\x07 \x01(\x0c\"G\n\x16\x41rbitrationDisputeList\x12-\n\x07\x64ispute\x18\x01 \x03(\x0b\x32\x1c.io.bisq.protobuffer.Dispute\"E\n\x14MediationDisputeList\x12-\n\x07\x64ispute\x18\x01 \x03(\x0b\x32\x1c.io.bisq.protobuffer.Dispute\"B\n\x11RefundDisputeList\x12-\n\x07\x64ispute\x18\x01 \x03(\x0b\x32\x1c.io.bisq.protobuffer.Dispute\"\x85\x18\n\x12PreferencesPayload\x12\x15\n\ruser_language\x18\x01 \x01(\t\x12\x32\n\x0cuser_country\x18\x02 \x01(\x0b\x32\x1c.io.bisq.protobuffer.Country\x12;\n\x0f\x66iat_currencies\x18\x03 \x03(\x0b\x32\".io.bisq.protobuffer.TradeCurrency\x12=\n\x11\x63rypto_currencies\x18\x04 \x03(\x0b\x32\".io.bisq.protobuffer.TradeCurrency\x12N\n\x1d\x62lock_chain_explorer_main_net\x18\x05 \x01(\x0b\x32\'.io.bisq.protobuffer.BlockChainExplorer\x12N\n\x1d\x62lock_chain_explorer_test_net\x18\x06 \x01(\x0b\x32\'.io.bisq.protobuffer.BlockChainExplorer\x12I\n\x18\x62sq_block_chain_explorer\x18\x07 \x01(\x0b\x32\'.io.bisq.protobuffer.BlockChainExplorer\x12\x18\n\x10\x62\x61\x63kup_directory\x18\x08 \x01(\t\x12\x1f\n\x17\x61uto_select_arbitrators\x18\t \x01(\x08\x12Z\n\x13\x64ont_show_again_map\x18\n \x03(\x0b\x32=.io.bisq.protobuffer.PreferencesPayload.DontShowAgainMapEntry\x12\x14\n\x0ctac_accepted\x18\x0b \x01(\x08\x12\x1d\n\x15use_tor_for_bitcoin_j\x18\x0c \x01(\x08\x12%\n\x1dshow_own_offers_in_offer_book\x18\r \x01(\x08\x12\x44\n\x18preferred_trade_currency\x18\x0e \x01(\x0b\x32\".io.bisq.protobuffer.TradeCurrency\x12#\n\x1bwithdrawal_tx_fee_in_vbytes\x18\x0f \x01(\x03\x12$\n\x1cuse_custom_withdrawal_tx_fee\x18\x10 \x01(\x08\x12%\n\x1dmax_price_distance_in_percent\x18\x11 \x01(\x01\x12-\n%offer_book_chart_screen_currency_code\x18\x12 \x01(\t\x12)\n!trade_charts_screen_currency_code\x18\x13 \x01(\t\x12 \n\x18\x62uy_screen_currency_code\x18\x14 \x01(\t\x12!\n\x19sell_screen_currency_code\x18\x15 \x01(\t\x12(\n trade_statistics_tick_unit_index\x18\x16 \x01(\x05\x12\x1c\n\x14resync_spv_requested\x18\x17 \x01(\x08\x12*\n\"sort_market_currencies_numerically\x18\x18 \x01(\x08\x12\"\n\x1ause_percentage_based_price\x18\x19 \x01(\x08\x12\x39\n\x0cpeer_tag_map\x18\x1a \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\x12\x15\n\rbitcoin_nodes\x18\x1b \x01(\t\x12\x1b\n\x13ignore_traders_list\x18\x1c \x03(\t\x12\x1e\n\x16\x64irectory_chooser_path\x18\x1d \x01(\t\x12*\n\x1e\x62uyer_security_deposit_as_long\x18\x1e \x01(\x03\x42\x02\x18\x01\x12\x16\n\x0euse_animations\x18\x1f \x01(\x08\x12Z\n)selected_payment_account_for_create_offer\x18  \x01(\x0b\x32#.io.bisq.protobuffer.PaymentAccountB\x02\x18\x01\x12\x16\n\x0epay_fee_in_btc\x18! \x01(\x08\x12\x18\n\x10\x62ridge_addresses\x18\" \x03(\t\x12\x1d\n\x15\x62ridge_option_ordinal\x18# \x01(\x05\x12\x1d\n\x15tor_transport_ordinal\x18$ \x01(\x05\x12\x16\n\x0e\x63ustom_bridges\x18% \x01(\t\x12$\n\x1c\x62itcoin_nodes_option_ordinal\x18& \x01(\x05\x12\x13\n\x0breferral_id\x18\' \x01(\t\x12\x1b\n\x13phone_key_and_token\x18( \x01(\t\x12*\n\"use_sound_for_mobile_notifications\x18) \x01(\x08\x12\x1f\n\x17use_trade_notifications\x18* \x01(\x08\x12 \n\x18use_market_notifications\x18+ \x01(\x08\x12\x1f\n\x17use_price_notifications\x18, \x01(\x08\x12\x18\n\x10use_standby_mode\x18- \x01(\x08\x12\x18\n\x10is_dao_full_node\x18. \x01(\x08\x12\x10\n\x08rpc_user\x18/ \x01(\t\x12\x0e\n\x06rpc_pw\x18\x30 \x01(\t\x12.\n&take_offer_selected_payment_account_id\x18\x31 \x01(\t\x12)\n!buyer_security_deposit_as_percent\x18\x32 \x01(\x01\x12\x1d\n\x15ignore_dust_threshold\x18\x33 \x01(\x05\x12\x34\n,buyer_security_deposit_as_percent_for_crypto\x18\x34 \x01(\x01\x12\x19\n\x11\x62lock_notify_port\x18\x35 \x01(\x05\x12\x11\n\tcss_theme\x18\x36 \x01(\x05\x12\x19\n\x11tac_accepted_v120\x18\x37 \x01(\x08\x12G\n\x15\x61uto_confirm_settings\x18\x38 \x03(\x0b\x32(.io.bisq.protobuffer.AutoConfirmSettings\x12\"\n\x1a\x62sq_average_trim_threshold\x18\x39 \x01(\x01\x12(\n hide_non_account_payment_methods\x18: \x01(\x08\x12(\n show_offers_matching_my_accounts\x18; \x01(\x08\x12\x16\n\x0e\x64\x65ny_api_taker\x18< \x01(\x08\x12\x1d\n\x15notify_on_pre_release\x18= \x01(\x08\x12!\n\x19use_full_mode_dao_monitor\x18> \x01(\x08\x12\x1d\n\x15\x63lear_data_after_days\x18? \x01(\x05\x12\'\n\x1f\x62uy_screen_crypto_currency_code\x18@ \x01(\t\x12(\n sell_screen_crypto_currency_code\x18\x41 \x01(\t\x12$\n\x1cuse_bitcoin_uris_in_qr_codes\x18\x42 \x01(\x08\x12 \n\x18user_defined_trade_limit\x18\x43 \x01(\x03\x12#\n\x1buser_has_raised_trade_limit\x18\x44 \x01(\x08\x12+\n#process_burning_man_accounting_data\x18\x45 \x01(\x08\x12#\n\x1bis_full_b_m_accounting_node\x18\x46 \x01(\x08\x12\x1f\n\x17use_bisq_wallet_funding\x18G \x01(\x08\x12\x33\n\x06\x63ookie\x18H \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\x12\x30\n(preferred_create_offer_payment_method_id\x18I \x01(\t\x12.\n&preferred_take_offer_payment_method_id\x18J \x01(\t\x12\x30\n(create_offer_selected_payment_account_id\x18K \x01(\t\x1a\x37\n\x15\x44ontShowAgainMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x08:\x02\x38\x01\"\x8d\x01\n\x13\x41utoConfirmSettings\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x1e\n\x16required_confirmations\x18\x02 \x01(\x05\x12\x13\n\x0btrade_limit\x18\x03 \x01(\x03\x12\x19\n\x11service_addresses\x18\x04 \x03(\t\x12\x15\n\rcurrency_code\x18\x05 \x01(\t\"\xf8\x07\n\x0bUserPayload\x12\x12\n\naccount_id\x18\x01 \x01(\t\x12=\n\x10payment_accounts\x18\x02 \x03(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\x12\x44\n\x17\x63urrent_payment_account\x18\x03 \x01(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\x12&\n\x1e\x61\x63\x63\x65pted_language_locale_codes\x18\x04 \x03(\t\x12\x34\n\x10\x64\x65velopers_alert\x18\x05 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Alert\x12\x33\n\x0f\x64isplayed_alert\x18\x06 \x01(\x0b\x32\x1a.io.bisq.protobuffer.Alert\x12\x36\n\x11\x64\x65velopers_filter\x18\x07 \x01(\x0b\x32\x1b.io.bisq.protobuffer.Filter\x12=\n\x14\x61\x63\x63\x65pted_arbitrators\x18\x08 \x03(\x0b\x32\x1f.io.bisq.protobuffer.Arbitrator\x12\x39\n\x12\x61\x63\x63\x65pted_mediators\x18\t \x03(\x0b\x32\x1d.io.bisq.protobuffer.Mediator\x12>\n\x15registered_arbitrator\x18\n \x01(\x0b\x32\x1f.io.bisq.protobuffer.Arbitrator\x12:\n\x13registered_mediator\x18\x0b \x01(\x0b\x32\x1d.io.bisq.protobuffer.Mediator\x12\x41\n\x12price_alert_filter\x18\x0c \x01(\x0b\x32%.io.bisq.protobuffer.PriceAlertFilter\x12\x44\n\x14market_alert_filters\x18\r \x03(\x0b\x32&.io.bisq.protobuffer.MarketAlertFilter\x12@\n\x16\x61\x63\x63\x65pted_refund_agents\x18\x0e \x03(\x0b\x32 .io.bisq.protobuffer.RefundAgent\x12\x41\n\x17registered_refund_agent\x18\x0f \x01(\x0b\x32 .io.bisq.protobuffer.RefundAgent\x12\x37\n\x06\x63ookie\x18\x10 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntryB\x02\x18\x01\x12H\n\x17sub_account_map_entries\x18\x11 \x03(\x0b\x32\'.io.bisq.protobuffer.SubAccountMapEntry\"U\n\x12SubAccountMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x32\n\x05value\x18\x02 \x03(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\"1\n\x12\x41\x63\x63ountingTxOutput\x12\r\n\x05value\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\"o\n\x0c\x41\x63\x63ountingTx\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x38\n\x07outputs\x18\x02 \x03(\x0b\x32\'.io.bisq.protobuffer.AccountingTxOutput\x12\x17\n\x0ftruncated_tx_id\x18\x03 \x01(\x0c\"\xa5\x01\n\x0f\x41\x63\x63ountingBlock\x12\x0e\n\x06height\x18\x01 \x01(\r\x12\x13\n\x0btime_in_sec\x18\x02 \x01(\r\x12\x16\n\x0etruncated_hash\x18\x03 \x01(\x0c\x12%\n\x1dtruncated_previous_block_hash\x18\x04 \x01(\x0c\x12.\n\x03txs\x18\x05 \x03(\x0b\x32!.io.bisq.protobuffer.AccountingTx\"\xba\x01\n\x19\x42urningManAccountingStore\x12\x34\n\x06\x62locks\x18\x01 \x03(\x0b\x32$.io.bisq.protobuffer.AccountingBlock\x12\x1a\n\x12journal_generation\x18\x64 \x01(\x05\x12K\n\x17received_btc_aggregates\x18\x65 \x01(\x0b\x32*.io.bisq.protobuffer.ReceivedBtcAggregates\"V\n\x15ReceivedBtcAggregates\x12=\n\naggregates\x18\x01 \x03(\x0b\x32).io.bisq.protobuffer.ReceivedBtcAggregate\"b\n\x14ReceivedBtcAggregate\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05month\x18\x02 \x01(\x05\x12\x0c\n\x04type\x18\x03 \x01(\r\x12\x0f\n\x07\x61mounts\x18\x04 \x03(\x03\x12\x0e\n\x06\x63ounts\x18\x05 \x03(\x05\"\xa5\x01\n\x1aGetAccountingBlocksRequest\x12\x19\n\x11\x66rom_block_height\x18\x01 \x01(\x05\x12\r\n\x05nonce\x18\x02 \x01(\x05\x12=\n\x13sender_node_address\x18\x03 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x1e\n\x16supported_capabilities\x18\x04 \x03(\x05\"\x8e\x01\n\x1bGetAccountingBlocksResponse\x12\x34\n\x06\x62locks\x18\x01 \x03(\x0b\x32$.io.bisq.protobuffer.AccountingBlock\x12\x15\n\rrequest_nonce\x18\x02 \x01(\x05\x12\x0f\n\x07pub_key\x18\x03 \x01(\t\x12\x11\n\tsignature\x18\x04 \x01(\x0c\"}\n\"NewAccountingBlockBroadcastMessage\x12\x33\n\x05\x62lock\x18\x01 \x01(\x0b\x32$.io.bisq.protobuffer.AccountingBlock\x12\x0f\n\x07pub_key\x18\x02 \x01(\t\x12\x11\n\tsignature\x18\x03 \x01(\x0c\"\xc0\x01\n\tBaseBlock\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\x0c\n\x04time\x18\x02 \x01(\x03\x12\x0c\n\x04hash\x18\x03 \x01(\t\x12\x1b\n\x13previous_block_hash\x18\x04 \x01(\t\x12\x32\n\traw_block\x18\x05 \x01(\x0b\x32\x1d.io.bisq.protobuffer.RawBlockH\x00\x12+\n\x05\x62lock\x18\x06 \x01(\x0b\x32\x1a.io.bisq.protobuffer.BlockH\x00\x42\t\n\x07message\"?\n\rBsqBlockStore\x12.\n\x06\x62locks\x18\x01 \x03(\x0b\x32\x1e.io.bisq.protobuffer.BaseBlock\"8\n\x08RawBlock\x12,\n\x07raw_txs\x18\x01 \x03(\x0b\x32\x1b.io.bisq.protobuffer.BaseTx\"1\n\x05\x42lock\x12(\n\x03txs\x18\x01 \x03(\x0b\x32\x1b.io.bisq.protobuffer.BaseTx\"\xf1\x01\n\x06\x42\x61seTx\x12\x12\n\ntx_version\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12\x14\n\x0c\x62lock_height\x18\x03 \x01(\x05\x12\x12\n\nblock_hash\x18\x04 \x01(\t\x12\x0c\n\x04time\x18\x05 \x01(\x03\x12/\n\ttx_inputs\x18\x06 \x03(\x0b\x32\x1c.io.bisq.protobuffer.TxInput\x12,\n\x06raw_tx\x18\x07 \x01(\x0b\x32\x1a.io.bisq.protobuffer.RawTxH\x00\x12%\n\x02tx\x18\x08 \x01(\x0b\x32\x17.io.bisq.protobuffer.TxH\x00\x42\t\n\x07message\"B\n\x05RawTx\x12\x39\n\x0eraw_tx_outputs\x18\x01 \x03(\x0b\x32!.io.bisq.protobuffer.BaseTxOutput\"|\n\x02Tx\x12\x35\n\ntx_outputs\x18\x01 \x03(\x0b\x32!.io.bisq.protobuffer.BaseTxOutput\x12,\n\x07tx_type\x18\x02 \x01(\x0e\x32\x1b.io.bisq.protobuffer.TxType\x12\x11\n\tburnt_bsq\x18\x03 \x01(\x03\"`\n\x07TxInput\x12!\n\x19\x63onnected_tx_output_tx_id\x18\x01 \x01(\t\x12!\n\x19\x63onnected_tx_output_index\x18\x02 \x01(\x05\x12\x0f\n\x07pub_key\x18\x03 \x01(\t\"\xaf\x02\n\x0c\x42\x61seTxOutput\x12\r\n\x05index\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\x03\x12\r\n\x05tx_id\x18\x03 \x01(\t\x12\x39\n\x0epub_key_script\x18\x04 \x01(\x0b\x32!.io.bisq.protobuffer.PubKeyScript\x12\x0f\n\x07\x61\x64\x64ress\x18\x05 \x01(\t\x12\x16\n\x0eop_return_data\x18\x06 \x01(\x0c\x12\x14\n\x0c\x62lock_height\x18\x07 \x01(\x05\x12\x39\n\rraw_tx_output\x18\x08 \x01(\x0b\x32 .io.bisq.protobuffer.RawTxOutputH\x00\x12\x32\n\ttx_output\x18\t \x01(\x0b\x32\x1d.io.bisq.protobuffer.TxOutputH\x00\x42\t\n\x07message\"B\n\x13UnconfirmedTxOutput\x12\r\n\x05index\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\x03\x12\r\n\x05tx_id\x18\x03 \x01(\t\"\r\n\x0bRawTxOutput\"u\n\x08TxOutput\x12\x39\n\x0etx_output_type\x18\x01 \x01(\x0e\x32!.io.bisq.protobuffer.TxOutputType\x12\x11\n\tlock_time\x18\x02 \x01(\x05\x12\x1b\n\x13unlock_block_height\x18\x03 \x01(\x05\"E\n\tSpentInfo\x12\x14\n\x0c\x62lock_height\x18\x01 \x01(\x03\x12\r\n\x05tx_id\x18\x02 \x01(\t\x12\x13\n\x0binput_index\x18\x03 \x01(\x05\"\x83\x01\n\x0cPubKeyScript\x12\x10\n\x08req_sigs\x18\x01 \x01(\x05\x12\x34\n\x0bscript_type\x18\x02 \x01(\x0e\x32\x1f.io.bisq.protobuffer.ScriptType\x12\x11\n\taddresses\x18\x03 \x03(\t\x12\x0b\n\x03\x61sm\x18\x04 \x01(\t\x12\x0b\n\x03hex\x18\x05 \x01(\t\"3\n\x08\x44\x61oPhase\x12\x15\n\rphase_ordinal\x18\x01 \x01(\x05\x12\x10\n\x08\x64uration\x18\x02 \x01(\x05\"X\n\x05\x43ycle\x12\x1d\n\x15height_of_first_block\x18\x01 \x01(\x05\x12\x30\n\tdao_phase\x18\x02 \x03(\x0b\x32\x1d.io.bisq.protobuffer.DaoPhase\"U\n\x14\x42\x61seTxOutputMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x30\n\x05value\x18\x02 \x01(\x0b\x32!.io.bisq.protobuffer.BaseTxOutput\"M\n\x10IssuanceMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12,\n\x05value\x18\x02 \x01(\x0b\x32\x1d.io.bisq.protobuffer.Issuance\"O\n\x11SpentInfoMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x1e.io.bisq.protobuffer.SpentInfo\"\xe2\x04\n\x08\x44\x61oState\x12\x14\n\x0c\x63hain_height\x18\x01 \x01(\x05\x12.\n\x06\x62locks\x18\x02 \x03(\x0b\x32\x1e.io.bisq.protobuffer.BaseBlock\x12*\n\x06\x63ycles\x18\x03 \x03(\x0b\x32\x1a.io.bisq.protobuffer.Cycle\x12P\n\x1dunspent_tx_output_map_entries\x18\x04 \x03(\x0b\x32).io.bisq.protobuffer.BaseTxOutputMapEntry\x12\x43\n\x14issuance_map_entries\x18\x05 \x03(\x0b\x32%.io.bisq.protobuffer.IssuanceMapEntry\x12\"\n\x1a\x63onfiscated_lockup_tx_list\x18\x06 \x03(\t\x12\x46\n\x16spent_info_map_entries\x18\x07 \x03(\x0b\x32&.io.bisq.protobuffer.SpentInfoMapEntry\x12;\n\x11param_change_list\x18\x08 \x03(\x0b\x32 .io.bisq.protobuffer.ParamChange\x12G\n\x17\x65valuated_proposal_list\x18\t \x03(\x0b\x32&.io.bisq.protobuffer.EvaluatedProposal\x12[\n\"decrypted_ballots_with_merits_list\x18\n \x03(\x0b\x32/.io.bisq.protobuffer.DecryptedBallotsWithMerits\"g\n\x08Issuance\x12\r\n\x05tx_id\x18\x01 \x01(\t\x12\x14\n\x0c\x63hain_height\x18\x02 \x01(\x05\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x03\x12\x0f\n\x07pub_key\x18\x04 \x01(\t\x12\x15\n\rissuance_type\x18\x05 \x01(\t\"\xa0\x05\n\x08Proposal\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04link\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\r\x12\x15\n\rcreation_date\x18\x04 \x01(\x03\x12\r\n\x05tx_id\x18\x05 \x01(\t\x12J\n\x15\x63ompensation_proposal\x18\x06 \x01(\x0b\x32).io.bisq.protobuffer.CompensationProposalH\x00\x12L\n\x16reimbursement_proposal\x18\x07 \x01(\x0b\x32*.io.bisq.protobuffer.ReimbursementProposalH\x00\x12I\n\x15\x63hange_param_proposal\x18\x08 \x01(\x0b\x32(.io.bisq.protobuffer.ChangeParamProposalH\x00\x12:\n\rrole_proposal\x18\t \x01(\x0b\x32!.io.bisq.protobuffer.RoleProposalH\x00\x12O\n\x18\x63onfiscate_bond_proposal\x18\n \x01(\x0b\x32+.io.bisq.protobuffer.ConfiscateBondProposalH\x00\x12@\n\x10generic_proposal\x18\x0b \x01(\x0b\x32$.io.bisq.protobuffer.GenericProposalH\x00\x12I\n\x15remove_asset_proposal\x18\x0c \x01(\x0b\x32(.io.bisq.protobuffer.RemoveAssetProposalH\x00\x12\x37\n\nextra_data\x18\x14 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntryB\t\n\x07message\"B\n\x14\x43ompensationProposal\x12\x15\n\rrequested_bsq\x18\x01 \x01(\x03\x12\x13\n\x0b\x62sq_address\x18\x02 \x01(\t\"C\n\x15ReimbursementProposal\x12\x15\n\rrequested_bsq\x18\x01 \x01(\x03\x12\x13\n\x0b\x62sq_address\x18\x02 \x01(\t\"9\n\x13\x43hangeParamProposal\x12\r\n\x05param\x18\x01 \x01(\t\x12\x13\n\x0bparam_value\x18\x02 \x01(\t\"h\n\x0cRoleProposal\x12\'\n\x04role\x18\x01 \x01(\x0b\x32\x19.io.bisq.protobuffer.Role\x12\x1a\n\x12required_bond_unit\x18\x02 \x01(\x03\x12\x13\n\x0bunlock_time\x18\x03 \x01(\x05\".\n\x16\x43onfiscateBondProposal\x12\x14\n\x0clockup_tx_id\x18\x01 \x01(\t\"\x11\n\x0fGenericProposal\",\n\x13RemoveAssetProposal\x12\x15\n\rticker_symbol\x18\x01 \x01(\t\"I\n\x04Role\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04link\x18\x03 \x01(\t\x12\x18\n\x10\x62onded_role_type\x18\x04 \x01(\t\")\n\x0cMyReputation\x12\x0b\n\x03uid\x18\x01 \x01(\t\x12\x0c\n\x04salt\x18\x02 \x01(\x0c\"L\n\x10MyReputationList\x12\x38\n\rmy_reputation\x18\x01 \x03(\x0b\x32!.io.bisq.protobuffer.MyReputation\"1\n\rMyProofOfBurn\x12\r\n\x05tx_id\x18\x01 \x01(\t\x12\x11\n\tpre_image\x18\x02 \x01(\t\"Q\n\x11MyProofOfBurnList\x12<\n\x10my_proof_of_burn\x18\x01 \x03(\x0b\x32\".io.bisq.protobuffer.MyProofOfBurn\"i\n\x1eUnconfirmedBsqChangeOutputList\x12G\n\x15unconfirmed_tx_output\x18\x01 \x03(\x0b\x32(.io.bisq.protobuffer.UnconfirmedTxOutput\"\x9e\x01\n\x13TempProposalPayload\x12/\n\x08proposal\x18\x01 \x01(\x0b\x32\x1d.io.bisq.protobuffer.Proposal\x12\x1d\n\x15owner_pub_key_encoded\x18\x02 \x01(\x0c\x12\x37\n\nextra_data\x18\x03 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"P\n\x0fProposalPayload\x12/\n\x08proposal\x18\x01 \x01(\x0b\x32\x1d.io.bisq.protobuffer.Proposal\x12\x0c\n\x04hash\x18\x02 \x01(\x0c\"D\n\rProposalStore\x12\x33\n\x05items\x18\x01 \x03(\x0b\x32$.io.bisq.protobuffer.ProposalPayload\"N\n\x11TempProposalStore\x12\x39\n\x05items\x18\x01 \x03(\x0b\x32*.io.bisq.protobuffer.ProtectedStorageEntry\"b\n\x06\x42\x61llot\x12/\n\x08proposal\x18\x01 \x01(\x0b\x32\x1d.io.bisq.protobuffer.Proposal\x12\'\n\x04vote\x18\x02 \x01(\x0b\x32\x19.io.bisq.protobuffer.Vote\"A\n\x0eMyProposalList\x12/\n\x08proposal\x18\x01 \x03(\x0b\x32\x1d.io.bisq.protobuffer.Proposal\"9\n\nBallotList\x12+\n\x06\x62\x61llot\x18\x01 \x03(\x0b\x32\x1b.io.bisq.protobuffer.Ballot\"Q\n\x0bParamChange\x12\x12\n\nparam_name\x18\x01 \x01(\t\x12\x13\n\x0bparam_value\x18\x02 \x01(\t\x12\x19\n\x11\x61\x63tivation_height\x18\x03 \x01(\x05\"&\n\x0e\x43onfiscateBond\x12\x14\n\x0clockup_tx_id\x18\x01 \x01(\t\"\xc2\x01\n\x06MyVote\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\x34\n\x0b\x62\x61llot_list\x18\x02 \x01(\x0b\x32\x1f.io.bisq.protobuffer.BallotList\x12\x1a\n\x12secret_key_encoded\x18\x03 \x01(\x0c\x12\x32\n\nblind_vote\x18\x04 \x01(\x0b\x32\x1e.io.bisq.protobuffer.BlindVote\x12\x0c\n\x04\x64\x61te\x18\x05 \x01(\x03\x12\x14\n\x0creveal_tx_id\x18\x06 \x01(\t\":\n\nMyVoteList\x12,\n\x07my_vote\x18\x01 \x03(\x0b\x32\x1b.io.bisq.protobuffer.MyVote\"W\n\x14VoteWithProposalTxId\x12\x16\n\x0eproposal_tx_id\x18\x01 \x01(\t\x12\'\n\x04vote\x18\x02 \x01(\x0b\x32\x19.io.bisq.protobuffer.Vote\"S\n\x18VoteWithProposalTxIdList\x12\x37\n\x04item\x18\x01 \x03(\x0b\x32).io.bisq.protobuffer.VoteWithProposalTxId\"\xa7\x01\n\tBlindVote\x12\x17\n\x0f\x65ncrypted_votes\x18\x01 \x01(\x0c\x12\r\n\x05tx_id\x18\x02 \x01(\t\x12\r\n\x05stake\x18\x03 \x01(\x03\x12\x1c\n\x14\x65ncrypted_merit_list\x18\x04 \x01(\x0c\x12\x0c\n\x04\x64\x61te\x18\x05 \x01(\x03\x12\x37\n\nextra_data\x18\x06 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"E\n\x0fMyBlindVoteList\x12\x32\n\nblind_vote\x18\x01 \x03(\x0b\x32\x1e.io.bisq.protobuffer.BlindVote\"F\n\x0e\x42lindVoteStore\x12\x34\n\x05items\x18\x01 \x03(\x0b\x32%.io.bisq.protobuffer.BlindVotePayload\"T\n\x10\x42lindVotePayload\x12\x32\n\nblind_vote\x18\x01 \x01(\x0b\x32\x1e.io.bisq.protobuffer.BlindVote\x12\x0c\n\x04hash\x18\x02 \x01(\x0c\"\x18\n\x04Vote\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x01 \x01(\x08\"K\n\x05Merit\x12/\n\x08issuance\x18\x01 \x01(\x0b\x32\x1d.io.bisq.protobuffer.Issuance\x12\x11\n\tsignature\x18\x02 \x01(\x0c\"6\n\tMeritList\x12)\n\x05merit\x18\x01 \x03(\x0b\x32\x1a.io.bisq.protobuffer.Merit\"\xda\x01\n\x12ProposalVoteResult\x12/\n\x08proposal\x18\x01 \x01(\x0b\x32\x1d.io.bisq.protobuffer.Proposal\x12\x1f\n\x17stake_of_accepted_votes\x18\x02 \x01(\x03\x12\x1f\n\x17stake_of_rejected_votes\x18\x03 \x01(\x03\x12\x1a\n\x12num_accepted_votes\x18\x04 \x01(\x05\x12\x1a\n\x12num_rejected_votes\x18\x05 \x01(\x05\x12\x19\n\x11num_ignored_votes\x18\x06 \x01(\x05\"o\n\x11\x45valuatedProposal\x12\x13\n\x0bis_accepted\x18\x01 \x01(\x08\x12\x45\n\x14proposal_vote_result\x18\x02 \x01(\x0b\x32\'.io.bisq.protobuffer.ProposalVoteResult\"\xeb\x01\n\x1a\x44\x65\x63ryptedBallotsWithMerits\x12\x1f\n\x17hash_of_blind_vote_list\x18\x01 \x01(\x0c\x12\x18\n\x10\x62lind_vote_tx_id\x18\x02 \x01(\t\x12\x19\n\x11vote_reveal_tx_id\x18\x03 \x01(\t\x12\r\n\x05stake\x18\x04 \x01(\x03\x12\x34\n\x0b\x62\x61llot_list\x18\x05 \x01(\x0b\x32\x1f.io.bisq.protobuffer.BallotList\x12\x32\n\nmerit_list\x18\x06 \x01(\x0b\x32\x1e.io.bisq.protobuffer.MeritList\"\xc0\x01\n\rDaoStateStore\x12\x30\n\tdao_state\x18\x01 \x01(\x0b\x32\x1d.io.bisq.protobuffer.DaoState\x12\x39\n\x0e\x64\x61o_state_hash\x18\x02 \x03(\x0b\x32!.io.bisq.protobuffer.DaoStateHash\x12\x42\n\x0esnapshot_index\x18\x64 \x01(\x0b\x32*.io.bisq.protobuffer.DaoStateSnapshotIndex\"\xe7\x01\n\x15\x44\x61oStateSnapshotIndex\x12\x14\n\x0c\x63hain_height\x18\x01 \x01(\x05\x12>\n\x13tail_dao_state_hash\x18\x02 \x01(\x0b\x32!.io.bisq.protobuffer.DaoStateHash\x12%\n\x1dsorted_unspent_tx_output_keys\x18\x03 \x03(\t\x12Q\n\x1ctx_output_type_index_entries\x18\x04 \x03(\x0b\x32+.io.bisq.protobuffer.TxOutputTypeIndexEntry\"k\n\x16TxOutputTypeIndexEntry\x12\x39\n\x0etx_output_type\x18\x01 \x01(\x0e\x32!.io.bisq.protobuffer.TxOutputType\x12\x16\n\x0etx_output_keys\x18\x02 \x03(\t\"\\\n\x0c\x44\x61oStateHash\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\x0c\n\x04hash\x18\x02 \x01(\x0c\x12\x15\n\tprev_hash\x18\x03 \x01(\x0c\x42\x02\x18\x01\x12\x17\n\x0fis_self_created\x18\x04 \x01(\x08\"_\n\x11ProposalStateHash\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\x0c\n\x04hash\x18\x02 \x01(\x0c\x12\x15\n\tprev_hash\x18\x03 \x01(\x0c\x42\x02\x18\x01\x12\x15\n\rnum_proposals\x18\x04 \x01(\x05\"b\n\x12\x42lindVoteStateHash\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\x0c\n\x04hash\x18\x02 \x01(\x0c\x12\x15\n\tprev_hash\x18\x03 \x01(\x0c\x42\x02\x18\x01\x12\x17\n\x0fnum_blind_votes\x18\x04 \x01(\x05\"G\n\x12\x42lockChainExplorer\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06tx_url\x18\x02 \x01(\t\x12\x13\n\x0b\x61\x64\x64ress_url\x18\x03 \x01(\t\"\x8e\x03\n\x0ePaymentAccount\x12\n\n\x02id\x18\x01 \x01(\t\x12\x15\n\rcreation_date\x18\x02 \x01(\x03\x12:\n\x0epayment_method\x18\x03 \x01(\x0b\x32\".io.bisq.protobuffer.PaymentMethod\x12\x14\n\x0c\x61\x63\x63ount_name\x18\x04 \x01(\t\x12<\n\x10trade_currencies\x18\x05 \x03(\x0b\x32\".io.bisq.protobuffer.TradeCurrency\x12\x43\n\x17selected_trade_currency\x18\x06 \x01(\x0b\x32\".io.bisq.protobuffer.TradeCurrency\x12K\n\x17payment_account_payload\x18\x07 \x01(\x0b\x32*.io.bisq.protobuffer.PaymentAccountPayload\x12\x37\n\nextra_data\x18\x08 \x03(\x0b\x32#.io.bisq.protobuffer.StringMapEntry\"N\n\rPaymentMethod\x12\n\n\x02id\x18\x01 \x01(\t\x12\x18\n\x10max_trade_period\x18\x02 \x01(\x03\x12\x17\n\x0fmax_trade_limit\x18\x03 \x01(\x03\"!\n\x08\x43urrency\x12\x15\n\rcurrency_code\x18\x01 \x01(\t\"\xb2\x01\n\rTradeCurrency\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12>\n\x0f\x63rypto_currency\x18\x03 \x01(\x0b\x32#.io.bisq.protobuffer.CryptoCurrencyH\x00\x12:\n\rfiat_currency\x18\x04 \x01(\x0b\x32!.io.bisq.protobuffer.FiatCurrencyH\x00\x42\t\n\x07message\"\"\n\x0e\x43ryptoCurrency\x12\x10\n\x08is_asset\x18\x01 \x01(\x08\"?\n\x0c\x46iatCurrency\x12/\n\x08\x63urrency\x18\x01 \x01(\x0b\x32\x1d.io.bisq.protobuffer.Currency\"R\n\x07\x43ountry\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12+\n\x06region\x18\x03 \x01(\x0b\x32\x1b.io.bisq.protobuffer.Region\"$\n\x06Region\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"D\n\x10PriceAlertFilter\x12\x15\n\rcurrency_code\x18\x01 \x01(\t\x12\x0c\n\x04high\x18\x02 \x01(\x03\x12\x0b\n\x03low\x18\x03 \x01(\x03\"\x91\x01\n\x11MarketAlertFilter\x12<\n\x0fpayment_account\x18\x01 \x01(\x0b\x32#.io.bisq.protobuffer.PaymentAccount\x12\x15\n\rtrigger_value\x18\x02 \x01(\x05\x12\x14\n\x0cis_buy_offer\x18\x03 \x01(\x08\x12\x11\n\talert_ids\x18\x04 \x03(\t\"q\n\x12MockMailboxPayload\x12\x0f\n\x07message\x18\x01 \x01(\t\x12=\n\x13sender_node_address\x18\x02 \x01(\x0b\x32 .io.bisq.protobuffer.NodeAddress\x12\x0b\n\x03uid\x18\x03 \x01(\t\"7\n\x0bMockPayload\x12\x17\n\x0fmessage_version\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\xb4\x02\n\rReportingItem\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05group\x18\x02 \x01(\t\x12T\n\x1bstring_value_reporting_item\x18\x03 \x01(\x0b\x32-.io.bisq.protobuffer.StringValueReportingItemH\x00\x12P\n\x19long_value_reporting_item\x18\x04 \x01(\x0b\x32+.io.bisq.protobuffer.LongValueReportingItemH\x00\x12T\n\x1b\x64ouble_value_reporting_item\x18\x05 \x01(\x0b\x32-.io.bisq.protobuffer.DoubleValueReportingItemH\x00\x42\t\n\x07message\")\n\x18StringValueReportingItem\x12\r\n\x05value\x18\x01 \x01(\t\"\'\n\x16LongValueReportingItem\x12\r\n\x05value\x18\x01 \x01(\x04\")\n\x18\x44oubleValueReportingItem\x12\r\n\x05value\x18\x01 \x01(\x01\"]\n\x0eReportingItems\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12:\n\x0ereporting_item\x18\x02 \x03(\x0b\x32\".io.bisq.protobuffer.ReportingItem*D\n\x0bSupportType\x12\x0f\n\x0b\x41RBITRATION\x10\x00\x12\r\n\tMEDIATION\x10\x01\x12\t\n\x05TRADE\x10\x02\x12\n\n\x06REFUND\x10\x03*>\n\x0eOfferDirection\x12\x19\n\x15OFFER_DIRECTION_ERROR\x10\x00\x12\x07\n\x03\x42UY\x10\x01\x12\x08\n\x04SELL\x10\x02*\xec\x02\n\x12\x41vailabilityResult\x12\x0c\n\x08PB_ERROR\x10\x00\x12\x13\n\x0fUNKNOWN_FAILURE\x10\x01\x12\r\n\tAVAILABLE\x10\x02\x12\x0f\n\x0bOFFER_TAKEN\x10\x03\x12\x1a\n\x16PRICE_OUT_OF_TOLERANCE\x10\x04\x12\x1e\n\x1aMARKET_PRICE_NOT_AVAILABLE\x10\x05\x12\x12\n\x0eNO_ARBITRATORS\x10\x06\x12\x10\n\x0cNO_MEDIATORS\x10\x07\x12\x10\n\x0cUSER_IGNORED\x10\x08\x12 \n\x1cMISSING_MANDATORY_CAPABILITY\x10\t\x12\x14\n\x10NO_REFUND_AGENTS\x10\n\x12\x17\n\x13UNCONF_TX_LIMIT_HIT\x10\x0b\x12\x19\n\x15MAKER_DENIED_API_USER\x10\x0c\x12\x16\n\x12PRICE_CHECK_FAILED\x10\r\x12\x1b\n\x17INVALID_SNAPSHOT_HEIGHT\x10\x0e*\xf7\x03\n\x14MediationResultState\x12\x1d\n\x19PB_ERROR_MEDIATION_RESULT\x10\x00\x12\x1e\n\x1aUNDEFINED_MEDIATION_RESULT\x10\x01\x12\x1d\n\x19MEDIATION_RESULT_ACCEPTED\x10\x02\x12\x1d\n\x19MEDIATION_RESULT_REJECTED\x10\x03\x12\x10\n\x0cSIG_MSG_SENT\x10\x04\x12\x13\n\x0fSIG_MSG_ARRIVED\x10\x05\x12\x16\n\x12SIG_MSG_IN_MAILBOX\x10\x06\x12\x17\n\x13SIG_MSG_SEND_FAILED\x10\x07\x12\x14\n\x10RECEIVED_SIG_MSG\x10\x08\x12\x17\n\x13PAYOUT_TX_PUBLISHED\x10\t\x12 \n\x1cPAYOUT_TX_PUBLISHED_MSG_SENT\x10\n\x12#\n\x1fPAYOUT_TX_PUBLISHED_MSG_ARRIVED\x10\x0b\x12&\n\"PAYOUT_TX_PUBLISHED_MSG_IN_MAILBOX\x10\x0c\x12\'\n#PAYOUT_TX_PUBLISHED_MSG_SEND_FAILED\x10\r\x12$\n RECEIVED_PAYOUT_TX_PUBLISHED_MSG\x10\x0e\x12\x1d\n\x19PAYOUT_TX_SEEN_IN_NETWORK\x10\x0f*L\n\x11RefundResultState\x12\x1a\n\x16PB_ERROR_REFUND_RESULT\x10\x00\x12\x1b\n\x17UNDEFINED_REFUND_RESULT\x10\x01*\xb9\x02\n\x06TxType\x12\x14\n\x10PB_ERROR_TX_TYPE\x10\x00\x12\x15\n\x11UNDEFINED_TX_TYPE\x10\x01\x12\x0e\n\nUNVERIFIED\x10\x02\x12\x0b\n\x07INVALID\x10\x03\x12\x0b\n\x07GENESIS\x10\x04\x12\x10\n\x0cTRANSFER_BSQ\x10\x05\x12\x11\n\rPAY_TRADE_FEE\x10\x06\x12\x0c\n\x08PROPOSAL\x10\x07\x12\x18\n\x14\x43OMPENSATION_REQUEST\x10\x08\x12\x19\n\x15REIMBURSEMENT_REQUEST\x10\t\x12\x0e\n\nBLIND_VOTE\x10\n\x12\x0f\n\x0bVOTE_REVEAL\x10\x0b\x12\n\n\x06LOCKUP\x10\x0c\x12\n\n\x06UNLOCK\x10\r\x12\x15\n\x11\x41SSET_LISTING_FEE\x10\x0e\x12\x11\n\rPROOF_OF_BURN\x10\x0f\x12\r\n\tIRREGULAR\x10\x10*\xc9\x04\n\x0cTxOutputType\x12\x1b\n\x17PB_ERROR_TX_OUTPUT_TYPE\x10\x00\x12\x14\n\x10UNDEFINED_OUTPUT\x10\x01\x12\x12\n\x0eGENESIS_OUTPUT\x10\x02\x12\x0e\n\nBSQ_OUTPUT\x10\x03\x12\x0e\n\nBTC_OUTPUT\x10\x04\x12\x1d\n\x19PROPOSAL_OP_RETURN_OUTPUT\x10\x05\x12\x1d\n\x19\x43OMP_REQ_OP_RETURN_OUTPUT\x10\x06\x12\"\n\x1eREIMBURSEMENT_OP_RETURN_OUTPUT\x10\x07\x12$\n CONFISCATE_BOND_OP_RETURN_OUTPUT\x10\x08\x12\x1d\n\x19ISSUANCE_CANDIDATE_OUTPUT\x10\t\x12 \n\x1c\x42LIND_VOTE_LOCK_STAKE_OUTPUT\x10\n\x12\x1f\n\x1b\x42LIND_VOTE_OP_RETURN_OUTPUT\x10\x0b\x12#\n\x1fVOTE_REVEAL_UNLOCK_STAKE_OUTPUT\x10\x0c\x12 \n\x1cVOTE_REVEAL_OP_RETURN_OUTPUT\x10\r\x12&\n\"ASSET_LISTING_FEE_OP_RETURN_OUTPUT\x10\x0e\x12\"\n\x1ePROOF_OF_BURN_OP_RETURN_OUTPUT\x10\x0f\x12\x11\n\rLOCKUP_OUTPUT\x10\x10\x12\x1b\n\x17LOCKUP_OP_RETURN_OUTPUT\x10\x11\x12\x11\n\rUNLOCK_OUTPUT\x10\x12\x12\x12\n\x0eINVALID_OUTPUT\x10\x13*\xe5\x01\n\nScriptType\x12\x19\n\x15PB_ERROR_SCRIPT_TYPES\x10\x00\x12\x0b\n\x07PUB_KEY\x10\x01\x12\x10\n\x0cPUB_KEY_HASH\x10\x02\x12\x0f\n\x0bSCRIPT_HASH\x10\x03\x12\x0c\n\x08MULTISIG\x10\x04\x12\r\n\tNULL_DATA\x10\x05\x12\x16\n\x12WITNESS_V0_KEYHASH\x10\x06\x12\x19\n\x15WITNESS_V0_SCRIPTHASH\x10\x07\x12\x0f\n\x0bNONSTANDARD\x10\x08\x12\x13\n\x0fWITNESS_UNKNOWN\x10\t\x12\x16\n\x12WITNESS_V1_TAPROOT\x10\nB\x0c\n\x08protobufP\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'pb_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\010protobufP\001'
+  _globals['_NETWORKENVELOPE'].fields_by_name['refresh_trade_state_request']._loaded_options = None
+  _globals['_NETWORKENVELOPE'].fields_by_name['refresh_trade_state_request']._serialized_options = b'\030\001'
+  _globals['_NETWORKENVELOPE'].fields_by_name['trader_signed_witness_message']._loaded_options = None
+  _globals['_NETWORKENVELOPE'].fields_by_name['trader_signed_witness_message']._serialized_options = b'\030\001'
+  _globals['_REFRESHTRADESTATEREQUEST'].fields_by_name['uid']._loaded_options = None
+  _globals['_REFRESHTRADESTATEREQUEST'].fields_by_name['uid']._serialized_options = b'\030\001'
+  _globals['_REFRESHTRADESTATEREQUEST'].fields_by_name['trade_id']._loaded_options = None
+  _globals['_REFRESHTRADESTATEREQUEST'].fields_by_name['trade_id']._serialized_options = b'\030\001'
+  _globals['_REFRESHTRADESTATEREQUEST'].fields_by_name['sender_node_address']._loaded_options = None
+  _globals['_REFRESHTRADESTATEREQUEST'].fields_by_name['sender_node_address']._serialized_options = b'\030\001'
+  _globals['_TRADERSIGNEDWITNESSMESSAGE'].fields_by_name['uid']._loaded_options = None
+  _globals['_TRADERSIGNEDWITNESSMESSAGE'].fields_by_name['uid']._serialized_options = b'\030\001'
+  _globals['_TRADERSIGNEDWITNESSMESSAGE'].fields_by_name['trade_id']._loaded_options = None
+  _globals['_TRADERSIGNEDWITNESSMESSAGE'].fields_by_name['trade_id']._serialized_options = b'\030\001'
+  _globals['_TRADERSIGNEDWITNESSMESSAGE'].fields_by_name['sender_node_address']._loaded_options = None
+  _globals['_TRADERSIGNEDWITNESSMESSAGE'].fields_by_name['sender_node_address']._serialized_options = b'\030\001'
+  _globals['_TRADERSIGNEDWITNESSMESSAGE'].fields_by_name['signed_witness']._loaded_options = None
+  _globals['_TRADERSIGNEDWITNESSMESSAGE'].fields_by_name['signed_witness']._serialized_options = b'\030\001'
+  _globals['_PERSISTABLENETWORKPAYLOAD'].fields_by_name['trade_statistics2']._loaded_options = None
+  _globals['_PERSISTABLENETWORKPAYLOAD'].fields_by_name['trade_statistics2']._serialized_options = b'\030\001'
+  _globals['_REMOVEDPAYLOADSMAP_DATEBYHASHESENTRY']._loaded_options = None
+  _globals['_REMOVEDPAYLOADSMAP_DATEBYHASHESENTRY']._serialized_options = b'8\001'
+  _globals['_IGNOREDMAILBOXMAP_DATAENTRY']._loaded_options = None
+  _globals['_IGNOREDMAILBOXMAP_DATAENTRY']._serialized_options = b'8\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['base_currency']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['base_currency']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['counter_currency']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['counter_currency']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['direction']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['direction']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['trade_price']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['trade_price']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['trade_amount']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['trade_amount']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['trade_date']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['trade_date']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['payment_method_id']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['payment_method_id']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_date']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_date']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_use_market_based_price']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_use_market_based_price']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_market_price_margin']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_market_price_margin']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_amount']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_amount']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_min_amount']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_min_amount']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_id']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['offer_id']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['deposit_tx_id']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['deposit_tx_id']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['hash']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['hash']._serialized_options = b'\030\001'
+  _globals['_TRADESTATISTICS2'].fields_by_name['extra_data']._loaded_options = None
+  _globals['_TRADESTATISTICS2'].fields_by_name['extra_data']._serialized_options = b'\030\001'
+  _globals['_OFFERPAYLOAD'].fields_by_name['arbitrator_node_addresses']._loaded_options = None
+  _globals['_OFFERPAYLOAD'].fields_by_name['arbitrator_node_addresses']._serialized_options = b'\030\001'
+  _globals['_OFFERPAYLOAD'].fields_by_name['mediator_node_addresses']._loaded_options = None
+  _globals['_OFFERPAYLOAD'].fields_by_name['mediator_node_addresses']._serialized_options = b'\030\001'
+  _globals['_PAYMENTACCOUNTPAYLOAD'].fields_by_name['max_trade_period']._loaded_options = None
+  _globals['_PAYMENTACCOUNTPAYLOAD'].fields_by_name['max_trade_period']._serialized_options = b'\030\001'
+  _globals['_PAYMENTACCOUNTPAYLOAD'].fields_by_name['o_k_pay_account_payload']._loaded_options = None
+  _globals['_PAYMENTACCOUNTPAYLOAD'].fields_by_name['o_k_pay_account_payload']._serialized_options = b'\030\001'
+  _globals['_PAYMENTACCOUNTPAYLOAD'].fields_by_name['cash_app_account_payload']._loaded_options = None
+  _globals['_PAYMENTACCOUNTPAYLOAD'].fields_by_name['cash_app_account_payload']._serialized_options = b'\030\001'
+  _globals['_PAYMENTACCOUNTPAYLOAD'].fields_by_name['venmo_account_payload']._loaded_options = None
+  _globals['_PAYMENTACCOUNTPAYLOAD'].fields_by_name['venmo_account_payload']._serialized_options = b'\030\001'
+  _globals['_BANKACCOUNTPAYLOAD'].fields_by_name['email']._loaded_options = None
+  _globals['_BANKACCOUNTPAYLOAD'].fields_by_name['email']._serialized_options = b'\030\001'
+  _globals['_SEPAACCOUNTPAYLOAD'].fields_by_name['email']._loaded_options = None
+  _globals['_SEPAACCOUNTPAYLOAD'].fields_by_name['email']._serialized_options = b'\030\001'
+  _globals['_FASTERPAYMENTSACCOUNTPAYLOAD'].fields_by_name['email']._loaded_options = None
+  _globals['_FASTERPAYMENTSACCOUNTPAYLOAD'].fields_by_name['email']._serialized_options = b'\030\001'
+  _globals['_PERSISTABLEENVELOPE'].fields_by_name['persisted_entry_map']._loaded_options = None
+  _globals['_PERSISTABLEENVELOPE'].fields_by_name['persisted_entry_map']._serialized_options = b'\030\001'
+  _globals['_PERSISTABLEENVELOPE'].fields_by_name['trade_statistics2_store']._loaded_options = None
+  _globals['_PERSISTABLEENVELOPE'].fields_by_name['trade_statistics2_store']._serialized_options = b'\030\001'
+  _globals['_PERSISTEDENTRYMAP_PERSISTEDENTRYMAPENTRY']._loaded_options = None
+  _globals['_PERSISTEDENTRYMAP_PERSISTEDENTRYMAPENTRY']._serialized_options = b'8\001'
+  _globals['_TRADESTATISTICS2STORE'].fields_by_name['items']._loaded_options = None
+  _globals['_TRADESTATISTICS2STORE'].fields_by_name['items']._serialized_options = b'\030\001'
+  _globals['_TRADE_STATE'].values_by_name["SELLER_SENT_DEPOSIT_TX_PUBLISHED_MSG"]._loaded_options = None
+  _globals['_TRADE_STATE'].values_by_name["SELLER_SENT_DEPOSIT_TX_PUBLISHED_MSG"]._serialized_options = b'\010\001'
+  _globals['_TRADE_STATE'].values_by_name["SELLER_SAW_ARRIVED_DEPOSIT_TX_PUBLISHED_MSG"]._loaded_options = None
+  _globals['_TRADE_STATE'].values_by_name["SELLER_SAW_ARRIVED_DEPOSIT_TX_PUBLISHED_MSG"]._serialized_options = b'\010\001'
+  _globals['_TRADE_STATE'].values_by_name["SELLER_STORED_IN_MAILBOX_DEPOSIT_TX_PUBLISHED_MSG"]._loaded_options = None
+  _globals['_TRADE_STATE'].values_by_name["SELLER_STORED_IN_MAILBOX_DEPOSIT_TX_PUBLISHED_MSG"]._serialized_options = b'\010\001'
+  _globals['_TRADE_STATE'].values_by_name["SELLER_SEND_FAILED_DEPOSIT_TX_PUBLISHED_MSG"]._loaded_options = None
+  _globals['_TRADE_STATE'].values_by_name["SELLER_SEND_FAILED_DEPOSIT_TX_PUBLISHED_MSG"]._serialized_options = b'\010\001'
+  _globals['_TRADE'].fields_by_name['last_refresh_request_date']._loaded_options = None
+  _globals['_TRADE'].fields_by_name['last_refresh_request_date']._serialized_options = b'\030\001'
+  _globals['_PREFERENCESPAYLOAD_DONTSHOWAGAINMAPENTRY']._loaded_options = None
+  _globals['_PREFERENCESPAYLOAD_DONTSHOWAGAINMAPENTRY']._serialized_options = b'8\001'
+  _globals['_PREFERENCESPAYLOAD'].fields_by_name['buyer_security_deposit_as_long']._loaded_options = None
+  _globals['_PREFERENCESPAYLOAD'].fields_by_name['buyer_security_deposit_as_long']._serialized_options = b'\030\001'
+  _globals['_PREFERENCESPAYLOAD'].fields_by_name['selected_payment_account_for_create_offer']._loaded_options = None
+  _globals['_PREFERENCESPAYLOAD'].fields_by_name['selected_payment_account_for_create_offer']._serialized_options = b'\030\001'
+  _globals['_USERPAYLOAD'].fields_by_name['cookie']._loaded_options = None
+  _globals['_USERPAYLOAD'].fields_by_name['cookie']._serialized_options = b'\030\001'
+  _globals['_DAOSTATEHASH'].fields_by_name['prev_hash']._loaded_options = None
+  _globals['_DAOSTATEHASH'].fields_by_name['prev_hash']._serialized_options = b'\030\001'
+  _globals['_PROPOSALSTATEHASH'].fields_by_name['prev_hash']._loaded_options = None
+  _globals['_PROPOSALSTATEHASH'].fields_by_name['prev_hash']._serialized_options = b'\030\001'
+  _globals['_BLINDVOTESTATEHASH'].fields_by_name['prev_hash']._loaded_options = None
+  _globals['_BLINDVOTESTATEHASH'].fields_by_name['prev_hash']._serialized_options = b'\030\001'
+  _globals['_SUPPORTTYPE']._serialized_start=66104
+  _globals['_SUPPORTTYPE']._serialized_end=66172
+  _globals['_OFFERDIRECTION']._serialized_start=66174
+  _globals['_OFFERDIRECTION']._serialized_end=66236
+  _globals['_AVAILABILITYRESULT']._serialized_start=66239
+  _globals['_AVAILABILITYRESULT']._serialized_end=66603
+  _globals['_MEDIATIONRESULTSTATE']._serialized_start=66606
+  _globals['_MEDIATIONRESULTSTATE']._serialized_end=67109
+  _globals['_REFUNDRESULTSTATE']._serialized_start=67111
+  _globals['_REFUNDRESULTSTATE']._serialized_end=67187
+  _globals['_TXTYPE']._serialized_start=67190
+  _globals['_TXTYPE']._serialized_end=67503
+  _globals['_TXOUTPUTTYPE']._serialized_start=67506
+  _globals['_TXOUTPUTTYPE']._serialized_end=68091
+  _globals['_SCRIPTTYPE']._serialized_start=68094
+  _globals['_SCRIPTTYPE']._serialized_end=68323
+  _globals['_STRINGMAPENTRY']._serialized_start=33
+  _globals['_STRINGMAPENTRY']._serialized_end=94
+  _globals['_NETWORKENVELOPE']._serialized_start=97
+  _globals['_NETWORKENVELOPE']._serialized_end=5451
+  _globals['_BUNDLEOFENVELOPES']._serialized_start=5453
+  _globals['_BUNDLEOFENVELOPES']._serialized_end=5529
+  _globals['_PRELIMINARYGETDATAREQUEST']._serialized_start=5532
+  _globals['_PRELIMINARYGETDATAREQUEST']._serialized_end=5679
+  _globals['_GETDATARESPONSE']._serialized_start=5682
+  _globals['_GETDATARESPONSE']._serialized_end=5990
+  _globals['_GETUPDATEDDATAREQUEST']._serialized_start=5993
+  _globals['_GETUPDATEDDATAREQUEST']._serialized_end=6167
+  _globals['_FILETRANSFERPART']._serialized_start=6170
+  _globals['_FILETRANSFERPART']._serialized_end=6355
+  _globals['_GETPEERSREQUEST']._serialized_start=6358
+  _globals['_GETPEERSREQUEST']._serialized_end=6536
+  _globals['_GETPEERSRESPONSE']._serialized_start=6538
+  _globals['_GETPEERSRESPONSE']._serialized_end=6662
+  _globals['_PING']._serialized_start=6664
+  _globals['_PING']._serialized_end=6715
+  _globals['_PONG']._serialized_start=6717
+  _globals['_PONG']._serialized_end=6746
+  _globals['_GETINVENTORYREQUEST']._serialized_start=6748
+  _globals['_GETINVENTORYREQUEST']._serialized_end=6786
+  _globals['_GETINVENTORYRESPONSE']._serialized_start=6788
+  _globals['_GETINVENTORYRESPONSE']._serialized_end=6866
+  _globals['_OFFERAVAILABILITYREQUEST']._serialized_start=6869
+  _globals['_OFFERAVAILABILITYREQUEST']._serialized_end=7106
+  _globals['_OFFERAVAILABILITYRESPONSE']._serialized_start=7109
+  _globals['_OFFERAVAILABILITYRESPONSE']._serialized_end=7431
+  _globals['_REFRESHOFFERMESSAGE']._serialized_start=7433
+  _globals['_REFRESHOFFERMESSAGE']._serialized_end=7556
+  _globals['_ADDDATAMESSAGE']._serialized_start=7558
+  _globals['_ADDDATAMESSAGE']._serialized_end=7631
+  _globals['_REMOVEDATAMESSAGE']._serialized_start=7633
+  _globals['_REMOVEDATAMESSAGE']._serialized_end=7729
+  _globals['_REMOVEMAILBOXDATAMESSAGE']._serialized_start=7731
+  _globals['_REMOVEMAILBOXDATAMESSAGE']._serialized_end=7841
+  _globals['_ADDPERSISTABLENETWORKPAYLOADMESSAGE']._serialized_start=7843
+  _globals['_ADDPERSISTABLENETWORKPAYLOADMESSAGE']._serialized_end=7945
+  _globals['_CLOSECONNECTIONMESSAGE']._serialized_start=7947
+  _globals['_CLOSECONNECTIONMESSAGE']._serialized_end=7987
+  _globals['_ACKMESSAGE']._serialized_start=7990
+  _globals['_ACKMESSAGE']._serialized_end=8209
+  _globals['_PREFIXEDSEALEDANDSIGNEDMESSAGE']._serialized_start=8212
+  _globals['_PREFIXEDSEALEDANDSIGNEDMESSAGE']._serialized_end=8407
+  _globals['_INPUTSFORDEPOSITTXREQUEST']._serialized_start=8410
+  _globals['_INPUTSFORDEPOSITTXREQUEST']._serialized_end=9674
+  _globals['_INPUTSFORDEPOSITTXRESPONSE']._serialized_start=9677
+  _globals['_INPUTSFORDEPOSITTXRESPONSE']._serialized_end=10321
+  _globals['_DELAYEDPAYOUTTXSIGNATUREREQUEST']._serialized_start=10324
+  _globals['_DELAYEDPAYOUTTXSIGNATUREREQUEST']._serialized_end=10522
+  _globals['_DELAYEDPAYOUTTXSIGNATURERESPONSE']._serialized_start=10525
+  _globals['_DELAYEDPAYOUTTXSIGNATURERESPONSE']._serialized_end=10716
+  _globals['_DEPOSITTXANDDELAYEDPAYOUTTXMESSAGE']._serialized_start=10719
+  _globals['_DEPOSITTXANDDELAYEDPAYOUTTXMESSAGE']._serialized_end=10980
+  _globals['_SHAREBUYERPAYMENTACCOUNTMESSAGE']._serialized_start=10983
+  _globals['_SHAREBUYERPAYMENTACCOUNTMESSAGE']._serialized_end=11193
+  _globals['_DEPOSITTXMESSAGE']._serialized_start=11196
+  _globals['_DEPOSITTXMESSAGE']._serialized_end=11346
+  _globals['_PEERPUBLISHEDDELAYEDPAYOUTTXMESSAGE']._serialized_start=11349
+  _globals['_PEERPUBLISHEDDELAYEDPAYOUTTXMESSAGE']._serialized_end=11480
+  _globals['_COUNTERCURRENCYTRANSFERSTARTEDMESSAGE']._serialized_start=11483
+  _globals['_COUNTERCURRENCYTRANSFERSTARTEDMESSAGE']._serialized_end=11740
+  _globals['_FINALIZEPAYOUTTXREQUEST']._serialized_start=11743
+  _globals['_FINALIZEPAYOUTTXREQUEST']._serialized_end=11919
+  _globals['_PAYOUTTXPUBLISHEDMESSAGE']._serialized_start=11922
+  _globals['_PAYOUTTXPUBLISHEDMESSAGE']._serialized_end=12121
+  _globals['_MEDIATEDPAYOUTTXPUBLISHEDMESSAGE']._serialized_start=12124
+  _globals['_MEDIATEDPAYOUTTXPUBLISHEDMESSAGE']._serialized_end=12271
+  _globals['_MEDIATEDPAYOUTTXSIGNATUREMESSAGE']._serialized_start=12274
+  _globals['_MEDIATEDPAYOUTTXSIGNATUREMESSAGE']._serialized_end=12424
+  _globals['_REFRESHTRADESTATEREQUEST']._serialized_start=12427
+  _globals['_REFRESHTRADESTATEREQUEST']._serialized_end=12559
+  _globals['_TRADERSIGNEDWITNESSMESSAGE']._serialized_start=12562
+  _globals['_TRADERSIGNEDWITNESSMESSAGE']._serialized_end=12760
+  _globals['_SELLERSBSQSWAPREQUEST']._serialized_start=12763
+  _globals['_SELLERSBSQSWAPREQUEST']._serialized_end=13047
+  _globals['_BUYERSBSQSWAPREQUEST']._serialized_start=13050
+  _globals['_BUYERSBSQSWAPREQUEST']._serialized_end=13485
+  _globals['_BSQSWAPTXINPUTSMESSAGE']._serialized_start=13488
+  _globals['_BSQSWAPTXINPUTSMESSAGE']._serialized_end=13758
+  _globals['_BSQSWAPFINALIZETXREQUEST']._serialized_start=13761
+  _globals['_BSQSWAPFINALIZETXREQUEST']._serialized_end=14031
+  _globals['_BSQSWAPFINALIZEDTXMESSAGE']._serialized_start=14034
+  _globals['_BSQSWAPFINALIZEDTXMESSAGE']._serialized_end=14167
+  _globals['_OPENNEWDISPUTEMESSAGE']._serialized_start=14170
+  _globals['_OPENNEWDISPUTEMESSAGE']._serialized_end=14364
+  _globals['_PEEROPENEDDISPUTEMESSAGE']._serialized_start=14367
+  _globals['_PEEROPENEDDISPUTEMESSAGE']._serialized_end=14564
+  _globals['_CHATMESSAGE']._serialized_start=14567
+  _globals['_CHATMESSAGE']._serialized_end=15015
+  _globals['_DISPUTERESULTMESSAGE']._serialized_start=15018
+  _globals['_DISPUTERESULTMESSAGE']._serialized_end=15224
+  _globals['_PEERPUBLISHEDDISPUTEPAYOUTTXMESSAGE']._serialized_start=15227
+  _globals['_PEERPUBLISHEDDISPUTEPAYOUTTXMESSAGE']._serialized_end=15427
+  _globals['_PRIVATENOTIFICATIONMESSAGE']._serialized_start=15430
+  _globals['_PRIVATENOTIFICATIONMESSAGE']._serialized_end=15621
+  _globals['_GETBLOCKSREQUEST']._serialized_start=15624
+  _globals['_GETBLOCKSREQUEST']._serialized_end=15779
+  _globals['_GETBLOCKSRESPONSE']._serialized_start=15781
+  _globals['_GETBLOCKSRESPONSE']._serialized_end=15875
+  _globals['_NEWBLOCKBROADCASTMESSAGE']._serialized_start=15877
+  _globals['_NEWBLOCKBROADCASTMESSAGE']._serialized_end=15954
+  _globals['_REPUBLISHGOVERNANCEDATAREQUEST']._serialized_start=15956
+  _globals['_REPUBLISHGOVERNANCEDATAREQUEST']._serialized_end=15988
+  _globals['_NEWDAOSTATEHASHMESSAGE']._serialized_start=15990
+  _globals['_NEWDAOSTATEHASHMESSAGE']._serialized_end=16069
+  _globals['_NEWPROPOSALSTATEHASHMESSAGE']._serialized_start=16071
+  _globals['_NEWPROPOSALSTATEHASHMESSAGE']._serialized_end=16160
+  _globals['_NEWBLINDVOTESTATEHASHMESSAGE']._serialized_start=16162
+  _globals['_NEWBLINDVOTESTATEHASHMESSAGE']._serialized_end=16253
+  _globals['_GETDAOSTATEHASHESREQUEST']._serialized_start=16255
+  _globals['_GETDAOSTATEHASHESREQUEST']._serialized_end=16312
+  _globals['_GETPROPOSALSTATEHASHESREQUEST']._serialized_start=16314
+  _globals['_GETPROPOSALSTATEHASHESREQUEST']._serialized_end=16376
+  _globals['_GETBLINDVOTESTATEHASHESREQUEST']._serialized_start=16378
+  _globals['_GETBLINDVOTESTATEHASHESREQUEST']._serialized_end=16441
+  _globals['_GETDAOSTATEHASHESRESPONSE']._serialized_start=16443
+  _globals['_GETDAOSTATEHASHESRESPONSE']._serialized_end=16550
+  _globals['_GETPROPOSALSTATEHASHESRESPONSE']._serialized_start=16552
+  _globals['_GETPROPOSALSTATEHASHESRESPONSE']._serialized_end=16669
+  _globals['_GETBLINDVOTESTATEHASHESRESPONSE']._serialized_start=16671
+  _globals['_GETBLINDVOTESTATEHASHESRESPONSE']._serialized_end=16790
+  _globals['_NODEADDRESS']._serialized_start=16792
+  _globals['_NODEADDRESS']._serialized_end=16838
+  _globals['_PEER']._serialized_start=16840
+  _globals['_PEER']._serialized_end=16948
+  _globals['_PUBKEYRING']._serialized_start=16950
+  _globals['_PUBKEYRING']._serialized_end=17035
+  _globals['_SEALEDANDSIGNED']._serialized_start=17038
+  _globals['_SEALEDANDSIGNED']._serialized_end=17171
+  _globals['_STORAGEPAYLOAD']._serialized_start=17174
+  _globals['_STORAGEPAYLOAD']._serialized_end=17747
+  _globals['_PERSISTABLENETWORKPAYLOAD']._serialized_start=17750
+  _globals['_PERSISTABLENETWORKPAYLOAD']._serialized_end=18196
+  _globals['_PROTECTEDSTORAGEENTRY']._serialized_start=18199
+  _globals['_PROTECTEDSTORAGEENTRY']._serialized_end=18386
+  _globals['_STORAGEENTRYWRAPPER']._serialized_start=18389
+  _globals['_STORAGEENTRYWRAPPER']._serialized_end=18594
+  _globals['_PROTECTEDMAILBOXSTORAGEENTRY']._serialized_start=18596
+  _globals['_PROTECTEDMAILBOXSTORAGEENTRY']._serialized_end=18718
+  _globals['_DATAANDSEQNRPAIR']._serialized_start=18720
+  _globals['_DATAANDSEQNRPAIR']._serialized_end=18817
+  _globals['_MAILBOXMESSAGELIST']._serialized_start=18819
+  _globals['_MAILBOXMESSAGELIST']._serialized_end=18895
+  _globals['_REMOVEDPAYLOADSMAP']._serialized_start=18898
+  _globals['_REMOVEDPAYLOADSMAP']._serialized_end=19054
+  _globals['_REMOVEDPAYLOADSMAP_DATEBYHASHESENTRY']._serialized_start=19003
+  _globals['_REMOVEDPAYLOADSMAP_DATEBYHASHESENTRY']._serialized_end=19054
+  _globals['_IGNOREDMAILBOXMAP']._serialized_start=19057
+  _globals['_IGNOREDMAILBOXMAP']._serialized_end=19185
+  _globals['_IGNOREDMAILBOXMAP_DATAENTRY']._serialized_start=19142
+  _globals['_IGNOREDMAILBOXMAP_DATAENTRY']._serialized_end=19185
+  _globals['_MAILBOXITEM']._serialized_start=19188
+  _globals['_MAILBOXITEM']._serialized_end=19382
+  _globals['_DECRYPTEDMESSAGEWITHPUBKEY']._serialized_start=19384
+  _globals['_DECRYPTEDMESSAGEWITHPUBKEY']._serialized_end=19509
+  _globals['_PRIVATENOTIFICATIONPAYLOAD']._serialized_start=19511
+  _globals['_PRIVATENOTIFICATIONPAYLOAD']._serialized_end=19615
+  _globals['_PAYMENTACCOUNTFILTER']._serialized_start=19617
+  _globals['_PAYMENTACCOUNTFILTER']._serialized_end=19706
+  _globals['_ALERT']._serialized_start=19709
+  _globals['_ALERT']._serialized_end=19918
+  _globals['_ARBITRATOR']._serialized_start=19921
+  _globals['_ARBITRATOR']._serialized_end=20293
+  _globals['_MEDIATOR']._serialized_start=20296
+  _globals['_MEDIATOR']._serialized_end=20624
+  _globals['_REFUNDAGENT']._serialized_start=20627
+  _globals['_REFUNDAGENT']._serialized_end=20958
+  _globals['_FILTER']._serialized_start=20961
+  _globals['_FILTER']._serialized_end=22196
+  _globals['_TRADESTATISTICS2']._serialized_start=22199
+  _globals['_TRADESTATISTICS2']._serialized_end=22729
+  _globals['_TRADESTATISTICS3']._serialized_start=22732
+  _globals['_TRADESTATISTICS3']._serialized_end=22948
+  _globals['_MAILBOXSTORAGEPAYLOAD']._serialized_start=22951
+  _globals['_MAILBOXSTORAGEPAYLOAD']._serialized_end=23205
+  _globals['_OFFERPAYLOAD']._serialized_start=23208
+  _globals['_OFFERPAYLOAD']._serialized_end=24430
+  _globals['_BSQSWAPOFFERPAYLOAD']._serialized_start=24433
+  _globals['_BSQSWAPOFFERPAYLOAD']._serialized_end=24864
+  _globals['_PROOFOFWORK']._serialized_start=24867
+  _globals['_PROOFOFWORK']._serialized_end=25006
+  _globals['_ACCOUNTAGEWITNESS']._serialized_start=25008
+  _globals['_ACCOUNTAGEWITNESS']._serialized_end=25055
+  _globals['_SIGNEDWITNESS']._serialized_start=25058
+  _globals['_SIGNEDWITNESS']._serialized_end=25364
+  _globals['_SIGNEDWITNESS_VERIFICATIONMETHOD']._serialized_start=25303
+  _globals['_SIGNEDWITNESS_VERIFICATIONMETHOD']._serialized_end=25364
+  _globals['_DISPUTE']._serialized_start=25367
+  _globals['_DISPUTE']._serialized_end=26575
+  _globals['_DISPUTE_STATE']._serialized_start=26483
+  _globals['_DISPUTE_STATE']._serialized_end=26575
+  _globals['_ATTACHMENT']._serialized_start=26577
+  _globals['_ATTACHMENT']._serialized_end=26645
+  _globals['_DISPUTERESULT']._serialized_start=26648
+  _globals['_DISPUTERESULT']._serialized_end=27805
+  _globals['_DISPUTERESULT_WINNER']._serialized_start=27221
+  _globals['_DISPUTERESULT_WINNER']._serialized_end=27273
+  _globals['_DISPUTERESULT_REASON']._serialized_start=27276
+  _globals['_DISPUTERESULT_REASON']._serialized_end=27524
+  _globals['_DISPUTERESULT_PAYOUTSUGGESTION']._serialized_start=27527
+  _globals['_DISPUTERESULT_PAYOUTSUGGESTION']._serialized_end=27805
+  _globals['_CONTRACT']._serialized_start=27808
+  _globals['_CONTRACT']._serialized_end=28911
+  _globals['_RAWTRANSACTIONINPUT']._serialized_start=28913
+  _globals['_RAWTRANSACTIONINPUT']._serialized_end=29016
+  _globals['_PAYMENTACCOUNTPAYLOAD']._serialized_start=29019
+  _globals['_PAYMENTACCOUNTPAYLOAD']._serialized_end=32336
+  _globals['_ALIPAYACCOUNTPAYLOAD']._serialized_start=32338
+  _globals['_ALIPAYACCOUNTPAYLOAD']._serialized_end=32380
+  _globals['_WECHATPAYACCOUNTPAYLOAD']._serialized_start=32382
+  _globals['_WECHATPAYACCOUNTPAYLOAD']._serialized_end=32427
+  _globals['_CHASEQUICKPAYACCOUNTPAYLOAD']._serialized_start=32429
+  _globals['_CHASEQUICKPAYACCOUNTPAYLOAD']._serialized_end=32494
+  _globals['_CLEARXCHANGEACCOUNTPAYLOAD']._serialized_start=32496
+  _globals['_CLEARXCHANGEACCOUNTPAYLOAD']._serialized_end=32573
+  _globals['_COUNTRYBASEDPAYMENTACCOUNTPAYLOAD']._serialized_start=32576
+  _globals['_COUNTRYBASEDPAYMENTACCOUNTPAYLOAD']._serialized_end=33997
+  _globals['_BANKACCOUNTPAYLOAD']._serialized_start=34000
+  _globals['_BANKACCOUNTPAYLOAD']._serialized_end=34678
+  _globals['_ACHTRANSFERACCOUNTPAYLOAD']._serialized_start=34680
+  _globals['_ACHTRANSFERACCOUNTPAYLOAD']._serialized_end=34731
+  _globals['_DOMESTICWIRETRANSFERACCOUNTPAYLOAD']._serialized_start=34733
+  _globals['_DOMESTICWIRETRANSFERACCOUNTPAYLOAD']._serialized_end=34793
+  _globals['_NATIONALBANKACCOUNTPAYLOAD']._serialized_start=34795
+  _globals['_NATIONALBANKACCOUNTPAYLOAD']._serialized_end=34823
+  _globals['_SAMEBANKACCOUNTPAYLOAD']._serialized_start=34825
+  _globals['_SAMEBANKACCOUNTPAYLOAD']._serialized_end=34849
+  _globals['_JAPANBANKACCOUNTPAYLOAD']._serialized_start=34852
+  _globals['_JAPANBANKACCOUNTPAYLOAD']._serialized_end=35050
+  _globals['_AUSTRALIAPAYIDPAYLOAD']._serialized_start=35052
+  _globals['_AUSTRALIAPAYIDPAYLOAD']._serialized_end=35117
+  _globals['_SPECIFICBANKSACCOUNTPAYLOAD']._serialized_start=35119
+  _globals['_SPECIFICBANKSACCOUNTPAYLOAD']._serialized_end=35172
+  _globals['_CASHDEPOSITACCOUNTPAYLOAD']._serialized_start=35175
+  _globals['_CASHDEPOSITACCOUNTPAYLOAD']._serialized_end=35416
+  _globals['_MONEYGRAMACCOUNTPAYLOAD']._serialized_start=35418
+  _globals['_MONEYGRAMACCOUNTPAYLOAD']._serialized_end=35516
+  _globals['_HALCASHACCOUNTPAYLOAD']._serialized_start=35518
+  _globals['_HALCASHACCOUNTPAYLOAD']._serialized_end=35560
+  _globals['_WESTERNUNIONACCOUNTPAYLOAD']._serialized_start=35562
+  _globals['_WESTERNUNIONACCOUNTPAYLOAD']._serialized_end=35655
+  _globals['_AMAZONGIFTCARDACCOUNTPAYLOAD']._serialized_start=35657
+  _globals['_AMAZONGIFTCARDACCOUNTPAYLOAD']._serialized_end=35737
+  _globals['_SEPAACCOUNTPAYLOAD']._serialized_start=35739
+  _globals['_SEPAACCOUNTPAYLOAD']._serialized_end=35858
+  _globals['_SEPAINSTANTACCOUNTPAYLOAD']._serialized_start=35860
+  _globals['_SEPAINSTANTACCOUNTPAYLOAD']._serialized_end=35967
+  _globals['_CRYPTOCURRENCYACCOUNTPAYLOAD']._serialized_start=35969
+  _globals['_CRYPTOCURRENCYACCOUNTPAYLOAD']._serialized_end=36016
+  _globals['_INSTANTCRYPTOCURRENCYACCOUNTPAYLOAD']._serialized_start=36018
+  _globals['_INSTANTCRYPTOCURRENCYACCOUNTPAYLOAD']._serialized_end=36072
+  _globals['_BSQSWAPACCOUNTPAYLOAD']._serialized_start=36074
+  _globals['_BSQSWAPACCOUNTPAYLOAD']._serialized_end=36097
+  _globals['_FASTERPAYMENTSACCOUNTPAYLOAD']._serialized_start=36099
+  _globals['_FASTERPAYMENTSACCOUNTPAYLOAD']._serialized_end=36187
+  _globals['_INTERACETRANSFERACCOUNTPAYLOAD']._serialized_start=36189
+  _globals['_INTERACETRANSFERACCOUNTPAYLOAD']._serialized_end=36291
+  _globals['_OKPAYACCOUNTPAYLOAD']._serialized_start=36293
+  _globals['_OKPAYACCOUNTPAYLOAD']._serialized_end=36334
+  _globals['_UPHOLDACCOUNTPAYLOAD']._serialized_start=36336
+  _globals['_UPHOLDACCOUNTPAYLOAD']._serialized_end=36401
+  _globals['_CASHAPPACCOUNTPAYLOAD']._serialized_start=36403
+  _globals['_CASHAPPACCOUNTPAYLOAD']._serialized_end=36444
+  _globals['_MONEYBEAMACCOUNTPAYLOAD']._serialized_start=36446
+  _globals['_MONEYBEAMACCOUNTPAYLOAD']._serialized_end=36491
+  _globals['_VENMOACCOUNTPAYLOAD']._serialized_start=36493
+  _globals['_VENMOACCOUNTPAYLOAD']._serialized_end=36560
+  _globals['_POPMONEYACCOUNTPAYLOAD']._serialized_start=36562
+  _globals['_POPMONEYACCOUNTPAYLOAD']._serialized_end=36627
+  _globals['_REVOLUTACCOUNTPAYLOAD']._serialized_start=36629
+  _globals['_REVOLUTACCOUNTPAYLOAD']._serialized_end=36691
+  _globals['_PERFECTMONEYACCOUNTPAYLOAD']._serialized_start=36693
+  _globals['_PERFECTMONEYACCOUNTPAYLOAD']._serialized_end=36741
+  _globals['_SWISHACCOUNTPAYLOAD']._serialized_start=36743
+  _globals['_SWISHACCOUNTPAYLOAD']._serialized_end=36804
+  _globals['_USPOSTALMONEYORDERACCOUNTPAYLOAD']._serialized_start=36806
+  _globals['_USPOSTALMONEYORDERACCOUNTPAYLOAD']._serialized_end=36885
+  _globals['_F2FACCOUNTPAYLOAD']._serialized_start=36887
+  _globals['_F2FACCOUNTPAYLOAD']._serialized_end=36957
+  _globals['_IFSCBASEDACCOUNTPAYLOAD']._serialized_start=36960
+  _globals['_IFSCBASEDACCOUNTPAYLOAD']._serialized_end=37270
+  _globals['_NEFTACCOUNTPAYLOAD']._serialized_start=37272
+  _globals['_NEFTACCOUNTPAYLOAD']._serialized_end=37292
+  _globals['_RTGSACCOUNTPAYLOAD']._serialized_start=37294
+  _globals['_RTGSACCOUNTPAYLOAD']._serialized_end=37314
+  _globals['_IMPSACCOUNTPAYLOAD']._serialized_start=37316
+  _globals['_IMPSACCOUNTPAYLOAD']._serialized_end=37336
+  _globals['_UPIACCOUNTPAYLOAD']._serialized_start=37338
+  _globals['_UPIACCOUNTPAYLOAD']._serialized_end=37390
+  _globals['_PAYTMACCOUNTPAYLOAD']._serialized_start=37392
+  _globals['_PAYTMACCOUNTPAYLOAD']._serialized_end=37441
+  _globals['_CASHBYMAILACCOUNTPAYLOAD']._serialized_start=37443
+  _globals['_CASHBYMAILACCOUNTPAYLOAD']._serialized_end=37530
+  _globals['_PROMPTPAYACCOUNTPAYLOAD']._serialized_start=37532
+  _globals['_PROMPTPAYACCOUNTPAYLOAD']._serialized_end=37580
+  _globals['_ADVANCEDCASHACCOUNTPAYLOAD']._serialized_start=37582
+  _globals['_ADVANCEDCASHACCOUNTPAYLOAD']._serialized_end=37630
+  _globals['_TRANSFERWISEACCOUNTPAYLOAD']._serialized_start=37632
+  _globals['_TRANSFERWISEACCOUNTPAYLOAD']._serialized_end=37675
+  _globals['_TRANSFERWISEUSDACCOUNTPAYLOAD']._serialized_start=37677
+  _globals['_TRANSFERWISEUSDACCOUNTPAYLOAD']._serialized_end=37773
+  _globals['_PAYSERAACCOUNTPAYLOAD']._serialized_start=37775
+  _globals['_PAYSERAACCOUNTPAYLOAD']._serialized_end=37813
+  _globals['_PAXUMACCOUNTPAYLOAD']._serialized_start=37815
+  _globals['_PAXUMACCOUNTPAYLOAD']._serialized_end=37851
+  _globals['_CAPITUALACCOUNTPAYLOAD']._serialized_start=37853
+  _globals['_CAPITUALACCOUNTPAYLOAD']._serialized_end=37897
+  _globals['_CELPAYACCOUNTPAYLOAD']._serialized_start=37899
+  _globals['_CELPAYACCOUNTPAYLOAD']._serialized_end=37936
+  _globals['_NEQUIACCOUNTPAYLOAD']._serialized_start=37938
+  _globals['_NEQUIACCOUNTPAYLOAD']._serialized_end=37978
+  _globals['_BIZUMACCOUNTPAYLOAD']._serialized_start=37980
+  _globals['_BIZUMACCOUNTPAYLOAD']._serialized_end=38020
+  _globals['_PIXACCOUNTPAYLOAD']._serialized_start=38022
+  _globals['_PIXACCOUNTPAYLOAD']._serialized_end=38058
+  _globals['_MONESEACCOUNTPAYLOAD']._serialized_start=38060
+  _globals['_MONESEACCOUNTPAYLOAD']._serialized_end=38122
+  _globals['_SATISPAYACCOUNTPAYLOAD']._serialized_start=38124
+  _globals['_SATISPAYACCOUNTPAYLOAD']._serialized_end=38188
+  _globals['_STRIKEACCOUNTPAYLOAD']._serialized_start=38190
+  _globals['_STRIKEACCOUNTPAYLOAD']._serialized_end=38233
+  _globals['_TIKKIEACCOUNTPAYLOAD']._serialized_start=38235
+  _globals['_TIKKIEACCOUNTPAYLOAD']._serialized_end=38271
+  _globals['_VERSEACCOUNTPAYLOAD']._serialized_start=38273
+  _globals['_VERSEACCOUNTPAYLOAD']._serialized_end=38315
+  _globals['_MERCADOPAGOACCOUNTPAYLOAD']._serialized_start=38317
+  _globals['_MERCADOPAGOACCOUNTPAYLOAD']._serialized_end=38384
+  _globals['_SWIFTACCOUNTPAYLOAD']._serialized_start=38387
+  _globals['_SWIFTACCOUNTPAYLOAD']._serialized_end=38846
+  _globals['_SBPACCOUNTPAYLOAD']._serialized_start=38848
+  _globals['_SBPACCOUNTPAYLOAD']._serialized_end=38930
+  _globals['_USERMANAGERPAYLOAD']._serialized_start=38933
+  _globals['_USERMANAGERPAYLOAD']._serialized_end=39138
+  _globals['_PERSISTABLEENVELOPE']._serialized_start=39141
+  _globals['_PERSISTABLEENVELOPE']._serialized_end=41502
+  _globals['_SEQUENCENUMBERMAP']._serialized_start=41504
+  _globals['_SEQUENCENUMBERMAP']._serialized_end=41598
+  _globals['_SEQUENCENUMBERENTRY']._serialized_start=41600
+  _globals['_SEQUENCENUMBERENTRY']._serialized_end=41718
+  _globals['_BYTEARRAY']._serialized_start=41720
+  _globals['_BYTEARRAY']._serialized_end=41746
+  _globals['_MAPVALUE']._serialized_start=41748
+  _globals['_MAPVALUE']._serialized_end=41799
+  _globals['_PERSISTEDENTRYMAP']._serialized_start=41802
+  _globals['_PERSISTEDENTRYMAP']._serialized_end=42015
+  _globals['_PERSISTEDENTRYMAP_PERSISTEDENTRYMAPENTRY']._serialized_start=41915
+  _globals['_PERSISTEDENTRYMAP_PERSISTEDENTRYMAPENTRY']._serialized_end=42015
+  _globals['_ACCOUNTAGEWITNESSSTORE']._serialized_start=42017
+  _globals['_ACCOUNTAGEWITNESSSTORE']._serialized_end=42096
+  _globals['_SIGNEDWITNESSSTORE']._serialized_start=42098
+  _globals['_SIGNEDWITNESSSTORE']._serialized_end=42169
+  _globals['_TRADESTATISTICS2STORE']._serialized_start=42171
+  _globals['_TRADESTATISTICS2STORE']._serialized_end=42252
+  _globals['_TRADESTATISTICS3STORE']._serialized_start=42254
+  _globals['_TRADESTATISTICS3STORE']._serialized_end=42331
+  _globals['_PEERLIST']._serialized_start=42333
+  _globals['_PEERLIST']._serialized_end=42384
+  _globals['_ADDRESSENTRYLIST']._serialized_start=42386
+  _globals['_ADDRESSENTRYLIST']._serialized_end=42462
+  _globals['_ADDRESSENTRY']._serialized_start=42465
+  _globals['_ADDRESSENTRY']._serialized_end=42779
+  _globals['_ADDRESSENTRY_CONTEXT']._serialized_start=42649
+  _globals['_ADDRESSENTRY_CONTEXT']._serialized_end=42779
+  _globals['_NAVIGATIONPATH']._serialized_start=42781
+  _globals['_NAVIGATIONPATH']._serialized_end=42811
+  _globals['_PAYMENTACCOUNTLIST']._serialized_start=42813
+  _globals['_PAYMENTACCOUNTLIST']._serialized_end=42895
+  _globals['_TRADABLELIST']._serialized_start=42897
+  _globals['_TRADABLELIST']._serialized_end=42960
+  _globals['_OFFER']._serialized_start=42963
+  _globals['_OFFER']._serialized_end=43239
+  _globals['_OFFER_STATE']._serialized_start=43108
+  _globals['_OFFER_STATE']._serialized_end=43228
+  _globals['_OPENOFFER']._serialized_start=43242
+  _globals['_OPENOFFER']._serialized_end=43668
+  _globals['_OPENOFFER_STATE']._serialized_start=43575
+  _globals['_OPENOFFER_STATE']._serialized_end=43668
+  _globals['_TRADABLE']._serialized_start=43671
+  _globals['_TRADABLE']._serialized_end=44394
+  _globals['_TRADE']._serialized_start=44397
+  _globals['_TRADE']._serialized_end=48052
+  _globals['_TRADE_STATE']._serialized_start=46104
+  _globals['_TRADE_STATE']._serialized_end=47465
+  _globals['_TRADE_PHASE']._serialized_start=47468
+  _globals['_TRADE_PHASE']._serialized_end=47647
+  _globals['_TRADE_DISPUTESTATE']._serialized_start=47650
+  _globals['_TRADE_DISPUTESTATE']._serialized_end=47943
+  _globals['_TRADE_TRADEPERIODSTATE']._serialized_start=47945
+  _globals['_TRADE_TRADEPERIODSTATE']._serialized_end=48052
+  _globals['_BUYERASMAKERTRADE']._serialized_start=48054
+  _globals['_BUYERASMAKERTRADE']._serialized_end=48116
+  _globals['_BUYERASTAKERTRADE']._serialized_start=48118
+  _globals['_BUYERASTAKERTRADE']._serialized_end=48180
+  _globals['_SELLERASMAKERTRADE']._serialized_start=48182
+  _globals['_SELLERASMAKERTRADE']._serialized_end=48245
+  _globals['_SELLERASTAKERTRADE']._serialized_start=48247
+  _globals['_SELLERASTAKERTRADE']._serialized_end=48310
+  _globals['_BSQSWAPTRADE']._serialized_start=48313
+  _globals['_BSQSWAPTRADE']._serialized_end=48795
+  _globals['_BSQSWAPTRADE_STATE']._serialized_start=48724
+  _globals['_BSQSWAPTRADE_STATE']._serialized_end=48795
+  _globals['_BSQSWAPBUYERASMAKERTRADE']._serialized_start=48797
+  _globals['_BSQSWAPBUYERASMAKERTRADE']._serialized_end=48882
+  _globals['_BSQSWAPBUYERASTAKERTRADE']._serialized_start=48884
+  _globals['_BSQSWAPBUYERASTAKERTRADE']._serialized_end=48969
+  _globals['_BSQSWAPSELLERASMAKERTRADE']._serialized_start=48971
+  _globals['_BSQSWAPSELLERASMAKERTRADE']._serialized_end=49057
+  _globals['_BSQSWAPSELLERASTAKERTRADE']._serialized_start=49059
+  _globals['_BSQSWAPSELLERASTAKERTRADE']._serialized_end=49145
+  _globals['_PROCESSMODEL']._serialized_start=49148
+  _globals['_PROCESSMODEL']._serialized_end=49983
+  _globals['_TRADINGPEER']._serialized_start=49986
+  _globals['_TRADINGPEER']._serialized_end=50591
+  _globals['_BSQSWAPPROTOCOLMODEL']._serialized_start=50594
+  _globals['_BSQSWAPPROTOCOLMODEL']._serialized_end=50890
+  _globals['_BSQSWAPTRADEPEER']._serialized_start=50893
+  _globals['_BSQSWAPTRADEPEER']._serialized_end=51110
+  _globals['_ARBITRATIONDISPUTELIST']._serialized_start=51112
+  _globals['_ARBITRATIONDISPUTELIST']._serialized_end=51183
+  _globals['_MEDIATIONDISPUTELIST']._serialized_start=51185
+  _globals['_MEDIATIONDISPUTELIST']._serialized_end=51254
+  _globals['_REFUNDDISPUTELIST']._serialized_start=51256
+  _globals['_REFUNDDISPUTELIST']._serialized_end=51322
+  _globals['_PREFERENCESPAYLOAD']._serialized_start=51325
+  _globals['_PREFERENCESPAYLOAD']._serialized_end=54402
+  _globals['_PREFERENCESPAYLOAD_DONTSHOWAGAINMAPENTRY']._serialized_start=54347
+  _globals['_PREFERENCESPAYLOAD_DONTSHOWAGAINMAPENTRY']._serialized_end=54402
+  _globals['_AUTOCONFIRMSETTINGS']._serialized_start=54405
+  _globals['_AUTOCONFIRMSETTINGS']._serialized_end=54546
+  _globals['_USERPAYLOAD']._serialized_start=54549
+  _globals['_USERPAYLOAD']._serialized_end=55565
+  _globals['_SUBACCOUNTMAPENTRY']._serialized_start=55567
+  _globals['_SUBACCOUNTMAPENTRY']._serialized_end=55652
+  _globals['_ACCOUNTINGTXOUTPUT']._serialized_start=55654
+  _globals['_ACCOUNTINGTXOUTPUT']._serialized_end=55703
+  _globals['_ACCOUNTINGTX']._serialized_start=55705
+  _globals['_ACCOUNTINGTX']._serialized_end=55816
+  _globals['_ACCOUNTINGBLOCK']._serialized_start=55819
+  _globals['_ACCOUNTINGBLOCK']._serialized_end=55984
+  _globals['_BURNINGMANACCOUNTINGSTORE']._serialized_start=55987
+  _globals['_BURNINGMANACCOUNTINGSTORE']._serialized_end=56173
+  _globals['_RECEIVEDBTCAGGREGATES']._serialized_start=56175
+  _globals['_RECEIVEDBTCAGGREGATES']._serialized_end=56261
+  _globals['_RECEIVEDBTCAGGREGATE']._serialized_start=56263
+  _globals['_RECEIVEDBTCAGGREGATE']._serialized_end=56361
+  _globals['_GETACCOUNTINGBLOCKSREQUEST']._serialized_start=56364
+  _globals['_GETACCOUNTINGBLOCKSREQUEST']._serialized_end=56529
+  _globals['_GETACCOUNTINGBLOCKSRESPONSE']._serialized_start=56532
+  _globals['_GETACCOUNTINGBLOCKSRESPONSE']._serialized_end=56674
+  _globals['_NEWACCOUNTINGBLOCKBROADCASTMESSAGE']._serialized_start=56676
+  _globals['_NEWACCOUNTINGBLOCKBROADCASTMESSAGE']._serialized_end=56801
+  _globals['_BASEBLOCK']._serialized_start=56804
+  _globals['_BASEBLOCK']._serialized_end=56996
+  _globals['_BSQBLOCKSTORE']._serialized_start=56998
+  _globals['_BSQBLOCKSTORE']._serialized_end=57061
+  _globals['_RAWBLOCK']._serialized_start=57063
+  _globals['_RAWBLOCK']._serialized_end=57119
+  _globals['_BLOCK']._serialized_start=57121
+  _globals['_BLOCK']._serialized_end=57170
+  _globals['_BASETX']._serialized_start=57173
+  _globals['_BASETX']._serialized_end=57414
+  _globals['_RAWTX']._serialized_start=57416
+  _globals['_RAWTX']._serialized_end=57482
+  _globals['_TX']._serialized_start=57484
+  _globals['_TX']._serialized_end=57608
+  _globals['_TXINPUT']._serialized_start=57610
+  _globals['_TXINPUT']._serialized_end=57706
+  _globals['_BASETXOUTPUT']._serialized_start=57709
+  _globals['_BASETXOUTPUT']._serialized_end=58012
+  _globals['_UNCONFIRMEDTXOUTPUT']._serialized_start=58014
+  _globals['_UNCONFIRMEDTXOUTPUT']._serialized_end=58080
+  _globals['_RAWTXOUTPUT']._serialized_start=58082
+  _globals['_RAWTXOUTPUT']._serialized_end=58095
+  _globals['_TXOUTPUT']._serialized_start=58097
+  _globals['_TXOUTPUT']._serialized_end=58214
+  _globals['_SPENTINFO']._serialized_start=58216
+  _globals['_SPENTINFO']._serialized_end=58285
+  _globals['_PUBKEYSCRIPT']._serialized_start=58288
+  _globals['_PUBKEYSCRIPT']._serialized_end=58419
+  _globals['_DAOPHASE']._serialized_start=58421
+  _globals['_DAOPHASE']._serialized_end=58472
+  _globals['_CYCLE']._serialized_start=58474
+  _globals['_CYCLE']._serialized_end=58562
+  _globals['_BASETXOUTPUTMAPENTRY']._serialized_start=58564
+  _globals['_BASETXOUTPUTMAPENTRY']._serialized_end=58649
+  _globals['_ISSUANCEMAPENTRY']._serialized_start=58651
+  _globals['_ISSUANCEMAPENTRY']._serialized_end=58728
+  _globals['_SPENTINFOMAPENTRY']._serialized_start=58730
+  _globals['_SPENTINFOMAPENTRY']._serialized_end=58809
+  _globals['_DAOSTATE']._serialized_start=58812
+  _globals['_DAOSTATE']._serialized_end=59422
+  _globals['_ISSUANCE']._serialized_start=59424
+  _globals['_ISSUANCE']._serialized_end=59527
+  _globals['_PROPOSAL']._serialized_start=59530
+  _globals['_PROPOSAL']._serialized_end=60202
+  _globals['_COMPENSATIONPROPOSAL']._serialized_start=60204
+  _globals['_COMPENSATIONPROPOSAL']._serialized_end=60270
+  _globals['_REIMBURSEMENTPROPOSAL']._serialized_start=60272
+  _globals['_REIMBURSEMENTPROPOSAL']._serialized_end=60339
+  _globals['_CHANGEPARAMPROPOSAL']._serialized_start=60341
+  _globals['_CHANGEPARAMPROPOSAL']._serialized_end=60398
+  _globals['_ROLEPROPOSAL']._serialized_start=60400
+  _globals['_ROLEPROPOSAL']._serialized_end=60504
+  _globals['_CONFISCATEBONDPROPOSAL']._serialized_start=60506
+  _globals['_CONFISCATEBONDPROPOSAL']._serialized_end=60552
+  _globals['_GENERICPROPOSAL']._serialized_start=60554
+  _globals['_GENERICPROPOSAL']._serialized_end=60571
+  _globals['_REMOVEASSETPROPOSAL']._serialized_start=60573
+  _globals['_REMOVEASSETPROPOSAL']._serialized_end=60617
+  _globals['_ROLE']._serialized_start=60619
+  _globals['_ROLE']._serialized_end=60692
+  _globals['_MYREPUTATION']._serialized_start=60694
+  _globals['_MYREPUTATION']._serialized_end=60735
+  _globals['_MYREPUTATIONLIST']._serialized_start=60737
+  _globals['_MYREPUTATIONLIST']._serialized_end=60813
+  _globals['_MYPROOFOFBURN']._serialized_start=60815
+  _globals['_MYPROOFOFBURN']._serialized_end=60864
+  _globals['_MYPROOFOFBURNLIST']._serialized_start=60866
+  _globals['_MYPROOFOFBURNLIST']._serialized_end=60947
+  _globals['_UNCONFIRMEDBSQCHANGEOUTPUTLIST']._serialized_start=60949
+  _globals['_UNCONFIRMEDBSQCHANGEOUTPUTLIST']._serialized_end=61054
+  _globals['_TEMPPROPOSALPAYLOAD']._serialized_start=61057
+  _globals['_TEMPPROPOSALPAYLOAD']._serialized_end=61215
+  _globals['_PROPOSALPAYLOAD']._serialized_start=61217
+  _globals['_PROPOSALPAYLOAD']._serialized_end=61297
+  _globals['_PROPOSALSTORE']._serialized_start=61299
+  _globals['_PROPOSALSTORE']._serialized_end=61367
+  _globals['_TEMPPROPOSALSTORE']._serialized_start=61369
+  _globals['_TEMPPROPOSALSTORE']._serialized_end=61447
+  _globals['_BALLOT']._serialized_start=61449
+  _globals['_BALLOT']._serialized_end=61547
+  _globals['_MYPROPOSALLIST']._serialized_start=61549
+  _globals['_MYPROPOSALLIST']._serialized_end=61614
+  _globals['_BALLOTLIST']._serialized_start=61616
+  _globals['_BALLOTLIST']._serialized_end=61673
+  _globals['_PARAMCHANGE']._serialized_start=61675
+  _globals['_PARAMCHANGE']._serialized_end=61756
+  _globals['_CONFISCATEBOND']._serialized_start=61758
+  _globals['_CONFISCATEBOND']._serialized_end=61796
+  _globals['_MYVOTE']._serialized_start=61799
+  _globals['_MYVOTE']._serialized_end=61993
+  _globals['_MYVOTELIST']._serialized_start=61995
+  _globals['_MYVOTELIST']._serialized_end=62053
+  _globals['_VOTEWITHPROPOSALTXID']._serialized_start=62055
+  _globals['_VOTEWITHPROPOSALTXID']._serialized_end=62142
+  _globals['_VOTEWITHPROPOSALTXIDLIST']._serialized_start=62144
+  _globals['_VOTEWITHPROPOSALTXIDLIST']._serialized_end=62227
+  _globals['_BLINDVOTE']._serialized_start=62230
+  _globals['_BLINDVOTE']._serialized_end=62397
+  _globals['_MYBLINDVOTELIST']._serialized_start=62399
+  _globals['_MYBLINDVOTELIST']._serialized_end=62468
+  _globals['_BLINDVOTESTORE']._serialized_start=62470
+  _globals['_BLINDVOTESTORE']._serialized_end=62540
+  _globals['_BLINDVOTEPAYLOAD']._serialized_start=62542
+  _globals['_BLINDVOTEPAYLOAD']._serialized_end=62626
+  _globals['_VOTE']._serialized_start=62628
+  _globals['_VOTE']._serialized_end=62652
+  _globals['_MERIT']._serialized_start=62654
+  _globals['_MERIT']._serialized_end=62729
+  _globals['_MERITLIST']._serialized_start=62731
+  _globals['_MERITLIST']._serialized_end=62785
+  _globals['_PROPOSALVOTERESULT']._serialized_start=62788
+  _globals['_PROPOSALVOTERESULT']._serialized_end=63006
+  _globals['_EVALUATEDPROPOSAL']._serialized_start=63008
+  _globals['_EVALUATEDPROPOSAL']._serialized_end=63119
+  _globals['_DECRYPTEDBALLOTSWITHMERITS']._serialized_start=63122
+  _globals['_DECRYPTEDBALLOTSWITHMERITS']._serialized_end=63357
+  _globals['_DAOSTATESTORE']._serialized_start=63360
+  _globals['_DAOSTATESTORE']._serialized_end=63552
+  _globals['_DAOSTATESNAPSHOTINDEX']._serialized_start=63555
+  _globals['_DAOSTATESNAPSHOTINDEX']._serialized_end=63786
+  _globals['_TXOUTPUTTYPEINDEXENTRY']._serialized_start=63788
+  _globals['_TXOUTPUTTYPEINDEXENTRY']._serialized_end=63895
+  _globals['_DAOSTATEHASH']._serialized_start=63897
+  _globals['_DAOSTATEHASH']._serialized_end=63989
+  _globals['_PROPOSALSTATEHASH']._serialized_start=63991
+  _globals['_PROPOSALSTATEHASH']._serialized_end=64086
+  _globals['_BLINDVOTESTATEHASH']._serialized_start=64088
+  _globals['_BLINDVOTESTATEHASH']._serialized_end=64186
+  _globals['_BLOCKCHAINEXPLORER']._serialized_start=64188
+  _globals['_BLOCKCHAINEXPLORER']._serialized_end=64259
+  _globals['_PAYMENTACCOUNT']._serialized_start=64262
+  _globals['_PAYMENTACCOUNT']._serialized_end=64660
+  _globals['_PAYMENTMETHOD']._serialized_start=64662
+  _globals['_PAYMENTMETHOD']._serialized_end=64740
+  _globals['_CURRENCY']._serialized_start=64742
+  _globals['_CURRENCY']._serialized_end=64775
+  _globals['_TRADECURRENCY']._serialized_start=64778
+  _globals['_TRADECURRENCY']._serialized_end=64956
+  _globals['_CRYPTOCURRENCY']._serialized_start=64958
+  _globals['_CRYPTOCURRENCY']._serialized_end=64992
+  _globals['_FIATCURRENCY']._serialized_start=64994
+  _globals['_FIATCURRENCY']._serialized_end=65057
+  _globals['_COUNTRY']._serialized_start=65059
+  _globals['_COUNTRY']._serialized_end=65141
+  _globals['_REGION']._serialized_start=65143
+  _globals['_REGION']._serialized_end=65179
+  _globals['_PRICEALERTFILTER']._serialized_start=65181
+  _globals['_PRICEALERTFILTER']._serialized_end=65249
+  _globals['_MARKETALERTFILTER']._serialized_start=65252
+  _globals['_MARKETALERTFILTER']._serialized_end=65397
+  _globals['_MOCKMAILBOXPAYLOAD']._serialized_start=65399
+  _globals['_MOCKMAILBOXPAYLOAD']._serialized_end=65512
+  _globals['_MOCKPAYLOAD']._serialized_start=65514
+  _globals['_MOCKPAYLOAD']._serialized_end=65569
+  _globals['_REPORTINGITEM']._serialized_start=65572
+  _globals['_REPORTINGITEM']._serialized_end=65880
+  _globals['_STRINGVALUEREPORTINGITEM']._serialized_start=65882
+  _globals['_STRINGVALUEREPORTINGITEM']._serialized_end=65923
+  _globals['_LONGVALUEREPORTINGITEM']._serialized_start=65925
+  _globals['_LONGVALUEREPORTINGITEM']._serialized_end=65964
+  _globals['_DOUBLEVALUEREPORTINGITEM']._serialized_start=65966
+  _globals['_DOUBLEVALUEREPORTINGITEM']._serialized_end=66007
+  _globals['_REPORTINGITEMS']._serialized_start=66009
+  _globals['_REPORTINGITEMS']._serialized_end=66102
+# @@protoc_insertion_point(module_scope)
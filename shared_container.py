@@ -54,6 +54,46 @@ class SharedContainer:
 
         return self._config
 
+    @property
+    def user_hibernation_service(self):
+        if self._user_hibernation_service is None:
+            from bisq.core.user.user_hibernation_service import (
+                UserHibernationPolicy,
+                UserHibernationService,
+            )
+
+            self._user_hibernation_service = UserHibernationService(
+                self._user_manager,
+                self,
+                UserHibernationPolicy.from_config(self.config),
+            )
+
+        return self._user_hibernation_service
+
+    @property
+    def user_worker_supervisor(self):
+        if self._user_worker_supervisor is None:
+            from bisq.daemon.worker.user_worker_supervisor import (
+                UserWorkerSupervisor,
+            )
+
+            self._user_worker_supervisor = UserWorkerSupervisor(self.config)
+
+        return self._user_worker_supervisor
+
+    @property
+    def shared_tor_manager(self):
+        if self._shared_tor_manager is None:
+            from bisq.core.network.p2p.network.shared_tor_manager import (
+                SharedTorManager,
+            )
+
+            tor_dir = self.config.app_data_dir.joinpath("shared_tor")
+            tor_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self._shared_tor_manager = SharedTorManager(self.config, tor_dir)
+
+        return self._shared_tor_manager
+
     @property
     def clock_watcher(self):
         if self._clock_watcher is None:
@@ -1,6 +1,11 @@
+import logging
 import math
 import unittest
-from bisq.common.crypto.equihash import Equihash, EquihashPuzzleSolution, count_all_solutions_for_nonce, deserialize_equihash_puzzle_solution, find_equihash_solution
+from unittest.mock import patch
+from bisq.common.crypto import equihash as equihash_module
+from bisq.common.crypto.equihash import Equihash, EquihashPuzzleSolution, count_all_solutions_for_nonce, deserialize_equihash_puzzle_solution, find_equihash_solution, find_equihash_solution_in_range
+from bisq.common.crypto.equihash_proof_of_work_service import EquihashProofOfWorkService
+from bisq.common.setup.log_setup import logger_context
 import time
 
 
@@ -81,6 +86,74 @@ class TestEquiHash(unittest.TestCase):
         java_solution = EquihashPuzzleSolution(equihash, seed, nonce, inputs)
         self.assertTrue(java_solution.verify())
         
+    @unittest.skipIf(equihash_module.equihash_numpy is None, "numpy not installed")
+    def test_numpy_solutions_match_pure_python(self):
+        equihash = Equihash(90, 5, 1.0)
+        seed = bytes(32)
+        for nonce in range(3):
+            with_prefix = equihash.with_hash_prefix(seed, nonce)
+            self.assertEqual(
+                sorted(with_prefix.stream_inputs_hits(use_numpy=False)),
+                sorted(with_prefix.stream_inputs_hits(use_numpy=True)),
+            )
+
+    def test_find_solution_in_range(self):
+        equihash = Equihash(90, 5, 2.0)
+        seed = bytes(32)
+        solution = find_equihash_solution(equihash, seed)
+        self.assertIsNone(find_equihash_solution_in_range(equihash, seed, 0, solution.nonce))
+        in_range = find_equihash_solution_in_range(equihash, seed, 0, solution.nonce + 1)
+        self.assertEqual(solution.serialize(), in_range.serialize())
+
+    def test_mint_across_workers(self):
+        with logger_context(logging.getLogger(__name__)):
+            service = EquihashProofOfWorkService(1)
+            try:
+                with patch.object(EquihashProofOfWorkService, "get_num_workers", return_value=2):
+                    # scaled to an adjusted difficulty of ~8, so the nonces get spread over the workers
+                    proof_of_work = service.mint(b"payload", b"challenge", 1.5e5).result(120)
+                self.assertTrue(service.verify(proof_of_work))
+                self.assertEqual(72, len(proof_of_work.solution))
+            finally:
+                service.shut_down()
+
+    @unittest.skipIf(equihash_module.equihash_numpy is None, "numpy not installed")
+    def test_numpy_is_faster_than_pure_python(self):
+        with_prefix = Equihash(90, 5, 1.0).with_hash_prefix(bytes(32), 0)
+        durations = {}
+        for use_numpy in (False, True):
+            start_time = time.perf_counter()
+            list(with_prefix.stream_inputs_hits(use_numpy))
+            durations[use_numpy] = time.perf_counter() - start_time
+        # about tenfold on a quiet machine, asserted with a margin for noisy ones
+        self.assertLess(durations[True] * 3, durations[False])
+
+    @unittest.skip("disabled")
+    def test_benchmark_filter_difficulties(self):
+        # pow difficulties the filter sets for offers, from the cheap 2 ** 8 to 2 ** 20
+        seed_count = 10
+        for log2_difficulty in (8, 15, 20):
+            difficulty = EquihashProofOfWorkService._scaled_difficulty(2.0 ** log2_difficulty)
+            equihash = Equihash(90, 5, difficulty)
+            for use_numpy in (False, True):
+                if use_numpy and equihash_module.equihash_numpy is None:
+                    continue
+                nonce_count = 0
+                start_time = time.time()
+                for i in range(seed_count):
+                    seed = bytes([0] * 28 + [0, 0, 0, i])
+                    nonce = 0
+                    while next(equihash.with_hash_prefix(seed, nonce).stream_inputs_hits(use_numpy), None) is None:
+                        nonce += 1
+                    nonce_count += nonce + 1
+                duration = time.time() - start_time
+                print(
+                    f"Difficulty 2 ** {log2_difficulty} (adjusted Equihash difficulty {difficulty:.2f}), "
+                    f"{'numpy' if use_numpy else 'pure python'}: "
+                    f"{int(duration * 1000 / seed_count)} ms per puzzle, "
+                    f"{int(duration * 1000 / nonce_count)} ms per nonce"
+                )
+
     @unittest.skip("disabled")
     def test_benchmark_find_solution(self):
         adjusted_difficulty = Equihash.adjust_difficulty(2.0)
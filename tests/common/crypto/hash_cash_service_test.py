@@ -5,8 +5,12 @@ import uuid
 import random
 import string
 import asyncio
+import logging
+from unittest.mock import patch
 from bisq.common.crypto.hash_cash_service import HashCashService
-from bisq.common.crypto.hash_cash_service_work import number_of_leading_zeros, to_num_leading_zeros
+from bisq.common.crypto.hash_cash_service_work import mint_range, number_of_leading_zeros, to_num_leading_zeros, to_sha256_hash
+from tests.common.crypto.hash_cash_test_utils import do_mint
+from bisq.common.setup.log_setup import logger_context
 from bisq.common.crypto.proof_of_work import ProofOfWork
 from utils.time import get_time_ms
 
@@ -31,6 +35,30 @@ class TestHashCashService(unittest.TestCase):
         self.assertEqual(8, to_num_leading_zeros(256.0))
         self.assertEqual(1024, to_num_leading_zeros(inf))
 
+    def test_mint_range_finds_lowest_counter(self):
+        payload = b"payload"
+        for log2_difficulty in range(10):
+            challenge = str(uuid.uuid4()).encode('utf-8')
+            counter = 1
+            while number_of_leading_zeros(to_sha256_hash(payload, challenge, counter)) <= log2_difficulty:
+                counter += 1
+            self.assertEqual(counter, mint_range(payload, challenge, log2_difficulty, 1, counter + 1))
+            self.assertIsNone(mint_range(payload, challenge, log2_difficulty, 1, counter))
+            self.assertEqual(counter, do_mint(payload, challenge, pow(2.0, log2_difficulty))[0])
+
+    def test_mint_across_workers(self):
+        with logger_context(logging.getLogger(__name__)):
+            hash_service = HashCashService()
+            try:
+                with patch.object(HashCashService, "get_num_workers", return_value=3):
+                    for log2_difficulty in (2, 16):
+                        challenge = str(uuid.uuid4()).encode('utf-8')
+                        proof_of_work = hash_service.mint(b"payload", challenge, pow(2.0, log2_difficulty)).result(60)
+                        self.assertTrue(hash_service.verify(proof_of_work))
+                        self.assertEqual(proof_of_work.counter.to_bytes(8, "big"), proof_of_work.solution)
+            finally:
+                hash_service.shut_down()
+
     def do_runs(self, log2_difficulty: int, string_builder: list):
         difficulty = pow(2.0, log2_difficulty)
         num_tokens = 1000
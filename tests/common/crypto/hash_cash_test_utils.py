@@ -0,0 +1,20 @@
+from bisq.common.crypto.hash_cash_service_work import (
+    MINT_BATCH_SIZE,
+    mint_range,
+    to_num_leading_zeros,
+)
+
+
+def do_mint(payload: bytes, challenge: bytes, difficulty: float) -> tuple[int, bytes]:
+    """Mints in the calling thread. HashCashService.mint spreads the same search over processes."""
+    log2_difficulty = to_num_leading_zeros(difficulty)
+    start = 1
+    while True:
+        counter = mint_range(
+            payload, challenge, log2_difficulty, start, start + MINT_BATCH_SIZE
+        )
+        if counter is not None:
+            break
+        start += MINT_BATCH_SIZE
+
+    return counter, counter.to_bytes(8, "big", signed=True)
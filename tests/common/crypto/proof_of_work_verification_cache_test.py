@@ -0,0 +1,83 @@
+import logging
+import unittest
+from unittest.mock import patch
+from bisq.common.crypto.hash_cash_service import HashCashService
+from bisq.common.crypto.proof_of_work import ProofOfWork
+from bisq.common.crypto.proof_of_work_service import ProofOfWorkService
+from bisq.common.crypto.proof_of_work_verification_cache import ProofOfWorkVerificationCache
+from bisq.common.setup.log_setup import logger_context
+from tests.common.crypto.hash_cash_test_utils import do_mint
+
+
+def mint(challenge: bytes, difficulty: float = 16.0) -> ProofOfWork:
+    counter, solution = do_mint(b"payload", challenge, difficulty)
+    return ProofOfWork(b"payload", counter, challenge, difficulty, 0, solution, 0)
+
+
+class TestProofOfWorkVerificationCache(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logging.getLogger(__name__))
+        self.logger_context.__enter__()
+        self.cache_patch = patch.object(ProofOfWorkService, "verification_cache", ProofOfWorkVerificationCache(max_size=3))
+        self.cache_patch.start()
+        self.service = HashCashService()
+
+    def tearDown(self):
+        self.cache_patch.stop()
+        self.logger_context.__exit__(None, None, None)
+
+    def test_verify_uses_cache(self):
+        proof_of_work = mint(b"challenge")
+        with patch.object(HashCashService, "do_verify", wraps=self.service.do_verify) as do_verify:
+            self.assertTrue(self.service.verify(proof_of_work))
+            self.assertTrue(self.service.verify(mint(b"challenge")))
+            self.assertEqual(1, do_verify.call_count)
+
+            # a tampered counter is a different proof
+            proof_of_work.counter += 1
+            proof_of_work.solution = proof_of_work.counter.to_bytes(8, "big")
+            self.assertEqual(self.service.do_verify(proof_of_work), self.service.verify(proof_of_work))
+            self.assertEqual(3, do_verify.call_count)
+
+    def test_cache_is_bounded(self):
+        cache = ProofOfWorkService.verification_cache
+        proofs = [mint(f"challenge{i}".encode()) for i in range(5)]
+        for proof_of_work in proofs:
+            self.service.verify(proof_of_work)
+        self.assertEqual(3, len(cache))
+        self.assertIsNone(cache.get(ProofOfWorkVerificationCache.get_key(0, proofs[0])))
+        self.assertTrue(cache.get(ProofOfWorkVerificationCache.get_key(0, proofs[4])))
+        # verdicts are kept per service version
+        self.assertIsNone(cache.get(ProofOfWorkVerificationCache.get_key(1, proofs[4])))
+
+    def test_verify_batch(self):
+        valid = mint(b"valid")
+        invalid = ProofOfWork(b"payload", 0, b"invalid", 2.0 ** 20, 0, bytes(8), 0)
+        with patch.object(HashCashService, "do_verify", wraps=self.service.do_verify) as do_verify:
+            self.assertEqual(
+                [True, False, True, False],
+                self.service.verify_batch([valid, invalid, mint(b"valid"), invalid]),
+            )
+            self.assertEqual(2, do_verify.call_count)
+            self.assertEqual([True], self.service.verify_batch([valid]))
+            self.assertEqual(2, do_verify.call_count)
+
+    def test_verify_all_with_ids_matches_verify_with_ids(self):
+        proof_of_work = mint(self.service.get_challenge("offer", "owner"))
+        proofs_with_ids = [
+            (proof_of_work, "offer", "owner"),
+            (proof_of_work, "other offer", "owner"),
+            (mint(self.service.get_challenge("offer", "owner"), 1.0), "offer", "owner"),
+        ]
+        expected = [
+            self.service.verify_with_ids(*proof_with_ids, 16.0)
+            for proof_with_ids in proofs_with_ids
+        ]
+        self.assertEqual([True, False, False], expected)
+        self.assertEqual(
+            expected, self.service.verify_all_with_ids(proofs_with_ids, 16.0)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import contextvars
+from datetime import timedelta
+import unittest
+
+from bisq.common import timing_wheel
+from bisq.common.timing_wheel import TimingWheel
+
+user_var = contextvars.ContextVar("user_var", default=None)
+
+
+class FakeClock:
+    def __init__(self, now: int = 1_000_000):
+        self.now = now
+
+    def millis(self):
+        return self.now
+
+
+class FakeTimer:
+    def __init__(self, factory: "FakeTimerFactory", runnable, delay: timedelta):
+        self.factory = factory
+        self.runnable = runnable
+        self.due = factory.clock.now + int(delay.total_seconds() * 1000)
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeTimerFactory:
+    """Stands in for UserThread.run_after and fires the wakeups when the time advances."""
+
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+        self.timers: list[FakeTimer] = []
+
+    def __call__(self, runnable, delay: timedelta):
+        timer = FakeTimer(self, runnable, delay)
+        self.timers.append(timer)
+        return timer
+
+    @property
+    def pending(self) -> list[FakeTimer]:
+        return [timer for timer in self.timers if not timer.stopped]
+
+    def advance(self, ms: int):
+        end = self.clock.now + ms
+        while True:
+            due = [t for t in self.pending if t.due <= end]
+            if not due:
+                break
+            timer = min(due, key=lambda t: t.due)
+            self.clock.now = max(self.clock.now, timer.due)
+            timer.stopped = True
+            timer.runnable()
+        self.clock.now = end
+
+
+class TimingWheelTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timers = FakeTimerFactory(self.clock)
+        self.wheel = TimingWheel(
+            tick_ms=100, num_slots=16, clock=self.clock, timer_factory=self.timers
+        )
+        self.calls = []
+
+    def record(self, name):
+        return lambda: self.calls.append((name, self.clock.now))
+
+    def test_timers_of_same_tick_share_a_wakeup(self):
+        for i in range(100):
+            self.wheel.run_after(self.record(i), timedelta(milliseconds=1 + i % 50))
+        self.assertEqual(1, len(self.timers.pending))
+
+        self.timers.advance(99)
+        self.assertEqual([], self.calls)
+        self.timers.advance(1)
+        self.assertEqual(list(range(100)), [name for name, _ in self.calls])
+        self.assertEqual(1, self.wheel.num_wakeups)
+        self.assertEqual(0, len(self.wheel))
+        self.assertEqual([], self.timers.pending)
+
+    def test_random_delays_keep_their_range(self):
+        for i in range(500):
+            self.wheel.run_after_random_delay(
+                self.record(i), timedelta(milliseconds=1), timedelta(seconds=1)
+            )
+        start = self.clock.now
+        self.timers.advance(2000)
+        delays = [now - start for _, now in self.calls]
+        self.assertEqual(500, len(delays))
+        self.assertTrue(all(0 < delay <= 1000 for delay in delays))
+        # spread over all ticks of the range, with one wakeup per tick
+        self.assertEqual(10, len(set(delays)))
+        self.assertEqual(10, self.wheel.num_wakeups)
+
+    def test_delays_longer_than_a_round(self):
+        # a round of the wheel is 1.6 sec
+        self.wheel.run_after(self.record("late"), timedelta(seconds=5))
+        self.wheel.run_after(self.record("early"), timedelta(milliseconds=300))
+        self.timers.advance(4999)
+        self.assertEqual([("early", 1_000_300)], self.calls)
+        self.timers.advance(1)
+        self.assertEqual(("late", 1_005_000), self.calls[-1])
+
+    def test_periodic_timer_and_stop(self):
+        timer = self.wheel.run_periodically(self.record("p"), timedelta(seconds=1))
+        self.timers.advance(3500)
+        self.assertEqual([1_001_000, 1_002_000, 1_003_000], [t for _, t in self.calls])
+        timer.stop()
+        self.assertEqual(0, len(self.wheel))
+        self.assertEqual([], self.timers.pending)
+        self.timers.advance(5000)
+        self.assertEqual(3, len(self.calls))
+
+    def test_stopped_timer_does_not_run(self):
+        stopped = self.wheel.run_after(self.record("stopped"), timedelta(seconds=1))
+        self.wheel.run_after(self.record("other"), timedelta(seconds=1))
+        stopped.stop()
+        self.timers.advance(1000)
+        self.assertEqual(["other"], [name for name, _ in self.calls])
+
+    def test_timer_can_stop_another_timer_of_same_tick(self):
+        second = None
+        first = self.wheel.run_after(lambda: second.stop(), timedelta(seconds=1))
+        second = self.wheel.run_after(self.record("second"), timedelta(seconds=1))
+        self.timers.advance(1000)
+        self.assertEqual([], self.calls)
+        self.assertIsNotNone(first)
+
+    def test_failing_timer_does_not_stop_others(self):
+        def fail():
+            raise ValueError("expected")
+
+        self.wheel.run_after(fail, timedelta(seconds=1))
+        self.wheel.run_after(self.record("ok"), timedelta(seconds=1))
+        with self.assertLogs(timing_wheel.logger, level="ERROR"):
+            self.timers.advance(1000)
+        self.assertEqual(["ok"], [name for name, _ in self.calls])
+
+    def test_timers_run_in_their_context(self):
+        def schedule(user):
+            user_var.set(user)
+            self.wheel.run_after(
+                lambda: self.calls.append(user_var.get()), timedelta(seconds=1)
+            )
+
+        contextvars.copy_context().run(schedule, "alice")
+        contextvars.copy_context().run(schedule, "bob")
+        self.timers.advance(1000)
+        self.assertEqual(["alice", "bob"], self.calls)
+        self.assertIsNone(user_var.get())
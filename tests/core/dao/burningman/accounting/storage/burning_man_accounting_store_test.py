@@ -0,0 +1,204 @@
+import logging
+from pathlib import Path
+import tempfile
+import unittest
+
+from bisq.common.persistence.persistence_manager_source import PersistenceManagerSource
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.dao.burningman.accounting.blockchain.accounting_block import (
+    AccountingBlock,
+)
+from bisq.core.dao.burningman.accounting.blockchain.accounting_tx import AccountingTx
+from bisq.core.dao.burningman.accounting.blockchain.accounting_tx_output import (
+    AccountingTxOutput,
+)
+from bisq.core.dao.burningman.accounting.blockchain.accounting_tx_type import (
+    AccountingTxType,
+)
+from bisq.core.dao.burningman.accounting.exceptions.block_hash_not_connecting_exception import (
+    BlockHashNotConnectingException,
+)
+from bisq.core.dao.burningman.accounting.exceptions.block_height_not_connecting_exception import (
+    BlockHeightNotConnectingException,
+)
+from bisq.core.dao.burningman.accounting.storage.burning_man_accounting_journal import (
+    BurningManAccountingJournal,
+)
+from bisq.core.dao.burningman.accounting.storage.burning_man_accounting_store import (
+    BurningManAccountingStore,
+)
+from bisq.core.dao.burningman.burning_man_accounting_const import (
+    BurningManAccountingConst,
+)
+import pb_pb2 as protobuf
+
+logger = logging.getLogger(__name__)
+
+NUM_BLOCKS = 100_000
+
+
+def block_hash(height: int, fork: int = 0) -> bytes:
+    # the blocks from the fork height on get other hashes
+    if fork and height >= fork:
+        return b"f" + height.to_bytes(3, "big")
+    return height.to_bytes(4, "big")
+
+
+def new_block(height: int, fork: int = 0) -> AccountingBlock:
+    return AccountingBlock(
+        height=height,
+        time_in_sec=1_600_000_000 + height * 600,
+        truncated_hash=block_hash(height, fork),
+        truncated_previous_block_hash=block_hash(height - 1, fork),
+        txs=(
+            AccountingTx(
+                AccountingTxType.BTC_TRADE_FEE_TX,
+                (AccountingTxOutput(height % 1000, "bm"),),
+                height.to_bytes(4, "big"),
+            ),
+        ),
+    )
+
+
+def new_chain(num_blocks: int, fork: int = 0) -> list[AccountingBlock]:
+    first = BurningManAccountingConst.EARLIEST_BLOCK_HEIGHT
+    return [new_block(height, fork) for height in range(first, first + num_blocks)]
+
+
+class SnapshotPersistenceManager:
+    """Writes the snapshot like the PersistenceManager, without backups and threads."""
+
+    def __init__(self, dir: Path):
+        self.dir = dir
+        self.file_name = "BurningManAccountingStore_v3"
+        self.source = PersistenceManagerSource.NETWORK
+        self.storage_file = dir.joinpath(self.file_name)
+        self.persistable: BurningManAccountingStore = None
+        self.num_writes = 0
+
+    def persist_now(self, complete_handler):
+        self.num_writes += 1
+        serialized = self.persistable.to_persistable_message()
+        temp_file = self.dir.joinpath("temp_" + self.file_name)
+        temp_file.write_bytes(serialized.SerializeToString())
+        temp_file.rename(self.storage_file)
+        complete_handler()
+
+    def get_persisted(self) -> BurningManAccountingStore:
+        if not self.storage_file.exists():
+            return BurningManAccountingStore([])
+        proto = protobuf.PersistableEnvelope.FromString(
+            self.storage_file.read_bytes()
+        )
+        return BurningManAccountingStore.from_proto(proto.burning_man_accounting_store)
+
+
+class BurningManAccountingStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.dir = Path(self.temp_dir.name)
+        self.first = BurningManAccountingConst.EARLIEST_BLOCK_HEIGHT
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def new_journal(self) -> BurningManAccountingJournal:
+        persistence_manager = SnapshotPersistenceManager(self.dir)
+        store = persistence_manager.get_persisted()
+        persistence_manager.persistable = store
+        journal = BurningManAccountingJournal(persistence_manager, store)
+        journal.replay()
+        return journal
+
+    def test_sync_of_100k_blocks(self):
+        chain = new_chain(NUM_BLOCKS)
+        store = BurningManAccountingStore([])
+        for block in chain:
+            self.assertTrue(store.add_if_new_block(block))
+        self.assertFalse(store.add_if_new_block(chain[500]))
+
+        self.assertEqual(NUM_BLOCKS, len(store))
+        self.assertIs(chain[-1], store.get_last_block())
+        self.assertIs(chain[12_345], store.get_block_at_height(self.first + 12_345))
+        self.assertIsNone(store.get_block_at_height(self.first - 1))
+        self.assertEqual(
+            chain[-100:], store.get_blocks_at_least_with_height(chain[-100].height)
+        )
+        self.assertEqual(chain, store.get_blocks_at_least_with_height(0))
+
+        with self.assertRaises(BlockHeightNotConnectingException):
+            store.add_if_new_block(new_block(chain[-1].height + 2))
+        with self.assertRaises(BlockHashNotConnectingException):
+            store.add_if_new_block(new_block(chain[-1].height + 1, fork=1))
+
+        store.purge_last_ten_blocks()
+        self.assertIs(chain[-11], store.get_last_block())
+        self.assertIsNone(store.get_block_at_height(chain[-1].height))
+        store.add_if_new_block(chain[-10])
+        self.assertIs(chain[-10], store.get_last_block())
+
+    def test_new_blocks_are_appended_to_journal(self):
+        chain = new_chain(NUM_BLOCKS)
+        journal = self.new_journal()
+        for block in chain[:1000]:
+            journal.store.add_if_new_block(block)
+            journal.append(block)
+        journal.compact()
+        for block in chain[1000:]:
+            journal.store.add_if_new_block(block)
+            journal.append(block)
+        journal.shut_down()
+
+        # The blocks added after the snapshot are only in the journal
+        self.assertEqual(1, journal.persistence_manager.num_writes)
+        self.assertEqual([1], journal.get_generations())
+        self.assertEqual(1000, len(journal.persistence_manager.get_persisted()))
+
+        restarted = self.new_journal()
+        self.assertEqual(NUM_BLOCKS - 1000, restarted.num_records)
+        self.assertEqual(chain, restarted.store.blocks)
+        self.assertEqual(2, restarted.generation)
+        restarted.shut_down()
+
+    def test_removed_blocks_are_not_replayed(self):
+        chain = new_chain(100)
+        journal = self.new_journal()
+        for block in chain:
+            journal.store.add_if_new_block(block)
+            journal.append(block)
+        journal.flush()
+        journal.store.purge_last_ten_blocks()
+        journal.compact()
+        # A reorg replaces the purged blocks
+        fork = new_chain(100, fork=chain[-10].height)
+        for block in fork[-10:]:
+            journal.store.add_if_new_block(block)
+            journal.append(block)
+        journal.shut_down()
+
+        # A journal file which was not deleted after the compaction is ignored
+        journal._append(
+            journal.get_file(0), [block.to_proto_message() for block in chain[-10:]]
+        )
+        restarted = self.new_journal()
+        self.assertEqual(fork, restarted.store.blocks)
+        self.assertEqual(10, restarted.num_records)
+        restarted.shut_down()
+        self.assertEqual([1], restarted.get_generations())
+
+    def test_incomplete_last_record_is_ignored(self):
+        chain = new_chain(10)
+        journal = self.new_journal()
+        for block in chain:
+            journal.store.add_if_new_block(block)
+            journal.append(block)
+        journal.shut_down()
+        with journal.get_file(0).open("ab") as file_out:
+            file_out.write(b"\x40\x08")
+
+        restarted = self.new_journal()
+        self.assertEqual(chain, restarted.store.blocks)
+        restarted.shut_down()
@@ -0,0 +1,242 @@
+from datetime import datetime
+import logging
+import random
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.dao.burningman.accounting.balance.balance_entry_type import (
+    BalanceEntryType,
+)
+from bisq.core.dao.burningman.accounting.balance.received_btc_aggregates import (
+    ReceivedBtcAggregates,
+)
+from bisq.core.dao.burningman.accounting.blockchain.accounting_block import (
+    AccountingBlock,
+)
+from bisq.core.dao.burningman.accounting.blockchain.accounting_tx import AccountingTx
+from bisq.core.dao.burningman.accounting.blockchain.accounting_tx_output import (
+    AccountingTxOutput,
+)
+from bisq.core.dao.burningman.accounting.blockchain.accounting_tx_type import (
+    AccountingTxType,
+)
+from bisq.core.dao.burningman.accounting.storage.burning_man_accounting_store import (
+    BurningManAccountingStore,
+)
+from bisq.core.dao.burningman.burning_man_accounting_const import (
+    BurningManAccountingConst,
+)
+from bisq.core.dao.burningman.burning_man_accounting_service import (
+    BurningManAccountingService,
+)
+from bisq.core.dao.burningman.burning_man_presentation_service import (
+    BurningManPresentationService,
+)
+from bisq.core.monetary.price import Price
+import pb_pb2 as protobuf
+
+logger = logging.getLogger(__name__)
+
+NAMES = [
+    "alice",
+    "bob",
+    "carol",
+    BurningManPresentationService.LEGACY_BURNING_MAN_DPT_NAME,
+    BurningManPresentationService.LEGACY_BURNING_MAN_BTC_FEES_NAME,
+]
+# 2 blocks a day from Nov 2020 on
+START_TIME_IN_SEC = 1_604_800_000
+BLOCK_INTERVAL_IN_SEC = 12 * 3600
+
+
+def new_chain(num_blocks: int, rnd: random.Random) -> list[AccountingBlock]:
+    first = BurningManAccountingConst.EARLIEST_BLOCK_HEIGHT
+    blocks = []
+    for height in range(first, first + num_blocks):
+        txs = []
+        for i in range(rnd.randint(0, 3)):
+            outputs = tuple(
+                AccountingTxOutput(
+                    rnd.choice([10**6, 10**7, rnd.randint(1, 10**9)]), name
+                )
+                for name in rnd.choices(NAMES, k=rnd.randint(1, 4))
+            )
+            txs.append(
+                AccountingTx(
+                    rnd.choice(list(AccountingTxType)),
+                    outputs,
+                    (height * 4 + i).to_bytes(4, "big"),
+                )
+            )
+        blocks.append(
+            AccountingBlock(
+                height=height,
+                time_in_sec=START_TIME_IN_SEC
+                + (height - first) * BLOCK_INTERVAL_IN_SEC,
+                truncated_hash=height.to_bytes(4, "big"),
+                truncated_previous_block_hash=(height - 1).to_bytes(4, "big"),
+                txs=tuple(txs),
+            )
+        )
+    return blocks
+
+
+class FakeStoreService:
+    def __init__(self, store: BurningManAccountingStore):
+        self.store = store
+
+    def add_if_new_block(self, block):
+        self.store.add_if_new_block(block)
+
+    def purge_last_ten_blocks(self):
+        return self.store.purge_last_ten_blocks()
+
+    def get_last_block(self):
+        return self.store.get_last_block()
+
+    def get_blocks_at_least_with_height(self, min_height):
+        return self.store.get_blocks_at_least_with_height(min_height)
+
+    def get_received_btc_aggregates(self):
+        return self.store.received_btc_aggregates
+
+
+class BurningManAccountingServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        rnd = random.Random(42)
+        self.chain = new_chain(3000, rnd)
+        self.store = BurningManAccountingStore([])
+        self.service = BurningManAccountingService(
+            dao_state_service=None,
+            burning_man_accounting_store_service=FakeStoreService(self.store),
+            burning_man_presentation_service=SimpleNamespace(
+                get_burning_man_candidates_by_name=lambda: {}
+            ),
+            trade_statistics_manager=None,
+            preferences=None,
+        )
+        # the historical prices are followed by the prices of the later months
+        prices = self.service._average_bsq_price_by_month
+        month = datetime(2022, 12, 1)
+        while month < datetime(2025, 1, 1):
+            price = rnd.choice([0, 20_000_000, 33_333_333, 45_000_000])
+            prices[month] = Price.value_of("BSQ", price)
+            month = datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+        self.service._average_prices_valid = True
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def add_blocks(self, blocks):
+        for block in blocks:
+            self.service.add_block(block)
+            self.service.on_new_block_received(block)
+
+    def get_balance_models(self, blocks):
+        balance_models = {}
+        for block in blocks:
+            self.service._add_accounting_block_to_balance_model(balance_models, block)
+        return balance_models
+
+    def assert_same_totals_as_balance_entries(self, blocks):
+        """Compares with the totals summed up over the balance entries of all blocks."""
+        entries = [
+            entry
+            for name, balance_model in self.get_balance_models(blocks).items()
+            if name not in ReceivedBtcAggregates.LEGACY_BURNING_MAN_NAMES
+            for entry in balance_model.received_btc_balance_entries
+        ]
+        prices = self.service.get_average_bsq_price_by_month()
+
+        def as_bsq(entry):
+            return BurningManAccountingService._received_btc_as_bsq(
+                entry.amount, prices.get(entry.month)
+            )
+
+        fees = [e for e in entries if e.type == BalanceEntryType.BTC_TRADE_FEE_TX]
+        dpt = [e for e in entries if e.type == BalanceEntryType.DPT_TX]
+        service = self.service
+        self.assertEqual(
+            sum(e.amount for e in entries), service.get_total_amount_of_distributed_btc()
+        )
+        self.assertEqual(
+            sum(e.amount for e in fees),
+            service.get_total_amount_of_distributed_btc_fees(),
+        )
+        self.assertEqual(
+            sum(e.amount for e in dpt), service.get_total_amount_of_distributed_dpt()
+        )
+        self.assertEqual(
+            sum(map(as_bsq, entries)), service.get_total_amount_of_distributed_bsq()
+        )
+        self.assertEqual(
+            sum(map(as_bsq, fees)),
+            service.get_total_amount_of_distributed_btc_fees_as_bsq(),
+        )
+        self.assertEqual(
+            sum(map(as_bsq, dpt)),
+            service.get_total_amount_of_distributed_dpt_as_bsq(),
+        )
+        month = datetime(2021, 6, 1)
+        self.assertEqual(
+            sum(e.amount for e in service.get_distributed_btc_balance_by_month(month)),
+            service.get_total_amount_of_distributed_btc_by_month(month),
+        )
+        self.assertGreater(service.get_total_amount_of_distributed_bsq(), 0)
+
+    def test_totals_are_updated_with_the_blocks(self):
+        self.add_blocks(self.chain[:2000])
+        self.assert_same_totals_as_balance_entries(self.chain[:2000])
+        self.add_blocks(self.chain[2000:])
+        self.assert_same_totals_as_balance_entries(self.chain)
+        self.assertEqual(
+            self.get_balance_models(self.chain),
+            self.service.balance_model_by_burning_man_name,
+        )
+
+    def test_purged_blocks_are_removed(self):
+        self.add_blocks(self.chain)
+        self.service.purge_last_ten_blocks()
+        self.service.purge_last_ten_blocks()
+        self.assert_same_totals_as_balance_entries(self.chain[:-20])
+        self.assertEqual(
+            self.get_balance_models(self.chain[:-20]),
+            self.service.balance_model_by_burning_man_name,
+        )
+
+        self.add_blocks(self.chain[-20:])
+        self.assert_same_totals_as_balance_entries(self.chain)
+        self.assertEqual(
+            ReceivedBtcAggregates.from_blocks(self.chain),
+            self.store.received_btc_aggregates,
+        )
+
+    def test_aggregates_are_persisted_with_the_store(self):
+        self.add_blocks(self.chain)
+        proto = self.store.to_proto_message().burning_man_accounting_store
+        loaded = BurningManAccountingStore.from_proto(
+            protobuf.BurningManAccountingStore.FromString(proto.SerializeToString())
+        )
+        self.assertEqual(
+            self.store.received_btc_aggregates, loaded.received_btc_aggregates
+        )
+        balance_model = self.get_balance_models(self.chain)["alice"]
+        amounts = loaded.received_btc_aggregates.get_amounts_by_month_of_burning_man(
+            "alice"
+        )
+        self.assertGreater(len(amounts), 12)
+        for (month, entry_type), amount in amounts.items():
+            entries = balance_model.get_received_btc_balance_entries_by_month(month)
+            self.assertEqual(
+                sum(e.amount for e in entries if e.type == entry_type), amount
+            )
+
+        # Stores written before the aggregates got added rebuild them from the blocks
+        proto.ClearField("received_btc_aggregates")
+        loaded = BurningManAccountingStore.from_proto(proto)
+        self.assertEqual(
+            self.store.received_btc_aggregates, loaded.received_btc_aggregates
+        )
@@ -0,0 +1,241 @@
+from dataclasses import dataclass
+import logging
+import random
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.dao.governance.asset.asset_consensus import AssetConsensus
+from bisq.core.dao.governance.asset.asset_service import AssetService
+from bisq.core.dao.governance.asset.asset_state import AssetState
+from bisq.core.dao.governance.asset.trade_volume_aggregates import (
+    TradeVolumeAggregates,
+)
+from bisq.core.dao.state.model.blockchain.tx_output_type import TxOutputType
+from bisq.core.dao.state.model.blockchain.tx_type import TxType
+from bisq.core.dao.state.model.governance.remove_asset_proposal import (
+    RemoveAssetProposal,
+)
+from bitcoinj.base.coin import Coin
+from utils.data import ObservableSet
+from utils.time import get_time_ms
+
+logger = logging.getLogger(__name__)
+
+DAY_IN_MS = TradeVolumeAggregates.DAY_IN_MS
+
+
+@dataclass(eq=False)
+class FakeTradeStatistics:
+    currency: str
+    amount: int
+    date: int
+
+
+def new_trade_statistics(rnd: random.Random, now: int, num: int):
+    return [
+        FakeTradeStatistics(
+            currency=rnd.choice(["XMR", "ETH", "USD"]),
+            amount=rnd.randint(1, 10**8),
+            date=now - rnd.randint(-DAY_IN_MS, 200 * DAY_IN_MS),
+        )
+        for _ in range(num)
+    ]
+
+
+def get_trade_volume(trade_statistics, currency: str, lookup_date: int) -> int:
+    if currency == "USD":
+        # Only the volumes of crypto currencies are aggregated
+        return 0
+    return sum(
+        e.amount
+        for e in trade_statistics
+        if e.currency == currency and e.date > lookup_date
+    )
+
+
+class FakeDaoStateService:
+    def __init__(self):
+        self.chain_height = 0
+        self.txs = {}
+        self.evaluated_proposals = []
+        self.listeners = []
+
+    def add_dao_state_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_dao_state_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def get_tx(self, tx_id):
+        return self.txs.get(tx_id, None)
+
+    def get_asset_listing_fee_op_return_tx_outputs(self):
+        return [
+            tx_output
+            for tx in self.txs.values()
+            for tx_output in tx.tx_outputs
+            if tx_output.tx_output_type
+            == TxOutputType.ASSET_LISTING_FEE_OP_RETURN_OUTPUT
+        ]
+
+    def get_evaluated_proposal_list(self):
+        return self.evaluated_proposals
+
+    def get_param_value_as_coin(self, param, block_height):
+        return Coin.value_of(100)
+
+    def add_block(self, height: int, txs: list):
+        self.chain_height = height
+        for tx in txs:
+            self.txs[tx.id] = tx
+        return SimpleNamespace(height=height, get_txs=lambda: tuple(txs))
+
+
+class TradeVolumeAggregatesTest(unittest.TestCase):
+    def test_trade_volume_is_same_as_of_trade_statistics(self):
+        rnd = random.Random(7)
+        now = get_time_ms()
+        trade_statistics = new_trade_statistics(rnd, now, 3000)
+        aggregates = TradeVolumeAggregates()
+        aggregates.add_all(trade_statistics)
+
+        removed = trade_statistics[:1000]
+        aggregates.remove_all(removed)
+        # Removing unknown trades has no effect
+        aggregates.remove_all(removed[:10])
+        trade_statistics = trade_statistics[1000:]
+
+        for look_back_in_days in [0, 1, 3, 30, 120, 365, 10000]:
+            lookup_date = now - look_back_in_days * DAY_IN_MS - rnd.randint(0, 10**6)
+            for currency in ["XMR", "ETH", "USD", "BTC"]:
+                self.assertEqual(
+                    get_trade_volume(trade_statistics, currency, lookup_date),
+                    aggregates.get_trade_volume(currency, lookup_date),
+                )
+        self.assertEqual(0, aggregates.get_trade_volume("USD", 0))
+        self.assertGreater(aggregates.get_trade_volume("XMR", 0), 0)
+
+        aggregates.remove_all(trade_statistics)
+        self.assertEqual(0, aggregates.get_trade_volume("XMR", 0))
+
+
+class AssetServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.dao_state_service = FakeDaoStateService()
+        self.trade_statistics_manager = SimpleNamespace(
+            observable_trade_statistics_set=ObservableSet()
+        )
+        self.service = AssetService(
+            bsq_wallet_service=None,
+            btc_wallet_service=None,
+            wallets_manager=None,
+            trade_statistics_manager=self.trade_statistics_manager,
+            dao_state_service=self.dao_state_service,
+            bsq_formatter=None,
+        )
+        self.assets = {
+            asset.ticker_symbol: asset for asset in self.service.get_stateful_assets()
+        }
+
+    def tearDown(self):
+        self.service.shut_down()
+        self.logger_context.__exit__(None, None, None)
+
+    def new_fee_tx(self, ticker_symbol: str, tx_id: str, fee: int, height: int):
+        op_return_data = AssetConsensus.get_op_return_data(
+            AssetConsensus.get_hash(self.assets[ticker_symbol])
+        )
+        return SimpleNamespace(
+            id=tx_id,
+            time=height * 600_000,
+            block_height=height,
+            tx_type=TxType.ASSET_LISTING_FEE,
+            burnt_fee=fee,
+            tx_outputs=[
+                SimpleNamespace(
+                    tx_id=tx_id,
+                    tx_output_type=TxOutputType.ASSET_LISTING_FEE_OP_RETURN_OUTPUT,
+                    op_return_data=op_return_data,
+                )
+            ],
+        )
+
+    def test_fee_payments_are_indexed_at_the_blocks(self):
+        self.service.add_listeners()
+        for height in range(1, 6):
+            block = self.dao_state_service.add_block(
+                height,
+                [
+                    self.new_fee_tx("XMR", f"xmr{height}", 1000 * height, height),
+                    self.new_fee_tx("ETH", f"eth{height}", 100, height),
+                ],
+            )
+            self.service.on_parse_block_complete(block)
+
+        xmr = self.assets["XMR"]
+        self.assertEqual(
+            [f"xmr{height}" for height in range(1, 6)],
+            [tx.id for tx in self.service._get_fee_txs(xmr)],
+        )
+        indexed = dict(self.service._fee_txs_by_op_return_data)
+        # A reorg replaces the last block
+        block = self.dao_state_service.add_block(
+            5, [self.new_fee_tx("XMR", "xmr5", 5000, 5)]
+        )
+        self.dao_state_service.txs.pop("eth5")
+        self.service.on_parse_block_complete(block)
+        self.assertEqual(5, len(self.service._get_fee_txs(xmr)))
+        self.assertEqual(4, len(self.service._get_fee_txs(self.assets["ETH"])))
+        self.assertNotEqual(indexed, self.service._fee_txs_by_op_return_data)
+
+        self.service._bsq_fee_per_day = 100
+        self.service._min_volume_in_btc = 10**6
+        self.service.update_asset_states()
+        self.assertEqual(AssetState.IN_TRIAL_PERIOD, xmr.asset_state)
+        self.assertEqual(50, xmr.look_back_period_in_days)
+        self.assertEqual(15000, xmr.get_total_fees_paid())
+        self.assertEqual(AssetState.DE_LISTED, self.assets["LTC"].asset_state)
+
+    def test_asset_states_use_the_trade_volumes_and_removed_assets(self):
+        now = get_time_ms()
+        trade_statistics = self.trade_statistics_manager.observable_trade_statistics_set
+        trade_statistics.add(FakeTradeStatistics(currency="LTC", amount=10**6, date=now))
+        self.service.add_listeners()
+        trade_statistics.update(
+            [
+                FakeTradeStatistics(currency="ETH", amount=10**6, date=now - DAY_IN_MS),
+                # too old for the default look back period of 120 days
+                FakeTradeStatistics(
+                    currency="XMR", amount=10**6, date=now - 121 * DAY_IN_MS
+                ),
+            ]
+        )
+        self.service._min_volume_in_btc = 10**6
+        self.service.update_asset_states()
+        self.assertEqual(AssetState.ACTIVELY_TRADED, self.assets["LTC"].asset_state)
+        self.assertEqual(AssetState.ACTIVELY_TRADED, self.assets["ETH"].asset_state)
+        self.assertEqual(AssetState.DE_LISTED, self.assets["XMR"].asset_state)
+
+        self.dao_state_service.evaluated_proposals.append(
+            SimpleNamespace(
+                is_accepted=True,
+                proposal=RemoveAssetProposal("remove", "link", "ETH"),
+            )
+        )
+        with self.assertLogs(self.service.logger, logging.INFO):
+            self.service.update_asset_states()
+        self.assertEqual(AssetState.REMOVED_BY_VOTING, self.assets["ETH"].asset_state)
+        self.assertFalse(self.service.is_active("ETH"))
+        self.assertTrue(self.service.is_active("LTC"))
+
+        trade_statistics.clear()
+        self.service.update_asset_states()
+        self.assertEqual(AssetState.DE_LISTED, self.assets["LTC"].asset_state)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+import random
+import unittest
+
+from bisq.common.util.permutation_util import PermutationUtil
+from bisq.core.dao.governance.voteresult.blind_vote_list_permutation_search import (
+    BlindVoteListPermutationSearch,
+)
+from bisq.core.dao.governance.voteresult.blind_vote_list_permutation_work import (
+    unrank_combination,
+)
+from bisq.core.dao.governance.votereveal.vote_reveal_consensus import (
+    VoteRevealConsensus,
+)
+from utils.concurrency import AtomicInt
+
+
+class FakeBlindVote:
+    def __init__(self, tx_id: str, data: bytes):
+        self.tx_id = tx_id
+        self.data = data
+
+    def serialize_for_hash(self):
+        return self.data
+
+    def __repr__(self):
+        return self.tx_id
+
+
+def new_blind_votes(n: int, rnd: random.Random) -> list[FakeBlindVote]:
+    return [
+        FakeBlindVote(f"tx{i}", rnd.randbytes(rnd.randint(50, 200))) for i in range(n)
+    ]
+
+
+def find_with_permutation_util(blind_votes, majority_hash, max_iterations):
+    def predicate(hash, variation):
+        return VoteRevealConsensus.get_hash_of_blind_vote_list(variation) == hash
+
+    return PermutationUtil._find_matching_permutation(
+        majority_hash, blind_votes, predicate, AtomicInt(max_iterations)
+    )
+
+
+class BlindVoteListPermutationSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.rnd = random.Random(7)
+
+    def majority_hash(self, blind_votes, removed):
+        return VoteRevealConsensus.get_hash_of_blind_vote_list(
+            [vote for i, vote in enumerate(blind_votes) if i not in removed]
+        )
+
+    def test_combinations_are_ranked_in_lexicographic_order(self):
+        for n, k in [(5, 1), (6, 3), (7, 6)]:
+            expected = [list(c) for c in combinations(range(n), k)]
+            self.assertEqual(
+                expected,
+                [unrank_combination(n, k, rank) for rank in range(len(expected))],
+            )
+
+    def test_same_result_as_permutation_util(self):
+        blind_votes = new_blind_votes(12, self.rnd)
+        for removed in [{0}, {11}, {3, 4}, {0, 11}, {2, 5, 9}, {1, 2, 3, 4}]:
+            majority_hash = self.majority_hash(blind_votes, removed)
+            expected = find_with_permutation_util(blind_votes, majority_hash, 1_000_000)
+            search = BlindVoteListPermutationSearch(
+                blind_votes, 1_000_000, batch_size=64
+            )
+            self.assertEqual(expected, search.find(majority_hash))
+            self.assertEqual(len(blind_votes) - len(removed), len(expected))
+
+    def test_first_match_in_search_order_is_returned(self):
+        # Removing either of two adjacent blind votes with the same data gives the same hash
+        blind_votes = new_blind_votes(8, self.rnd)
+        blind_votes[3] = FakeBlindVote("copy_of_tx2", blind_votes[2].data)
+        majority_hash = self.majority_hash(blind_votes, {3})
+        expected = find_with_permutation_util(blind_votes, majority_hash, 1_000_000)
+        result = BlindVoteListPermutationSearch(blind_votes, 1_000_000).find(
+            majority_hash
+        )
+        self.assertEqual(expected, result)
+        self.assertNotIn(blind_votes[2], result)
+
+    def test_max_iterations(self):
+        blind_votes = new_blind_votes(10, self.rnd)
+        # 10 lists with one removed, then {0, 1} to {0, 9} and {1, 2} come first
+        majority_hash = self.majority_hash(blind_votes, {1, 2})
+        for max_iterations in [19, 20]:
+            self.assertEqual(
+                find_with_permutation_util(blind_votes, majority_hash, max_iterations),
+                BlindVoteListPermutationSearch(
+                    blind_votes, max_iterations, batch_size=4
+                ).find(majority_hash)
+                or [],
+            )
+        self.assertIsNone(
+            BlindVoteListPermutationSearch(blind_votes, 19).find(majority_hash)
+        )
+
+    def test_search_with_worker_processes(self):
+        blind_votes = new_blind_votes(40, self.rnd)
+        removed = {3, 17, 38}
+        majority_hash = self.majority_hash(blind_votes, removed)
+        with ProcessPoolExecutor(2) as executor:
+            search = BlindVoteListPermutationSearch(
+                blind_votes, 1_000_000, executor, num_workers=2, batch_size=500
+            )
+            self.assertGreater(search.num_candidates, search.batch_size)
+            result = search.find(majority_hash)
+        self.assertEqual(
+            [vote for i, vote in enumerate(blind_votes) if i not in removed], result
+        )
+
+    def test_cancelled_search_returns_none(self):
+        blind_votes = new_blind_votes(20, self.rnd)
+        search = BlindVoteListPermutationSearch(blind_votes, 1_000_000)
+        search.cancel()
+        self.assertIsNone(search.find(self.majority_hash(blind_votes, {0})))
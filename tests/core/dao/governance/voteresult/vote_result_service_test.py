@@ -0,0 +1,125 @@
+import logging
+from utils.aio import as_future  # at top to prevent reactor problems
+import asyncio
+import random
+from types import SimpleNamespace
+from unittest import mock
+from twisted.trial import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.dao.governance.blindvote.blind_vote_consensus import BlindVoteConsensus
+from bisq.core.dao.governance.voteresult.blind_vote_list_permutation_search import (
+    BlindVoteListPermutationSearch,
+)
+from bisq.core.dao.governance.voteresult.vote_result_service import VoteResultService
+from bisq.core.dao.governance.votereveal.vote_reveal_consensus import (
+    VoteRevealConsensus,
+)
+from bisq.core.dao.state.dao_state_service import DaoStateService
+from bisq.core.network.p2p.storage.storage_byte_array import StorageByteArray
+from utils.twisted_utils import cancel_delayed_calls, wrap_with_ensure_deferred
+
+logger = logging.getLogger(__name__)
+
+FIRST_BLOCK_OF_RESULT_PHASE = 100
+
+
+class FakeBlindVote:
+    def __init__(self, tx_id: str, data: bytes):
+        self.tx_id = tx_id
+        self.data = data
+
+    def serialize_for_hash(self):
+        return self.data
+
+
+class VoteResultServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        rnd = random.Random(3)
+        self.blind_votes = [
+            FakeBlindVote(f"tx{i}", rnd.randbytes(100)) for i in range(20)
+        ]
+        self.dao_state_service = DaoStateService(None, None, None)
+        period_service = SimpleNamespace(
+            get_first_block_of_phase=lambda height, phase: FIRST_BLOCK_OF_RESULT_PHASE
+        )
+        self.service = VoteResultService(
+            None, self.dao_state_service, period_service, None, None, None, None
+        )
+        patcher = mock.patch.object(
+            BlindVoteConsensus,
+            "get_sorted_blind_vote_list_of_cycle",
+            return_value=self.blind_votes,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.service.shut_down()
+        cancel_delayed_calls()
+        self.logger_context.__exit__(None, None, None)
+
+    def expect_majority_hash(self, blind_votes) -> bytes:
+        majority_hash = VoteRevealConsensus.get_hash_of_blind_vote_list(blind_votes)
+        self.service._get_expected_stake_by_hash_of_blind_vote_list_map = (
+            lambda chain_height: {StorageByteArray(majority_hash): 1000}
+        )
+        return majority_hash
+
+    async def wait_for_release(self, timeout: float):
+        released = asyncio.get_running_loop().create_future()
+        self.dao_state_service.run_when_block_parsing_released(
+            lambda: released.set_result(None)
+        )
+        await asyncio.wait_for(released, timeout)
+
+    @wrap_with_ensure_deferred
+    async def test_variant_is_searched_before_the_vote_result_block(self):
+        variant = self.blind_votes[:7] + self.blind_votes[8:]
+        majority_hash = self.expect_majority_hash(variant)
+
+        self.service.on_parse_block_complete(
+            SimpleNamespace(height=FIRST_BLOCK_OF_RESULT_PHASE - 2)
+        )
+        self.assertFalse(self.dao_state_service.is_block_parsing_held)
+
+        self.service.on_parse_block_complete(
+            SimpleNamespace(height=FIRST_BLOCK_OF_RESULT_PHASE - 1)
+        )
+        # the next block gets parsed once the search is done
+        self.assertTrue(self.dao_state_service.is_block_parsing_held)
+        await self.wait_for_release(10)
+
+        with mock.patch.object(BlindVoteListPermutationSearch, "find") as find:
+            self.assertEqual(
+                variant,
+                self.service._find_permutated_list_matching_majority(majority_hash),
+            )
+            find.assert_not_called()
+
+    @wrap_with_ensure_deferred
+    async def test_matching_list_does_not_hold_block_parsing(self):
+        self.expect_majority_hash(self.blind_votes)
+        self.service.on_parse_block_complete(
+            SimpleNamespace(height=FIRST_BLOCK_OF_RESULT_PHASE - 1)
+        )
+        self.assertFalse(self.dao_state_service.is_block_parsing_held)
+
+    @wrap_with_ensure_deferred
+    async def test_shut_down_cancels_the_search(self):
+        # no variant matches, so all candidates would be checked
+        self.expect_majority_hash(self.blind_votes[:3])
+        self.service._create_permutation_search = (
+            lambda blind_votes: BlindVoteListPermutationSearch(blind_votes, 1000000)
+        )
+        self.service.on_parse_block_complete(
+            SimpleNamespace(height=FIRST_BLOCK_OF_RESULT_PHASE - 1)
+        )
+        await asyncio.sleep(0.1)
+        self.assertTrue(self.dao_state_service.is_block_parsing_held)
+
+        self.service.shut_down()
+        await self.wait_for_release(1)
+        self.assertEqual({}, self.service._permutation_search_results)
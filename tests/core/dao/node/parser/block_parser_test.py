@@ -0,0 +1,208 @@
+import logging
+import random
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.dao.node.full.raw_block import RawBlock
+from bisq.core.dao.node.full.raw_tx import RawTx
+from bisq.core.dao.node.full.raw_tx_output import RawTxOutput
+from bisq.core.dao.node.parser.block_parser import BlockParser
+from bisq.core.dao.node.parser.tx_parser import TxParser
+from bisq.core.dao.state.dao_state_service import DaoStateService
+from bisq.core.dao.state.model.blockchain.tx_input import TxInput
+from bisq.core.dao.state.model.blockchain.tx_output_key import TxOutputKey
+from bisq.core.dao.state.model.dao_state import DaoState
+from bitcoinj.base.coin import Coin
+
+logger = logging.getLogger(__name__)
+
+GENESIS_TX_ID = "00" * 32
+GENESIS_BLOCK_HEIGHT = 100
+GENESIS_OUTPUTS = 20
+GENESIS_OUTPUT_VALUE = 100_000
+
+
+def new_raw_tx(tx_id, height, inputs, values) -> RawTx:
+    return RawTx(
+        id=tx_id,
+        block_height=height,
+        block_hash=f"block{height}",
+        time=height * 600,
+        tx_inputs=tuple(TxInput(key.tx_id, key.index) for key in inputs),
+        raw_tx_outputs=tuple(
+            RawTxOutput(index, value, tx_id, None, f"addr{index}", None, height)
+            for index, value in enumerate(values)
+        ),
+    )
+
+
+def new_chain(num_blocks: int, rnd: random.Random) -> list[RawBlock]:
+    """Returns blocks with BSQ transfers, some spending outputs of the same block."""
+    genesis_tx = new_raw_tx(
+        GENESIS_TX_ID,
+        GENESIS_BLOCK_HEIGHT,
+        [TxOutputKey("ff" * 32, 0)],
+        [GENESIS_OUTPUT_VALUE] * GENESIS_OUTPUTS,
+    )
+    blocks = [new_raw_block(GENESIS_BLOCK_HEIGHT, [genesis_tx])]
+    unspent = {
+        TxOutputKey(GENESIS_TX_ID, i): GENESIS_OUTPUT_VALUE
+        for i in range(GENESIS_OUTPUTS)
+    }
+    for height in range(GENESIS_BLOCK_HEIGHT + 1, GENESIS_BLOCK_HEIGHT + num_blocks):
+        raw_txs = []
+        for i in range(rnd.randint(0, 4)):
+            tx_id = f"{height:032x}{i:032x}"
+            inputs = rnd.sample(list(unspent), rnd.randint(1, min(3, len(unspent))))
+            if rnd.random() < 0.1:
+                # Input which is not a BSQ output, or was spent already
+                inputs.append(TxOutputKey(f"{height:064x}", 7))
+            input_value = sum(unspent.pop(key, 0) for key in inputs)
+            values = []
+            while input_value > 1 and len(values) < 3:
+                value = rnd.randint(1, input_value)
+                values.append(value)
+                input_value -= value
+            # A BTC output
+            values.append(rnd.randint(input_value + 1, input_value + 10_000))
+            for index, value in enumerate(values[:-1]):
+                unspent[TxOutputKey(tx_id, index)] = value
+            raw_txs.append(new_raw_tx(tx_id, height, inputs, values))
+        blocks.append(new_raw_block(height, raw_txs))
+    return blocks
+
+
+def new_raw_block(height: int, raw_txs: list[RawTx]) -> RawBlock:
+    return RawBlock(
+        height, height * 600, f"block{height}", f"block{height - 1}", tuple(raw_txs)
+    )
+
+
+def new_dao_state_service() -> DaoStateService:
+    dao_state_service = DaoStateService(
+        DaoState(),
+        SimpleNamespace(
+            genesis_tx_id=GENESIS_TX_ID,
+            genesis_block_height=GENESIS_BLOCK_HEIGHT,
+            genesis_total_supply=GENESIS_OUTPUTS * GENESIS_OUTPUT_VALUE,
+        ),
+        None,
+    )
+    dao_state_service.start()
+    return dao_state_service
+
+
+def parse_without_overlay(dao_state_service: DaoStateService, raw_block: RawBlock):
+    """Parses the block the way it was done before, with each tx applied right away."""
+    tx_parser = TxParser(None, dao_state_service)
+    # The block gets added without txs, then the txs get parsed one by one
+    block = BlockParser(tx_parser, dao_state_service).parse_block(
+        RawBlock(
+            raw_block.height,
+            raw_block.time,
+            raw_block.hash,
+            raw_block.previous_block_hash,
+            (),
+        )
+    )
+    dao_state_service.allow_dao_state_change = True
+    for raw_tx in raw_block.raw_txs:
+        tx = tx_parser.find_tx(
+            raw_tx,
+            GENESIS_TX_ID,
+            GENESIS_BLOCK_HEIGHT,
+            Coin.value_of(GENESIS_OUTPUTS * GENESIS_OUTPUT_VALUE),
+        )
+        if tx:
+            dao_state_service.on_new_tx_for_last_block(block, tx)
+    dao_state_service.allow_dao_state_change = False
+
+
+class FailingTxParser(TxParser):
+    def find_tx(self, raw_tx, *args):
+        if raw_tx.id.endswith("1"):
+            raise RuntimeError("Parsing failed")
+        return super().find_tx(raw_tx, *args)
+
+
+class BlockParserTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.chain = new_chain(300, random.Random(3))
+        self.dao_state_service = new_dao_state_service()
+        self.block_parser = BlockParser(
+            TxParser(None, self.dao_state_service), self.dao_state_service
+        )
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def test_utxos_are_same_as_with_txs_applied_one_by_one(self):
+        for raw_block in self.chain:
+            self.block_parser.parse_block(raw_block)
+
+        expected = new_dao_state_service()
+        for raw_block in self.chain:
+            parse_without_overlay(expected, raw_block)
+
+        dao_state = self.dao_state_service.dao_state
+        self.assertGreater(len(dao_state.unspent_tx_output_map), GENESIS_OUTPUTS)
+        self.assertGreater(len(dao_state.spent_info_map), GENESIS_OUTPUTS)
+        self.assertEqual(
+            list(expected.dao_state.unspent_tx_output_map.items()),
+            list(dao_state.unspent_tx_output_map.items()),
+        )
+        self.assertEqual(
+            [(k, str(v)) for k, v in expected.dao_state.spent_info_map.items()],
+            [(k, str(v)) for k, v in dao_state.spent_info_map.items()],
+        )
+
+        def get_txs(dao_state_service):
+            return [
+                (tx.id, tx.tx_type, tx.burnt_bsq)
+                for tx in dao_state_service.get_unordered_tx_stream()
+            ]
+
+        self.assertEqual(get_txs(expected), get_txs(self.dao_state_service))
+
+    def test_outputs_spent_in_the_same_block_are_not_added_to_the_utxos(self):
+        txs_by_height = {}
+        for raw_block in self.chain:
+            for raw_tx in raw_block.raw_txs:
+                txs_by_height.setdefault(raw_block.height, set()).add(raw_tx.id)
+        for raw_block in self.chain:
+            self.block_parser.parse_block(raw_block)
+
+        spent_in_same_block = [
+            (key, info)
+            for key, info in self.dao_state_service.dao_state.spent_info_map.items()
+            if key.tx_id in txs_by_height.get(info.block_height, ())
+        ]
+        self.assertGreater(len(spent_in_same_block), 0)
+        for key, _ in spent_in_same_block:
+            self.assertFalse(self.dao_state_service.is_unspent(key))
+
+    def test_utxos_are_not_changed_if_parsing_of_a_block_fails(self):
+        block_parser = BlockParser(
+            FailingTxParser(None, self.dao_state_service), self.dao_state_service
+        )
+        for raw_block in self.chain:
+            unspent = dict(self.dao_state_service.get_unspent_tx_output_map())
+            spent_infos = dict(self.dao_state_service.get_spent_info_map())
+            try:
+                block_parser.parse_block(raw_block)
+            except RuntimeError:
+                self.assertEqual(
+                    unspent, self.dao_state_service.get_unspent_tx_output_map()
+                )
+                self.assertEqual(
+                    spent_infos, self.dao_state_service.get_spent_info_map()
+                )
+                return
+        self.fail("Parsing did not fail")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import logging
+from pathlib import Path
+import shutil
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.dao.monitoring.model.dao_state_hash import DaoStateHash
+from bisq.core.dao.state.model.dao_state import DaoState
+from bisq.core.dao.state.storage.blocks_persistence import BlocksPersistence
+from bisq.core.dao.state.storage.bsq_block_storage_service import (
+    BsqBlocksStorageService,
+)
+from bisq.core.dao.state.storage.dao_state_resource_indexer import (
+    index_dao_state_resources,
+)
+from bisq.core.dao.state.storage.dao_state_snapshot_index import DaoStateSnapshotIndex
+from bisq.core.dao.state.storage.dao_state_storage_service import (
+    DaoStateStorageService,
+)
+from bisq.core.dao.state.storage.dao_state_store import DaoStateStore
+from proto.delimited_protobuf import read_delimited, write_delimited
+import pb_pb2 as protobuf
+from tests.core.dao.state.storage.dao_state_storage_service_test import parse_chain
+
+logger = logging.getLogger(__name__)
+
+POST_FIX = "_BTC_REGTEST"
+
+
+class DaoStateResourceIndexerTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.resource_dir = Path(tempfile.mkdtemp())
+        self.store_file = self.resource_dir.joinpath(
+            DaoStateStorageService.FILE_NAME + POST_FIX
+        )
+        dao_state_service, self.hash_chain = parse_chain(80)
+        self.dao_state = dao_state_service.dao_state
+        BlocksPersistence(
+            self.resource_dir.joinpath(BsqBlocksStorageService.NAME + POST_FIX),
+            BsqBlocksStorageService.NAME,
+            None,
+        ).write_blocks([block.to_proto_message() for block in self.dao_state.blocks])
+
+    def tearDown(self):
+        shutil.rmtree(self.resource_dir, ignore_errors=True)
+        self.logger_context.__exit__(None, None, None)
+
+    def write_store(self, hash_chain):
+        # Like the resource files, which are written without index
+        store = DaoStateStore(
+            DaoState.get_bsq_state_clone_excluding_blocks(self.dao_state), hash_chain
+        )
+        with self.store_file.open("wb") as file_out:
+            write_delimited(file_out, store.to_proto_message())
+
+    def read_store(self) -> DaoStateStore:
+        with self.store_file.open("rb") as file_in:
+            proto = read_delimited(file_in, protobuf.PersistableEnvelope)
+        return DaoStateStore.from_proto(proto.dao_state_store)
+
+    def test_index_is_added_and_used_at_first_start(self):
+        self.write_store(self.hash_chain)
+        self.assertTrue(index_dao_state_resources(self.resource_dir, POST_FIX))
+
+        store = self.read_store()
+        expected = DaoStateSnapshotIndex.from_dao_state(self.dao_state, self.hash_chain)
+        self.assertEqual(
+            expected.to_proto_message(), store.snapshot_index.to_proto_message()
+        )
+
+        # The app reads the copied resource files like its own snapshot
+        service = DaoStateStorageService(
+            SimpleNamespace(add_service=lambda s: None, remove_service=lambda s: None),
+            None,
+            self.resource_dir,
+            None,
+        )
+        self.addCleanup(service.shut_down)
+        service.store = store
+        service._blocks.extend(self.dao_state.blocks)
+        self.assertTrue(service.verify_persisted_snapshot())
+        dao_state = service.get_persisted_bsq_state()
+        self.assertEqual(
+            self.dao_state.get_serialized_state_for_hash_chain(),
+            dao_state.get_serialized_state_for_hash_chain(),
+        )
+
+    def test_no_index_if_hash_chain_is_not_at_chain_height(self):
+        self.write_store(self.hash_chain[:-1])
+        content = self.store_file.read_bytes()
+        with self.assertLogs(level=logging.WARNING):
+            self.assertFalse(index_dao_state_resources(self.resource_dir, POST_FIX))
+        self.assertEqual(content, self.store_file.read_bytes())
+
+    def test_no_index_if_dao_state_does_not_match_the_hash_chain(self):
+        tail = self.hash_chain[-1]
+        self.write_store(
+            self.hash_chain[:-1] + [DaoStateHash(tail.height, bytes(20), False)]
+        )
+        with self.assertLogs(level=logging.WARNING):
+            self.assertFalse(index_dao_state_resources(self.resource_dir, POST_FIX))
+        self.assertIsNone(self.read_store().snapshot_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
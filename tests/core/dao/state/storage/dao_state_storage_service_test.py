@@ -0,0 +1,165 @@
+import logging
+from pathlib import Path
+import random
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.crypto.hash import get_sha256_ripemd160_hash
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.dao.monitoring.model.dao_state_hash import DaoStateHash
+from bisq.core.dao.node.parser.block_parser import BlockParser
+from bisq.core.dao.node.parser.tx_parser import TxParser
+from bisq.core.dao.state.model.blockchain.block import Block
+from bisq.core.dao.state.model.dao_state import DaoState
+from bisq.core.dao.state.storage.dao_state_snapshot_index import DaoStateSnapshotIndex
+from bisq.core.dao.state.storage.dao_state_storage_service import (
+    DaoStateStorageService,
+)
+from bisq.core.dao.state.storage.dao_state_store import DaoStateStore
+import pb_pb2 as protobuf
+from tests.core.dao.node.parser.block_parser_test import (
+    new_chain,
+    new_dao_state_service,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_chain(num_blocks: int):
+    """Returns the parsed dao state service and the hash chain created at each block."""
+    dao_state_service = new_dao_state_service()
+    block_parser = BlockParser(TxParser(None, dao_state_service), dao_state_service)
+    hash_chain: list[DaoStateHash] = []
+    for raw_block in new_chain(num_blocks, random.Random(5)):
+        dao_state_service.on_new_block_height(raw_block.height)
+        block_parser.parse_block(raw_block)
+        prev_hash = hash_chain[-1].hash if hash_chain else bytes()
+        state_as_bytes = dao_state_service.get_serialized_state_for_hash_chain()
+        hash_chain.append(
+            DaoStateHash(
+                raw_block.height,
+                get_sha256_ripemd160_hash(prev_hash + state_as_bytes),
+                True,
+            )
+        )
+    return dao_state_service, hash_chain
+
+
+def get_index_keys(dao_state: DaoState):
+    return {
+        tx_output_type: {str(tx_output.get_key()) for tx_output in tx_outputs}
+        for (
+            tx_output_type,
+            tx_outputs,
+        ) in dao_state.tx_outputs_by_tx_output_type.items()
+    }
+
+
+class DaoStateStorageServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.dao_state_service, hash_chain = parse_chain(80)
+        dao_state = self.dao_state_service.dao_state
+        store = DaoStateStore(
+            DaoState.get_bsq_state_clone_excluding_blocks(dao_state),
+            hash_chain,
+            DaoStateSnapshotIndex.from_dao_state(dao_state, hash_chain),
+        )
+        self.service = DaoStateStorageService(
+            SimpleNamespace(add_service=lambda s: None, remove_service=lambda s: None),
+            None,
+            Path("."),
+            None,
+        )
+        # As it got written to and read from disk
+        self.service.store = DaoStateStore.from_proto(
+            protobuf.PersistableEnvelope.FromString(
+                store.to_proto_message().SerializeToString()
+            ).dao_state_store
+        )
+        self.service._blocks.extend(
+            Block.from_proto(block.to_proto_message()) for block in dao_state.blocks
+        )
+
+    def tearDown(self):
+        self.service.shut_down()
+        self.logger_context.__exit__(None, None, None)
+
+    def test_snapshot_with_index_is_same_as_without_index(self):
+        self.assertIsNotNone(self.service.store.snapshot_index)
+        with self.assertLogs(self.service.logger, logging.INFO):
+            self.assertTrue(self.service.verify_persisted_snapshot())
+        self.assertTrue(self.service.is_chain_height_matching_last_block_height())
+
+        with_index = self.service.get_persisted_bsq_state()
+        snapshot_index = self.service.store.snapshot_index
+        self.service.store.snapshot_index = None
+        without_index = self.service.get_persisted_bsq_state()
+
+        self.assertGreater(len(with_index.unspent_tx_output_map), 0)
+        self.assertEqual(
+            list(without_index.unspent_tx_output_map.keys()),
+            list(with_index.unspent_tx_output_map.keys()),
+        )
+        self.assertEqual(without_index.tx_cache.keys(), with_index.tx_cache.keys())
+        self.assertEqual(get_index_keys(without_index), get_index_keys(with_index))
+        self.assertEqual(
+            without_index.get_serialized_state_for_hash_chain(),
+            with_index.get_serialized_state_for_hash_chain(),
+        )
+        # Snapshots without index are not verified
+        self.assertTrue(self.service.verify_persisted_snapshot())
+
+        self.service.store.snapshot_index = snapshot_index
+        self.dao_state_service.apply_snapshot(with_index)
+        self.assertEqual(
+            get_index_keys(without_index),
+            get_index_keys(self.dao_state_service.dao_state),
+        )
+
+    def test_changed_snapshot_is_not_verified(self):
+        dao_state_as_proto = self.service.store.dao_state_as_proto
+        dao_state_as_proto.unspent_tx_output_map_entries[0].value.value += 1
+        with self.assertLogs(self.service.logger, logging.WARNING):
+            self.assertFalse(self.service.verify_persisted_snapshot())
+        dao_state_as_proto.unspent_tx_output_map_entries[0].value.value -= 1
+        self.assertTrue(self.service.verify_persisted_snapshot())
+
+        # The locally stored blocks are missing the last block
+        last_block = self.service._blocks.pop()
+        with self.assertLogs(self.service.logger, logging.WARNING):
+            self.assertFalse(self.service.verify_persisted_snapshot())
+        self.service._blocks.append(last_block)
+
+        hash_chain = self.service.store.dao_state_hash_chain
+        hash_chain[-2] = DaoStateHash(hash_chain[-2].height, bytes(20), False)
+        with self.assertLogs(self.service.logger, logging.WARNING):
+            self.assertFalse(self.service.verify_persisted_snapshot())
+
+    def test_index_which_does_not_match_is_not_used(self):
+        snapshot_index = self.service.store.snapshot_index
+        removed_key = snapshot_index.sorted_unspent_tx_output_keys.pop()
+        with self.assertLogs(self.service.logger, logging.WARNING):
+            dao_state = self.service.get_persisted_bsq_state()
+        self.assertEqual(removed_key, str(dao_state.unspent_tx_output_map.keys()[-1]))
+
+        snapshot_index.sorted_unspent_tx_output_keys.append(removed_key)
+        next(iter(snapshot_index.tx_output_keys_by_type.values())).pop()
+        with self.assertLogs(self.service.logger, logging.WARNING):
+            dao_state = self.service.get_persisted_bsq_state()
+        self.assertEqual(
+            get_index_keys(self.dao_state_service.dao_state), get_index_keys(dao_state)
+        )
+
+    def test_no_index_if_hash_chain_is_not_at_chain_height(self):
+        dao_state = self.dao_state_service.dao_state
+        hash_chain = self.service.store.dao_state_hash_chain
+        self.assertIsNone(DaoStateSnapshotIndex.from_dao_state(dao_state, []))
+        self.assertIsNone(
+            DaoStateSnapshotIndex.from_dao_state(dao_state, hash_chain[:-1])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import logging
+from utils.aio import as_future  # at top to prevent reactor problems
+import asyncio
+import socket
+from aiohttp import web
+from twisted.internet.defer import Deferred
+from twisted.trial import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.http.async_http_client_impl import AsyncHttpClientImpl
+from bisq.core.network.http.http_response_error import HttpResponseError
+from bisq.core.network.http.http_session_pool import HttpSessionPool
+from utils.twisted_utils import cancel_delayed_calls, wrap_with_ensure_deferred
+
+logger = logging.getLogger(__name__)
+
+
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class CountingServer:
+    """Local http server which counts the connections its requests arrived on."""
+
+    def __init__(self):
+        self.port = get_free_port()
+        self.connections = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.drop_next_requests = 0
+        self.received_cookies: list[dict] = []
+        self.runner: web.AppRunner = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/ok", self.handle_ok)
+        app.router.add_get("/slow", self.handle_slow)
+        app.router.add_get("/drop", self.handle_drop)
+        app.router.add_get("/missing", self.handle_missing)
+        app.router.add_get("/cookie", self.handle_cookie)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "localhost", self.port).start()
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    def track(self, request: web.Request):
+        self.connections.add(request.transport.get_extra_info("peername"))
+
+    async def handle_ok(self, request: web.Request):
+        self.track(request)
+        return web.Response(text="ok")
+
+    async def handle_slow(self, request: web.Request):
+        self.track(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.in_flight -= 1
+        return web.Response(text="slow")
+
+    async def handle_drop(self, request: web.Request):
+        self.track(request)
+        if self.drop_next_requests > 0:
+            self.drop_next_requests -= 1
+            request.transport.close()
+            await asyncio.sleep(0.05)
+        return web.Response(text="recovered")
+
+    async def handle_missing(self, request: web.Request):
+        self.track(request)
+        return web.Response(status=404, text="not here")
+
+    async def handle_cookie(self, request: web.Request):
+        self.track(request)
+        self.received_cookies.append(dict(request.cookies))
+        response = web.Response(text="cookie")
+        response.set_cookie("session", "user-a")
+        return response
+
+
+class HttpSessionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.server = CountingServer()
+        self.pool = HttpSessionPool(max_concurrent_requests=2)
+        self.base_url = f"http://localhost:{self.server.port}"
+        return Deferred.fromFuture(as_future(self.server.start()))
+
+    def tearDown(self):
+        async def stop():
+            await self.pool.shut_down()
+            await self.server.stop()
+            cancel_delayed_calls()
+
+        stopped = Deferred.fromFuture(as_future(stop()))
+        self.logger_context.__exit__(None, None, None)
+        return stopped
+
+    def new_client(self):
+        return AsyncHttpClientImpl(self.base_url, session_pool=self.pool)
+
+    @wrap_with_ensure_deferred
+    async def test_connection_is_reused(self):
+        for _ in range(5):
+            self.assertEqual("ok", await self.new_client().get("/ok"))
+        self.assertEqual(1, len(self.server.connections))
+        self.assertEqual(1, self.pool.session_count)
+
+    @wrap_with_ensure_deferred
+    async def test_concurrency_is_bounded(self):
+        results = await asyncio.gather(
+            *(self.new_client().get("/slow") for _ in range(6))
+        )
+        self.assertEqual(["slow"] * 6, results)
+        self.assertEqual(2, self.server.max_in_flight)
+        self.assertEqual(2, len(self.server.connections))
+
+    @wrap_with_ensure_deferred
+    async def test_idle_sessions_get_evicted(self):
+        self.pool.idle_timeout_sec = 0
+        await self.new_client().get("/ok")
+        await self.pool.evict_idle_sessions()
+        self.assertEqual(0, self.pool.session_count)
+        await self.new_client().get("/ok")
+        self.assertEqual(2, len(self.server.connections))
+
+    @wrap_with_ensure_deferred
+    async def test_get_is_retried_on_new_connection(self):
+        self.assertEqual("ok", await self.new_client().get("/ok"))
+        self.server.drop_next_requests = 1
+        self.assertEqual("recovered", await self.new_client().get("/drop"))
+        self.assertEqual(2, len(self.server.connections))
+
+    @wrap_with_ensure_deferred
+    async def test_cookies_are_not_shared_between_clients(self):
+        await self.new_client().get("/cookie")
+        await self.new_client().get("/cookie")
+        self.assertEqual(1, len(self.server.connections))
+        self.assertEqual([{}, {}], self.server.received_cookies)
+
+    @wrap_with_ensure_deferred
+    async def test_non_200_response(self):
+        with self.assertRaises(HttpResponseError) as context:
+            await self.new_client().get("/missing")
+        self.assertEqual(404, context.exception.status)
+        self.assertEqual("not here", context.exception.response_text)
@@ -0,0 +1,311 @@
+import logging
+from utils.aio import as_future  # at top to prevent reactor problems
+import asyncio
+import base64
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from types import SimpleNamespace
+from twisted.internet.defer import Deferred
+from twisted.trial import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.p2p.network.shared_tor_manager import (
+    SharedTor,
+    SharedTorManager,
+)
+from bisq.core.network.p2p.network.tor_controller import TorControlError
+from utils.twisted_utils import cancel_delayed_calls, wrap_with_ensure_deferred
+
+logger = logging.getLogger(__name__)
+
+
+class StubTorController:
+    """
+    Local server which emulates the parts of the tor control protocol used by the SharedTorManager.
+
+    Like with a real tor, ephemeral onion services are removed when the control connection
+    which added them gets closed.
+    """
+
+    PASSWORD = "secret"
+    SOCKS_LISTENER = "127.0.0.1:9050"
+
+    def __init__(self):
+        self.port: int = None
+        self.server: asyncio.Server = None
+        self.bootstrap_progress = 100
+        self.onion_services: dict[str, list[str]] = {}  # service id -> ports
+        self.commands: list[str] = []
+        self._connections: list[asyncio.StreamWriter] = []
+        self._subscribers: list[asyncio.StreamWriter] = []
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        for writer in self._connections:
+            writer.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    @staticmethod
+    def get_service_id(key: str) -> str:
+        # a real tor derives it from the public key
+        return hashlib.sha3_256(key.encode()).hexdigest()[:56]
+
+    def emit_bootstrap(self, progress: int):
+        self.bootstrap_progress = progress
+        for writer in self._subscribers:
+            writer.write(f"650 STATUS_CLIENT {self.bootstrap_status()}\r\n".encode())
+
+    def bootstrap_status(self):
+        if self.bootstrap_progress >= 100:
+            tag, summary = "done", "Done"
+        else:
+            tag, summary = "loading_descriptors", "Loading relay descriptors"
+        return (
+            f"NOTICE BOOTSTRAP PROGRESS={self.bootstrap_progress} TAG={tag} "
+            f'SUMMARY="{summary}"'
+        )
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections.append(writer)
+        authenticated = False
+        added_service_ids = []
+        try:
+            while line := await reader.readline():
+                command, _, args = line.decode().strip().partition(" ")
+                self.commands.append(command)
+                if command == "PROTOCOLINFO":
+                    reply = [
+                        "250-PROTOCOLINFO 1",
+                        "250-AUTH METHODS=HASHEDPASSWORD",
+                        '250-VERSION Tor="0.4.8.12"',
+                        "250 OK",
+                    ]
+                elif command == "AUTHENTICATE":
+                    authenticated = args == f'"{StubTorController.PASSWORD}"'
+                    reply = (
+                        ["250 OK"]
+                        if authenticated
+                        else ["515 Authentication failed: Password did not match"]
+                    )
+                elif not authenticated:
+                    reply = ["514 Authentication required."]
+                elif command == "SETEVENTS":
+                    if "STATUS_CLIENT" in args.split():
+                        self._subscribers.append(writer)
+                    reply = ["250 OK"]
+                elif command == "GETINFO" and args == "status/bootstrap-phase":
+                    reply = [
+                        f"250-status/bootstrap-phase={self.bootstrap_status()}",
+                        "250 OK",
+                    ]
+                elif command == "GETINFO" and args == "net/listeners/socks":
+                    reply = [
+                        "250+net/listeners/socks=",
+                        f'"{StubTorController.SOCKS_LISTENER}"',
+                        ".",
+                        "250 OK",
+                    ]
+                elif command == "ADD_ONION":
+                    key, *ports = args.split(" ")
+                    reply = []
+                    if key == "NEW:ED25519-V3":
+                        key = "ED25519-V3:" + base64.b64encode(os.urandom(64)).decode()
+                        reply.append(f"250-PrivateKey={key}")
+                    service_id = StubTorController.get_service_id(key)
+                    self.onion_services[service_id] = [
+                        port.removeprefix("Port=") for port in ports
+                    ]
+                    added_service_ids.append(service_id)
+                    reply = [f"250-ServiceID={service_id}"] + reply + ["250 OK"]
+                elif command == "DEL_ONION":
+                    if self.onion_services.pop(args, None) is not None:
+                        reply = ["250 OK"]
+                    else:
+                        reply = ["552 Unknown Onion Service id"]
+                else:
+                    reply = [f'510 Unrecognized command "{command}"']
+                writer.write(("\r\n".join(reply) + "\r\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for service_id in added_service_ids:
+                self.onion_services.pop(service_id, None)
+            if writer in self._subscribers:
+                self._subscribers.remove(writer)
+            writer.close()
+
+
+class SharedTorManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.stub = StubTorController()
+        self.managers: list[SharedTorManager] = []
+        return Deferred.fromFuture(as_future(self.stub.start()))
+
+    def tearDown(self):
+        async def stop():
+            for manager in self.managers:
+                await manager.shut_down()
+            await self.stub.stop()
+            cancel_delayed_calls()
+
+        stopped = Deferred.fromFuture(as_future(stop()))
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        self.logger_context.__exit__(None, None, None)
+        return stopped
+
+    def new_manager(self, password=StubTorController.PASSWORD):
+        config = SimpleNamespace(
+            app_data_dir=self.data_dir,
+            tor_control_host="127.0.0.1",
+            tor_control_port=self.stub.port,
+            tor_control_password=password,
+        )
+        manager = SharedTorManager(config, self.data_dir.joinpath("shared_tor"))
+        self.managers.append(manager)
+        return manager
+
+    def hidden_service_dir(self, user_id: str):
+        return self.data_dir.joinpath(user_id, "tor", "hiddenservice")
+
+    @wrap_with_ensure_deferred
+    async def test_start_completes_when_tor_is_bootstrapped(self):
+        self.stub.bootstrap_progress = 50
+        manager = self.new_manager()
+        progress = []
+        manager.bootstrap_phase_property.add_listener(
+            lambda e: progress.append(e.new_value.progress)
+        )
+        started = manager.start()
+        while manager.bootstrap_progress < 50:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        self.assertFalse(started.done())
+
+        self.stub.emit_bootstrap(80)
+        self.stub.emit_bootstrap(100)
+        await started
+        self.assertEqual([50, 80, 100], progress)
+        self.assertTrue(manager.is_bootstrapped)
+        self.assertEqual("done", manager.bootstrap_phase_property.value.tag)
+
+        # only one tor gets started or connected, whoever asks
+        self.assertIs(started, manager.start())
+        self.assertEqual(1, self.stub.commands.count("AUTHENTICATE"))
+
+    @wrap_with_ensure_deferred
+    async def test_each_user_gets_isolated_socks_credentials(self):
+        manager = self.new_manager()
+        await manager.start()
+        alice = manager.get_socks_proxy("alice")
+        bob = manager.get_socks_proxy("bob")
+        self.assertEqual(("127.0.0.1", 9050), (alice.host, alice.port))
+        self.assertEqual(("127.0.0.1", 9050), (bob.host, bob.port))
+        self.assertNotEqual(alice.username, bob.username)
+        self.assertNotEqual(alice.password, bob.password)
+        self.assertEqual(alice, manager.get_socks_proxy("alice"))
+
+    @wrap_with_ensure_deferred
+    async def test_onion_services_per_user_keep_their_address(self):
+        manager = self.new_manager()
+        alice = await manager.add_onion_service(
+            "alice", self.hidden_service_dir("alice"), 9999, 1111
+        )
+        bob = await manager.add_onion_service(
+            "bob", self.hidden_service_dir("bob"), 9999, 2222
+        )
+        self.assertNotEqual(alice, bob)
+        self.assertEqual(
+            {
+                alice.removesuffix(".onion"): ["9999,127.0.0.1:1111"],
+                bob.removesuffix(".onion"): ["9999,127.0.0.1:2222"],
+            },
+            self.stub.onion_services,
+        )
+        key_file = self.hidden_service_dir("alice").joinpath("private_key")
+        self.assertEqual(0o600, key_file.stat().st_mode & 0o777)
+
+        await manager.shut_down()
+        self.assertEqual({}, self.stub.onion_services)
+
+        manager = self.new_manager()
+        self.assertEqual(
+            alice,
+            await manager.add_onion_service(
+                "alice", self.hidden_service_dir("alice"), 9999, 3333
+            ),
+        )
+        self.assertEqual(
+            {alice.removesuffix(".onion"): ["9999,127.0.0.1:3333"]},
+            self.stub.onion_services,
+        )
+
+    @wrap_with_ensure_deferred
+    async def test_hidden_service_of_own_tor_keeps_its_address(self):
+        hidden_service_dir = self.hidden_service_dir("alice")
+        hidden_service_dir.mkdir(parents=True)
+        secret_key = os.urandom(64)
+        hidden_service_dir.joinpath("hs_ed25519_secret_key").write_bytes(
+            b"== ed25519v1-secret: type0 ==\x00\x00\x00" + secret_key
+        )
+        service_id = StubTorController.get_service_id(
+            "ED25519-V3:" + base64.b64encode(secret_key).decode()
+        )
+
+        manager = self.new_manager()
+        self.assertEqual(
+            f"{service_id}.onion",
+            await manager.add_onion_service("alice", hidden_service_dir, 9999, 1111),
+        )
+        # tor's key file stays the only key, so turning off the shared tor keeps the address
+        self.assertFalse(hidden_service_dir.joinpath("private_key").exists())
+
+    @wrap_with_ensure_deferred
+    async def test_remove_onion_service_keeps_the_others(self):
+        manager = self.new_manager()
+        await manager.add_onion_service(
+            "alice", self.hidden_service_dir("alice"), 9999, 1111
+        )
+        bob = await manager.add_onion_service(
+            "bob", self.hidden_service_dir("bob"), 9999, 2222
+        )
+        await manager.remove_onion_service("alice")
+        self.assertEqual([bob.removesuffix(".onion")], list(self.stub.onion_services))
+        # removing twice is fine
+        await manager.remove_onion_service("alice")
+
+    @wrap_with_ensure_deferred
+    async def test_failed_start_can_be_retried(self):
+        manager = self.new_manager(password="wrong")
+        with self.assertRaises(TorControlError) as context:
+            await manager.start()
+        self.assertEqual("515", context.exception.code)
+
+        manager._config.tor_control_password = StubTorController.PASSWORD
+        await manager.start()
+        self.assertTrue(manager.is_bootstrapped)
+
+    @wrap_with_ensure_deferred
+    async def test_shared_tor_mode_publishes_in_the_tor_dir_of_the_user(self):
+        manager = self.new_manager()
+        tor_dir = self.data_dir.joinpath("alice", "tor")
+        tor_mode = SharedTor(manager, tor_dir, "alice")
+        self.assertIsNone(await tor_mode.get_tor())
+        self.assertEqual(manager.get_socks_proxy("alice"), tor_mode.get_socks_proxy())
+
+        hostname = await tor_mode.publish_hidden_service(9999, 1111)
+        self.assertTrue(hostname.endswith(".onion"))
+        self.assertTrue(tor_dir.joinpath("hiddenservice", "private_key").is_file())
+
+        await tor_mode.remove_hidden_service()
+        self.assertEqual({}, self.stub.onion_services)
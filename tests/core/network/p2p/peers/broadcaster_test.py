@@ -0,0 +1,198 @@
+import logging
+from utils.aio import as_future  # at top to prevent reactor problems
+import asyncio
+from concurrent.futures import Future
+from types import SimpleNamespace
+from twisted.trial import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.p2p.bundle_of_envelopes import BundleOfEnvelopes
+from bisq.core.network.p2p.node_address import NodeAddress
+from bisq.core.network.p2p.peers.broadcast_handler import BroadcastHandler
+from bisq.core.network.p2p.peers.broadcaster import Broadcaster
+from utils.concurrency import AtomicBoolean
+from utils.data import SimpleProperty
+from utils.twisted_utils import cancel_delayed_calls, wrap_with_ensure_deferred
+
+logger = logging.getLogger(__name__)
+
+
+class FakeMessage:
+    def __init__(self, name: str, size: int = 100):
+        self.name = name
+        self.size = size
+        self.num_serializations = 0
+
+    def to_proto_network_envelope(self):
+        self.num_serializations += 1
+        return SimpleNamespace(ByteSize=lambda: self.size)
+
+
+class FakeConnection:
+    def __init__(self, port: int):
+        self.peers_node_address = NodeAddress("localhost", port)
+        self.stopped = AtomicBoolean(False)
+
+    def test_capability(self, message) -> bool:
+        return True
+
+
+class FakeNetworkNode:
+    def __init__(self, num_connections: int):
+        self.connections = [FakeConnection(1000 + i) for i in range(num_connections)]
+        self.node_address_property = SimpleProperty(NodeAddress("localhost", 999))
+        self.sent: list[tuple[FakeConnection, object]] = []
+        self.fail_sends = False
+
+    def get_confirmed_connections(self):
+        return set(self.connections)
+
+    def send_message(self, connection, message, executor=None):
+        self.sent.append((connection, message))
+        future = Future()
+        if self.fail_sends:
+            future.set_exception(ConnectionError("peer gone"))
+        else:
+            future.set_result(connection)
+        return future
+
+
+class RecordingListener(BroadcastHandler.Listener):
+    def __init__(self):
+        self.sufficiently_broadcast = 0
+        self.not_sufficiently_broadcast = 0
+
+    def on_sufficiently_broadcast(self, broadcast_requests):
+        self.sufficiently_broadcast += 1
+
+    def on_not_sufficiently_broadcast(self, num_completed_broadcasts, num_failed_broadcast):
+        self.not_sufficiently_broadcast += 1
+
+
+class BroadcasterTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.network_node = FakeNetworkNode(3)
+        peer_manager = SimpleNamespace(add_listener=lambda l: None, remove_listener=lambda l: None)
+        self.broadcaster = Broadcaster(self.network_node, peer_manager, max_connections=3)
+
+    def tearDown(self):
+        self.broadcaster.shut_down(lambda: None)
+        cancel_delayed_calls()
+        self.logger_context.__exit__(None, None, None)
+
+    def get_sent_messages(self, connection):
+        result = []
+        for c, message in self.network_node.sent:
+            if c is connection:
+                result.extend(message.envelopes if isinstance(message, BundleOfEnvelopes) else [message])
+        return result
+
+    @wrap_with_ensure_deferred
+    async def test_sends_of_concurrent_bundles_get_merged_per_connection(self):
+        listener_a = RecordingListener()
+        listener_b = RecordingListener()
+        message_a = FakeMessage("a")
+        message_b = FakeMessage("b")
+        self.broadcaster.broadcast(message_a, NodeAddress("relay", 1), listener_a)
+        self.broadcaster.flush()
+        self.broadcaster.broadcast(message_b, NodeAddress("relay", 1), listener_b)
+        self.broadcaster.flush()
+
+        await asyncio.sleep(0.6)
+        # one message per connection carrying both bundles
+        self.assertEqual(3, len(self.network_node.sent))
+        for connection in self.network_node.connections:
+            self.assertEqual([message_a, message_b], self.get_sent_messages(connection))
+        self.assertEqual(1, listener_a.sufficiently_broadcast)
+        self.assertEqual(1, listener_b.sufficiently_broadcast)
+        self.assertEqual(0, listener_a.not_sufficiently_broadcast)
+
+    @wrap_with_ensure_deferred
+    async def test_message_is_not_sent_back_to_sender(self):
+        sender = self.network_node.connections[0].peers_node_address
+        message = FakeMessage("a")
+        self.broadcaster.broadcast(message, sender)
+        self.broadcaster.flush()
+        self.broadcaster.broadcast(FakeMessage("b"), NodeAddress("relay", 1))
+        self.broadcaster.flush()
+
+        await asyncio.sleep(0.6)
+        self.assertNotIn(message, self.get_sent_messages(self.network_node.connections[0]))
+        self.assertIn(message, self.get_sent_messages(self.network_node.connections[1]))
+
+    @wrap_with_ensure_deferred
+    async def test_window_shrinks_with_bundle_size(self):
+        self.broadcaster.broadcast(FakeMessage("small", 100), NodeAddress("relay", 1))
+        self.broadcaster.broadcast(
+            FakeMessage("large", int(Broadcaster.MAX_BUNDLE_SIZE_BYTES * 0.6)),
+            NodeAddress("relay", 1),
+        )
+        # the window is at about 0.86 sec now instead of 2 sec
+        await asyncio.sleep(1.5)
+        self.assertEqual(3, len(self.network_node.sent))
+
+    @wrap_with_ensure_deferred
+    async def test_full_bundle_is_sent_right_away(self):
+        half = Broadcaster.MAX_BUNDLE_SIZE_BYTES // 2
+        self.broadcaster.broadcast(FakeMessage("a", half), NodeAddress("relay", 1))
+        self.broadcaster.broadcast(FakeMessage("b", half), NodeAddress("relay", 1))
+        # only the staggering delay of the sends is left
+        await asyncio.sleep(0.5)
+        self.assertEqual(3, len(self.network_node.sent))
+
+        # a full pending send is not extended, the next bundle gets its own send
+        self.network_node.sent.clear()
+        self.broadcaster.broadcast(FakeMessage("c", half), NodeAddress("relay", 1))
+        self.broadcaster.broadcast(FakeMessage("d", half), NodeAddress("relay", 1))
+        self.broadcaster.broadcast(FakeMessage("e", half), NodeAddress("relay", 1))
+        self.broadcaster.broadcast(FakeMessage("f", half), NodeAddress("relay", 1))
+        await asyncio.sleep(0.5)
+        self.assertEqual(6, len(self.network_node.sent))
+
+    @wrap_with_ensure_deferred
+    async def test_bundle_is_sent_before_a_message_which_does_not_fit(self):
+        large = int(Broadcaster.MAX_BUNDLE_SIZE_BYTES * 0.6)
+        message_a = FakeMessage("a", large)
+        message_b = FakeMessage("b", large)
+        self.broadcaster.broadcast(message_a, NodeAddress("relay", 1))
+        self.broadcaster.broadcast(message_b, NodeAddress("relay", 1))
+        self.broadcaster.flush()
+
+        await asyncio.sleep(0.6)
+        # no send exceeds the permitted message size
+        self.assertEqual(6, len(self.network_node.sent))
+        for _, message in self.network_node.sent:
+            self.assertIn(message, (message_a, message_b))
+
+    @wrap_with_ensure_deferred
+    async def test_messages_get_serialized_once(self):
+        messages = [FakeMessage(name) for name in "abc"]
+        for message in messages:
+            self.broadcaster.broadcast(message, NodeAddress("relay", 1))
+        self.broadcaster.flush()
+
+        await asyncio.sleep(0.6)
+        self.assertEqual(3, len(self.network_node.sent))
+        for _, bundle in self.network_node.sent:
+            self.assertEqual(messages, bundle.envelopes)
+            for envelope in bundle.envelopes:
+                bundle._get_envelope_proto(envelope)
+        self.assertEqual([1, 1, 1], [m.num_serializations for m in messages])
+
+    @wrap_with_ensure_deferred
+    async def test_failed_sends_notify_not_sufficiently_broadcast(self):
+        self.network_node.fail_sends = True
+        listener_a = RecordingListener()
+        listener_b = RecordingListener()
+        self.broadcaster.broadcast(FakeMessage("a"), NodeAddress("relay", 1), listener_a)
+        self.broadcaster.flush()
+        self.broadcaster.broadcast(FakeMessage("b"), NodeAddress("relay", 1), listener_b)
+        self.broadcaster.flush()
+
+        await asyncio.sleep(0.6)
+        self.assertEqual(0, listener_a.sufficiently_broadcast)
+        # each handler reports it for every failure after its target of 3 peers can not be reached
+        self.assertEqual(2, listener_a.not_sufficiently_broadcast)
+        self.assertEqual(2, listener_b.not_sufficiently_broadcast)
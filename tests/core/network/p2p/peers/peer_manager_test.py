@@ -0,0 +1,184 @@
+import logging
+from utils.aio import as_future  # at top to prevent reactor problems
+import asyncio
+import random
+import socket
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from twisted.internet.defer import Deferred
+from twisted.trial import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.p2p.network.connection_listener import ConnectionListener
+from bisq.core.network.p2p.network.inbound_connection import InboundConnection
+from bisq.core.network.p2p.network.localhost_network_node import LocalhostNetworkNode
+from bisq.core.network.p2p.network.peer_type import PeerType
+from bisq.core.network.p2p.peers.peer_manager import PeerManager
+from utils.clock import Clock
+from utils.twisted_utils import cancel_delayed_calls, wrap_with_ensure_deferred
+
+logger = logging.getLogger(__name__)
+
+
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def get_expected_eviction_candidate(connections):
+    """The candidate selection of check_max_connections done by filtering and sorting."""
+    candidates = sorted(
+        [
+            c
+            for c in connections
+            if isinstance(c, InboundConnection)
+            and c.connection_state.peer_type == PeerType.PEER
+        ],
+        key=lambda c: c.statistic.last_activity_timestamp,
+    )
+    if not candidates:
+        candidates = sorted(
+            [
+                c
+                for c in connections
+                if c.connection_state.peer_type == PeerType.INITIAL_DATA_EXCHANGE
+            ],
+            key=lambda c: c.connection_state.last_initial_data_msg_timestamp,
+        )
+    return candidates[0] if candidates else None
+
+
+class DisconnectRecorder(ConnectionListener):
+    def __init__(self):
+        self.disconnected = []
+
+    def on_connection(self, connection):
+        pass
+
+    def on_disconnect(self, close_connection_reason, connection):
+        # a closed connection can report its disconnect more than once
+        if connection not in self.disconnected:
+            self.disconnected.append(connection)
+
+
+class PeerManagerEvictionSimulationTest(unittest.TestCase):
+    """Opens hundreds of connections to a LocalhostNetworkNode and lets the PeerManager trim them."""
+
+    NUM_CONNECTIONS = 200
+
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        LocalhostNetworkNode.set_simulate_tor_delay_tor_node(0)
+        LocalhostNetworkNode.set_simulate_tor_delay_hidden_service(0)
+        self.client_sockets: list[socket.socket] = []
+        self.node = None
+        self.peer_manager = None
+
+    def tearDown(self):
+        async def shut_down():
+            if self.peer_manager:
+                self.peer_manager.shut_down()
+            if self.node:
+                done = asyncio.Event()
+                self.node.shut_down(lambda: done.set())
+                await asyncio.wait_for(done.wait(), 30)
+            for sock in self.client_sockets:
+                sock.close()
+            cancel_delayed_calls()
+            self.temp_dir.cleanup()
+
+        stopped = Deferred.fromFuture(as_future(shut_down()))
+        self.logger_context.__exit__(None, None, None)
+        return stopped
+
+    async def _start(self, max_connections: int):
+        from bisq.common.config.config import Config
+        from bisq.core.protocol.network.core_network_proto_resolver import CoreNetworkProtoResolver
+
+        config = Config(default_user_data_dir=Path(self.temp_dir.name))
+        self.node = LocalhostNetworkNode(
+            get_free_port(), CoreNetworkProtoResolver(Clock()), None, config
+        )
+        await self.node.start()
+        await self._wait_for(lambda: self.node.server is not None)
+
+        for _ in range(self.NUM_CONNECTIONS):
+            sock = socket.create_connection(("localhost", self.node.service_port))
+            self.client_sockets.append(sock)
+        await self._wait_for(
+            lambda: len(self.node.get_all_connections()) == self.NUM_CONNECTIONS
+        )
+
+        self.peer_manager = PeerManager(
+            self.node,
+            SimpleNamespace(get_seed_node_addresses=lambda: set()),
+            SimpleNamespace(add_listener=lambda l: None, remove_listener=lambda l: None),
+            SimpleNamespace(initialize=lambda *args: None, request_persistence=lambda: None),
+            max_connections=max_connections,
+        )
+        self.recorder = DisconnectRecorder()
+        self.node.add_connection_listener(self.recorder)
+
+    async def _wait_for(self, condition, timeout_sec=60):
+        for _ in range(int(timeout_sec / 0.02)):
+            if condition():
+                return
+            await asyncio.sleep(0.02)
+        self.fail("Condition not met in time")
+
+    async def _touch(self, connections):
+        # distinct timestamps, the update is executed at the user thread
+        for connection in connections:
+            connection.statistic.update_last_activity_timestamp()
+            await asyncio.sleep(0.002)
+
+    async def _evict_until(self, num_connections: int) -> list:
+        """Lets the peer manager close connections and returns them in the expected order."""
+        expected = []
+        remaining = list(self.node.get_all_connections())
+        while len(remaining) > num_connections:
+            candidate = get_expected_eviction_candidate(remaining)
+            expected.append(candidate)
+            remaining.remove(candidate)
+
+        # closing a connection triggers the next check until we are within our limits
+        self.assertTrue(self.peer_manager.check_max_connections())
+        await self._wait_for(lambda: len(self.recorder.disconnected) == len(expected))
+        await asyncio.sleep(0.5)
+        self.assertFalse(self.peer_manager.check_max_connections())
+        return expected
+
+    @wrap_with_ensure_deferred
+    async def test_least_active_inbound_peers_get_evicted(self):
+        await self._start(max_connections=190)
+        connections = list(self.node.get_all_connections())
+        random.shuffle(connections)
+        await self._touch(connections)
+        # activity of some connections moves them to the end of the queue
+        await self._touch(random.sample(connections, 50))
+
+        expected = await self._evict_until(190)
+        self.assertEqual(10, len(expected))
+        self.assertEqual(expected, self.recorder.disconnected)
+        self.assertEqual(190, len(self.node.get_all_connections()))
+
+    @wrap_with_ensure_deferred
+    async def test_initial_data_exchange_connections_get_evicted(self):
+        # initial_data_exchange_trigger is 190
+        await self._start(max_connections=112)
+        connections = list(self.node.get_all_connections())
+        random.shuffle(connections)
+        for connection in connections:
+            connection.connection_state.on_initial_data_exchange()
+            await asyncio.sleep(0.002)
+        # a connection which completed its initial data exchange is a peer again
+        # and gets evicted first
+        connections[-1].connection_state.reset_initial_data_exchange_type()
+
+        expected = await self._evict_until(190)
+        self.assertIs(connections[-1], expected[0])
+        self.assertEqual(expected, self.recorder.disconnected)
@@ -0,0 +1,66 @@
+import unittest
+
+from bisq.common.capabilities import Capabilities
+from bisq.common.capability import Capability
+from bisq.core.network.p2p.node_address import NodeAddress
+from bisq.core.network.p2p.peers.peerexchange.peer import Peer
+from bisq.core.network.p2p.peers.peerexchange.peer_list import PeerList
+from bisq.core.network.p2p.peers.peerexchange.peer_registry import PeerRegistry
+
+
+def new_peer(i: int, date: int = 0, capabilities: Capabilities = None) -> Peer:
+    return Peer(
+        node_address=NodeAddress(f"peer{i}.onion", 9999),
+        date=date,
+        capabilities=capabilities or Capabilities(),
+    )
+
+
+class PeerRegistryTest(unittest.TestCase):
+    def test_known_peers_are_not_replaced(self):
+        registry = PeerRegistry([new_peer(1, date=100)])
+        self.assertFalse(registry.add(new_peer(1, date=200)))
+        self.assertEqual(1, len(registry))
+        self.assertEqual(100, registry.get(NodeAddress("peer1.onion", 9999)).date)
+        self.assertIn(new_peer(1), registry)
+        self.assertIn(NodeAddress("peer1.onion", 9999), registry)
+
+    def test_remove_older_than(self):
+        registry = PeerRegistry(new_peer(i, date=i) for i in range(5000))
+        # removed and re-added peers must not be expired with their old date
+        registry.remove(NodeAddress("peer10.onion", 9999))
+        registry.add(new_peer(10, date=10_000))
+
+        removed = registry.remove_older_than(2500)
+        self.assertEqual(2499, len(removed))
+        self.assertEqual(2501, len(registry))
+        self.assertTrue(all(peer.date >= 2500 for peer in registry))
+        self.assertIsNotNone(registry.get(NodeAddress("peer10.onion", 9999)))
+        self.assertEqual([], registry.remove_older_than(2500))
+
+    def test_sample_and_remove(self):
+        registry = PeerRegistry(new_peer(i) for i in range(100))
+        sampled = registry.sample(30)
+        self.assertEqual(30, len(set(sampled)))
+        for peer in sampled:
+            registry.discard(peer)
+        self.assertEqual(70, len(registry))
+        self.assertFalse(any(peer in registry for peer in sampled))
+        self.assertEqual(70, len(registry.sample(1000)))
+
+    def test_find_capabilities(self):
+        capabilities = Capabilities([Capability.DAO_FULL_NODE])
+        registry = PeerRegistry([new_peer(1, capabilities=capabilities), new_peer(2)])
+        self.assertEqual(capabilities, registry.find_capabilities(NodeAddress("peer1.onion", 9999)))
+        self.assertIsNone(registry.find_capabilities(NodeAddress("peer2.onion", 9999)))
+        self.assertIsNone(registry.find_capabilities(NodeAddress("peer3.onion", 9999)))
+
+    def test_peer_list_proto_round_trip(self):
+        peer_list = PeerList({new_peer(i, date=i) for i in range(10)})
+        restored = PeerList.from_proto(peer_list.to_proto_message().peer_list)
+        self.assertIsInstance(restored.set, PeerRegistry)
+        self.assertEqual(peer_list, restored)
+
+
+if __name__ == "__main__":
+    unittest.main()
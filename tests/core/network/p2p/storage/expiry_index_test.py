@@ -0,0 +1,212 @@
+import logging
+from pathlib import Path
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.persistence.persistence_manager_source import PersistenceManagerSource
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.p2p.network.close_connection_reason import (
+    CloseConnectionReason,
+)
+from bisq.core.network.p2p.node_address import NodeAddress
+from bisq.core.network.p2p.storage.expiry_index import ExpiryIndex
+from bisq.core.network.p2p.storage.hash_map_changed_listener import (
+    HashMapChangedListener,
+)
+from bisq.core.network.p2p.storage.p2p_data_storage import P2PDataStorage
+from bisq.core.network.p2p.storage.payload.expirable_payload import ExpirablePayload
+from bisq.core.network.p2p.storage.payload.protected_storage_entry import (
+    ProtectedStorageEntry,
+)
+from bisq.core.network.p2p.storage.payload.requires_owner_is_online_payload import (
+    RequiresOwnerIsOnlinePayload,
+)
+from bisq.core.network.p2p.storage.storage_byte_array import StorageByteArray
+
+logger = logging.getLogger(__name__)
+
+
+class FakeClock:
+    def __init__(self, now: int = 1_000_000):
+        self.now = now
+
+    def millis(self):
+        return self.now
+
+
+class ExpiringPayload(ExpirablePayload):
+    def __init__(self, payload_id: str, ttl: int):
+        self.payload_id = payload_id
+        self.ttl = ttl
+
+    def get_ttl(self):
+        return self.ttl
+
+    def to_proto_message(self):
+        raise NotImplementedError()
+
+    def serialize_for_hash(self):
+        return self.payload_id.encode()
+
+
+class OwnerIsOnlinePayload(ExpiringPayload, RequiresOwnerIsOnlinePayload):
+    OWNER = NodeAddress("owner.onion", 9999)
+
+    def get_owner_node_address(self):
+        return OwnerIsOnlinePayload.OWNER
+
+
+class CountingEntry(ProtectedStorageEntry):
+    num_expiry_checks = 0
+
+    def is_expired(self, clock):
+        CountingEntry.num_expiry_checks += 1
+        return super().is_expired(clock)
+
+    def __str__(self):
+        return f"CountingEntry({self.protected_storage_payload.payload_id})"
+
+
+class RemovedRecorder(HashMapChangedListener):
+    def __init__(self, removed: list):
+        self.removed = removed
+
+    def on_added(self, protected_storage_entries):
+        pass
+
+    def on_removed(self, protected_storage_entries):
+        self.removed.extend(protected_storage_entries)
+
+
+def new_entry(clock: FakeClock, payload_id: str, ttl: int) -> CountingEntry:
+    return CountingEntry(
+        protected_storage_payload=ExpiringPayload(payload_id, ttl),
+        sequence_number=1,
+        signature=b"",
+        clock=clock,
+        owner_pub_key_bytes=b"",
+    )
+
+
+class ExpiryIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def test_pop_due_in_expiry_order(self):
+        index = ExpiryIndex()
+        for i in (3, 1, 2):
+            index.add(StorageByteArray(bytes([i])), new_entry(self.clock, str(i), i * 100))
+
+        self.assertEqual([], index.pop_due(self.clock.now + 100))
+        self.assertEqual(1_000_100, index.peek_next_expiry_date())
+        self.assertEqual(
+            [StorageByteArray(bytes([1])), StorageByteArray(bytes([2]))],
+            index.pop_due(self.clock.now + 201),
+        )
+        self.assertEqual(1, len(index))
+
+    def test_readded_and_removed_entries(self):
+        index = ExpiryIndex()
+        key_a = StorageByteArray(b"a")
+        key_b = StorageByteArray(b"b")
+        index.add(key_a, new_entry(self.clock, "a", 100))
+        index.add(key_b, new_entry(self.clock, "b", 100))
+        # refreshed later, so the old expiry date must not count anymore
+        self.clock.now += 50
+        index.add(key_a, new_entry(self.clock, "a", 100))
+        index.remove(key_b)
+
+        self.assertEqual([], index.pop_due(self.clock.now + 1))
+        self.assertEqual([key_a], index.pop_due(self.clock.now + 101))
+        self.assertEqual(0, len(index))
+        self.assertIsNone(index.peek_next_expiry_date())
+
+    def test_compaction_keeps_valid_entries(self):
+        index = ExpiryIndex()
+        key = StorageByteArray(b"k")
+        for i in range(1000):
+            index.add(key, new_entry(self.clock, "k", i))
+        self.assertLess(len(index._heap), 100)
+        self.assertEqual([], index.pop_due(self.clock.now + 999))
+        self.assertEqual([key], index.pop_due(self.clock.now + 1000))
+
+
+class P2PDataStorageExpiryTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.clock = FakeClock()
+        self.removed = []
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.storage = P2PDataStorage(
+            network_node=SimpleNamespace(
+                add_message_listener=lambda listener: None,
+                add_connection_listener=lambda listener: None,
+            ),
+            broadcaster=None,
+            append_only_data_store_service=None,
+            protected_data_store_service=None,
+            resource_data_store_service=None,
+            persistence_manager=SimpleNamespace(
+                initialize=lambda *args: None,
+                dir=Path(self.temp_dir.name),
+                file_name="SequenceNumberMap",
+                source=PersistenceManagerSource.PRIVATE_LOW_PRIO,
+            ),
+            removed_payloads_service=None,
+            clock=self.clock,
+            max_sequence_number_map_size_before_purge=1000,
+        )
+        self.storage.add_hash_map_changed_listener(RemovedRecorder(self.removed))
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def test_only_due_entries_are_checked(self):
+        minute = 60 * 1000
+        entries = [new_entry(self.clock, str(i), (i + 1) * minute) for i in range(1000)]
+        for entry in entries:
+            self.storage.add_protected_mailbox_storage_entry_to_map(entry)
+
+        CountingEntry.num_expiry_checks = 0
+        self.storage.remove_expired_entries()
+        self.assertEqual(0, CountingEntry.num_expiry_checks)
+        self.assertEqual(1000, len(self.storage.map))
+
+        # 3 minutes and 1 ms later the first 3 entries are expired
+        self.clock.now += 3 * minute + 1
+        self.storage.remove_expired_entries()
+        self.assertEqual(3, CountingEntry.num_expiry_checks)
+        self.assertEqual(entries[:3], self.removed)
+        self.assertEqual(997, len(self.storage.map))
+        self.assertEqual(997, len(self.storage.expiry_index))
+
+        self.clock.now += 1000 * minute
+        self.storage.remove_expired_entries()
+        self.assertEqual(0, len(self.storage.map))
+        self.assertEqual(0, len(self.storage.expiry_index))
+
+    def test_back_dated_entries_expire_earlier(self):
+        ttl = 10 * 60 * 1000
+        entry = CountingEntry(
+            protected_storage_payload=OwnerIsOnlinePayload("a", ttl),
+            sequence_number=1,
+            signature=b"",
+            clock=self.clock,
+            owner_pub_key_bytes=b"",
+        )
+        self.storage.add_protected_mailbox_storage_entry_to_map(entry)
+
+        connection = SimpleNamespace(peers_node_address=OwnerIsOnlinePayload.OWNER)
+        self.storage.on_disconnect(CloseConnectionReason.RESET, connection)
+        self.clock.now += ttl // 2 + 1
+        self.storage.remove_expired_entries()
+        self.assertEqual([entry], self.removed)
+        self.assertEqual(0, len(self.storage.map))
@@ -0,0 +1,240 @@
+from datetime import datetime
+import logging
+from types import SimpleNamespace
+import unittest
+from unittest.mock import patch
+
+from bisq.common.capabilities import Capabilities
+from bisq.common.protocol.network.get_data_response_priority import (
+    GetDataResponsePriority,
+)
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.p2p.peers.getdata.messages.preliminary_get_data_request import (
+    PreliminaryGetDataRequest,
+)
+from bisq.core.network.p2p.storage.get_data_response_builder import (
+    GetDataResponseBuilder,
+)
+from bisq.core.network.p2p.storage.p2p_data_storage import P2PDataStorage
+from bisq.core.network.p2p.storage.payload.data_sorted_truncatable_payload import (
+    DateSortedTruncatablePayload,
+)
+from bisq.core.network.p2p.storage.payload.persistable_network_payload import (
+    PersistableNetworkPayload,
+)
+from bisq.core.network.p2p.storage.payload.protected_storage_entry import (
+    ProtectedStorageEntry,
+)
+from bisq.core.network.p2p.storage.payload.protected_storage_payload import (
+    ProtectedStoragePayload,
+)
+from bisq.core.network.p2p.storage.storage_byte_array import StorageByteArray
+import pb_pb2 as protobuf
+
+logger = logging.getLogger(__name__)
+
+
+class SizedPayload(PersistableNetworkPayload):
+    num_serializations = 0
+
+    def __init__(self, hash: bytes, size: int):
+        self.hash = hash
+        self.size = size
+
+    def to_proto_message(self):
+        SizedPayload.num_serializations += 1
+        return protobuf.PersistableNetworkPayload(
+            account_age_witness=protobuf.AccountAgeWitness(
+                hash=self.hash + bytes(self.size)
+            )
+        )
+
+    def get_hash(self):
+        return self.hash
+
+    def verify_hash_size(self):
+        return True
+
+    def __eq__(self, other):
+        return isinstance(other, SizedPayload) and self.hash == other.hash
+
+    def __hash__(self):
+        return hash(self.hash)
+
+
+class DatedPayload(SizedPayload, DateSortedTruncatablePayload):
+    def __init__(self, hash: bytes, size: int, date: int, max_items: int):
+        super().__init__(hash, size)
+        self.date = date
+        self._max_items = max_items
+
+    def get_date(self):
+        return datetime.fromtimestamp(self.date)
+
+    def max_items(self):
+        return self._max_items
+
+
+class HighPrioPayload(ProtectedStoragePayload):
+    def __init__(self, payload_id: str):
+        self.payload_id = payload_id
+
+    def get_owner_pub_key_bytes(self):
+        return b""
+
+    def get_extra_data_map(self):
+        return None
+
+    def get_data_response_priority(self):
+        return GetDataResponsePriority.HIGH
+
+    def to_proto_message(self):
+        raise NotImplementedError()
+
+    def serialize_for_hash(self):
+        return self.payload_id.encode()
+
+
+class HighPrioEntry(ProtectedStorageEntry):
+    def to_proto_message(self):
+        return protobuf.StorageEntryWrapper(
+            protected_storage_entry=protobuf.ProtectedStorageEntry(
+                signature=self.protected_storage_payload.payload_id.encode()
+                + bytes(1000)
+            )
+        )
+
+
+def new_store(payloads):
+    return SimpleNamespace(
+        get_map=lambda: {StorageByteArray(p.get_hash()): p for p in payloads}
+    )
+
+
+class GetDataResponseBuilderTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        # 1000 bytes for PersistableNetworkPayloads and 3000 bytes for ProtectedStorageEntries
+        max_size_patch = patch.object(GetDataResponseBuilder, "MAX_SIZE", 4000)
+        max_size_patch.start()
+        self.addCleanup(max_size_patch.stop)
+        self.low_prio = [SizedPayload(b"low%03d" % i, 94) for i in range(30)]
+        self.dated = [
+            DatedPayload(b"dat%03d" % i, 94, 1_600_000_000 + i, 5) for i in range(10)
+        ]
+        clock = SimpleNamespace(millis=lambda: 1_000_000)
+        self.entries = [
+            HighPrioEntry(HighPrioPayload(str(i)), 1, b"", clock, owner_pub_key_bytes=b"")
+            for i in range(5)
+        ]
+        self.data_storage = SimpleNamespace(
+            append_only_data_store_service=SimpleNamespace(
+                services=[new_store(self.low_prio[:20]), new_store(self.low_prio[20:])]
+            ),
+            map={
+                StorageByteArray(str(i).encode()): entry
+                for i, entry in enumerate(self.entries)
+            },
+            should_transmit_payload_to_peer=P2PDataStorage.should_transmit_payload_to_peer,
+        )
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def new_builder(self, excluded_keys=None, max_entries=1000):
+        request = PreliminaryGetDataRequest(
+            nonce=7, excluded_keys=excluded_keys or set()
+        )
+        return GetDataResponseBuilder(
+            self.data_storage, request, max_entries, Capabilities()
+        )
+
+    def test_known_hashes_are_excluded(self):
+        excluded = {p.hash for p in self.low_prio[:25]}
+        response = self.new_builder(excluded).build()
+        self.assertEqual(
+            frozenset(self.low_prio[25:]), response.persistable_network_payload_set
+        )
+        self.assertEqual(frozenset(self.entries), response.data_set)
+        self.assertFalse(response.was_truncated)
+        self.assertFalse(response.has_more_parts)
+
+    def test_response_is_truncated_by_size(self):
+        # each payload has 100 bytes, so 9 of them fit into the limit
+        response = self.new_builder().build()
+        self.assertEqual(
+            frozenset(self.low_prio[:9]), response.persistable_network_payload_set
+        )
+        self.assertTrue(response.was_truncated)
+        # high priority data is never truncated
+        self.assertEqual(frozenset(self.entries), response.data_set)
+
+    def test_date_sorted_payloads_keep_the_newest(self):
+        self.data_storage.append_only_data_store_service.services = [
+            new_store(self.low_prio[:3] + self.dated[:6])
+        ]
+        response = self.new_builder().build()
+        self.assertEqual(
+            frozenset(self.low_prio[:3] + self.dated[1:6]),
+            response.persistable_network_payload_set,
+        )
+        self.assertTrue(response.was_truncated)
+
+        response = self.new_builder(max_entries=5).build()
+        # the oldest are removed first when the max entries are exceeded
+        self.assertEqual(
+            frozenset(self.low_prio[:3] + self.dated[4:6]),
+            response.persistable_network_payload_set,
+        )
+
+    def test_items_are_serialized_once(self):
+        SizedPayload.num_serializations = 0
+        response = self.new_builder().build()
+        envelope = response.to_proto_network_envelope()
+        # the 10th payload got serialized for the size check only
+        self.assertEqual(10, SizedPayload.num_serializations)
+        self.assertEqual(9, len(envelope.get_data_response.persistable_network_payload_items))
+        self.assertEqual(5, len(envelope.get_data_response.data_set))
+
+    def test_split_response(self):
+        responses = self.new_builder().build_parts(max_parts=4)
+        self.assertEqual(
+            frozenset(self.low_prio),
+            frozenset().union(*(r.persistable_network_payload_set for r in responses)),
+        )
+        self.assertEqual(
+            frozenset(self.entries),
+            frozenset().union(*(r.data_set for r in responses)),
+        )
+        self.assertEqual(
+            [True] * (len(responses) - 1) + [False],
+            [r.has_more_parts for r in responses],
+        )
+        self.assertFalse(any(r.was_truncated for r in responses))
+        for response in responses:
+            envelope = response.to_proto_network_envelope()
+            self.assertLessEqual(
+                envelope.get_data_response.ByteSize(),
+                GetDataResponseBuilder.MAX_SIZE + 100,
+            )
+            self.assertEqual(
+                response.has_more_parts, envelope.get_data_response.has_more_parts
+            )
+        # high priority data comes first
+        self.assertEqual(frozenset(), responses[0].persistable_network_payload_set)
+        self.assertEqual(
+            frozenset(self.entries), responses[0].data_set | responses[1].data_set
+        )
+
+    def test_split_response_is_truncated_at_max_parts(self):
+        self.low_prio = [SizedPayload(b"low%03d" % i, 94) for i in range(100)]
+        self.data_storage.append_only_data_store_service.services = [
+            new_store(self.low_prio)
+        ]
+        responses = self.new_builder().build_parts(max_parts=2)
+        payloads = frozenset().union(
+            *(r.persistable_network_payload_set for r in responses)
+        )
+        self.assertEqual(frozenset(self.low_prio[:19]), payloads)
+        self.assertTrue(all(r.was_truncated for r in responses))
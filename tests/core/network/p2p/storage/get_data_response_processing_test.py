@@ -0,0 +1,185 @@
+import logging
+from pathlib import Path
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.persistence.persistence_manager_source import PersistenceManagerSource
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.p2p.node_address import NodeAddress
+from bisq.core.network.p2p.storage.hash_map_changed_listener import (
+    HashMapChangedListener,
+)
+from bisq.core.network.p2p.storage.p2p_data_storage import P2PDataStorage
+from bisq.core.network.p2p.storage.payload.expirable_payload import ExpirablePayload
+from bisq.core.network.p2p.storage.payload.protected_storage_entry import (
+    ProtectedStorageEntry,
+)
+from bisq.core.network.p2p.storage.payload.protected_storage_payload import (
+    ProtectedStoragePayload,
+)
+
+logger = logging.getLogger(__name__)
+
+SENDER = NodeAddress("seed.onion", 8000)
+MINUTE = 60 * 1000
+
+
+class FakeClock:
+    def __init__(self, now: int = 100 * MINUTE):
+        self.now = now
+
+    def millis(self):
+        return self.now
+
+
+class OfferLikePayload(ProtectedStoragePayload, ExpirablePayload):
+    def __init__(self, payload_id: str, ttl: int = 10 * MINUTE):
+        self.payload_id = payload_id
+        self.ttl = ttl
+
+    def get_ttl(self):
+        return self.ttl
+
+    def get_owner_pub_key_bytes(self):
+        return b""
+
+    def get_extra_data_map(self):
+        return None
+
+    def to_proto_message(self):
+        raise NotImplementedError()
+
+    def serialize_for_hash(self):
+        return self.payload_id.encode()
+
+
+class SignedEntry(ProtectedStorageEntry):
+    num_signature_checks = 0
+
+    def __init__(self, clock, payload, sequence_number, valid=True, **kwargs):
+        super().__init__(
+            protected_storage_payload=payload,
+            sequence_number=sequence_number,
+            signature=b"",
+            clock=clock,
+            owner_pub_key_bytes=b"",
+            **kwargs,
+        )
+        self.valid = valid
+
+    def is_valid_for_add_operation(self):
+        SignedEntry.num_signature_checks += 1
+        return self.valid
+
+    def __str__(self):
+        return f"SignedEntry({self.protected_storage_payload.payload_id}, {self.sequence_number})"
+
+
+class AddedRecorder(HashMapChangedListener):
+    def __init__(self):
+        self.calls = []
+
+    def on_added(self, protected_storage_entries):
+        self.calls.append(list(protected_storage_entries))
+
+
+class ProcessGetDataResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.clock = FakeClock()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def new_storage(self) -> tuple[P2PDataStorage, AddedRecorder]:
+        storage = P2PDataStorage(
+            network_node=SimpleNamespace(
+                add_message_listener=lambda listener: None,
+                add_connection_listener=lambda listener: None,
+            ),
+            broadcaster=None,
+            append_only_data_store_service=None,
+            protected_data_store_service=None,
+            resource_data_store_service=None,
+            persistence_manager=SimpleNamespace(
+                initialize=lambda *args: None,
+                dir=Path(self.temp_dir.name),
+                file_name="SequenceNumberMap",
+                source=PersistenceManagerSource.PRIVATE_LOW_PRIO,
+            ),
+            removed_payloads_service=None,
+            clock=self.clock,
+            max_sequence_number_map_size_before_purge=1000,
+        )
+        storage.sequence_number_journal.request_flush = lambda: None
+        storage.filter_predicate = lambda payload: not payload.payload_id.startswith(
+            "filtered"
+        )
+        recorder = AddedRecorder()
+        storage.add_hash_map_changed_listener(recorder)
+        # known from an earlier response
+        storage.add_protected_storage_entry(
+            SignedEntry(self.clock, OfferLikePayload("known"), 5), SENDER, None, False
+        )
+        recorder.calls.clear()
+        return storage, recorder
+
+    def new_entries(self) -> list[SignedEntry]:
+        entries = [
+            SignedEntry(self.clock, OfferLikePayload(f"new{i}"), 1) for i in range(50)
+        ]
+        entries += [
+            SignedEntry(self.clock, OfferLikePayload("invalid"), 1, valid=False),
+            SignedEntry(
+                self.clock,
+                OfferLikePayload("expired", ttl=MINUTE),
+                1,
+                creation_time_stamp=self.clock.now - 2 * MINUTE,
+            ),
+            SignedEntry(self.clock, OfferLikePayload("known"), 5),
+            SignedEntry(self.clock, OfferLikePayload("known"), 4),
+            SignedEntry(self.clock, OfferLikePayload("filtered"), 1),
+            SignedEntry(self.clock, OfferLikePayload("updated"), 2),
+            SignedEntry(self.clock, OfferLikePayload("updated"), 1),
+            SignedEntry(self.clock, OfferLikePayload("updated"), 3),
+        ]
+        return entries
+
+    def get_state(self, storage: P2PDataStorage):
+        return (
+            {
+                key: (entry.protected_storage_payload.payload_id, entry.sequence_number)
+                for key, entry in storage.map.items()
+            },
+            {key: value.sequence_nr for key, value in storage.sequence_number_map.items()},
+        )
+
+    def test_same_entries_are_accepted_as_one_by_one(self):
+        entries = self.new_entries()
+
+        one_by_one, one_by_one_recorder = self.new_storage()
+        SignedEntry.num_signature_checks = 0
+        for entry in entries:
+            one_by_one.add_protected_storage_entry(entry, SENDER, None, False)
+        one_by_one_signature_checks = SignedEntry.num_signature_checks
+
+        bulk, bulk_recorder = self.new_storage()
+        SignedEntry.num_signature_checks = 0
+        added = bulk.add_protected_storage_entries_from_initial_request(entries, SENDER)
+
+        self.assertEqual(self.get_state(one_by_one), self.get_state(bulk))
+        self.assertEqual(
+            [entry for call in one_by_one_recorder.calls for entry in call],
+            added,
+        )
+        self.assertEqual(52, len(bulk.map))
+        self.assertEqual(52, len(bulk.expiry_index))
+        # the filtered entry does not get its signature checked
+        self.assertLess(SignedEntry.num_signature_checks, one_by_one_signature_checks)
+        # one notification for the batch, the entries with the same hash are added one by one
+        self.assertEqual(51, len(bulk_recorder.calls[0]))
+        self.assertEqual(2, len(bulk_recorder.calls))
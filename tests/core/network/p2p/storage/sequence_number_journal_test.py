@@ -0,0 +1,201 @@
+import logging
+from pathlib import Path
+import tempfile
+import unittest
+
+from bisq.common.persistence.persistence_manager_source import PersistenceManagerSource
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.p2p.storage.sequence_number_journal import (
+    SequenceNumberJournal,
+)
+from bisq.core.network.p2p.storage.sequence_number_map import SequenceNumberMap
+from bisq.core.network.p2p.storage.storage_byte_array import StorageByteArray
+from bisq.core.network.p2p.storage.storage_map_value import StorageMapValue
+import pb_pb2 as protobuf
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotPersistenceManager:
+    """Writes the snapshot like the PersistenceManager, without backups and threads."""
+
+    def __init__(self, dir: Path):
+        self.dir = dir
+        self.file_name = "SequenceNumberMap"
+        self.source = PersistenceManagerSource.PRIVATE_LOW_PRIO
+        self.storage_file = dir.joinpath(self.file_name)
+        self.persistable: SequenceNumberMap = None
+        self.fail_writes = False
+
+    def persist_now(self, complete_handler):
+        if not self.fail_writes:
+            serialized = self.persistable.to_persistable_message()
+            temp_file = self.dir.joinpath("temp_" + self.file_name)
+            temp_file.write_bytes(serialized.SerializeToString())
+            temp_file.rename(self.storage_file)
+        complete_handler()
+
+    def get_persisted(self):
+        if not self.storage_file.exists():
+            return None
+        proto = protobuf.PersistableEnvelope.FromString(
+            self.storage_file.read_bytes()
+        )
+        return SequenceNumberMap.from_proto(proto.sequence_number_map)
+
+
+def key(i: int) -> StorageByteArray:
+    return StorageByteArray(i.to_bytes(32, "big"))
+
+
+def value(sequence_nr: int, time_stamp: int) -> StorageMapValue:
+    return StorageMapValue(sequence_nr=sequence_nr, time_stamp=time_stamp)
+
+
+class SequenceNumberMapTest(unittest.TestCase):
+    def test_values_are_packed_losslessly(self):
+        sequence_number_map = SequenceNumberMap()
+        values = [
+            value(0, 0),
+            value(1, 1_700_000_000_000),
+            value(2**31 - 1, 2**62),
+            value(-1, 5),
+            value(-(2**31), 7),
+        ]
+        for i, map_value in enumerate(values):
+            sequence_number_map[key(i)] = map_value
+            self.assertEqual(map_value, sequence_number_map[key(i)])
+        self.assertIsNone(sequence_number_map.get(key(100)))
+        self.assertIn(key(3), sequence_number_map)
+
+        proto = sequence_number_map.to_proto_message().sequence_number_map
+        self.assertEqual(
+            dict(sequence_number_map.items()),
+            dict(SequenceNumberMap.from_proto(proto).items()),
+        )
+
+    def test_purge_visits_entries_in_update_order(self):
+        sequence_number_map = SequenceNumberMap()
+        for i in range(100):
+            sequence_number_map[key(i)] = value(1, i)
+        # updated entries move to the end
+        sequence_number_map[key(0)] = value(2, 200)
+        sequence_number_map.drain_changes()
+
+        self.assertEqual(49, sequence_number_map.purge_older_than(49))
+        self.assertNotIn(key(1), sequence_number_map)
+        self.assertIn(key(0), sequence_number_map)
+        self.assertIn(key(50), sequence_number_map)
+        self.assertEqual(51, len(sequence_number_map))
+        self.assertEqual(
+            {key(i).bytes: None for i in range(1, 50)},
+            dict(sequence_number_map.drain_changes()),
+        )
+        self.assertEqual(0, sequence_number_map.purge_older_than(49))
+
+    def test_loaded_entries_are_ordered_by_time_stamp(self):
+        persisted = SequenceNumberMap({key(i): value(1, 100 - i) for i in range(100)})
+        sequence_number_map = SequenceNumberMap()
+        sequence_number_map.load(persisted)
+        self.assertEqual(50, sequence_number_map.purge_older_than(50))
+        self.assertTrue(
+            all(v.time_stamp > 50 for _, v in sequence_number_map.items())
+        )
+
+
+class SequenceNumberJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def new_journal(self):
+        persistence_manager = SnapshotPersistenceManager(self.dir)
+        sequence_number_map = SequenceNumberMap()
+        persistence_manager.persistable = sequence_number_map
+        return SequenceNumberJournal(persistence_manager, sequence_number_map)
+
+    def restart(self, journal: SequenceNumberJournal) -> SequenceNumberJournal:
+        journal.shut_down()
+        restarted = self.new_journal()
+        restarted.sequence_number_map.load(
+            restarted.persistence_manager.get_persisted()
+        )
+        restarted.replay()
+        return restarted
+
+    def assert_same_entries(
+        self, expected: SequenceNumberMap, actual: SequenceNumberMap
+    ):
+        self.assertEqual(dict(expected.items()), dict(actual.items()))
+
+    def test_changes_are_replayed(self):
+        journal = self.new_journal()
+        sequence_number_map = journal.sequence_number_map
+        for i in range(100):
+            sequence_number_map[key(i)] = value(1, 1000 + i)
+        journal.flush()
+        for i in range(50):
+            sequence_number_map[key(i)] = value(2, 2000 + i)
+        del sequence_number_map[key(99)]
+        sequence_number_map.purge_older_than(1060)
+
+        restarted = self.restart(journal)
+        self.assert_same_entries(sequence_number_map, restarted.sequence_number_map)
+        self.assertEqual(88, len(restarted.sequence_number_map))
+        self.assertEqual(value(2, 2000), restarted.sequence_number_map[key(0)])
+        # appends after a restart go to a new file
+        self.assertEqual(1, restarted.generation)
+
+    def test_compaction_writes_snapshot_and_deletes_covered_journal_files(self):
+        journal = self.new_journal()
+        sequence_number_map = journal.sequence_number_map
+        for round in range(3):
+            for i in range(10):
+                sequence_number_map[key(i)] = value(round, round * 100 + i)
+            journal.flush()
+        self.assertEqual(30, journal.num_records)
+
+        journal.compact()
+        sequence_number_map[key(42)] = value(1, 500)
+        journal.flush()
+        journal.shut_down()
+
+        self.assertTrue(journal.persistence_manager.storage_file.exists())
+        self.assertEqual([1], journal.get_generations())
+        restarted = self.restart(journal)
+        self.assertEqual(1, restarted.num_records)
+        self.assert_same_entries(sequence_number_map, restarted.sequence_number_map)
+
+    def test_journal_is_kept_if_snapshot_was_not_written(self):
+        journal = self.new_journal()
+        journal.persistence_manager.fail_writes = True
+        sequence_number_map = journal.sequence_number_map
+        for i in range(10):
+            sequence_number_map[key(i)] = value(1, i)
+        journal.flush()
+        journal.compact()
+        journal.shut_down()
+
+        self.assertEqual([0], journal.get_generations())
+        restarted = self.restart(journal)
+        self.assert_same_entries(sequence_number_map, restarted.sequence_number_map)
+
+    def test_incomplete_last_record_is_ignored(self):
+        journal = self.new_journal()
+        sequence_number_map = journal.sequence_number_map
+        for i in range(10):
+            sequence_number_map[key(i)] = value(1, i)
+        journal.flush()
+        journal.shut_down()
+        with journal.get_file(0).open("ab") as file_out:
+            file_out.write(b"\x40\x0a\x20")
+
+        restarted = self.restart(journal)
+        self.assertEqual(10, restarted.num_records)
+        self.assert_same_entries(sequence_number_map, restarted.sequence_number_map)
@@ -0,0 +1,96 @@
+import logging
+from pathlib import Path
+import shutil
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.offer.bsq_swap.bsq_swap_offer_payload import BsqSwapOfferPayload
+from bisq.core.offer.offer_book_changed_listener import OfferBookChangedListener
+from bisq.core.offer.offer_book_service import OfferBookService
+from bisq.core.offer.offer_direction import OfferDirection
+
+logger = logging.getLogger(__name__)
+
+
+class FakeFilterManager:
+    """Accepts proofs of work with at least the current pow difficulty."""
+
+    def __init__(self):
+        self.pow_difficulty = 1
+
+    def are_proofs_of_work_valid(self, offers):
+        return [
+            offer.bsq_swap_offer_payload.get_proof_of_work().difficulty
+            >= self.pow_difficulty
+            for offer in offers
+        ]
+
+
+class RecordingListener(OfferBookChangedListener):
+    def __init__(self):
+        self.offer_ids: set[str] = set()
+
+    def on_added(self, offer):
+        self.offer_ids.add(offer.id)
+
+    def on_removed(self, offer):
+        self.offer_ids.discard(offer.id)
+
+
+def new_entry(offer_id: str, pow_difficulty: int):
+    payload = BsqSwapOfferPayload(
+        offer_id,
+        0,
+        None,
+        None,
+        OfferDirection.BUY,
+        1,
+        1,
+        1,
+        SimpleNamespace(difficulty=pow_difficulty),
+    )
+    return SimpleNamespace(protected_storage_payload=payload)
+
+
+class OfferBookServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.storage_dir = Path(tempfile.mkdtemp())
+        self.hash_map_listeners = []
+        p2p_service = SimpleNamespace(
+            add_hash_set_changed_listener=lambda listener: (
+                self.hash_map_listeners.append(listener) or (lambda: None)
+            )
+        )
+        self.filter_manager = FakeFilterManager()
+        self.service = OfferBookService(
+            p2p_service, None, self.filter_manager, self.storage_dir, False
+        )
+        self.listener = RecordingListener()
+        self.service.add_offer_book_changed_listener(self.listener)
+
+    def tearDown(self):
+        shutil.rmtree(self.storage_dir, ignore_errors=True)
+        self.logger_context.__exit__(None, None, None)
+
+    def test_offers_with_invalid_proof_of_work_are_not_added(self):
+        (hash_map_listener,) = self.hash_map_listeners
+        hash_map_listener.on_added([new_entry("valid", 1), new_entry("invalid", 0)])
+        self.assertEqual({"valid"}, self.listener.offer_ids)
+
+    def test_offer_is_removed_after_pow_difficulty_went_up(self):
+        (hash_map_listener,) = self.hash_map_listeners
+        entry = new_entry("offer", 1)
+        hash_map_listener.on_added([entry])
+        self.assertEqual({"offer"}, self.listener.offer_ids)
+
+        self.filter_manager.pow_difficulty = 2
+        hash_map_listener.on_removed([entry])
+        self.assertEqual(set(), self.listener.offer_ids)
+
+
+if __name__ == "__main__":
+    unittest.main()
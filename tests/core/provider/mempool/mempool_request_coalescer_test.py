@@ -0,0 +1,129 @@
+import logging
+from utils.aio import as_future  # at top to prevent reactor problems
+import asyncio
+import json
+from twisted.trial import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.provider.mempool.mempool_request_coalescer import MempoolRequestCoalescer
+from utils.twisted_utils import cancel_delayed_calls, wrap_with_ensure_deferred
+
+logger = logging.getLogger(__name__)
+
+CONFIRMED = json.dumps({"txid": "a", "status": {"confirmed": True, "block_height": 1}})
+UNCONFIRMED = json.dumps({"txid": "a", "status": {"confirmed": False}})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def millis(self):
+        return self.now
+
+
+class FakeProvider:
+    def __init__(self, response: str = CONFIRMED, error: Exception = None):
+        self.response = response
+        self.error = error
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch(self):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+            if self.error:
+                raise self.error
+            return self.response
+        finally:
+            self.in_flight -= 1
+
+
+class MempoolRequestCoalescerTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.clock = FakeClock()
+        self.coalescer = MempoolRequestCoalescer(
+            cache_ttl_sec=60, max_requests_per_provider=2, clock=self.clock
+        )
+
+    def tearDown(self):
+        cancel_delayed_calls()
+        self.logger_context.__exit__(None, None, None)
+
+    @wrap_with_ensure_deferred
+    async def test_concurrent_lookups_are_coalesced(self):
+        provider = FakeProvider()
+        results = await asyncio.gather(
+            *(self.coalescer.get_tx_details("a", "p1", provider.fetch) for _ in range(5))
+        )
+        self.assertEqual([CONFIRMED] * 5, results)
+        self.assertEqual(1, provider.calls)
+
+    @wrap_with_ensure_deferred
+    async def test_confirmed_results_are_cached_until_ttl(self):
+        provider = FakeProvider()
+        await self.coalescer.get_tx_details("a", "p1", provider.fetch)
+        self.clock.now = 59_000
+        await self.coalescer.get_tx_details("a", "p2", provider.fetch)
+        self.assertEqual(1, provider.calls)
+        self.clock.now = 61_000
+        await self.coalescer.get_tx_details("a", "p1", provider.fetch)
+        self.assertEqual(2, provider.calls)
+
+    @wrap_with_ensure_deferred
+    async def test_unconfirmed_results_are_not_cached(self):
+        provider = FakeProvider(UNCONFIRMED)
+        await self.coalescer.get_tx_details("a", "p1", provider.fetch)
+        await self.coalescer.get_tx_details("a", "p1", provider.fetch)
+        self.assertEqual(2, provider.calls)
+        # raw tx hex does not change, so it is always cached
+        await self.coalescer.get_tx_as_hex("a", "p1", provider.fetch)
+        await self.coalescer.get_tx_as_hex("a", "p1", provider.fetch)
+        self.assertEqual(3, provider.calls)
+
+    @wrap_with_ensure_deferred
+    async def test_requests_per_provider_are_bounded(self):
+        provider = FakeProvider()
+        other_provider = FakeProvider()
+        await asyncio.gather(
+            *(self.coalescer.get_tx_details(f"tx{i}", "p1", provider.fetch) for i in range(6)),
+            *(self.coalescer.get_tx_details(f"tx{i}", "p2", other_provider.fetch) for i in range(6, 10)),
+        )
+        self.assertEqual(6, provider.calls)
+        self.assertEqual(2, provider.max_in_flight)
+        self.assertEqual(2, other_provider.max_in_flight)
+
+    @wrap_with_ensure_deferred
+    async def test_failures_reach_all_waiters_and_are_not_cached(self):
+        failing = FakeProvider(error=ConnectionError("provider down"))
+        results = await asyncio.gather(
+            *(self.coalescer.get_tx_details("a", "p1", failing.fetch) for _ in range(3)),
+            return_exceptions=True,
+        )
+        self.assertEqual(1, failing.calls)
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+
+        # the next provider of the rotation gets asked
+        working = FakeProvider()
+        self.assertEqual(CONFIRMED, await self.coalescer.get_tx_details("a", "p2", working.fetch))
+        self.assertEqual(1, working.calls)
+
+    @wrap_with_ensure_deferred
+    async def test_failure_of_one_provider_does_not_reach_waiters_of_another(self):
+        failing = FakeProvider(error=ConnectionError("provider down"))
+        working = FakeProvider()
+        results = await asyncio.gather(
+            self.coalescer.get_tx_details("a", "p1", failing.fetch),
+            self.coalescer.get_tx_details("a", "p2", working.fetch),
+            return_exceptions=True,
+        )
+        self.assertIsInstance(results[0], ConnectionError)
+        self.assertEqual(CONFIRMED, results[1])
+        self.assertEqual(1, failing.calls)
+        self.assertEqual(1, working.calls)
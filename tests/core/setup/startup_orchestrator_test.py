@@ -0,0 +1,205 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from pathlib import Path
+import queue
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+import unittest
+
+from bisq.common.persistence.persistence_manager import PersistenceManager
+from bisq.common.persistence.persistence_manager_source import PersistenceManagerSource
+from bisq.common.persistence.persistence_orchestrator import PersistenceOrchestrator
+from bisq.common.setup.log_setup import logger_context
+from bisq.common.timer import Timer
+from bisq.common.user_thread import UserThread
+from bisq.core.setup.startup_orchestrator import StartupOrchestrator
+
+logger = logging.getLogger(__name__)
+
+user_thread_queue: "queue.Queue" = queue.Queue()
+
+
+class ConcurrentReads:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.max = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.current += 1
+            self.max = max(self.max, self.current)
+
+    def __exit__(self, *args):
+        with self.lock:
+            self.current -= 1
+
+
+class QueueTimer(Timer):
+    """Queues the runnables, which get run by the test as user thread."""
+
+    def run_later(self, delay, action):
+        user_thread_queue.put(action)
+        return self
+
+    def run_periodically(self, interval, runnable):
+        raise NotImplementedError()
+
+    def stop(self):
+        pass
+
+
+class FakePersistenceManager(PersistenceManager):
+    def __init__(
+        self,
+        dir: Path,
+        orchestrator,
+        file_name: str,
+        read_delay: float,
+        concurrent_reads: ConcurrentReads,
+    ):
+        super().__init__(dir, None, None, orchestrator)
+        dir.joinpath(file_name).touch()
+        self.initialize(SimpleNamespace(), PersistenceManagerSource.PRIVATE, file_name)
+        self.read_delay = read_delay
+        self.read_threads = []
+        self.num_reads = 0
+        self.concurrent_reads = concurrent_reads
+
+    def _read_file(self, file_name: str):
+        with self.concurrent_reads:
+            time.sleep(self.read_delay)
+        self.read_threads.append(threading.current_thread().name)
+        self.num_reads += 1
+        return SimpleNamespace(file_name=file_name)
+
+
+class FakeHost:
+    def __init__(self, name: str, persistence_manager, applied: list):
+        self.name = name
+        self.persistence_manager = persistence_manager
+        self.applied = applied
+
+    def read_persisted(self, complete_handler):
+        def on_persisted(persisted):
+            assert threading.current_thread() is threading.main_thread()
+            self.applied.append(self.name)
+            complete_handler()
+
+        self.persistence_manager.read_persisted(on_persisted, complete_handler)
+
+
+class StartupOrchestratorTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.timer_class = UserThread.timer_class
+        UserThread.timer_class = QueueTimer
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = Path(temp_dir.name)
+        self.persistence_orchestrator = PersistenceOrchestrator()
+        self.concurrent_reads = ConcurrentReads()
+        self.read_executor = ThreadPoolExecutor(thread_name_prefix="TestRead")
+        self.orchestrator = StartupOrchestrator(
+            self.persistence_orchestrator, self.read_executor
+        )
+        self.applied = []
+        self.hosts = {}
+
+    def tearDown(self):
+        self.read_executor.shutdown()
+        UserThread.timer_class = self.timer_class
+        self.logger_context.__exit__(None, None, None)
+
+    def add_host(self, name: str, read_delay: float, depends_on=()):
+        manager = FakePersistenceManager(
+            self.dir,
+            self.persistence_orchestrator,
+            name,
+            read_delay,
+            self.concurrent_reads,
+        )
+        self.hosts[name] = FakeHost(name, manager, self.applied)
+        self.orchestrator.add_host(name, self.hosts[name], depends_on)
+
+    def run_user_thread_until(self, is_done):
+        deadline = time.monotonic() + 10
+        while not is_done():
+            self.assertLess(time.monotonic(), deadline, "Timed out")
+            try:
+                user_thread_queue.get(timeout=0.05)()
+            except queue.Empty:
+                pass
+
+    def test_stores_are_read_concurrently_and_applied_in_dependency_order(self):
+        self.add_host("trades", 0.3)
+        self.add_host("disputes", 0.1, depends_on=["trades"])
+        self.add_host("peers", 0.1)
+        self.add_host("mailbox", 0.1, depends_on=["peers", "trades"])
+        completed = []
+        self.orchestrator.read_all(lambda: completed.append(True))
+        with self.assertLogs(self.orchestrator.logger, logging.INFO) as logs:
+            self.run_user_thread_until(lambda: completed)
+
+        self.assertEqual("peers", self.applied[0])
+        self.assertEqual("trades", self.applied[1])
+        self.assertEqual({"disputes", "mailbox"}, set(self.applied[2:]))
+        self.assertEqual(4, self.concurrent_reads.max)
+        for host in self.hosts.values():
+            manager = host.persistence_manager
+            self.assertEqual(1, manager.num_reads)
+            self.assertTrue(manager.read_threads[0].startswith("TestRead"))
+            self.assertTrue(manager.read_called)
+        report = self.orchestrator.get_timing_report()
+        self.assertIn(report, logs.output[-1])
+        for name in self.hosts:
+            self.assertIn(f"file {name}: read at", report)
+            self.assertIn(f"store {name}: started at", report)
+
+    def test_data_read_ahead_is_not_marked_as_read_until_requested(self):
+        self.add_host("trades", 0)
+        manager = FakePersistenceManager(
+            self.dir,
+            self.persistence_orchestrator,
+            "not_a_host",
+            0,
+            self.concurrent_reads,
+        )
+        completed = []
+        self.orchestrator.read_all(lambda: completed.append(True))
+        self.run_user_thread_until(lambda: completed)
+
+        manager._prefetched["not_a_host"].result()
+        self.assertEqual(1, manager.num_reads)
+        # So that it does not get written before it got applied
+        self.assertFalse(manager.read_called)
+        self.persistence_orchestrator.on_all_services_initialized()
+        self.assertEqual({}, manager._prefetched)
+
+        # Without read ahead data it is read again
+        results = []
+        manager.read_persisted(results.append, lambda: None)
+        self.run_user_thread_until(lambda: results)
+        self.assertEqual(2, manager.num_reads)
+        self.assertTrue(manager.read_called)
+
+    def test_invalid_dependencies_are_rejected(self):
+        self.add_host("trades", 0, depends_on=["disputes"])
+        self.add_host("disputes", 0, depends_on=["trades"])
+        with self.assertRaises(ValueError):
+            self.orchestrator.read_all(lambda: None)
+
+        orchestrator = StartupOrchestrator(self.persistence_orchestrator)
+        orchestrator.add_host("trades", self.hosts["trades"], ["offers"])
+        with self.assertRaises(ValueError):
+            orchestrator.read_all(lambda: None)
+        with self.assertRaises(ValueError):
+            orchestrator.add_host("trades", self.hosts["trades"])
+        self.assertEqual([], self.applied)
+
+
+if __name__ == "__main__":
+    unittest.main()
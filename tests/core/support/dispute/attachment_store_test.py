@@ -0,0 +1,69 @@
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.common.crypto.hash import get_sha256_hash
+from bisq.core.support.dispute.attachment import Attachment
+from bisq.core.support.dispute.attachment_store import AttachmentStore
+
+
+class AttachmentStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        with logger_context(logging.getLogger(__name__)):
+            self.store = AttachmentStore(Path(self.temp_dir.name).joinpath("attachments"))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_put_is_content_addressed(self):
+        data = b"some log file content"
+        content_hash = self.store.put(data)
+        self.assertEqual(get_sha256_hash(data), content_hash)
+        self.assertTrue(self.store.contains(content_hash))
+        self.assertEqual(data, self.store.read(content_hash))
+        # writing the same content again is a no-op
+        self.assertEqual(content_hash, self.store.put(data))
+        self.assertEqual([content_hash], list(self.store.get_all_hashes()))
+
+    def test_remove_unreferenced(self):
+        kept = self.store.put(b"kept")
+        dropped = self.store.put(b"dropped")
+        self.assertEqual(1, self.store.remove_unreferenced({kept}))
+        self.assertTrue(self.store.contains(kept))
+        self.assertFalse(self.store.contains(dropped))
+
+    def test_attachment_moved_to_store(self):
+        data = bytes(range(256)) * 100
+        attachment = Attachment("log.zip", data)
+        content_hash = attachment.content_hash
+        attachment.move_to_store(self.store)
+
+        self.assertTrue(attachment.is_stored)
+        self.assertEqual(data, attachment.bytes)
+        with attachment.open() as f:
+            self.assertEqual(data, f.read())
+
+        # network form still carries the bytes, stored form only the hash
+        self.assertEqual(data, attachment.to_proto_message().bytes)
+        stored_proto = attachment.to_stored_proto_message()
+        self.assertEqual(b"", stored_proto.bytes)
+        self.assertEqual(content_hash, stored_proto.content_hash)
+
+        restored = Attachment.from_proto(stored_proto)
+        self.assertEqual(attachment, restored)
+        restored.move_to_store(self.store)
+        self.assertEqual(data, restored.bytes)
+
+    def test_attachment_from_network_proto(self):
+        attachment = Attachment("a.txt", b"abc")
+        restored = Attachment.from_proto(attachment.to_proto_message())
+        self.assertFalse(restored.is_stored)
+        self.assertEqual(attachment, restored)
+        self.assertEqual(b"abc", restored.bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+import logging
+from utils.aio import as_future  # at top to prevent reactor problems
+import asyncio
+from concurrent.futures import Future
+from datetime import timedelta
+import os
+import socket
+from pathlib import Path
+import tempfile
+from types import SimpleNamespace
+from twisted.trial import unittest
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.common.user_thread import UserThread
+from bisq.core.network.p2p.file_transfer_part import FileTransferPart
+from bisq.core.network.p2p.network.localhost_network_node import LocalhostNetworkNode
+from bisq.core.network.p2p.network.message_listener import MessageListener
+from bisq.core.support.dispute.mediation.file_transfer_receiver import FileTransferReceiver
+from bisq.core.support.dispute.mediation.file_transfer_sender import FileTransferSender
+from bisq.core.support.dispute.mediation.file_transfer_session import FileTransferSession
+from utils.clock import Clock
+from utils.twisted_utils import cancel_delayed_calls, wrap_with_ensure_deferred
+
+logger = logging.getLogger(__name__)
+
+
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class LatentLocalhostNetworkNode(LocalhostNetworkNode):
+    """Delays every outgoing message to simulate the round trip time of Tor."""
+
+    def __init__(self, *args, latency_ms: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latency_ms = latency_ms
+        self.drop_filter = lambda message: False
+
+    def send_message(self, peers_node_address_or_connection, network_envelope, executor=None):
+        result = Future()
+        if self.drop_filter(network_envelope):
+            # pretend it was sent, it just never arrives
+            result.set_result(None)
+            return result
+
+        def send():
+            future = super(LatentLocalhostNetworkNode, self).send_message(
+                peers_node_address_or_connection, network_envelope, executor
+            )
+
+            def on_done(f: Future):
+                if f.exception():
+                    result.set_exception(f.exception())
+                else:
+                    result.set_result(f.result())
+
+            future.add_done_callback(on_done)
+
+        UserThread.run_after(send, timedelta(milliseconds=self.latency_ms))
+        return result
+
+
+class FtpCallback(FileTransferSession.FtpCallback):
+    def __init__(self):
+        self.completed = asyncio.Event()
+        self.timed_out = None
+
+    def on_ftp_progress(self, progress_pct):
+        pass
+
+    def on_ftp_complete(self, session):
+        self.completed.set()
+
+    def on_ftp_timeout(self, status_msg, session):
+        self.timed_out = status_msg
+        self.completed.set()
+
+
+class FileTransferTest(unittest.TestCase):
+    LATENCY_MS = 150
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.temp_dir.name)
+        LocalhostNetworkNode.set_simulate_tor_delay_tor_node(0)
+        LocalhostNetworkNode.set_simulate_tor_delay_hidden_service(0)
+
+    def tearDown(self):
+        cancel_delayed_calls()
+        self.temp_dir.cleanup()
+
+    async def _start_nodes(self):
+        from bisq.common.config.config import Config
+        from bisq.core.protocol.network.core_network_proto_resolver import CoreNetworkProtoResolver
+
+        self.config = Config(default_user_data_dir=self.data_dir)
+        self.sender_node = LatentLocalhostNetworkNode(
+            get_free_port(), CoreNetworkProtoResolver(Clock()), None, self.config, latency_ms=self.LATENCY_MS
+        )
+        self.receiver_node = LatentLocalhostNetworkNode(
+            get_free_port(), CoreNetworkProtoResolver(Clock()), None, self.config, latency_ms=self.LATENCY_MS
+        )
+        await self.sender_node.start()
+        await self.receiver_node.start()
+        for _ in range(100):
+            if self.sender_node.server and self.receiver_node.server:
+                break
+            await asyncio.sleep(0.05)
+
+    async def _shut_down_nodes(self):
+        done = asyncio.Event()
+        self.sender_node.shut_down()
+        self.receiver_node.shut_down(lambda: done.set())
+        await done.wait()
+
+    def _create_sessions(self, file_size: int):
+        self.sender_callback = FtpCallback()
+        self.receiver_callback = FtpCallback()
+        user = SimpleNamespace(data_dir=self.data_dir)
+        sender = FileTransferSender(
+            self.sender_node,
+            self.receiver_node.node_address_property.value,
+            "trade_id_1234",
+            1,
+            "seller",
+            user,
+            self.sender_callback,
+        )
+        self.content = os.urandom(file_size)
+        sender.zip_file_path.write_bytes(self.content)
+
+        receiver = FileTransferReceiver(
+            self.receiver_node,
+            self.sender_node.node_address_property.value,
+            "trade_id_1234",
+            1,
+            "seller",
+            self.config,
+            self.receiver_callback,
+        )
+
+        # the mediation manager hands the initial request over to the receiving session
+        class InitialRequestRouter(MessageListener):
+            def on_message(self_, network_envelope, connection):
+                if isinstance(network_envelope, FileTransferPart) and network_envelope.is_initial_request:
+                    receiver.process_file_part_received(network_envelope)
+
+        self.receiver_node.add_message_listener(InitialRequestRouter())
+        return sender, receiver
+
+    @wrap_with_ensure_deferred
+    async def test_windowed_transfer(self):
+        with logger_context(logger):
+            await self._start_nodes()
+            try:
+                block_size = FileTransferSender.FILE_BLOCK_SIZE
+                sender, receiver = self._create_sessions(block_size * 6 + 1234)
+
+                sender.init_send()
+                # at most one part is in flight until the transfer request is acknowledged
+                self.assertEqual(1, len(sender.parts_awaiting_ack))
+                await asyncio.wait_for(self.sender_callback.completed.wait(), 30)
+                await asyncio.wait_for(self.receiver_callback.completed.wait(), 30)
+
+                self.assertIsNone(self.sender_callback.timed_out)
+                self.assertEqual(self.content, receiver.zip_file_path.read_bytes())
+                self.assertGreater(sender.throughput_bytes_per_sec, 0)
+            finally:
+                await self._shut_down_nodes()
+
+    @wrap_with_ensure_deferred
+    async def test_selective_retransmission(self):
+        with logger_context(logger):
+            await self._start_nodes()
+            try:
+                block_size = FileTransferSender.FILE_BLOCK_SIZE
+                sender, receiver = self._create_sessions(block_size * 4)
+                sender.PART_ACK_TIMEOUT_MILLIS = 1000
+
+                dropped = []
+
+                def drop_first_send_of_block_2(message):
+                    if (isinstance(message, FileTransferPart)
+                            and not message.is_initial_request
+                            and message.seq_num_or_file_length == 2
+                            and not dropped):
+                        dropped.append(message.uid)
+                        return True
+                    return False
+
+                self.sender_node.drop_filter = drop_first_send_of_block_2
+
+                sender.init_send()
+                await asyncio.wait_for(self.sender_callback.completed.wait(), 30)
+                await asyncio.wait_for(self.receiver_callback.completed.wait(), 30)
+
+                self.assertEqual(1, len(dropped))
+                self.assertIsNone(self.sender_callback.timed_out)
+                self.assertEqual(self.content, receiver.zip_file_path.read_bytes())
+            finally:
+                await self._shut_down_nodes()
+
+
+if __name__ == "__main__":
+    import unittest as _unittest
+    _unittest.main()
@@ -0,0 +1,210 @@
+from dataclasses import dataclass, field
+import logging
+from types import SimpleNamespace
+from typing import Optional
+import unittest
+from unittest import mock
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.core.network.p2p.storage.payload.protected_mailbox_storage_entry import (
+    ProtectedMailboxStorageEntry,
+)
+from bisq.core.user.user_hibernation_service import (
+    UserHibernationPolicy,
+    UserHibernationService,
+)
+from utils.concurrency import AtomicBoolean
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class FakeUserContext:
+    user_id: str
+    last_activity_ms: int
+    running: bool = True
+    initialized: bool = True
+    bootstrapped: bool = True
+    open_offers: list = field(default_factory=list)
+    pending_trades: list = field(default_factory=list)
+    hibernated: bool = False
+    sig_pub_key: bytes = b""
+
+    def __post_init__(self):
+        self.persistence_orchestrator = SimpleNamespace(
+            all_services_initialized=AtomicBoolean(self.initialized)
+        )
+
+    @property
+    def is_running(self):
+        return self.running
+
+    @property
+    def global_container(self):
+        if not self.running:
+            return None
+        return SimpleNamespace(
+            p2p_service=SimpleNamespace(is_bootstrapped=self.bootstrapped),
+            open_offer_manager=SimpleNamespace(
+                get_observable_list=lambda: self.open_offers
+            ),
+            trade_manager=SimpleNamespace(
+                get_observable_list=lambda: self.pending_trades
+            ),
+        )
+
+
+class FakeUserManager:
+    def __init__(self, contexts: list[FakeUserContext]):
+        self.contexts = contexts
+
+    def get_all_contexts(self):
+        return self.contexts
+
+    def find_user_context_for_sig_pub_key(
+        self, pub_key_bytes: bytes
+    ) -> Optional[FakeUserContext]:
+        return next(
+            (ctx for ctx in self.contexts if ctx.sig_pub_key == pub_key_bytes), None
+        )
+
+
+def mailbox_entry(receivers_pub_key_bytes: bytes):
+    entry = ProtectedMailboxStorageEntry.__new__(ProtectedMailboxStorageEntry)
+    entry._receivers_pub_key_bytes = receivers_pub_key_bytes
+    return entry
+
+
+NOW = 1_000_000_000
+
+
+class UserHibernationServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+
+    def tearDown(self):
+        self.logger_context.__exit__(None, None, None)
+
+    def create_service(self, contexts: list[FakeUserContext], **policy):
+        return UserHibernationService(
+            FakeUserManager(contexts), None, UserHibernationPolicy(**policy)
+        )
+
+    def test_nothing_gets_hibernated_if_disabled(self):
+        service = self.create_service([FakeUserContext("a", 0)])
+        self.assertFalse(service.policy.is_hibernation_enabled)
+        self.assertEqual(service.select_users_to_hibernate(NOW, 10_000), [])
+
+    def test_idle_users_get_hibernated(self):
+        idle = FakeUserContext("idle", NOW - 61_000)
+        active = FakeUserContext("active", NOW - 1_000)
+        stopped = FakeUserContext("stopped", 0, running=False)
+        service = self.create_service([idle, active, stopped], idle_timeout_sec=60)
+        self.assertEqual(service.select_users_to_hibernate(NOW, 0), [idle])
+
+    def test_users_which_must_stay_online_are_kept_awake(self):
+        contexts = [
+            FakeUserContext("always", 0),
+            FakeUserContext("starting", 0, initialized=False),
+            FakeUserContext("mailbox", 0, bootstrapped=False),
+            FakeUserContext("offers", 0, open_offers=["offer"]),
+            FakeUserContext("trades", 0, pending_trades=["trade"]),
+        ]
+        service = self.create_service(
+            contexts, idle_timeout_sec=60, always_online_user_ids=frozenset({"always"})
+        )
+        self.assertEqual(service.select_users_to_hibernate(NOW, 0), [])
+        self.assertEqual(
+            [service.get_keep_awake_reason(ctx) for ctx in contexts],
+            [
+                "user is always online",
+                "user is starting up",
+                "user is receiving its mailbox messages",
+                "user has open offers",
+                "user has pending trades",
+            ],
+        )
+
+    def test_least_recently_active_users_get_hibernated_above_max_awake_users(self):
+        contexts = [
+            FakeUserContext("c", NOW - 1_000),
+            FakeUserContext("a", NOW - 3_000),
+            FakeUserContext("b", NOW - 2_000),
+            FakeUserContext("kept", 0, open_offers=["offer"]),
+        ]
+        service = self.create_service(contexts, max_awake_users=2)
+        self.assertEqual(
+            [ctx.user_id for ctx in service.select_users_to_hibernate(NOW, 0)],
+            ["a", "b"],
+        )
+
+    def test_one_user_per_check_gets_hibernated_above_memory_cap(self):
+        contexts = [FakeUserContext("b", NOW - 1_000), FakeUserContext("a", NOW - 2_000)]
+        service = self.create_service(contexts, memory_cap_mb=500)
+        self.assertEqual(service.select_users_to_hibernate(NOW, 400), [])
+        self.assertEqual(
+            [ctx.user_id for ctx in service.select_users_to_hibernate(NOW, 600)], ["a"]
+        )
+
+    def test_memory_cap_stops_hibernating_if_memory_does_not_drop(self):
+        contexts = [
+            FakeUserContext("c", NOW - 1_000),
+            FakeUserContext("b", NOW - 2_000),
+            FakeUserContext("a", NOW - 3_000),
+        ]
+        service = self.create_service(contexts, memory_cap_mb=500)
+        self.assertEqual(
+            [ctx.user_id for ctx in service.select_users_to_hibernate(NOW, 700)], ["a"]
+        )
+        contexts[2].running = False
+        self.assertEqual(
+            [ctx.user_id for ctx in service.select_users_to_hibernate(NOW, 650)], ["b"]
+        )
+        contexts[1].running = False
+        with self.assertLogs(service.logger, logging.WARNING):
+            self.assertEqual(service.select_users_to_hibernate(NOW, 648), [])
+
+        # once the memory got below the cap, the next excess counts anew
+        self.assertEqual(service.select_users_to_hibernate(NOW, 450), [])
+        self.assertEqual(
+            [ctx.user_id for ctx in service.select_users_to_hibernate(NOW, 648)], ["c"]
+        )
+
+    def test_memory_cap_without_candidates_logs_warning(self):
+        service = self.create_service(
+            [FakeUserContext("a", 0, open_offers=["offer"])], memory_cap_mb=500
+        )
+        with self.assertLogs(service.logger, logging.WARNING):
+            self.assertEqual(service.select_users_to_hibernate(NOW, 600), [])
+
+    def test_hibernated_users_get_woken_for_mailbox_check(self):
+        due = FakeUserContext("due", 0, running=False, hibernated=True)
+        recent = FakeUserContext("recent", 0, running=False, hibernated=True)
+        never_started = FakeUserContext("never_started", 0, running=False)
+        service = self.create_service(
+            [due, recent, never_started], mailbox_check_interval_sec=600
+        )
+        service._hibernated_at = {"due": NOW - 600_000, "recent": NOW - 1_000}
+        self.assertEqual(service.select_users_to_wake_for_mailbox(NOW), [due])
+
+    def test_mailbox_entry_for_hibernated_user_wakes_it(self):
+        hibernated = FakeUserContext(
+            "hibernated", 0, running=False, hibernated=True, sig_pub_key=b"key1"
+        )
+        awake = FakeUserContext("awake", 0, sig_pub_key=b"key2")
+        service = self.create_service([hibernated, awake], idle_timeout_sec=60)
+        with mock.patch.object(service, "_wake_user") as wake_user:
+            service.on_added(
+                [
+                    mailbox_entry(b"key1"),
+                    mailbox_entry(b"key2"),
+                    mailbox_entry(b"unknown"),
+                    SimpleNamespace(),
+                ]
+            )
+        wake_user.assert_called_once_with("hibernated", "pending mailbox message")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Stands in for a user worker process in the multi process tests.
+
+Serves every rpc method on the given unix domain socket and replies with the user id, the method,
+the password header and the request. The method /Stub/Crash makes the worker exit.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import threading
+
+import grpc
+
+
+class StubHandler(grpc.GenericRpcHandler):
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    def service(self, handler_call_details):
+        method = handler_call_details.method
+        return grpc.unary_unary_rpc_method_handler(
+            lambda request, context: self.handle(method, request, context)
+        )
+
+    def handle(self, method: str, request: bytes, context: grpc.ServicerContext):
+        if method == "/Stub/Crash":
+            os._exit(3)
+        if method == "/Stub/Fail":
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, "stub failure")
+        password = dict(context.invocation_metadata()).get("password", "")
+        return f"{self.user_id}|{method}|{password}|".encode() + request
+
+
+if __name__ == "__main__":
+    socket_path, user_id = sys.argv[1:3]
+    server = grpc.server(ThreadPoolExecutor(max_workers=2))
+    server.add_generic_rpc_handlers((StubHandler(user_id),))
+    server.add_insecure_port(f"unix:{socket_path}")
+    server.start()
+    threading.Event().wait()
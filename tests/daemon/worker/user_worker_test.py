@@ -0,0 +1,137 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+import grpc
+
+from bisq.common.setup.log_setup import logger_context
+from bisq.daemon.worker.user_worker_proxy_handler import UserWorkerProxyHandler
+from bisq.daemon.worker.user_worker_supervisor import UserWorkerSupervisor
+
+logger = logging.getLogger(__name__)
+
+STUB_WORKER = Path(__file__).parent.joinpath("stub_worker.py")
+GET_MARKET_PRICE = "/io.bisq.protobuffer.Price/GetMarketPrice"
+SET_TX_FEE_RATE_PREFERENCE = "/io.bisq.protobuffer.Wallets/SetTxFeeRatePreference"
+
+
+class StubWorkerSupervisor(UserWorkerSupervisor):
+    READY_TIMEOUT_SEC = 30
+
+    def _get_worker_command(self, user_id: str) -> list[str]:
+        socket_path = UserWorkerSupervisor.get_socket_path(
+            self._config.app_data_dir, user_id
+        )
+        return [sys.executable, str(STUB_WORKER), str(socket_path), user_id]
+
+
+class UserWorkerTest(unittest.TestCase):
+    """Runs a front end server which routes to stub worker processes over unix sockets."""
+
+    def setUp(self):
+        self.logger_context = logger_context(logger)
+        self.logger_context.__enter__()
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.supervisor = StubWorkerSupervisor(
+            SimpleNamespace(app_data_dir=self.data_dir)
+        )
+        self.user_manager = SimpleNamespace(active_user_id="alice")
+        self.server = grpc.server(ThreadPoolExecutor(max_workers=4))
+        self.server.add_generic_rpc_handlers(
+            (UserWorkerProxyHandler(self.user_manager, self.supervisor),)
+        )
+        port = self.server.add_insecure_port("127.0.0.1:0")
+        self.server.start()
+        self.channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop(None)
+        self.supervisor.shut_down()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        self.logger_context.__exit__(None, None, None)
+
+    def call(self, method: str, request: bytes = b"request"):
+        return self.channel.unary_unary(method)(
+            request, metadata=(("password", "secret"),), timeout=30
+        )
+
+    def test_calls_get_routed_to_the_worker_of_the_active_user(self):
+        self.assertEqual(
+            self.call(GET_MARKET_PRICE),
+            f"alice|{GET_MARKET_PRICE}|secret|request".encode(),
+        )
+        self.user_manager.active_user_id = "bob"
+        self.assertEqual(
+            self.call(GET_MARKET_PRICE),
+            f"bob|{GET_MARKET_PRICE}|secret|request".encode(),
+        )
+        self.assertTrue(self.supervisor.is_worker_alive("alice"))
+        self.assertTrue(self.supervisor.is_worker_alive("bob"))
+
+    def test_errors_of_the_worker_get_forwarded(self):
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.call("/Stub/Fail")
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.FAILED_PRECONDITION)
+        self.assertEqual(cm.exception.details(), "stub failure")
+
+    def test_calls_which_change_the_shared_preferences_get_rejected(self):
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.call(SET_TX_FEE_RATE_PREFERENCE)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.FAILED_PRECONDITION)
+        self.assertEqual(
+            cm.exception.details(),
+            "SetTxFeeRatePreference changes the preferences shared by all users, "
+            "which is not supported in process per user mode",
+        )
+        self.assertFalse(self.supervisor.is_worker_alive("alice"))
+
+    def test_crashed_worker_gets_restarted(self):
+        self.call(GET_MARKET_PRICE)
+        worker = self.supervisor._get_worker("alice")
+        pid = worker.process.pid
+        with self.assertRaises(grpc.RpcError):
+            self.call("/Stub/Crash")
+        worker.process.wait(timeout=30)
+
+        with self.assertLogs(self.supervisor.logger, logging.WARNING):
+            self.supervisor._restart_crashed_workers()
+        self.assertFalse(self.supervisor.is_worker_alive("alice"))
+        self.assertEqual(worker.num_restarts, 1)
+
+        # the restart delay has passed
+        worker.restart_not_before = 1
+        self.supervisor._restart_crashed_workers()
+        self.assertTrue(self.supervisor.is_worker_alive("alice"))
+        self.assertNotEqual(worker.process.pid, pid)
+        self.assertEqual(
+            self.call(GET_MARKET_PRICE),
+            f"alice|{GET_MARKET_PRICE}|secret|request".encode(),
+        )
+
+    def test_stopped_workers_do_not_get_restarted(self):
+        self.call(GET_MARKET_PRICE)
+        self.supervisor.stop_worker("alice")
+        self.assertFalse(self.supervisor.is_worker_alive("alice"))
+        self.supervisor._restart_crashed_workers()
+        self.assertFalse(self.supervisor.is_worker_alive("alice"))
+
+    def test_shut_down_stops_all_workers(self):
+        self.call(GET_MARKET_PRICE)
+        self.user_manager.active_user_id = "bob"
+        self.call(GET_MARKET_PRICE)
+        self.supervisor.shut_down()
+        self.assertFalse(self.supervisor.is_worker_alive("alice"))
+        self.assertFalse(self.supervisor.is_worker_alive("bob"))
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.call(GET_MARKET_PRICE)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.UNAVAILABLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
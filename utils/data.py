@@ -162,10 +162,12 @@ class ObservableSet(set[T]):
         self._notify(ObservableChangeEvent(None, elements))
         
     def update(self, *others: Iterable[T]) -> bool:
-        before = self.copy()
-        super().update(*others)
-        added_elements = self - before
+        # Only the new elements are collected, instead of copying the whole set
+        added_elements = {
+            element for other in others for element in other if element not in self
+        }
         if len(added_elements) > 0:
+            super().update(added_elements)
             self._notify(ObservableChangeEvent(added_elements))
             return True
         return False